@@ -44,6 +44,8 @@ from ._warnings import *  # noqa: F403,F401 pylint: disable=redefined-builtin
 from ._cim_types import *  # noqa: F403,F401
 from ._cim_constants import *  # noqa: F403,F401
 from ._cim_operations import *  # noqa: F403,F401
+from ._cim_operations_async import *  # noqa: F403,F401
+from ._connection_pool import *  # noqa: F403,F401
 from ._nocasedict import *  # noqa: F403,F401
 from ._cim_obj import *  # noqa: F403,F401
 from ._tupleparse import *  # noqa: F403,F401
@@ -58,6 +60,9 @@ from ._statistics import *  # noqa: F403,F401
 from ._logging import *  # noqa: F403,F401
 from ._features import *  # noqa: F403,F401
 from ._units import *  # noqa: F403,F401
+from ._columns import *  # noqa: F403,F401
+from ._binary import *  # noqa: F403,F401
+from ._cim_json import *  # noqa: F403,F401
 
 from ._version import __version__  # noqa: F401
 
@@ -0,0 +1,1164 @@
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this program; if not, write to the Free Software
+# Foundation, Inc., 675 Mass Ave, Cambridge, MA 02139, USA.
+#
+
+"""
+The :func:`~pywbem.dumpb` and :func:`~pywbem.loadb` functions convert
+:ref:`CIM objects` and values of :ref:`CIM data types` to and from a compact
+binary format, and the :class:`~pywbem.BinaryWriter` and
+:class:`~pywbem.BinaryReader` classes write and read sequences of them to and
+from a binary file, for example for passing enumerated CIM instances to
+another process or for caching them on disk.
+
+*New in pywbem 1.10.*
+
+The binary format is smaller and faster to create and to read than the
+pickle and CIM-XML representations of the CIM objects:
+
+* Names (e.g. class, property and qualifier names, and namespaces) are stored
+  in a string table, so that each name is stored only once in a sequence of
+  objects and is referenced by its index otherwise.
+* Integer values and sizes are stored as variable-length integers, and the
+  values of numeric arrays that are :class:`~pywbem.CIMNumericArray` objects
+  are stored as their typed buffer.
+* The CIM data type of property, parameter and qualifier values is stored
+  once with the CIM element instead of with each value.
+
+The supported objects are :class:`~pywbem.CIMInstance`,
+:class:`~pywbem.CIMInstanceName`, :class:`~pywbem.CIMClass`,
+:class:`~pywbem.CIMClassName`, :class:`~pywbem.CIMProperty`,
+:class:`~pywbem.CIMMethod`, :class:`~pywbem.CIMParameter`,
+:class:`~pywbem.CIMQualifier`, :class:`~pywbem.CIMQualifierDeclaration`,
+values of :ref:`CIM data types` (including :class:`~pywbem.CIMDateTime`),
+Python :class:`py:int` and :class:`py:float` values (as used in keybindings),
+`None`, and lists of these objects.
+
+The objects that are read are equal to the objects that were written, with
+the following exceptions: CIM instances that use a
+:class:`~pywbem.CIMInstanceLayout` are read as CIM instances that do not use
+a layout, and :class:`~pywbem.CIMQualifier` objects that are shared by a
+:class:`~pywbem.CIMQualifierCache` are read as qualifiers that are not
+shared. Frozen CIM instance paths (see
+:meth:`~pywbem.CIMInstanceName.freeze`) are read as frozen CIM instance paths.
+
+The binary format is specific to pywbem and is versioned. Data written by a
+version of pywbem can be read by the same or a later version of pywbem.
+
+Example::
+
+    with open('instances.bin', 'wb') as fp:
+        writer = pywbem.BinaryWriter(fp)
+        writer.write_all(conn.IterEnumerateInstances('CIM_Foo'))
+
+    with open('instances.bin', 'rb') as fp:
+        for inst in pywbem.BinaryReader(fp):
+            print(inst.path)
+"""
+
+import io
+import struct
+import sys
+from array import array
+from datetime import datetime, timedelta
+
+from ._cim_obj import CIMInstanceName, CIMInstance, CIMClassName, CIMClass, \
+    CIMProperty, CIMMethod, CIMParameter, CIMQualifier, \
+    CIMQualifierDeclaration, _LayoutValues, _FrozenKeybindings
+from ._cim_types import CIMType, CIMDateTime, MinutesFromUTC, \
+    CIMNumericArray, Char16, Uint8, Sint8, Uint16, Sint16, Uint32, Sint32, \
+    Uint64, Sint64, Real32, Real64, _ARRAY_TYPECODES
+from ._nocasedict import NocaseDict
+from ._utils import _format
+
+__all__ = ['dumpb', 'loadb', 'BinaryWriter', 'BinaryReader']
+
+# Magic bytes at the begin of the binary format, followed by the format
+# version as a byte.
+_MAGIC = b'PYWBEMB'
+_VERSION = 1
+
+# Codes of the CIM data types, that are also the tags of scalar values of
+# these types.
+_TYPE_CODES = {
+    None: 0,
+    'boolean': 1,
+    'string': 2,
+    'char16': 3,
+    'datetime': 4,
+    'uint8': 5,
+    'sint8': 6,
+    'uint16': 7,
+    'sint16': 8,
+    'uint32': 9,
+    'sint32': 10,
+    'uint64': 11,
+    'sint64': 12,
+    'real32': 13,
+    'real64': 14,
+    'reference': 15,
+}
+_TYPE_NAMES = {code: type_name for type_name, code in _TYPE_CODES.items()}
+
+# Tags of the values that are written with their tag (i.e. values whose type
+# is not known from the CIM element they are a value of). The tags of the
+# scalar values of CIM data types are their type codes.
+_TAG_NULL = 0
+_TAG_REFERENCE = 15
+_TAG_INSTANCE = 16
+_TAG_CLASS = 17
+_TAG_INT = 18
+_TAG_FLOAT = 19
+_TAG_CLASSNAME = 20
+_TAG_QUALIFIERDECLARATION = 21
+_TAG_PROPERTY = 22
+_TAG_METHOD = 23
+_TAG_PARAMETER = 24
+_TAG_QUALIFIER = 25
+_TAG_LIST = 26
+_TAG_NUMERICARRAY = 27
+
+# Tags of the Python types of the values. bool must be before int, and the
+# CIM data types must be before their Python base types, because subclasses
+# of these types are looked up using isinstance() in this order.
+_TAGS = {
+    bool: 1,
+    Char16: 3,
+    CIMDateTime: 4,
+    Uint8: 5,
+    Sint8: 6,
+    Uint16: 7,
+    Sint16: 8,
+    Uint32: 9,
+    Sint32: 10,
+    Uint64: 11,
+    Sint64: 12,
+    Real32: 13,
+    Real64: 14,
+    CIMInstanceName: _TAG_REFERENCE,
+    CIMInstance: _TAG_INSTANCE,
+    CIMClass: _TAG_CLASS,
+    CIMClassName: _TAG_CLASSNAME,
+    CIMQualifierDeclaration: _TAG_QUALIFIERDECLARATION,
+    CIMProperty: _TAG_PROPERTY,
+    CIMMethod: _TAG_METHOD,
+    CIMParameter: _TAG_PARAMETER,
+    CIMQualifier: _TAG_QUALIFIER,
+    CIMNumericArray: _TAG_NUMERICARRAY,
+    list: _TAG_LIST,
+    str: 2,
+    int: _TAG_INT,
+    float: _TAG_FLOAT,
+}
+
+# Types of keybinding values that are valid as-is
+_KEYBINDING_TYPES = (str, int, float, CIMType, CIMInstanceName)
+
+# Kinds of the values of CIM elements (properties, parameters, qualifiers and
+# qualifier declarations).
+_VALUE_NULL = 0
+_VALUE_SCALAR = 1
+_VALUE_LIST = 2
+_VALUE_NUMERICARRAY = 3
+
+# Kinds of CIMDateTime values
+_DATETIME_TIMESTAMP = 0
+_DATETIME_INTERVAL = 1
+_DATETIME_STRING = 2
+
+# Codes of the embedded_object attribute of properties and parameters
+_EMBEDDED_CODES = {None: 0, 'instance': 1, 'object': 2}
+_EMBEDDED_NAMES = {code: name for name, code in _EMBEDDED_CODES.items()}
+
+# Codes of the tri-state (None, False, True) attributes
+_TRISTATE_CODES = {None: 0, False: 1, True: 2}
+_TRISTATE_VALUES = (None, False, True)
+
+# struct formats of the items of CIMNumericArray buffers in the binary format
+# (little-endian, with the standard sizes).
+_ITEM_FORMATS = {
+    'uint8': 'B',
+    'sint8': 'b',
+    'uint16': 'H',
+    'sint16': 'h',
+    'uint32': 'I',
+    'sint32': 'i',
+    'uint64': 'Q',
+    'sint64': 'q',
+    'real32': 'd',
+    'real64': 'd',
+}
+
+_LITTLE_ENDIAN = sys.byteorder == 'little'
+
+_FLOAT = struct.Struct('<d')
+
+_UNSIGNED_CODES = (5, 7, 9, 11)
+_SIGNED_CODES = (6, 8, 10, 12)
+
+# Integer CIM data types by type code
+_INT_TYPES = {
+    5: Uint8,
+    6: Sint8,
+    7: Uint16,
+    8: Sint16,
+    9: Uint32,
+    10: Sint32,
+    11: Uint64,
+    12: Sint64,
+}
+
+
+def _tristates(*values):
+    """
+    Return the tri-state values (None, False, True) combined into an integer
+    with 2 bits per value.
+    """
+    result = 0
+    for i, value in enumerate(values):
+        result |= _TRISTATE_CODES[value] << (2 * i)
+    return result
+
+
+def _tristate(bits, i):
+    """
+    Return tri-state value i from an integer created with _tristates().
+    """
+    return _TRISTATE_VALUES[(bits >> (2 * i)) & 3]
+
+
+class _Encoder:
+    # pylint: disable=too-few-public-methods
+    """
+    Encoder of objects into the binary format, with a string table that is
+    kept across the objects that are encoded.
+    """
+
+    def __init__(self):
+        self._buf = bytearray()
+        self._strings = {}
+
+    def encode(self, obj):
+        """
+        Return the binary format of an object, as a bytearray.
+
+        Names that are not yet in the string table are added to it.
+
+        Raises:
+
+          TypeError: The object or a value in it has an unsupported type.
+        """
+        self._buf = bytearray()
+        self._value(obj)
+        return self._buf
+
+    def _uint(self, n):
+        """Write an unsigned variable-length integer."""
+        buf = self._buf
+        while n >= 0x80:
+            buf.append((n & 0x7f) | 0x80)
+            n >>= 7
+        buf.append(n)
+
+    def _sint(self, n):
+        """Write a signed variable-length integer (zigzag encoded)."""
+        self._uint((n << 1) if n >= 0 else ((-n << 1) - 1))
+
+    def _str(self, value):
+        """Write a string value."""
+        data = value.encode('utf-8', 'surrogatepass')
+        self._uint(len(data))
+        self._buf += data
+
+    def _name(self, name):
+        """
+        Write a name, that may be `None`, using the string table.
+
+        The name is written as 0 for `None`, as 1 followed by the string for
+        a name that is added to the string table, or as its index in the
+        string table plus 2.
+        """
+        if name is None:
+            self._buf.append(0)
+            return
+        index = self._strings.get(name)
+        if index is not None:
+            self._uint(index + 2)
+            return
+        self._strings[name] = len(self._strings)
+        self._buf.append(1)
+        self._str(name)
+
+    def _value(self, value):
+        """Write a value with its tag."""
+        if value is None:
+            self._buf.append(_TAG_NULL)
+            return
+        tag = _TAGS.get(type(value))
+        if tag is None:
+            for cls, cls_tag in _TAGS.items():
+                if isinstance(value, cls):
+                    tag = cls_tag
+                    break
+            else:
+                raise TypeError(
+                    _format("Object has an unsupported type for the binary "
+                            "format: {0}", type(value)))
+        self._buf.append(tag)
+        if tag <= _TAG_REFERENCE:
+            self._typed(tag, value)
+        elif tag == _TAG_INSTANCE:
+            self._instance(value)
+        elif tag == _TAG_CLASS:
+            self._class(value)
+        elif tag == _TAG_INT:
+            self._sint(value)
+        elif tag == _TAG_FLOAT:
+            self._buf += _FLOAT.pack(value)
+        elif tag == _TAG_CLASSNAME:
+            self._classname(value)
+        elif tag == _TAG_QUALIFIERDECLARATION:
+            self._qualifierdeclaration(value)
+        elif tag == _TAG_PROPERTY:
+            self._property(value)
+        elif tag == _TAG_METHOD:
+            self._method(value)
+        elif tag == _TAG_PARAMETER:
+            self._parameter(value)
+        elif tag == _TAG_QUALIFIER:
+            self._qualifier(value)
+        elif tag == _TAG_NUMERICARRAY:
+            self._buf.append(_TYPE_CODES[value.cimtype])
+            self._numericarray(value)
+        else:  # _TAG_LIST
+            self._uint(len(value))
+            for item in value:
+                self._value(item)
+
+    def _typed(self, code, value):
+        """
+        Write a non-NULL scalar value of the CIM data type with the type code,
+        without tag.
+        """
+        # pylint: disable=too-many-branches
+        if code in _UNSIGNED_CODES:
+            self._uint(value)
+        elif code in _SIGNED_CODES:
+            self._sint(value)
+        elif code in (2, 3):  # string, char16
+            self._str(value)
+        elif code == 1:  # boolean
+            self._buf.append(1 if value else 0)
+        elif code == 15:  # reference
+            self._instancename(value)
+        elif code == 4:  # datetime
+            self._datetime(value)
+        else:  # real32, real64
+            self._buf += _FLOAT.pack(value)
+
+    def _datetime(self, value):
+        """Write a CIMDateTime value."""
+        if value.precision is not None:
+            # The time fields with asterisks are represented only in the
+            # string format.
+            self._buf.append(_DATETIME_STRING)
+            self._str(str(value))
+        elif value.is_interval:
+            td = value.timedelta
+            self._buf.append(_DATETIME_INTERVAL)
+            self._sint(td.days)
+            self._uint(td.seconds)
+            self._uint(td.microseconds)
+        else:
+            dt = value.datetime
+            self._buf.append(_DATETIME_TIMESTAMP)
+            self._uint(dt.toordinal())
+            self._uint(((dt.hour * 60 + dt.minute) * 60 + dt.second) *
+                       1000000 + dt.microsecond)
+            self._sint(value.minutes_from_utc)
+
+    def _numericarray(self, value):
+        """Write the items of a CIMNumericArray value, without its type."""
+        data = value.buffer
+        fmt = _ITEM_FORMATS[value.cimtype]
+        self._uint(len(data))
+        if _LITTLE_ENDIAN and data.itemsize == struct.calcsize(fmt):
+            self._buf += data.tobytes()
+        else:
+            self._buf += struct.pack(f'<{len(data)}{fmt}', *data)
+
+    def _element_value(self, code, embedded_object, value):
+        """
+        Write the value of a CIM element with the type code and embedded
+        object attribute of the CIM element.
+        """
+        buf = self._buf
+        if value is None:
+            buf.append(_VALUE_NULL)
+        elif isinstance(value, list):
+            buf.append(_VALUE_LIST)
+            self._array(code, embedded_object, value)
+        elif isinstance(value, CIMNumericArray):
+            buf.append(_VALUE_NUMERICARRAY)
+            self._numericarray(value)
+        else:
+            buf.append(_VALUE_SCALAR)
+            if embedded_object:
+                self._value(value)
+            else:
+                self._typed(code, value)
+
+    def _array(self, code, embedded_object, values):
+        """
+        Write the items of a list value of a CIM element, with a bitmap of
+        its NULL items if it has NULL items.
+        """
+        has_nulls = any(value is None for value in values)
+        self._uint((len(values) << 1) | has_nulls)
+        if has_nulls:
+            bitmap = bytearray((len(values) + 7) // 8)
+            for i, value in enumerate(values):
+                if value is None:
+                    bitmap[i >> 3] |= 1 << (i & 7)
+            self._buf += bitmap
+        for value in values:
+            if value is not None:
+                if embedded_object:
+                    self._value(value)
+                else:
+                    self._typed(code, value)
+
+    def _instancename(self, path):
+        """Write a CIMInstanceName object, without tag."""
+        keybindings = path.keybindings
+        self._buf.append(keybindings.__class__ is _FrozenKeybindings)
+        self._name(path.classname)
+        self._name(path.host)
+        self._name(path.namespace)
+        self._uint(len(keybindings))
+        for key, value in keybindings.items():
+            self._name(key)
+            self._value(value)
+
+    def _classname(self, path):
+        """Write a CIMClassName object, without tag."""
+        self._name(path.classname)
+        self._name(path.host)
+        self._name(path.namespace)
+
+    def _qualifiers(self, qualifiers):
+        """Write the qualifiers of a CIM object."""
+        self._uint(len(qualifiers))
+        for qualifier in qualifiers.values():
+            self._qualifier(qualifier)
+
+    def _qualifier(self, qualifier):
+        """Write a CIMQualifier object, without tag."""
+        code = _TYPE_CODES[qualifier.type]
+        self._name(qualifier.name)
+        self._buf.append(code)
+        self._uint(_tristates(
+            qualifier.propagated, qualifier.overridable, qualifier.tosubclass,
+            qualifier.toinstance, qualifier.translatable))
+        self._element_value(code, None, qualifier.value)
+
+    def _qualifierdeclaration(self, qualdecl):
+        """Write a CIMQualifierDeclaration object, without tag."""
+        code = _TYPE_CODES[qualdecl.type]
+        self._name(qualdecl.name)
+        self._buf.append(code)
+        self._uint(_tristates(
+            qualdecl.is_array, qualdecl.overridable, qualdecl.tosubclass,
+            qualdecl.toinstance, qualdecl.translatable))
+        self._size(qualdecl.array_size)
+        self._uint(len(qualdecl.scopes))
+        for scope, scope_value in qualdecl.scopes.items():
+            self._name(scope)
+            self._buf.append(1 if scope_value else 0)
+        self._element_value(code, None, qualdecl.value)
+
+    def _size(self, size):
+        """Write an array size that may be `None`."""
+        self._uint(0 if size is None else size + 1)
+
+    def _property(self, prop, value=None, use_value=False):
+        """
+        Write a CIMProperty object, without tag.
+
+        If use_value is True, the specified value is written instead of the
+        value of the property.
+        """
+        code = _TYPE_CODES[prop.type]
+        embedded_object = prop.embedded_object
+        self._name(prop.name)
+        self._buf.append(code)
+        self._uint(_tristates(prop.propagated, prop.is_array) |
+                   (_EMBEDDED_CODES[embedded_object] << 4))
+        self._size(prop.array_size)
+        self._name(prop.reference_class)
+        self._name(prop.class_origin)
+        self._qualifiers(prop.qualifiers)
+        self._element_value(code, embedded_object,
+                            value if use_value else prop.value)
+
+    def _parameter(self, parm):
+        """Write a CIMParameter object, without tag."""
+        code = _TYPE_CODES[parm.type]
+        embedded_object = parm.embedded_object
+        self._name(parm.name)
+        self._buf.append(code)
+        self._uint(_tristates(parm.is_array) |
+                   (_EMBEDDED_CODES[embedded_object] << 4))
+        self._size(parm.array_size)
+        self._name(parm.reference_class)
+        self._qualifiers(parm.qualifiers)
+        self._element_value(code, embedded_object, parm.value)
+
+    def _method(self, method):
+        """Write a CIMMethod object, without tag."""
+        self._name(method.name)
+        self._buf.append(_TYPE_CODES[method.return_type])
+        self._uint(_tristates(method.propagated))
+        self._name(method.class_origin)
+        self._qualifiers(method.qualifiers)
+        self._uint(len(method.parameters))
+        for parm in method.parameters.values():
+            self._parameter(parm)
+
+    def _instance(self, inst):
+        """Write a CIMInstance object, without tag."""
+        self._name(inst.classname)
+        path = inst.path
+        if path is None:
+            self._buf.append(0)
+        else:
+            self._buf.append(1)
+            self._instancename(path)
+        self._qualifiers(inst.qualifiers)
+        # pylint: disable=protected-access
+        properties = inst._properties
+        if isinstance(properties, _LayoutValues):
+            # The properties are written from the layout, without creating
+            # the CIMProperty objects of the instance.
+            self._uint(len(properties.values))
+            for template, value in zip(properties.layout._properties,
+                                       properties.values):
+                self._property(template, value, True)
+        else:
+            properties = inst.properties
+            self._uint(len(properties))
+            for prop in properties.values():
+                self._property(prop)
+
+    def _class(self, cls):
+        """Write a CIMClass object, without tag."""
+        self._name(cls.classname)
+        self._name(cls.superclass)
+        path = cls.path
+        if path is None:
+            self._buf.append(0)
+        else:
+            self._buf.append(1)
+            self._classname(path)
+        self._qualifiers(cls.qualifiers)
+        self._uint(len(cls.properties))
+        for prop in cls.properties.values():
+            self._property(prop)
+        self._uint(len(cls.methods))
+        for method in cls.methods.values():
+            self._method(method)
+
+
+class _Decoder:
+    # pylint: disable=too-few-public-methods
+    """
+    Decoder of objects from the binary format, with a string table that is
+    kept across the objects that are decoded.
+    """
+
+    def __init__(self):
+        self._data = b''
+        self._pos = 0
+        self._strings = []
+
+    def decode(self, data):
+        """
+        Return the object decoded from its binary format.
+
+        Names that are not yet in the string table are added to it.
+
+        Raises:
+
+          ValueError: Invalid binary format.
+        """
+        self._data = data
+        self._pos = 0
+        try:
+            obj = self._value()
+        except (IndexError, KeyError, struct.error, UnicodeDecodeError) as exc:
+            raise ValueError(
+                _format("Invalid binary format of a CIM object: {0}: {1}",
+                        exc.__class__.__name__, exc))
+        if self._pos != len(data):
+            raise ValueError(
+                _format("Invalid binary format of a CIM object: {0} bytes "
+                        "after the end of the object",
+                        len(data) - self._pos))
+        return obj
+
+    def _uint(self):
+        """Read an unsigned variable-length integer."""
+        data = self._data
+        pos = self._pos
+        b = data[pos]
+        pos += 1
+        if b < 0x80:
+            self._pos = pos
+            return b
+        result = b & 0x7f
+        shift = 7
+        while True:
+            b = data[pos]
+            pos += 1
+            result |= (b & 0x7f) << shift
+            if b < 0x80:
+                self._pos = pos
+                return result
+            shift += 7
+
+    def _sint(self):
+        """Read a signed variable-length integer (zigzag encoded)."""
+        n = self._uint()
+        return -((n + 1) >> 1) if n & 1 else n >> 1
+
+    def _byte(self):
+        """Read a byte."""
+        b = self._data[self._pos]
+        self._pos += 1
+        return b
+
+    def _bytes(self, size):
+        """Read a number of bytes."""
+        pos = self._pos
+        end = pos + size
+        if end > len(self._data):
+            raise IndexError("Data ends within a value")
+        self._pos = end
+        return self._data[pos:end]
+
+    def _str(self):
+        """Read a string value."""
+        return str(self._bytes(self._uint()), 'utf-8', 'surrogatepass')
+
+    def _name(self):
+        """Read a name, that may be `None`, using the string table."""
+        n = self._uint()
+        if n >= 2:
+            return self._strings[n - 2]
+        if n == 0:
+            return None
+        name = self._str()
+        self._strings.append(name)
+        return name
+
+    def _value(self):
+        """Read a value with its tag."""
+        # pylint: disable=too-many-return-statements
+        tag = self._byte()
+        if tag == _TAG_NULL:
+            return None
+        if tag <= _TAG_REFERENCE:
+            return self._typed(tag)
+        if tag == _TAG_INSTANCE:
+            return self._instance()
+        if tag == _TAG_CLASS:
+            return self._class()
+        if tag == _TAG_INT:
+            return self._sint()
+        if tag == _TAG_FLOAT:
+            return _FLOAT.unpack(self._bytes(8))[0]
+        if tag == _TAG_CLASSNAME:
+            return self._classname()
+        if tag == _TAG_QUALIFIERDECLARATION:
+            return self._qualifierdeclaration()
+        if tag == _TAG_PROPERTY:
+            return self._property()
+        if tag == _TAG_METHOD:
+            return self._method()
+        if tag == _TAG_PARAMETER:
+            return self._parameter()
+        if tag == _TAG_QUALIFIER:
+            return self._qualifier()
+        if tag == _TAG_NUMERICARRAY:
+            return self._numericarray(_TYPE_NAMES[self._byte()])
+        if tag == _TAG_LIST:
+            return [self._value() for _ in range(self._uint())]
+        raise ValueError(
+            _format("Invalid binary format of a CIM object: Invalid value "
+                    "tag {0}", tag))
+
+    def _typed(self, code):
+        """
+        Read a non-NULL scalar value of the CIM data type with the type code.
+        """
+        # pylint: disable=too-many-return-statements
+        if code in _UNSIGNED_CODES:
+            return _INT_TYPES[code](self._uint())
+        if code in _SIGNED_CODES:
+            return _INT_TYPES[code](self._sint())
+        if code == 2:  # string
+            return self._str()
+        if code == 3:  # char16
+            return Char16(self._str())
+        if code == 1:  # boolean
+            return self._byte() != 0
+        if code == 15:  # reference
+            return self._instancename()
+        if code == 4:  # datetime
+            return self._datetime()
+        if code == 13:  # real32
+            return Real32(_FLOAT.unpack(self._bytes(8))[0])
+        if code == 14:  # real64
+            return Real64(_FLOAT.unpack(self._bytes(8))[0])
+        raise ValueError(
+            _format("Invalid binary format of a CIM object: Invalid type "
+                    "code {0}", code))
+
+    def _datetime(self):
+        """Read a CIMDateTime value."""
+        kind = self._byte()
+        if kind == _DATETIME_TIMESTAMP:
+            dt = datetime.fromordinal(self._uint()) + \
+                timedelta(microseconds=self._uint())
+            return CIMDateTime(dt.replace(tzinfo=MinutesFromUTC(self._sint())))
+        if kind == _DATETIME_INTERVAL:
+            return CIMDateTime(timedelta(
+                days=self._sint(), seconds=self._uint(),
+                microseconds=self._uint()))
+        if kind == _DATETIME_STRING:
+            return CIMDateTime(self._str())
+        raise ValueError(
+            _format("Invalid binary format of a CIM object: Invalid datetime "
+                    "kind {0}", kind))
+
+    def _numericarray(self, type_name):
+        """Read the items of a CIMNumericArray value of the CIM data type."""
+        num = self._uint()
+        fmt = _ITEM_FORMATS[type_name]
+        data = self._bytes(num * struct.calcsize(fmt))
+        buffer = array(_ARRAY_TYPECODES[type_name])
+        if _LITTLE_ENDIAN and buffer.itemsize == struct.calcsize(fmt):
+            buffer.frombytes(data)
+        else:
+            buffer.extend(struct.unpack(f'<{num}{fmt}', data))
+        result = CIMNumericArray(type_name)
+        result._data = buffer  # pylint: disable=protected-access
+        return result
+
+    def _element_value(self, code, embedded_object):
+        """
+        Read the value of a CIM element with the type code and embedded
+        object attribute of the CIM element.
+        """
+        kind = self._byte()
+        if kind == _VALUE_NULL:
+            return None
+        if kind == _VALUE_SCALAR:
+            return self._value() if embedded_object else self._typed(code)
+        if kind == _VALUE_LIST:
+            return self._array(code, embedded_object)
+        if kind == _VALUE_NUMERICARRAY:
+            return self._numericarray(_TYPE_NAMES[code])
+        raise ValueError(
+            _format("Invalid binary format of a CIM object: Invalid value "
+                    "kind {0}", kind))
+
+    def _array(self, code, embedded_object):
+        """Read the items of a list value of a CIM element."""
+        n = self._uint()
+        num = n >> 1
+        read = self._value if embedded_object else \
+            lambda: self._typed(code)
+        if not n & 1:
+            return [read() for _ in range(num)]
+        bitmap = self._bytes((num + 7) // 8)
+        return [None if bitmap[i >> 3] & (1 << (i & 7)) else read()
+                for i in range(num)]
+
+    def _instancename(self):
+        """Read a CIMInstanceName object."""
+        frozen = self._byte()
+        classname = self._name()
+        host = self._name()
+        namespace = self._name()
+        keybindings = [(self._name(), self._value())
+                       for _ in range(self._uint())]
+        if all(isinstance(value, _KEYBINDING_TYPES)
+               for _, value in keybindings):
+            # The values have the types that are returned by
+            # _cim_keybinding(), so the checks of CIMInstanceName() are
+            # bypassed. Other values are left to it for raising the error.
+            path = CIMInstanceName(classname, host=host, namespace=namespace)
+            # pylint: disable=protected-access
+            path._keybindings = NocaseDict.from_items(
+                keybindings, allow_unnamed_keys=True)
+        else:
+            path = CIMInstanceName(classname, keybindings, host=host,
+                                   namespace=namespace)
+        if frozen:
+            path.freeze()
+        return path
+
+    def _classname(self):
+        """Read a CIMClassName object."""
+        return CIMClassName(self._name(), host=self._name(),
+                            namespace=self._name())
+
+    def _qualifiers(self):
+        """Read the qualifiers of a CIM object, as a list."""
+        return [self._qualifier() for _ in range(self._uint())]
+
+    def _qualifier(self):
+        """Read a CIMQualifier object."""
+        name = self._name()
+        code = self._byte()
+        bits = self._uint()
+        return CIMQualifier(
+            name, self._element_value(code, None), type=_TYPE_NAMES[code],
+            propagated=_tristate(bits, 0), overridable=_tristate(bits, 1),
+            tosubclass=_tristate(bits, 2), toinstance=_tristate(bits, 3),
+            translatable=_tristate(bits, 4))
+
+    def _qualifierdeclaration(self):
+        """Read a CIMQualifierDeclaration object."""
+        name = self._name()
+        code = self._byte()
+        bits = self._uint()
+        array_size = self._size()
+        scopes = NocaseDict(
+            [(self._name(), self._byte() != 0) for _ in range(self._uint())])
+        return CIMQualifierDeclaration(
+            name, _TYPE_NAMES[code], self._element_value(code, None),
+            is_array=_tristate(bits, 0), array_size=array_size,
+            scopes=scopes, overridable=_tristate(bits, 1),
+            tosubclass=_tristate(bits, 2), toinstance=_tristate(bits, 3),
+            translatable=_tristate(bits, 4))
+
+    def _size(self):
+        """Read an array size that may be `None`."""
+        n = self._uint()
+        return None if n == 0 else n - 1
+
+    def _property(self):
+        """Read a CIMProperty object."""
+        name = self._name()
+        code = self._byte()
+        bits = self._uint()
+        embedded_object = _EMBEDDED_NAMES[bits >> 4]
+        array_size = self._size()
+        reference_class = self._name()
+        class_origin = self._name()
+        qualifiers = self._qualifiers()
+        return CIMProperty(
+            name, self._element_value(code, embedded_object),
+            type=_TYPE_NAMES[code], class_origin=class_origin,
+            array_size=array_size, propagated=_tristate(bits, 0),
+            is_array=_tristate(bits, 1), reference_class=reference_class,
+            qualifiers=qualifiers, embedded_object=embedded_object)
+
+    def _parameter(self):
+        """Read a CIMParameter object."""
+        name = self._name()
+        code = self._byte()
+        bits = self._uint()
+        embedded_object = _EMBEDDED_NAMES[bits >> 4]
+        array_size = self._size()
+        reference_class = self._name()
+        qualifiers = self._qualifiers()
+        return CIMParameter(
+            name, _TYPE_NAMES[code], reference_class=reference_class,
+            is_array=_tristate(bits, 0), array_size=array_size,
+            qualifiers=qualifiers,
+            value=self._element_value(code, embedded_object),
+            embedded_object=embedded_object)
+
+    def _method(self):
+        """Read a CIMMethod object."""
+        name = self._name()
+        return_type = _TYPE_NAMES[self._byte()]
+        propagated = _tristate(self._uint(), 0)
+        class_origin = self._name()
+        qualifiers = self._qualifiers()
+        parameters = [self._parameter() for _ in range(self._uint())]
+        return CIMMethod(
+            name, return_type=return_type, parameters=parameters,
+            class_origin=class_origin, propagated=propagated,
+            qualifiers=qualifiers)
+
+    def _instance(self):
+        """Read a CIMInstance object."""
+        classname = self._name()
+        path = self._instancename() if self._byte() else None
+        inst = CIMInstance(classname, qualifiers=self._qualifiers())
+        props = [self._property() for _ in range(self._uint())]
+        # The path has just been created, so it is not copied like in
+        # CIMInstance(), and the property names of the CIMProperty objects
+        # are the dictionary keys, so the checks of CIMInstance.__setitem__()
+        # are not needed.
+        # pylint: disable=protected-access
+        inst._path = path
+        inst._properties = NocaseDict.from_items(
+            (prop.name, prop) for prop in props)
+        return inst
+
+    def _class(self):
+        """Read a CIMClass object."""
+        classname = self._name()
+        superclass = self._name()
+        path = self._classname() if self._byte() else None
+        qualifiers = self._qualifiers()
+        properties = [self._property() for _ in range(self._uint())]
+        methods = [self._method() for _ in range(self._uint())]
+        return CIMClass(
+            classname, properties=properties, methods=methods,
+            superclass=superclass, qualifiers=qualifiers, path=path)
+
+
+class BinaryWriter:
+    """
+    A writer of a sequence of CIM objects to a binary file, in the binary
+    format of pywbem.
+
+    *New in pywbem 1.10.*
+
+    The names in the objects are stored in a string table that is shared by
+    all objects written by the writer, so that names that are repeated in
+    the objects (e.g. the class and property names of CIM instances of the
+    same class) are stored only once.
+
+    Each object is written to the file when it is passed to :meth:`write`, so
+    that the objects can be written while they are being retrieved (e.g. from
+    :meth:`~pywbem.WBEMConnection.IterEnumerateInstances`), without having
+    all of them in memory. The objects can be read with
+    :class:`~pywbem.BinaryReader`.
+
+    For the supported objects, see :ref:`Binary format`.
+    """
+
+    def __init__(self, fp):
+        """
+        Parameters:
+
+          fp (:term:`py:file object`): The binary file the objects are
+            written to. Must have a ``write()`` method that accepts bytes.
+            The header of the binary format is written to it when the writer
+            is created.
+        """
+        self._fp = fp
+        self._encoder = _Encoder()
+        fp.write(_MAGIC + bytes([_VERSION]))
+
+    def write(self, obj):
+        """
+        Write a CIM object to the file.
+
+        Parameters:
+
+          obj: The CIM object or value of a CIM data type.
+
+        Raises:
+
+          TypeError: The object or a value in it has an unsupported type.
+        """
+        data = self._encoder.encode(obj)
+        header = bytearray()
+        n = len(data)
+        while n >= 0x80:
+            header.append((n & 0x7f) | 0x80)
+            n >>= 7
+        header.append(n)
+        self._fp.write(bytes(header) + data)
+
+    def write_all(self, objs):
+        """
+        Write CIM objects to the file.
+
+        Parameters:
+
+          objs (:term:`py:iterable`): The CIM objects or values of CIM data
+            types. This may be a generator, in which case only one object
+            exists at a time.
+
+        Raises:
+
+          TypeError: An object or a value in it has an unsupported type.
+        """
+        for obj in objs:
+            self.write(obj)
+
+
+class BinaryReader:
+    """
+    A reader of a sequence of CIM objects from a binary file, in the binary
+    format of pywbem, as written by :class:`~pywbem.BinaryWriter`.
+
+    *New in pywbem 1.10.*
+
+    Objects of this class are iterators that return the CIM objects in the
+    order in which they were written. Each object is read from the file when
+    it is returned, so that the objects can be processed without having all
+    of them in memory.
+    """
+
+    def __init__(self, fp):
+        """
+        Parameters:
+
+          fp (:term:`py:file object`): The binary file the objects are read
+            from. Must have a ``read()`` method that returns bytes. The header
+            of the binary format is read from it when the reader is created.
+
+        Raises:
+
+          ValueError: The file does not start with a header of the binary
+            format of a supported version.
+        """
+        self._fp = fp
+        self._decoder = _Decoder()
+        _check_header(fp.read(len(_MAGIC) + 1))
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            return self.read()
+        except EOFError:
+            raise StopIteration  # pylint: disable=raise-missing-from
+
+    def read(self):
+        """
+        Read the next CIM object from the file.
+
+        Returns:
+
+          The CIM object or value of a CIM data type.
+
+        Raises:
+
+          EOFError: The end of the file has been reached.
+          ValueError: Invalid binary format.
+        """
+        fp = self._fp
+        size = 0
+        shift = 0
+        while True:
+            b = fp.read(1)
+            if not b:
+                if shift == 0:
+                    raise EOFError("No more objects in the binary file")
+                raise ValueError(
+                    "Invalid binary format of a CIM object: File ends within "
+                    "the size of an object")
+            size |= (b[0] & 0x7f) << shift
+            if b[0] < 0x80:
+                break
+            shift += 7
+        data = fp.read(size)
+        if len(data) != size:
+            raise ValueError(
+                _format("Invalid binary format of a CIM object: File ends "
+                        "within an object ({0} of {1} bytes)",
+                        len(data), size))
+        return self._decoder.decode(data)
+
+
+def _check_header(header):
+    """
+    Check the header of the binary format.
+
+    Raises:
+
+      ValueError: Invalid header, or unsupported version.
+    """
+    if header[:len(_MAGIC)] != _MAGIC or len(header) != len(_MAGIC) + 1:
+        raise ValueError(
+            "Invalid binary format of CIM objects: Data does not start with "
+            "the header of the binary format of pywbem")
+    version = header[len(_MAGIC)]
+    if version > _VERSION:
+        raise ValueError(
+            _format("Unsupported version of the binary format of CIM "
+                    "objects: {0} (supported up to version {1})",
+                    version, _VERSION))
+
+
+def dumpb(obj):
+    """
+    Return the binary format of a CIM object.
+
+    *New in pywbem 1.10.*
+
+    For the supported objects, see :ref:`Binary format`. The returned data
+    can be converted back to the CIM object with :func:`~pywbem.loadb`.
+
+    Parameters:
+
+      obj: The CIM object or value of a CIM data type.
+
+    Returns:
+
+      :class:`py:bytes`: The binary format of the CIM object.
+
+    Raises:
+
+      TypeError: The object or a value in it has an unsupported type.
+    """
+    fp = io.BytesIO()
+    BinaryWriter(fp).write(obj)
+    return fp.getvalue()
+
+
+def loadb(data):
+    """
+    Return the CIM object from its binary format, as returned by
+    :func:`~pywbem.dumpb`.
+
+    *New in pywbem 1.10.*
+
+    Parameters:
+
+      data (:term:`py:bytes-like object`): The binary format of the CIM
+        object.
+
+    Returns:
+
+      The CIM object or value of a CIM data type.
+
+    Raises:
+
+      ValueError: Invalid binary format.
+    """
+    fp = io.BytesIO(data)
+    reader = BinaryReader(fp)
+    try:
+        obj = reader.read()
+    except EOFError:
+        raise ValueError(  # pylint: disable=raise-missing-from
+            "Invalid binary format of a CIM object: Data contains no object")
+    if fp.read(1):
+        raise ValueError(
+            "Invalid binary format of a CIM object: Data contains more than "
+            "one object")
+    return obj
@@ -38,6 +38,7 @@ import base64
 import ssl
 import warnings
 import urllib
+import zlib
 import requests
 from requests.packages import urllib3
 
@@ -63,6 +64,28 @@ DEBUG_EXCEPTIONS = False
 # integer precicion when shown in any messages.
 HTTP_CONNECT_TIMEOUT = 9.99
 
+# Size in Bytes of the chunks in which the HTTP response body is read and
+# passed on when the response is streamed (see the stream parameter of
+# wbem_request()).
+HTTP_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Content codings that are supported for compressed HTTP bodies, in the order
+# of preference. The first one is used for compressing request bodies.
+HTTP_CONTENT_ENCODINGS = ('gzip', 'deflate')
+
+# XML declaration at the begin of the HTTP body of CIM-XML requests
+XML_DECLARATION = '<?xml version="1.0" encoding="utf-8" ?>\n'
+
+# Compression level (1-9) for compressing request bodies. The default of zlib
+# is a good compromise between speed and compression ratio for CIM-XML.
+HTTP_COMPRESSION_LEVEL = 6
+
+# Maximum size in Bytes of a compressed HTTP response body after it has been
+# decompressed. This protects against compressed bodies that decompress to a
+# size that exhausts the memory (decompression bombs). Uncompressed response
+# bodies are not limited.
+HTTP_MAX_DECOMPRESSED_SIZE = 1024 * 1024 * 1024
+
 # Regexp pattern for an entire URL, with parsing items:
 # (1) scheme (optional)
 # (2) host (required) - may contain brackets and colons for IPv6 addresses
@@ -417,7 +440,8 @@ def debug_exc(exc):
     return message
 
 
-def wbem_request(conn, req_data, cimxml_headers, target_type='server'):
+def wbem_request(conn, req_data, cimxml_headers, target_type='server',
+                 stream=False, buffer=False):
     """
     Send an HTTP or HTTPS request to a WBEM server or WBEM listener and return
     the response.
@@ -442,12 +466,25 @@ def wbem_request(conn, req_data, cimxml_headers, target_type='server'):
 
       target_type (str): Target type: 'server' or 'listener'.
 
+      stream (bool): Stream the HTTP response body. If `True`, the response
+        body is not read by this function. Instead, an iterator is returned
+        that reads the body in chunks while being consumed. The iterator must
+        be consumed completely or closed, in order to release the HTTP
+        connection.
+
+      buffer (bool): Read the HTTP response body into a buffer that is
+        allocated once, see read_response_body(). If `True`, the response
+        data is returned as a :class:`py:memoryview` object on the buffer.
+
     Returns:
 
         tuple: A tuple containing two items:
 
           * The CIM-XML formatted response data from the WBEM server or
-            WBEM listener, as a :class:`py:bytes` object.
+            WBEM listener, as a :class:`py:bytes` object. If `stream` is
+            `True`, an iterator of :class:`py:bytes` objects with the
+            chunks of the response data. If `buffer` is `True`, a
+            :class:`py:memoryview` object with the response data.
 
           * The server response time in seconds as floating point number if
             this data was received from the server. If no data returned
@@ -461,56 +498,89 @@ def wbem_request(conn, req_data, cimxml_headers, target_type='server'):
         :exc:`~pywbem.HTTPError`
     """
 
-    if cimxml_headers is None:
-        cimxml_headers = []
-
-    if target_type == 'server':
-        target = '/cimom'
-    else:
-        target = ''
+    target, req_body, req_headers = build_request(
+        conn, req_data, cimxml_headers, target_type)
     target_url = f'{conn.url}{target}'
 
-    # Make sure the data parameter is converted to a UTF-8 encoded byte string.
-    # This is important because according to RFC2616, the Content-Length HTTP
-    # header must be measured in Bytes (and the Content-Type header will
-    # indicate UTF-8).
-    req_body = _ensure_bytes(req_data)
-    req_body = b'<?xml version="1.0" encoding="utf-8" ?>\n' + req_body
-
-    req_headers = {
-        'Content-type': 'application/xml; charset="utf-8"',
-        'Content-length': f'{len(req_body)}',
-    }
-    req_headers.update(dict(cimxml_headers))
-
-    if target_type == 'server' and conn.creds is not None:
-        auth = f'{conn.creds[0]}:{conn.creds[1]}'
-        auth64 = _ensure_unicode(base64.b64encode(
-            _ensure_bytes(auth))).replace('\n', '')
-        req_headers['Authorization'] = f'Basic {auth64}'
+    # The body that is sent, which may be compressed. The uncompressed body
+    # is used for the operation recorders and in exceptions.
+    send_body = compress_request(conn, req_body, req_headers)
 
     if conn.operation_recorders:
         for recorder in conn.operation_recorders:
             recorder.stage_http_request(
                 conn.conn_id, 11, conn.url, target, 'POST',
-                dict(cimxml_headers), req_body)
+                dict(cimxml_headers or []), req_body)
 
             # We want clean response data when an exception is raised before
             # the HTTP response comes in:
             recorder.stage_http_response1(conn.conn_id, None, None, None, None)
             recorder.stage_http_response2(None)
 
+    resp = post_request(
+        conn, target_url, send_body, req_headers, cimxml_headers)
+
+    if send_body is not req_body and compression_rejected(resp):
+        # The WBEM server or WBEM listener does not support compressed
+        # requests. Send the request again uncompressed.
+        resp.close()
+        reject_request_compression(conn, req_body, req_headers)
+        resp = post_request(
+            conn, target_url, req_body, req_headers, cimxml_headers)
+
+    if conn.operation_recorders:
+        for recorder in conn.operation_recorders:
+            recorder.stage_http_response1(
+                conn.conn_id,
+                resp.raw.version,
+                resp.status_code,
+                resp.reason,
+                resp.headers)
+
+    try:
+        svr_resp_time = check_response(conn, resp, req_body, target_type)
+    except Exception:
+        resp.close()
+        raise
+
+    if stream:
+        return iter_response_body(conn, resp), svr_resp_time
+    if buffer:
+        return read_response_body(conn, resp), svr_resp_time
+    return b''.join(iter_response_body(conn, resp)), svr_resp_time
+
+
+def post_request(conn, target_url, req_body, req_headers, cimxml_headers):
+    """
+    Send the HTTP POST request for a CIM-XML request and return the HTTP
+    response. See wbem_request() for a description of the parameters.
+
+    The HTTP response is always streamed, i.e. its body has not been read
+    yet. This allows limiting the size of decompressed response bodies while
+    they are read (see iter_response_body()).
+
+    Returns:
+
+        :class:`requests.Response`: The HTTP response.
+
+    Raises:
+
+        :exc:`~pywbem.ConnectionError`
+        :exc:`~pywbem.TimeoutError`
+    """
     try:
         try:
             if DEBUG_EXCEPTIONS:
+                debug_headers = dict(cimxml_headers or [])
                 print("Debug: pywbem wbem_request: Calling session.post() "
                       f"with timeout=(connect={HTTP_CONNECT_TIMEOUT}, "
-                      f"read={conn.timeout}) for {cimxml_headers[1][1]} on "
-                      f"{cimxml_headers[2][1]} with "
+                      f"read={conn.timeout}) for "
+                      f"{debug_headers.get('CIMMethod')} on "
+                      f"{debug_headers.get('CIMObject')} with "
                       f"{conn.session.adapters['https://'].max_retries}")
-            resp = conn.session.post(
+            return conn.session.post(
                 target_url, data=req_body, headers=req_headers,
-                timeout=(HTTP_CONNECT_TIMEOUT, conn.timeout))
+                timeout=(HTTP_CONNECT_TIMEOUT, conn.timeout), stream=True)
         except Exception as _exc:
             if DEBUG_EXCEPTIONS:
                 print("Debug: pywbem wbem_request: session.post() raised: "
@@ -524,6 +594,438 @@ def wbem_request(conn, req_data, cimxml_headers, target_type='server'):
             RequestExceptionWarning, 1)
         raise pywbem_urllib3_exception(exc, conn)
 
+
+def compress_request(conn, req_body, req_headers):
+    """
+    Set the HTTP headers of a CIM-XML request for the compression settings
+    of the connection, and return the HTTP body to be sent, which is
+    compressed if the request_compression_threshold of the connection is
+    reached.
+
+    This function is independent of the HTTP client implementation and is
+    used for both the synchronous and asynchronous WBEM connections.
+
+    The decision to compress is made once for the operation. A rejection of
+    compressed requests is recorded in the connection as a property of the
+    WBEM server (like the support for pull operations), without changing
+    the request_compression_threshold setting, so that operations of other
+    threads in the thread_safe mode are not affected while in progress.
+
+    Parameters:
+
+      conn: WBEM connection to be used.
+
+      req_body (bytes): The uncompressed HTTP body of the request.
+
+      req_headers (dict): HTTP headers of the request. Updated by this
+        function.
+
+    Returns:
+
+      bytes: The HTTP body to be sent. This is the `req_body` object if the
+      request is not compressed.
+    """
+    if conn.compression:
+        req_headers['Accept-Encoding'] = ', '.join(HTTP_CONTENT_ENCODINGS)
+    else:
+        req_headers['Accept-Encoding'] = 'identity'
+
+    threshold = conn.request_compression_threshold
+    # pylint: disable=protected-access
+    if threshold is None or conn._request_compression_rejected or \
+            len(req_body) < threshold:
+        return req_body
+    send_body = compress_body(req_body)
+    req_headers['Content-Encoding'] = HTTP_CONTENT_ENCODINGS[0]
+    req_headers['Content-length'] = f'{len(send_body)}'
+    return send_body
+
+
+def reject_request_compression(conn, req_body, req_headers):
+    """
+    Record in the connection that the WBEM server or WBEM listener does not
+    support compressed requests, so that further requests are not compressed,
+    and set the HTTP headers of the request for sending `req_body`
+    uncompressed. See compress_request().
+
+    The flag in the connection only changes from False to True, so setting it
+    needs no lock.
+    """
+    # pylint: disable=protected-access
+    conn._request_compression_rejected = True
+    del req_headers['Content-Encoding']
+    req_headers['Content-length'] = f'{len(req_body)}'
+
+
+def compression_rejected(resp):
+    """
+    Return a boolean indicating whether an HTTP response rejects the
+    compressed body of the request.
+
+    Besides HTTP status 415 (Unsupported Media Type), this recognizes
+    HTTP status 406 with a 'header-mismatch' CIMError header field, which is
+    returned by WBEM listeners that do not support the Content-Encoding header
+    field of the request (e.g. pywbem listeners before pywbem 1.10).
+    """
+    if resp.status_code == 415:
+        return True
+    return resp.status_code == 406 and \
+        resp.headers.get('CIMError', None) == 'header-mismatch'
+
+
+def compress_body(body):
+    """
+    Compress an HTTP body with the gzip content coding.
+
+    Parameters:
+
+      body (bytes): The uncompressed HTTP body.
+
+    Returns:
+
+      bytes: The compressed HTTP body.
+    """
+    compressor = zlib.compressobj(HTTP_COMPRESSION_LEVEL, zlib.DEFLATED,
+                                  16 + zlib.MAX_WBITS)
+    return compressor.compress(body) + compressor.flush()
+
+
+def decompress_body(body, content_encoding, max_size=None):
+    """
+    Decompress an HTTP body with the gzip or deflate content coding.
+
+    The deflate content coding is defined as the zlib format (RFC1950), but
+    some HTTP implementations send raw deflate data (RFC1951). Both are
+    accepted.
+
+    The decompression stops as soon as the decompressed body exceeds
+    `max_size`, so that compressed bodies that decompress to a very large
+    size (decompression bombs) do not exhaust the memory.
+
+    Parameters:
+
+      body (bytes): The compressed HTTP body.
+
+      content_encoding (str): The content coding, in lower case: 'gzip',
+        'x-gzip' or 'deflate'.
+
+      max_size (int): Maximum size in Bytes of the decompressed HTTP body,
+        or `None` for no limit.
+
+    Returns:
+
+      bytes: The decompressed HTTP body.
+
+    Raises:
+
+      zlib.error: The HTTP body is not valid for the content coding.
+
+      ValueError: The decompressed HTTP body exceeds `max_size`.
+    """
+    if content_encoding in ('gzip', 'x-gzip'):
+        return _decompress(body, 16 + zlib.MAX_WBITS, max_size)
+    try:
+        return _decompress(body, zlib.MAX_WBITS, max_size)
+    except zlib.error:
+        return _decompress(body, -zlib.MAX_WBITS, max_size)
+
+
+def _decompress(body, wbits, max_size):
+    """
+    Decompress a body in the zlib, gzip or raw deflate format, as specified
+    by `wbits`, with a limit on the decompressed size. See decompress_body().
+    """
+    decompressor = zlib.decompressobj(wbits)
+    if max_size is None:
+        data = decompressor.decompress(body)
+    else:
+        data = decompressor.decompress(body, max_size + 1)
+        if len(data) > max_size:
+            raise ValueError(
+                _format("The decompressed body exceeds the maximum size of "
+                        "{0} Bytes", max_size))
+    if not decompressor.eof:
+        raise zlib.error("Incomplete or truncated compressed body")
+    return data
+
+
+def wbem_options(conn):
+    """
+    Send an HTTP OPTIONS request to a WBEM server for discovering the CIM-XML
+    capabilities of the server, as described in DSP0200, and return the
+    header fields of the response.
+
+    Parameters:
+
+      conn (:class:`~pywbem.WBEMConnection`):
+        WBEM connection to be used.
+
+    Returns:
+
+        :class:`requests.structures.CaseInsensitiveDict`: The HTTP header
+        fields of the response, e.g. 'CIMSupportsMultipleOperations'.
+
+    Raises:
+
+        :exc:`~pywbem.AuthError`
+        :exc:`~pywbem.ConnectionError`
+        :exc:`~pywbem.TimeoutError`
+        :exc:`~pywbem.HTTPError`
+    """
+
+    target, _, req_headers = build_request(conn, '', None)
+    target_url = f'{conn.url}{target}'
+
+    # The OPTIONS request has no body
+    del req_headers['Content-type']
+    del req_headers['Content-length']
+
+    try:
+        resp = conn.session.options(
+            target_url, headers=req_headers,
+            timeout=(HTTP_CONNECT_TIMEOUT, conn.timeout))
+    except requests.exceptions.RequestException as exc:
+        raise pywbem_requests_exception(exc, conn)
+    except urllib3.exceptions.HTTPError as exc:
+        warnings.warn(
+            f"requests raised an urllib3 exception {type(exc)} directly",
+            RequestExceptionWarning, 1)
+        raise pywbem_urllib3_exception(exc, conn)
+
+    if resp.status_code != 200:
+        # Raises AuthError or HTTPError
+        check_response(conn, resp, None)
+
+    return resp.headers
+
+
+def iter_response_body(conn, resp):
+    """
+    Generator function that reads the body of a streamed HTTP response in
+    chunks and yields them.
+
+    The HTTP connection is released when the generator is exhausted or
+    closed. If operation recorders are active on the connection, the chunks
+    are accumulated and the complete body is passed on to them at the end.
+
+    A compressed body is decompressed by requests while it is read. If the
+    decompressed body exceeds HTTP_MAX_DECOMPRESSED_SIZE, reading it is
+    aborted.
+
+    Parameters:
+
+      conn (:class:`~pywbem.WBEMConnection`):
+        WBEM connection that was used.
+
+      resp (:class:`requests.Response`): HTTP response that was returned with
+        streaming enabled.
+
+    Yields:
+
+        :class:`py:bytes`: The next chunk of the HTTP response body.
+
+    Raises:
+
+        :exc:`~pywbem.ConnectionError`
+        :exc:`~pywbem.TimeoutError`
+    """
+    recorded_chunks = [] if conn.operation_recorders else None
+    content_encoding = resp.headers.get('Content-Encoding', 'identity')
+    if content_encoding.strip().lower() == 'identity':
+        max_size = None
+    else:
+        max_size = HTTP_MAX_DECOMPRESSED_SIZE
+    size = 0
+    try:
+        try:
+            for chunk in resp.iter_content(HTTP_STREAM_CHUNK_SIZE):
+                if not chunk:
+                    continue
+                size += len(chunk)
+                if max_size is not None and size > max_size:
+                    raise ConnectionError(
+                        _format("The decompressed HTTP response body "
+                                "exceeds the maximum size of {0} Bytes",
+                                max_size),
+                        conn_id=conn.conn_id)
+                if recorded_chunks is not None:
+                    recorded_chunks.append(chunk)
+                yield chunk
+        except requests.exceptions.RequestException as exc:
+            raise pywbem_requests_exception(exc, conn)
+        except urllib3.exceptions.HTTPError as exc:
+            warnings.warn(
+                f"requests raised an urllib3 exception {type(exc)} directly",
+                RequestExceptionWarning, 1)
+            raise pywbem_urllib3_exception(exc, conn)
+    finally:
+        resp.close()
+
+    if recorded_chunks is not None:
+        resp_body = b''.join(recorded_chunks)
+        for recorder in conn.operation_recorders:
+            recorder.stage_http_response2(resp_body)
+
+
+def read_response_body(conn, resp):
+    """
+    Read the body of a streamed HTTP response into a buffer and return a
+    memoryview on the buffer.
+
+    If the HTTP response has a Content-Length header field and is not
+    compressed, the buffer is allocated once with that length, and the body
+    is read into it in chunks. This avoids holding the body in memory twice
+    (as the list of chunks and as the joined body), as it happens when the
+    HTTP response is not streamed. Otherwise, the chunks of the body are
+    joined.
+
+    The HTTP connection is released. If operation recorders are active on the
+    connection, the body is passed on to them.
+
+    Parameters:
+
+      conn (:class:`~pywbem.WBEMConnection`):
+        WBEM connection that was used.
+
+      resp (:class:`requests.Response`): HTTP response that was returned with
+        streaming enabled.
+
+    Returns:
+
+        :class:`py:memoryview`: The HTTP response body.
+
+    Raises:
+
+        :exc:`~pywbem.ConnectionError`
+        :exc:`~pywbem.TimeoutError`
+    """
+    content_encoding = resp.headers.get('Content-Encoding', 'identity')
+    try:
+        length = int(resp.headers.get('Content-Length', None))
+    except (TypeError, ValueError):
+        length = None
+    if length is None or content_encoding.strip().lower() != 'identity':
+        # The chunks are decompressed by requests
+        return memoryview(b''.join(iter_response_body(conn, resp)))
+
+    buffer = bytearray(length)
+    view = memoryview(buffer)
+    pos = 0
+    try:
+        try:
+            while pos < length:
+                size = resp.raw.readinto(
+                    view[pos:pos + HTTP_STREAM_CHUNK_SIZE])
+                if not size:
+                    raise ConnectionError(
+                        _format("The HTTP response body ended after {0} of "
+                                "{1} Bytes", pos, length),
+                        conn_id=conn.conn_id)
+                pos += size
+        except urllib3.exceptions.HTTPError as exc:
+            raise pywbem_urllib3_exception(exc, conn)
+    except Exception:
+        resp.close()
+        raise
+    resp.raw.release_conn()
+
+    if conn.operation_recorders:
+        resp_body = bytes(buffer)
+        for recorder in conn.operation_recorders:
+            recorder.stage_http_response2(resp_body)
+
+    return view
+
+
+def build_request(conn, req_data, cimxml_headers, target_type='server'):
+    """
+    Build the target, body and headers of the HTTP request for a CIM-XML
+    request to a WBEM server or WBEM listener.
+
+    This function is independent of the HTTP client implementation and is
+    used for both the synchronous and asynchronous WBEM connections.
+
+    Parameters: See wbem_request().
+
+    Returns:
+
+        tuple: A tuple containing these items:
+
+          * The target (path) of the HTTP request, as a string.
+
+          * The HTTP body of the request, as a :class:`py:bytes` object.
+
+          * The HTTP headers of the request, as a dict.
+    """
+
+    if cimxml_headers is None:
+        cimxml_headers = []
+
+    if target_type == 'server':
+        target = '/cimom'
+    else:
+        target = ''
+
+    # Make sure the data parameter is converted to a UTF-8 encoded byte string.
+    # This is important because according to RFC2616, the Content-Length HTTP
+    # header must be measured in Bytes (and the Content-Type header will
+    # indicate UTF-8).
+    # The request strings built by pywbem start with the XML declaration, so
+    # that they are encoded without being copied again. The XML declaration
+    # is added for other request data.
+    req_data = _ensure_unicode(req_data)
+    if not req_data.startswith(XML_DECLARATION):
+        req_data = XML_DECLARATION + req_data
+    req_body = _ensure_bytes(req_data)
+
+    req_headers = {
+        'Content-type': 'application/xml; charset="utf-8"',
+        'Content-length': f'{len(req_body)}',
+    }
+    req_headers.update(dict(cimxml_headers))
+
+    if target_type == 'server' and conn.creds is not None:
+        auth = f'{conn.creds[0]}:{conn.creds[1]}'
+        auth64 = _ensure_unicode(base64.b64encode(
+            _ensure_bytes(auth))).replace('\n', '')
+        req_headers['Authorization'] = f'Basic {auth64}'
+
+    return target, req_body, req_headers
+
+
+def check_response(conn, resp, req_body, target_type='server'):
+    """
+    Check the status and headers of the HTTP response for a CIM-XML request
+    and return the server response time.
+
+    This function is independent of the HTTP client implementation and is
+    used for both the synchronous and asynchronous WBEM connections.
+
+    Parameters:
+
+      conn: WBEM connection that was used.
+
+      resp: HTTP response object with the attributes `status_code`, `reason`,
+        `headers` (case insensitive dict) and `text`, for example a
+        :class:`requests.Response` object.
+
+      req_body (bytes): HTTP body of the request.
+
+      target_type (str): Target type: 'server' or 'listener'.
+
+    Returns:
+
+        The server response time in seconds as floating point number if
+        this data was received from the server. If no data returned from
+        server `None` is returned.
+
+    Raises:
+
+        :exc:`~pywbem.AuthError`
+        :exc:`~pywbem.HTTPError`
+        :exc:`~pywbem.HeaderParseError`
+    """
+
     if target_type == 'server':
         # Get the optional response time header
         svr_resp_time = resp.headers.get('WBEMServerResponseTime', None)
@@ -536,15 +1038,6 @@ def wbem_request(conn, req_data, cimxml_headers, target_type='server'):
     else:
         svr_resp_time = None
 
-    if conn.operation_recorders:
-        for recorder in conn.operation_recorders:
-            recorder.stage_http_response1(
-                conn.conn_id,
-                resp.raw.version,
-                resp.status_code,
-                resp.reason,
-                resp.headers)
-
     if resp.status_code != 200:
 
         if target_type == 'server' and resp.status_code == 401:
@@ -609,13 +1102,7 @@ def wbem_request(conn, req_data, cimxml_headers, target_type='server'):
             conn_id=conn.conn_id, request_data=req_body,
             response_data=resp.text)
 
-    resp_body = resp.content
-
-    if conn.operation_recorders:
-        for recorder in conn.operation_recorders:
-            recorder.stage_http_response2(resp_body)
-
-    return resp_body, svr_resp_time
+    return svr_resp_time
 
 
 def max_repr(text, max_len=1000):
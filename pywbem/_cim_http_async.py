@@ -0,0 +1,524 @@
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this program; if not, write to the Free Software
+# Foundation, Inc., 675 Mass Ave, Cambridge, MA 02139, USA.
+#
+
+"""
+Send HTTP/HTTPS requests to a WBEM server using asyncio.
+
+This module implements a minimal HTTP/1.1 client on top of asyncio streams
+that is used by :class:`~pywbem.AsyncWBEMConnection`. It supports persistent
+(keep-alive) connections that are pooled per WBEM connection, with an upper
+bound on the number of concurrently open connections.
+
+Like the _cim_http module, this module does not know anything about the fact
+that the data being transferred in the HTTP request and response is CIM-XML.
+"""
+
+import asyncio
+import collections
+import os
+import re
+import ssl
+import zlib
+
+import certifi
+from requests.structures import CaseInsensitiveDict
+
+from ._cim_http import HTTP_CONNECT_TIMEOUT, HTTP_STREAM_CHUNK_SIZE, \
+    HTTP_MAX_DECOMPRESSED_SIZE, build_request, check_response, \
+    compress_request, compression_rejected, reject_request_compression, \
+    decompress_body, exc_message_amended
+from ._exceptions import ConnectionError, TimeoutError, \
+    HeaderParseError  # pylint: disable=redefined-builtin
+from ._utils import _format
+
+__all__ = []
+
+# Regexp pattern for the HTTP status line, with parsing items:
+# (1) HTTP version (e.g. '1.1')
+# (2) status code
+# (3) reason phrase (optional)
+STATUS_LINE_PATTERN = re.compile(
+    rb'^HTTP/(\d\.\d) +(\d{3})(?: +(.*))?$')
+
+# Regexp pattern for the hostport of a normalized URL, with parsing items:
+# (1) host, without brackets in case of IPv6 addresses
+# (2) zone ID of IPv6 addresses (optional)
+# (3) port
+HOSTPORT_PATTERN = re.compile(r'^\[?(.+?)(?:-([^\]]+))?\]?:(\d+)$')
+
+# Maximum size in Bytes of a received HTTP response body. The body is held in
+# memory, so this protects against responses that exhaust the memory.
+HTTP_MAX_RESPONSE_SIZE = 1024 * 1024 * 1024
+
+
+class _NoResponseError(Exception):
+    """
+    Raised when a connection broke down before the status line of the HTTP
+    response was received. The original exception is in the args.
+    """
+
+
+class _HTTPResponse:
+    # pylint: disable=too-few-public-methods
+    """
+    A received HTTP response.
+
+    The attributes are compatible with those of :class:`requests.Response`
+    that are used by :func:`pywbem._cim_http.check_response`.
+    """
+
+    def __init__(self, version, status_code, reason, headers, content):
+        self.version = version
+        self.status_code = status_code
+        self.reason = reason
+        self.headers = headers
+        self.content = content
+
+    @property
+    def text(self):
+        """
+        str: The HTTP body decoded using the charset from the Content-type
+        header, defaulting to UTF-8.
+        """
+        content_type = self.headers.get('Content-type', '')
+        m = re.search(r'charset="?([A-Za-z0-9_\-]+)"?', content_type)
+        encoding = m.group(1) if m else 'utf-8'
+        try:
+            return self.content.decode(encoding, errors='replace')
+        except LookupError:
+            return self.content.decode('utf-8', errors='replace')
+
+
+def split_hostport(hostport):
+    """
+    Split the normalized hostport of a WBEM connection URL into host and port
+    as needed for opening a socket.
+
+    IPv6 addresses in RFC6874 URI syntax are converted to RFC4007 text syntax
+    without brackets, e.g. '[fe80::1-eth0]:5989' becomes
+    ('fe80::1%eth0', 5989).
+
+    Returns:
+      tuple of (host, port)
+    """
+    m = HOSTPORT_PATTERN.match(hostport)
+    if not m:
+        raise ValueError(
+            _format("Invalid host and port {0!A} in URL", hostport))
+    host, zone_id, port = m.group(1), m.group(2), int(m.group(3))
+    if hostport.startswith('[') and zone_id is not None:
+        host = f'{host}%{zone_id}'
+    return host, port
+
+
+def create_ssl_context(conn):
+    """
+    Create the SSL context for an HTTPS connection to the WBEM server, based
+    on the x509, ca_certs and no_verification attributes of the WBEM
+    connection.
+
+    The certificate verification follows that of
+    :class:`~pywbem.WBEMConnection`: If `no_verification` is `True`, the server
+    certificate is not verified. Otherwise, it is verified using the
+    certificates in the file or directory specified in `ca_certs`, or if that
+    is `None`, using the certificates provided by the Python certifi package.
+    """
+    ctx = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
+    if conn.no_verification:
+        ctx.check_hostname = False
+        ctx.verify_mode = ssl.CERT_NONE
+    elif conn.ca_certs is None:
+        ctx.load_verify_locations(cafile=certifi.where())
+    elif os.path.isdir(conn.ca_certs):
+        ctx.load_verify_locations(capath=conn.ca_certs)
+    else:
+        ctx.load_verify_locations(cafile=conn.ca_certs)
+    if conn.x509 is not None:
+        ctx.load_cert_chain(
+            conn.x509['cert_file'], conn.x509.get('key_file', None))
+    return ctx
+
+
+class HTTPConnectionPool:
+    """
+    A pool of persistent HTTP connections to a single WBEM server.
+
+    At most `max_connections` connections are in use at the same time; further
+    requests wait until a connection becomes available. Connections are kept
+    open after a request for reuse by later requests, unless the server
+    indicated that it closes the connection.
+
+    The pool must be used from a single event loop.
+    """
+
+    def __init__(self, conn, max_connections):
+        self._conn = conn
+        self._max_connections = max_connections
+        self._host, self._port = split_hostport(conn.host)
+        self._ssl = create_ssl_context(conn) if conn.scheme == 'https' \
+            else None
+        self._idle = collections.deque()  # (reader, writer) tuples
+        # The semaphore is created when first used, so that it is bound to
+        # the event loop that is running at that time.
+        self._semaphore = None
+        self._closed = False
+
+    @property
+    def max_connections(self):
+        """
+        int: Maximum number of connections that are in use at the same time.
+        """
+        return self._max_connections
+
+    @property
+    def idle_count(self):
+        """
+        int: Number of idle connections in the pool.
+        """
+        return len(self._idle)
+
+    async def _open(self):
+        """
+        Open a new connection to the WBEM server.
+
+        Returns:
+          tuple of (reader, writer)
+        """
+        try:
+            return await asyncio.wait_for(
+                asyncio.open_connection(
+                    self._host, self._port, ssl=self._ssl,
+                    server_hostname=self._host if self._ssl else None),
+                HTTP_CONNECT_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise ConnectionError(
+                f"Could not send request to {self._conn.url} within "
+                f"{HTTP_CONNECT_TIMEOUT:.0f} sec",
+                conn_id=self._conn.conn_id)
+        except ssl.SSLError as exc:
+            raise ConnectionError(
+                exc_message_amended(str(exc), self._conn),
+                conn_id=self._conn.conn_id)
+        except OSError as exc:
+            raise ConnectionError(
+                _format("Cannot connect to {0}: {1}", self._conn.url, exc),
+                conn_id=self._conn.conn_id)
+
+    async def request(self, target, body, headers, idempotent=False):
+        """
+        Send an HTTP POST request and receive the response, using a pooled
+        connection.
+
+        Idle pooled connections that have been closed by the server are
+        discarded before a request is sent. If a reused pooled connection
+        breaks down after the request has been sent but before the status
+        line of the response has been received, the server may or may not
+        have processed the request. The request is then sent again on another
+        connection only if it is idempotent.
+
+        Parameters:
+
+          target (str): Target URI of the request.
+
+          body (bytes): HTTP body of the request.
+
+          headers (dict): HTTP headers of the request.
+
+          idempotent (bool): Indicates that performing the request more than
+            once has the same effect as performing it once.
+
+        Returns:
+          _HTTPResponse: The received response.
+
+        Raises:
+          :exc:`~pywbem.ConnectionError`
+          :exc:`~pywbem.TimeoutError`
+          :exc:`~pywbem.HeaderParseError`
+        """
+        if self._closed:
+            raise ConnectionError(
+                "AsyncWBEMConnection is closed", conn_id=self._conn.conn_id)
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_connections)
+
+        head = [f'POST {target} HTTP/1.1',
+                f'Host: {self._conn.host}']
+        head.extend(f'{name}: {value}' for name, value in headers.items())
+        request_data = ('\r\n'.join(head) + '\r\n\r\n').encode('utf-8') + \
+            body
+
+        async with self._semaphore:
+            while True:
+                reader, writer, reused = await self._acquire()
+                try:
+                    try:
+                        writer.write(request_data)
+                        await writer.drain()
+                    except OSError as exc:
+                        raise _NoResponseError(exc)
+                    resp, keep_alive = await asyncio.wait_for(
+                        self._read_response(reader), self._conn.timeout)
+                except asyncio.TimeoutError:
+                    writer.close()
+                    raise TimeoutError(
+                        f"No response received from {self._conn.url} within "
+                        f"{self._conn.timeout} sec",
+                        conn_id=self._conn.conn_id)
+                except _NoResponseError as exc:
+                    writer.close()
+                    if reused and idempotent:
+                        # The server has probably closed the idle connection
+                        # while the request was sent.
+                        continue
+                    cause = exc.args[0]
+                    raise ConnectionError(
+                        _format("Connection to {0} broke down before a "
+                                "response was received: {1}",
+                                self._conn.url, cause or type(cause).__name__),
+                        conn_id=self._conn.conn_id)
+                except (OSError, asyncio.IncompleteReadError,
+                        asyncio.LimitOverrunError) as exc:
+                    writer.close()
+                    raise ConnectionError(
+                        _format("Connection to {0} broke down: {1}",
+                                self._conn.url, exc or type(exc).__name__),
+                        conn_id=self._conn.conn_id)
+                except BaseException:
+                    # Includes cancellation of the task
+                    writer.close()
+                    raise
+                if keep_alive and not self._closed:
+                    self._idle.append((reader, writer))
+                else:
+                    writer.close()
+                return resp
+
+    async def _acquire(self):
+        """
+        Return an idle pooled connection, or a new connection if there is no
+        idle connection. Idle connections that have been closed by the server
+        are discarded.
+
+        Returns:
+          tuple of (reader, writer, reused)
+        """
+        while self._idle:
+            reader, writer = self._idle.popleft()
+            if reader.at_eof():
+                writer.close()
+                continue
+            return reader, writer, True
+        reader, writer = await self._open()
+        return reader, writer, False
+
+    async def _read_response(self, reader):
+        """
+        Read an HTTP response from the stream.
+
+        Returns:
+          tuple of (response, keep_alive)
+
+        Raises:
+          _NoResponseError: The connection broke down before the status line
+            was received.
+        """
+        try:
+            line = await self._read_line(reader)
+        except (OSError, asyncio.IncompleteReadError) as exc:
+            raise _NoResponseError(exc)
+        m = STATUS_LINE_PATTERN.match(line)
+        if not m:
+            raise HeaderParseError(
+                _format("Invalid HTTP status line received: {0!A}", line),
+                conn_id=self._conn.conn_id)
+        version = m.group(1).decode('ascii')
+        status_code = int(m.group(2))
+        reason = (m.group(3) or b'').decode('latin-1')
+
+        headers = CaseInsensitiveDict()
+        while True:
+            line = await self._read_line(reader)
+            if not line:
+                break
+            name, sep, value = line.decode('latin-1').partition(':')
+            if not sep:
+                raise HeaderParseError(
+                    _format("Invalid HTTP header line received: {0!A}", line),
+                    conn_id=self._conn.conn_id)
+            name = name.strip()
+            value = value.strip()
+            if name in headers:
+                headers[name] = f'{headers[name]}, {value}'
+            else:
+                headers[name] = value
+
+        connection = headers.get('Connection', '').lower()
+        if version == '1.0':
+            keep_alive = 'keep-alive' in connection
+        else:
+            keep_alive = 'close' not in connection
+
+        transfer_encoding = headers.get('Transfer-Encoding', '').lower()
+        content_length = headers.get('Content-Length', None)
+        if 'chunked' in transfer_encoding:
+            content = await self._read_chunked(reader)
+        elif content_length is not None:
+            try:
+                content_length = int(content_length)
+            except ValueError:
+                raise HeaderParseError(
+                    _format("Invalid Content-Length header received: {0!A}",
+                            content_length),
+                    conn_id=self._conn.conn_id)
+            self._check_size(content_length)
+            content = await reader.readexactly(content_length)
+        else:
+            content = await self._read_until_eof(reader)
+            keep_alive = False
+
+        content_encoding = headers.get('Content-Encoding', 'identity')
+        content_encoding = content_encoding.strip().lower()
+        if content_encoding != 'identity':
+            content = self._decompress(content, content_encoding)
+
+        resp = _HTTPResponse(version, status_code, reason, headers, content)
+        return resp, keep_alive
+
+    def _check_size(self, size):
+        """
+        Raise ConnectionError if the size of the response body exceeds
+        HTTP_MAX_RESPONSE_SIZE.
+        """
+        if size > HTTP_MAX_RESPONSE_SIZE:
+            raise ConnectionError(
+                _format("The HTTP response body exceeds the maximum size of "
+                        "{0} Bytes", HTTP_MAX_RESPONSE_SIZE),
+                conn_id=self._conn.conn_id)
+
+    def _decompress(self, content, content_encoding):
+        """
+        Decompress an HTTP body with the content coding, limiting the
+        decompressed size to HTTP_MAX_DECOMPRESSED_SIZE.
+        """
+        try:
+            return decompress_body(
+                content, content_encoding, HTTP_MAX_DECOMPRESSED_SIZE)
+        except zlib.error as exc:
+            raise ConnectionError(
+                _format("Cannot decompress the HTTP response body with "
+                        "Content-Encoding {0}: {1}", content_encoding, exc),
+                conn_id=self._conn.conn_id)
+        except ValueError:
+            raise ConnectionError(
+                _format("The decompressed HTTP response body exceeds the "
+                        "maximum size of {0} Bytes",
+                        HTTP_MAX_DECOMPRESSED_SIZE),
+                conn_id=self._conn.conn_id)
+
+    @staticmethod
+    async def _read_line(reader):
+        """
+        Read a CRLF terminated line from the stream and return it without the
+        line terminator.
+        """
+        line = await reader.readuntil(b'\n')
+        return line.rstrip(b'\r\n')
+
+    async def _read_chunked(self, reader):
+        """
+        Read an HTTP body in chunked transfer encoding from the stream.
+        """
+        chunks = []
+        total_size = 0
+        while True:
+            line = await self._read_line(reader)
+            try:
+                size = int(line.split(b';', 1)[0], 16)
+            except ValueError:
+                raise HeaderParseError(
+                    _format("Invalid chunk size line received: {0!A}", line),
+                    conn_id=self._conn.conn_id)
+            if size == 0:
+                break
+            total_size += size
+            self._check_size(total_size)
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)  # CRLF after chunk data
+        # Skip the optional trailer
+        while await self._read_line(reader):
+            pass
+        return b''.join(chunks)
+
+    async def _read_until_eof(self, reader):
+        """
+        Read an HTTP body that is delimited by the end of the connection from
+        the stream.
+        """
+        chunks = []
+        total_size = 0
+        while True:
+            chunk = await reader.read(HTTP_STREAM_CHUNK_SIZE)
+            if not chunk:
+                break
+            total_size += len(chunk)
+            self._check_size(total_size)
+            chunks.append(chunk)
+        return b''.join(chunks)
+
+    async def close(self):
+        """
+        Close all idle connections of the pool and mark the pool closed.
+        Connections that are in use are closed when their request completes.
+        """
+        self._closed = True
+        while self._idle:
+            _, writer = self._idle.popleft()
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (OSError, ssl.SSLError):
+                pass
+
+
+async def wbem_request_async(conn, req_data, cimxml_headers,
+                             target_type='server', idempotent=False):
+    """
+    Send an HTTP or HTTPS request to a WBEM server or WBEM listener and return
+    the response, using asyncio.
+
+    This is the asyncio counterpart of :func:`pywbem._cim_http.wbem_request`
+    and has the same parameters, return value and exceptions, except that
+    `conn` is an :class:`~pywbem.AsyncWBEMConnection` object, and that the
+    `idempotent` parameter indicates that the request may be sent again if
+    the connection broke down before a response was received.
+
+    Requests and responses are compressed as for
+    :func:`pywbem._cim_http.wbem_request`.
+    """
+
+    target, req_body, req_headers = build_request(
+        conn, req_data, cimxml_headers, target_type)
+    send_body = compress_request(conn, req_body, req_headers)
+    pool = conn._pool  # pylint: disable=protected-access
+    resp = await pool.request(
+        target, send_body, req_headers, idempotent=idempotent)
+    if send_body is not req_body and compression_rejected(resp):
+        # See wbem_request()
+        reject_request_compression(conn, req_body, req_headers)
+        resp = await pool.request(
+            target, req_body, req_headers, idempotent=idempotent)
+    svr_resp_time = check_response(conn, resp, req_body, target_type)
+    return resp.content, svr_resp_time
@@ -0,0 +1,807 @@
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this program; if not, write to the Free Software
+# Foundation, Inc., 675 Mass Ave, Cambridge, MA 02139, USA.
+#
+
+"""
+The :func:`~pywbem.tojson` and :func:`~pywbem.fromjson` functions convert
+:ref:`CIM objects` to and from a JSON representation, and the
+:class:`~pywbem.NDJSONWriter` and :class:`~pywbem.NDJSONReader` classes
+write and read sequences of CIM objects to and from a text file in the
+`NDJSON <https://github.com/ndjson/ndjson-spec>`_ format (one JSON object
+per line).
+
+*New in pywbem 1.10.*
+
+The JSON representation of a CIM object is a JSON object with a member for
+each public attribute of the CIM object, with the same name as the
+attribute. All members are always present, with a value of `null` for
+attributes that are `None`. The JSON objects of CIM instances, CIM instance
+paths, CIM classes, CIM class paths and CIM qualifier declarations, and the
+JSON objects that are passed to :func:`~pywbem.fromjson`, have an additional
+``"pywbem_object"`` member with the name of the pywbem class (e.g.
+``"CIMInstance"``), in order to identify the kind of CIM object.
+
+The attributes are represented as follows:
+
+* Dictionaries of properties, methods, parameters and qualifiers are
+  represented as JSON arrays of the JSON objects of the CIM elements, in the
+  order of the dictionary.
+* Keybindings are represented as a JSON array of JSON objects with members
+  ``"name"``, ``"type"`` and ``"value"``, where ``"type"`` is the CIM data
+  type name of the keybinding value (``"reference"`` for CIM instance
+  paths), or `null` for Python :class:`py:int` and :class:`py:float` values.
+* Scopes of qualifier declarations are represented as a JSON object with the
+  scope names as members.
+* Values are represented according to the CIM data type of the CIM element:
+  Values of CIM data type datetime are represented as JSON strings in the
+  CIM datetime format, values of CIM data type reference as the JSON object
+  of the :class:`~pywbem.CIMInstanceName` object, embedded objects as the
+  JSON object of the :class:`~pywbem.CIMInstance` or
+  :class:`~pywbem.CIMClass` object, and all other values as the
+  corresponding JSON numbers, strings and booleans. The special values NaN,
+  positive infinity and negative infinity of real values, which cannot be
+  represented as JSON numbers, are represented as the JSON strings
+  ``"NaN"``, ``"INF"`` and ``"-INF"``, as in CIM-XML. Array values are
+  represented as JSON arrays of these values.
+
+The JSON representation is stable; new members may be added in future
+versions of pywbem, but existing members will not be changed.
+
+The objects that are read are equal to the objects that were written, with
+the following exceptions: Array values that are
+:class:`~pywbem.CIMNumericArray` objects are read as lists, CIM instances
+that use a :class:`~pywbem.CIMInstanceLayout` are read as CIM instances that
+do not use a layout, and frozen CIM instance paths are read as CIM instance
+paths that are not frozen.
+
+Example::
+
+    with open('instances.ndjson', 'w', encoding='utf-8') as fp:
+        writer = pywbem.NDJSONWriter(fp)
+        writer.write_all(conn.IterEnumerateInstances('CIM_Foo'))
+
+    with open('instances.ndjson', encoding='utf-8') as fp:
+        for inst in pywbem.NDJSONReader(fp):
+            print(inst.path)
+"""
+
+import json
+import math
+
+from ._cim_obj import CIMInstanceName, CIMInstance, CIMClassName, CIMClass, \
+    CIMProperty, CIMMethod, CIMParameter, CIMQualifier, \
+    CIMQualifierDeclaration, cimvalue, _LayoutValues
+from ._cim_types import CIMType, CIMDateTime, CIMNumericArray
+from ._nocasedict import NocaseDict
+from ._utils import _format
+
+__all__ = ['tojson', 'tojsonstr', 'fromjson', 'fromjsonstr',
+           'NDJSONWriter', 'NDJSONReader']
+
+# Separators for compact JSON strings without whitespace
+_COMPACT_SEPARATORS = (',', ':')
+
+# CIM data types whose values are floating point numbers
+_REAL_TYPES = ('real32', 'real64')
+
+
+def _json_real(value):
+    """
+    Return the JSON representation of a floating point value.
+
+    The special values NaN, INF and -INF are not allowed in JSON, and are
+    represented as strings, as in CIM-XML.
+    """
+    if math.isfinite(value):
+        return value
+    if math.isnan(value):
+        return 'NaN'
+    return 'INF' if value > 0 else '-INF'
+
+
+def _real(json_value):
+    """
+    Return the floating point value from its JSON representation.
+    """
+    if isinstance(json_value, str):
+        return float(json_value)
+    return json_value
+
+
+def _json_scalar(value):
+    """
+    Return the JSON representation of a non-NULL scalar value of a CIM
+    element.
+    """
+    if isinstance(value, CIMDateTime):
+        return str(value)
+    if isinstance(value, CIMInstanceName):
+        return _json_instancename(value)
+    if isinstance(value, (CIMInstance, CIMClass)):
+        return tojson(value)
+    if isinstance(value, float):
+        return _json_real(value)
+    # The CIM data types for integers and strings are subclasses of the
+    # Python types and are serialized by the json module as such.
+    return value
+
+
+def _json_value(value):
+    """
+    Return the JSON representation of the value of a CIM element.
+    """
+    if value is None:
+        return None
+    if isinstance(value, CIMNumericArray):
+        if value.cimtype in _REAL_TYPES:
+            return [_json_real(v) for v in value.buffer]
+        return value.buffer.tolist()
+    if isinstance(value, list):
+        return [None if v is None else _json_scalar(v) for v in value]
+    return _json_scalar(value)
+
+
+def _json_qualifiers(qualifiers):
+    """
+    Return the JSON representation of the qualifiers of a CIM object.
+    """
+    return [_json_qualifier(q) for q in qualifiers.values()]
+
+
+def _json_qualifier(qualifier):
+    """
+    Return the JSON representation of a CIMQualifier object.
+    """
+    return {
+        'name': qualifier.name,
+        'type': qualifier.type,
+        'value': _json_value(qualifier.value),
+        'propagated': qualifier.propagated,
+        'overridable': qualifier.overridable,
+        'tosubclass': qualifier.tosubclass,
+        'toinstance': qualifier.toinstance,
+        'translatable': qualifier.translatable,
+    }
+
+
+def _json_property(prop, value):
+    """
+    Return the JSON representation of a CIMProperty object, with the
+    specified value.
+    """
+    return {
+        'name': prop.name,
+        'type': prop.type,
+        'value': _json_value(value),
+        'reference_class': prop.reference_class,
+        'embedded_object': prop.embedded_object,
+        'is_array': prop.is_array,
+        'array_size': prop.array_size,
+        'class_origin': prop.class_origin,
+        'propagated': prop.propagated,
+        'qualifiers': _json_qualifiers(prop.qualifiers),
+    }
+
+
+def _json_parameter(parm):
+    """
+    Return the JSON representation of a CIMParameter object.
+    """
+    return {
+        'name': parm.name,
+        'type': parm.type,
+        'value': _json_value(parm.value),
+        'reference_class': parm.reference_class,
+        'embedded_object': parm.embedded_object,
+        'is_array': parm.is_array,
+        'array_size': parm.array_size,
+        'qualifiers': _json_qualifiers(parm.qualifiers),
+    }
+
+
+def _json_method(method):
+    """
+    Return the JSON representation of a CIMMethod object.
+    """
+    return {
+        'name': method.name,
+        'return_type': method.return_type,
+        'class_origin': method.class_origin,
+        'propagated': method.propagated,
+        'parameters': [_json_parameter(p) for p in method.parameters.values()],
+        'qualifiers': _json_qualifiers(method.qualifiers),
+    }
+
+
+def _json_keybinding(name, value):
+    """
+    Return the JSON representation of a keybinding.
+    """
+    if isinstance(value, CIMInstanceName):
+        type_ = 'reference'
+        value = _json_instancename(value)
+    elif isinstance(value, bool):
+        type_ = 'boolean'
+    elif isinstance(value, CIMType):
+        type_ = value.cimtype
+        if isinstance(value, CIMDateTime):
+            value = str(value)
+        elif isinstance(value, float):
+            value = _json_real(value)
+    elif isinstance(value, str):
+        type_ = 'string'
+    else:
+        # Python int and float values, and None
+        type_ = None
+        if isinstance(value, float):
+            value = _json_real(value)
+    return {'name': name, 'type': type_, 'value': value}
+
+
+def _json_instancename(path):
+    """
+    Return the JSON representation of a CIMInstanceName object.
+    """
+    return {
+        'pywbem_object': 'CIMInstanceName',
+        'classname': path.classname,
+        'namespace': path.namespace,
+        'host': path.host,
+        'keybindings': [_json_keybinding(name, value)
+                        for name, value in path.keybindings.items()],
+    }
+
+
+def _json_instance(inst):
+    """
+    Return the JSON representation of a CIMInstance object.
+    """
+    # pylint: disable=protected-access
+    properties = inst._properties
+    if isinstance(properties, _LayoutValues):
+        # The properties are represented from the layout, without creating
+        # the CIMProperty objects of the instance.
+        json_props = [
+            _json_property(template, value) for template, value in
+            zip(properties.layout._properties, properties.values)]
+    else:
+        json_props = [_json_property(prop, prop.value)
+                      for prop in inst.properties.values()]
+    path = inst.path
+    return {
+        'pywbem_object': 'CIMInstance',
+        'classname': inst.classname,
+        'path': None if path is None else _json_instancename(path),
+        'properties': json_props,
+        'qualifiers': _json_qualifiers(inst.qualifiers),
+    }
+
+
+def _json_classname(path):
+    """
+    Return the JSON representation of a CIMClassName object.
+    """
+    return {
+        'pywbem_object': 'CIMClassName',
+        'classname': path.classname,
+        'namespace': path.namespace,
+        'host': path.host,
+    }
+
+
+def _json_class(cls):
+    """
+    Return the JSON representation of a CIMClass object.
+    """
+    path = cls.path
+    return {
+        'pywbem_object': 'CIMClass',
+        'classname': cls.classname,
+        'superclass': cls.superclass,
+        'path': None if path is None else _json_classname(path),
+        'properties': [_json_property(prop, prop.value)
+                       for prop in cls.properties.values()],
+        'methods': [_json_method(m) for m in cls.methods.values()],
+        'qualifiers': _json_qualifiers(cls.qualifiers),
+    }
+
+
+def _json_qualifierdeclaration(qualdecl):
+    """
+    Return the JSON representation of a CIMQualifierDeclaration object.
+    """
+    return {
+        'pywbem_object': 'CIMQualifierDeclaration',
+        'name': qualdecl.name,
+        'type': qualdecl.type,
+        'value': _json_value(qualdecl.value),
+        'is_array': qualdecl.is_array,
+        'array_size': qualdecl.array_size,
+        'scopes': dict(qualdecl.scopes.items()),
+        'overridable': qualdecl.overridable,
+        'tosubclass': qualdecl.tosubclass,
+        'toinstance': qualdecl.toinstance,
+        'translatable': qualdecl.translatable,
+    }
+
+
+def _with_kind(json_func, kind):
+    """
+    Return a function that returns the JSON representation of a CIM element
+    with a "pywbem_object" member.
+    """
+    def func(obj):
+        "JSON representation with a pywbem_object member"
+        json_obj = {'pywbem_object': kind}
+        json_obj.update(json_func(obj))
+        return json_obj
+    return func
+
+
+# Functions returning the JSON representation of the CIM object classes
+_TOJSON_FUNCS = {
+    CIMInstance: _json_instance,
+    CIMInstanceName: _json_instancename,
+    CIMClass: _json_class,
+    CIMClassName: _json_classname,
+    CIMQualifierDeclaration: _json_qualifierdeclaration,
+    CIMProperty: _with_kind(lambda p: _json_property(p, p.value),
+                            'CIMProperty'),
+    CIMMethod: _with_kind(_json_method, 'CIMMethod'),
+    CIMParameter: _with_kind(_json_parameter, 'CIMParameter'),
+    CIMQualifier: _with_kind(_json_qualifier, 'CIMQualifier'),
+}
+
+
+def tojson(obj):
+    """
+    Return the JSON representation of a CIM object, as a JSON-serializable
+    Python object.
+
+    *New in pywbem 1.10.*
+
+    For a description of the JSON representation, see
+    :ref:`JSON representation`. The returned object can be serialized with
+    :func:`py:json.dumps`, and can be converted back to the CIM object with
+    :func:`~pywbem.fromjson`.
+
+    Parameters:
+
+      obj (:ref:`CIM object <CIM objects>`): The CIM object, i.e. an object
+        of one of the classes :class:`~pywbem.CIMInstance`,
+        :class:`~pywbem.CIMInstanceName`, :class:`~pywbem.CIMClass`,
+        :class:`~pywbem.CIMClassName`, :class:`~pywbem.CIMProperty`,
+        :class:`~pywbem.CIMMethod`, :class:`~pywbem.CIMParameter`,
+        :class:`~pywbem.CIMQualifier` or
+        :class:`~pywbem.CIMQualifierDeclaration`.
+
+    Returns:
+
+      :class:`py:dict`: The JSON representation of the CIM object.
+
+    Raises:
+
+      TypeError: The object is not a CIM object.
+    """
+    func = _TOJSON_FUNCS.get(type(obj))
+    if func is None:
+        for cls, cls_func in _TOJSON_FUNCS.items():
+            if isinstance(obj, cls):
+                func = cls_func
+                break
+        else:
+            raise TypeError(
+                _format("Object for JSON representation must be a CIM "
+                        "object, but is: {0}", type(obj)))
+    return func(obj)
+
+
+def tojsonstr(obj, indent=None):
+    """
+    Return the JSON representation of a CIM object, as a JSON string.
+
+    *New in pywbem 1.10.*
+
+    For a description of the JSON representation, see
+    :ref:`JSON representation`. The returned string can be converted back to
+    the CIM object with :func:`~pywbem.fromjsonstr`.
+
+    Parameters:
+
+      obj (:ref:`CIM object <CIM objects>`): The CIM object. For the
+        supported objects, see :func:`~pywbem.tojson`.
+
+      indent (:term:`string` or :term:`integer`):
+        `None` indicates that a single-line version of the JSON string should
+        be returned, without any whitespace between the JSON elements.
+
+        Other values are passed on to :func:`py:json.dumps` as its `indent`
+        parameter.
+
+    Returns:
+
+      :term:`unicode string`: The JSON representation of the CIM object.
+
+    Raises:
+
+      TypeError: The object is not a CIM object.
+    """
+    if indent is None:
+        return json.dumps(tojson(obj), ensure_ascii=False, allow_nan=False,
+                          separators=_COMPACT_SEPARATORS)
+    return json.dumps(tojson(obj), ensure_ascii=False, allow_nan=False,
+                      indent=indent)
+
+
+def _element_value(json_value, type_, embedded_object):
+    """
+    Return the value of a CIM element from its JSON representation.
+
+    Values of CIM data type reference and embedded objects are converted to
+    the CIM objects. Other values are returned unchanged, for being converted
+    to the CIM data type by the CIM element.
+    """
+    if json_value is None:
+        return None
+    if type_ == 'reference':
+        func = _instancename
+    elif embedded_object:
+        func = fromjson
+    elif type_ in _REAL_TYPES:
+        func = _real
+    else:
+        return json_value
+    if isinstance(json_value, list):
+        return [None if v is None else func(v) for v in json_value]
+    return func(json_value)
+
+
+def _qualifiers(json_qualifiers):
+    """
+    Return the qualifiers of a CIM object from their JSON representation, as
+    a list.
+    """
+    return [_qualifier(jq) for jq in json_qualifiers]
+
+
+def _qualifier(jq):
+    """
+    Return a CIMQualifier object from its JSON representation.
+    """
+    type_ = jq['type']
+    return CIMQualifier(
+        jq['name'], _element_value(jq['value'], type_, None), type=type_,
+        propagated=jq['propagated'], overridable=jq['overridable'],
+        tosubclass=jq['tosubclass'], toinstance=jq['toinstance'],
+        translatable=jq['translatable'])
+
+
+def _property(jp):
+    """
+    Return a CIMProperty object from its JSON representation.
+    """
+    type_ = jp['type']
+    embedded_object = jp['embedded_object']
+    return CIMProperty(
+        jp['name'], _element_value(jp['value'], type_, embedded_object),
+        type=type_, class_origin=jp['class_origin'],
+        array_size=jp['array_size'], propagated=jp['propagated'],
+        is_array=jp['is_array'], reference_class=jp['reference_class'],
+        qualifiers=_qualifiers(jp['qualifiers']),
+        embedded_object=embedded_object)
+
+
+def _parameter(jp):
+    """
+    Return a CIMParameter object from its JSON representation.
+    """
+    type_ = jp['type']
+    embedded_object = jp['embedded_object']
+    return CIMParameter(
+        jp['name'], type_, reference_class=jp['reference_class'],
+        is_array=jp['is_array'], array_size=jp['array_size'],
+        qualifiers=_qualifiers(jp['qualifiers']),
+        value=_element_value(jp['value'], type_, embedded_object),
+        embedded_object=embedded_object)
+
+
+def _method(jm):
+    """
+    Return a CIMMethod object from its JSON representation.
+    """
+    return CIMMethod(
+        jm['name'], return_type=jm['return_type'],
+        parameters=[_parameter(jp) for jp in jm['parameters']],
+        class_origin=jm['class_origin'], propagated=jm['propagated'],
+        qualifiers=_qualifiers(jm['qualifiers']))
+
+
+def _keybinding_value(jk):
+    """
+    Return the value of a keybinding from its JSON representation.
+    """
+    type_ = jk['type']
+    value = jk['value']
+    if type_ is None:
+        # Python int and float values, where strings are special float values
+        return _real(value)
+    if type_ == 'reference':
+        return _instancename(value)
+    return cimvalue(value, type_)
+
+
+def _instancename(jn):
+    """
+    Return a CIMInstanceName object from its JSON representation.
+    """
+    return CIMInstanceName(
+        jn['classname'],
+        keybindings=[(jk['name'], _keybinding_value(jk))
+                     for jk in jn['keybindings']],
+        host=jn['host'], namespace=jn['namespace'])
+
+
+def _instance(ji):
+    """
+    Return a CIMInstance object from its JSON representation.
+    """
+    jn = ji['path']
+    inst = CIMInstance(ji['classname'],
+                       qualifiers=_qualifiers(ji['qualifiers']))
+    props = [_property(jp) for jp in ji['properties']]
+    # The path has just been created, so it is not copied like in
+    # CIMInstance(), and the property names of the CIMProperty objects are
+    # the dictionary keys, so the checks of CIMInstance.__setitem__() are not
+    # needed.
+    # pylint: disable=protected-access
+    inst._path = None if jn is None else _instancename(jn)
+    inst._properties = NocaseDict.from_items(
+        (prop.name, prop) for prop in props)
+    return inst
+
+
+def _classname(jn):
+    """
+    Return a CIMClassName object from its JSON representation.
+    """
+    return CIMClassName(jn['classname'], host=jn['host'],
+                        namespace=jn['namespace'])
+
+
+def _class(jc):
+    """
+    Return a CIMClass object from its JSON representation.
+    """
+    jn = jc['path']
+    return CIMClass(
+        jc['classname'],
+        properties=[_property(jp) for jp in jc['properties']],
+        methods=[_method(jm) for jm in jc['methods']],
+        superclass=jc['superclass'],
+        qualifiers=_qualifiers(jc['qualifiers']),
+        path=None if jn is None else _classname(jn))
+
+
+def _qualifierdeclaration(jq):
+    """
+    Return a CIMQualifierDeclaration object from its JSON representation.
+    """
+    type_ = jq['type']
+    return CIMQualifierDeclaration(
+        jq['name'], type_, _element_value(jq['value'], type_, None),
+        is_array=jq['is_array'], array_size=jq['array_size'],
+        scopes=jq['scopes'], overridable=jq['overridable'],
+        tosubclass=jq['tosubclass'], toinstance=jq['toinstance'],
+        translatable=jq['translatable'])
+
+
+# Functions returning the CIM objects from their JSON representation, by
+# the value of the pywbem_object member
+_FROMJSON_FUNCS = {
+    'CIMInstance': _instance,
+    'CIMInstanceName': _instancename,
+    'CIMClass': _class,
+    'CIMClassName': _classname,
+    'CIMQualifierDeclaration': _qualifierdeclaration,
+    'CIMProperty': _property,
+    'CIMMethod': _method,
+    'CIMParameter': _parameter,
+    'CIMQualifier': _qualifier,
+}
+
+
+def fromjson(json_obj):
+    """
+    Return a CIM object from its JSON representation, as returned by
+    :func:`~pywbem.tojson`.
+
+    *New in pywbem 1.10.*
+
+    Parameters:
+
+      json_obj (:class:`py:dict`): The JSON representation of the CIM
+        object, e.g. as returned by :func:`py:json.loads`. It must have a
+        ``"pywbem_object"`` member.
+
+    Returns:
+
+      :ref:`CIM object <CIM objects>`: The CIM object.
+
+    Raises:
+
+      ValueError: Invalid JSON representation of a CIM object.
+      TypeError: Invalid type of a value in the JSON representation.
+    """
+    try:
+        kind = json_obj['pywbem_object']
+    except (KeyError, TypeError):
+        raise ValueError(  # pylint: disable=raise-missing-from
+            _format("JSON representation of a CIM object must be a JSON "
+                    "object with a 'pywbem_object' member, but is: {0!A}",
+                    json_obj))
+    try:
+        func = _FROMJSON_FUNCS[kind]
+    except (KeyError, TypeError):
+        raise ValueError(  # pylint: disable=raise-missing-from
+            _format("Invalid 'pywbem_object' member in JSON representation "
+                    "of a CIM object: {0!A}", kind))
+    try:
+        return func(json_obj)
+    except KeyError as exc:
+        raise ValueError(  # pylint: disable=raise-missing-from
+            _format("Missing member {0} in JSON representation of a {1} "
+                    "object", exc, kind))
+
+
+def fromjsonstr(json_str):
+    """
+    Return a CIM object from its JSON representation as a JSON string, as
+    returned by :func:`~pywbem.tojsonstr`.
+
+    *New in pywbem 1.10.*
+
+    Parameters:
+
+      json_str (:term:`string`): The JSON string.
+
+    Returns:
+
+      :ref:`CIM object <CIM objects>`: The CIM object.
+
+    Raises:
+
+      ValueError: Invalid JSON string or invalid JSON representation of a
+        CIM object.
+      TypeError: Invalid type of a value in the JSON representation.
+    """
+    return fromjson(json.loads(json_str))
+
+
+class NDJSONWriter:
+    """
+    A writer of a sequence of CIM objects to a text file in the NDJSON
+    format, with the JSON representation of each CIM object on a separate
+    line.
+
+    *New in pywbem 1.10.*
+
+    Each object is written to the file when it is passed to :meth:`write`, so
+    that the objects can be written while they are being retrieved (e.g. from
+    :meth:`~pywbem.WBEMConnection.IterEnumerateInstances`), without having
+    all of them in memory. The objects can be read with
+    :class:`~pywbem.NDJSONReader`.
+
+    For a description of the JSON representation, see
+    :ref:`JSON representation`.
+    """
+
+    def __init__(self, fp):
+        """
+        Parameters:
+
+          fp (:term:`py:file object`): The text file the objects are written
+            to. Must have a ``write()`` method that accepts strings.
+        """
+        self._fp = fp
+        self._encoder = json.JSONEncoder(
+            ensure_ascii=False, allow_nan=False,
+            separators=_COMPACT_SEPARATORS)
+
+    def write(self, obj):
+        """
+        Write a CIM object to the file, as a line.
+
+        Parameters:
+
+          obj (:ref:`CIM object <CIM objects>`): The CIM object. For the
+            supported objects, see :func:`~pywbem.tojson`.
+
+        Raises:
+
+          TypeError: The object is not a CIM object.
+        """
+        self._fp.write(self._encoder.encode(tojson(obj)) + '\n')
+
+    def write_all(self, objs):
+        """
+        Write CIM objects to the file, as one line each.
+
+        Parameters:
+
+          objs (:term:`py:iterable` of :ref:`CIM object <CIM objects>`): The
+            CIM objects. This may be a generator, in which case only one
+            object exists at a time.
+
+        Raises:
+
+          TypeError: An object is not a CIM object.
+        """
+        for obj in objs:
+            self.write(obj)
+
+
+class NDJSONReader:
+    """
+    A reader of a sequence of CIM objects from a text file in the NDJSON
+    format, as written by :class:`~pywbem.NDJSONWriter`.
+
+    *New in pywbem 1.10.*
+
+    Objects of this class are iterators that return the CIM objects in the
+    order of the lines. Each object is read from the file when it is
+    returned, so that the objects can be processed without having all of them
+    in memory. Empty lines are ignored.
+    """
+
+    def __init__(self, fp):
+        """
+        Parameters:
+
+          fp (:term:`py:file object`): The text file the objects are read
+            from. Must have a ``readline()`` method that returns strings.
+        """
+        self._fp = fp
+        self._decoder = json.JSONDecoder()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            return self.read()
+        except EOFError:
+            raise StopIteration  # pylint: disable=raise-missing-from
+
+    def read(self):
+        """
+        Read the next CIM object from the file.
+
+        Returns:
+
+          :ref:`CIM object <CIM objects>`: The CIM object.
+
+        Raises:
+
+          EOFError: The end of the file has been reached.
+          ValueError: Invalid JSON string or invalid JSON representation of a
+            CIM object.
+          TypeError: Invalid type of a value in the JSON representation.
+        """
+        while True:
+            line = self._fp.readline()
+            if not line:
+                raise EOFError("No more objects in the NDJSON file")
+            if line.strip():
+                return fromjson(self._decoder.decode(line))
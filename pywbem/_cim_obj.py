@@ -33,6 +33,7 @@ CIM object                                  Purpose
 ==========================================  ==========================================================================
 :class:`~pywbem.CIMInstanceName`            Instance path of a CIM instance
 :class:`~pywbem.CIMInstance`                CIM instance
+:class:`~pywbem.CIMInstanceLayout`          Property layout shared by CIM instances of a class
 :class:`~pywbem.CIMClassName`               Name of a CIM class, optionally with class path
 :class:`~pywbem.CIMClass`                   CIM class
 :class:`~pywbem.CIMProperty`                CIM property, both as property value in a CIM instance and as property
@@ -41,6 +42,7 @@ CIM object                                  Purpose
 :class:`~pywbem.CIMParameter`               CIM parameter, both as a parameter value in a method invocation and as a
                                             parameter declaration in a CIM method declaration in a CIM class
 :class:`~pywbem.CIMQualifier`               CIM qualifier value
+:class:`~pywbem.CIMQualifierCache`          Cache of CIM qualifier values shared by CIM objects
 :class:`~pywbem.CIMQualifierDeclaration`    CIM qualifier type/declaration
 ==========================================  ==========================================================================
 
@@ -204,6 +206,7 @@ the class created at the end:
 
 # This module is meant to be safe for 'import *'.
 
+import sys
 import warnings
 import copy as copy_
 import re
@@ -217,8 +220,8 @@ from .config import SEND_VALUE_NULL
 from . import config
 from ._cim_types import _CIMComparisonMixin, type_from_name, cimtype, \
     atomic_to_cim_xml, CIMType, CIMDateTime, number_types, CIMInt, \
-    CIMFloat, Char16, SlottedPickleMixin
-from ._nocasedict import NocaseDict
+    CIMFloat, Char16, CIMNumericArray, SlottedPickleMixin
+from ._nocasedict import NocaseDict, _OMITTED
 from ._utils import _ensure_unicode, _ensure_bool, \
     _hash_name, _hash_item, _hash_dict, _format, _integerValue_to_int, \
     _realValue_to_float, _to_unicode, _eq_name, _eq_item, _eq_dict, \
@@ -227,8 +230,9 @@ from ._warnings import MissingKeybindingsWarning
 
 
 __all__ = ['CIMClassName', 'CIMProperty', 'CIMInstanceName', 'CIMInstance',
-           'CIMClass', 'CIMMethod', 'CIMParameter', 'CIMQualifier',
-           'CIMQualifierDeclaration', 'tocimxml', 'tocimxmlstr', 'cimvalue']
+           'CIMInstanceLayout', 'CIMClass', 'CIMMethod', 'CIMParameter',
+           'CIMQualifier', 'CIMQualifierCache', 'CIMQualifierDeclaration',
+           'tocimxml', 'tocimxmlstr', 'cimvalue']
 
 # Constants for MOF formatting output
 MOF_INDENT = 3
@@ -838,7 +842,7 @@ def _value_tomof(
         * new line_pos
     """
 
-    if isinstance(value, list):
+    if isinstance(value, (list, CIMNumericArray)):
 
         mof = []
 
@@ -1070,6 +1074,144 @@ def _cim_qualifier(key, value):
     return qual
 
 
+def _keyvalue_cimxml(key, value):
+    """
+    Return the CIM-XML representation of a non-reference keybinding value,
+    as a tuple (value, value_type, cim_type) with the text, the VALUETYPE
+    attribute and the TYPE attribute (may be `None`) of the KEYVALUE element.
+    """
+    if isinstance(value, Char16):
+        value_type = 'string'
+        cim_type = 'char16'
+    elif isinstance(value, str):
+        value_type = 'string'
+        cim_type = 'string'
+    elif isinstance(value, bytes):
+        value_type = 'string'
+        cim_type = 'string'
+        value = _to_unicode(value)
+    elif isinstance(value, bool):
+        # Note: Bool is a subtype of int, therefore bool is tested
+        # before int.
+        value_type = 'boolean'
+        cim_type = 'boolean'
+        if value:
+            value = 'TRUE'
+        else:
+            value = 'FALSE'
+    elif isinstance(value, CIMDateTime):
+        value_type = 'string'
+        cim_type = value.cimtype
+        value = str(value)
+    elif isinstance(value, (CIMInt, CIMFloat)):
+        # Numeric CIM data types derive from Python number types.
+        value_type = 'numeric'
+        cim_type = value.cimtype
+        value = str(value)
+    elif isinstance(value, number_types):
+        value_type = 'numeric'
+
+        # Without CIM type information in the keybindings, pywbem cannot
+        # determine the CIM type from the value alone. This will cause
+        # the TYPE attribute not to be set, violating the requirement
+        # to set the TYPE attribute that was introduced in DTD 2.4.
+        cim_type = None
+
+        value = str(value)
+    else:
+        # Double check the type of the keybindings, because they can be
+        # set individually.
+        raise TypeError(
+            _format("Keybinding {0!A} has invalid type: {1}",
+                    key, builtin_type(value)))
+
+    return value, value_type, cim_type
+
+
+def _lower(name):
+    """
+    Return a CIM name in lower case, or `None` if it is `None`.
+    """
+    return None if name is None else name.lower()
+
+
+def _frozen_copy(value):
+    """
+    Return a frozen copy of a keybinding value that is a non-frozen
+    CIMInstanceName object, and the value itself otherwise.
+    """
+    if isinstance(value, CIMInstanceName) and not value.frozen:
+        return value.copy().freeze()
+    return value
+
+
+class _FrozenKeybindings(NocaseDict):
+    """
+    NocaseDict with the keybindings of a frozen CIMInstanceName, that cannot
+    be modified.
+
+    It also holds the normalized key of the CIMInstanceName (a tuple of its
+    lower-cased host, namespace and class name and a frozenset of its
+    casefolded keybinding names and values) and its cached hash value.
+    """
+
+    def __init__(self, path, keybindings):
+        super().__init__()
+        self.allow_unnamed_keys = True
+        # pylint: disable=protected-access
+        self._data = keybindings._data.copy()
+        self.path_key = (
+            _lower(path.host),
+            _lower(path.namespace),
+            path.classname.lower(),
+            frozenset((k, v) for k, (_, v) in self._data.items()))
+        self.path_hash = None  # Calculated on first use
+
+    def __getstate__(self):
+        # String hash values differ between Python processes, so the hash
+        # value is calculated again after unpickling.
+        state = self.__dict__.copy()
+        state['path_hash'] = None
+        return state
+
+    @staticmethod
+    def _raise_frozen():
+        """
+        Raise TypeError for modifying the keybindings.
+        """
+        raise TypeError("The keybindings of a frozen CIMInstanceName object "
+                        "cannot be modified")
+
+    def __setitem__(self, key, value):
+        self._raise_frozen()
+
+    def __delitem__(self, key):
+        self._raise_frozen()
+
+    def pop(self, key, default=_OMITTED):
+        self._raise_frozen()
+
+    def popitem(self):
+        self._raise_frozen()
+
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self[key]
+        return self._raise_frozen()
+
+    def update(self, *args, **kwargs):
+        # Also called without arguments by the init method
+        if args or kwargs:
+            self._raise_frozen()
+
+    def clear(self):
+        self._raise_frozen()
+
+    def copy(self):
+        # The copy of the keybindings is not frozen
+        return NocaseDict.from_items(self.items(), allow_unnamed_keys=True)
+
+
 class CIMInstanceName(_CIMComparisonMixin, SlottedPickleMixin):
     """
     A CIM instance path (aka *CIM instance name*).
@@ -1082,6 +1224,10 @@ class CIMInstanceName(_CIMComparisonMixin, SlottedPickleMixin):
     value being based on its public attributes. Therefore, objects of this
     class can be used as members in a set (or as dictionary keys) only during
     periods in which their public attributes remain unchanged.
+
+    Objects of this class can be made immutable using
+    :meth:`~pywbem.CIMInstanceName.freeze`, which also speeds up their use as
+    members in a set or as dictionary keys.
     """
 
     __slots__ = ['_classname', '_keybindings', '_host', '_namespace']
@@ -1146,6 +1292,8 @@ class CIMInstanceName(_CIMComparisonMixin, SlottedPickleMixin):
           TypeError: An error in the provided argument types.
         """  # noqa: E501
 
+        self._keybindings = None
+
         # We use the respective setter methods:
         self.classname = classname
         self.keybindings = keybindings
@@ -1169,6 +1317,7 @@ class CIMInstanceName(_CIMComparisonMixin, SlottedPickleMixin):
     @classname.setter
     def classname(self, classname):
         """Setter method; for a description see the getter method."""
+        self._check_not_frozen()
 
         # pylint: disable=attribute-defined-outside-init
         self._classname = _ensure_unicode(classname)
@@ -1212,6 +1361,10 @@ class CIMInstanceName(_CIMComparisonMixin, SlottedPickleMixin):
         the description of the same-named init parameter of
         :class:`this class <pywbem.CIMInstanceName>`.
 
+        If this CIM instance path is frozen (see
+        :meth:`~pywbem.CIMInstanceName.freeze`), the dictionary cannot be
+        modified.
+
         When setting a keybinding value, it will be preserved whether the
         input value was a :term:`CIM data type`, :class:`py:int`,
         :class:`py:float` or `None`.
@@ -1251,6 +1404,7 @@ class CIMInstanceName(_CIMComparisonMixin, SlottedPickleMixin):
     @keybindings.setter
     def keybindings(self, keybindings):
         """Setter method; for a description see the getter method."""
+        self._check_not_frozen()
         # pylint: disable=attribute-defined-outside-init
         self._keybindings = None  # Lazy initialization
         if keybindings:
@@ -1298,6 +1452,7 @@ class CIMInstanceName(_CIMComparisonMixin, SlottedPickleMixin):
     @namespace.setter
     def namespace(self, namespace):
         """Setter method; for a description see the getter method."""
+        self._check_not_frozen()
         # pylint: disable=attribute-defined-outside-init
         self._namespace = _ensure_unicode(namespace)
         if self._namespace is not None:
@@ -1325,9 +1480,74 @@ class CIMInstanceName(_CIMComparisonMixin, SlottedPickleMixin):
     @host.setter
     def host(self, host):
         """Setter method; for a description see the getter method."""
+        self._check_not_frozen()
         # pylint: disable=attribute-defined-outside-init
         self._host = _ensure_unicode(host)
 
+    @property
+    def frozen(self):
+        """
+        bool: Boolean indicating that this CIM instance path is frozen, i.e.
+        immutable.
+
+        *New in pywbem 1.10.*
+
+        See :meth:`~pywbem.CIMInstanceName.freeze` for details.
+        """
+        return self._keybindings.__class__ is _FrozenKeybindings
+
+    def _check_not_frozen(self):
+        """
+        Raise TypeError if this CIM instance path is frozen.
+        """
+        if self._keybindings.__class__ is _FrozenKeybindings:
+            raise TypeError("A frozen CIMInstanceName object cannot be "
+                            "modified")
+
+    def freeze(self):
+        """
+        Make this CIM instance path immutable, and return it.
+
+        *New in pywbem 1.10.*
+
+        The attributes of a frozen CIM instance path cannot be set, and its
+        keybindings cannot be added, changed or deleted; attempts to do so
+        raise :exc:`py:TypeError`. Keybinding values that are
+        :class:`~pywbem.CIMInstanceName` objects (i.e. references) are
+        replaced with frozen copies of them, so that the referenced objects
+        themselves remain unchanged.
+
+        A frozen CIM instance path has a precomputed case-insensitive key and
+        caches its hash value, so that calculating its hash value and testing
+        it for equality with another frozen CIM instance path no longer
+        processes its attributes and keybindings each time. This speeds up the
+        use of CIM instance paths as members in a set or as dictionary keys.
+        Frozen and non-frozen CIM instance paths with equal attributes
+        compare equal and have the same hash value.
+
+        Freezing a CIM instance path that is already frozen has no effect.
+        :meth:`~pywbem.CIMInstanceName.copy` returns a copy that is not
+        frozen, including its references in keybinding values.
+
+        Returns:
+
+          :class:`~pywbem.CIMInstanceName`: This CIM instance path.
+
+        Example::
+
+            paths = {p.freeze() for p in conn.EnumerateInstanceNames('CIM_Foo')}
+        """
+        if self._keybindings.__class__ is not _FrozenKeybindings:
+            keybindings = self.keybindings
+            if any(isinstance(value, CIMInstanceName)
+                   for value in keybindings.values()):
+                keybindings = NocaseDict.from_items(
+                    ((key, _frozen_copy(value))
+                     for key, value in keybindings.items()),
+                    allow_unnamed_keys=True)
+            self._keybindings = _FrozenKeybindings(self, keybindings)
+        return self
+
     def __eq__(self, other):
         """
         Equality test function for two :class:`~pywbem.CIMInstanceName` objects.
@@ -1351,6 +1571,20 @@ class CIMInstanceName(_CIMComparisonMixin, SlottedPickleMixin):
             raise TypeError(
                 _format("other must be CIMInstanceName, but is: {0}",
                         type(other)))
+        kbs = self._keybindings
+        other_kbs = other._keybindings
+        if kbs.__class__ is _FrozenKeybindings and \
+                other_kbs.__class__ is _FrozenKeybindings:
+            if kbs.path_hash is not None and \
+                    other_kbs.path_hash is not None and \
+                    kbs.path_hash != other_kbs.path_hash:
+                return False
+            try:
+                return kbs.path_key == other_kbs.path_key
+            except TypeError:
+                # Keybinding values of types that cannot be compared, with
+                # equal hash values
+                pass
         return (_eq_name(self.host, other.host) and
                 _eq_name(self.namespace, other.namespace) and
                 _eq_name(self.classname, other.classname) and
@@ -1362,6 +1596,13 @@ class CIMInstanceName(_CIMComparisonMixin, SlottedPickleMixin):
         into account any case insensitivities described for these attributes.
         This approach causes this class to be :term:`unchanged-hashable`.
         """
+        kbs = self._keybindings
+        if kbs.__class__ is _FrozenKeybindings:
+            if kbs.path_hash is None:
+                # Same hash value as for the non-frozen object
+                kbs.path_hash = hash(tuple(hash(item)
+                                           for item in kbs.path_key))
+            return kbs.path_hash
         hashes = (
             _hash_name(self.host),
             _hash_name(self.namespace),
@@ -1404,14 +1645,19 @@ class CIMInstanceName(_CIMComparisonMixin, SlottedPickleMixin):
 
         The key bindings will be ordered by their names in the result.
         """
+        keybindings = self.keybindings
+        if keybindings.__class__ is _FrozenKeybindings:
+            # Represent the keybindings the same as for a non-frozen object
+            keybindings = NocaseDict.from_items(
+                keybindings.items(), allow_unnamed_keys=True)
 
         return _format(
             "CIMInstanceName("
             "classname={s.classname!A}, "
-            "keybindings={s.keybindings!A}, "
+            "keybindings={kbs!A}, "
             "namespace={s.namespace!A}, "
             "host={s.host!A})",
-            s=self)
+            s=self, kbs=keybindings)
 
     def __contains__(self, key):
         ""  # Avoids docstring to be inherited
@@ -1452,15 +1698,32 @@ class CIMInstanceName(_CIMComparisonMixin, SlottedPickleMixin):
           :attr:`~pywbem.CIMInstanceName.keybindings` dictionary (but not the
           dictionary object itself)
 
+        The copy of a frozen CIM instance path is not frozen. Its keybinding
+        values that are :class:`~pywbem.CIMInstanceName` objects (i.e.
+        references) are copied as well, so that they are not frozen either.
+
         Note that the Python functions :func:`py:copy.copy` and
         :func:`py:copy.deepcopy` can be used to create completely shallow or
         completely deep copies of objects of this class.
         """
-        return CIMInstanceName(
+        result = CIMInstanceName(
             self.classname,
-            keybindings=self.keybindings,  # setter copies
             host=self.host,
             namespace=self.namespace)
+        # The keybindings have already been checked and converted by the
+        # setter, so the dictionary is copied directly.
+        keybindings = self.keybindings
+        if keybindings.__class__ is _FrozenKeybindings:
+            keybindings = NocaseDict.from_items(
+                ((key, value.copy()
+                  if isinstance(value, CIMInstanceName) else value)
+                 for key, value in keybindings.items()),
+                allow_unnamed_keys=True)
+        else:
+            keybindings = keybindings.copy()
+            keybindings.allow_unnamed_keys = True
+        result._keybindings = keybindings  # pylint: disable=protected-access
+        return result
 
     def update(self, *args, **kwargs):
         """
@@ -1676,51 +1939,7 @@ class CIMInstanceName(_CIMComparisonMixin, SlottedPickleMixin):
                     key, _cim_xml.VALUE_REFERENCE(value.tocimxml())))
                 continue
 
-            if isinstance(value, Char16):
-                value_type = 'string'
-                cim_type = 'char16'
-            elif isinstance(value, str):
-                value_type = 'string'
-                cim_type = 'string'
-            elif isinstance(value, bytes):
-                value_type = 'string'
-                cim_type = 'string'
-                value = _to_unicode(value)
-            elif isinstance(value, bool):
-                # Note: Bool is a subtype of int, therefore bool is tested
-                # before int.
-                value_type = 'boolean'
-                cim_type = 'boolean'
-                if value:
-                    value = 'TRUE'
-                else:
-                    value = 'FALSE'
-            elif isinstance(value, CIMDateTime):
-                value_type = 'string'
-                cim_type = value.cimtype
-                value = str(value)
-            elif isinstance(value, (CIMInt, CIMFloat)):
-                # Numeric CIM data types derive from Python number types.
-                value_type = 'numeric'
-                cim_type = value.cimtype
-                value = str(value)
-            elif isinstance(value, number_types):
-                value_type = 'numeric'
-
-                # Without CIM type information in the keybindings, pywbem cannot
-                # determine the CIM type from the value alone. This will cause
-                # the TYPE attribute not to be set, violating the requirement
-                # to set the TYPE attribute that was introduced in DTD 2.4.
-                cim_type = None
-
-                value = str(value)
-            else:
-                # Double check the type of the keybindings, because they can be
-                # set individually.
-                raise TypeError(
-                    _format("Keybinding {0!A} has invalid type: {1}",
-                            key, builtin_type(value)))
-
+            value, value_type, cim_type = _keyvalue_cimxml(key, value)
             kbs.append(_cim_xml.KEYBINDING(
                 key, _cim_xml.KEYVALUE(value, value_type, cim_type)))
 
@@ -1748,6 +1967,58 @@ class CIMInstanceName(_CIMComparisonMixin, SlottedPickleMixin):
             _cim_xml.NAMESPACEPATH(_cim_xml.HOST(self.host), localnsp_xml),
             instancename_xml)
 
+    def _write_cimxml(self, out, ignore_host=False, ignore_namespace=False):
+        """
+        Append the CIM-XML representation of this CIM instance path to the
+        list of strings `out`.
+
+        This produces the same XML string as `tocimxml().toxml()` with the
+        same parameters, without creating the :term:`Element` objects.
+        """
+        # pylint: disable=protected-access
+
+        if self.namespace is None or ignore_namespace:
+            path_elem = None
+        elif self.host is None or ignore_host:
+            path_elem = 'LOCALINSTANCEPATH'
+            out.append('<LOCALINSTANCEPATH>')
+            _cim_xml.write_localnamespacepath(out, self.namespace)
+        else:
+            path_elem = 'INSTANCEPATH'
+            out.append('<INSTANCEPATH>')
+            _cim_xml.write_namespacepath(out, self.host, self.namespace)
+
+        escape_attr = _cim_xml.escape_attr
+        out.append(f'<INSTANCENAME CLASSNAME="{escape_attr(self.classname)}"')
+
+        if self.keybindings:
+            out.append('>')
+            for key, value in self.keybindings.items():
+                out.append(f'<KEYBINDING NAME="{escape_attr(key)}">')
+                if isinstance(value, CIMInstanceName):
+                    out.append('<VALUE.REFERENCE>')
+                    value._write_cimxml(out)
+                    out.append('</VALUE.REFERENCE></KEYBINDING>')
+                    continue
+                value, value_type, cim_type = _keyvalue_cimxml(key, value)
+                out.append(f'<KEYVALUE VALUETYPE="{value_type}"')
+                if cim_type is not None:
+                    out.append(f' TYPE="{cim_type}"')
+                out.append(f'>{_cim_xml.escape_text(value)}'
+                           '</KEYVALUE></KEYBINDING>')
+            out.append('</INSTANCENAME>')
+        else:
+            warnings.warn(
+                _format(
+                    "Instance path without keybindings encountered for "
+                    "classname {0!A} when converting to CIM-XML - this not "
+                    "permitted according to DSP0004", self.classname),
+                MissingKeybindingsWarning, _stacklevel_above_module('pywbem'))
+            out.append('/>')
+
+        if path_elem is not None:
+            out.append(f'</{path_elem}>')
+
     def tocimxmlstr(self, indent=None, ignore_host=False,
                     ignore_namespace=False):
         """
@@ -1780,6 +2051,10 @@ class CIMInstanceName(_CIMComparisonMixin, SlottedPickleMixin):
 
             str: The CIM-XML representation of the object.
         """
+        if indent is None:
+            out = []
+            self._write_cimxml(out, ignore_host, ignore_namespace)
+            return ''.join(out)
         xml_elem = self.tocimxml(ignore_host, ignore_namespace)
         return tocimxmlstr(xml_elem, indent)
 
@@ -2462,10 +2737,18 @@ class CIMInstance(_CIMComparisonMixin, SlottedPickleMixin):
             inst['p2'] = p2  # Set "p2" to p2 (add if needed)
             p2 = inst['p2']  # Access "p2"
             del inst['p2']  # Delete "p2" from the instance
+
+        For instances that use a shared :class:`~pywbem.CIMInstanceLayout`,
+        accessing this attribute creates the :class:`~pywbem.CIMProperty`
+        objects of the instance, after which the instance no longer uses the
+        layout.
         """
-        if self._properties is None:  # Lazy initialization
-            self._properties = NocaseDict()
-        return self._properties
+        props = self._properties
+        if props is None:  # Lazy initialization
+            props = self._properties = NocaseDict()
+        elif props.__class__ is _LayoutValues:
+            props = self._properties = props.properties()
+        return props
 
     @properties.setter
     def properties(self, properties):
@@ -2602,9 +2885,20 @@ class CIMInstance(_CIMComparisonMixin, SlottedPickleMixin):
             raise TypeError(
                 _format("other must be CIMInstance, but is: {0}",
                         type(other)))
+        props = self._properties
+        other_props = other._properties
+        if props.__class__ is _LayoutValues and \
+                other_props.__class__ is _LayoutValues and \
+                props.layout is other_props.layout:
+            # The property metadata is the same, so only the values need to
+            # be compared.
+            eq_props = props.values == other_props.values
+        else:
+            eq_props = _eq_dict(self._property_dict(),
+                                other._property_dict())
         return (_eq_name(self.classname, other.classname) and
                 _eq_item(self.path, other.path) and
-                _eq_dict(self.properties, other.properties) and
+                eq_props and
                 _eq_dict(self.qualifiers, other.qualifiers))
 
     def __hash__(self):
@@ -2617,7 +2911,7 @@ class CIMInstance(_CIMComparisonMixin, SlottedPickleMixin):
         hashes = (
             _hash_name(self.classname),
             _hash_item(self.path),
-            _hash_dict(self.properties),
+            _hash_dict(self._property_dict()),
             _hash_dict(self.qualifiers),
         )
         return hash(hashes)
@@ -2645,14 +2939,34 @@ class CIMInstance(_CIMComparisonMixin, SlottedPickleMixin):
             "CIMInstance("
             "classname={s.classname!A}, "
             "path={s.path!A}, "
-            "properties={s.properties!A}, "
+            "properties={0!A}, "
             "qualifiers={s.qualifiers!A})",
-            s=self)
+            self._property_dict(), s=self)
+
+    def _property_dict(self):
+        """
+        Return the properties of this CIM instance as a NocaseDict of
+        CIMProperty objects, without changing an instance that uses a shared
+        layout to no longer use it.
+        """
+        props = self._properties
+        if props.__class__ is _LayoutValues:
+            return props.properties()
+        return self.properties
 
     def __contains__(self, key):
+        props = self._properties
+        if props.__class__ is _LayoutValues:
+            return props.index(key) is not None
         return key in self.properties
 
     def __getitem__(self, key):
+        props = self._properties
+        if props.__class__ is _LayoutValues:
+            i = props.index(key)
+            if i is None:
+                raise KeyError(f"Key {key!r} not found")
+            return props.values[i]
         return self.properties[key].value
 
     def __setitem__(self, key, value):
@@ -2671,9 +2985,15 @@ class CIMInstance(_CIMComparisonMixin, SlottedPickleMixin):
         del self.properties[key]
 
     def __len__(self):
+        props = self._properties
+        if props.__class__ is _LayoutValues:
+            return len(props.values)
         return len(self.properties)
 
     def __iter__(self):
+        props = self._properties
+        if props.__class__ is _LayoutValues:
+            return iter(props.layout.names)
         return iter(self.properties.keys())
 
     def copy(self):
@@ -2694,14 +3014,25 @@ class CIMInstance(_CIMComparisonMixin, SlottedPickleMixin):
           :attr:`~pywbem.CIMInstance.qualifiers` dictionary (but not the
           dictionary object itself)
 
+        If this CIM instance uses a shared :class:`~pywbem.CIMInstanceLayout`,
+        the copy uses the same layout, with a copy of the list of property
+        values.
+
         Note that the Python functions :func:`py:copy.copy` and
         :func:`py:copy.deepcopy` can be used to create completely shallow or
         completely deep copies of objects of this class.
         """
-        result = CIMInstance(
-            self.classname,
-            properties=self.properties,  # setter copies
-            qualifiers=self.qualifiers)  # setter copies
+        # The properties and qualifiers have already been checked and
+        # converted by their setters, so the dictionaries are copied directly.
+        # pylint: disable=protected-access
+        result = CIMInstance(self.classname)
+        result._qualifiers = self.qualifiers.copy()
+        props = self._properties
+        if props.__class__ is _LayoutValues:
+            result._properties = _LayoutValues(props.layout,
+                                               list(props.values))
+        else:
+            result._properties = self.properties.copy()
 
         # The path is set after the init method, because the init method
         # would overwrite the values of keybindings that have corresponding
@@ -2832,6 +3163,10 @@ class CIMInstance(_CIMComparisonMixin, SlottedPickleMixin):
         Returns:
           :term:`CIM data type`: Value of the property, or the default value.
         """
+        props = self._properties
+        if props.__class__ is _LayoutValues:
+            i = props.index(key)
+            return default if i is None else props.values[i]
         prop = self.properties.get(key, None)
         return default if prop is None else prop.value
 
@@ -2992,7 +3327,8 @@ class CIMInstance(_CIMComparisonMixin, SlottedPickleMixin):
         # In pywbem 0.12, this conversion was removed because it worked only
         # for bool and string types anyway. Because that conversion had been
         # implemented, we still check that the items are CIMProperty objects.
-        for key, value in self.properties.items():
+        properties = self._property_dict()
+        for key, value in properties.items():
             try:
                 assert isinstance(value, CIMProperty)
             except AssertionError:
@@ -3002,7 +3338,7 @@ class CIMInstance(_CIMComparisonMixin, SlottedPickleMixin):
 
         instance_xml = _cim_xml.INSTANCE(
             self.classname,
-            properties=[p.tocimxml() for p in self.properties.values()],
+            properties=[p.tocimxml() for p in properties.values()],
             qualifiers=[q.tocimxml() for q in self.qualifiers.values()])
 
         if self.path is None or ignore_path:
@@ -3022,6 +3358,53 @@ class CIMInstance(_CIMComparisonMixin, SlottedPickleMixin):
             self.path.tocimxml(),
             instance_xml)
 
+    def _write_cimxml(self, out, ignore_path=False):
+        """
+        Append the CIM-XML representation of this CIM instance to the list
+        of strings `out`.
+
+        This produces the same XML string as `tocimxml().toxml()` with the
+        same parameters, without creating the :term:`Element` objects.
+        """
+        # pylint: disable=protected-access
+
+        # See tocimxml() for this check.
+        properties = self._property_dict()
+        for key, value in properties.items():
+            if not isinstance(value, CIMProperty):
+                raise TypeError(
+                    _format("Property {0!A} has invalid type: {1} (must be "
+                            "CIMProperty)", key, builtin_type(value)))
+
+        path = self.path
+        if path is None or ignore_path:
+            path_elem = None
+        else:
+            if path.namespace is None:
+                path_elem = 'VALUE.NAMEDINSTANCE'
+            elif path.host is None:
+                path_elem = 'VALUE.OBJECTWITHLOCALPATH'
+            else:
+                path_elem = 'VALUE.INSTANCEWITHPATH'
+            out.append(f'<{path_elem}>')
+            path._write_cimxml(out)
+
+        out.append(
+            f'<INSTANCE CLASSNAME="{_cim_xml.escape_attr(self.classname)}"')
+        qualifiers = self.qualifiers
+        if qualifiers or properties:
+            out.append('>')
+            for q in qualifiers.values():
+                q._write_cimxml(out)
+            for p in properties.values():
+                p._write_cimxml(out)
+            out.append('</INSTANCE>')
+        else:
+            out.append('/>')
+
+        if path_elem is not None:
+            out.append(f'</{path_elem}>')
+
     def tocimxmlstr(self, indent=None, ignore_path=False):
         """
         Return the CIM-XML representation of this CIM instance,
@@ -3050,6 +3433,10 @@ class CIMInstance(_CIMComparisonMixin, SlottedPickleMixin):
 
             str: The CIM-XML representation of the object.
         """
+        if indent is None:
+            out = []
+            self._write_cimxml(out, ignore_path)
+            return ''.join(out)
         xml_elem = self.tocimxml(ignore_path)
         return tocimxmlstr(xml_elem, indent)
 
@@ -3087,7 +3474,7 @@ class CIMInstance(_CIMComparisonMixin, SlottedPickleMixin):
 
         mof.append(' {\n')
 
-        for p in self.properties.values():
+        for p in self._property_dict().values():
             mof.append(p.tomof(True, MOF_INDENT, maxline))
 
         mof.append('};\n')
@@ -3232,6 +3619,256 @@ class CIMInstance(_CIMComparisonMixin, SlottedPickleMixin):
         return inst
 
 
+class _LayoutValues:
+    """
+    The properties of a CIM instance that uses a shared CIMInstanceLayout,
+    stored in the `_properties` attribute of the CIMInstance object instead
+    of a NocaseDict, until the `properties` attribute is accessed.
+    """
+
+    __slots__ = ['layout', 'values']
+
+    def __init__(self, layout, values):
+        self.layout = layout
+        self.values = values
+
+    def index(self, key):
+        """
+        Return the index of a property in the values, or `None` if the
+        layout does not have the property.
+
+        The key may be a unicode string or a byte string.
+
+        Raises the same exceptions as NocaseDict for invalid keys.
+        """
+        if key is None:
+            raise ValueError("Key None (unnamed key) is not allowed for this "
+                             "object")
+        # pylint: disable=protected-access
+        return self.layout._index.get(_ensure_unicode(key).casefold(), None)
+
+    def properties(self):
+        """
+        Return a new NocaseDict with new CIMProperty objects for the
+        properties.
+        """
+        props = NocaseDict()
+        # pylint: disable=protected-access
+        for template, value in zip(self.layout._properties, self.values):
+            prop = template.copy()
+            # The value has already been converted to the CIM data type
+            prop._value = value
+            props[prop.name] = prop
+        return props
+
+
+class CIMInstanceLayout:
+    """
+    A layout of the properties of CIM instances of a class that is shared by
+    the CIM instances, for representing a large number of CIM instances
+    with less memory.
+
+    *New in pywbem 1.10.*
+
+    The layout defines the names and all other attributes except the values of
+    the properties, in their order. A :class:`~pywbem.CIMInstance` object that
+    uses a layout stores only a list of the property values, instead of a
+    dictionary with a :class:`~pywbem.CIMProperty` object for each property.
+    Otherwise, it behaves like any other :class:`~pywbem.CIMInstance` object.
+
+    The following uses of a CIM instance are supported without creating
+    :class:`~pywbem.CIMProperty` objects: Accessing property values by
+    property name (e.g. ``inst['p1']`` or ``inst.get('p1')``), testing for
+    properties (``'p1' in inst``), ``len(inst)``, iterating through the
+    property names, :meth:`~pywbem.CIMInstance.copy`, comparison with other
+    instances that use the same layout, and creating the CIM-XML and MOF
+    representations (e.g. :meth:`~pywbem.CIMInstance.tocimxml` and
+    :meth:`~pywbem.CIMInstance.tomof`, which create only temporary
+    :class:`~pywbem.CIMProperty` objects).
+
+    Any other use of the properties, in particular accessing the
+    :attr:`~pywbem.CIMInstance.properties` attribute and setting or deleting
+    properties, creates the :class:`~pywbem.CIMProperty` objects of the
+    instance, after which the instance no longer uses the layout.
+
+    Objects of this class are immutable. CIM instances that use a layout are
+    created with :meth:`new_instance`, and are returned by CIM operations of
+    :class:`~pywbem.WBEMConnection` if its
+    :attr:`~pywbem.WBEMConnection.instance_layouts` mode is enabled.
+
+    Example::
+
+        layout = pywbem.CIMInstanceLayout.from_class(cim_class)
+        inst = layout.new_instance([pywbem.Uint32(42), 'abc'])
+    """
+
+    __slots__ = ['_classname', '_properties', '_index']
+
+    def __init__(self, classname, properties):
+        """
+        Parameters:
+
+          classname (:term:`string`):
+            Name of the creation class of the CIM instances using the layout.
+
+          properties (:term:`py:iterable` of :class:`~pywbem.CIMProperty`):
+            The properties of the layout, in the order of the property values
+            of the CIM instances. The values of the properties are ignored.
+
+        Raises:
+
+          TypeError: A property is not a :class:`~pywbem.CIMProperty` object.
+          ValueError: A property name occurs more than once (case
+            insensitively).
+        """
+        templates = []
+        index = {}
+        for prop in properties:
+            if not isinstance(prop, CIMProperty):
+                raise TypeError(
+                    _format("Property must be CIMProperty, but is: {0}",
+                            builtin_type(prop)))
+            k = prop.name.casefold()
+            if k in index:
+                raise ValueError(
+                    _format("Property {0!A} occurs more than once",
+                            prop.name))
+            index[k] = len(templates)
+            template = prop.copy()
+            template.value = None
+            templates.append(template)
+        self._classname = _ensure_unicode(classname)
+        self._properties = tuple(templates)
+        self._index = index
+
+    @property
+    def classname(self):
+        """
+        :term:`string`: Name of the creation class of the CIM instances using
+        this layout.
+        """
+        return self._classname
+
+    @property
+    def properties(self):
+        """
+        tuple of :class:`~pywbem.CIMProperty`: The properties of this layout,
+        in order, with their values being `None`.
+
+        The :class:`~pywbem.CIMProperty` objects are shared by all CIM
+        instances using this layout and must not be modified.
+        """
+        return self._properties
+
+    @property
+    def names(self):
+        """
+        tuple of :term:`string`: The names of the properties of this layout,
+        in order.
+        """
+        return tuple(p.name for p in self._properties)
+
+    def __len__(self):
+        """
+        Return the number of properties of this layout.
+        """
+        return len(self._properties)
+
+    def __repr__(self):
+        """
+        Return a string representation suitable for debugging.
+        """
+        return _format(
+            "CIMInstanceLayout(classname={s.classname!A}, "
+            "properties={s.properties!A})", s=self)
+
+    @staticmethod
+    def from_class(klass):
+        """
+        Return a new layout with the properties of a CIM class, in the order
+        of the class.
+
+        Parameters:
+
+          klass (:class:`~pywbem.CIMClass`): The CIM class.
+
+        Returns:
+
+          :class:`~pywbem.CIMInstanceLayout`: The layout.
+        """
+        return CIMInstanceLayout(klass.classname, klass.properties.values())
+
+    @staticmethod
+    def from_instance(instance):
+        """
+        Return a new layout with the properties of a CIM instance, in the
+        order of the instance.
+
+        Parameters:
+
+          instance (:class:`~pywbem.CIMInstance`): The CIM instance.
+
+        Returns:
+
+          :class:`~pywbem.CIMInstanceLayout`: The layout.
+        """
+        return CIMInstanceLayout(instance.classname,
+                                 instance.properties.values())
+
+    def new_instance(self, values, path=None, qualifiers=None):
+        """
+        Return a new CIM instance that uses this layout.
+
+        Parameters:
+
+          values (:term:`py:iterable` of :term:`CIM data type`):
+            The property values, in the order of the properties of this
+            layout. The values are converted to the CIM data types of the
+            properties, as in :func:`~pywbem.cimvalue`.
+
+          path (:class:`~pywbem.CIMInstanceName`):
+            Instance path for the instance, see
+            :class:`~pywbem.CIMInstance`.
+
+          qualifiers (:term:`qualifiers input object`):
+            The qualifiers for the instance, see
+            :class:`~pywbem.CIMInstance`.
+
+        Returns:
+
+          :class:`~pywbem.CIMInstance`: The CIM instance.
+
+        Raises:
+
+          ValueError: The number of values does not match the number of
+            properties of this layout.
+          TypeError: A value cannot be converted to the CIM data type of its
+            property.
+        """
+        values = list(values)
+        if len(values) != len(self._properties):
+            raise ValueError(
+                _format("The number of values ({0}) does not match the number "
+                        "of properties ({1}) of the layout for class {2!A}",
+                        len(values), len(self._properties), self._classname))
+        values = [cimvalue(value, template.type)
+                  for template, value in zip(self._properties, values)]
+        inst = self._new_instance(self._classname, values, qualifiers)
+        inst.path = path
+        return inst
+
+    def _new_instance(self, classname, values, qualifiers=None):
+        """
+        Return a new CIM instance that uses this layout, with property values
+        that have already been converted to the CIM data types of the
+        properties.
+        """
+        inst = CIMInstance(classname, qualifiers=qualifiers)
+        # pylint: disable=protected-access
+        inst._properties = _LayoutValues(self, values)
+        return inst
+
+
 class CIMClassName(_CIMComparisonMixin, SlottedPickleMixin):
     """
     A CIM class path (aka *CIM class name*).
@@ -3530,6 +4167,31 @@ class CIMClassName(_CIMComparisonMixin, SlottedPickleMixin):
             _cim_xml.NAMESPACEPATH(_cim_xml.HOST(self.host), localnsp_xml),
             classname_xml)
 
+    def _write_cimxml(self, out, ignore_host=False, ignore_namespace=False):
+        """
+        Append the CIM-XML representation of this CIM class path to the list
+        of strings `out`.
+
+        This produces the same XML string as `tocimxml().toxml()` with the
+        same parameters, without creating the :term:`Element` objects.
+        """
+
+        classname_str = \
+            f'<CLASSNAME NAME="{_cim_xml.escape_attr(self.classname)}"/>'
+
+        if self.namespace is None or ignore_namespace:
+            out.append(classname_str)
+        elif self.host is None or ignore_host:
+            out.append('<LOCALCLASSPATH>')
+            _cim_xml.write_localnamespacepath(out, self.namespace)
+            out.append(classname_str)
+            out.append('</LOCALCLASSPATH>')
+        else:
+            out.append('<CLASSPATH>')
+            _cim_xml.write_namespacepath(out, self.host, self.namespace)
+            out.append(classname_str)
+            out.append('</CLASSPATH>')
+
     def tocimxmlstr(self, indent=None, ignore_host=False,
                     ignore_namespace=False):
         """
@@ -3562,6 +4224,10 @@ class CIMClassName(_CIMComparisonMixin, SlottedPickleMixin):
 
             str: The CIM-XML representation of the object.
         """
+        if indent is None:
+            out = []
+            self._write_cimxml(out, ignore_host, ignore_namespace)
+            return ''.join(out)
         xml_elem = self.tocimxml(ignore_host, ignore_namespace)
         return tocimxmlstr(xml_elem, indent)
 
@@ -4210,7 +4876,7 @@ class CIMClass(_CIMComparisonMixin, SlottedPickleMixin):
             "path={s.path!A})",
             s=self)
 
-    def copy(self):
+    def copy(self, qualifier_cache=None):
         """
         Return a new :class:`~pywbem.CIMClass` object that is a copy
         of this CIM class.
@@ -4231,17 +4897,48 @@ class CIMClass(_CIMComparisonMixin, SlottedPickleMixin):
           :attr:`~pywbem.CIMClass.qualifiers` dictionary (but not the
           dictionary object itself)
 
+        If a qualifier cache is specified, the :class:`~pywbem.CIMProperty`,
+        :class:`~pywbem.CIMMethod` and :class:`~pywbem.CIMParameter` objects
+        are copied as well, and the qualifiers of the copy are replaced with
+        the equal shared qualifiers of the cache (see
+        :meth:`pywbem.CIMQualifierCache.share_qualifiers`).
+
         Note that the Python functions :func:`py:copy.copy` and
         :func:`py:copy.deepcopy` can be used to create completely shallow or
         completely deep copies of objects of this class.
+
+        Parameters:
+
+          qualifier_cache (:class:`~pywbem.CIMQualifierCache`):
+            Qualifier cache for sharing the qualifiers of the copy, or `None`
+            for not sharing them.
+
+            *New in pywbem 1.10.*
         """
-        return CIMClass(
+        result = CIMClass(
             self.classname,
-            properties=self.properties,  # setter copies
-            methods=self.methods,  # setter copies
             superclass=self.superclass,
-            qualifiers=self.qualifiers,  # setter copies
             path=self.path)  # setter copies
+        # The properties, methods and qualifiers have already been checked and
+        # converted by their setters, so the dictionaries are copied directly.
+        # pylint: disable=protected-access
+        result._properties = self.properties.copy()
+        result._methods = self.methods.copy()
+        result._qualifiers = self.qualifiers.copy()
+        if qualifier_cache is not None:
+            properties = result._properties
+            for pname, prop in list(properties.items()):
+                properties[pname] = prop.copy()
+            methods = result._methods
+            for mname, meth in list(methods.items()):
+                meth = methods[mname] = meth.copy()
+                parameters = meth.parameters
+                for pname, parm in list(parameters.items()):
+                    parameters[pname] = parm.copy()
+            # The qualifiers are shared with this class, so they must not
+            # become the shared qualifiers.
+            qualifier_cache._share_qualifiers(result, True)
+        return result
 
     def tocimxml(self):
         """
@@ -4270,6 +4967,34 @@ class CIMClass(_CIMComparisonMixin, SlottedPickleMixin):
             qualifiers=[q.tocimxml() for q in self.qualifiers.values()],
             superclass=self.superclass)
 
+    def _write_cimxml(self, out):
+        """
+        Append the CIM-XML representation of this CIM class to the list of
+        strings `out`.
+
+        This produces the same XML string as `tocimxml().toxml()`, without
+        creating the :term:`Element` objects.
+        """
+        # pylint: disable=protected-access
+        escape_attr = _cim_xml.escape_attr
+        out.append(f'<CLASS NAME="{escape_attr(self.classname)}"')
+        if self.superclass is not None:
+            out.append(f' SUPERCLASS="{escape_attr(self.superclass)}"')
+        qualifiers = self.qualifiers
+        properties = self.properties
+        methods = self.methods
+        if qualifiers or properties or methods:
+            out.append('>')
+            for q in qualifiers.values():
+                q._write_cimxml(out)
+            for p in properties.values():
+                p._write_cimxml(out)
+            for m in methods.values():
+                m._write_cimxml(out)
+            out.append('</CLASS>')
+        else:
+            out.append('/>')
+
     def tocimxmlstr(self, indent=None):
         """
         Return the CIM-XML representation of this CIM class,
@@ -4295,6 +5020,10 @@ class CIMClass(_CIMComparisonMixin, SlottedPickleMixin):
 
             str: The CIM-XML representation of the object.
         """
+        if indent is None:
+            out = []
+            self._write_cimxml(out)
+            return ''.join(out)
         xml_elem = self.tocimxml()
         return tocimxmlstr(xml_elem, indent)
 
@@ -5033,6 +5762,80 @@ class CIMProperty(_CIMComparisonMixin, SlottedPickleMixin):
                 embedded_object=self.embedded_object,
                 qualifiers=qualifiers)
 
+    def _write_cimxml(self, out):
+        """
+        Append the CIM-XML representation of this CIM property to the list of
+        strings `out`.
+
+        This produces the same XML string as `tocimxml().toxml()`, without
+        creating the :term:`Element` objects.
+        """
+        # pylint: disable=protected-access
+
+        escape_attr = _cim_xml.escape_attr
+        name = escape_attr(self.name)
+        value = self.value
+
+        if self.is_array:
+            assert self.type != 'reference'
+            elem = 'PROPERTY.ARRAY'
+            out.append(f'<PROPERTY.ARRAY NAME="{name}" '
+                       f'TYPE="{escape_attr(self.type)}"')
+            if self.array_size is not None:
+                out.append(f' ARRAYSIZE="{escape_attr(str(self.array_size))}"')
+            if self.class_origin is not None:
+                out.append(f' CLASSORIGIN="{escape_attr(self.class_origin)}"')
+            if self.embedded_object is not None:
+                out.append(
+                    f' EmbeddedObject="{escape_attr(self.embedded_object)}"')
+            if self.propagated is not None:
+                out.append(f' PROPAGATED="{str(self.propagated).lower()}"')
+
+        elif self.type == 'reference':  # scalar
+            elem = 'PROPERTY.REFERENCE'
+            out.append(f'<PROPERTY.REFERENCE NAME="{name}"')
+            if self.reference_class is not None:
+                out.append(
+                    f' REFERENCECLASS="{escape_attr(self.reference_class)}"')
+            if self.class_origin is not None:
+                out.append(f' CLASSORIGIN="{escape_attr(self.class_origin)}"')
+            if self.propagated is not None:
+                out.append(f' PROPAGATED="{str(self.propagated).lower()}"')
+
+        else:  # scalar non-reference
+            elem = 'PROPERTY'
+            out.append(
+                f'<PROPERTY NAME="{name}" TYPE="{escape_attr(self.type)}"')
+            if self.class_origin is not None:
+                out.append(f' CLASSORIGIN="{escape_attr(self.class_origin)}"')
+            if self.propagated is not None:
+                out.append(f' PROPAGATED="{str(self.propagated).lower()}"')
+            if self.embedded_object is not None:
+                out.append(
+                    f' EmbeddedObject="{escape_attr(self.embedded_object)}"')
+
+        qualifiers = self.qualifiers
+        if not qualifiers and value is None:
+            out.append('/>')
+            return
+
+        out.append('>')
+        for q in qualifiers.values():
+            q._write_cimxml(out)
+        if value is not None:
+            if self.is_array:
+                _write_value_array(out, value, self.embedded_object)
+            elif self.type == 'reference':
+                out.append('<VALUE.REFERENCE>')
+                value._write_cimxml(out)
+                out.append('</VALUE.REFERENCE>')
+            elif self.embedded_object is not None:
+                assert isinstance(value, (CIMInstance, CIMClass))
+                _write_embedded_value(out, value)
+            else:
+                _cim_xml.write_value(out, atomic_to_cim_xml(value))
+        out.append(f'</{elem}>')
+
     def tocimxmlstr(self, indent=None):
         """
         Return the CIM-XML representation of this CIM property,
@@ -5058,6 +5861,10 @@ class CIMProperty(_CIMComparisonMixin, SlottedPickleMixin):
 
             str: The CIM-XML representation of the object.
         """
+        if indent is None:
+            out = []
+            self._write_cimxml(out)
+            return ''.join(out)
         xml_elem = self.tocimxml()
         return tocimxmlstr(xml_elem, indent)
 
@@ -5123,7 +5930,7 @@ class CIMProperty(_CIMComparisonMixin, SlottedPickleMixin):
         if self.value is not None or is_instance:
             mof.append(' =')
 
-            if isinstance(self.value, list):
+            if isinstance(self.value, (list, CIMNumericArray)):
                 mof.append(' {')
                 mof_str = ''.join(mof)
                 line_pos = len(mof_str) - mof_str.rfind('\n') - 1
@@ -5669,6 +6476,35 @@ class CIMMethod(_CIMComparisonMixin, SlottedPickleMixin):
             propagated=self.propagated,
             qualifiers=[q.tocimxml() for q in self.qualifiers.values()])
 
+    def _write_cimxml(self, out):
+        """
+        Append the CIM-XML representation of this CIM method to the list of
+        strings `out`.
+
+        This produces the same XML string as `tocimxml().toxml()`, without
+        creating the :term:`Element` objects.
+        """
+        # pylint: disable=protected-access
+        escape_attr = _cim_xml.escape_attr
+        out.append(f'<METHOD NAME="{escape_attr(self.name)}"')
+        if self.return_type is not None:
+            out.append(f' TYPE="{escape_attr(self.return_type)}"')
+        if self.class_origin is not None:
+            out.append(f' CLASSORIGIN="{escape_attr(self.class_origin)}"')
+        if self.propagated is not None:
+            out.append(f' PROPAGATED="{str(self.propagated).lower()}"')
+        qualifiers = self.qualifiers
+        parameters = self.parameters
+        if qualifiers or parameters:
+            out.append('>')
+            for q in qualifiers.values():
+                q._write_cimxml(out)
+            for p in parameters.values():
+                p._write_cimxml(out)
+            out.append('</METHOD>')
+        else:
+            out.append('/>')
+
     def tocimxmlstr(self, indent=None):
         """
         Return the CIM-XML representation of this CIM method,
@@ -5694,6 +6530,10 @@ class CIMMethod(_CIMComparisonMixin, SlottedPickleMixin):
 
             str: The CIM-XML representation of the object.
         """
+        if indent is None:
+            out = []
+            self._write_cimxml(out)
+            return ''.join(out)
         xml_elem = self.tocimxml()
         return tocimxmlstr(xml_elem, indent)
 
@@ -6363,6 +7203,100 @@ class CIMParameter(_CIMComparisonMixin, SlottedPickleMixin):
                     self.type,
                     qualifiers=qualifiers)
 
+    def _write_cimxml(self, out, as_value=False):
+        """
+        Append the CIM-XML representation of this CIM parameter to the list
+        of strings `out`.
+
+        This produces the same XML string as `tocimxml().toxml()` with the
+        same parameters, without creating the :term:`Element` objects.
+        """
+        # pylint: disable=protected-access
+
+        escape_attr = _cim_xml.escape_attr
+        name = escape_attr(self.name)
+
+        if as_value:
+
+            out.append(f'<PARAMVALUE NAME="{name}"')
+            if self.type is not None:
+                out.append(f' PARAMTYPE="{escape_attr(self.type)}"')
+            if self.embedded_object is not None:
+                out.append(
+                    f' EmbeddedObject="{escape_attr(self.embedded_object)}"')
+
+            value = self.value
+            if value is None:
+                out.append('/>')
+                return
+            out.append('>')
+
+            if self.is_array:
+                if self.type == 'reference':
+                    if value:
+                        out.append('<VALUE.REFARRAY>')
+                        for v in value:
+                            if v is None:
+                                out.append('<VALUE.NULL/>' if SEND_VALUE_NULL
+                                           else '<VALUE/>')
+                            else:
+                                out.append('<VALUE.REFERENCE>')
+                                v._write_cimxml(out)
+                                out.append('</VALUE.REFERENCE>')
+                        out.append('</VALUE.REFARRAY>')
+                    else:
+                        out.append('<VALUE.REFARRAY/>')
+                else:  # array non-reference
+                    _write_value_array(out, value, self.embedded_object)
+
+            else:  # scalar
+                if self.type == 'reference':
+                    out.append('<VALUE.REFERENCE>')
+                    value._write_cimxml(out)
+                    out.append('</VALUE.REFERENCE>')
+                elif self.embedded_object is not None:
+                    _write_embedded_value(out, value)
+                else:
+                    _cim_xml.write_value(out, atomic_to_cim_xml(value))
+
+            out.append('</PARAMVALUE>')
+            return
+
+        # as declaration
+
+        if self.is_array:
+            if self.type == 'reference':
+                elem = 'PARAMETER.REFARRAY'
+                out.append(f'<PARAMETER.REFARRAY NAME="{name}"')
+                if self.reference_class is not None:
+                    out.append(' REFERENCECLASS='
+                               f'"{escape_attr(self.reference_class)}"')
+            else:
+                elem = 'PARAMETER.ARRAY'
+                out.append(f'<PARAMETER.ARRAY NAME="{name}" '
+                           f'TYPE="{escape_attr(self.type)}"')
+            if self.array_size is not None:
+                out.append(f' ARRAYSIZE="{escape_attr(str(self.array_size))}"')
+        elif self.type == 'reference':
+            elem = 'PARAMETER.REFERENCE'
+            out.append(f'<PARAMETER.REFERENCE NAME="{name}"')
+            if self.reference_class is not None:
+                out.append(
+                    f' REFERENCECLASS="{escape_attr(self.reference_class)}"')
+        else:
+            elem = 'PARAMETER'
+            out.append(
+                f'<PARAMETER NAME="{name}" TYPE="{escape_attr(self.type)}"')
+
+        qualifiers = self.qualifiers
+        if qualifiers:
+            out.append('>')
+            for q in qualifiers.values():
+                q._write_cimxml(out)
+            out.append(f'</{elem}>')
+        else:
+            out.append('/>')
+
     def tocimxmlstr(self, indent=None, as_value=False):
         """
         Return the CIM-XML representation of this CIM parameter,
@@ -6395,6 +7329,10 @@ class CIMParameter(_CIMComparisonMixin, SlottedPickleMixin):
 
             str: The CIM-XML representation of the object.
         """
+        if indent is None:
+            out = []
+            self._write_cimxml(out, as_value)
+            return ''.join(out)
         xml_elem = self.tocimxml(as_value)
         return tocimxmlstr(xml_elem, indent)
 
@@ -6935,7 +7873,7 @@ class CIMQualifier(_CIMComparisonMixin, SlottedPickleMixin):
         if self.value is None:
             value_xml = None
 
-        elif isinstance(self.value, (tuple, list)):
+        elif isinstance(self.value, (tuple, list, CIMNumericArray)):
             array_xml = []
             for v in self.value:
                 if v is None:
@@ -6960,6 +7898,31 @@ class CIMQualifier(_CIMComparisonMixin, SlottedPickleMixin):
             toinstance=self.toinstance,
             translatable=self.translatable)
 
+    def _write_cimxml(self, out):
+        """
+        Append the CIM-XML representation of this CIM qualifier to the list
+        of strings `out`.
+
+        This produces the same XML string as `tocimxml().toxml()`, without
+        creating the :term:`Element` objects.
+        """
+        escape_attr = _cim_xml.escape_attr
+        out.append(f'<QUALIFIER NAME="{escape_attr(self.name)}" '
+                   f'TYPE="{escape_attr(self.type)}"')
+        if self.propagated is not None:
+            out.append(f' PROPAGATED="{str(self.propagated).lower()}"')
+        _write_flavor_attrs(out, self)
+        value = self.value
+        if value is None:
+            out.append('/>')
+            return
+        out.append('>')
+        if isinstance(value, (tuple, list, CIMNumericArray)):
+            _write_value_array(out, value)
+        else:
+            _cim_xml.write_value(out, atomic_to_cim_xml(value))
+        out.append('</QUALIFIER>')
+
     def tocimxmlstr(self, indent=None):
         """
         Return the CIM-XML representation of this CIM qualifier,
@@ -6985,6 +7948,10 @@ class CIMQualifier(_CIMComparisonMixin, SlottedPickleMixin):
 
             str: The CIM-XML representation of the object.
         """
+        if indent is None:
+            out = []
+            self._write_cimxml(out)
+            return ''.join(out)
         xml_elem = self.tocimxml()
         return tocimxmlstr(xml_elem, indent)
 
@@ -7018,7 +7985,7 @@ class CIMQualifier(_CIMComparisonMixin, SlottedPickleMixin):
         mof.append(self.name)
         mof.append(' ')
 
-        if isinstance(self.value, list):
+        if isinstance(self.value, (list, CIMNumericArray)):
             mof.append('{')
         else:
             mof.append('(')
@@ -7036,7 +8003,7 @@ class CIMQualifier(_CIMComparisonMixin, SlottedPickleMixin):
             line_pos -= 1
         mof.append(val_str)
 
-        if isinstance(self.value, list):
+        if isinstance(self.value, (list, CIMNumericArray)):
             mof.append(' }')
         else:
             mof.append(' )')
@@ -7045,6 +8012,275 @@ class CIMQualifier(_CIMComparisonMixin, SlottedPickleMixin):
         return mof_str
 
 
+class _SharedQualifier(CIMQualifier):
+    """
+    CIMQualifier that is shared between CIM objects by a CIMQualifierCache,
+    and whose attributes therefore cannot be set.
+
+    Objects of this class are created by changing the class of CIMQualifier
+    objects, which is possible because this class adds no slots.
+    """
+
+    __slots__ = []
+
+    def _read_only(self, value):
+        # pylint: disable=unused-argument
+        """
+        Setter method for the attributes of a shared qualifier.
+        """
+        raise TypeError(
+            _format("The attributes of the shared CIMQualifier {0!A} cannot "
+                    "be set; use its copy() method to get a modifiable copy",
+                    self.name))
+
+    name = property(CIMQualifier.name.fget, _read_only)
+    type = property(CIMQualifier.type.fget, _read_only)
+    value = property(CIMQualifier.value.fget, _read_only)
+    propagated = property(CIMQualifier.propagated.fget, _read_only)
+    overridable = property(CIMQualifier.overridable.fget, _read_only)
+    tosubclass = property(CIMQualifier.tosubclass.fget, _read_only)
+    toinstance = property(CIMQualifier.toinstance.fget, _read_only)
+    translatable = property(CIMQualifier.translatable.fget, _read_only)
+
+    def __reduce__(self):
+        # Pickled and copied as a shared qualifier, so that the copy cannot be
+        # modified either.
+        return (_new_shared_qualifier,
+                (self.name, self.value, self.type, self.propagated,
+                 self.overridable, self.tosubclass, self.toinstance,
+                 self.translatable))
+
+
+def _new_shared_qualifier(*args):
+    """
+    Return a new _SharedQualifier object from the init arguments of
+    CIMQualifier.
+    """
+    qual = CIMQualifier(*args)
+    qual.__class__ = _SharedQualifier
+    return qual
+
+
+def _value_size(value):
+    """
+    Return the approximate memory size of a qualifier value in bytes, not
+    counting the values that are shared anyway (None and boolean values).
+    """
+    if value is None or isinstance(value, bool):
+        return 0
+    if isinstance(value, list):
+        return sys.getsizeof(value) + sum(_value_size(v) for v in value)
+    if isinstance(value, CIMNumericArray):
+        return sys.getsizeof(value) + sys.getsizeof(value.buffer)
+    return sys.getsizeof(value)
+
+
+class CIMQualifierCache:
+    """
+    A cache of shared :class:`~pywbem.CIMQualifier` objects, for sharing
+    equal qualifier values between CIM objects.
+
+    *New in pywbem 1.10.*
+
+    CIM classes that have been retrieved with their qualifiers contain many
+    equal qualifier values (e.g. the ``Key``, ``Override`` or ``ValueMap``
+    qualifiers, or the ``Description`` qualifiers of propagated properties).
+    Sharing one :class:`~pywbem.CIMQualifier` object for all equal qualifier
+    values reduces the memory used for holding many CIM classes, e.g. for
+    caching a whole schema on the client side.
+
+    Qualifier values are shared if all their attributes are equal, including
+    the lexical case of their names. A shared qualifier is immutable: Setting
+    its attributes raises :exc:`py:TypeError`. Its
+    :meth:`~pywbem.CIMQualifier.copy` method returns a modifiable copy.
+    The array values of shared qualifiers are shared as well and must not be
+    modified.
+
+    Qualifiers are shared by passing the CIM objects to
+    :meth:`share_qualifiers`, or by using the cache in the
+    :meth:`~pywbem.CIMClass.copy` method of :class:`~pywbem.CIMClass`. The
+    qualifiers of the CIM objects returned by CIM operations of
+    :class:`~pywbem.WBEMConnection` are shared if its
+    :attr:`~pywbem.WBEMConnection.shared_qualifiers` mode is enabled.
+
+    Example::
+
+        qual_cache = pywbem.CIMQualifierCache()
+        for cls in conn.EnumerateClasses(DeepInheritance=True,
+                                         IncludeQualifiers=True):
+            qual_cache.share_qualifiers(cls)
+        print(f"Saved {qual_cache.saved_bytes} bytes")
+    """
+
+    __slots__ = ['_qualifiers', '_shared_count', '_saved_bytes']
+
+    def __init__(self):
+        self._qualifiers = {}
+        self._shared_count = 0
+        self._saved_bytes = 0
+
+    @property
+    def shared_count(self):
+        """
+        :term:`integer`: The number of qualifier values that have been
+        replaced by a shared qualifier.
+        """
+        return self._shared_count
+
+    @property
+    def saved_bytes(self):
+        """
+        :term:`integer`: The approximate number of bytes of memory that
+        has been saved by sharing qualifiers.
+
+        This is the memory size of the replaced :class:`~pywbem.CIMQualifier`
+        objects and of their values. It assumes that the replaced objects are
+        not referenced elsewhere, and does not count the qualifier names,
+        which are shared anyway.
+        """
+        return self._saved_bytes
+
+    def __len__(self):
+        """
+        Return the number of shared qualifiers in this cache.
+        """
+        return len(self._qualifiers)
+
+    def __repr__(self):
+        """
+        Return a string representation suitable for debugging.
+        """
+        return _format(
+            "CIMQualifierCache(qualifiers={0}, shared_count={1}, "
+            "saved_bytes={2})",
+            len(self), self._shared_count, self._saved_bytes)
+
+    def clear(self):
+        """
+        Remove all shared qualifiers from this cache and reset its
+        statistics.
+
+        The qualifiers that have already been shared remain shared and
+        immutable.
+        """
+        self._qualifiers.clear()
+        self._shared_count = 0
+        self._saved_bytes = 0
+
+    def share(self, qualifier):
+        """
+        Return the shared qualifier that is equal to a qualifier.
+
+        If this cache does not yet have an equal shared qualifier, the
+        qualifier itself becomes the shared qualifier and is returned. It can
+        then no longer be modified.
+
+        Qualifiers of classes derived from :class:`~pywbem.CIMQualifier`
+        and qualifiers with values that cannot be compared by hash value are
+        returned unchanged.
+
+        Parameters:
+
+          qualifier (:class:`~pywbem.CIMQualifier`): The qualifier.
+
+        Returns:
+
+          :class:`~pywbem.CIMQualifier`: The shared qualifier.
+        """
+        return self._share(qualifier, False)
+
+    def _share(self, qualifier, copy):
+        """
+        Return the shared qualifier that is equal to a qualifier. If `copy` is
+        True, a copy of the qualifier becomes the shared qualifier if needed,
+        so that the qualifier itself is not changed.
+        """
+        cls = qualifier.__class__
+        if cls is not CIMQualifier and cls is not _SharedQualifier:
+            return qualifier
+        value = qualifier.value
+        if isinstance(value, (list, CIMNumericArray)):
+            value = tuple(value)
+        key = (qualifier.name, qualifier.type, value, qualifier.propagated,
+               qualifier.overridable, qualifier.tosubclass,
+               qualifier.toinstance, qualifier.translatable)
+        try:
+            shared = self._qualifiers.get(key)
+        except TypeError:
+            # A value that is not hashable
+            return qualifier
+        if shared is None:
+            if copy and cls is CIMQualifier:
+                qualifier = qualifier.copy()
+            qualifier.__class__ = _SharedQualifier
+            self._qualifiers[key] = qualifier
+            return qualifier
+        if shared is not qualifier:
+            self._shared_count += 1
+            self._saved_bytes += sys.getsizeof(qualifier)
+            if qualifier.value is not shared.value:
+                self._saved_bytes += _value_size(qualifier.value)
+        return shared
+
+    def share_qualifiers(self, obj):
+        """
+        Replace the qualifiers of a CIM object and of its child objects with
+        the equal shared qualifiers of this cache, in place.
+
+        The child objects are the properties of a CIM class or CIM instance,
+        the methods of a CIM class and the parameters of a CIM method.
+        Qualifiers of these CIM objects that become shared qualifiers (see
+        :meth:`share`) can no longer be modified.
+
+        CIM instances that use a shared :class:`~pywbem.CIMInstanceLayout`
+        have no qualifiers on their properties, so only their own qualifiers
+        are replaced.
+
+        Parameters:
+
+          obj (:ref:`CIM object <CIM objects>`):
+            The CIM object. Must be a :class:`~pywbem.CIMClass`,
+            :class:`~pywbem.CIMInstance`, :class:`~pywbem.CIMProperty`,
+            :class:`~pywbem.CIMMethod`, or :class:`~pywbem.CIMParameter`
+            object.
+
+        Raises:
+
+          TypeError: Invalid type of CIM object.
+        """
+        self._share_qualifiers(obj, False)
+
+    def _share_qualifiers(self, obj, copy):
+        """
+        Replace the qualifiers of a CIM object and of its child objects with
+        the equal shared qualifiers of this cache, in place. If `copy` is True,
+        the qualifiers of the CIM object are not changed.
+        """
+        if isinstance(obj, CIMClass):
+            children = list(obj.properties.values()) + \
+                list(obj.methods.values())
+        elif isinstance(obj, CIMInstance):
+            # pylint: disable=protected-access
+            if obj._properties.__class__ is _LayoutValues:
+                children = []
+            else:
+                children = obj.properties.values()
+        elif isinstance(obj, CIMMethod):
+            children = obj.parameters.values()
+        elif isinstance(obj, (CIMProperty, CIMParameter)):
+            children = []
+        else:
+            raise TypeError(
+                _format("Object must be a CIMClass, CIMInstance, "
+                        "CIMProperty, CIMMethod or CIMParameter, but is: {0}",
+                        builtin_type(obj)))
+        for child in children:
+            self._share_qualifiers(child, copy)
+        qualifiers = obj.qualifiers
+        for qname, qual in list(qualifiers.items()):
+            qualifiers[qname] = self._share(qual, copy)
+
+
 # pylint: disable=too-many-instance-attributes
 class CIMQualifierDeclaration(_CIMComparisonMixin, SlottedPickleMixin):
     """
@@ -7618,7 +8854,7 @@ class CIMQualifierDeclaration(_CIMComparisonMixin, SlottedPickleMixin):
         if self.value is None:
             value_xml = None
 
-        elif isinstance(self.value, (tuple, list)):
+        elif isinstance(self.value, (tuple, list, CIMNumericArray)):
             array_xml = []
             for v in self.value:
                 if v is None:
@@ -7645,6 +8881,54 @@ class CIMQualifierDeclaration(_CIMComparisonMixin, SlottedPickleMixin):
             toinstance=self.toinstance,
             translatable=self.translatable)
 
+    def _write_cimxml(self, out):
+        """
+        Append the CIM-XML representation of this CIM qualifier type to the
+        list of strings `out`.
+
+        This produces the same XML string as `tocimxml().toxml()`, without
+        creating the :term:`Element` objects.
+        """
+        escape_attr = _cim_xml.escape_attr
+        out.append(f'<QUALIFIER.DECLARATION NAME="{escape_attr(self.name)}" '
+                   f'TYPE="{escape_attr(self.type)}"')
+        if self.is_array is not None:
+            out.append(f' ISARRAY="{str(self.is_array).lower()}"')
+        if self.array_size is not None:
+            out.append(f' ARRAYSIZE="{escape_attr(str(self.array_size))}"')
+        _write_flavor_attrs(out, self)
+
+        scopes = self.scopes
+        value = self.value
+        if not scopes and value is None:
+            out.append('/>')
+            return
+        out.append('>')
+
+        if scopes:
+            # See _cim_xml.SCOPE for the handling of the 'any' scope.
+            if 'any' in scopes and scopes['any']:
+                scopes = {'CLASS': True,
+                          'ASSOCIATION': True,
+                          'REFERENCE': True,
+                          'PROPERTY': True,
+                          'METHOD': True,
+                          'PARAMETER': True,
+                          'INDICATION': True}
+            out.append('<SCOPE')
+            for k in sorted(scopes.keys(), key=lambda k: k.upper()):
+                v = scopes[k]
+                if v is not None:
+                    out.append(f' {k.upper()}="{escape_attr(str(v).lower())}"')
+            out.append('/>')
+
+        if value is not None:
+            if isinstance(value, (tuple, list, CIMNumericArray)):
+                _write_value_array(out, value)
+            else:
+                _cim_xml.write_value(out, atomic_to_cim_xml(value))
+        out.append('</QUALIFIER.DECLARATION>')
+
     def tocimxmlstr(self, indent=None):
         """
         Return the CIM-XML representation of this CIM qualifier type,
@@ -7670,6 +8954,10 @@ class CIMQualifierDeclaration(_CIMComparisonMixin, SlottedPickleMixin):
 
             str: The CIM-XML representation of the object.
         """
+        if indent is None:
+            out = []
+            self._write_cimxml(out)
+            return ''.join(out)
         xml_elem = self.tocimxml()
         return tocimxmlstr(xml_elem, indent)
 
@@ -7711,7 +8999,7 @@ class CIMQualifierDeclaration(_CIMComparisonMixin, SlottedPickleMixin):
 
             mof.append(' = ')
 
-            if isinstance(self.value, list):
+            if isinstance(self.value, (list, CIMNumericArray)):
                 mof.append('{ ')
 
             mof_str = ''.join(mof)
@@ -7720,7 +9008,7 @@ class CIMQualifierDeclaration(_CIMComparisonMixin, SlottedPickleMixin):
                 self.value, self.type, MOF_INDENT, maxline, line_pos, 3, False)
             mof.append(val_str)
 
-            if isinstance(self.value, list):
+            if isinstance(self.value, (list, CIMNumericArray)):
                 mof.append(' }')
 
         mof.append(',\n')
@@ -7786,7 +9074,7 @@ def tocimxml(value):
     if value is None:
         raise ValueError("The value parameter must not be None")
 
-    if isinstance(value, (tuple, list)):
+    if isinstance(value, (tuple, list, CIMNumericArray)):
         array_xml = []
         for v in value:
             if v is None:
@@ -7805,6 +9093,81 @@ def tocimxml(value):
     return _cim_xml.VALUE(atomic_to_cim_xml(value))
 
 
+def _write_cimxml(out, value):
+    """
+    Append the CIM-XML representation of the input object to the list of
+    strings `out`.
+
+    This produces the same XML string as `tocimxml(value).toxml()`, without
+    creating the :term:`Element` objects.
+
+    Raises:
+      ValueError: Invalid input value.
+    """
+    # pylint: disable=protected-access
+
+    if value is None:
+        raise ValueError("The value parameter must not be None")
+
+    if isinstance(value, (tuple, list, CIMNumericArray)):
+        _write_value_array(out, value)
+    elif hasattr(value, '_write_cimxml'):
+        value._write_cimxml(out)
+    else:
+        _cim_xml.write_value(out, atomic_to_cim_xml(value))
+
+
+def _write_value_array(out, values, embedded_object=None):
+    """
+    Append the CIM-XML string of a VALUE.ARRAY element with the specified
+    array values to the list of strings `out`.
+
+    If `embedded_object` is not `None`, the non-Null array values are
+    embedded objects (CIMInstance or CIMClass).
+    """
+    if not values:
+        out.append('<VALUE.ARRAY/>')
+        return
+    out.append('<VALUE.ARRAY>')
+    for v in values:
+        if v is None:
+            out.append('<VALUE.NULL/>' if SEND_VALUE_NULL else '<VALUE/>')
+        elif embedded_object is not None:
+            _write_embedded_value(out, v)
+        else:
+            _cim_xml.write_value(out, atomic_to_cim_xml(v))
+    out.append('</VALUE.ARRAY>')
+
+
+def _write_embedded_value(out, obj, **kwargs):
+    """
+    Append the CIM-XML string of a VALUE element with the escaped CIM-XML
+    representation of the embedded object `obj` (CIMInstance or CIMClass) to
+    the list of strings `out`. The keyword arguments are passed on to the
+    _write_cimxml() method of the embedded object.
+    """
+    # pylint: disable=protected-access
+    obj_out = []
+    obj._write_cimxml(obj_out, **kwargs)
+    _cim_xml.write_value(out, ''.join(obj_out))
+
+
+def _write_flavor_attrs(out, obj):
+    """
+    Append the CIM-XML strings of the qualifier flavor attributes of the
+    CIMQualifier or CIMQualifierDeclaration object `obj` to the list of
+    strings `out`.
+    """
+    if obj.overridable is not None:
+        out.append(f' OVERRIDABLE="{str(obj.overridable).lower()}"')
+    if obj.tosubclass is not None:
+        out.append(f' TOSUBCLASS="{str(obj.tosubclass).lower()}"')
+    if obj.toinstance is not None:
+        out.append(f' TOINSTANCE="{str(obj.toinstance).lower()}"')
+    if obj.translatable is not None:
+        out.append(f' TRANSLATABLE="{str(obj.translatable).lower()}"')
+
+
 def tocimxmlstr(value, indent=None):
     """
     Return the CIM-XML representation of the CIM object or CIM data type,
@@ -7836,6 +9199,10 @@ def tocimxmlstr(value, indent=None):
 
     if isinstance(value, Element):
         xml_elem = value
+    elif indent is None:
+        out = []
+        _write_cimxml(out, value)
+        return ''.join(out)
     else:
         xml_elem = tocimxml(value)
 
@@ -7953,6 +9320,9 @@ def cimvalue(value, type):
     # Arrays
     if isinstance(value, list):
         return [cimvalue(v, type) for v in value]
+    if isinstance(value, CIMNumericArray):
+        # Raises ValueError if the type is not numeric
+        return CIMNumericArray(type, value)
 
     # Boolean type
     if type == 'boolean':
@@ -8026,7 +9396,7 @@ def _infer_is_array(value):
     if value is None:
         return False
 
-    return isinstance(value, list)
+    return isinstance(value, (list, CIMNumericArray))
 
 
 def _check_array_parms(is_array, array_size, value, element_kind,
@@ -8046,7 +9416,7 @@ def _check_array_parms(is_array, array_size, value, element_kind,
     #                 element_kind, element_name, array_size))
 
     if value is not None:
-        value_is_array = isinstance(value, (list, tuple))
+        value_is_array = isinstance(value, (list, tuple, CIMNumericArray))
         if not is_array and value_is_array:
             raise ValueError(
                 _format("The is_array parameter of {0} {1!A} is False but "
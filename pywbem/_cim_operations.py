@@ -80,6 +80,8 @@ WBEMConnection methods targeting a server                   Purpose
                                                             PullInstances or ExecQuery depending on
                                                             the attributes and existence of pull operations in the
                                                             server.
+:meth:`~pywbem.WBEMConnection.EnumerateInstancesColumnar`   Columnar API that uses EnumerateInstances and returns the
+                                                            instances as columns of property and keybinding values.
 ----------------------------------------------------------  --------------------------------------------------------------
 :meth:`~pywbem.WBEMConnection.OpenEnumerateInstances`       Open enumeration session to retrieve instances of
                                                             of a class (including instances of its subclass)
@@ -139,11 +141,15 @@ WBEMConnection methods targeting a listener                 Purpose
 
 import os
 import re
+import copy
 from datetime import datetime, timedelta
 from xml.dom import minidom
 from collections import namedtuple
 import logging
 import warnings
+import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
 from requests.packages import urllib3
@@ -152,23 +158,31 @@ from . import _cim_xml
 from .config import DEFAULT_ITER_MAXOBJECTCOUNT, AUTO_GENERATE_SFCB_UEP_HEADER
 from ._cim_constants import DEFAULT_NAMESPACE, CIM_ERR_NOT_SUPPORTED, \
     CIM_ERR_FAILED, DEFAULT_TIMEOUT
-from ._cim_types import CIMType, CIMDateTime, atomic_to_cim_xml
+from ._cim_types import CIMType, CIMDateTime, CIMNumericArray, \
+    atomic_to_cim_xml
 from ._nocasedict import NocaseDict
 from ._cim_obj import CIMInstance, CIMInstanceName, CIMClass, CIMClassName, \
-    CIMParameter, CIMQualifierDeclaration, tocimxml, cimvalue
-from ._cim_http import get_cimobject_header, wbem_request, parse_url
-from ._tupleparse import TupleParser
-from ._tupletree import xml_to_tupletree_sax
-from ._exceptions import CIMXMLParseError, XMLParseError, CIMError
+    CIMParameter, CIMQualifierCache, CIMQualifierDeclaration, cimvalue, \
+    _write_cimxml, _write_embedded_value
+from ._cim_http import get_cimobject_header, wbem_request, wbem_options, \
+    parse_url, XML_DECLARATION
+from ._tupleparse import TupleParser, VALIDATION_LEVELS
+from ._tupledecode import TupleDecoder
+from ._columns import InstanceColumns
+from ._tupletree import xml_to_tupletree_expat, \
+    xml_chunks_to_tupletree_expat, iter_xml_chunks_to_tupletree_expat
+from ._exceptions import Error, CIMXMLParseError, XMLParseError, CIMError, \
+    HTTPError
 from ._exceptions import ConnectionError  # pylint: disable=redefined-builtin
 from ._statistics import Statistics
 from ._recorder import LogOperationRecorder
 from ._logging import DEFAULT_LOG_DETAIL_LEVEL, LOG_DESTINATIONS, \
     LOGGER_API_CALLS_NAME, LOGGER_HTTP_NAME, LOG_DETAIL_LEVELS, \
     LOGGER_SIMPLE_NAMES
-from ._utils import _ensure_unicode, _format
+from ._utils import _ensure_unicode, _format, _StateAttribute
 
-__all__ = ['WBEMConnection', 'IterQueryInstancesReturn']
+__all__ = ['WBEMConnection', 'IterQueryInstancesReturn', 'WBEMBatch',
+           'BatchOperation']
 
 URLLIB3_VERSION_INFO = tuple(map(int, urllib3.__version__.split('.')[0:3]))
 
@@ -182,6 +196,13 @@ HTTP_OTHER_RETRIES = 0           # other: Max number of other HTTP retries
 HTTP_MAX_REDIRECTS = 5           # redirect: Max number of HTTP redirects
 HTTP_RETRY_BACKOFF_FACTOR = 0.1  # backoff_factor: Backoff factor for retries
 
+# Maximum number of HTTP connections to a WBEM server that are kept open for
+# reuse by a connection in thread_safe mode. This is the pool_maxsize
+# parameter of requests.adapters.HTTPAdapter and limits the number of threads
+# that can use the connection without opening new HTTP connections. Without
+# thread_safe mode, the default pool size of the requests package is used.
+HTTP_POOL_MAXSIZE = 32
+
 # urllib3 1.26.0 started issuing a DeprecationWarning for using the
 # 'method_whitelist' init parameter of Retry and announced its removal in
 # version 2.0. The replacement parameter is 'allowed_methods'.
@@ -275,6 +296,17 @@ def _iparam_propertylist(property_list):
     return property_list
 
 
+def _property_filter(property_list, enforce_property_list):
+    """
+    Return the property filter for enforcing the PropertyList parameter of an
+    operation on the client side, as a set of lower-cased property names, or
+    `None` if the property list is not to be enforced.
+    """
+    if not enforce_property_list or property_list is None:
+        return None
+    return {pname.lower() for pname in property_list}
+
+
 def _validate_OperationTimeout(OperationTimeout):
     """
     Validate the OperationTimeout input parameter for the Iter...() and
@@ -377,2507 +409,3860 @@ def _validate_context(context):
                     "of size 2)", context))
 
 
-class IterQueryInstancesReturn:
+def _validate_prefetch(prefetch):
     """
-    The return data for
-    :meth:`~pywbem.WBEMConnection.IterQueryInstances`.
+    Validate the prefetch input parameter for the Iter...() operations.
+
+    Parameters:
+      prefetch: Must be integer type and > 0, or None
+
+    Raises:
+      TypeError: Invalid type
+      ValueError: Invalid value
+    """
+    if prefetch is None:
+        return
+    # bool is a subclass of int, but True is not a meaningful prefetch count
+    if isinstance(prefetch, bool) or not isinstance(prefetch, int):
+        raise TypeError(
+            _format("The 'prefetch' parameter of the WBEMConnection "
+                    "operation has invalid type {0} (must be integer or None)",
+                    type(prefetch)))
+    if prefetch <= 0:
+        raise ValueError(
+            _format("The 'prefetch' parameter of the WBEMConnection "
+                    "operation has invalid value {0!r} (must be > 0)",
+                    prefetch))
+
+
+class _OperationState:
+    # pylint: disable=too-few-public-methods
     """
+    State of the last operation of a WBEMConnection that is not in
+    thread_safe mode.
 
-    def __init__(self, instances, query_result_class=None):
-        """Save any query_result_class and instances returned"""
-        self._query_result_class = query_result_class
-        self.instances = instances
+    The attributes of this object are accessed via the _StateAttribute
+    descriptors of WBEMConnection and are created when they are set for the
+    first time.
+    """
 
-    @property
-    def query_result_class(self):
+
+def _new_operation_state(thread_safe):
+    """
+    Return a new object for the state of the last operation of a
+    WBEMConnection, for the thread_safe mode specified.
+
+    In thread_safe mode, this is a threading.local object, so that each
+    thread has its own state of the last operation.
+    """
+    if thread_safe:
+        return threading.local()
+    return _OperationState()
+
+
+class _PullPrefetcher:
+    """
+    Background worker thread that issues the pull operations of an open
+    enumeration session ahead of the consumer of the pull results.
+
+    The worker thread issues at most `prefetch` pull operations whose results
+    have not yet been taken by the consumer. Pull results and exceptions
+    raised by the pull operations are passed to the consumer in the order
+    of the pull operations.
+    """
+
+    def __init__(self, pull_method, context, MaxObjectCount, prefetch):
+        # pylint: disable=invalid-name
         """
-        :class:`~pywbem.CIMClass`: The query result class, if requested
-        via the `ReturnQueryResultClass` parameter of
-        :meth:`~pywbem.WBEMConnection.IterQueryInstances`.
+        Parameters:
 
-        `None`, if a query result class was not requested.
+          pull_method (callable): The Pull...() method of the connection
+            that is used by the worker thread. This must not be a method of a
+            connection that is used by other threads.
+
+          context (tuple): Enumeration context returned by the Open...()
+            operation.
+
+          MaxObjectCount (int): MaxObjectCount parameter for the pull
+            operations.
+
+          prefetch (int): Maximum number of pull results ahead of the
+            consumer.
         """
-        return self._query_result_class
+        self._pull_method = pull_method
+        self._context = context
+        self._max_object_count = MaxObjectCount
+        self._results = queue.Queue()
+        self._credits = threading.Semaphore(prefetch)
+        self._stopped = False
+        self._last_result = None
+        self.failed = False  # A pull operation has raised an exception
+        self._thread = threading.Thread(
+            target=self._run, name='pywbem-pull-prefetch', daemon=True)
+        self._thread.start()
 
-    @property
-    def generator(self):
+    def _run(self):
         """
-        :term:`py:generator` iterating :class:`~pywbem.CIMInstance`:
-        A generator object that iterates the CIM instances representing
-        the query result. These instances do not have an instance path
-        set.
+        Thread function of the worker thread.
         """
-        yield from self.instances
+        context = self._context
+        while True:
+            self._credits.acquire()  # pylint: disable=consider-using-with
+            if self._stopped:
+                return
+            try:
+                result = self._pull_method(
+                    context, MaxObjectCount=self._max_object_count)
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                self.failed = True
+                self._results.put(exc)
+                return
+            self._last_result = result
+            self._results.put(result)
+            if result.eos:
+                return
+            context = result.context
+
+    def next_result(self):
+        """
+        Return the next pull result, waiting for it if needed.
 
+        Raises:
+          Exception raised by the pull operation.
+        """
+        result = self._results.get()
+        self._credits.release()
+        if isinstance(result, Exception):
+            raise result
+        return result
 
-class WBEMConnection:  # pylint: disable=too-many-instance-attributes
-    """
-    A client's connection to a WBEM server or WBEM listener. This is the main
-    class of the WBEM client library API.
+    def stop(self):
+        """
+        Stop the worker thread, waiting for a pull operation in progress to
+        complete.
 
-    This class is used for communication with WBEM servers and WBEM listeners,
-    because the communication mechanisms are very similar. However, a
-    particular object of this class will connect to only one target which is
-    either a WBEM server or a WBEM listener, but never both.
+        Returns:
+          The last pull result received by the worker thread, or `None` if no
+          pull operation has succeeded.
+        """
+        self._stopped = True
+        self._credits.release()
+        self._thread.join()
+        return self._last_result
 
-    When targeting a WBEM server, the connection object knows a default CIM
-    namespace, which is used when no namespace is specified on subsequent
-    WBEM operations (that support specifying namespaces). Thus, the connection
-    object can be used as a connection to multiple CIM namespaces on a
-    WBEM server (when the namespace is specified on subsequent operations),
-    or as a connection to only the default namespace (this allows omitting the
-    namespace on subsequent operations).
 
-    As usual in HTTP, there is no persistent TCP connection; the connectedness
-    provided by this class is only conceptual. That is, the creation of the
-    connection object does not cause any interaction with the WBEM server or
-    WBEM listener, and each subsequent WBEM operation performs an independent,
-    state-less HTTP/HTTPS request. However, usage of the `requests` Python
-    package causes the underlying resources such as sockets to be pooled.
-    A :meth:`~pywbem.WBEMConnection.close` method closes the underlying
-    session of the `requests` package, releasing any sockets.
+# Start and end of the CIM-XML string of a request, i.e. the XML declaration
+# and the CIM and MESSAGE elements that enclose the simple request element.
+# The XML declaration is written with the request, so that the request
+# string can be sent without adding it (see _cim_http.build_request()).
+_REQUEST_START = XML_DECLARATION + \
+    '<CIM CIMVERSION="2.0" DTDVERSION="2.0">' \
+    '<MESSAGE ID="1001" PROTOCOLVERSION="1.0">'
+_REQUEST_END = '</MESSAGE></CIM>'
 
-    The WBEMConnection class can also be used as a context manager, which
-    causes the connection to be closed at context manager exit:
 
-    .. code-block:: python
+def _request_xml(request_data):
+    """
+    Return the CIM-XML request string without its XML declaration, as it is
+    exposed in the last_raw_request attribute and in exceptions.
 
-        with WBEMConnection('https://myserver') as conn:
-            conn.EnumerateInstances('CIM_Foo')
+    This creates a copy of the request string, and should be used only when
+    the request string is exposed.
+    """
+    if isinstance(request_data, str) and \
+            request_data.startswith(XML_DECLARATION):
+        return request_data[len(XML_DECLARATION):]
+    return request_data
 
-    The :class:`~pywbem.WBEMConnection` class supports connection through
-    HTTP and SOCKS proxies, by utilizing the proxy support in the `requests`
-    Python package.
 
-    After creating a :class:`~pywbem.WBEMConnection` object, various methods
-    may be called on the object, which cause WBEM operations to be issued to
-    the WBEM server or WBEM listener. See :ref:`WBEM operations` for a list of
-    these methods. Each operation method describes whether it can be used
-    with a WBEM server or with a WBEM listener.
+def _imethodcall_request(methodname, namespace, **params):
+    """
+    Build the CIM-XML request for an intrinsic CIM-XML operation.
 
-    CIM elements such as instances or classes are represented as Python objects
-    (see :ref:`CIM objects`). The caller does not need to know about the CIM-XML
-    encoding of CIM elements and protocol payload that is used underneath (It
-    should be possible to use a different WBEM protocol below this layer without
-    disturbing any callers).
+    Parameters:
 
-    The connection remembers the XML of the last request and last reply if
-    debugging is turned on via the :attr:`debug` attribute of the
-    connection object.
-    This may be useful in debugging: If a problem occurs, you can examine the
-    :attr:`last_request` and :attr:`last_reply` attributes of the
-    connection object.
-    These are the prettified XML of request and response, respectively.
-    The real request and response that are sent and received are available in
-    the :attr:`last_raw_request` and :attr:`last_raw_reply` attributes
-    of the connection object.
+      methodname (str): Name of the CIM operation (e.g. 'GetInstance').
 
-    The methods of this class may raise the following exceptions:
+      namespace (str): Namespace name.
 
-    * Exceptions indicating operational errors:
+      **params (dict): Input parameters for the operation. Parameters with a
+        value of `None` are omitted.
 
-      - :exc:`~pywbem.ConnectionError` - A connection with the WBEM server
-        or WBEM listener could not be established or broke down.
+    Returns:
 
-      - :exc:`~pywbem.AuthError` - Authentication failed with the WBEM server.
-        This exception cannot occur when targeting a WBEM listener.
+      tuple of (request_data, cimxml_headers), with request_data being the
+      CIM-XML request string, and cimxml_headers being the list of CIM-XML
+      extension header fields for the request.
+    """
 
-      - :exc:`~pywbem.TimeoutError` - The WBEM server or WBEM listener did not
-        respond in time and the client timed out.
+    # Create HTTP extension headers for CIM-XML.
+    # Note: The two-step encoding required by DSP0200 will be performed in
+    # wbem_request().
 
-      Such exceptions can typically be resolved by the client user or server
-      admin.
+    cimxml_headers = [
+        ('CIMOperation', 'MethodCall'),
+        ('CIMMethod', methodname),
+        ('CIMObject', get_cimobject_header(namespace)),
+    ]
 
-    * Exceptions indicating server-side issues:
+    # Build XML request. The CIM-XML string is written directly, which
+    # produces the same XML string as building the request from the
+    # _cim_xml element classes, but much faster.
 
-      - :exc:`~pywbem.HTTPError` - HTTP error (bad status code) received from
-        WBEM server or WBEM listener.
+    out = [_REQUEST_START, '<SIMPLEREQ><IMETHODCALL NAME="',
+           _cim_xml.escape_attr(methodname), '">']
+    _cim_xml.write_localnamespacepath(out, namespace)
 
-      - :exc:`~pywbem.CIMXMLParseError` - The response from the WBEM server
-        or WBEM listener cannot be parsed because it is invalid CIM-XML
-        (for example, a required attribute is missing on an XML element).
+    # Create parameter list
 
-      - :exc:`~pywbem.XMLParseError` - The response from the WBEM server or
-        WBEM listener cannot be parsed because it is invalid XML (for example,
-        invalid characters or UTF-8 sequences, or ill-formed XML).
+    for name, value in params.items():
+        if value is not None:
+            out.append(f'<IPARAMVALUE NAME="{_cim_xml.escape_attr(name)}">')
+            _write_cimxml(out, value)
+            out.append('</IPARAMVALUE>')
 
-      Such exceptions nearly always indicate an issue with the implementation
-      of the WBEM server or WBEM listener.
+    out.append('</IMETHODCALL></SIMPLEREQ>')
+    out.append(_REQUEST_END)
 
-    * Other exceptions:
+    return ''.join(out), cimxml_headers
 
-      - :exc:`~pywbem.CIMError` - The WBEM server or WBEM listener returned an
-        error response  with a CIM status code.
 
-      Depending on the nature of the request, and on the CIM status code, the
-      reason may be a client user error (e.g. incorrect class name) or
-      a server side issue (e.g. some internal error in the server or listener).
+def _methodcall_request(methodname, objectname, default_namespace,
+                        Params=None, **params):
+    # pylint: disable=invalid-name
+    """
+    Build the CIM-XML request for an extrinsic CIM-XML method call.
 
-    * Exceptions indicating programming errors (in pywbem or by the user):
+    Parameters:
 
-      - :exc:`py:TypeError`
-      - :exc:`py:KeyError`
-      - :exc:`py:ValueError`
-      - :exc:`py:AttributeError`
-      - ... possibly others ...
+      methodname (str): CIM method name.
 
-      Exceptions indicating programming errors should not happen. If you think
-      the reason such an exception is raised lies in pywbem,
-      `report a bug <https://github.com/pywbem/pywbem/issues>`_.
-    """
+      objectname (string or CIMInstanceName or CIMClassName):
+        Target object. Strings are interpreted as class names.
 
-    # Class level counter. Incremented at each WBEMConnection creation
-    # and used as part of WBEMConnection instance ID.
-    _conn_counter = 0
+      default_namespace (str): Namespace to be used if objectname does not
+        specify one.
 
-    # Detail levels to be used for log operation recorders of any newly created
-    # WBEMConnection objects.
-    #   Key: Simple logger name (e.g. 'api')
-    #   Value: Detail level string from LOG_DETAIL_LEVELS.
-    _log_detail_levels = {}
+      Params: CIM method input parameters, for details see InvokeMethod().
 
-    # If True, logging will be activated for any newly created WBEMConnection
-    # objects.
-    _activate_logging = False
+      **params: CIM method input parameters, for details see InvokeMethod().
 
-    def __init__(self, url, creds=None, default_namespace=None,
-                 x509=None, ca_certs=None,
-                 no_verification=False, timeout=DEFAULT_TIMEOUT,
-                 use_pull_operations=False,
-                 stats_enabled=False, proxies=None):
-        # pylint: disable=line-too-long
-        """
-        Parameters:
+    Returns:
 
-          url (str):
-            URL of the WBEM server or WBEM listener, in the format:
+      tuple of (request_data, cimxml_headers), with request_data being the
+      CIM-XML request string, and cimxml_headers being the list of CIM-XML
+      extension header fields for the request.
+    """
 
-              ``[{scheme}://]{host}[:{port}]``
+    if isinstance(objectname, (CIMInstanceName, CIMClassName)):
+        localobject = objectname.copy()
+        if localobject.namespace is None:
+            localobject.namespace = default_namespace
+        localobject.host = None
+    elif isinstance(objectname, str):
+        # a string is always interpreted as a class name
+        localobject = CIMClassName(objectname,
+                                   namespace=default_namespace)
+    else:
+        raise TypeError(
+            _format("The 'ObjectName' parameter of the WBEMConnection "
+                    "operation has invalid type {0} (must be a string, "
+                    "a CIMClassName, or a CIMInstanceName)",
+                    type(objectname)))
+
+    # Create HTTP extension headers for CIM-XML.
+    # Note: The two-step encoding required by DSP0200 will be performed in
+    # wbem_request().
+
+    cimxml_headers = [
+        ('CIMOperation', 'MethodCall'),
+        ('CIMMethod', methodname),
+        ('CIMObject', get_cimobject_header(localobject)),
+    ]
+
+    # Add a special HTTP header for SFCB's special password expiration
+    # update mechanism. For details, see the documentation of the
+    # pywbem config variable AUTO_GENERATE_SFCB_UEP_HEADER.
+    if AUTO_GENERATE_SFCB_UEP_HEADER and \
+            methodname == 'UpdateExpiredPassword' and \
+            objectname.classname == 'SFCB_Account':
+        cimxml_headers.append(('Pragma', 'UpdateExpiredPassword'))
+
+    # Create parameter list
+
+    def infer_type(obj, param_name):
+        """
+        Infer the CIM data type name of a parameter value.
+        """
+        if isinstance(obj, CIMType):  # pylint: disable=no-else-return
+            return obj.cimtype
+        elif isinstance(obj, bool):
+            return 'boolean'
+        elif isinstance(obj, str):
+            return 'string'
+        elif isinstance(obj, (datetime, timedelta)):
+            return 'datetime'
+        elif isinstance(obj, (CIMClassName, CIMInstanceName)):
+            return 'reference'
+        elif isinstance(obj, (CIMClass, CIMInstance)):
+            return 'string'
+        elif isinstance(obj, CIMNumericArray):
+            return obj.cimtype
+        elif isinstance(obj, list):
+            return infer_type(obj[0], param_name) if obj else None
+        elif obj is None:
+            return None
+        if isinstance(obj, int):
+            hint = " (use a CIM integer type such as pywbem.Uint32)"
+        else:
+            hint = ""
+        raise TypeError(
+            _format("Method parameter {0!A} has type {1} which cannot "
+                    "be used to infer a valid CIM data type{2}",
+                    param_name, type(obj), hint))
+        # pylint: disable=inconsistent-return-statements
 
-            Possibly present trailing path segments in the URL are ignored.
+    def write_paramvalue(out, obj):
+        """
+        Append the CIM-XML string for the value of a parameter to the list of
+        strings out.
+        """
+        # pylint: disable=protected-access
+        if isinstance(obj, (datetime, timedelta)):
+            obj = CIMDateTime(obj)
+        if isinstance(obj, (CIMType, bool, str)):
+            # This includes CIMDateTime (subclass of CIMType)
+            _cim_xml.write_value(out, atomic_to_cim_xml(obj))
+        elif isinstance(obj, (CIMClassName, CIMInstanceName)):
+            out.append('<VALUE.REFERENCE>')
+            obj._write_cimxml(out)
+            out.append('</VALUE.REFERENCE>')
+        elif isinstance(obj, CIMInstance):
+            _write_embedded_value(out, obj, ignore_path=True)
+        elif isinstance(obj, CIMClass):
+            # CIMClass._write_cimxml() always ignores path
+            _write_embedded_value(out, obj)
+        elif isinstance(obj, (list, CIMNumericArray)):
+            if obj and isinstance(obj[0], (CIMClassName, CIMInstanceName)):
+                elem = 'VALUE.REFARRAY'
+            else:
+                elem = 'VALUE.ARRAY'
+            if obj:
+                out.append(f'<{elem}>')
+                for x in obj:
+                    write_paramvalue(out, x)
+                out.append(f'</{elem}>')
+            else:
+                out.append(f'<{elem}/>')
+        else:
+            # The type has been checked in infer_type(), so we can assert
+            assert obj is None
 
-            The following URL schemes are supported:
+    def infer_embedded_object(obj):
+        """
+        Infer the embedded_object value of a parameter value.
+        """
+        if isinstance(obj, list) and obj:
+            return infer_embedded_object(obj[0])
 
-            * ``http``: Causes HTTP to be used (default).
-            * ``https``: Causes HTTPS to be used.
+        if isinstance(obj, CIMClass):
+            return 'object'
 
-            The host can be specified in any of the usual formats:
+        if isinstance(obj, CIMInstance):
+            return 'instance'
+        return None
 
-            * a short or fully qualified DNS hostname
-            * a literal (= dotted) IPv4 address
-            * a literal IPv6 address, formatted as defined in :term:`RFC3986`
-              with the extensions for zone identifiers as defined in
-              :term:`RFC6874`, supporting ``-`` (minus) for the delimiter
-              before the zone ID string, as an additional choice to ``%25``.
+    ptuples = []  # tuple (name, value, type, embedded_object)
+    if Params is not None:
+        for p in Params:
+            if isinstance(p, CIMParameter):
+                ptuple = (p.name, p.value, p.type, p.embedded_object)
+            else:  # p is a tuple of name, value
+                ptuple = (p[0], p[1], infer_type(p[1], p[0]),
+                          infer_embedded_object(p[1]))
+            ptuples.append(ptuple)
+    for n, v in params.items():
+        ptuple = (n, v, infer_type(v, n), infer_embedded_object(v))
+        ptuples.append(ptuple)
+
+    # Build XML request. The CIM-XML string is written directly, see
+    # _imethodcall_request().
+
+    escape_attr = _cim_xml.escape_attr
+    out = [_REQUEST_START, '<SIMPLEREQ><METHODCALL NAME="',
+           escape_attr(methodname), '">']
+    localobject._write_cimxml(out)  # pylint: disable=protected-access
+
+    for n, v, t, eo in ptuples:
+        out.append(f'<PARAMVALUE NAME="{escape_attr(n)}"')
+        if t is not None:
+            out.append(f' PARAMTYPE="{escape_attr(t)}"')
+        if eo is not None:
+            out.append(f' EmbeddedObject="{escape_attr(eo)}"')
+        if v is None:
+            out.append('/>')
+        else:
+            out.append('>')
+            write_paramvalue(out, v)
+            out.append('</PARAMVALUE>')
 
-            If no port is specified in the URL, it defaults to:
+    out.append('</METHODCALL></SIMPLEREQ>')
+    out.append(_REQUEST_END)
 
-            * Port 5988 for URL scheme ``http``
-            * Port 5989 for URL scheme ``https``
+    return ''.join(out), cimxml_headers
 
-            For WBEM listeners, the port usually different and should therefore
-            be specified in the URL.
 
-            Examples for some URL formats:
+def _iexportcall_request(methodname, **params):
+    """
+    Build the CIM-XML request for a CIM-XML export method.
 
-            * ``"https://10.11.12.13:6989"``:
-              Use HTTPS to port 6989 on host 10.11.12.13
-            * ``"https://mysystem.acme.org"``:
-              Use HTTPS to port 5989 on host mysystem.acme.org
-            * ``"10.11.12.13"``:
-              Use HTTP to port 5988 on host 10.11.12.13
-            * ``"http://[2001:db8::1234]:15988"``:
-              Use HTTP to port 15988 on host 2001:db8::1234
-            * ``"http://[::ffff.10.11.12.13]"``:
-              Use HTTP to port 5988 on host ::ffff.10.11.12.13 (an
-              IPv4-mapped IPv6 address)
-            * ``"http://[2001:db8::1234%25eth0]"`` or
-              ``"http://[2001:db8::1234-eth0]"``:
-              Use HTTP to port 5988 to host 2001:db8::1234 (a link-local IPv6
-              address) using zone identifier eth0
+    Parameters:
 
-          creds (:class:`py:tuple` of userid, password):
-            Credentials for HTTP authentication with the WBEM server, as a
-            tuple(userid, password), with:
+      methodname (str): Name of the export method
+        (e.g. 'ExportIndication').
 
-            * userid (str):
-              Userid for authenticating with the WBEM server.
+      **params (dict): Input parameters for the export method. Parameters
+        with a value of `None` are omitted.
 
-            * password (str):
-              Password for that userid.
+    Returns:
 
-            If `None`, the client will not generate ``Authorization`` headers
-            in the HTTP request. Otherwise, the client will generate an
-            ``Authorization`` header using HTTP Basic Authentication.
+      tuple of (request_data, cimxml_headers), with request_data being the
+      CIM-XML request string, and cimxml_headers being the list of CIM-XML
+      extension header fields for the request.
+    """
 
-            See :ref:`Authentication types` for an overview.
+    # Create HTTP extension headers for CIM-XML.
+    # Note: The two-step encoding required by DSP0200 will be performed in
+    # wbem_request().
 
-            This parameter will be ignored when targeting a WBEM listener.
+    cimxml_headers = [
+        ('CIMExport', 'MethodRequest'),
+        ('CIMExportMethod', methodname),
+    ]
 
-          default_namespace (str):
-            Default CIM namespace for this connection.
+    # Build XML request. The CIM-XML string is written directly, see
+    # _imethodcall_request().
 
-            Leading and trailing slash characters will be stripped. The lexical
-            case will be preserved.
+    out = [_REQUEST_START, '<SIMPLEEXPREQ><EXPMETHODCALL NAME="',
+           _cim_xml.escape_attr(methodname), '"']
 
-            If `None`, the default namespace of the connection will be set to
-            the built-in default namespace |DEFAULT_NAMESPACE|.
+    # Create parameter list
 
-            The default namespace of the connection is used if no namespace
-            or a namespace of `None` is specified for an operation.
+    plist = [x for x in params.items() if x[1] is not None]
+    if plist:
+        out.append('>')
+        for name, value in plist:
+            out.append(
+                f'<EXPPARAMVALUE NAME="{_cim_xml.escape_attr(name)}">')
+            _write_cimxml(out, value)
+            out.append('</EXPPARAMVALUE>')
+        out.append('</EXPMETHODCALL>')
+    else:
+        out.append('/>')
 
-            This parameter will be ignored when targeting a WBEM listener.
+    out.append('</SIMPLEEXPREQ>')
+    out.append(_REQUEST_END)
 
-          x509 (dict):
-            :term:`X.509` client certificate and key file to be presented
-            to the WBEM server or WBEM listener during the TLS/SSL handshake.
+    return ''.join(out), cimxml_headers
 
-            This parameter is ignored when HTTP is used.
 
-            If `None`, no client certificate is presented to the server or
-            listener, resulting in TLS/SSL 1-way authentication to be used.
+# Element names on the path from the root element to the IRETURNVALUE element
+# of a CIM-XML response.
+IRETURNVALUE_PATH = ('CIM', 'MESSAGE', 'SIMPLERSP', 'IMETHODRESPONSE',
+                     'IRETURNVALUE')
 
-            Otherwise, the client certificate is presented to the server or
-            listener, resulting in TLS/SSL 2-way authentication to be used.
-            This parameter must be a dictionary containing the following
-            two items:
 
-              * ``"cert_file"`` (str):
-                The file path of a file containing an :term:`X.509` client
-                certificate. Required. If the file does not exist,
-                :exc:`py:IOError` will be raised.
+def _check_rsp_envelope(tup_tree, rsp_name, methodresponse_name, methodname,
+                        conn_id):
+    """
+    Check the CIM, MESSAGE, simple response and method response elements of
+    a parsed CIM-XML response, and return the list of child elements of the
+    method response element.
+    """
 
-              * ``"key_file"`` (str):
-                The file path of a file containing the private key belonging to
-                the public key that is part of the :term:`X.509` certificate
-                file. Optional; if omitted or `None`, the private key must
-                be in the file specified with ``"cert_file"``. If specified
-                but the file does not exist, :exc:`py:IOError` will
-                be raised.
+    if tup_tree[0] != 'CIM':
+        raise CIMXMLParseError(
+            _format("Expecting CIM element, got {0}", tup_tree[0]),
+            conn_id=conn_id)
+    tup_tree = tup_tree[2]
+
+    if tup_tree[0] != 'MESSAGE':
+        raise CIMXMLParseError(
+            _format("Expecting MESSAGE element, got {0}", tup_tree[0]),
+            conn_id=conn_id)
+    tup_tree = tup_tree[2]
+
+    if tup_tree[0] != rsp_name:
+        raise CIMXMLParseError(
+            _format("Expecting {0} element, got {1}", rsp_name, tup_tree[0]),
+            conn_id=conn_id)
+    tup_tree = tup_tree[2]
+
+    if tup_tree[0] != methodresponse_name:
+        raise CIMXMLParseError(
+            _format("Expecting {0} element, got {1}",
+                    methodresponse_name, tup_tree[0]),
+            conn_id=conn_id)
+
+    if tup_tree[1]['NAME'] != methodname:
+        raise CIMXMLParseError(
+            _format("Expecting attribute NAME={0!A}, got {1!A}",
+                    methodname, tup_tree[1]['NAME']),
+            conn_id=conn_id)
+    return tup_tree[2]
+
+
+def _check_rsp_error(tup_tree, conn_id, request_data):
+    """
+    Raise CIMError if the list of child elements of a method response
+    element represents a failed operation.
+    """
+    if tup_tree and tup_tree[0][0] == 'ERROR':
+        # The operation failed
+        err = tup_tree[0]
+        code = int(err[1]['CODE'])
+        err_insts = err[2] or None  # List of CIMInstance objects
+        if 'DESCRIPTION' in err[1]:
+            desc = err[1]['DESCRIPTION']
+        else:
+            desc = _format("Error code {0}", err[1]['CODE'])
+        raise CIMError(
+            code, desc, instances=err_insts, conn_id=conn_id,
+            request_data=_request_xml(request_data))
 
-            The dictionary is copied.
 
-            See :ref:`Authentication types` for an overview.
+def _imethodcall_result(tup_tree, methodname, has_return_value,
+                        has_out_params, conn_id, request_data):
+    """
+    Check the parsed CIM-XML response of an intrinsic CIM-XML operation and
+    return its result.
 
-          ca_certs (str):
-            Selects the CA certificates (trusted certificates) for
-            verifying the X.509 server certificate returned by the WBEM server
-            or WBEM listener.
+    Parameters:
 
-            This parameter is ignored when HTTP is used or when the
-            `no_verification` parameter is set to disable verification.
+      tup_tree: The CIM element of the response, as parsed by TupleParser.
 
-            The parameter value must be one of:
+      methodname (str): Name of the CIM operation (e.g. 'GetInstance').
 
-            * :class:`py:int`: A path to a file containing one or more CA
-              certificates in PEM format. See the description of `CAfile` in
-              the OpenSSL `SSL_CTX_load_verify_locations`_ function for
-              details. If the file does not exist,
-              :exc:`py:IOError` will be raised.
+      has_return_value (bool): Indicates that the operation is defined with
+        a non-void return value.
 
-            * :class:`py:int`: A path to a directory with files each of which
-              contains one CA certificate in PEM format. See the description
-              of `CApath` in the OpenSSL `SSL_CTX_load_verify_locations`_
-              function for details. If the directory does not exist,
-              :exc:`py:IOError` will be raised.
+      has_out_params (bool): Indicates that the operation is defined with
+        one or more output parameters.
 
-            * `None` (default): Use the certificates provided by the
-              `certifi Python package`_. This package provides the certificates
-              from the `Mozilla Included CA Certificate List`_.
+      conn_id (:term:`connection id`): Connection ID to be used in
+        exceptions.
 
-            .. _`certifi Python package`: https://certifi.io/en/latest/
+      request_data: The CIM-XML request, to be used in exceptions.
 
-            .. _`Mozilla Included CA Certificate List`: https://wiki.mozilla.org/CA/Included_Certificates
+    Returns: See WBEMConnection._imethodcall().
+    """
 
-            .. _`SSL_CTX_load_verify_locations`: https://www.openssl.org/docs/man1.1.0/ssl/SSL_CTX_load_verify_locations.html
+    tup_tree = _check_rsp_envelope(
+        tup_tree, 'SIMPLERSP', 'IMETHODRESPONSE', methodname, conn_id)
 
-          no_verification (bool):
-            Disables verification of the X.509 server certificate returned by
-            the WBEM server or WBEM listener during TLS/SSL handshake, and
-            disables verification of the hostname.
+    # At this point tup_tree is a list of the child elements of
+    # IMETHODRESPONSE:
+    #   (ERROR | (IRETURNVALUE?, PARAMVALUE*)
+    # or an empty list if there were no child elements.
+    #
+    # More specifically, the following cases are possible for tup_tree:
+    # - operation failed: List with one ERROR node
+    # - operation succeeded:
+    #   - operation has void return type and no output parms
+    #     (e.g. DeleteInstance): Empty list.
+    #   - operation has non-void return type and no output parms
+    #     (e.g. CreateInstance): List with (zero or?) one IRETURNVALUE
+    #     node.
+    #   - operation has non-void return type and output parms
+    #     (e.g. OpenEnumerateInstances): List with (zero or?) one
+    #     IRETURNVALUE node and one unpacked PARAMVALUE node for each
+    #     output parameter.
+    #
+    # Note: DSP0200 is not entirely clear as to whether an empty result
+    # list must be represented as an empty IRETURNVALUE node vs.
+    # omitting it. Pywbem tolerates a missing IRETURNVALUE node.
+    #
+    # Note that there are no operations defined with a void return type but
+    # with output parameters.
 
-            If `True`, verification is disabled; otherwise, verification is
-            enabled.
+    # Check for failed operation
+    _check_rsp_error(tup_tree, conn_id, request_data)
 
-            This parameter is ignored when HTTP is used.
+    # At this point, we know the operation was successful.
 
-            Disabling the verification of the server certificate is insecure
-            and should be avoided!
+    return_value = False
+    out_param_names = []
+    for child_node in tup_tree:
+        if child_node[0] == 'IRETURNVALUE':
+            return_value = True
+        else:
+            # The PARAMVALUE nodes are already unpacked
+            out_param_names.append(child_node[0])
+
+    # Convert empty list to None
+    if not tup_tree:
+        tup_tree = None
+
+    # Check unexpected return value and output parameters
+    if not has_return_value and return_value:
+        raise CIMXMLParseError(
+            _format("Unexpected IRETURNVALUE child element of "
+                    "IMETHODRESPONSE for operation {0} which is defined as "
+                    "void", methodname),
+            conn_id=conn_id)
+    if not has_out_params and out_param_names:
+        raise CIMXMLParseError(
+            _format("Unexpected PARAMVALUE child element(s) of "
+                    "IMETHODRESPONSE for operation {0} which has no output "
+                    "parameters defined: {1!A}",
+                    methodname, out_param_names),
+            conn_id=conn_id)
+
+    # Missing return value and output parameters are checked by caller
+
+    return tup_tree
+
+
+def _methodcall_result(tup_tree, methodname, conn_id, request_data):
+    """
+    Check the parsed CIM-XML response of an extrinsic CIM-XML method call and
+    return its result.
 
-          timeout (:class:`py:int` or :class:`py:float`):
-            Timeout in seconds, for completing a CIM operation to a server or a
-            CIM indication delivery to a listener.
+    Parameters:
 
-            *New in pywbem 0.8.*
+      tup_tree: The CIM element of the response, as parsed by TupleParser.
 
-            If the CIM operation or CIM indication delivery could not be
-            completed within the specified timeout, :exc:`~pywbem.TimeoutError`
-            is raised.
+      methodname (str): CIM method name.
 
-            A value of `None` means that the connection uses the standard
-            timeout behavior of Python sockets, which can be between several
-            minutes and forever. Because this is somewhat unpredictable,
-            it is recommended to specify a value for the timeout.
+      conn_id (:term:`connection id`): Connection ID to be used in
+        exceptions.
 
-            A value of ``0`` means the timeout is very short, and does not
-            really make any sense.
+      request_data: The CIM-XML request, to be used in exceptions.
 
-            Note that not all situations can be handled within this timeout, so
-            for some issues, operations may take longer before raising an
-            exception.
+    Returns: See WBEMConnection._methodcall().
+    """
 
-          use_pull_operations (bool):
-            Controls the use of pull operations in any `Iter...()` methods.
+    tup_tree = _check_rsp_envelope(
+        tup_tree, 'SIMPLERSP', 'METHODRESPONSE', methodname, conn_id)
 
-            *New in pywbem 0.11 as experimental and finalized in 0.13.*
+    # At this point we have an optional RETURNVALUE and zero or
+    # more PARAMVALUE elements representing output parameters.
 
-            `None` means that the `Iter...()` methods will attempt a pull
-            operation first, and if the WBEM server does not support it, will
-            use a traditional operation from then on, on this connection.
-            This detection is performed for each pull operation separately, in
-            order to accomodate WBEM servers that support only some of the pull
-            operations. This will work on any WBEM server whether it supports
-            no, some, or all pull operations. Note that as per DSP0200, WBEM
-            servers need to return status code `CIM_ERR_NOT_SUPPORTED` if a
-            pull operation is not supported. Some WBEM servers return status
-            code `CIM_ERR_FAILED` in this case, which is treated by pywbem to
-            also mean that the pull operation is not supported.
+    _check_rsp_error(tup_tree, conn_id, request_data)
 
-            `True` means that the `Iter...()` methods will only use pull
-            operations. If the WBEM server does not support pull operations, a
-            :exc:`~pywbem.CIMError` with status code `CIM_ERR_NOT_SUPPORTED`
-            (or `CIM_ERR_FAILED` for some WBEM servers) will be raised.
+    # Convert optional RETURNVALUE into a Python object
+    returnvalue = None
 
-            `False` (default) means that the `Iter...()` methods will only use
-            traditional operations.
+    if tup_tree and tup_tree[0][0] == 'RETURNVALUE':
 
-            This parameter will be ignored when targeting a WBEM listener.
+        returnvalue = cimvalue(tup_tree[0][2], tup_tree[0][1]['PARAMTYPE'])
+        tup_tree = tup_tree[1:]
 
-          stats_enabled (bool):
-            Initial enablement status for maintaining statistics about the
-            WBEM operations executed via this connection.
+    # Convert zero or more PARAMVALUE elements into dictionary
 
-            *New in pywbem 0.11 as experimental, renamed from `enable_stats`
-            and finalized in 0.12.*
+    output_params = NocaseDict()
 
-            See the :ref:`WBEM operation statistics` section for details.
+    for p in tup_tree:
+        if p[1] == 'reference':
+            output_params[p[0]] = p[2]
+        else:
+            output_params[p[0]] = cimvalue(p[2], p[1])
 
-            This parameter will be ignored when targeting a WBEM listener.
+    return (returnvalue, output_params)
 
-          proxies (dict):
-            Dictionary with the URLs of HTTP or SOCKS proxies to use for
-            the connection to the WBEM server or WBEM listener.
 
-            *New in pywbem 1.0*
+def _iexportcall_result(tup_tree, methodname, conn_id, request_data):
+    """
+    Check the parsed CIM-XML response of a CIM-XML export method.
 
-            `None` (the default) causes the use of direct connections without
-            using a proxy.
+    Parameters:
 
-            An input dictionary is copied.
+      tup_tree: The CIM element of the response, as parsed by TupleParser.
 
-            This parameter is passed on to the `proxies` parameter of the
-            requests package. See the :ref:`Proxy support` section for details.
-        """  # noqa: E501
-        # pylint: enable=line-too-long
+      methodname (str): Name of the export method.
 
-        # Connection attributes
-        scheme, hostport, url = parse_url(url)
-        self._scheme = scheme
-        self._host = hostport
-        self._url = url
-        self._creds = creds  # tuple is immutable, so no copy
-        if x509 is not None:
-            if not isinstance(x509, dict):
-                raise TypeError(
-                    "The x509 parameter must be a dictionary but has type: "
-                    f"{type(x509)}")
-            try:
-                cert_file = x509['cert_file']
-            except KeyError:
-                raise ValueError(
-                    "The x509 parameter does not have the required key "
-                    f"'cert_file': {x509!r}")
-            if not isinstance(cert_file, str):
-                raise TypeError(
-                    "The 'cert_file' item in the x509 parameter must be a "
-                    f"string but has type: {type(cert_file)}")
-            key_file = x509.get('key_file', None)
-            if key_file is not None and \
-                    not isinstance(key_file, str):
-                raise TypeError(
-                    "The 'key_file' item in the x509 parameter must be a "
-                    f"string but has type: {type(key_file)}")
-        # x509 dict is mutable, so we copy it
-        self._x509 = None if x509 is None else dict(x509)
-        self._ca_certs = ca_certs
-        self._no_verification = no_verification
-        self._timeout = timeout
+      conn_id (:term:`connection id`): Connection ID to be used in
+        exceptions.
 
-        if proxies is not None:
-            if not isinstance(proxies, dict):
-                raise TypeError(
-                    "The proxies parameter must be a dictionary but has "
-                    f"type: {type(proxies)}")
-            self._proxies = proxies.copy()
-        else:
-            self._proxies = None
+      request_data: The CIM-XML request, to be used in exceptions.
+    """
 
-        self._set_default_namespace(default_namespace)
+    tup_tree = _check_rsp_envelope(
+        tup_tree, 'SIMPLEEXPRSP', 'EXPMETHODRESPONSE', methodname, conn_id)
 
-        # Requests session
-        self.session = requests.Session()
-        self.session.proxies = self.proxies
+    # At this point tup_tree is a list of the child elements of
+    # EXPMETHODRESPONSE:
+    #   (ERROR | IRETURNVALUE?)
+    # or an empty list if there were no child elements.
+    # Note that output parameters are not supported in DSP0201.
+    #
+    # More specifically, the following cases are possible for tup_tree:
+    # - operation failed: List with one ERROR node
+    # - operation succeeded:
+    #   - operation has void return type (e.g. ExportIndication):
+    #     Empty list.
+    #
+    # Note that DSP0200 does not define any export methods with non-void
+    # return type.
+
+    # Check for failed operation
+    _check_rsp_error(tup_tree, conn_id, request_data)
+
+    # At this point, we know the operation was successful.
+
+    if tup_tree:
+        # Since there are only export methods with a void return type, the
+        # tup_tree must be empty.
+        raise CIMXMLParseError(
+            _format("Unexpected {0} child element of EXPMETHODRESPONSE "
+                    "for export method {1} which is defined as void",
+                    tup_tree[0][0], methodname),
+            conn_id=conn_id)
+
+
+# Names of the WBEMConnection operation methods that can be added to a batch
+# (see WBEMConnection.batch()). These are the operations that are performed
+# with a single CIM-XML request. The pull operations and the Iter...()
+# methods are not supported, because they perform a sequence of requests
+# that depend on each other.
+BATCH_OPERATIONS = (
+    'EnumerateInstances', 'EnumerateInstanceNames', 'GetInstance',
+    'ModifyInstance', 'CreateInstance', 'DeleteInstance', 'Associators',
+    'AssociatorNames', 'References', 'ReferenceNames', 'InvokeMethod',
+    'ExecQuery', 'EnumerateClasses', 'EnumerateClassNames', 'GetClass',
+    'ModifyClass', 'CreateClass', 'DeleteClass', 'EnumerateQualifiers',
+    'GetQualifier', 'SetQualifier', 'DeleteQualifier',
+)
+
+# Default maximum number of individual requests of a batch that are performed
+# concurrently.
+DEFAULT_BATCH_MAX_WORKERS = 8
+
+# Value of the CIMError header field with which a WBEM server rejects a
+# multiple operation request (see DSP0200).
+_MULTIREQ_UNSUPPORTED = 'multiple-requests-unsupported'
+
+
+class _BatchCapture(Exception):
+    """
+    Raised by _imethodcall() and _methodcall() of a batch proxy connection
+    for stopping the operation method after its request has been captured.
+    """
 
-        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
-        if self.x509 is not None:
-            cert_file = self.x509['cert_file']
-            key_file = self.x509.get('key_file', None)
-            if not os.path.exists(cert_file):
-                raise OSError(
-                    "Client certificate file for TLS/SSL 2-way "
-                    f"authentication not found: {cert_file}")
-            if key_file is not None and not os.path.exists(key_file):
-                raise OSError(
-                    "Client key file for TLS/SSL 2-way "
-                    f"authentication not found: {key_file}")
-            cert = (cert_file, key_file)
-        else:
-            cert = None
-        self.session.cert = cert
+def _batch_proxy(conn, imethodcall, methodcall):
+    """
+    Return a shallow copy of a connection, for performing an operation method
+    of a batch with the _imethodcall() and _methodcall() methods replaced by
+    the specified functions.
 
-        # In addition to the possibilities below, the REQUESTS_CA_BUNDLE
-        # and CURL_CA_BUNDLE environment variables can be set to override the
-        # choice. The value is in both cases the path to a certificate file or
-        # certificate directory.
-        if self.no_verification:
-            verify = False
-        elif self.ca_certs is None:
-            # Use the certificates provided by the Python certifi package.
-            verify = True
-        elif isinstance(self.ca_certs, str):
-            # Use the specified path name (to file or directory).
-            if not os.path.exists(self.ca_certs):
-                raise OSError(
-                    "CA certificate file or directory not found: "
-                    f"{self.ca_certs}")
-            verify = self.ca_certs
-        else:
-            raise TypeError(
-                _format("The ca_certs parameter has invalid type: {0}",
-                        type(self.ca_certs)))
-        self.session.verify = verify
+    The copy shares the session with the connection, but has its own
+    operation state, disabled statistics and no operation recorders.
+    """
+    # pylint: disable=protected-access
+    proxy = copy.copy(conn)
+    proxy._op_state = _OperationState()
+    proxy._statistics = Statistics()
+    proxy._operation_recorders = []
+    proxy._imethodcall = imethodcall
+    proxy._methodcall = methodcall
+    return proxy
 
-        retry = urllib3.Retry(**RETRY_KWARGS)
 
-        # While it would be technically sufficient to set a retry transport
-        # adapter only for the scheme specified in the input URL, we are
-        # setting it for both schemes that have existing adapters, in order to
-        # avoid confusion for the human reader.
-        retry_adapter = requests.adapters.HTTPAdapter(max_retries=retry)
-        self.session.mount('http://', retry_adapter)
-        self.session.mount('https://', retry_adapter)
+def _prefetch_connection(conn):
+    """
+    Return a shallow copy of a connection, for performing the pull operations
+    of a prefetching Iter...() operation in a background thread.
+
+    The copy shares the session and statistics with the connection, but has
+    its own operation state and no operation recorders. Therefore, the pull
+    operations performed on the copy are included in the statistics of the
+    connection, but are not recorded by its operation recorders and are not
+    reflected in its last_* attributes.
+    """
+    # pylint: disable=protected-access
+    worker = copy.copy(conn)
+    worker._op_state = _OperationState()
+    worker._operation_recorders = []
+    return worker
 
-        # Saving last request and reply
-        self._debug = False
-        self._last_raw_request = None
-        self._last_raw_reply = None
-        self._last_request = None
-        self._last_request_xml_item = None
-        self._last_reply = None
-        self._last_reply_xml_item = None
 
-        # Time statistics
-        self._last_request_len = 0
-        self._last_reply_len = 0
+class IterQueryInstancesReturn:
+    """
+    The return data for
+    :meth:`~pywbem.WBEMConnection.IterQueryInstances`.
+    """
 
-        # control of operation recorders
-        self._operation_recorders = []
+    def __init__(self, instances, query_result_class=None):
+        """Save any query_result_class and instances returned"""
+        self._query_result_class = query_result_class
+        self.instances = instances
 
-        # Create the connection identifier for this WBEMConnection
-        # Includes class level counter and process pid
-        self.__class__._conn_counter += 1
-        # pylint: disable=protected-access
-        self._conn_id = f'{self.__class__._conn_counter}-{os.getpid()}'
+    @property
+    def query_result_class(self):
+        """
+        :class:`~pywbem.CIMClass`: The query result class, if requested
+        via the `ReturnQueryResultClass` parameter of
+        :meth:`~pywbem.WBEMConnection.IterQueryInstances`.
 
-        # Intent to use pull operations
-        self._use_pull_operations = use_pull_operations
-
-        # Actual status of using pull operations
-        self._use_enum_inst_pull_operations = use_pull_operations
-        self._use_enum_path_pull_operations = use_pull_operations
-        self._use_ref_inst_pull_operations = use_pull_operations
-        self._use_ref_path_pull_operations = use_pull_operations
-        self._use_assoc_inst_pull_operations = use_pull_operations
-        self._use_assoc_path_pull_operations = use_pull_operations
-        self._use_query_pull_operations = use_pull_operations
-
-        self._statistics = Statistics(stats_enabled)
-        self._last_operation_time = None
-        self._last_server_response_time = None
-
-        if self._activate_logging:
-            recorder = LogOperationRecorder(
-                conn_id=self.conn_id,
-                detail_levels=self._log_detail_levels)
-            self.add_operation_recorder(recorder)
-
-    def __enter__(self):
+        `None`, if a query result class was not requested.
         """
-        *New in pywbem 1.2.*
+        return self._query_result_class
 
-        Enter method when the class is used as a context manager.
-        Returns the connection object.
+    @property
+    def generator(self):
         """
-        return self
-
-    def __exit__(self, exc_type, exc_value, traceback):
+        :term:`py:generator` iterating :class:`~pywbem.CIMInstance`:
+        A generator object that iterates the CIM instances representing
+        the query result. These instances do not have an instance path
+        set.
         """
-        *New in pywbem 1.2.*
+        yield from self.instances
 
-        Exit method when the class is used as a context manager.
 
-        It closes the connection by calling
-        :meth:`~pywbem.WBEMConnection.close`.
-        """
-        self.close()
-        return False  # re-raise any exceptions
+class _WBEMConnectionMixin:
+    # pylint: disable=too-few-public-methods
+    """
+    Mixin class with the operation parameter processing and the response
+    parsing that are shared by :class:`~pywbem.WBEMConnection` and
+    :class:`~pywbem.AsyncWBEMConnection`.
 
-    def copy(self):
-        """
-        *New in pywbem 1.3.*
+    The using class must have the `conn_id` and `default_namespace`
+    attributes, and the attributes used by `_tuple_parser()`.
+    """
 
-        Return a deep copy of the object with internal state reset.
+    def _set_default_namespace(self, default_namespace):
+        """Internal setter function."""
+        if default_namespace is not None:
+            default_namespace = default_namespace.strip('/')
+        else:
+            default_namespace = DEFAULT_NAMESPACE
+        self._default_namespace = _ensure_unicode(default_namespace)
 
-        The user-specifiable attributes of the object are deep-copied, and all
-        other internal state (e.g. session, statistics, debug data) is reset.
+    def _set_response_validation(self, response_validation):
+        """Internal setter function."""
+        if response_validation not in VALIDATION_LEVELS:
+            raise ValueError(
+                _format("Invalid response_validation level {0!A} (allowed "
+                        "are {1!A})", response_validation, VALIDATION_LEVELS))
+        self._response_validation = response_validation
 
-        Any operation recorders on the original object are also deep-copied
-        while resetting their internal state (e.g. staged operations).
+    def _set_request_compression_threshold(self, threshold):
         """
-        cpy = WBEMConnection(
-            url=self.url,
-            creds=self.creds,
-            default_namespace=self.default_namespace,
-            x509=self.x509,
-            ca_certs=self.ca_certs,
-            no_verification=self.no_verification,
-            timeout=self.timeout,
-            use_pull_operations=self.use_pull_operations,
-            stats_enabled=self.stats_enabled,
-            proxies=self.proxies,
-        )  # init makes copies of mutable parameters
-        for rec in self.operation_recorders:
-            cpy.add_operation_recorder(rec.copy())
-        return cpy
-
-    @property
-    def url(self):
+        Internal setter function. Setting the threshold again also resets
+        the record of a WBEM server having rejected compressed requests.
         """
-        str: Normalized URL of the WBEM server or WBEM listener.
+        self._request_compression_threshold = threshold
+        self._request_compression_rejected = False
 
-        The scheme is in lower case and the default scheme (http) has been
-        applied. Default port numbers (5988 for http and 5989 for https) have
-        been applied. For IPv6 addresses, the host has been normalized to
-        RFC6874 URI syntax. Trailing path segments have been removed.
-
-        For examples, see the description of the same-named init
-        parameter of :class:`this class <pywbem.WBEMConnection>`.
-
-        *Changed in pywbem 1.0: The URL is now normalized.*
+    def _tuple_parser(self):
         """
-        return self._url
+        Return the parser for the CIM-XML response of an operation, in the
+        direct_decode mode, response_validation level, lazy_instances mode,
+        compact_arrays mode, instance_layouts mode and shared_qualifiers mode
+        of this connection.
 
-    @property
-    def scheme(self):
-        """
-        str: Normalized scheme of the URL of the WBEM server or WBEM listener,
-        for example 'http' or 'https'.
+        Returns:
 
-        The scheme is in lower case and the default scheme (http) has been
-        applied.
+          tuple of (tp, decoder), with tp being the TupleParser object for
+          parsing the tuple tree of the response, and decoder being the
+          decoder to be passed to the tupletree functions (the same object as
+          tp if direct_decode is enabled, or None otherwise).
+        """
+        instance_layouts = self._instance_layout_cache \
+            if self.instance_layouts else None
+        qualifier_cache = self._qualifier_cache \
+            if self.shared_qualifiers else None
+        if self.direct_decode:
+            decoder = TupleDecoder(self.conn_id, self.response_validation,
+                                   self.lazy_instances, self.compact_arrays,
+                                   instance_layouts, qualifier_cache)
+            return decoder, decoder
+        return TupleParser(self.conn_id, self.response_validation,
+                           self.lazy_instances, self.compact_arrays,
+                           instance_layouts, qualifier_cache), None
+
+    def _iparam_namespace_from_classname(self, namespace, ClassName):
+        # pylint: disable=invalid-name
+        """
+        Determine the namespace from a namespace parameter and a ClassName
+        parameter, for use as an argument to imethodcall().
 
-        *New in pywbem 1.0.*
+        If namespace is None and ClassName is a CIMClassName, the namespace
+        of ClassName is used. Otherwise, see
+        _iparam_namespace_from_namespace().
         """
-        return self._scheme
+        if namespace is None and isinstance(ClassName, CIMClassName):
+            namespace = ClassName.namespace
+        return self._iparam_namespace_from_namespace(namespace)
 
-    @property
-    def host(self):
+    def _iparam_namespace_from_namespace(self, namespace):
+        # pylint: disable=invalid-name,
         """
-        str: Normalized host and port number of the WBEM server or WBEM
-        listener, in the format ``host:port``.
+        Determine the namespace from a namespace parameter, for use as an
+        argument to imethodcall().
 
-        Default port numbers (5988 for http and 5989 for https) have been
-        applied. For IPv6 addresses, the host has been normalized to RFC6874
-        URI syntax.
+        Slashes at begin and end of namespace are stripped.
 
-        This value is used as the host portion of CIM namespace paths in
-        any objects returned from the WBEM server that did not specify a
-        CIM namespace path.
+        If namespace is None, the default namespace of the connection object
+        is used.
 
-        *New in pywbem 0.11.*
-        *Changed in pywbem 1.0: The host is now normalized and the port is
-        always present.*
-        """
-        return self._host
+        Returns:
+           str: The so determined namespace string.
 
-    @property
-    def creds(self):
+        Raises:
+          TypeError: namespace has an invalid type
         """
-        :class:`py:tuple`: Credentials for HTTP authentication with the WBEM
-        server.
-
-        For details, see the description of the same-named init
-        parameter of :class:`this class <pywbem.WBEMConnection>`.
+        if isinstance(namespace, str):
+            namespace = namespace.strip('/')
+        elif namespace is None:
+            pass
+        else:
+            raise TypeError(
+                _format("The 'namespace' parameter of the WBEMConnection "
+                        "operation has invalid type {0} (must be None, or a "
+                        "string)",
+                        type(namespace)))
+        if namespace is None:
+            namespace = self.default_namespace
+        return namespace
 
-        This attribute is ignored when targeting a WBEM listener.
+    def _iparam_namespace_from_objectname(self, objectname, arg_name):
+        # pylint: disable=invalid-name,
         """
-        return self._creds
+        Determine the namespace from an object name, for use as an argument to
+        imethodcall().
 
-    @property
-    def default_namespace(self):
-        """
-        str: Name of the CIM namespace to be used by default
-        (if no namespace is specified for an operation).
+        The objectname can be a class name string, a CIMClassName or
+        CIMInstanceName object, or `None`.
 
-        For details, see the description of the same-named init
-        parameter of :class:`this class <pywbem.WBEMConnection>`.
+        The default namespace of the connection object is used, if needed.
 
-        This attribute is settable.
+        Returns:
+           str: The so determined namespace string.
 
-        This attribute is ignored when targeting a WBEM listener.
+        Raises:
+          TypeError: objectname has an invalid type
         """
-        return self._default_namespace
-
-    @default_namespace.setter
-    def default_namespace(self, default_namespace):
-        """Setter method; for a description see the getter method."""
-        # pylint: disable=attribute-defined-outside-init
-        self._set_default_namespace(default_namespace)
 
-    def _set_default_namespace(self, default_namespace):
-        """Internal setter function."""
-        if default_namespace is not None:
-            default_namespace = default_namespace.strip('/')
+        if isinstance(objectname, (CIMClassName, CIMInstanceName)):
+            namespace = objectname.namespace
+        elif isinstance(objectname, str):
+            namespace = None
+        elif objectname is None:
+            namespace = objectname
         else:
-            default_namespace = DEFAULT_NAMESPACE
-        self._default_namespace = _ensure_unicode(default_namespace)
+            raise TypeError(
+                _format("The {0!A} parameter of the WBEMConnection operation "
+                        "has invalid type {1} (must be None, a string, a "
+                        "CIMClassName, or a CIMInstanceName)",
+                        arg_name, type(objectname)))
+        if namespace is None:
+            namespace = self.default_namespace
+        return namespace
 
-    @property
-    def x509(self):
+    @staticmethod
+    def _iparam_objectname(objectname, arg_name, required=False):
         """
-        :class:`py:dict`: :term:`X.509` client certificate and key file to be
-        presented to the WBEM server or WBEM listener during the TLS/SSL
-        handshake.
+        Convert an object name (i.e. class or instance name) specified in an
+        operation method into an object (i.e. CIMClassName or CIMInstanceName)
+        that can be passed to imethodcall().
 
-        For details, see the description of the same-named init
-        parameter of :class:`this class <pywbem.WBEMConnection>`.
-        """
-        return self._x509
+        Returns:
+          * CIMClassName without host and namespace, if objectname is string or
+            CIMClassName
+          * CIMInstanceName without host and namespace, if objectname is
+            CIMInstanceName
+          * None, if objectname is None (only if not required)
 
-    @property
-    def ca_certs(self):
+        Raises:
+          TypeError: objectname has an invalid type
         """
-        str: Selects the CA certificates (trusted certificates) for
-        verifying the X.509 server certificate returned by the WBEM server or
-        WBEM listener.
 
-        For details, see the description of the same-named init
-        parameter of :class:`this class <pywbem.WBEMConnection>`.
-        """
-        return self._ca_certs
+        if isinstance(objectname, (CIMClassName, CIMInstanceName)):
+            objectname = objectname.copy()
+            objectname.host = None
+            objectname.namespace = None
+        elif isinstance(objectname, str):
+            objectname = CIMClassName(objectname)
+        elif not required and objectname is None:
+            pass
+        else:
+            raise TypeError(
+                _format("The {0!A} parameter of the WBEMConnection operation "
+                        "has invalid type {1} (must be {2}a string, a "
+                        "CIMClassName, or a CIMInstanceName)",
+                        arg_name, type(objectname),
+                        "" if required else "None, "))
+        return objectname
 
-    @property
-    def no_verification(self):
+    @staticmethod
+    def _iparam_classname(classname, arg_name, required=False):
         """
-        bool: Boolean indicating that verifications are disabled
-        for this connection.
+        Convert a class name specified in an operation method into a
+        CIMClassName object, so that it can be passed to imethodcall().
 
-        For details, see the description of the same-named init
-        parameter of :class:`this class <pywbem.WBEMConnection>`.
-        """
-        return self._no_verification
+        Returns:
+          * CIMClassName without host and namespace, if classname is string or
+            CIMClassName
+          * None, if classname is None (only if not required)
 
-    @property
-    def timeout(self):
+        Raises:
+          TypeError: classname has an invalid type
         """
-        :class:`py:int` or :class:`py:float`: Timeout in seconds, for requests
-        sent to the server or listener.
 
-        *New in pywbem 0.8.*
-
-        *New in pywbem 1.3.*: This attribute is settable.
+        if isinstance(classname, CIMClassName):
+            classname = classname.copy()
+            classname.host = None
+            classname.namespace = None
+        elif isinstance(classname, str):
+            classname = CIMClassName(classname)
+        elif not required and classname is None:
+            pass
+        else:
+            raise TypeError(
+                _format("The {0!A} parameter of the WBEMConnection operation "
+                        "has invalid type {1} (must be {2}a string, or a "
+                        "CIMClassName)",
+                        arg_name, type(classname),
+                        "" if required else "None, "))
+        return classname
 
-        For details, see the description of the same-named init
-        parameter of :class:`this class <pywbem.WBEMConnection>`.
+    @staticmethod
+    def _iparam_instancename(instancename, arg_name, required=False):
         """
-        return self._timeout
+        Convert an instance name specified in an operation method into a
+        CIMInstanceName object that can be passed to imethodcall().
 
-    @timeout.setter
-    def timeout(self, timeout_value):
-        """Setter method; for a description see the getter method."""
-        self._timeout = timeout_value
+        Returns:
+          * CIMInstanceName without host and namespace, if instancename is
+            CIMInstanceName
+          * None, if instancename is None (only if not required)
 
-    @property
-    def operation_recorders(self):
+        Raises:
+          TypeError: instancename has an invalid type
         """
-        tuple of :class:`BaseOperationRecorder` subclass objects:
-          **Internal:** The operation recorders of this connection.
 
-        *New in pywbem 0.12 as experimental and made internal in 1.2.*
-        """
-        return tuple(self._operation_recorders)
+        if isinstance(instancename, CIMInstanceName):
+            instancename = instancename.copy()
+            instancename.host = None
+            instancename.namespace = None
+        elif not required and instancename is None:
+            pass
+        else:
+            raise TypeError(
+                _format("The {0!A} parameter of the WBEMConnection "
+                        "operation has invalid type {1} (must be {2}a "
+                        "string, or a CIMInstanceName)",
+                        arg_name, type(instancename),
+                        "" if required else "None, "))
+        return instancename
 
-    @property
-    def operation_recorder_enabled(self):
+    @staticmethod
+    def _iparam_class(klass, arg_name):
         """
-        bool: **Internal:** Enablement status for all operation
-        recorders of the connection.
-
-        *New in pywbem 0.11 as experimental and made internal in 1.2.*
+        Convert a CIMClass object specified in an operation method such that
+        it can be passed to imethodcall().
 
-        This is a writeable property; setting this property will change the
-        operation recorder enablement status accordingly for all operation
-        recorders of the connection.
+        Returns:
+          * CIMClass copy without path
+          * None
 
-        Reading this property returns `True` if one or more operation recorders
-        of the connection are enabled. Otherwise it returns `False`, also
-        when the connection has no operation recorders.
+        Raises:
+          TypeError: klass has an invalid type
         """
-        for recorder in self._operation_recorders:
-            if recorder.enabled:
-                return True
-        return False
 
-    @operation_recorder_enabled.setter
-    def operation_recorder_enabled(self, value):
-        """Setter method; for a description see the getter method."""
-        for recorder in self._operation_recorders:
-            if value:
-                recorder.enable()
-            else:
-                recorder.disable()
+        if isinstance(klass, CIMClass):
+            klass = klass.copy()
+            klass.path = None
+        elif klass is None:
+            pass
+        else:
+            raise TypeError(
+                _format("The {0!A} parameter of the WBEMConnection operation "
+                        "has invalid type {1} (must be None, or a CIMClass)",
+                        arg_name, type(klass)))
+        return klass
 
-    @property
-    def stats_enabled(self):
+    @staticmethod
+    def _iparam_instance(instance, arg_name, required=False):
         """
-        bool: Statistics enablement status for this connection.
-
-        *New in pywbem 0.11 as experimental and finalized in 0.12.*
+        Validate the type of a required CIMInstance typed parameter.
 
-        This is a writeable property; setting this property will change the
-        statistics enablement status accordingly.
+        Returns:
+          * CIMInstance copy
 
-        The statistics enablement status can also be set when creating a
-        connection, through the ``stats_enabled`` init argument of
-        :class:`~pywbem.WBEMConnection`.
+        Raises:
+          TypeError: instance has an invalid type
         """
-        return self.statistics.enabled
-
-    @stats_enabled.setter
-    def stats_enabled(self, value):
-        """Setter method; for a description see the getter method."""
-        if value:
-            self.statistics.enable()
-        else:
-            self.statistics.disable()
 
-    @property
-    def proxies(self):
-        """
-        :class:`py:dict`: Dictionary with the URLs of HTTP or SOCKS proxies to
-        use for the connection to the WBEM server or WBEM listener.
+        assert required is True  # For now, only required instances supported
 
-        *New in pywbem 1.0*
+        if isinstance(instance, CIMInstance):
+            return instance.copy()
 
-        This attribute is not settable. The dictionary content should not be
-        modified (and such modifications would have no effect).
+        raise TypeError(
+            _format("The {0!A} parameter of the WBEMConnection operation "
+                    "has invalid type {1} (must be a CIMInstance)",
+                    arg_name, type(instance)))
 
-        See the :ref:`Proxy support` section for details.
+    @staticmethod
+    def _iparam_qualifierdeclaration(qualifier, arg_name, required=False):
         """
-        return self._proxies
+        Validate the type of a CIMQualifierDeclaration object.
+        """
+        if isinstance(qualifier, CIMQualifierDeclaration):
+            pass
+        elif not required and qualifier is None:
+            pass
+        else:
+            raise TypeError(
+                _format("The {0!A} parameter of the WBEMConnection operation "
+                        "has invalid type {1} (must be {2}a "
+                        "CIMQualifierDeclaration)",
+                        arg_name, type(qualifier),
+                        "" if required else "None or "))
+        return qualifier
 
-    @property
-    def statistics(self):
+    @staticmethod
+    def _iparam_string(string_param, arg_name, required=False):
+        # pylint: disable=invalid-name,
         """
-        :class:`~pywbem.Statistics`: Statistics for this connection.
+        Validate a string typed operation parameter that may be None.
 
-        *New in pywbem 0.11 as experimental and finalized in 0.12.*
+        Returns:
+           The input string, or None (only if not required).
 
-        Statistics are disabled by default and can be enabled via the
-        ``stats_enabled`` argument when creating a connection object, or
-        later via modifying the :attr:`~pywbem.WBEMConnection.stats_enabled`
-        property on this connection object. See the
-        :ref:`WBEM operation statistics` section for more details.
+        Raises:
+          TypeError: string_param has an invalid type
         """
-        return self._statistics
+        if isinstance(string_param, str):
+            pass
+        elif not required and string_param is None:
+            pass
+        else:
+            raise TypeError(
+                _format("The {0!A} parameter of the WBEMConnection operation "
+                        "has invalid type {1} (must be None, or a string)",
+                        arg_name, type(string_param)))
+        return string_param
 
-    @property
-    def last_operation_time(self):
+    @staticmethod
+    def _iparam_positive_integer(integer_param, arg_name):
+        # pylint: disable=invalid-name,
         """
-        float: Elapsed time of the last operation that was executed
-        via this connection in seconds or `None`.
+        Validate a integer typed operation parameter that may be None, zero,
+        or a positive integer.
 
-        *New in pywbem 0.11 as experimental and finalized in 0.12.*
+        Returns:
+           The input integer, or None.
 
-        This time is available only subsequent to the execution of an operation
-        on this connection, and if the statistics are enabled on this
-        connection. Otherwise, the value is `None`.
+        Raises:
+          TypeError: integer_param has an invalid type
+          ValueError: integer param is LT 0
         """
-        return self._last_operation_time
+        if not isinstance(integer_param, (int, type(None))):
+            raise TypeError(
+                _format("The {0!A} parameter of the WBEMConnection operation "
+                        "has invalid type {1} (must be None, or an integer)",
+                        arg_name, type(integer_param)))
 
-    @property
-    def last_server_response_time(self):
-        """
-        float: Server-measured response time of the last request, or `None`.
+        if integer_param is not None and integer_param < 0:
+            raise ValueError(
+                _format("The {0!A} parameter must be >= 0 but is {0}",
+                        arg_name, integer_param))
+        return integer_param
 
-        *New in pywbem 0.11 as experimental and finalized in 0.12.*
+    @staticmethod
+    def _iparam_bool(bool_param, arg_name):
+        # pylint: disable=invalid-name,
+        """
+        Validate a bool typed operation parameter that may be None.
 
-        This time is optionally returned from the server in the HTTP header of
-        the response.
-        This time is available only subsequent to the execution of an operation
-        on this connection if the WBEMServerResponseTime is received from the
-        WBEM server. Otherwise, the value is `None`.
+        Returns:
+           The input boolean, or None.
 
-        When targeting a WBEM listener, the value is always `None`.
+        Raises:
+          TypeError: bool_param has an invalid type
         """
-        return self._last_server_response_time
+        if not isinstance(bool_param, (bool, type(None))):
+            raise TypeError(
+                _format("The {0!A} parameter of the WBEMConnection operation "
+                        "has invalid type {1} (must be None, or a bool)",
+                        arg_name, type(bool_param)))
+        return bool_param
+
+    def _get_rslt_params(self, result, namespace):
+        """
+        Common processing for pull results to separate end-of-sequence,
+        enum-context, and entities in IRETURNVALUE.
+
+        Returns tuple of entities in IRETURNVALUE, end_of_sequence,
+        and enumeration_context)
+        """
+        rtn_objects = []
+        end_of_sequence = False
+        enumeration_context = None
+        end_of_sequence_found = False  # flag True if found and valid value
+        enumeration_context_found = False  # flag True if ec tuple found
+        for p in result:
+            if p[0] == 'EndOfSequence':
+                if isinstance(p[2], str):
+                    p2 = p[2].lower()
+                    if p2 in ['true', 'false']:  # noqa: E125
+                        end_of_sequence = (p2 == 'true')
+                        end_of_sequence_found = True
+                    else:
+                        raise CIMXMLParseError(
+                            _format("EndOfSequence output parameter has an "
+                                    "invalid value: {0!A}", p[2]),
+                            conn_id=self.conn_id)
+
+            elif p[0] == 'EnumerationContext':
+                enumeration_context_found = True
+                if isinstance(p[2], str):
+                    enumeration_context = p[2]
+
+            elif p[0] == "IRETURNVALUE":
+                rtn_objects = p[2]
+
+        if not end_of_sequence_found and not enumeration_context_found:
+            raise CIMXMLParseError(
+                "Expected EndOfSequence or EnumerationContext output "
+                "parameter in open/pull response, but none received",
+                conn_id=self.conn_id)
+
+        if not end_of_sequence and enumeration_context is None:
+            raise CIMXMLParseError(
+                "Expected EnumerationContext output parameter because "
+                "EndOfSequence=False, but did not receive it.",
+                conn_id=self.conn_id)
+
+        # Drop enumeration_context if eos True
+        # Returns tuple of enumeration context and namespace
+        rtn_ctxt = None if end_of_sequence else (enumeration_context,
+                                                 namespace)
+        return (rtn_objects, end_of_sequence, rtn_ctxt)
+
+    def _get_returned_objects(self, result, ObjectName):
+        """
+        Support for Associators, References operations
+        Get returned objects and validate that the types correspond to the types
+        for Associators and References
+        """
+        objects = [] if result is None else [x[2] for x in result[0][2]]
+
+        if isinstance(ObjectName, CIMInstanceName):
+            # instance-level invocation
+            for instance in objects:
+                if not isinstance(instance, CIMInstance):
+                    raise CIMXMLParseError(
+                        _format("Expecting CIMInstance object in result "
+                                "list, got {0} object",
+                                instance.__class__.__name__),
+                        conn_id=self.conn_id)
+        else:
+            # class-level invocation
+            for classpath, klass in objects:
+                if not isinstance(classpath, CIMClassName) or \
+                        not isinstance(klass, CIMClass):
+                    raise CIMXMLParseError(
+                        _format("Expecting tuple (CIMClassName, CIMClass) "
+                                "in result list, got tuple ({0}, {1})",
+                                classpath.__class__.__name__,
+                                klass.__class__.__name__),
+                        conn_id=self.conn_id)
+        return objects
+
+    def _get_returned_objectnames(self, result, ObjectName):
+        """
+        Support for AssociatorNames, ReferenceNames operations
+
+        Get returned objects from results and validate that they are either
+        CIMInstanceName if the request was CIMInstanceName or
+        CIMClassName if the request was CIMClassName
+        """
+        objects = [] if result is None else [x[2] for x in result[0][2]]
+
+        if isinstance(ObjectName, CIMInstanceName):
+            # instance-level invocation
+            for instancepath in objects:
+                if not isinstance(instancepath, CIMInstanceName):
+                    raise CIMXMLParseError(
+                        _format("Expecting CIMInstanceName object in "
+                                "result list, got {0} object",
+                                instancepath.__class__.__name__),
+                        conn_id=self.conn_id)
+        else:
+            # class-level invocation
+            for classpath in objects:
+                if not isinstance(classpath, CIMClassName):
+                    raise CIMXMLParseError(
+                        _format("Expecting CIMClassName object in result "
+                                "list, got {0} object",
+                                classpath.__class__.__name__),
+                        conn_id=self.conn_id)
+        return objects
+
+    def _single_result(self, result):
+        """
+        Return the single object in the IRETURNVALUE element of an intrinsic
+        operation result, for operations that return exactly one object.
+        """
+        if result is None:
+            raise CIMXMLParseError(
+                "Expecting a child element below IMETHODRESPONSE, "
+                "got no child elements", conn_id=self.conn_id)
+        result = result[0][2]  # List of children of IRETURNVALUE
+
+        if not result:
+            raise CIMXMLParseError(
+                "Expecting a child element below IRETURNVALUE, "
+                "got no child elements", conn_id=self.conn_id)
+        return result[0]
+
+    def _query_result_class(self, result):
+        """
+        Return the QueryResultClass output parameter of an OpenQueryInstances
+        result, or raise CIMXMLParseError.
+        """
+        for p in result:
+            if p[0] == 'QueryResultClass':
+                class_obj = p[2]
+                if not isinstance(class_obj, CIMClass):
+                    raise CIMXMLParseError(
+                        _format("Expecting CIMClass object in "
+                                "QueryResultClass output parameter, got "
+                                "{0} object", class_obj.__class__.__name__),
+                        conn_id=self.conn_id)
+                return class_obj
+        raise CIMXMLParseError(
+            "QueryResultClass output parameter is missing",
+            conn_id=self.conn_id)
+
+    def _update_pull_property_filter(self, context, result_tuple,
+                                     property_filter):
+        """
+        Maintain the property filter of an enumeration session whose
+        PropertyList is enforced, after an open or pull operation returned
+        `result_tuple`.
+
+        The property filter is stored by the server context string, which may
+        change with every pull operation. `context` is the enumeration
+        context used by a pull operation, or `None` for an open operation.
+        """
+        if property_filter is None:
+            return
+        if context is not None:
+            self._pull_property_filters.pop(context[0], None)
+        if not result_tuple.eos:
+            self._pull_property_filters[result_tuple.context[0]] = \
+                property_filter
+
+
+class WBEMConnection(_WBEMConnectionMixin):
+    # pylint: disable=too-many-instance-attributes
+    """
+    A client's connection to a WBEM server or WBEM listener. This is the main
+    class of the WBEM client library API.
+
+    This class is used for communication with WBEM servers and WBEM listeners,
+    because the communication mechanisms are very similar. However, a
+    particular object of this class will connect to only one target which is
+    either a WBEM server or a WBEM listener, but never both.
+
+    When targeting a WBEM server, the connection object knows a default CIM
+    namespace, which is used when no namespace is specified on subsequent
+    WBEM operations (that support specifying namespaces). Thus, the connection
+    object can be used as a connection to multiple CIM namespaces on a
+    WBEM server (when the namespace is specified on subsequent operations),
+    or as a connection to only the default namespace (this allows omitting the
+    namespace on subsequent operations).
+
+    As usual in HTTP, there is no persistent TCP connection; the connectedness
+    provided by this class is only conceptual. That is, the creation of the
+    connection object does not cause any interaction with the WBEM server or
+    WBEM listener, and each subsequent WBEM operation performs an independent,
+    state-less HTTP/HTTPS request. However, usage of the `requests` Python
+    package causes the underlying resources such as sockets to be pooled.
+    A :meth:`~pywbem.WBEMConnection.close` method closes the underlying
+    session of the `requests` package, releasing any sockets.
+
+    The WBEMConnection class can also be used as a context manager, which
+    causes the connection to be closed at context manager exit:
+
+    .. code-block:: python
+
+        with WBEMConnection('https://myserver') as conn:
+            conn.EnumerateInstances('CIM_Foo')
+
+    The :class:`~pywbem.WBEMConnection` class supports connection through
+    HTTP and SOCKS proxies, by utilizing the proxy support in the `requests`
+    Python package.
+
+    After creating a :class:`~pywbem.WBEMConnection` object, various methods
+    may be called on the object, which cause WBEM operations to be issued to
+    the WBEM server or WBEM listener. See :ref:`WBEM operations` for a list of
+    these methods. Each operation method describes whether it can be used
+    with a WBEM server or with a WBEM listener.
+
+    CIM elements such as instances or classes are represented as Python objects
+    (see :ref:`CIM objects`). The caller does not need to know about the CIM-XML
+    encoding of CIM elements and protocol payload that is used underneath (It
+    should be possible to use a different WBEM protocol below this layer without
+    disturbing any callers).
+
+    The connection remembers the XML of the last request and last reply if
+    debugging is turned on via the :attr:`debug` attribute of the
+    connection object.
+    This may be useful in debugging: If a problem occurs, you can examine the
+    :attr:`last_request` and :attr:`last_reply` attributes of the
+    connection object.
+    These are the prettified XML of request and response, respectively.
+    The real request and response that are sent and received are available in
+    the :attr:`last_raw_request` and :attr:`last_raw_reply` attributes
+    of the connection object.
+
+    By default, a connection object must not be used by multiple threads at
+    the same time. If the :attr:`thread_safe` mode is enabled, the state of
+    the last operation (e.g. :attr:`last_raw_request` or
+    :attr:`last_operation_time`) is maintained separately for each thread, so
+    that a single connection object can be shared by multiple threads that
+    issue operations concurrently, using the same pool of HTTP connections to
+    the WBEM server or WBEM listener.
+
+    The methods of this class may raise the following exceptions:
+
+    * Exceptions indicating operational errors:
+
+      - :exc:`~pywbem.ConnectionError` - A connection with the WBEM server
+        or WBEM listener could not be established or broke down.
+
+      - :exc:`~pywbem.AuthError` - Authentication failed with the WBEM server.
+        This exception cannot occur when targeting a WBEM listener.
+
+      - :exc:`~pywbem.TimeoutError` - The WBEM server or WBEM listener did not
+        respond in time and the client timed out.
+
+      Such exceptions can typically be resolved by the client user or server
+      admin.
+
+    * Exceptions indicating server-side issues:
+
+      - :exc:`~pywbem.HTTPError` - HTTP error (bad status code) received from
+        WBEM server or WBEM listener.
+
+      - :exc:`~pywbem.CIMXMLParseError` - The response from the WBEM server
+        or WBEM listener cannot be parsed because it is invalid CIM-XML
+        (for example, a required attribute is missing on an XML element).
+
+      - :exc:`~pywbem.XMLParseError` - The response from the WBEM server or
+        WBEM listener cannot be parsed because it is invalid XML (for example,
+        invalid characters or UTF-8 sequences, or ill-formed XML).
+
+      Such exceptions nearly always indicate an issue with the implementation
+      of the WBEM server or WBEM listener.
+
+    * Other exceptions:
+
+      - :exc:`~pywbem.CIMError` - The WBEM server or WBEM listener returned an
+        error response  with a CIM status code.
+
+      Depending on the nature of the request, and on the CIM status code, the
+      reason may be a client user error (e.g. incorrect class name) or
+      a server side issue (e.g. some internal error in the server or listener).
+
+    * Exceptions indicating programming errors (in pywbem or by the user):
+
+      - :exc:`py:TypeError`
+      - :exc:`py:KeyError`
+      - :exc:`py:ValueError`
+      - :exc:`py:AttributeError`
+      - ... possibly others ...
+
+      Exceptions indicating programming errors should not happen. If you think
+      the reason such an exception is raised lies in pywbem,
+      `report a bug <https://github.com/pywbem/pywbem/issues>`_.
+    """
+
+    # Class level counter. Incremented at each WBEMConnection creation
+    # and used as part of WBEMConnection instance ID.
+    _conn_counter = 0
+
+    # Detail levels to be used for log operation recorders of any newly created
+    # WBEMConnection objects.
+    #   Key: Simple logger name (e.g. 'api')
+    #   Value: Detail level string from LOG_DETAIL_LEVELS.
+    _log_detail_levels = {}
+
+    # If True, logging will be activated for any newly created WBEMConnection
+    # objects.
+    _activate_logging = False
+
+    # State of the last operation, stored in the _op_state object of the
+    # connection. That object is a threading.local object in the thread_safe
+    # mode, so that each thread has its own state.
+    _last_raw_request = _StateAttribute('_op_state')
+    _last_raw_reply = _StateAttribute('_op_state')
+    _last_request = _StateAttribute('_op_state')
+    _last_request_xml_item = _StateAttribute('_op_state')
+    _last_reply = _StateAttribute('_op_state')
+    _last_reply_xml_item = _StateAttribute('_op_state')
+    _last_request_len = _StateAttribute('_op_state', 0)
+    _last_reply_len = _StateAttribute('_op_state', 0)
+    _last_operation_time = _StateAttribute('_op_state')
+    _last_server_response_time = _StateAttribute('_op_state')
+
+    def __init__(self, url, creds=None, default_namespace=None,
+                 x509=None, ca_certs=None,
+                 no_verification=False, timeout=DEFAULT_TIMEOUT,
+                 use_pull_operations=False,
+                 stats_enabled=False, proxies=None, stream_response=False,
+                 direct_decode=False, response_validation='strict',
+                 lazy_instances=False, compact_arrays=False,
+                 instance_layouts=False, shared_qualifiers=False,
+                 thread_safe=False, compression=True,
+                 request_compression_threshold=None, retain_raw_data=True):
+        # pylint: disable=line-too-long
+        """
+        Parameters:
+
+          url (str):
+            URL of the WBEM server or WBEM listener, in the format:
+
+              ``[{scheme}://]{host}[:{port}]``
+
+            Possibly present trailing path segments in the URL are ignored.
+
+            The following URL schemes are supported:
+
+            * ``http``: Causes HTTP to be used (default).
+            * ``https``: Causes HTTPS to be used.
+
+            The host can be specified in any of the usual formats:
+
+            * a short or fully qualified DNS hostname
+            * a literal (= dotted) IPv4 address
+            * a literal IPv6 address, formatted as defined in :term:`RFC3986`
+              with the extensions for zone identifiers as defined in
+              :term:`RFC6874`, supporting ``-`` (minus) for the delimiter
+              before the zone ID string, as an additional choice to ``%25``.
+
+            If no port is specified in the URL, it defaults to:
+
+            * Port 5988 for URL scheme ``http``
+            * Port 5989 for URL scheme ``https``
+
+            For WBEM listeners, the port usually different and should therefore
+            be specified in the URL.
+
+            Examples for some URL formats:
+
+            * ``"https://10.11.12.13:6989"``:
+              Use HTTPS to port 6989 on host 10.11.12.13
+            * ``"https://mysystem.acme.org"``:
+              Use HTTPS to port 5989 on host mysystem.acme.org
+            * ``"10.11.12.13"``:
+              Use HTTP to port 5988 on host 10.11.12.13
+            * ``"http://[2001:db8::1234]:15988"``:
+              Use HTTP to port 15988 on host 2001:db8::1234
+            * ``"http://[::ffff.10.11.12.13]"``:
+              Use HTTP to port 5988 on host ::ffff.10.11.12.13 (an
+              IPv4-mapped IPv6 address)
+            * ``"http://[2001:db8::1234%25eth0]"`` or
+              ``"http://[2001:db8::1234-eth0]"``:
+              Use HTTP to port 5988 to host 2001:db8::1234 (a link-local IPv6
+              address) using zone identifier eth0
+
+          creds (:class:`py:tuple` of userid, password):
+            Credentials for HTTP authentication with the WBEM server, as a
+            tuple(userid, password), with:
+
+            * userid (str):
+              Userid for authenticating with the WBEM server.
+
+            * password (str):
+              Password for that userid.
+
+            If `None`, the client will not generate ``Authorization`` headers
+            in the HTTP request. Otherwise, the client will generate an
+            ``Authorization`` header using HTTP Basic Authentication.
+
+            See :ref:`Authentication types` for an overview.
+
+            This parameter will be ignored when targeting a WBEM listener.
+
+          default_namespace (str):
+            Default CIM namespace for this connection.
+
+            Leading and trailing slash characters will be stripped. The lexical
+            case will be preserved.
+
+            If `None`, the default namespace of the connection will be set to
+            the built-in default namespace |DEFAULT_NAMESPACE|.
+
+            The default namespace of the connection is used if no namespace
+            or a namespace of `None` is specified for an operation.
+
+            This parameter will be ignored when targeting a WBEM listener.
+
+          x509 (dict):
+            :term:`X.509` client certificate and key file to be presented
+            to the WBEM server or WBEM listener during the TLS/SSL handshake.
+
+            This parameter is ignored when HTTP is used.
+
+            If `None`, no client certificate is presented to the server or
+            listener, resulting in TLS/SSL 1-way authentication to be used.
+
+            Otherwise, the client certificate is presented to the server or
+            listener, resulting in TLS/SSL 2-way authentication to be used.
+            This parameter must be a dictionary containing the following
+            two items:
+
+              * ``"cert_file"`` (str):
+                The file path of a file containing an :term:`X.509` client
+                certificate. Required. If the file does not exist,
+                :exc:`py:IOError` will be raised.
+
+              * ``"key_file"`` (str):
+                The file path of a file containing the private key belonging to
+                the public key that is part of the :term:`X.509` certificate
+                file. Optional; if omitted or `None`, the private key must
+                be in the file specified with ``"cert_file"``. If specified
+                but the file does not exist, :exc:`py:IOError` will
+                be raised.
+
+            The dictionary is copied.
+
+            See :ref:`Authentication types` for an overview.
+
+          ca_certs (str):
+            Selects the CA certificates (trusted certificates) for
+            verifying the X.509 server certificate returned by the WBEM server
+            or WBEM listener.
+
+            This parameter is ignored when HTTP is used or when the
+            `no_verification` parameter is set to disable verification.
+
+            The parameter value must be one of:
+
+            * :class:`py:int`: A path to a file containing one or more CA
+              certificates in PEM format. See the description of `CAfile` in
+              the OpenSSL `SSL_CTX_load_verify_locations`_ function for
+              details. If the file does not exist,
+              :exc:`py:IOError` will be raised.
+
+            * :class:`py:int`: A path to a directory with files each of which
+              contains one CA certificate in PEM format. See the description
+              of `CApath` in the OpenSSL `SSL_CTX_load_verify_locations`_
+              function for details. If the directory does not exist,
+              :exc:`py:IOError` will be raised.
+
+            * `None` (default): Use the certificates provided by the
+              `certifi Python package`_. This package provides the certificates
+              from the `Mozilla Included CA Certificate List`_.
+
+            .. _`certifi Python package`: https://certifi.io/en/latest/
+
+            .. _`Mozilla Included CA Certificate List`: https://wiki.mozilla.org/CA/Included_Certificates
+
+            .. _`SSL_CTX_load_verify_locations`: https://www.openssl.org/docs/man1.1.0/ssl/SSL_CTX_load_verify_locations.html
+
+          no_verification (bool):
+            Disables verification of the X.509 server certificate returned by
+            the WBEM server or WBEM listener during TLS/SSL handshake, and
+            disables verification of the hostname.
+
+            If `True`, verification is disabled; otherwise, verification is
+            enabled.
+
+            This parameter is ignored when HTTP is used.
+
+            Disabling the verification of the server certificate is insecure
+            and should be avoided!
+
+          timeout (:class:`py:int` or :class:`py:float`):
+            Timeout in seconds, for completing a CIM operation to a server or a
+            CIM indication delivery to a listener.
+
+            *New in pywbem 0.8.*
+
+            If the CIM operation or CIM indication delivery could not be
+            completed within the specified timeout, :exc:`~pywbem.TimeoutError`
+            is raised.
+
+            A value of `None` means that the connection uses the standard
+            timeout behavior of Python sockets, which can be between several
+            minutes and forever. Because this is somewhat unpredictable,
+            it is recommended to specify a value for the timeout.
+
+            A value of ``0`` means the timeout is very short, and does not
+            really make any sense.
+
+            Note that not all situations can be handled within this timeout, so
+            for some issues, operations may take longer before raising an
+            exception.
+
+          use_pull_operations (bool):
+            Controls the use of pull operations in any `Iter...()` methods.
+
+            *New in pywbem 0.11 as experimental and finalized in 0.13.*
+
+            `None` means that the `Iter...()` methods will attempt a pull
+            operation first, and if the WBEM server does not support it, will
+            use a traditional operation from then on, on this connection.
+            This detection is performed for each pull operation separately, in
+            order to accomodate WBEM servers that support only some of the pull
+            operations. This will work on any WBEM server whether it supports
+            no, some, or all pull operations. Note that as per DSP0200, WBEM
+            servers need to return status code `CIM_ERR_NOT_SUPPORTED` if a
+            pull operation is not supported. Some WBEM servers return status
+            code `CIM_ERR_FAILED` in this case, which is treated by pywbem to
+            also mean that the pull operation is not supported.
+
+            `True` means that the `Iter...()` methods will only use pull
+            operations. If the WBEM server does not support pull operations, a
+            :exc:`~pywbem.CIMError` with status code `CIM_ERR_NOT_SUPPORTED`
+            (or `CIM_ERR_FAILED` for some WBEM servers) will be raised.
+
+            `False` (default) means that the `Iter...()` methods will only use
+            traditional operations.
+
+            This parameter will be ignored when targeting a WBEM listener.
+
+          stats_enabled (bool):
+            Initial enablement status for maintaining statistics about the
+            WBEM operations executed via this connection.
+
+            *New in pywbem 0.11 as experimental, renamed from `enable_stats`
+            and finalized in 0.12.*
+
+            See the :ref:`WBEM operation statistics` section for details.
+
+            This parameter will be ignored when targeting a WBEM listener.
+
+          proxies (dict):
+            Dictionary with the URLs of HTTP or SOCKS proxies to use for
+            the connection to the WBEM server or WBEM listener.
+
+            *New in pywbem 1.0*
+
+            `None` (the default) causes the use of direct connections without
+            using a proxy.
+
+            An input dictionary is copied.
+
+            This parameter is passed on to the `proxies` parameter of the
+            requests package. See the :ref:`Proxy support` section for details.
+
+          stream_response (bool):
+            Controls whether the HTTP response body of CIM operations is
+            streamed into the XML parser.
+
+            *New in pywbem 1.10.*
+
+            `True` means that the HTTP response body is read from the network
+            in chunks, and each chunk is fed into an incremental XML parser as
+            soon as it has been received. This overlaps the transfer of the
+            response with parsing it, and bounds the peak memory usage to the
+            parser state plus the produced objects, since the complete
+            response body is never held in memory. In this mode, the
+            :attr:`~pywbem.WBEMConnection.last_raw_reply` attribute is only
+            set when debug is enabled, and :exc:`~pywbem.XMLParseError`
+            exceptions show only the chunk of the response in which the error
+            was detected.
+
+            In addition, when the
+            :meth:`~pywbem.WBEMConnection.IterEnumerateInstances` and
+            :meth:`~pywbem.WBEMConnection.IterEnumerateInstancePaths` methods
+            use the traditional EnumerateInstances and EnumerateInstanceNames
+            operations, they yield each instance or instance path as soon as
+            it has been received, instead of after the complete response has
+            been received. This allows consuming the instances of large
+            enumerations from WBEM servers that do not support pull operations
+            in constant memory. A failed operation is raised as an exception
+            only when the iteration reaches the end of the response.
+
+            `False` (default) means that the complete HTTP response body is
+            read before it is parsed.
+
+          direct_decode (bool):
+            Controls whether the CIM-XML responses of CIM operations are
+            decoded into CIM objects while they are parsed.
+
+            *New in pywbem 1.10.*
+
+            `True` means that each element of a response is decoded into its
+            CIM object (e.g. :class:`~pywbem.CIMInstance`) as soon as the XML
+            parser has reached the end of the element, and the parse tree of
+            the element is discarded. This avoids building the complete parse
+            tree of the response and walking it again afterwards, which
+            reduces the peak memory usage and the processing time for large
+            responses. The validation of the response and the exceptions that
+            are raised for invalid responses are the same as with `False`.
+
+            `False` (default) means that the complete parse tree of a
+            response is built first, and is then decoded into CIM objects.
+
+          response_validation (:term:`string`):
+            Validation level for the CIM-XML responses of CIM operations.
+
+            *New in pywbem 1.10.*
+
+            'strict' (default) means that each element of a response is
+            validated against the CIM-XML DTD for its name, attributes, child
+            elements and text content (with tolerances for known server
+            issues), and :exc:`~pywbem.CIMXMLParseError` is raised for
+            invalid elements.
+
+            'fast' means that only the element names and the presence of
+            required attributes are checked, which reduces the processing
+            time of large responses. Invalid responses may not be detected,
+            or may cause other exceptions or incorrect results, so this
+            should only be used with trusted WBEM servers that are known to
+            produce valid CIM-XML.
+
+          lazy_instances (bool):
+            Controls whether the properties of the CIM instances returned by
+            CIM operations are parsed only when they are accessed.
+
+            *New in pywbem 1.10.*
+
+            `True` means that the property elements of the instances in a
+            response are kept unparsed, and each property is parsed into its
+            :class:`~pywbem.CIMProperty` object (including the conversion of
+            its value and the parsing of embedded objects) when it is
+            accessed for the first time. This reduces the processing time for
+            instances with many properties of which only a few are used. The
+            returned instances behave like fully parsed instances, e.g. for
+            comparison, :meth:`~pywbem.CIMInstance.tomof` and
+            :meth:`~pywbem.CIMInstance.tocimxml`, which access all
+            properties. Invalid property elements in a response are reported
+            by raising :exc:`~pywbem.CIMXMLParseError` when the property is
+            accessed, instead of when the operation is performed.
+
+            `False` (default) means that all properties are parsed when the
+            response is parsed.
+
+          compact_arrays (bool):
+            Controls whether the array values of numeric CIM types in the
+            CIM objects returned by CIM operations are represented in a
+            compact form.
+
+            *New in pywbem 1.10.*
+
+            `True` means that the values of array properties, parameters and
+            qualifiers of numeric CIM types (e.g. uint64 or real32) are
+            :class:`~pywbem.CIMNumericArray` objects that store the values
+            in a typed buffer, instead of lists of CIM data type objects
+            (e.g. :class:`~pywbem.Uint64`). This reduces the memory used for
+            large numeric arrays and the processing time for parsing them.
+            :class:`~pywbem.CIMNumericArray` objects behave like lists of CIM
+            data type objects in most respects.
+
+            `False` (default) means that these array values are lists.
+
+          instance_layouts (bool):
+            Controls whether the CIM instances returned by CIM operations use
+            a shared :class:`~pywbem.CIMInstanceLayout`.
+
+            *New in pywbem 1.10.*
+
+            `True` means that the CIM instances in a response store only the
+            list of their property values, and share the names and other
+            attributes of their properties in a
+            :class:`~pywbem.CIMInstanceLayout` with all other returned
+            instances of the same class that have the same properties. This
+            reduces the memory used for holding a large number of instances.
+            The layouts are cached in the connection. Instances with
+            qualifiers on their properties do not use a layout. This mode
+            does not apply if :attr:`~pywbem.WBEMConnection.lazy_instances`
+            is enabled.
+
+            `False` (default) means that each returned CIM instance has its
+            own :class:`~pywbem.CIMProperty` objects.
+
+          shared_qualifiers (bool):
+            Controls whether equal qualifier values in the CIM objects
+            returned by CIM operations share one
+            :class:`~pywbem.CIMQualifier` object.
+
+            *New in pywbem 1.10.*
+
+            `True` means that the qualifiers of the returned CIM objects are
+            the shared qualifiers of the
+            :attr:`~pywbem.WBEMConnection.qualifier_cache` of the connection
+            (see :class:`~pywbem.CIMQualifierCache`), which cannot be
+            modified. This reduces the memory used for holding many CIM
+            classes that have been retrieved with their qualifiers (e.g. with
+            ``IncludeQualifiers=True``).
+
+            `False` (default) means that each returned CIM object has its own
+            :class:`~pywbem.CIMQualifier` objects.
+
+          thread_safe (bool):
+            Controls whether the connection can be used by multiple threads
+            at the same time.
+
+            *New in pywbem 1.10.*
+
+            `True` means that the state of the last operation that is
+            available in the `last_*` attributes of the connection (e.g.
+            :attr:`~pywbem.WBEMConnection.last_raw_reply` or
+            :attr:`~pywbem.WBEMConnection.last_operation_time`) is maintained
+            separately for each thread. The pool of HTTP connections to the
+            WBEM server or WBEM listener is shared by all threads, and keeps
+            up to 32 HTTP connections open for reuse.
+
+            `False` (default) means that the connection must not be used by
+            multiple threads at the same time.
+
+          compression (bool):
+            Controls whether compressed CIM-XML responses are accepted.
+
+            *New in pywbem 1.10.*
+
+            `True` (default) means that the requests include an
+            `Accept-Encoding` header field that allows the WBEM server or
+            WBEM listener to return the response compressed with the gzip or
+            deflate content coding. Compressed responses are decompressed
+            while they are being received, also in the
+            :attr:`~pywbem.WBEMConnection.stream_response` mode. The reply
+            lengths in :attr:`~pywbem.WBEMConnection.last_reply_len` and in
+            the statistics are those of the decompressed responses.
+
+            `False` means that the requests include an `Accept-Encoding`
+            header field that requests uncompressed responses.
+
+          request_compression_threshold (:term:`integer`):
+            Minimum size in Bytes of the HTTP body of a CIM-XML request for
+            the request to be sent compressed with the gzip content coding.
+
+            *New in pywbem 1.10.*
+
+            Compressing requests is useful for operations with large
+            requests (e.g. CreateInstance, ModifyInstance or InvokeMethod with
+            large input parameters) on slow network links. If the WBEM server
+            or WBEM listener rejects a compressed request, the request is
+            sent again uncompressed, and further requests on this connection
+            are sent uncompressed until this attribute is set again.
+
+            `None` (default) means that requests are not compressed.
+
+          retain_raw_data (bool):
+            Controls whether the raw CIM-XML request and response of the last
+            operation are retained in the connection after the operation has
+            succeeded.
+
+            *New in pywbem 1.10.*
+
+            `True` (default) means that they are retained and are available in
+            the :attr:`~pywbem.WBEMConnection.last_raw_request` and
+            :attr:`~pywbem.WBEMConnection.last_raw_reply` attributes until the
+            next operation is performed. This is the behavior of previous
+            versions of pywbem. It keeps the memory for the raw response of
+            the last operation (i.e. about the size of the response) allocated
+            between operations.
+
+            `False` means that they are released when the operation has
+            succeeded, unless debug is enabled (see
+            :attr:`~pywbem.WBEMConnection.debug`). In addition, the response
+            is received into a buffer that is allocated once with the size of
+            the response and that is handed to the XML parser without being
+            copied. This reduces the memory needed for operations with large
+            responses. The raw request and response remain available for
+            operations that fail during the HTTP exchange or the XML parsing
+            of the response, and in the `request_data` and `response_data`
+            attributes of the exceptions raised for them.
+
+        Raises:
+
+          ValueError: Invalid response_validation level.
+        """  # noqa: E501
+        # pylint: enable=line-too-long
+
+        # Connection attributes
+        scheme, hostport, url = parse_url(url)
+        self._scheme = scheme
+        self._host = hostport
+        self._url = url
+        self._creds = creds  # tuple is immutable, so no copy
+        if x509 is not None:
+            if not isinstance(x509, dict):
+                raise TypeError(
+                    "The x509 parameter must be a dictionary but has type: "
+                    f"{type(x509)}")
+            try:
+                cert_file = x509['cert_file']
+            except KeyError:
+                raise ValueError(
+                    "The x509 parameter does not have the required key "
+                    f"'cert_file': {x509!r}")
+            if not isinstance(cert_file, str):
+                raise TypeError(
+                    "The 'cert_file' item in the x509 parameter must be a "
+                    f"string but has type: {type(cert_file)}")
+            key_file = x509.get('key_file', None)
+            if key_file is not None and \
+                    not isinstance(key_file, str):
+                raise TypeError(
+                    "The 'key_file' item in the x509 parameter must be a "
+                    f"string but has type: {type(key_file)}")
+        # x509 dict is mutable, so we copy it
+        self._x509 = None if x509 is None else dict(x509)
+        self._ca_certs = ca_certs
+        self._no_verification = no_verification
+        self._timeout = timeout
+
+        if proxies is not None:
+            if not isinstance(proxies, dict):
+                raise TypeError(
+                    "The proxies parameter must be a dictionary but has "
+                    f"type: {type(proxies)}")
+            self._proxies = proxies.copy()
+        else:
+            self._proxies = None
+
+        self._stream_response = stream_response
+        self._direct_decode = direct_decode
+        self.response_validation = response_validation
+        self._lazy_instances = lazy_instances
+        self._compact_arrays = compact_arrays
+        self._instance_layouts = instance_layouts
+        self._shared_qualifiers = shared_qualifiers
+        self._compression = compression
+        self._request_compression_threshold = request_compression_threshold
+        self._retain_raw_data = retain_raw_data
+
+        # Cache of the shared CIMInstanceLayout objects for the
+        # instance_layouts mode
+        self._instance_layout_cache = {}
+
+        # Cache of the shared CIMQualifier objects for the shared_qualifiers
+        # mode
+        self._qualifier_cache = CIMQualifierCache()
+
+        # Property filters of open enumeration sessions whose PropertyList is
+        # enforced, by server context string
+        self._pull_property_filters = {}
+
+        self._set_default_namespace(default_namespace)
+
+        # Requests session
+        self.session = requests.Session()
+        self.session.proxies = self.proxies
+
+        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+        if self.x509 is not None:
+            cert_file = self.x509['cert_file']
+            key_file = self.x509.get('key_file', None)
+            if not os.path.exists(cert_file):
+                raise OSError(
+                    "Client certificate file for TLS/SSL 2-way "
+                    f"authentication not found: {cert_file}")
+            if key_file is not None and not os.path.exists(key_file):
+                raise OSError(
+                    "Client key file for TLS/SSL 2-way "
+                    f"authentication not found: {key_file}")
+            cert = (cert_file, key_file)
+        else:
+            cert = None
+        self.session.cert = cert
+
+        # In addition to the possibilities below, the REQUESTS_CA_BUNDLE
+        # and CURL_CA_BUNDLE environment variables can be set to override the
+        # choice. The value is in both cases the path to a certificate file or
+        # certificate directory.
+        if self.no_verification:
+            verify = False
+        elif self.ca_certs is None:
+            # Use the certificates provided by the Python certifi package.
+            verify = True
+        elif isinstance(self.ca_certs, str):
+            # Use the specified path name (to file or directory).
+            if not os.path.exists(self.ca_certs):
+                raise OSError(
+                    "CA certificate file or directory not found: "
+                    f"{self.ca_certs}")
+            verify = self.ca_certs
+        else:
+            raise TypeError(
+                _format("The ca_certs parameter has invalid type: {0}",
+                        type(self.ca_certs)))
+        self.session.verify = verify
+
+        # Saving last request and reply
+        self._debug = False
+        self._thread_safe = thread_safe
+        self._op_state = _new_operation_state(thread_safe)
+
+        self._mount_http_adapter()
+        self._last_raw_request = None
+        self._last_raw_reply = None
+        self._last_request = None
+        self._last_request_xml_item = None
+        self._last_reply = None
+        self._last_reply_xml_item = None
+
+        # Time statistics
+        self._last_request_len = 0
+        self._last_reply_len = 0
+
+        # control of operation recorders
+        self._operation_recorders = []
+
+        # Create the connection identifier for this WBEMConnection
+        # Includes class level counter and process pid
+        self.__class__._conn_counter += 1
+        # pylint: disable=protected-access
+        self._conn_id = f'{self.__class__._conn_counter}-{os.getpid()}'
+
+        # Intent to use pull operations
+        self._use_pull_operations = use_pull_operations
+
+        # Actual status of using pull operations. In thread_safe mode, this is
+        # shared by all threads, because it reflects the support of the WBEM
+        # server for pull operations.
+        self._use_enum_inst_pull_operations = use_pull_operations
+        self._use_enum_path_pull_operations = use_pull_operations
+        self._use_ref_inst_pull_operations = use_pull_operations
+        self._use_ref_path_pull_operations = use_pull_operations
+        self._use_assoc_inst_pull_operations = use_pull_operations
+        self._use_assoc_path_pull_operations = use_pull_operations
+        self._use_query_pull_operations = use_pull_operations
+
+        # Support of the WBEM server for multiple operation requests, or None
+        # if not yet determined. See _supports_multireq().
+        self._multireq_supported = None
+
+        # Indicates that the WBEM server has rejected a compressed request.
+        # In thread_safe mode, this is shared by all threads, like the status
+        # of using pull operations. See _cim_http.wbem_request().
+        self._request_compression_rejected = False
+
+        self._statistics = Statistics(stats_enabled)
+        self._last_operation_time = None
+        self._last_server_response_time = None
+
+        if self._activate_logging:
+            recorder = LogOperationRecorder(
+                conn_id=self.conn_id,
+                detail_levels=self._log_detail_levels)
+            self.add_operation_recorder(recorder)
+
+    def __enter__(self):
+        """
+        *New in pywbem 1.2.*
+
+        Enter method when the class is used as a context manager.
+        Returns the connection object.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        *New in pywbem 1.2.*
+
+        Exit method when the class is used as a context manager.
+
+        It closes the connection by calling
+        :meth:`~pywbem.WBEMConnection.close`.
+        """
+        self.close()
+        return False  # re-raise any exceptions
+
+    def copy(self):
+        """
+        *New in pywbem 1.3.*
+
+        Return a deep copy of the object with internal state reset.
+
+        The user-specifiable attributes of the object are deep-copied, and all
+        other internal state (e.g. session, statistics, debug data) is reset.
+
+        Any operation recorders on the original object are also deep-copied
+        while resetting their internal state (e.g. staged operations).
+        """
+        cpy = WBEMConnection(
+            url=self.url,
+            creds=self.creds,
+            default_namespace=self.default_namespace,
+            x509=self.x509,
+            ca_certs=self.ca_certs,
+            no_verification=self.no_verification,
+            timeout=self.timeout,
+            use_pull_operations=self.use_pull_operations,
+            stats_enabled=self.stats_enabled,
+            proxies=self.proxies,
+            stream_response=self.stream_response,
+            direct_decode=self.direct_decode,
+            response_validation=self.response_validation,
+            lazy_instances=self.lazy_instances,
+            compact_arrays=self.compact_arrays,
+            instance_layouts=self.instance_layouts,
+            shared_qualifiers=self.shared_qualifiers,
+            thread_safe=self.thread_safe,
+            compression=self.compression,
+            request_compression_threshold=self.request_compression_threshold,
+            retain_raw_data=self.retain_raw_data,
+        )  # init makes copies of mutable parameters
+        for rec in self.operation_recorders:
+            cpy.add_operation_recorder(rec.copy())
+        return cpy
+
+    @property
+    def url(self):
+        """
+        str: Normalized URL of the WBEM server or WBEM listener.
+
+        The scheme is in lower case and the default scheme (http) has been
+        applied. Default port numbers (5988 for http and 5989 for https) have
+        been applied. For IPv6 addresses, the host has been normalized to
+        RFC6874 URI syntax. Trailing path segments have been removed.
+
+        For examples, see the description of the same-named init
+        parameter of :class:`this class <pywbem.WBEMConnection>`.
+
+        *Changed in pywbem 1.0: The URL is now normalized.*
+        """
+        return self._url
+
+    @property
+    def scheme(self):
+        """
+        str: Normalized scheme of the URL of the WBEM server or WBEM listener,
+        for example 'http' or 'https'.
+
+        The scheme is in lower case and the default scheme (http) has been
+        applied.
+
+        *New in pywbem 1.0.*
+        """
+        return self._scheme
+
+    @property
+    def host(self):
+        """
+        str: Normalized host and port number of the WBEM server or WBEM
+        listener, in the format ``host:port``.
+
+        Default port numbers (5988 for http and 5989 for https) have been
+        applied. For IPv6 addresses, the host has been normalized to RFC6874
+        URI syntax.
+
+        This value is used as the host portion of CIM namespace paths in
+        any objects returned from the WBEM server that did not specify a
+        CIM namespace path.
+
+        *New in pywbem 0.11.*
+        *Changed in pywbem 1.0: The host is now normalized and the port is
+        always present.*
+        """
+        return self._host
+
+    @property
+    def creds(self):
+        """
+        :class:`py:tuple`: Credentials for HTTP authentication with the WBEM
+        server.
+
+        For details, see the description of the same-named init
+        parameter of :class:`this class <pywbem.WBEMConnection>`.
+
+        This attribute is ignored when targeting a WBEM listener.
+        """
+        return self._creds
+
+    @property
+    def default_namespace(self):
+        """
+        str: Name of the CIM namespace to be used by default
+        (if no namespace is specified for an operation).
+
+        For details, see the description of the same-named init
+        parameter of :class:`this class <pywbem.WBEMConnection>`.
+
+        This attribute is settable.
+
+        This attribute is ignored when targeting a WBEM listener.
+        """
+        return self._default_namespace
+
+    @default_namespace.setter
+    def default_namespace(self, default_namespace):
+        """Setter method; for a description see the getter method."""
+        # pylint: disable=attribute-defined-outside-init
+        self._set_default_namespace(default_namespace)
+
+    @property
+    def x509(self):
+        """
+        :class:`py:dict`: :term:`X.509` client certificate and key file to be
+        presented to the WBEM server or WBEM listener during the TLS/SSL
+        handshake.
+
+        For details, see the description of the same-named init
+        parameter of :class:`this class <pywbem.WBEMConnection>`.
+        """
+        return self._x509
+
+    @property
+    def ca_certs(self):
+        """
+        str: Selects the CA certificates (trusted certificates) for
+        verifying the X.509 server certificate returned by the WBEM server or
+        WBEM listener.
+
+        For details, see the description of the same-named init
+        parameter of :class:`this class <pywbem.WBEMConnection>`.
+        """
+        return self._ca_certs
+
+    @property
+    def no_verification(self):
+        """
+        bool: Boolean indicating that verifications are disabled
+        for this connection.
+
+        For details, see the description of the same-named init
+        parameter of :class:`this class <pywbem.WBEMConnection>`.
+        """
+        return self._no_verification
+
+    @property
+    def timeout(self):
+        """
+        :class:`py:int` or :class:`py:float`: Timeout in seconds, for requests
+        sent to the server or listener.
+
+        *New in pywbem 0.8.*
+
+        *New in pywbem 1.3.*: This attribute is settable.
+
+        For details, see the description of the same-named init
+        parameter of :class:`this class <pywbem.WBEMConnection>`.
+        """
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, timeout_value):
+        """Setter method; for a description see the getter method."""
+        self._timeout = timeout_value
+
+    @property
+    def operation_recorders(self):
+        """
+        tuple of :class:`BaseOperationRecorder` subclass objects:
+          **Internal:** The operation recorders of this connection.
+
+        *New in pywbem 0.12 as experimental and made internal in 1.2.*
+        """
+        return tuple(self._operation_recorders)
+
+    @property
+    def operation_recorder_enabled(self):
+        """
+        bool: **Internal:** Enablement status for all operation
+        recorders of the connection.
+
+        *New in pywbem 0.11 as experimental and made internal in 1.2.*
+
+        This is a writeable property; setting this property will change the
+        operation recorder enablement status accordingly for all operation
+        recorders of the connection.
+
+        Reading this property returns `True` if one or more operation recorders
+        of the connection are enabled. Otherwise it returns `False`, also
+        when the connection has no operation recorders.
+        """
+        for recorder in self._operation_recorders:
+            if recorder.enabled:
+                return True
+        return False
+
+    @operation_recorder_enabled.setter
+    def operation_recorder_enabled(self, value):
+        """Setter method; for a description see the getter method."""
+        for recorder in self._operation_recorders:
+            if value:
+                recorder.enable()
+            else:
+                recorder.disable()
+
+    @property
+    def stats_enabled(self):
+        """
+        bool: Statistics enablement status for this connection.
+
+        *New in pywbem 0.11 as experimental and finalized in 0.12.*
+
+        This is a writeable property; setting this property will change the
+        statistics enablement status accordingly.
+
+        The statistics enablement status can also be set when creating a
+        connection, through the ``stats_enabled`` init argument of
+        :class:`~pywbem.WBEMConnection`.
+        """
+        return self.statistics.enabled
+
+    @stats_enabled.setter
+    def stats_enabled(self, value):
+        """Setter method; for a description see the getter method."""
+        if value:
+            self.statistics.enable()
+        else:
+            self.statistics.disable()
 
     @property
-    def use_pull_operations(self):
+    def proxies(self):
         """
-        bool: Boolean indicating that the client should attempt
-        the use of pull operations in any `Iter...()` methods.
+        :class:`py:dict`: Dictionary with the URLs of HTTP or SOCKS proxies to
+        use for the connection to the WBEM server or WBEM listener.
 
-        *New in pywbem 0.11 as experimental and finalized in 0.13.*
+        *New in pywbem 1.0*
 
-        This property reflects the intent of the user as specified in the
-        same-named init parameter of
-        :class:`this class <pywbem.WBEMConnection>`. This property is not
-        updated with the status of actually using pull operations. That status
-        is maintained internally for each pull operation separately to
-        accomodate WBEM servers that support only some of the pull operations.
+        This attribute is not settable. The dictionary content should not be
+        modified (and such modifications would have no effect).
 
-        This attribute is ignored when targeting a WBEM listener.
+        See the :ref:`Proxy support` section for details.
         """
-        return self._use_pull_operations
+        return self._proxies
 
     @property
-    def debug(self):
+    def stream_response(self):
         """
-        bool: Boolean indicating that debug is enabled for this connection.
-
-        When enabled (value `True`), the prettified last CIM-XML request and
-        response will be stored in the following properties of this class:
-
-        * :attr:`~pywbem.WBEMConnection.last_request`
-        * :attr:`~pywbem.WBEMConnection.last_reply`
+        bool: Boolean indicating that the HTTP response body of CIM operations
+        is streamed into the XML parser.
 
-        When disabled (value `False`), these properties will be `None`.
-
-        This attribute is writeable. The initial value of this attribute is
-        `False`.
+        *New in pywbem 1.10.*
 
-        Note that the following properties will be set regardless of whether
-        debug is enabled for this connection:
+        This attribute is settable.
 
-        * :attr:`~pywbem.WBEMConnection.last_raw_request`
-        * :attr:`~pywbem.WBEMConnection.last_raw_reply`
-        * :attr:`~pywbem.WBEMConnection.last_request_len`
-        * :attr:`~pywbem.WBEMConnection.last_reply_len`
+        For details, see the description of the same-named init
+        parameter of :class:`this class <pywbem.WBEMConnection>`.
         """
-        return self._debug
+        return self._stream_response
 
-    @debug.setter
-    def debug(self, debug):
+    @stream_response.setter
+    def stream_response(self, stream_response):
         """Setter method; for a description see the getter method."""
-        self._debug = debug
+        self._stream_response = stream_response
 
     @property
-    def last_request(self):
+    def direct_decode(self):
         """
-        str: CIM-XML data of the last request sent to the WBEM server or WBEM
-        listener on this connection, formatted as prettified XML.
+        bool: Boolean indicating that the CIM-XML responses of CIM operations
+        are decoded into CIM objects while they are parsed.
 
-        This property is only set when debug is enabled (see
-        :attr:`~pywbem.WBEMConnection.debug`), and is `None` otherwise.
+        *New in pywbem 1.10.*
 
-        Prior to sending the very first request on this connection object,
-        this property is `None`.
-        """
-        if self._last_request_xml_item is None:
-            return None
-        if self._last_request is None:
-            self._last_request = _to_pretty_xml(self._last_request_xml_item)
-        return self._last_request
+        This attribute is settable.
 
-    @property
-    def last_raw_request(self):
+        For details, see the description of the same-named init
+        parameter of :class:`this class <pywbem.WBEMConnection>`.
         """
-        str: CIM-XML data of the last request sent to the WBEM server or WBEM
-        listener on this connection, formatted as it was sent (=raw).
+        return self._direct_decode
 
-        Prior to sending the very first request on this connection object,
-        this property is `None`.
-
-        As of pywbem 0.13, this property is set independently of whether debug
-        is enabled (see :attr:`~pywbem.WBEMConnection.debug`).
-        """
-        return self._last_raw_request
+    @direct_decode.setter
+    def direct_decode(self, direct_decode):
+        """Setter method; for a description see the getter method."""
+        self._direct_decode = direct_decode
 
     @property
-    def last_reply(self):
+    def response_validation(self):
         """
-        str: CIM-XML data of the last response received from the WBEM server or
-        WBEM listener on this connection, formatted as prettified XML.
+        :term:`string`: Validation level for the CIM-XML responses of CIM
+        operations ('strict' or 'fast').
 
-        This property is only set when debug is enabled (see
-        :attr:`~pywbem.WBEMConnection.debug`), and is `None` otherwise.
+        *New in pywbem 1.10.*
 
-        This property is set to `None` in the WBEM operation methods of this
-        class before the request is sent to the WBEM server or WBEM listener,
-        and is set to the prettified response when the response has been
-        received from the WBEM server or WBEM listener and XML parsed. If the
-        XML parsing fails, this property will be `None`, but the
-        :attr:`~pywbem.WBEMConnection.last_raw_reply` property does not depend
-        on XML parsing and will already have been set at that point.
+        This attribute is settable.
 
-        Prior to sending the very first request on this connection object,
-        this property is `None`.
+        For details, see the description of the same-named init
+        parameter of :class:`this class <pywbem.WBEMConnection>`.
         """
-        if self._last_reply_xml_item is None:
-            return None
-        if self._last_reply is None:
-            self._last_reply = _to_pretty_xml(self._last_reply_xml_item)
-        return self._last_reply
+        return self._response_validation
+
+    @response_validation.setter
+    def response_validation(self, response_validation):
+        """Setter method; for a description see the getter method."""
+        self._set_response_validation(response_validation)
 
     @property
-    def last_raw_reply(self):
+    def lazy_instances(self):
         """
-        str: CIM-XML data of the last response received from the WBEM server or
-        WBEM listener on this connection, formatted as it was received (=raw).
+        bool: Boolean indicating that the properties of the CIM instances
+        returned by CIM operations are parsed only when they are accessed.
 
-        This property is set to `None` in the WBEM operation methods of this
-        class before the request is sent to the WBEM server or WBEM listener,
-        and is set to the prettified response when the response has been
-        received from the WBEM server or WBEM listener, and before XML parsing
-        takes place.
+        *New in pywbem 1.10.*
 
-        Prior to sending the very first request on this connection object,
-        this property is `None`.
+        This attribute is settable.
 
-        As of pywbem 0.13, this property is set independently of whether debug
-        is enabled (see :attr:`~pywbem.WBEMConnection.debug`).
+        For details, see the description of the same-named init
+        parameter of :class:`this class <pywbem.WBEMConnection>`.
         """
-        return self._last_raw_reply
+        return self._lazy_instances
+
+    @lazy_instances.setter
+    def lazy_instances(self, lazy_instances):
+        """Setter method; for a description see the getter method."""
+        self._lazy_instances = lazy_instances
 
     @property
-    def last_request_len(self):
+    def compact_arrays(self):
         """
-        int: The size of the HTTP body in the CIM-XML request of the last
-        operation, in Bytes.
+        bool: Boolean indicating that the array values of numeric CIM types
+        in the CIM objects returned by CIM operations are
+        :class:`~pywbem.CIMNumericArray` objects.
 
-        Prior to sending the very first request on this connection object,
-        this property is 0.
+        *New in pywbem 1.10.*
 
-        This property is set independently of whether debug is enabled
-        (see :attr:`~pywbem.WBEMConnection.debug`).
+        This attribute is settable.
+
+        For details, see the description of the same-named init
+        parameter of :class:`this class <pywbem.WBEMConnection>`.
         """
-        return self._last_request_len
+        return self._compact_arrays
+
+    @compact_arrays.setter
+    def compact_arrays(self, compact_arrays):
+        """Setter method; for a description see the getter method."""
+        self._compact_arrays = compact_arrays
 
     @property
-    def last_reply_len(self):
+    def instance_layouts(self):
         """
-        int: The size of the HTTP body in the CIM-XML response of the last
-        operation, in Bytes.
+        bool: Boolean indicating that the CIM instances returned by CIM
+        operations use a shared :class:`~pywbem.CIMInstanceLayout`.
 
-        This property is set to 0 in the WBEM operation methods of this class
-        before the request is sent to the WBEM server or WBEM listener, and is
-        set to the size when the response has been received from the WBEM
-        server or WBEM listener, and before XML parsing takes place.
+        *New in pywbem 1.10.*
 
-        Prior to sending the very first request on this connection object,
-        this property is 0.
+        This attribute is settable.
 
-        This property is set independently of whether debug is enabled
-        (see :attr:`~pywbem.WBEMConnection.debug`).
+        For details, see the description of the same-named init
+        parameter of :class:`this class <pywbem.WBEMConnection>`.
         """
-        return self._last_reply_len
+        return self._instance_layouts
+
+    @instance_layouts.setter
+    def instance_layouts(self, instance_layouts):
+        """Setter method; for a description see the getter method."""
+        self._instance_layouts = instance_layouts
 
     @property
-    def conn_id(self):
+    def shared_qualifiers(self):
         """
-        :term:`connection id`: Connection ID (a unique ID) of this connection.
+        bool: Boolean indicating that equal qualifier values in the CIM
+        objects returned by CIM operations share one
+        :class:`~pywbem.CIMQualifier` object.
 
-        The value for this property is created when the
-        :class:`~pywbem.WBEMConnection` object is created and remains constant
-        throughout the life of that object.
+        *New in pywbem 1.10.*
 
-        The connection ID is part of each log entry output to uniquely identify
-        the :class:`~pywbem.WBEMConnection` object responsible for that log.
-        It also part of the logger name for the "pywbem.api" and "pywbem.http"
-        loggers that create log entries so that logging can be defined
-        separately for different connections.
-        """
-        return self._conn_id
+        This attribute is settable.
 
-    def __str__(self):
-        """
-        Return a short representation of the :class:`~pywbem.WBEMConnection`
-        object for human consumption.
+        For details, see the description of the same-named init
+        parameter of :class:`this class <pywbem.WBEMConnection>`.
         """
+        return self._shared_qualifiers
 
-        if isinstance(self.creds, tuple):
-            # tuple (userid, password) was specified
-            creds_repr = _format("({0!A}, ...)", self.creds[0])
-        else:
-            creds_repr = _format("{0!A}", self.creds)
-
-        return _format(
-            "WBEMConnection("
-            "url={s.url!A}, "
-            "creds={creds}, "
-            "default_namespace={s.default_namespace!A}, ...)",
-            s=self, creds=creds_repr)
+    @shared_qualifiers.setter
+    def shared_qualifiers(self, shared_qualifiers):
+        """Setter method; for a description see the getter method."""
+        self._shared_qualifiers = shared_qualifiers
 
-    def __repr__(self):
-        """
-        Return a representation of the :class:`~pywbem.WBEMConnection` object
-        with all attributes (except for the password in the
-        credentials) that is suitable for debugging.
+    @property
+    def thread_safe(self):
         """
+        bool: Boolean indicating that the connection can be used by multiple
+        threads at the same time.
 
-        if isinstance(self.creds, tuple):
-            # tuple (userid, password) was specified
-            creds_repr = _format("({0!A}, ...)", self.creds[0])
-        else:
-            creds_repr = _format("{0!A}", self.creds)
-        if self.x509:
-            x509_repr = "{" + ", ".join(
-                [_format("{0!A}: {1!A}", key, self.x509[key])
-                 for key in sorted(self.x509.keys())]) + "}"
-        else:
-            x509_repr = "None"
-
-        recorder_list = [recorder.__class__.__name__
-                         for recorder in self._operation_recorders]
+        *New in pywbem 1.10.*
 
-        return _format(
-            "WBEMConnection("
-            "url={s.url!A}, "
-            "creds={creds}, "
-            "conn_id={s.conn_id!A}, "
-            "default_namespace={s.default_namespace!A}, "
-            "x509={x509}, "
-            "ca_certs={s.ca_certs!A}, "
-            "no_verification={s.no_verification!A}, "
-            "timeout={s.timeout!A}, "
-            "use_pull_operations={s.use_pull_operations!A}, "
-            "stats_enabled={s.stats_enabled!A}, "
-            "recorders={recorders})",
-            s=self, creds=creds_repr, x509=x509_repr, recorders=recorder_list)
+        This attribute is settable. Setting it resets the state of the last
+        operation (e.g. :attr:`~pywbem.WBEMConnection.last_raw_reply`) and
+        must not be done while operations are in progress.
 
-    @classmethod
-    def _configure_logger(cls, simple_name, log_dest, detail_level,
-                          log_filename, connection, propagate):
-        # pylint: disable=line-too-long
+        For details, see the description of the same-named init
+        parameter of :class:`this class <pywbem.WBEMConnection>`.
         """
-        Configure the pywbem loggers and optionally activate WBEM connections
-        for logging and setting a log detail level.
-
-        Parameters:
+        return self._thread_safe
 
-          simple_name (str):
-            Simple name (ex. `'api'`) of the single pywbem logger this method
-            should affect, or `'all'` to affect all pywbem loggers.
+    @thread_safe.setter
+    def thread_safe(self, thread_safe):
+        """Setter method; for a description see the getter method."""
+        self._thread_safe = thread_safe
+        self._op_state = _new_operation_state(thread_safe)
+        if self.session is not None:
+            # Resize the pool of HTTP connections for the new mode
+            self.session.get_adapter('https://').close()
+            self._mount_http_adapter()
 
-            Must be one of the strings in
-            :data:`~pywbem._logging.LOGGER_SIMPLE_NAMES`.
+    @property
+    def compression(self):
+        """
+        bool: Boolean indicating that compressed CIM-XML responses are
+        accepted.
 
-          log_dest (str):
-            Log destination for the affected pywbem loggers, controlling the
-            configuration of its Python logging parameters (log handler,
-            message format, and log level).
+        *New in pywbem 1.10.*
 
-            If it is a :class:`py:str`, it must be one of the strings in
-            :data:`~pywbem._logging.LOG_DESTINATIONS` and the Python logging
-            parameters of the loggers will be configured accordingly for their
-            log handler, message format, and with a logging level of
-            :attr:`py:logging.DEBUG`.
+        This attribute is settable.
 
-            If `None`, the Python logging parameters of the loggers will not be
-            changed.
+        For details, see the description of the same-named init
+        parameter of :class:`this class <pywbem.WBEMConnection>`.
+        """
+        return self._compression
 
-          detail_level (:class:`py:str` or :class:`py:int` or `None`):
-            Detail level for the data in each log record that is generated by
-            the affected pywbem loggers.
+    @compression.setter
+    def compression(self, compression):
+        """Setter method; for a description see the getter method."""
+        self._compression = compression
 
-            If it is a :class:`py:str`, it must be one of the strings in
-            :data:`~pywbem._logging.LOG_DETAIL_LEVELS` and the loggers will
-            be configured for the corresponding detail level.
+    @property
+    def request_compression_threshold(self):
+        """
+        :term:`integer`: Minimum size in Bytes of the HTTP body of a CIM-XML
+        request for the request to be sent compressed, or `None` if requests
+        are not compressed.
 
-            If it is an :class:`py:int`, it defines the maximum size of the log
-            records created and the loggers will be configured to output all
-            available information up to that size.
+        *New in pywbem 1.10.*
 
-            If `None`, the detail level configuration will not be changed.
+        This attribute is settable.
 
-          log_filename (str):
-            Path name of the log file (required if the log destination is
-            `'file'`; otherwise ignored).
+        For details, see the description of the same-named init
+        parameter of :class:`this class <pywbem.WBEMConnection>`.
+        """
+        return self._request_compression_threshold
 
-          connection (:class:`~pywbem.WBEMConnection` or :class:`py:bool` or `None`):
-            WBEM connection(s) that should be affected for activation and for
-            setting the detail level.
+    @request_compression_threshold.setter
+    def request_compression_threshold(self, threshold):
+        """Setter method; for a description see the getter method."""
+        self._set_request_compression_threshold(threshold)
 
-            If it is a :class:`py:bool`, the information for activating logging
-            and for the detail level of the affected loggers will be stored for
-            use by subsequently created :class:`~pywbem.WBEMConnection` objects.
-            A value of `True` will store the information to activate the
-            connections for logging, and will add the detail level for the
-            logger(s).
-            A value of `False` will reset the stored information for future
-            connections to be deactivated with no detail levels specified.
+    @property
+    def retain_raw_data(self):
+        """
+        bool: Boolean indicating that the raw CIM-XML request and response of
+        the last operation are retained after the operation has succeeded.
 
-            If it is a :class:`~pywbem.WBEMConnection` object, logging will be
-            activated for that WBEM connection only and the specified detail
-            level will be set for the affected pywbem loggers on the
-            connection.
+        *New in pywbem 1.10.*
 
-            If `None`, no WBEM connection will be activated for logging.
+        This attribute is settable.
 
-        propagate (bool): Flag controlling whether the
-          affected pywbem logger should propagate log events to its
-          parent loggers.
+        For details, see the description of the same-named init
+        parameter of :class:`this class <pywbem.WBEMConnection>`.
+        """
+        return self._retain_raw_data
 
-        Raises:
+    @retain_raw_data.setter
+    def retain_raw_data(self, retain_raw_data):
+        """Setter method; for a description see the getter method."""
+        self._retain_raw_data = retain_raw_data
 
-          ValueError: Invalid input parameters (loggers remain unchanged).
-        """  # noqa: E501
-        # pylint: enable=line-too-long
+    @property
+    def qualifier_cache(self):
+        """
+        :class:`~pywbem.CIMQualifierCache`: The cache of the shared
+        qualifiers of this connection, that is used if the
+        :attr:`~pywbem.WBEMConnection.shared_qualifiers` mode is enabled.
 
-        # If name is all, create individual loggers for each log type
-        if simple_name == 'all':
-            for name in ['api', 'http']:
-                cls._configure_logger(name, log_dest=log_dest,
-                                      detail_level=detail_level,
-                                      log_filename=log_filename,
-                                      connection=connection,
-                                      propagate=propagate)
-            return
+        *New in pywbem 1.10.*
 
-        if simple_name == 'api':
-            logger_name = LOGGER_API_CALLS_NAME
-        elif simple_name == 'http':
-            logger_name = LOGGER_HTTP_NAME
-        else:
-            raise ValueError(
-                _format("Invalid simple logger name: {0!A}; must be one of: "
-                        "{1!A}", simple_name, LOGGER_SIMPLE_NAMES))
+        Its :attr:`~pywbem.CIMQualifierCache.saved_bytes` attribute reports
+        the memory that has been saved by sharing the qualifiers.
+        """
+        return self._qualifier_cache
 
-        if log_dest == 'off':
-            logger = logging.getLogger(logger_name)
-            for handler in logger.handlers:
-                handler.close()
-                logger.removeHandler(handler)
-            logger.setLevel(logging.ERROR)
-            logger.propagate = False
+    @property
+    def statistics(self):
+        """
+        :class:`~pywbem.Statistics`: Statistics for this connection.
 
-            # Don't activate logging on future connections
-            cls._reset_logging_config()
-        else:
-            detail_level = cls._configure_detail_level(detail_level)
-            handler = cls._configure_logger_handler(log_dest, log_filename)
-            cls._activate_logger(logger_name, simple_name, detail_level,
-                                 handler, connection, propagate)
+        *New in pywbem 0.11 as experimental and finalized in 0.12.*
 
-    @classmethod
-    def _configure_detail_level(cls, detail_level):
+        Statistics are disabled by default and can be enabled via the
+        ``stats_enabled`` argument when creating a connection object, or
+        later via modifying the :attr:`~pywbem.WBEMConnection.stats_enabled`
+        property on this connection object. See the
+        :ref:`WBEM operation statistics` section for more details.
         """
-        Validate the `detail_level` parameter and return it.
+        return self._statistics
 
-        This accepts a string or integer for `detail_level`.
+    @property
+    def last_operation_time(self):
         """
-        # process detail_level
-        if isinstance(detail_level, str):
-            if detail_level not in LOG_DETAIL_LEVELS:
-                raise ValueError(
-                    _format("Invalid log detail level string: {0!A}; must be "
-                            "one of: {1!A}", detail_level, LOG_DETAIL_LEVELS))
-        elif isinstance(detail_level, int):
-            if detail_level < 0:
-                raise ValueError(
-                    _format("Invalid log detail level integer: {0}; must be a "
-                            "positive integer.", detail_level))
+        float: Elapsed time of the last operation that was executed
+        via this connection in seconds or `None`.
 
-        elif detail_level is None:
-            detail_level = DEFAULT_LOG_DETAIL_LEVEL
-        else:
-            raise ValueError(
-                _format("Invalid log detail level: {0!A}; must be one of: "
-                        "{1!A}, or a positive integer",
-                        detail_level, LOG_DETAIL_LEVELS))
-        return detail_level
+        *New in pywbem 0.11 as experimental and finalized in 0.12.*
 
-    @classmethod
-    def _configure_logger_handler(cls, log_dest, log_filename):
-        """
-        Return a logging handler for the specified `log_dest`, or `None` if
-        `log_dest` is `None`.
+        This time is available only subsequent to the execution of an operation
+        on this connection, and if the statistics are enabled on this
+        connection. Otherwise, the value is `None`.
         """
+        return self._last_operation_time
 
-        if log_dest is None:
-            return None
+    @property
+    def last_server_response_time(self):
+        """
+        float: Server-measured response time of the last request, or `None`.
 
-        msg_format = '%(asctime)s-%(name)s-%(message)s'
+        *New in pywbem 0.11 as experimental and finalized in 0.12.*
 
-        if log_dest == 'stderr':
-            # Note: sys.stderr is the default stream for StreamHandler
-            handler = logging.StreamHandler()
-            handler.setFormatter(logging.Formatter(msg_format))
-        elif log_dest == 'file':
-            if not log_filename:
-                raise ValueError("Log filename is required if log destination "
-                                 "is 'file'")
-            handler = logging.FileHandler(log_filename, encoding="UTF-8")
-            handler.setFormatter(logging.Formatter(msg_format))
-        else:
-            raise ValueError(
-                _format("Invalid log destination: {0!A}; Must be one of: "
-                        "{1!A}", log_dest, LOG_DESTINATIONS))
+        This time is optionally returned from the server in the HTTP header of
+        the response.
+        This time is available only subsequent to the execution of an operation
+        on this connection if the WBEMServerResponseTime is received from the
+        WBEM server. Otherwise, the value is `None`.
 
-        return handler
+        When targeting a WBEM listener, the value is always `None`.
+        """
+        return self._last_server_response_time
 
-    @classmethod
-    def _activate_logger(cls, logger_name, simple_name, detail_level, handler,
-                         connection, propagate):
+    @property
+    def use_pull_operations(self):
         """
-        Configure the specified logger, and activate logging and set detail
-        level for connections.
+        bool: Boolean indicating that the client should attempt
+        the use of pull operations in any `Iter...()` methods.
 
-        The specified logger is always a single pywbem logger; the simple
-        logger name 'all' has already been resolved by the caller into
-        multiple calls to this method.
+        *New in pywbem 0.11 as experimental and finalized in 0.13.*
 
-        The 'handler' parameter controls logger configuration:
-        * If None, nothing is done.
-        * If a Handler object, the specified logger gets its handlers replaced
-          with the new handler, logging level DEBUG is set, and the
-          `propagate` attribute of the logger is set according to the
-          `propagate` parameter.
+        This property reflects the intent of the user as specified in the
+        same-named init parameter of
+        :class:`this class <pywbem.WBEMConnection>`. This property is not
+        updated with the status of actually using pull operations. That status
+        is maintained internally for each pull operation separately to
+        accomodate WBEM servers that support only some of the pull operations.
 
-        The 'connection' parameter controls activation and setting of the
-        detail level:
-        * If None, nothing is done.
-        * If bool=True, log activation and log detail information is stored for
-          use by future connections in class variables of WBEMConnection.
-        * If bool=False, log activation and log detail information is reset.
-        * If a WBEMConnection object, logging is activated and detail level is
-          set immediately for that connection.
+        This attribute is ignored when targeting a WBEM listener.
         """
+        return self._use_pull_operations
 
-        if handler is not None:
-            assert isinstance(handler, logging.Handler)
-
-            # Replace existing handlers of the specified logger (e.g. from
-            # previous calls) by the specified handler
-
-            logger = logging.getLogger(logger_name)
-            for hdlr in logger.handlers:
-                logger.removeHandler(hdlr)
-            logger.addHandler(handler)
+    @property
+    def debug(self):
+        """
+        bool: Boolean indicating that debug is enabled for this connection.
 
-            logger.setLevel(logging.DEBUG)
-            logger.propagate = propagate
+        When enabled (value `True`), the prettified last CIM-XML request and
+        response will be stored in the following properties of this class:
 
-        if connection is not None:
-            if isinstance(connection, bool):
-                if connection:
-                    # Store the activation and detail level information for
-                    # future connections. This information is used in the init
-                    # method of WBEMConnection to activate logging at that
-                    # point.
-                    cls._activate_logging = True
-                    cls._log_detail_levels[simple_name] = detail_level
-                else:
-                    cls._reset_logging_config()
-            else:
-                assert isinstance(connection, WBEMConnection)
+        * :attr:`~pywbem.WBEMConnection.last_request`
+        * :attr:`~pywbem.WBEMConnection.last_reply`
 
-                # Activate logging for this existing connection by ensuring
-                # the connection has a log recorder
+        When disabled (value `False`), these properties will be `None`.
 
-                recorder_found = False
-                # pylint: disable=protected-access
-                for recorder in connection._operation_recorders:
-                    if isinstance(recorder, LogOperationRecorder):
-                        recorder_found = True
-                        assert recorder._conn_id  # validate recorder staged
-                        break
+        This attribute is writeable. The initial value of this attribute is
+        `False`.
 
-                # Create new recorder object if not found in connection
-                if not recorder_found:
-                    recorder = LogOperationRecorder(conn_id=connection.conn_id)
+        Note that the following properties will be set regardless of whether
+        debug is enabled for this connection:
 
-                # Add the log detail level for this logger to the log recorder
-                # of this connection
-                detail_levels = recorder.detail_levels.copy()
-                detail_levels[simple_name] = detail_level
-                recorder.set_detail_level(detail_levels)
+        * :attr:`~pywbem.WBEMConnection.last_raw_request`
+        * :attr:`~pywbem.WBEMConnection.last_raw_reply`
+        * :attr:`~pywbem.WBEMConnection.last_request_len`
+        * :attr:`~pywbem.WBEMConnection.last_reply_len`
 
-                if not recorder_found:
-                    # This call must be made after the detail levels of the
-                    # recorder have been set, because that data is used
-                    # for recording the WBEM connection information.
-                    connection.add_operation_recorder(recorder)
+        The first two of them are retained after a successful operation only
+        if debug is enabled or :attr:`~pywbem.WBEMConnection.retain_raw_data`
+        is `True`.
+        """
+        return self._debug
 
-    def _verify_open(self):
+    @debug.setter
+    def debug(self, debug):
+        """Setter method; for a description see the getter method."""
+        self._debug = debug
+
+    @property
+    def last_request(self):
         """
-        Verify that this connection is open and raise ConnectionError otherwise.
+        str: CIM-XML data of the last request sent to the WBEM server or WBEM
+        listener on this connection, formatted as prettified XML.
 
-        Raises:
-          :exc:`~pywbem.ConnectionError`: WBEMConnection is closed
+        This property is only set when debug is enabled (see
+        :attr:`~pywbem.WBEMConnection.debug`), and is `None` otherwise.
+
+        Prior to sending the very first request on this connection object,
+        this property is `None`.
         """
-        if self.session is None:
-            raise ConnectionError(
-                "WBEMConnection is closed",
-                conn_id=self.conn_id)
+        if self._last_request_xml_item is None:
+            return None
+        if self._last_request is None:
+            # The request string has no XML declaration, so it is prettified
+            # from its root element.
+            self._last_request = _to_pretty_xml(minidom.parseString(
+                self._last_request_xml_item).documentElement)
+        return self._last_request
 
-    def close(self):
+    @property
+    def last_raw_request(self):
         """
-        Closes this connection.
+        str: CIM-XML data of the last request sent to the WBEM server or WBEM
+        listener on this connection, formatted as it was sent (=raw).
 
-        *New in pywbem 1.2.*
+        Prior to sending the very first request on this connection object,
+        this property is `None`.
 
-        This method closes the session in the underlying requests package,
-        causing it to close any sockets it has pooled and marks the connection
-        closed. Any subsequent WBEM connection operation requests will generate
-        an exception.
+        As of pywbem 0.13, this property is set independently of whether debug
+        is enabled (see :attr:`~pywbem.WBEMConnection.debug`).
 
-        Raises:
-          :exc:`~pywbem.ConnectionError`: WBEMConnection is closed
+        As of pywbem 1.10, this property is reset to `None` after a successful
+        operation if :attr:`~pywbem.WBEMConnection.retain_raw_data` is `False`
+        and debug is not enabled.
         """
-        self._verify_open()
-        self.session.close()
-        self.session = None  # Indicates closed state
+        return _request_xml(self._last_raw_request)
 
-    def add_operation_recorder(self, operation_recorder):
-        # pylint: disable=line-too-long
+    @property
+    def last_reply(self):
         """
-        **Internal:** Add an operation recorder to this connection.
+        str: CIM-XML data of the last response received from the WBEM server or
+        WBEM listener on this connection, formatted as prettified XML.
 
-        *New in pywbem 0.12 as experimental and made internal in 1.2.*
+        This property is only set when debug is enabled (see
+        :attr:`~pywbem.WBEMConnection.debug`), and is `None` otherwise.
 
-        If the connection already has a recorder with the same class, the
-        request to add the recorder is ignored.
+        This property is set to `None` in the WBEM operation methods of this
+        class before the request is sent to the WBEM server or WBEM listener,
+        and is set to the prettified response when the response has been
+        received from the WBEM server or WBEM listener and XML parsed. If the
+        XML parsing fails, this property will be `None`, but the
+        :attr:`~pywbem.WBEMConnection.last_raw_reply` property does not depend
+        on XML parsing and will already have been set at that point.
 
-        Parameters:
+        Prior to sending the very first request on this connection object,
+        this property is `None`.
+        """
+        if self._last_reply_xml_item is None:
+            return None
+        if self._last_reply is None:
+            self._last_reply = _to_pretty_xml(self._last_reply_xml_item)
+        return self._last_reply
 
-          operation_recorder (:class:`~pywbem.BaseOperationRecorder` subclass object):
-            The operation recorder to be added. Must not be `None`.
+    @property
+    def last_raw_reply(self):
+        """
+        str: CIM-XML data of the last response received from the WBEM server or
+        WBEM listener on this connection, formatted as it was received (=raw).
 
-        Raises:
+        This property is set to `None` in the WBEM operation methods of this
+        class before the request is sent to the WBEM server or WBEM listener,
+        and is set to the prettified response when the response has been
+        received from the WBEM server or WBEM listener, and before XML parsing
+        takes place.
 
-          ValueError: Operation recorder must not be `None`.
-          ValueError: Cannot add the same recorder class multiple times.
-        """  # noqa: E501
-        if operation_recorder is None:
-            raise ValueError("Invalid value None for new operation recorder")
+        Prior to sending the very first request on this connection object,
+        this property is `None`.
 
-        for recorder in self._operation_recorders:
-            # pylint: disable=unidiomatic-typecheck
-            if type(recorder) is type(operation_recorder):
-                raise ValueError(
-                    _format("Cannot add the same operation recorder class {0} "
-                            "multiple times to the same connection",
-                            type(operation_recorder)))
-        self._operation_recorders.append(operation_recorder)
+        As of pywbem 0.13, this property is set independently of whether debug
+        is enabled (see :attr:`~pywbem.WBEMConnection.debug`). The exception
+        is the streaming mode (see
+        :attr:`~pywbem.WBEMConnection.stream_response`), where this property
+        is set only if debug is enabled, and only after XML parsing has
+        taken place.
 
-        operation_recorder.reset()
-        operation_recorder.stage_wbem_connection(self)
+        As of pywbem 1.10, this property is set only if the XML parsing fails
+        if :attr:`~pywbem.WBEMConnection.retain_raw_data` is `False` and debug
+        is not enabled.
+        """
+        return self._last_raw_reply
 
-    def operation_recorder_reset(self, pull_op=False):
+    @property
+    def last_request_len(self):
         """
-        **Internal:** Low-level method used by the operation-specific
-        methods of this class.
+        int: The size of the HTTP body in the CIM-XML request of the last
+        operation, in Bytes.
 
-        *New in pywbem 0.9 as experimental and made internal in 1.2.*
+        Prior to sending the very first request on this connection object,
+        this property is 0.
 
-        It resets the operation processing state of all recorders of this
-        connection, to be ready for processing a new operation call.
+        This property is set independently of whether debug is enabled
+        (see :attr:`~pywbem.WBEMConnection.debug`).
         """
-        for recorder in self._operation_recorders:
-            recorder.reset(pull_op)
+        return self._last_request_len
 
-    def operation_recorder_stage_pywbem_args(self, method, **kwargs):
+    @property
+    def last_reply_len(self):
         """
-        **Internal:** Low-level method used by the operation-specific
-        methods of this class.
+        int: The size of the HTTP body in the CIM-XML response of the last
+        operation, in Bytes.
 
-        *New in pywbem 0.9 as experimental and made internal in 1.2.*
+        This property is set to 0 in the WBEM operation methods of this class
+        before the request is sent to the WBEM server or WBEM listener, and is
+        set to the size when the response has been received from the WBEM
+        server or WBEM listener, and before XML parsing takes place.
 
-        It forwards the operation method name and arguments to all recorders of
-        this connection.
-        """
-        for recorder in self._operation_recorders:
-            recorder.stage_pywbem_args(method, **kwargs)
+        Prior to sending the very first request on this connection object,
+        this property is 0.
 
-    def operation_recorder_stage_result(self, ret, exc):
+        This property is set independently of whether debug is enabled
+        (see :attr:`~pywbem.WBEMConnection.debug`).
         """
-        **Internal:** Low-level method used by the operation-specific
-        methods of this class.
-
-        *New in pywbem 0.9 as experimental and made internal in 1.2.*
+        return self._last_reply_len
 
-        It forwards the operation results including exceptions that were
-        raised, to all recorders of this connection, and causes the forwarded
-        information to be recorded by all recorders of this connection.
+    @property
+    def conn_id(self):
         """
-        for recorder in self._operation_recorders:
-            recorder.stage_pywbem_result(ret, exc)
-            recorder.record_staged()
+        :term:`connection id`: Connection ID (a unique ID) of this connection.
 
-    @classmethod
-    def _reset_logging_config(cls):
-        """
-        Reset the activation of logging and the log detail levels for future
-        WBEM connections.
+        The value for this property is created when the
+        :class:`~pywbem.WBEMConnection` object is created and remains constant
+        throughout the life of that object.
 
-        This method resets the corresponding class variables
-        of :class:`~pywbem.WBEMConnection`.
+        The connection ID is part of each log entry output to uniquely identify
+        the :class:`~pywbem.WBEMConnection` object responsible for that log.
+        It also part of the logger name for the "pywbem.api" and "pywbem.http"
+        loggers that create log entries so that logging can be defined
+        separately for different connections.
         """
-        cls._activate_logging = False
-        cls._log_detail_levels = {}
+        return self._conn_id
 
-    def _imethodcall(self, methodname, namespace, has_return_value=True,
-                     has_out_params=False, **params):
+    def __str__(self):
+        """
+        Return a short representation of the :class:`~pywbem.WBEMConnection`
+        object for human consumption.
         """
-        Perform an intrinsic CIM-XML operation.
-
-        Parameters:
-
-          methodname (str): Name of the CIM operation (e.g. 'GetInstance').
-
-          namespace (str): Namespace name, or None. In case of None, the
-            default connection namespace will be used.
-
-          has_return_value (bool): Indicates that the operation is defined with
-            a non-void return value.
-
-          has_out_params (bool): Indicates that the operation is defined with
-            one or more output parameters.
 
-          **in_params (dict): Input parameters for the operation.
+        if isinstance(self.creds, tuple):
+            # tuple (userid, password) was specified
+            creds_repr = _format("({0!A}, ...)", self.creds[0])
+        else:
+            creds_repr = _format("{0!A}", self.creds)
 
-        For failed operations and invalid responses, raises an exception.
+        return _format(
+            "WBEMConnection("
+            "url={s.url!A}, "
+            "creds={creds}, "
+            "default_namespace={s.default_namespace!A}, ...)",
+            s=self, creds=creds_repr)
 
-        For successful operations, returns:
+    def __repr__(self):
+        """
+        Return a representation of the :class:`~pywbem.WBEMConnection` object
+        with all attributes (except for the password in the
+        credentials) that is suitable for debugging.
+        """
 
-        * `None`, for operations with a void return type and no output params.
+        if isinstance(self.creds, tuple):
+            # tuple (userid, password) was specified
+            creds_repr = _format("({0!A}, ...)", self.creds[0])
+        else:
+            creds_repr = _format("{0!A}", self.creds)
+        if self.x509:
+            x509_repr = "{" + ", ".join(
+                [_format("{0!A}: {1!A}", key, self.x509[key])
+                 for key in sorted(self.x509.keys())]) + "}"
+        else:
+            x509_repr = "None"
 
-        * Otherwise, the list of child elements of IMETHODRESPONSE, containing
-          these items:
+        recorder_list = [recorder.__class__.__name__
+                         for recorder in self._operation_recorders]
 
-          - zero or one IRETURNVALUE (as tupletree node) for the operation
-            return value. Only operations with output parameters will return
-            no IRETURNVALUE element for representing an empty result list.
+        return _format(
+            "WBEMConnection("
+            "url={s.url!A}, "
+            "creds={creds}, "
+            "conn_id={s.conn_id!A}, "
+            "default_namespace={s.default_namespace!A}, "
+            "x509={x509}, "
+            "ca_certs={s.ca_certs!A}, "
+            "no_verification={s.no_verification!A}, "
+            "timeout={s.timeout!A}, "
+            "use_pull_operations={s.use_pull_operations!A}, "
+            "stats_enabled={s.stats_enabled!A}, "
+            "recorders={recorders})",
+            s=self, creds=creds_repr, x509=x509_repr, recorders=recorder_list)
 
-          - zero or more PARAMVALUE (unpacked) for the operation output
-            parameters.
+    @classmethod
+    def _configure_logger(cls, simple_name, log_dest, detail_level,
+                          log_filename, connection, propagate):
+        # pylint: disable=line-too-long
         """
+        Configure the pywbem loggers and optionally activate WBEM connections
+        for logging and setting a log detail level.
 
-        self._verify_open()
-
-        # Create HTTP extension headers for CIM-XML.
-        # Note: The two-step encoding required by DSP0200 will be performed in
-        # wbem_request().
+        Parameters:
 
-        cimxml_headers = [
-            ('CIMOperation', 'MethodCall'),
-            ('CIMMethod', methodname),
-            ('CIMObject', get_cimobject_header(namespace)),
-        ]
+          simple_name (str):
+            Simple name (ex. `'api'`) of the single pywbem logger this method
+            should affect, or `'all'` to affect all pywbem loggers.
 
-        # Create parameter list
+            Must be one of the strings in
+            :data:`~pywbem._logging.LOGGER_SIMPLE_NAMES`.
 
-        plist = [_cim_xml.IPARAMVALUE(x[0], tocimxml(x[1]))
-                 for x in params.items() if x[1] is not None]
+          log_dest (str):
+            Log destination for the affected pywbem loggers, controlling the
+            configuration of its Python logging parameters (log handler,
+            message format, and log level).
 
-        # Build XML request
+            If it is a :class:`py:str`, it must be one of the strings in
+            :data:`~pywbem._logging.LOG_DESTINATIONS` and the Python logging
+            parameters of the loggers will be configured accordingly for their
+            log handler, message format, and with a logging level of
+            :attr:`py:logging.DEBUG`.
 
-        req_xml = _cim_xml.CIM(
-            _cim_xml.MESSAGE(
-                _cim_xml.SIMPLEREQ(
-                    _cim_xml.IMETHODCALL(
-                        methodname,
-                        _cim_xml.LOCALNAMESPACEPATH(
-                            [_cim_xml.NAMESPACE(ns)
-                             for ns in namespace.split('/')]),
-                        plist)),
-                '1001', '1.0'),
-            '2.0', '2.0')
+            If `None`, the Python logging parameters of the loggers will not be
+            changed.
 
-        request_data = req_xml.toxml()
+          detail_level (:class:`py:str` or :class:`py:int` or `None`):
+            Detail level for the data in each log record that is generated by
+            the affected pywbem loggers.
 
-        # Set attributes recording the request.
-        # Also, reset attributes recording the reply in case we fail.
-        self._last_raw_request = request_data
-        self._last_request_len = len(request_data)
-        self._last_raw_reply = None
-        self._last_reply_len = 0
-        self._last_server_response_time = None
-        if self.debug:
-            self._last_request = None  # will be set upon access
-            self._last_request_xml_item = req_xml
-            self._last_reply = None
-            self._last_reply_xml_item = None
+            If it is a :class:`py:str`, it must be one of the strings in
+            :data:`~pywbem._logging.LOG_DETAIL_LEVELS` and the loggers will
+            be configured for the corresponding detail level.
 
-        # Send request and receive response
-        reply_data, self._last_server_response_time = wbem_request(
-            self, request_data, cimxml_headers)
+            If it is an :class:`py:int`, it defines the maximum size of the log
+            records created and the loggers will be configured to output all
+            available information up to that size.
 
-        # Set attributes recording the response, part 1.
-        # Only those that can be done without parsing (which can fail).
-        self._last_raw_reply = reply_data
-        self._last_reply_len = len(reply_data)
+            If `None`, the detail level configuration will not be changed.
 
-        # Parse the XML into a tuple tree (may raise CIMXMLParseError or
-        # XMLParseError):
-        tt_ = xml_to_tupletree_sax(reply_data, "CIM-XML response")
-        tp = TupleParser(self.conn_id)
-        tup_tree = tp.parse_cim(tt_)
+          log_filename (str):
+            Path name of the log file (required if the log destination is
+            `'file'`; otherwise ignored).
 
-        # Set attributes recording the response, part 2.
-        if self.debug:
-            self._last_reply = None  # will be set upon access
-            self._last_reply_xml_item = reply_data
+          connection (:class:`~pywbem.WBEMConnection` or :class:`py:bool` or `None`):
+            WBEM connection(s) that should be affected for activation and for
+            setting the detail level.
 
-        # Check the tuple tree
+            If it is a :class:`py:bool`, the information for activating logging
+            and for the detail level of the affected loggers will be stored for
+            use by subsequently created :class:`~pywbem.WBEMConnection` objects.
+            A value of `True` will store the information to activate the
+            connections for logging, and will add the detail level for the
+            logger(s).
+            A value of `False` will reset the stored information for future
+            connections to be deactivated with no detail levels specified.
 
-        if tup_tree[0] != 'CIM':
-            raise CIMXMLParseError(
-                _format("Expecting CIM element, got {0}", tup_tree[0]),
-                conn_id=self.conn_id)
-        tup_tree = tup_tree[2]
+            If it is a :class:`~pywbem.WBEMConnection` object, logging will be
+            activated for that WBEM connection only and the specified detail
+            level will be set for the affected pywbem loggers on the
+            connection.
 
-        if tup_tree[0] != 'MESSAGE':
-            raise CIMXMLParseError(
-                _format("Expecting MESSAGE element, got {0}", tup_tree[0]),
-                conn_id=self.conn_id)
-        tup_tree = tup_tree[2]
+            If `None`, no WBEM connection will be activated for logging.
 
-        if tup_tree[0] != 'SIMPLERSP':
-            raise CIMXMLParseError(
-                _format("Expecting SIMPLERSP element, got {0}", tup_tree[0]),
-                conn_id=self.conn_id)
-        tup_tree = tup_tree[2]
+        propagate (bool): Flag controlling whether the
+          affected pywbem logger should propagate log events to its
+          parent loggers.
 
-        if tup_tree[0] != 'IMETHODRESPONSE':
-            raise CIMXMLParseError(
-                _format("Expecting IMETHODRESPONSE element, got {0}",
-                        tup_tree[0]),
-                conn_id=self.conn_id)
+        Raises:
 
-        if tup_tree[1]['NAME'] != methodname:
-            raise CIMXMLParseError(
-                _format("Expecting attribute NAME={0!A}, got {1!A}",
-                        methodname, tup_tree[1]['NAME']),
-                conn_id=self.conn_id)
-        tup_tree = tup_tree[2]
-
-        # At this point tup_tree is a list of the child elements of
-        # IMETHODRESPONSE:
-        #   (ERROR | (IRETURNVALUE?, PARAMVALUE*)
-        # or an empty list if there were no child elements.
-        #
-        # More specifically, the following cases are possible for tup_tree:
-        # - operation failed: List with one ERROR node
-        # - operation succeeded:
-        #   - operation has void return type and no output parms
-        #     (e.g. DeleteInstance): Empty list.
-        #   - operation has non-void return type and no output parms
-        #     (e.g. CreateInstance): List with (zero or?) one IRETURNVALUE
-        #     node.
-        #   - operation has non-void return type and output parms
-        #     (e.g. OpenEnumerateInstances): List with (zero or?) one
-        #     IRETURNVALUE node and one unpacked PARAMVALUE node for each
-        #     output parameter.
-        #
-        # Note: DSP0200 is not entirely clear as to whether an empty result
-        # list must be represented as an empty IRETURNVALUE node vs.
-        # omitting it. Pywbem tolerates a missing IRETURNVALUE node.
-        #
-        # Note that there are no operations defined with a void return type but
-        # with output parameters.
-
-        # Check for failed operation
-        if tup_tree and tup_tree[0][0] == 'ERROR':
-            # The operation failed
-            err = tup_tree[0]
-            code = int(err[1]['CODE'])
-            err_insts = err[2] or None  # List of CIMInstance objects
-            if 'DESCRIPTION' in err[1]:
-                desc = err[1]['DESCRIPTION']
-            else:
-                desc = _format("Error code {0}", err[1]['CODE'])
-            raise CIMError(
-                code, desc, instances=err_insts, conn_id=self.conn_id,
-                request_data=request_data)
-
-        # At this point, we know the operation was successful.
-
-        return_value = False
-        out_param_names = []
-        for child_node in tup_tree:
-            if child_node[0] == 'IRETURNVALUE':
-                return_value = True
-            else:
-                # The PARAMVALUE nodes are already unpacked
-                out_param_names.append(child_node[0])
+          ValueError: Invalid input parameters (loggers remain unchanged).
+        """  # noqa: E501
+        # pylint: enable=line-too-long
 
-        # Convert empty list to None
-        if not tup_tree:
-            tup_tree = None
+        # If name is all, create individual loggers for each log type
+        if simple_name == 'all':
+            for name in ['api', 'http']:
+                cls._configure_logger(name, log_dest=log_dest,
+                                      detail_level=detail_level,
+                                      log_filename=log_filename,
+                                      connection=connection,
+                                      propagate=propagate)
+            return
 
-        # Check unexpected return value and output parameters
-        if not has_return_value and return_value:
-            raise CIMXMLParseError(
-                _format("Unexpected IRETURNVALUE child element of "
-                        "IMETHODRESPONSE for operation {0} which is defined as "
-                        "void", methodname),
-                conn_id=self.conn_id)
-        if not has_out_params and out_param_names:
-            raise CIMXMLParseError(
-                _format("Unexpected PARAMVALUE child element(s) of "
-                        "IMETHODRESPONSE for operation {0} which has no output "
-                        "parameters defined: {1!A}",
-                        methodname, out_param_names),
-                conn_id=self.conn_id)
+        if simple_name == 'api':
+            logger_name = LOGGER_API_CALLS_NAME
+        elif simple_name == 'http':
+            logger_name = LOGGER_HTTP_NAME
+        else:
+            raise ValueError(
+                _format("Invalid simple logger name: {0!A}; must be one of: "
+                        "{1!A}", simple_name, LOGGER_SIMPLE_NAMES))
 
-        # Missing return value and output parameters are checked by caller
+        if log_dest == 'off':
+            logger = logging.getLogger(logger_name)
+            for handler in logger.handlers:
+                handler.close()
+                logger.removeHandler(handler)
+            logger.setLevel(logging.ERROR)
+            logger.propagate = False
 
-        return tup_tree
+            # Don't activate logging on future connections
+            cls._reset_logging_config()
+        else:
+            detail_level = cls._configure_detail_level(detail_level)
+            handler = cls._configure_logger_handler(log_dest, log_filename)
+            cls._activate_logger(logger_name, simple_name, detail_level,
+                                 handler, connection, propagate)
 
-    def _methodcall(self, methodname, objectname, Params=None, **params):
+    @classmethod
+    def _configure_detail_level(cls, detail_level):
         """
-        Perform an extrinsic CIM-XML method call.
-
-        Parameters:
-
-          methodname (str): CIM method name.
+        Validate the `detail_level` parameter and return it.
 
-          objectname (string or CIMInstanceName or CIMClassName):
-            Target object. Strings are interpreted as class names.
+        This accepts a string or integer for `detail_level`.
+        """
+        # process detail_level
+        if isinstance(detail_level, str):
+            if detail_level not in LOG_DETAIL_LEVELS:
+                raise ValueError(
+                    _format("Invalid log detail level string: {0!A}; must be "
+                            "one of: {1!A}", detail_level, LOG_DETAIL_LEVELS))
+        elif isinstance(detail_level, int):
+            if detail_level < 0:
+                raise ValueError(
+                    _format("Invalid log detail level integer: {0}; must be a "
+                            "positive integer.", detail_level))
 
-          Params: CIM method input parameters, for details see InvokeMethod().
+        elif detail_level is None:
+            detail_level = DEFAULT_LOG_DETAIL_LEVEL
+        else:
+            raise ValueError(
+                _format("Invalid log detail level: {0!A}; must be one of: "
+                        "{1!A}, or a positive integer",
+                        detail_level, LOG_DETAIL_LEVELS))
+        return detail_level
 
-          **params: CIM method input parameters, for details see InvokeMethod().
+    @classmethod
+    def _configure_logger_handler(cls, log_dest, log_filename):
+        """
+        Return a logging handler for the specified `log_dest`, or `None` if
+        `log_dest` is `None`.
+        """
 
-        Returns:
+        if log_dest is None:
+            return None
 
-          tuple of (returnvalue, outparams): A tuple with these items:
-            * returnvalue (:term:`CIM data type`): Return value.
-            * outparams (:ref:`NocaseDict`): Output parameters, with:
-              * key (str): Parameter name
-              * value (:term:`CIM data type`): Parameter value
-        """
+        msg_format = '%(asctime)s-%(name)s-%(message)s'
 
-        self._verify_open()
-        if isinstance(objectname, (CIMInstanceName, CIMClassName)):
-            localobject = objectname.copy()
-            if localobject.namespace is None:
-                localobject.namespace = self.default_namespace
-            localobject.host = None
-        elif isinstance(objectname, str):
-            # a string is always interpreted as a class name
-            localobject = CIMClassName(objectname,
-                                       namespace=self.default_namespace)
+        if log_dest == 'stderr':
+            # Note: sys.stderr is the default stream for StreamHandler
+            handler = logging.StreamHandler()
+            handler.setFormatter(logging.Formatter(msg_format))
+        elif log_dest == 'file':
+            if not log_filename:
+                raise ValueError("Log filename is required if log destination "
+                                 "is 'file'")
+            handler = logging.FileHandler(log_filename, encoding="UTF-8")
+            handler.setFormatter(logging.Formatter(msg_format))
         else:
-            raise TypeError(
-                _format("The 'ObjectName' parameter of the WBEMConnection "
-                        "operation has invalid type {0} (must be a string, "
-                        "a CIMClassName, or a CIMInstanceName)",
-                        type(objectname)))
+            raise ValueError(
+                _format("Invalid log destination: {0!A}; Must be one of: "
+                        "{1!A}", log_dest, LOG_DESTINATIONS))
 
-        # Create HTTP extension headers for CIM-XML.
-        # Note: The two-step encoding required by DSP0200 will be performed in
-        # wbem_request().
+        return handler
 
-        cimxml_headers = [
-            ('CIMOperation', 'MethodCall'),
-            ('CIMMethod', methodname),
-            ('CIMObject', get_cimobject_header(localobject)),
-        ]
+    @classmethod
+    def _activate_logger(cls, logger_name, simple_name, detail_level, handler,
+                         connection, propagate):
+        """
+        Configure the specified logger, and activate logging and set detail
+        level for connections.
 
-        # Add a special HTTP header for SFCB's special password expiration
-        # update mechanism. For details, see the documentation of the
-        # pywbem config variable AUTO_GENERATE_SFCB_UEP_HEADER.
-        if AUTO_GENERATE_SFCB_UEP_HEADER and \
-                methodname == 'UpdateExpiredPassword' and \
-                objectname.classname == 'SFCB_Account':
-            cimxml_headers.append(('Pragma', 'UpdateExpiredPassword'))
-
-        # Create parameter list
-
-        def infer_type(obj, param_name):
-            """
-            Infer the CIM data type name of a parameter value.
-            """
-            if isinstance(obj, CIMType):  # pylint: disable=no-else-return
-                return obj.cimtype
-            elif isinstance(obj, bool):
-                return 'boolean'
-            elif isinstance(obj, str):
-                return 'string'
-            elif isinstance(obj, (datetime, timedelta)):
-                return 'datetime'
-            elif isinstance(obj, (CIMClassName, CIMInstanceName)):
-                return 'reference'
-            elif isinstance(obj, (CIMClass, CIMInstance)):
-                return 'string'
-            elif isinstance(obj, list):
-                return infer_type(obj[0], param_name) if obj else None
-            elif obj is None:
-                return None
-            if isinstance(obj, int):
-                hint = " (use a CIM integer type such as pywbem.Uint32)"
-            else:
-                hint = ""
-            raise TypeError(
-                _format("Method parameter {0!A} has type {1} which cannot "
-                        "be used to infer a valid CIM data type{2}",
-                        param_name, type(obj), hint))
-            # pylint: disable=inconsistent-return-statements
-
-        def paramvalue(obj):
-            """
-            Return a _cim_xml node to be used as the value for a parameter.
-            """
-            if isinstance(obj, (datetime, timedelta)):
-                obj = CIMDateTime(obj)
-            if isinstance(obj, (CIMType, bool, str)):
-                # This includes CIMDateTime (subclass of CIMType)
-                return _cim_xml.VALUE(atomic_to_cim_xml(obj))
-            if isinstance(obj, (CIMClassName, CIMInstanceName)):
-                return _cim_xml.VALUE_REFERENCE(obj.tocimxml())
-            if isinstance(obj, CIMInstance):
-                return _cim_xml.VALUE(obj.tocimxml(ignore_path=True).toxml())
-            if isinstance(obj, CIMClass):
-                # CIMClass.tocimxml() always ignores path
-                return _cim_xml.VALUE(obj.tocimxml().toxml())
-            if isinstance(obj, list):
-                if obj and isinstance(obj[0], (CIMClassName, CIMInstanceName)):
-                    return _cim_xml.VALUE_REFARRAY([paramvalue(x) for x in obj])
-                return _cim_xml.VALUE_ARRAY([paramvalue(x) for x in obj])
-            # The type has been checked in infer_type(), so we can assert
-            assert obj is None
+        The specified logger is always a single pywbem logger; the simple
+        logger name 'all' has already been resolved by the caller into
+        multiple calls to this method.
 
-        def infer_embedded_object(obj):
-            """
-            Infer the embedded_object value of a parameter value.
-            """
-            if isinstance(obj, list) and obj:
-                return infer_embedded_object(obj[0])
+        The 'handler' parameter controls logger configuration:
+        * If None, nothing is done.
+        * If a Handler object, the specified logger gets its handlers replaced
+          with the new handler, logging level DEBUG is set, and the
+          `propagate` attribute of the logger is set according to the
+          `propagate` parameter.
 
-            if isinstance(obj, CIMClass):
-                return 'object'
+        The 'connection' parameter controls activation and setting of the
+        detail level:
+        * If None, nothing is done.
+        * If bool=True, log activation and log detail information is stored for
+          use by future connections in class variables of WBEMConnection.
+        * If bool=False, log activation and log detail information is reset.
+        * If a WBEMConnection object, logging is activated and detail level is
+          set immediately for that connection.
+        """
 
-            if isinstance(obj, CIMInstance):
-                return 'instance'
-            return None
+        if handler is not None:
+            assert isinstance(handler, logging.Handler)
 
-        ptuples = []  # tuple (name, value, type, embedded_object)
-        if Params is not None:
-            for p in Params:
-                if isinstance(p, CIMParameter):
-                    ptuple = (p.name, p.value, p.type, p.embedded_object)
-                else:  # p is a tuple of name, value
-                    ptuple = (p[0], p[1], infer_type(p[1], p[0]),
-                              infer_embedded_object(p[1]))
-                ptuples.append(ptuple)
-        for n, v in params.items():
-            ptuple = (n, v, infer_type(v, n), infer_embedded_object(v))
-            ptuples.append(ptuple)
+            # Replace existing handlers of the specified logger (e.g. from
+            # previous calls) by the specified handler
 
-        plist = [_cim_xml.PARAMVALUE(n, paramvalue(v), t, embedded_object=eo)
-                 for n, v, t, eo in ptuples]
+            logger = logging.getLogger(logger_name)
+            for hdlr in logger.handlers:
+                logger.removeHandler(hdlr)
+            logger.addHandler(handler)
 
-        # Build XML request
+            logger.setLevel(logging.DEBUG)
+            logger.propagate = propagate
 
-        req_xml = _cim_xml.CIM(
-            _cim_xml.MESSAGE(
-                _cim_xml.SIMPLEREQ(
-                    _cim_xml.METHODCALL(
-                        methodname,
-                        localobject.tocimxml(),
-                        plist)),
-                '1001', '1.0'),
-            '2.0', '2.0')
+        if connection is not None:
+            if isinstance(connection, bool):
+                if connection:
+                    # Store the activation and detail level information for
+                    # future connections. This information is used in the init
+                    # method of WBEMConnection to activate logging at that
+                    # point.
+                    cls._activate_logging = True
+                    cls._log_detail_levels[simple_name] = detail_level
+                else:
+                    cls._reset_logging_config()
+            else:
+                assert isinstance(connection, WBEMConnection)
 
-        request_data = req_xml.toxml()
+                # Activate logging for this existing connection by ensuring
+                # the connection has a log recorder
 
-        # Set attributes recording the request.
-        # Also, reset attributes recording the reply in case we fail.
-        self._last_raw_request = request_data
-        self._last_request_len = len(request_data)
-        self._last_raw_reply = None
-        self._last_reply_len = 0
-        self._last_server_response_time = None
-        if self.debug:
-            self._last_request = None  # will be set upon access
-            self._last_request_xml_item = req_xml
-            self._last_reply = None
-            self._last_reply_xml_item = None
+                recorder_found = False
+                # pylint: disable=protected-access
+                for recorder in connection._operation_recorders:
+                    if isinstance(recorder, LogOperationRecorder):
+                        recorder_found = True
+                        assert recorder._conn_id  # validate recorder staged
+                        break
 
-        # Send request and receive response
-        reply_data, self._last_server_response_time = wbem_request(
-            self, request_data, cimxml_headers)
+                # Create new recorder object if not found in connection
+                if not recorder_found:
+                    recorder = LogOperationRecorder(conn_id=connection.conn_id)
 
-        # Set attributes recording the response, part 1.
-        # Only those that can be done without parsing (which can fail).
-        self._last_raw_reply = reply_data
-        self._last_reply_len = len(reply_data)
+                # Add the log detail level for this logger to the log recorder
+                # of this connection
+                detail_levels = recorder.detail_levels.copy()
+                detail_levels[simple_name] = detail_level
+                recorder.set_detail_level(detail_levels)
 
-        # Parse the XML into a tuple tree (may raise CIMXMLParseError or
-        # XMLParseError):
-        tt_ = xml_to_tupletree_sax(reply_data, "CIM-XML response")
-        tp = TupleParser(self.conn_id)
-        tup_tree = tp.parse_cim(tt_)
+                if not recorder_found:
+                    # This call must be made after the detail levels of the
+                    # recorder have been set, because that data is used
+                    # for recording the WBEM connection information.
+                    connection.add_operation_recorder(recorder)
 
-        # Set attributes recording the response, part 2.
-        if self.debug:
-            self._last_reply = None  # will be set upon access
-            self._last_reply_xml_item = reply_data
+    def _mount_http_adapter(self):
+        """
+        Mount the HTTP transport adapter of the requests session, with the
+        retry settings and a pool of HTTP connections that is sized for the
+        thread_safe mode.
+        """
+        retry = urllib3.Retry(**RETRY_KWARGS)
+        if self._thread_safe:
+            pool_maxsize = HTTP_POOL_MAXSIZE
+        else:
+            pool_maxsize = requests.adapters.DEFAULT_POOLSIZE
 
-        # Check the tuple tree
+        # While it would be technically sufficient to set a retry transport
+        # adapter only for the scheme specified in the input URL, we are
+        # setting it for both schemes that have existing adapters, in order to
+        # avoid confusion for the human reader.
+        retry_adapter = requests.adapters.HTTPAdapter(
+            max_retries=retry, pool_maxsize=pool_maxsize)
+        self.session.mount('http://', retry_adapter)
+        self.session.mount('https://', retry_adapter)
 
-        if tup_tree[0] != 'CIM':
-            raise CIMXMLParseError(
-                _format("Expecting CIM element, got {0}", tup_tree[0]),
-                conn_id=self.conn_id)
-        tup_tree = tup_tree[2]
+    def _verify_open(self):
+        """
+        Verify that this connection is open and raise ConnectionError otherwise.
 
-        if tup_tree[0] != 'MESSAGE':
-            raise CIMXMLParseError(
-                _format("Expecting MESSAGE element, got {0}", tup_tree[0]),
+        Raises:
+          :exc:`~pywbem.ConnectionError`: WBEMConnection is closed
+        """
+        if self.session is None:
+            raise ConnectionError(
+                "WBEMConnection is closed",
                 conn_id=self.conn_id)
-        tup_tree = tup_tree[2]
 
-        if tup_tree[0] != 'SIMPLERSP':
-            raise CIMXMLParseError(
-                _format("Expecting SIMPLERSP element, got {0}", tup_tree[0]),
-                conn_id=self.conn_id)
-        tup_tree = tup_tree[2]
+    def close(self):
+        """
+        Closes this connection.
 
-        if tup_tree[0] != 'METHODRESPONSE':
-            raise CIMXMLParseError(
-                _format("Expecting METHODRESPONSE element, got {0}",
-                        tup_tree[0]),
-                conn_id=self.conn_id)
+        *New in pywbem 1.2.*
 
-        if tup_tree[1]['NAME'] != methodname:
-            raise CIMXMLParseError(
-                _format("Expecting attribute NAME={0!A}, got {1!A}",
-                        methodname, tup_tree[1]['NAME']),
-                conn_id=self.conn_id)
-        tup_tree = tup_tree[2]
-
-        # At this point we have an optional RETURNVALUE and zero or
-        # more PARAMVALUE elements representing output parameters.
-
-        if tup_tree and tup_tree[0][0] == 'ERROR':
-            # Operation failed
-            err = tup_tree[0]
-            code = int(err[1]['CODE'])
-            err_insts = err[2] or None  # List of CIMInstance objects
-            if 'DESCRIPTION' in err[1]:
-                desc = err[1]['DESCRIPTION']
-            else:
-                desc = _format("Error code {0}", err[1]['CODE'])
-            raise CIMError(
-                code, desc, instances=err_insts, conn_id=self.conn_id,
-                request_data=request_data)
+        This method closes the session in the underlying requests package,
+        causing it to close any sockets it has pooled and marks the connection
+        closed. Any subsequent WBEM connection operation requests will generate
+        an exception.
 
-        # #  Original code return tup_tree
+        Raises:
+          :exc:`~pywbem.ConnectionError`: WBEMConnection is closed
+        """
+        self._verify_open()
+        self.session.close()
+        self.session = None  # Indicates closed state
 
-        # Convert optional RETURNVALUE into a Python object
-        returnvalue = None
+    def batch(self, multireq=None, max_workers=DEFAULT_BATCH_MAX_WORKERS):
+        """
+        *New in pywbem 1.10 as experimental.*
 
-        if tup_tree and tup_tree[0][0] == 'RETURNVALUE':
+        Return a new batch of WBEM operations on this connection, for
+        performing many small operations with few HTTP round trips.
 
-            returnvalue = cimvalue(tup_tree[0][2], tup_tree[0][1]['PARAMTYPE'])
-            tup_tree = tup_tree[1:]
+        Operations are added to the batch by calling the operation methods of
+        the returned :class:`~pywbem.WBEMBatch` object, and they are performed
+        when the batch is executed. The batch is executed when the `with`
+        statement using it as a context manager is left, or when its
+        :meth:`~pywbem.WBEMBatch.execute` method is called.
 
-        # Convert zero or more PARAMVALUE elements into dictionary
+        If the WBEM server supports multiple operation requests as defined in
+        :term:`DSP0200`, the operations of the batch are sent to the WBEM
+        server in a single CIM-XML MULTIREQ request. Otherwise, they are sent
+        as individual requests, concurrently if this connection is in the
+        :attr:`~pywbem.WBEMConnection.thread_safe` mode, and sequentially
+        otherwise.
 
-        output_params = NocaseDict()
+        Example::
 
-        for p in tup_tree:
-            if p[1] == 'reference':
-                output_params[p[0]] = p[2]
-            else:
-                output_params[p[0]] = cimvalue(p[2], p[1])
+            with conn.batch() as batch:
+                ops = [batch.GetInstance(path) for path in paths]
+            for op in ops:
+                try:
+                    inst = op.result()
+                except pywbem.Error as exc:
+                    print(f"Error: {exc}")
 
-        return (returnvalue, output_params)
+        Parameters:
 
-    def _iexportcall(self, methodname, **params):
-        """
-        Invoke a CIM-XML export method.
+          multireq (:class:`py:bool`):
+            Controls the use of multiple operation requests:
 
-        Parameters:
+            * `None` - Use multiple operation requests if the WBEM server
+              supports them. The support is determined upon first use with an
+              HTTP OPTIONS request to the WBEM server, and is retained in this
+              connection.
+            * `True` - Always use multiple operation requests.
+            * `False` - Never use multiple operation requests.
 
-          methodname (str): Name of the export method
-            (e.g. 'ExportIndication').
+          max_workers (:term:`integer`):
+            Maximum number of individual requests that are performed
+            concurrently, in the thread_safe mode.
 
-          **params (dict): Input parameters for the export method.
+        Returns:
 
-        For failed export methods and invalid responses, raises an exception.
+          :class:`~pywbem.WBEMBatch`: The new, empty batch.
+        """
+        return WBEMBatch(self, multireq, max_workers)
 
-        For successful operations, returns `None`.
+    def _supports_multireq(self):
         """
+        Return a boolean indicating whether the WBEM server supports multiple
+        operation requests.
 
-        self._verify_open()
+        The support is determined with an HTTP OPTIONS request to the WBEM
+        server, whose response includes the 'CIMSupportsMultipleOperations'
+        header field (optionally with a prefix, see DSP0200) if the server
+        supports them. The result is retained in this connection, unless
+        the server could not be reached.
+        """
+        if self._multireq_supported is None:
+            try:
+                headers = wbem_options(self)
+            except HTTPError:
+                supported = False
+            except Error:
+                # Retry the OPTIONS request with the next batch
+                return False
+            else:
+                supported = any(
+                    hname.lower() == 'cimsupportsmultipleoperations' or
+                    hname.lower().endswith('-cimsupportsmultipleoperations')
+                    for hname in headers)
+            self._multireq_supported = supported
+        return self._multireq_supported
 
-        # Create HTTP extension headers for CIM-XML.
-        # Note: The two-step encoding required by DSP0200 will be performed in
-        # wbem_request().
+    def add_operation_recorder(self, operation_recorder):
+        # pylint: disable=line-too-long
+        """
+        **Internal:** Add an operation recorder to this connection.
 
-        cimxml_headers = [
-            ('CIMExport', 'MethodRequest'),
-            ('CIMExportMethod', methodname),
-        ]
+        *New in pywbem 0.12 as experimental and made internal in 1.2.*
 
-        # Create parameter list
+        If the connection already has a recorder with the same class, the
+        request to add the recorder is ignored.
 
-        plist = [_cim_xml.EXPPARAMVALUE(x[0], tocimxml(x[1]))
-                 for x in params.items() if x[1] is not None]
+        Parameters:
 
-        # Build XML request
+          operation_recorder (:class:`~pywbem.BaseOperationRecorder` subclass object):
+            The operation recorder to be added. Must not be `None`.
 
-        req_xml = _cim_xml.CIM(
-            _cim_xml.MESSAGE(
-                _cim_xml.SIMPLEEXPREQ(
-                    _cim_xml.EXPMETHODCALL(
-                        methodname,
-                        plist)),
-                '1001', '1.0'),
-            '2.0', '2.0')
+        Raises:
 
-        request_data = req_xml.toxml()
+          ValueError: Operation recorder must not be `None`.
+          ValueError: Cannot add the same recorder class multiple times.
+        """  # noqa: E501
+        if operation_recorder is None:
+            raise ValueError("Invalid value None for new operation recorder")
 
-        # Set attributes recording the request.
-        # Also, reset attributes recording the reply in case we fail.
-        self._last_raw_request = request_data
-        self._last_request_len = len(request_data)
-        self._last_raw_reply = None
-        self._last_reply_len = 0
-        self._last_server_response_time = None
-        if self.debug:
-            self._last_request = None  # will be set upon access
-            self._last_request_xml_item = req_xml
-            self._last_reply = None
-            self._last_reply_xml_item = None
+        for recorder in self._operation_recorders:
+            # pylint: disable=unidiomatic-typecheck
+            if type(recorder) is type(operation_recorder):
+                raise ValueError(
+                    _format("Cannot add the same operation recorder class {0} "
+                            "multiple times to the same connection",
+                            type(operation_recorder)))
+        self._operation_recorders.append(operation_recorder)
 
-        # Send request and receive response
-        reply_data, self._last_server_response_time = wbem_request(
-            self, request_data, cimxml_headers)
+        operation_recorder.reset()
+        operation_recorder.stage_wbem_connection(self)
 
-        # Set attributes recording the response, part 1.
-        # Only those that can be done without parsing (which can fail).
-        self._last_raw_reply = reply_data
-        self._last_reply_len = len(reply_data)
+    def operation_recorder_reset(self, pull_op=False):
+        """
+        **Internal:** Low-level method used by the operation-specific
+        methods of this class.
 
-        # Parse the XML into a tuple tree (may raise CIMXMLParseError or
-        # XMLParseError):
-        tt_ = xml_to_tupletree_sax(reply_data, "CIM-XML export response")
-        tp = TupleParser(self.conn_id)
-        tup_tree = tp.parse_cim(tt_)
+        *New in pywbem 0.9 as experimental and made internal in 1.2.*
 
-        # Set attributes recording the response, part 2.
-        if self.debug:
-            self._last_reply = None  # will be set upon access
-            self._last_reply_xml_item = reply_data
+        It resets the operation processing state of all recorders of this
+        connection, to be ready for processing a new operation call.
+        """
+        for recorder in self._operation_recorders:
+            recorder.reset(pull_op)
 
-        # Check the tuple tree
+    def operation_recorder_stage_pywbem_args(self, method, **kwargs):
+        """
+        **Internal:** Low-level method used by the operation-specific
+        methods of this class.
 
-        if tup_tree[0] != 'CIM':
-            raise CIMXMLParseError(
-                _format("Expecting CIM element, got {0}", tup_tree[0]),
-                conn_id=self.conn_id)
-        tup_tree = tup_tree[2]
+        *New in pywbem 0.9 as experimental and made internal in 1.2.*
 
-        if tup_tree[0] != 'MESSAGE':
-            raise CIMXMLParseError(
-                _format("Expecting MESSAGE element, got {0}", tup_tree[0]),
-                conn_id=self.conn_id)
-        tup_tree = tup_tree[2]
+        It forwards the operation method name and arguments to all recorders of
+        this connection.
+        """
+        for recorder in self._operation_recorders:
+            recorder.stage_pywbem_args(method, **kwargs)
 
-        if tup_tree[0] != 'SIMPLEEXPRSP':
-            raise CIMXMLParseError(
-                _format("Expecting SIMPLEEXPRSP element, got {0}", tup_tree[0]),
-                conn_id=self.conn_id)
-        tup_tree = tup_tree[2]
+    def operation_recorder_stage_result(self, ret, exc):
+        """
+        **Internal:** Low-level method used by the operation-specific
+        methods of this class.
 
-        if tup_tree[0] != 'EXPMETHODRESPONSE':
-            raise CIMXMLParseError(
-                _format("Expecting EXPMETHODRESPONSE element, got {0}",
-                        tup_tree[0]),
-                conn_id=self.conn_id)
+        *New in pywbem 0.9 as experimental and made internal in 1.2.*
 
-        if tup_tree[1]['NAME'] != methodname:
-            raise CIMXMLParseError(
-                _format("Expecting attribute NAME={0!A}, got {1!A}",
-                        methodname, tup_tree[1]['NAME']),
-                conn_id=self.conn_id)
-        tup_tree = tup_tree[2]
-
-        # At this point tup_tree is a list of the child elements of
-        # EXPMETHODRESPONSE:
-        #   (ERROR | IRETURNVALUE?)
-        # or an empty list if there were no child elements.
-        # Note that output parameters are not supported in DSP0201.
-        #
-        # More specifically, the following cases are possible for tup_tree:
-        # - operation failed: List with one ERROR node
-        # - operation succeeded:
-        #   - operation has void return type (e.g. ExportIndication):
-        #     Empty list.
-        #
-        # Note that DSP0200 does not define any export methods with non-void
-        # return type.
-
-        # Check for failed operation
-        if tup_tree and tup_tree[0][0] == 'ERROR':
-            # The operation failed
-            err = tup_tree[0]
-            code = int(err[1]['CODE'])
-            err_insts = err[2] or None  # List of CIMInstance objects
-            if 'DESCRIPTION' in err[1]:
-                desc = err[1]['DESCRIPTION']
-            else:
-                desc = _format("Error code {0}", err[1]['CODE'])
-            raise CIMError(
-                code, desc, instances=err_insts, conn_id=self.conn_id,
-                request_data=request_data)
+        It forwards the operation results including exceptions that were
+        raised, to all recorders of this connection, and causes the forwarded
+        information to be recorded by all recorders of this connection.
+        """
+        for recorder in self._operation_recorders:
+            recorder.stage_pywbem_result(ret, exc)
+            recorder.record_staged()
 
-        # At this point, we know the operation was successful.
+    @classmethod
+    def _reset_logging_config(cls):
+        """
+        Reset the activation of logging and the log detail levels for future
+        WBEM connections.
 
-        if tup_tree:
-            # Since there are only export methods with a void return type, the
-            # tup_tree must be empty.
-            raise CIMXMLParseError(
-                _format("Unexpected {0} child element of EXPMETHODRESPONSE "
-                        "for export method {1} which is defined as void",
-                        tup_tree[0][0], methodname),
-                conn_id=self.conn_id)
+        This method resets the corresponding class variables
+        of :class:`~pywbem.WBEMConnection`.
+        """
+        cls._activate_logging = False
+        cls._log_detail_levels = {}
 
-    def _iparam_namespace_from_namespace(self, namespace):
-        # pylint: disable=invalid-name,
+    def _imethodcall(self, methodname, namespace, has_return_value=True,
+                     has_out_params=False, property_filter=None, **params):
         """
-        Determine the namespace from a namespace parameter, for use as an
-        argument to imethodcall().
+        Perform an intrinsic CIM-XML operation.
 
-        Slashes at begin and end of namespace are stripped.
+        Parameters:
 
-        If namespace is None, the default namespace of the connection object
-        is used.
+          methodname (str): Name of the CIM operation (e.g. 'GetInstance').
 
-        Returns:
-           str: The so determined namespace string.
+          namespace (str): Namespace name, or None. In case of None, the
+            default connection namespace will be used.
 
-        Raises:
-          TypeError: namespace has an invalid type
-        """
-        if isinstance(namespace, str):
-            namespace = namespace.strip('/')
-        elif namespace is None:
-            pass
-        else:
-            raise TypeError(
-                _format("The 'namespace' parameter of the WBEMConnection "
-                        "operation has invalid type {0} (must be None, or a "
-                        "string)",
-                        type(namespace)))
-        if namespace is None:
-            namespace = self.default_namespace
-        return namespace
+          has_return_value (bool): Indicates that the operation is defined with
+            a non-void return value.
 
-    def _iparam_namespace_from_objectname(self, objectname, arg_name):
-        # pylint: disable=invalid-name,
-        """
-        Determine the namespace from an object name, for use as an argument to
-        imethodcall().
+          has_out_params (bool): Indicates that the operation is defined with
+            one or more output parameters.
 
-        The objectname can be a class name string, a CIMClassName or
-        CIMInstanceName object, or `None`.
+          property_filter (set of str): Lower-cased names of the properties to
+            be included in the returned instances, or `None` for including
+            all properties. Other properties are skipped while parsing the
+            response.
 
-        The default namespace of the connection object is used, if needed.
+          **in_params (dict): Input parameters for the operation.
 
-        Returns:
-           str: The so determined namespace string.
+        For failed operations and invalid responses, raises an exception.
 
-        Raises:
-          TypeError: objectname has an invalid type
-        """
+        For successful operations, returns:
 
-        if isinstance(objectname, (CIMClassName, CIMInstanceName)):
-            namespace = objectname.namespace
-        elif isinstance(objectname, str):
-            namespace = None
-        elif objectname is None:
-            namespace = objectname
-        else:
-            raise TypeError(
-                _format("The {0!A} parameter of the WBEMConnection operation "
-                        "has invalid type {1} (must be None, a string, a "
-                        "CIMClassName, or a CIMInstanceName)",
-                        arg_name, type(objectname)))
-        if namespace is None:
-            namespace = self.default_namespace
-        return namespace
+        * `None`, for operations with a void return type and no output params.
+
+        * Otherwise, the list of child elements of IMETHODRESPONSE, containing
+          these items:
+
+          - zero or one IRETURNVALUE (as tupletree node) for the operation
+            return value. Only operations with output parameters will return
+            no IRETURNVALUE element for representing an empty result list.
 
-    @staticmethod
-    def _iparam_objectname(objectname, arg_name, required=False):
+          - zero or more PARAMVALUE (unpacked) for the operation output
+            parameters.
         """
-        Convert an object name (i.e. class or instance name) specified in an
-        operation method into an object (i.e. CIMClassName or CIMInstanceName)
-        that can be passed to imethodcall().
 
-        Returns:
-          * CIMClassName without host and namespace, if objectname is string or
-            CIMClassName
-          * CIMInstanceName without host and namespace, if objectname is
-            CIMInstanceName
-          * None, if objectname is None (only if not required)
+        self._verify_open()
 
-        Raises:
-          TypeError: objectname has an invalid type
-        """
+        request_data, cimxml_headers = _imethodcall_request(
+            methodname, namespace, **params)
 
-        if isinstance(objectname, (CIMClassName, CIMInstanceName)):
-            objectname = objectname.copy()
-            objectname.host = None
-            objectname.namespace = None
-        elif isinstance(objectname, str):
-            objectname = CIMClassName(objectname)
-        elif not required and objectname is None:
-            pass
-        else:
-            raise TypeError(
-                _format("The {0!A} parameter of the WBEMConnection operation "
-                        "has invalid type {1} (must be {2}a string, a "
-                        "CIMClassName, or a CIMInstanceName)",
-                        arg_name, type(objectname),
-                        "" if required else "None, "))
-        return objectname
+        tup_tree, request_data = self._cimxml_call(
+            request_data, cimxml_headers, "CIM-XML response",
+            property_filter)
 
-    @staticmethod
-    def _iparam_classname(classname, arg_name, required=False):
+        return _imethodcall_result(
+            tup_tree, methodname, has_return_value, has_out_params,
+            self.conn_id, request_data)
+
+    def _iter_imethodcall(self, methodname, namespace, item_name,
+                          property_filter=None, **params):
         """
-        Convert a class name specified in an operation method into a
-        CIMClassName object, so that it can be passed to imethodcall().
+        Perform an intrinsic CIM-XML operation that returns a list of objects,
+        with streaming of the response, and yield each object as soon as its
+        element in the IRETURNVALUE element of the response has been received
+        and parsed.
 
-        Returns:
-          * CIMClassName without host and namespace, if classname is string or
-            CIMClassName
-          * None, if classname is None (only if not required)
+        The operation response is read and parsed incrementally, so that the
+        memory needed does not grow with the number of returned objects. A
+        failed operation is raised as an exception when the iteration reaches
+        the end of the response.
 
-        Raises:
-          TypeError: classname has an invalid type
-        """
+        Parameters:
 
-        if isinstance(classname, CIMClassName):
-            classname = classname.copy()
-            classname.host = None
-            classname.namespace = None
-        elif isinstance(classname, str):
-            classname = CIMClassName(classname)
-        elif not required and classname is None:
-            pass
-        else:
-            raise TypeError(
-                _format("The {0!A} parameter of the WBEMConnection operation "
-                        "has invalid type {1} (must be {2}a string, or a "
-                        "CIMClassName)",
-                        arg_name, type(classname),
-                        "" if required else "None, "))
-        return classname
+          methodname (str): Name of the CIM operation (e.g.
+            'EnumerateInstances').
 
-    @staticmethod
-    def _iparam_instancename(instancename, arg_name, required=False):
-        """
-        Convert an instance name specified in an operation method into a
-        CIMInstanceName object that can be passed to imethodcall().
+          namespace (str): Namespace name, or None. In case of None, the
+            default connection namespace will be used.
 
-        Returns:
-          * CIMInstanceName without host and namespace, if instancename is
-            CIMInstanceName
-          * None, if instancename is None (only if not required)
+          item_name (str): Name of the CIM-XML element of the returned
+            objects (e.g. 'VALUE.NAMEDINSTANCE').
 
-        Raises:
-          TypeError: instancename has an invalid type
-        """
+          property_filter (set of str): Lower-cased names of the properties to
+            be included in the returned instances, or `None` for including
+            all properties.
 
-        if isinstance(instancename, CIMInstanceName):
-            instancename = instancename.copy()
-            instancename.host = None
-            instancename.namespace = None
-        elif not required and instancename is None:
-            pass
-        else:
-            raise TypeError(
-                _format("The {0!A} parameter of the WBEMConnection "
-                        "operation has invalid type {1} (must be {2}a "
-                        "string, or a CIMInstanceName)",
-                        arg_name, type(instancename),
-                        "" if required else "None, "))
-        return instancename
+          **in_params (dict): Input parameters for the operation.
 
-    @staticmethod
-    def _iparam_class(klass, arg_name):
+        Yields:
+
+          The returned objects, as parsed by TupleParser.
         """
-        Convert a CIMClass object specified in an operation method such that
-        it can be passed to imethodcall().
 
-        Returns:
-          * CIMClass copy without path
-          * None
+        tp, decoder = self._tuple_parser()
+        items = self._iter_imethodcall_items(
+            tp, decoder, methodname, namespace, item_name, property_filter,
+            **params)
+        try:
+            for item in items:
+                yield tp.parse_any(item)
+        finally:
+            items.close()
 
-        Raises:
-          TypeError: klass has an invalid type
+    def _iter_imethodcall_items(self, tp, decoder, methodname, namespace,
+                                item_name, property_filter=None, **params):
         """
+        Perform an intrinsic CIM-XML operation that returns a list of objects,
+        with streaming of the response, and yield the tupletree node of the
+        element of each object as soon as it has been received.
 
-        if isinstance(klass, CIMClass):
-            klass = klass.copy()
-            klass.path = None
-        elif klass is None:
-            pass
-        else:
-            raise TypeError(
-                _format("The {0!A} parameter of the WBEMConnection operation "
-                        "has invalid type {1} (must be None, or a CIMClass)",
-                        arg_name, type(klass)))
-        return klass
+        Parameters:
 
-    @staticmethod
-    def _iparam_instance(instance, arg_name, required=False):
-        """
-        Validate the type of a required CIMInstance typed parameter.
+          tp (TupleParser): Parser for the CIM-XML response.
 
-        Returns:
-          * CIMInstance copy
+          decoder (TupleDecoder): Decoder for the elements of the CIM-XML
+            response, or None for not decoding them directly.
 
-        Raises:
-          TypeError: instance has an invalid type
+          For a description of the other parameters, see _iter_imethodcall().
+
+        Yields:
+
+          The tupletree nodes of the elements of the returned objects
+          (decoded nodes if a decoder is specified).
         """
 
-        assert required is True  # For now, only required instances supported
+        self._verify_open()
 
-        if isinstance(instance, CIMInstance):
-            return instance.copy()
+        request_data, cimxml_headers = _imethodcall_request(
+            methodname, namespace, **params)
 
-        raise TypeError(
-            _format("The {0!A} parameter of the WBEMConnection operation "
-                    "has invalid type {1} (must be a CIMInstance)",
-                    arg_name, type(instance)))
+        self._record_request(request_data)
 
-    @staticmethod
-    def _iparam_qualifierdeclaration(qualifier, arg_name, required=False):
+        reply_chunks = self._streamed_reply(request_data, cimxml_headers)
+        tt_items = iter_xml_chunks_to_tupletree_expat(
+            reply_chunks, IRETURNVALUE_PATH, "CIM-XML response", self.conn_id,
+            decoder, property_filter)
+        tt_ = None  # Set to the return value of the generator
+        try:
+            while True:
+                try:
+                    item = next(tt_items)
+                except StopIteration as stop:
+                    tt_ = stop.value
+                    break
+                if item[0] != item_name:
+                    raise CIMXMLParseError(
+                        _format("Expecting {0} element in IRETURNVALUE "
+                                "element, got {1}", item_name, item[0]),
+                        conn_id=self.conn_id)
+                yield item
+        finally:
+            tt_items.close()
+            reply_chunks.close()
+
+        tup_tree = tp.parse_cim(tt_)
+
+        if self.debug:
+            self._last_reply = None  # will be set upon access
+            self._last_reply_xml_item = self._last_raw_reply
+        elif not self.retain_raw_data:
+            self._last_raw_request = None
+
+        # Raises CIMError for a failed operation
+        _imethodcall_result(
+            tup_tree, methodname, True, False, self.conn_id, request_data)
+
+    def _iter_streamed_operation(self, method_name, namespace, item_name,
+                                 property_filter=None, **params):
         """
-        Validate the type of a CIMQualifierDeclaration object.
+        Generator function that performs an intrinsic CIM-XML operation that
+        returns a list of objects, and yields each object as soon as it has
+        been received. This is the streamed counterpart of the operation
+        methods such as EnumerateInstances(), including their statistics and
+        operation recorder support.
+
+        The parameters must already have been validated and converted.
+        For a description of the parameters, see _iter_imethodcall().
         """
-        if isinstance(qualifier, CIMQualifierDeclaration):
-            pass
-        elif not required and qualifier is None:
-            pass
-        else:
-            raise TypeError(
-                _format("The {0!A} parameter of the WBEMConnection operation "
-                        "has invalid type {1} (must be {2}a "
-                        "CIMQualifierDeclaration)",
-                        arg_name, type(qualifier),
-                        "" if required else "None or "))
-        return qualifier
 
-    @staticmethod
-    def _iparam_string(string_param, arg_name, required=False):
-        # pylint: disable=invalid-name,
+        exc = None
+        objects = None
+
+        if self._operation_recorders:
+            objects = []  # Only needed for the operation recorders
+            self.operation_recorder_reset()
+            self.operation_recorder_stage_pywbem_args(
+                method=method_name,
+                namespace=namespace,
+                **params)
+
+        stats = self.statistics.start_timer(method_name)
+        try:
+
+            for obj in self._iter_imethodcall(
+                    method_name, namespace, item_name, property_filter,
+                    **params):
+                if objects is not None:
+                    objects.append(obj)
+                yield obj
+
+        except (CIMXMLParseError, XMLParseError) as exce:
+            exce.request_data = self.last_raw_request
+            exce.response_data = self.last_raw_reply
+            exc = exce
+            raise
+        except Exception as exce:
+            exc = exce
+            raise
+        finally:
+            self._last_operation_time = stats.stop_timer(
+                self.last_request_len, self.last_reply_len,
+                self.last_server_response_time, exc)
+            if self._operation_recorders:
+                self.operation_recorder_stage_result(objects, exc)
+
+    def _methodcall(self, methodname, objectname, Params=None, **params):
         """
-        Validate a string typed operation parameter that may be None.
+        Perform an extrinsic CIM-XML method call.
+
+        Parameters:
+
+          methodname (str): CIM method name.
+
+          objectname (string or CIMInstanceName or CIMClassName):
+            Target object. Strings are interpreted as class names.
+
+          Params: CIM method input parameters, for details see InvokeMethod().
+
+          **params: CIM method input parameters, for details see InvokeMethod().
 
         Returns:
-           The input string, or None (only if not required).
 
-        Raises:
-          TypeError: string_param has an invalid type
+          tuple of (returnvalue, outparams): A tuple with these items:
+            * returnvalue (:term:`CIM data type`): Return value.
+            * outparams (:ref:`NocaseDict`): Output parameters, with:
+              * key (str): Parameter name
+              * value (:term:`CIM data type`): Parameter value
         """
-        if isinstance(string_param, str):
-            pass
-        elif not required and string_param is None:
-            pass
-        else:
-            raise TypeError(
-                _format("The {0!A} parameter of the WBEMConnection operation "
-                        "has invalid type {1} (must be None, or a string)",
-                        arg_name, type(string_param)))
-        return string_param
 
-    @staticmethod
-    def _iparam_positive_integer(integer_param, arg_name):
-        # pylint: disable=invalid-name,
-        """
-        Validate a integer typed operation parameter that may be None, zero,
-        or a positive integer.
+        self._verify_open()
 
-        Returns:
-           The input integer, or None.
+        request_data, cimxml_headers = _methodcall_request(
+            methodname, objectname, self.default_namespace, Params, **params)
 
-        Raises:
-          TypeError: integer_param has an invalid type
-          ValueError: integer param is LT 0
+        tup_tree, request_data = self._cimxml_call(
+            request_data, cimxml_headers, "CIM-XML response")
+
+        return _methodcall_result(
+            tup_tree, methodname, self.conn_id, request_data)
+
+    def _iexportcall(self, methodname, **params):
         """
-        if not isinstance(integer_param, (int, type(None))):
-            raise TypeError(
-                _format("The {0!A} parameter of the WBEMConnection operation "
-                        "has invalid type {1} (must be None, or an integer)",
-                        arg_name, type(integer_param)))
+        Invoke a CIM-XML export method.
 
-        if integer_param is not None and integer_param < 0:
-            raise ValueError(
-                _format("The {0!A} parameter must be >= 0 but is {0}",
-                        arg_name, integer_param))
-        return integer_param
+        Parameters:
+
+          methodname (str): Name of the export method
+            (e.g. 'ExportIndication').
 
-    @staticmethod
-    def _iparam_bool(bool_param, arg_name):
-        # pylint: disable=invalid-name,
-        """
-        Validate a bool typed operation parameter that may be None.
+          **params (dict): Input parameters for the export method.
 
-        Returns:
-           The input boolean, or None.
+        For failed export methods and invalid responses, raises an exception.
 
-        Raises:
-          TypeError: bool_param has an invalid type
+        For successful operations, returns `None`.
         """
-        if not isinstance(bool_param, (bool, type(None))):
-            raise TypeError(
-                _format("The {0!A} parameter of the WBEMConnection operation "
-                        "has invalid type {1} (must be None, or a bool)",
-                        arg_name, type(bool_param)))
-        return bool_param
 
-    def _get_rslt_params(self, result, namespace):
+        self._verify_open()
+
+        request_data, cimxml_headers = _iexportcall_request(
+            methodname, **params)
+
+        tup_tree, request_data = self._cimxml_call(
+            request_data, cimxml_headers, "CIM-XML export response")
+
+        _iexportcall_result(tup_tree, methodname, self.conn_id, request_data)
+
+    def _cimxml_call(self, request_data, cimxml_headers, meaning,
+                     property_filter=None):
         """
-        Common processing for pull results to separate end-of-sequence,
-        enum-context, and entities in IRETURNVALUE.
+        Send a CIM-XML request, receive the response and parse it into a
+        tuple tree, recording request and response in this connection.
 
-        Returns tuple of entities in IRETURNVALUE, end_of_sequence,
-        and enumeration_context)
+        Parameters:
+
+          request_data (str): The CIM-XML request string.
+
+          cimxml_headers (list): CIM-XML extension header fields for the
+            request.
+
+          meaning (str): Short text with meaning of the response, for use in
+            exception messages.
+
+          property_filter (set of str): Lower-cased names of the properties to
+            be included in the returned instances, or `None` for including
+            all properties.
+
+        Returns:
+
+          tuple of (tup_tree, request_data), with tup_tree being the CIM
+          element of the response as parsed by TupleParser, and request_data
+          being the CIM-XML request string that was sent.
         """
-        rtn_objects = []
-        end_of_sequence = False
-        enumeration_context = None
-        end_of_sequence_found = False  # flag True if found and valid value
-        enumeration_context_found = False  # flag True if ec tuple found
-        for p in result:
-            if p[0] == 'EndOfSequence':
-                if isinstance(p[2], str):
-                    p2 = p[2].lower()
-                    if p2 in ['true', 'false']:  # noqa: E125
-                        end_of_sequence = (p2 == 'true')
-                        end_of_sequence_found = True
-                    else:
-                        raise CIMXMLParseError(
-                            _format("EndOfSequence output parameter has an "
-                                    "invalid value: {0!A}", p[2]),
-                            conn_id=self.conn_id)
 
-            elif p[0] == 'EnumerationContext':
-                enumeration_context_found = True
-                if isinstance(p[2], str):
-                    enumeration_context = p[2]
+        self._record_request(request_data)
 
-            elif p[0] == "IRETURNVALUE":
-                rtn_objects = p[2]
+        tp, decoder = self._tuple_parser()
 
-        if not end_of_sequence_found and not enumeration_context_found:
-            raise CIMXMLParseError(
-                "Expected EndOfSequence or EnumerationContext output "
-                "parameter in open/pull response, but none received",
-                conn_id=self.conn_id)
+        if self.stream_response:
+            reply_chunks = self._streamed_reply(request_data, cimxml_headers)
+            try:
+                # Parse the XML into a tuple tree (may raise XMLParseError):
+                tt_ = xml_chunks_to_tupletree_expat(
+                    reply_chunks, meaning, self.conn_id, decoder,
+                    property_filter)
+            finally:
+                reply_chunks.close()
+            reply_data = self._last_raw_reply
+            tup_tree = tp.parse_cim(tt_)
+        elif self._retains_raw_data():
+            # Send request and receive response
+            reply_data, self._last_server_response_time = wbem_request(
+                self, request_data, cimxml_headers)
+
+            # Set attributes recording the response, part 1.
+            # Only those that can be done without parsing (which can fail).
+            self._last_raw_reply = reply_data
+            self._last_reply_len = len(reply_data)
+
+            # Parse the XML into a tuple tree (may raise CIMXMLParseError or
+            # XMLParseError):
+            tt_ = xml_to_tupletree_expat(
+                reply_data, meaning, decoder=decoder,
+                property_filter=property_filter)
+            tup_tree = tp.parse_cim(tt_)
+        else:
+            # The response is received into a buffer that is passed to the
+            # parser as a memoryview, without copying it. The raw response
+            # is set only if the parsing fails.
+            reply_buffer, self._last_server_response_time = wbem_request(
+                self, request_data, cimxml_headers, buffer=True)
+            self._last_reply_len = len(reply_buffer)
+            try:
+                tt_ = xml_to_tupletree_expat(
+                    reply_buffer, meaning, decoder=decoder,
+                    property_filter=property_filter)
+                tup_tree = tp.parse_cim(tt_)
+            except (CIMXMLParseError, XMLParseError):
+                self._last_raw_reply = bytes(reply_buffer)
+                raise
+            reply_data = None
 
-        if not end_of_sequence and enumeration_context is None:
-            raise CIMXMLParseError(
-                "Expected EnumerationContext output parameter because "
-                "EndOfSequence=False, but did not receive it.",
-                conn_id=self.conn_id)
+        # Set attributes recording the response, part 2.
+        if self.debug:
+            self._last_reply = None  # will be set upon access
+            self._last_reply_xml_item = reply_data
+        elif not self.retain_raw_data:
+            self._last_raw_request = None
+            self._last_raw_reply = None
 
-        # Drop enumeration_context if eos True
-        # Returns tuple of enumeration context and namespace
-        rtn_ctxt = None if end_of_sequence else (enumeration_context,
-                                                 namespace)
-        return (rtn_objects, end_of_sequence, rtn_ctxt)
+        return tup_tree, request_data
 
-    def _get_returned_objects(self, result, ObjectName):
+    def _retains_raw_data(self):
         """
-        Support for Associators, References operations
-        Get returned objects and validate that the types correspond to the types
-        for Associators and References
+        Return a boolean indicating whether the raw CIM-XML request and
+        response of an operation are retained in this connection after the
+        operation has succeeded. See the retain_raw_data init parameter.
         """
-        objects = [] if result is None else [x[2] for x in result[0][2]]
+        return self.retain_raw_data or self.debug
 
-        if isinstance(ObjectName, CIMInstanceName):
-            # instance-level invocation
-            for instance in objects:
-                if not isinstance(instance, CIMInstance):
-                    raise CIMXMLParseError(
-                        _format("Expecting CIMInstance object in result "
-                                "list, got {0} object",
-                                instance.__class__.__name__),
-                        conn_id=self.conn_id)
-        else:
-            # class-level invocation
-            for classpath, klass in objects:
-                if not isinstance(classpath, CIMClassName) or \
-                        not isinstance(klass, CIMClass):
-                    raise CIMXMLParseError(
-                        _format("Expecting tuple (CIMClassName, CIMClass) "
-                                "in result list, got tuple ({0}, {1})",
-                                classpath.__class__.__name__,
-                                klass.__class__.__name__),
-                        conn_id=self.conn_id)
-        return objects
+    def _record_request(self, request_data):
+        """
+        Set the attributes recording the CIM-XML request string in this
+        connection. Also, reset the attributes recording the reply in case the
+        operation fails.
+        """
 
-    def _get_returned_objectnames(self, result, ObjectName):
+        self._last_raw_request = request_data
+        self._last_request_len = len(request_data)
+        self._last_raw_reply = None
+        self._last_reply_len = 0
+        self._last_server_response_time = None
+        if self.debug:
+            self._last_request = None  # will be set upon access
+            self._last_request_xml_item = request_data
+            self._last_reply = None
+            self._last_reply_xml_item = None
+
+    def _streamed_reply(self, request_data, cimxml_headers):
         """
-        Support for AssociatorNames, ReferenceNames operations
+        Send a CIM-XML request with streaming of the response, for the
+        stream_response mode.
 
-        Get returned objects from results and validate that they are either
-        CIMInstanceName if the request was CIMInstanceName or
-        CIMClassName if the request was CIMClassName
+        Returns:
+
+          A generator object that yields the chunks of the response body,
+          recording their length in this connection. The generator object
+          must be exhausted or closed. The response body is retained and set
+          in the last_raw_reply attribute only if debug is enabled.
         """
-        objects = [] if result is None else [x[2] for x in result[0][2]]
 
-        if isinstance(ObjectName, CIMInstanceName):
-            # instance-level invocation
-            for instancepath in objects:
-                if not isinstance(instancepath, CIMInstanceName):
-                    raise CIMXMLParseError(
-                        _format("Expecting CIMInstanceName object in "
-                                "result list, got {0} object",
-                                instancepath.__class__.__name__),
-                        conn_id=self.conn_id)
-        else:
-            # class-level invocation
-            for classpath in objects:
-                if not isinstance(classpath, CIMClassName):
-                    raise CIMXMLParseError(
-                        _format("Expecting CIMClassName object in result "
-                                "list, got {0} object",
-                                classpath.__class__.__name__),
-                        conn_id=self.conn_id)
-        return objects
+        reply_chunks, self._last_server_response_time = wbem_request(
+            self, request_data, cimxml_headers, stream=True)
+
+        return self._iter_reply_chunks(reply_chunks)
+
+    def _iter_reply_chunks(self, reply_chunks):
+        """
+        Generator function that yields the chunks of a streamed response body
+        and records them in this connection. See _streamed_reply().
+        """
+        retained_chunks = [] if self.debug else None
+        try:
+            for chunk in reply_chunks:
+                self._last_reply_len += len(chunk)
+                if retained_chunks is not None:
+                    retained_chunks.append(chunk)
+                yield chunk
+        finally:
+            reply_chunks.close()
+            if retained_chunks is not None:
+                self._last_raw_reply = b''.join(retained_chunks)
 
     ###############################################################
     #
@@ -2887,7 +4272,8 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
 
     def EnumerateInstances(self, ClassName, namespace=None, LocalOnly=None,
                            DeepInheritance=None, IncludeQualifiers=None,
-                           IncludeClassOrigin=None, PropertyList=None):
+                           IncludeClassOrigin=None, PropertyList=None,
+                           enforce_property_list=False):
         # pylint: disable=invalid-name,line-too-long
         """
         Enumerate the instances of a class (including instances of its
@@ -2983,6 +4369,19 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
 
             If `None`, all properties are included.
 
+          enforce_property_list (bool):
+            Controls whether the `PropertyList` parameter is enforced on the
+            client side, for WBEM servers that do not honor it.
+
+            * If `True` and `PropertyList` is not `None`, the properties of
+              the returned instances that are not in `PropertyList` are skipped
+              while the response is parsed, so that no CIM objects are created
+              for them.
+            * If `False`, the returned instances have the properties that are
+              returned by the WBEM server.
+
+            *New in pywbem 1.10.*
+
         Returns:
 
             list: A list of :class:`~pywbem.CIMInstance` objects that are
@@ -3035,6 +4434,8 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
             IncludeClassOrigin = self._iparam_bool(
                 IncludeClassOrigin, 'IncludeClassOrigin')
             PropertyList = _iparam_propertylist(PropertyList)
+            property_filter = _property_filter(
+                PropertyList, enforce_property_list)
 
             result = self._imethodcall(
                 method_name,
@@ -3044,7 +4445,8 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
                 DeepInheritance=DeepInheritance,
                 IncludeQualifiers=IncludeQualifiers,
                 IncludeClassOrigin=IncludeClassOrigin,
-                PropertyList=PropertyList)
+                PropertyList=PropertyList,
+                property_filter=property_filter)
 
             if result is None:
                 instances = []
@@ -3083,6 +4485,160 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
             if self._operation_recorders:
                 self.operation_recorder_stage_result(instances, exc)
 
+    def EnumerateInstancesColumnar(self, ClassName, namespace=None,
+                                   LocalOnly=None, DeepInheritance=None,
+                                   PropertyList=None,
+                                   enforce_property_list=False):
+        # pylint: disable=invalid-name,line-too-long
+        """
+        Enumerate the instances of a class (including instances of its
+        subclasses) in a namespace, and return them in columnar form.
+
+        *New in pywbem 1.10.*
+
+        This method performs the EnumerateInstances operation
+        (see :term:`DSP0200`) without qualifiers and class origin information,
+        and returns the enumerated instances as an
+        :class:`~pywbem.InstanceColumns` object with a column of values for
+        each property and for each keybinding of the instance paths.
+
+        The response is read and parsed incrementally while it is received,
+        and the values are added to the columns directly from the CIM-XML
+        elements of the instances, without creating
+        :class:`~pywbem.CIMInstance` and :class:`~pywbem.CIMProperty` objects.
+        The :attr:`~pywbem.WBEMConnection.direct_decode`,
+        :attr:`~pywbem.WBEMConnection.lazy_instances` and
+        :attr:`~pywbem.WBEMConnection.instance_layouts` modes of the connection
+        do not apply to this method. If
+        :attr:`~pywbem.WBEMConnection.compact_arrays` is enabled, the values
+        of array properties of numeric CIM data types are
+        :class:`~pywbem.CIMNumericArray` objects.
+
+        For collecting the instances of other operations in columnar form,
+        the CIM instances returned by them can be added to an
+        :class:`~pywbem.InstanceColumns` object, for example::
+
+            columns = pywbem.InstanceColumns()
+            columns.add_instances(conn.IterAssociatorInstances(path))
+
+        If the operation succeeds, this method returns.
+        Otherwise, this method raises an exception.
+
+        Parameters:
+
+          ClassName (:class:`py:str` or :class:`~pywbem.CIMClassName`):
+            Name of the class to be enumerated (case independent).
+            If specified as a :class:`~pywbem.CIMClassName` object, its `host`
+            attribute will be ignored.
+
+          namespace (str):
+            Name of the CIM namespace to be used (case independent).
+
+            Leading and trailing slash characters will be stripped. The lexical
+            case will be preserved.
+
+            If `None`, the namespace of the `ClassName` parameter will be used,
+            if specified as a :class:`~pywbem.CIMClassName` object. If that is
+            also `None`, the default namespace of the connection will be used.
+
+          LocalOnly (bool):
+            Controls the exclusion of inherited properties from the returned
+            instances, as described for
+            :meth:`~pywbem.WBEMConnection.EnumerateInstances`.
+
+          DeepInheritance (bool):
+            Indicates that properties added by subclasses of the specified
+            class are to be included in the returned instances, as described
+            for :meth:`~pywbem.WBEMConnection.EnumerateInstances`.
+
+          PropertyList (:class:`py:str` or :term:`py:iterable` of :class:`py:str`):
+            An iterable specifying the names of the properties (or a string
+            that defines a single property) to be included in the returned
+            instances (case independent).
+
+            An empty iterable indicates to include no properties.
+
+            If `None`, all properties are included.
+
+          enforce_property_list (bool):
+            Controls whether the `PropertyList` parameter is enforced on the
+            client side, for WBEM servers that do not honor it, as described
+            for :meth:`~pywbem.WBEMConnection.EnumerateInstances`.
+
+        Returns:
+
+            :class:`~pywbem.InstanceColumns`: The enumerated instances in
+            columnar form. The keybinding columns represent the keybindings of
+            the instance paths, whose namespace is the effective target
+            namespace of the operation.
+
+        Raises:
+
+            : Exceptions described in :class:`~pywbem.WBEMConnection`.
+        """  # noqa: E501
+
+        exc = None
+        columns = None
+        method_name = 'EnumerateInstancesColumnar'
+
+        if self._operation_recorders:
+            self.operation_recorder_reset()
+            self.operation_recorder_stage_pywbem_args(
+                method=method_name,
+                namespace=namespace,
+                ClassName=ClassName,
+                LocalOnly=LocalOnly,
+                DeepInheritance=DeepInheritance,
+                PropertyList=PropertyList)
+
+        stats = self.statistics.start_timer(method_name)
+        try:
+
+            if namespace is None and isinstance(ClassName, CIMClassName):
+                namespace = ClassName.namespace
+            namespace = self._iparam_namespace_from_namespace(namespace)
+            ClassName = self._iparam_classname(
+                ClassName, 'ClassName', required=True)
+            LocalOnly = self._iparam_bool(
+                LocalOnly, 'LocalOnly')
+            DeepInheritance = self._iparam_bool(
+                DeepInheritance, 'DeepInheritance')
+            PropertyList = _iparam_propertylist(PropertyList)
+            property_filter = _property_filter(
+                PropertyList, enforce_property_list)
+
+            # The instances are unpacked from their tupletree nodes, so the
+            # elements are not decoded directly.
+            tp = TupleParser(self.conn_id, self.response_validation,
+                             compact_arrays=self.compact_arrays)
+            columns = InstanceColumns()
+            for item in self._iter_imethodcall_items(
+                    tp, None, 'EnumerateInstances', namespace,
+                    'VALUE.NAMEDINSTANCE', property_filter,
+                    ClassName=ClassName,
+                    LocalOnly=LocalOnly,
+                    DeepInheritance=DeepInheritance,
+                    PropertyList=PropertyList):
+                path, classname, props = tp.unpack_value_namedinstance(item)
+                columns.add_row(classname, path.keybindings.items(), props)
+
+            return columns
+
+        except (CIMXMLParseError, XMLParseError) as exce:
+            exce.request_data = self.last_raw_request
+            exce.response_data = self.last_raw_reply
+            exc = exce
+            raise
+        except Exception as exce:
+            exc = exce
+            raise
+        finally:
+            self._last_operation_time = stats.stop_timer(
+                self.last_request_len, self.last_reply_len,
+                self.last_server_response_time, exc)
+            if self._operation_recorders:
+                self.operation_recorder_stage_result(columns, exc)
+
     def EnumerateInstanceNames(self, ClassName, namespace=None):
         # pylint: disable=invalid-name,line-too-long
         """
@@ -3191,7 +4747,8 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
                 self.operation_recorder_stage_result(instancenames, exc)
 
     def GetInstance(self, InstanceName, LocalOnly=None, IncludeQualifiers=None,
-                    IncludeClassOrigin=None, PropertyList=None):
+                    IncludeClassOrigin=None, PropertyList=None,
+                    enforce_property_list=False):
         # pylint: disable=invalid-name,line-too-long
         """
         Retrieve an instance.
@@ -3262,6 +4819,19 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
 
             If `None`, all properties are included.
 
+          enforce_property_list (bool):
+            Controls whether the `PropertyList` parameter is enforced on the
+            client side, for WBEM servers that do not honor it.
+
+            * If `True` and `PropertyList` is not `None`, the properties of
+              the returned instance that are not in `PropertyList` are skipped
+              while the response is parsed, so that no CIM objects are created
+              for them.
+            * If `False`, the returned instance have the properties that are
+              returned by the WBEM server.
+
+            *New in pywbem 1.10.*
+
         Returns:
 
             :class:`~pywbem.CIMInstance`: A representation of the retrieved
@@ -3308,6 +4878,8 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
             IncludeClassOrigin = self._iparam_bool(
                 IncludeClassOrigin, 'IncludeClassOrigin')
             PropertyList = _iparam_propertylist(PropertyList)
+            property_filter = _property_filter(
+                PropertyList, enforce_property_list)
 
             result = self._imethodcall(
                 method_name,
@@ -3316,19 +4888,10 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
                 LocalOnly=LocalOnly,
                 IncludeQualifiers=IncludeQualifiers,
                 IncludeClassOrigin=IncludeClassOrigin,
-                PropertyList=PropertyList)
-
-            if result is None:
-                raise CIMXMLParseError(
-                    "Expecting a child element below IMETHODRESPONSE, "
-                    "got no child elements", conn_id=self.conn_id)
-            result = result[0][2]  # List of children of IRETURNVALUE
+                PropertyList=PropertyList,
+                property_filter=property_filter)
 
-            if not result:
-                raise CIMXMLParseError(
-                    "Expecting a child element below IRETURNVALUE, "
-                    "got no child elements", conn_id=self.conn_id)
-            instance = result[0]  # CIMInstance object
+            instance = self._single_result(result)
 
             if not isinstance(instance, CIMInstance):
                 raise CIMXMLParseError(
@@ -3643,17 +5206,7 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
                 namespace,
                 NewInstance=NewInstance)
 
-            if result is None:
-                raise CIMXMLParseError(
-                    "Expecting a child element below IMETHODRESPONSE, "
-                    "got no child elements", conn_id=self.conn_id)
-            result = result[0][2]  # List of children of IRETURNVALUE
-
-            if not result:
-                raise CIMXMLParseError(
-                    "Expecting a child element below IRETURNVALUE, "
-                    "got no child elements", conn_id=self.conn_id)
-            instancename = result[0]  # CIMInstanceName object
+            instancename = self._single_result(result)
 
             if not isinstance(instancename, CIMInstanceName):
                 raise CIMXMLParseError(
@@ -3750,7 +5303,8 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
 
     def Associators(self, ObjectName, AssocClass=None, ResultClass=None,
                     Role=None, ResultRole=None, IncludeQualifiers=None,
-                    IncludeClassOrigin=None, PropertyList=None):
+                    IncludeClassOrigin=None, PropertyList=None,
+                    enforce_property_list=False):
         # pylint: disable=invalid-name, line-too-long
         """
         Retrieve the instances associated to a source instance, or the classes
@@ -3856,6 +5410,22 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
 
             If `None`, all properties are included.
 
+          enforce_property_list (bool):
+            Controls whether the `PropertyList` parameter is enforced on the
+            client side, for WBEM servers that do not honor it.
+
+            * If `True` and `PropertyList` is not `None`, the properties of
+              the returned instances that are not in `PropertyList` are skipped
+              while the response is parsed, so that no CIM objects are created
+              for them.
+            * If `False`, the returned instances have the properties that are
+              returned by the WBEM server.
+
+            The properties of returned classes (for class-level use) are not
+            affected.
+
+            *New in pywbem 1.10.*
+
         Returns:
 
             list: The returned list of objects depends on the usage:
@@ -3932,6 +5502,8 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
             IncludeClassOrigin = self._iparam_bool(
                 IncludeClassOrigin, 'IncludeClassOrigin')
             PropertyList = _iparam_propertylist(PropertyList)
+            property_filter = _property_filter(
+                PropertyList, enforce_property_list)
 
             result = self._imethodcall(
                 method_name,
@@ -3943,7 +5515,8 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
                 ResultRole=ResultRole,
                 IncludeQualifiers=IncludeQualifiers,
                 IncludeClassOrigin=IncludeClassOrigin,
-                PropertyList=PropertyList)
+                PropertyList=PropertyList,
+                property_filter=property_filter)
 
             objects = self._get_returned_objects(result, ObjectName)
             # namespace already set
@@ -4123,7 +5696,7 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
 
     def References(self, ObjectName, ResultClass=None, Role=None,
                    IncludeQualifiers=None, IncludeClassOrigin=None,
-                   PropertyList=None):
+                   PropertyList=None, enforce_property_list=False):
         # pylint: disable=invalid-name, line-too-long
         """
         Retrieve the association instances that reference a source instance,
@@ -4213,6 +5786,22 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
 
             If `None`, all properties are included.
 
+          enforce_property_list (bool):
+            Controls whether the `PropertyList` parameter is enforced on the
+            client side, for WBEM servers that do not honor it.
+
+            * If `True` and `PropertyList` is not `None`, the properties of
+              the returned instances that are not in `PropertyList` are skipped
+              while the response is parsed, so that no CIM objects are created
+              for them.
+            * If `False`, the returned instances have the properties that are
+              returned by the WBEM server.
+
+            The properties of returned classes (for class-level use) are not
+            affected.
+
+            *New in pywbem 1.10.*
+
         Returns:
 
             list: The returned list of objects depends on the usage:
@@ -4285,6 +5874,8 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
             IncludeClassOrigin = self._iparam_bool(
                 IncludeClassOrigin, 'IncludeClassOrigin')
             PropertyList = _iparam_propertylist(PropertyList)
+            property_filter = _property_filter(
+                PropertyList, enforce_property_list)
 
             result = self._imethodcall(
                 method_name,
@@ -4294,7 +5885,8 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
                 Role=Role,
                 IncludeQualifiers=IncludeQualifiers,
                 IncludeClassOrigin=IncludeClassOrigin,
-                PropertyList=PropertyList)
+                PropertyList=PropertyList,
+                property_filter=property_filter)
 
             objects = self._get_returned_objects(result, ObjectName)
             # path and namespace are already set
@@ -4682,13 +6274,67 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
             if self._operation_recorders:
                 self.operation_recorder_stage_result(instances, exc)
 
+    def _iter_prefetched(self, pull_method_name, pull_result, MaxObjectCount,
+                         prefetch):
+        # pylint: disable=invalid-name
+        """
+        Generator function that yields the instances of the result of an
+        Open...() operation and of the subsequent pull operations of the
+        enumeration session, whose pull operations are issued by a background
+        thread up to `prefetch` pull operations ahead of the consumer.
+
+        The background thread performs the pull operations on a private copy
+        of this connection, because the connection is not safe to be used by
+        multiple threads at the same time (see _prefetch_connection() for the
+        consequences).
+
+        The enumeration session is closed when the generator is closed before
+        it is exhausted. If a pull operation has failed, exceptions raised
+        when closing the enumeration session are ignored, so that they do not
+        replace the exception of the pull operation.
+
+        Parameters:
+
+          pull_method_name (str): Name of the Pull...() method to use.
+
+          pull_result: The result tuple of the Open...() operation.
+
+          MaxObjectCount (int): MaxObjectCount parameter for the pull
+            operations.
+
+          prefetch (int): Maximum number of pull results ahead of the
+            consumer.
+        """
+        pull_method = getattr(_prefetch_connection(self), pull_method_name)
+        prefetcher = _PullPrefetcher(
+            pull_method, pull_result.context, MaxObjectCount, prefetch)
+        try:
+            yield from pull_result.instances
+            while not pull_result.eos:
+                pull_result = prefetcher.next_result()
+                yield from pull_result.instances
+        finally:
+            # Cleanup only required if the pull context is open and not
+            # complete. This uses the most recent enumeration context, which
+            # may belong to a pull result the consumer has not seen yet.
+            pull_result = prefetcher.stop() or pull_result
+            if not pull_result.eos:
+                if prefetcher.failed:
+                    try:
+                        self.CloseEnumeration(pull_result.context)
+                    except Error:
+                        pass
+                else:
+                    self.CloseEnumeration(pull_result.context)
+
     def IterEnumerateInstances(self, ClassName, namespace=None,
                                LocalOnly=None,
                                DeepInheritance=None, IncludeQualifiers=None,
                                IncludeClassOrigin=None, PropertyList=None,
                                FilterQueryLanguage=None, FilterQuery=None,
                                OperationTimeout=None, ContinueOnError=None,
-                               MaxObjectCount=DEFAULT_ITER_MAXOBJECTCOUNT):
+                               MaxObjectCount=DEFAULT_ITER_MAXOBJECTCOUNT,
+                               prefetch=None, enforce_property_list=False):
         # pylint: disable=invalid-name,line-too-long
         """
         Enumerate the instances of a class (including instances of its
@@ -4924,6 +6570,40 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
             between 100 and 1000 typically do not have a significant impact on
             either memory or overall efficiency.
 
+          prefetch (:term:`integer`):
+            Controls prefetching of pull results, if pull operations are used
+            by this method.
+
+            * If a positive integer, the pull operations are issued by a
+              background thread, up to the specified number of pull
+              operations ahead of the caller iterating through the returned
+              generator object. This overlaps the network latency of the pull
+              operations with the processing of the instances by the caller.
+            * If `None`, each pull operation is issued only after the caller
+              has iterated through all instances of the previous
+              pull result.
+
+            The background thread issues the pull operations on a private
+            copy of the connection, so these pull operations are not
+            reflected in the `last_*` attributes and in the operation
+            recorders of the connection. They are included in the statistics
+            of the connection.
+
+            *New in pywbem 1.10.*
+
+          enforce_property_list (bool):
+            Controls whether the `PropertyList` parameter is enforced on the
+            client side, for WBEM servers that do not honor it.
+
+            * If `True` and `PropertyList` is not `None`, the properties of
+              the returned instances that are not in `PropertyList` are skipped
+              while the response is parsed, so that no CIM objects are created
+              for them.
+            * If `False`, the returned instances have the properties that are
+              returned by the WBEM server.
+
+            *New in pywbem 1.10.*
+
         Raises:
 
             : Exceptions described in :class:`~pywbem.WBEMConnection`.
@@ -4953,6 +6633,7 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
         # The other parameters are validated in the operations called
         _validate_OperationTimeout(OperationTimeout)
         _validate_MaxObjectCount_Iter(MaxObjectCount)
+        _validate_prefetch(prefetch)
 
         # Common variable for pull result tuple used by pulls and finally:
         pull_result = None
@@ -4969,11 +6650,22 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
                         FilterQuery=FilterQuery,
                         OperationTimeout=OperationTimeout,
                         ContinueOnError=ContinueOnError,
-                        MaxObjectCount=MaxObjectCount)
+                        MaxObjectCount=MaxObjectCount,
+                        enforce_property_list=enforce_property_list)
 
                     # Open operation succeeded; set has_pull flag
                     self._use_enum_inst_pull_operations = True
 
+                    if prefetch and not pull_result.eos:
+                        # The prefetching generator takes over the enumeration
+                        # session, including closing it.
+                        prefetched = self._iter_prefetched(
+                            'PullInstancesWithPath', pull_result,
+                            MaxObjectCount, prefetch)
+                        pull_result = None
+                        yield from prefetched
+                        return
+
                     for inst in pull_result.instances:
                         yield inst
 
@@ -5026,19 +6718,38 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
             raise ValueError('EnumerateInstances does not support '
                              'ContinueOnError.')
 
-        enum_rslt = self.EnumerateInstances(
-            ClassName,
-            namespace=namespace,
-            LocalOnly=LocalOnly,
-            DeepInheritance=DeepInheritance,
-            IncludeQualifiers=IncludeQualifiers,
-            IncludeClassOrigin=IncludeClassOrigin,
-            PropertyList=PropertyList)
+        if self.stream_response:
+            # The instances are yielded as soon as they have been received,
+            # so they are completed one at a time below.
+            enum_rslt = self._iter_streamed_operation(
+                'EnumerateInstances',
+                self._iparam_namespace_from_classname(namespace, ClassName),
+                'VALUE.NAMEDINSTANCE',
+                _property_filter(
+                    _iparam_propertylist(PropertyList), enforce_property_list),
+                ClassName=self._iparam_classname(
+                    ClassName, 'ClassName', required=True),
+                LocalOnly=self._iparam_bool(LocalOnly, 'LocalOnly'),
+                DeepInheritance=self._iparam_bool(
+                    DeepInheritance, 'DeepInheritance'),
+                IncludeQualifiers=self._iparam_bool(
+                    IncludeQualifiers, 'IncludeQualifiers'),
+                IncludeClassOrigin=self._iparam_bool(
+                    IncludeClassOrigin, 'IncludeClassOrigin'),
+                PropertyList=_iparam_propertylist(PropertyList))
+        else:
+            enum_rslt = self.EnumerateInstances(
+                ClassName,
+                namespace=namespace,
+                LocalOnly=LocalOnly,
+                DeepInheritance=DeepInheritance,
+                IncludeQualifiers=IncludeQualifiers,
+                IncludeClassOrigin=IncludeClassOrigin,
+                PropertyList=PropertyList,
+                enforce_property_list=enforce_property_list)
 
         # get namespace for the operation
-        if namespace is None and isinstance(ClassName, CIMClassName):
-            namespace = ClassName.namespace
-        namespace = self._iparam_namespace_from_namespace(namespace)
+        namespace = self._iparam_namespace_from_classname(namespace, ClassName)
 
         # Complete namespace and host components of the path if they are not
         # provided from the host. This covers cases where the namespace might
@@ -5050,8 +6761,6 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
                 inst.path.namespace = namespace
             if inst.path.host is None:
                 inst.path.host = self.host
-
-        for inst in enum_rslt:
             yield inst
 
     def IterEnumerateInstancePaths(self, ClassName, namespace=None,
@@ -5309,13 +7018,21 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
             raise ValueError('EnumerateInstanceNames does not support '
                              'ContinueOnError.')
 
-        enum_rslt = self.EnumerateInstanceNames(
-            ClassName, namespace=namespace)
+        if self.stream_response:
+            # The instance paths are yielded as soon as they have been
+            # received, so they are completed one at a time below.
+            enum_rslt = self._iter_streamed_operation(
+                'EnumerateInstanceNames',
+                self._iparam_namespace_from_classname(namespace, ClassName),
+                'INSTANCENAME',
+                ClassName=self._iparam_classname(
+                    ClassName, 'ClassName', required=True))
+        else:
+            enum_rslt = self.EnumerateInstanceNames(
+                ClassName, namespace=namespace)
 
         # get namespace for the operation
-        if namespace is None and isinstance(ClassName, CIMClassName):
-            namespace = ClassName.namespace
-        namespace = self._iparam_namespace_from_namespace(namespace)
+        namespace = self._iparam_namespace_from_classname(namespace, ClassName)
 
         # Complete namespace and host components of the path if they are not
         # provided from the host. This covers cases where the namespace might
@@ -5327,8 +7044,7 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
                 path.namespace = namespace
             if path.host is None:
                 path.host = self.host
-
-        yield from enum_rslt
+            yield path
 
     def IterAssociatorInstances(self, InstanceName, AssocClass=None,
                                 ResultClass=None,
@@ -5337,7 +7053,8 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
                                 IncludeClassOrigin=None, PropertyList=None,
                                 FilterQueryLanguage=None, FilterQuery=None,
                                 OperationTimeout=None, ContinueOnError=None,
-                                MaxObjectCount=DEFAULT_ITER_MAXOBJECTCOUNT):
+                                MaxObjectCount=DEFAULT_ITER_MAXOBJECTCOUNT,
+                                prefetch=None, enforce_property_list=False):
         # pylint: disable=invalid-name,line-too-long
         """
         Retrieve the instances associated to a source instance, using the
@@ -5555,6 +7272,40 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
             * The default is defined as a system config variable.
             * `None` is not allowed.
 
+          prefetch (:term:`integer`):
+            Controls prefetching of pull results, if pull operations are used
+            by this method.
+
+            * If a positive integer, the pull operations are issued by a
+              background thread, up to the specified number of pull
+              operations ahead of the caller iterating through the returned
+              generator object. This overlaps the network latency of the pull
+              operations with the processing of the instances by the caller.
+            * If `None`, each pull operation is issued only after the caller
+              has iterated through all instances of the previous
+              pull result.
+
+            The background thread issues the pull operations on a private
+            copy of the connection, so these pull operations are not
+            reflected in the `last_*` attributes and in the operation
+            recorders of the connection. They are included in the statistics
+            of the connection.
+
+            *New in pywbem 1.10.*
+
+          enforce_property_list (bool):
+            Controls whether the `PropertyList` parameter is enforced on the
+            client side, for WBEM servers that do not honor it.
+
+            * If `True` and `PropertyList` is not `None`, the properties of
+              the returned instances that are not in `PropertyList` are skipped
+              while the response is parsed, so that no CIM objects are created
+              for them.
+            * If `False`, the returned instances have the properties that are
+              returned by the WBEM server.
+
+            *New in pywbem 1.10.*
+
         Returns:
 
           :term:`py:generator` iterating :class:`~pywbem.CIMInstance`:
@@ -5581,6 +7332,7 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
         # The other parameters are validated in the operations called
         _validate_OperationTimeout(OperationTimeout)
         _validate_MaxObjectCount_Iter(MaxObjectCount)
+        _validate_prefetch(prefetch)
 
         # Common variable for pull result tuple used by pulls and finally:
         pull_result = None
@@ -5600,11 +7352,22 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
                         FilterQuery=FilterQuery,
                         OperationTimeout=OperationTimeout,
                         ContinueOnError=ContinueOnError,
-                        MaxObjectCount=MaxObjectCount)
+                        MaxObjectCount=MaxObjectCount,
+                        enforce_property_list=enforce_property_list)
 
                     # Open operation succeeded; set has_pull flag
                     self._use_assoc_inst_pull_operations = True
 
+                    if prefetch and not pull_result.eos:
+                        # The prefetching generator takes over the enumeration
+                        # session, including closing it.
+                        prefetched = self._iter_prefetched(
+                            'PullInstancesWithPath', pull_result,
+                            MaxObjectCount, prefetch)
+                        pull_result = None
+                        yield from prefetched
+                        return
+
                     yield from pull_result.instances
 
                     # Loop to pull while more while eos not returned.
@@ -5663,7 +7426,8 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
             ResultRole=ResultRole,
             IncludeQualifiers=IncludeQualifiers,
             IncludeClassOrigin=IncludeClassOrigin,
-            PropertyList=PropertyList)
+            PropertyList=PropertyList,
+            enforce_property_list=enforce_property_list)
 
         yield from enum_rslt
 
@@ -5955,7 +7719,8 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
                                IncludeClassOrigin=None, PropertyList=None,
                                FilterQueryLanguage=None, FilterQuery=None,
                                OperationTimeout=None, ContinueOnError=None,
-                               MaxObjectCount=DEFAULT_ITER_MAXOBJECTCOUNT):
+                               MaxObjectCount=DEFAULT_ITER_MAXOBJECTCOUNT,
+                               prefetch=None, enforce_property_list=False):
         # pylint: disable=invalid-name,line-too-long
         """
         Retrieve the association instances that reference a source instance,
@@ -6151,6 +7916,40 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
             * The default is defined as a system config variable.
             * `None` is not allowed.
 
+          prefetch (:term:`integer`):
+            Controls prefetching of pull results, if pull operations are used
+            by this method.
+
+            * If a positive integer, the pull operations are issued by a
+              background thread, up to the specified number of pull
+              operations ahead of the caller iterating through the returned
+              generator object. This overlaps the network latency of the pull
+              operations with the processing of the instances by the caller.
+            * If `None`, each pull operation is issued only after the caller
+              has iterated through all instances of the previous
+              pull result.
+
+            The background thread issues the pull operations on a private
+            copy of the connection, so these pull operations are not
+            reflected in the `last_*` attributes and in the operation
+            recorders of the connection. They are included in the statistics
+            of the connection.
+
+            *New in pywbem 1.10.*
+
+          enforce_property_list (bool):
+            Controls whether the `PropertyList` parameter is enforced on the
+            client side, for WBEM servers that do not honor it.
+
+            * If `True` and `PropertyList` is not `None`, the properties of
+              the returned instances that are not in `PropertyList` are skipped
+              while the response is parsed, so that no CIM objects are created
+              for them.
+            * If `False`, the returned instances have the properties that are
+              returned by the WBEM server.
+
+            *New in pywbem 1.10.*
+
         Returns:
 
           :term:`py:generator` iterating :class:`~pywbem.CIMInstance`:
@@ -6177,6 +7976,7 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
         # The other parameters are validated in the operations called
         _validate_OperationTimeout(OperationTimeout)
         _validate_MaxObjectCount_Iter(MaxObjectCount)
+        _validate_prefetch(prefetch)
 
         # Common variable for pull result tuple used by pulls and finally:
         pull_result = None
@@ -6194,10 +7994,21 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
                         FilterQuery=FilterQuery,
                         OperationTimeout=OperationTimeout,
                         ContinueOnError=ContinueOnError,
-                        MaxObjectCount=MaxObjectCount)
+                        MaxObjectCount=MaxObjectCount,
+                        enforce_property_list=enforce_property_list)
 
                     # Open operation succeeded; set has_pull flag
                     self._use_ref_inst_pull_operations = True
+
+                    if prefetch and not pull_result.eos:
+                        # The prefetching generator takes over the enumeration
+                        # session, including closing it.
+                        prefetched = self._iter_prefetched(
+                            'PullInstancesWithPath', pull_result,
+                            MaxObjectCount, prefetch)
+                        pull_result = None
+                        yield from prefetched
+                        return
                     yield from pull_result.instances
 
                     # Loop to pull while more while eos not returned.
@@ -6253,7 +8064,8 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
             Role=Role,
             IncludeQualifiers=IncludeQualifiers,
             IncludeClassOrigin=IncludeClassOrigin,
-            PropertyList=PropertyList)
+            PropertyList=PropertyList,
+            enforce_property_list=enforce_property_list)
 
         yield from enum_rslt
 
@@ -6522,7 +8334,8 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
     def IterQueryInstances(self, FilterQueryLanguage, FilterQuery,
                            namespace=None, ReturnQueryResultClass=None,
                            OperationTimeout=None, ContinueOnError=None,
-                           MaxObjectCount=DEFAULT_ITER_MAXOBJECTCOUNT):
+                           MaxObjectCount=DEFAULT_ITER_MAXOBJECTCOUNT,
+                           prefetch=None):
         # pylint: disable=line-too-long
         """
         Execute a query in a namespace, using the Python :term:`py:generator`
@@ -6543,7 +8356,8 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
         generator object that returns the instances in the query result one by
         one (using :keyword:`yield`) when the caller iterates through the
         generator object. This design causes the entire query result to be
-        materialized, even if pull operations are used.
+        materialized, even if pull operations are used, unless the `prefetch`
+        parameter is used.
 
         By default, this method attempts to perform the corresponding pull
         operations
@@ -6683,6 +8497,33 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
             A generator object that iterates the CIM instances representing the
             query result. These instances do not have an instance path set.
 
+          prefetch (:term:`integer`):
+            Controls prefetching of pull results, if pull operations are used
+            by this method.
+
+            * If a positive integer, this method returns after the open
+              operation, and the instances of the subsequent pull operations
+              are returned while the caller iterates through the generator of
+              the returned object. The pull operations are issued by a
+              background thread, up to the specified number of pull
+              operations ahead of the caller. This overlaps the network
+              latency of the pull operations with the processing of the
+              instances by the caller, and avoids materializing the entire
+              query result. In this case, the `instances` attribute of the
+              returned object is an iterator instead of a list, and the
+              enumeration session is closed when its generator is exhausted
+              or closed.
+            * If `None`, all pull operations are issued before this method
+              returns.
+
+            The background thread issues the pull operations on a private
+            copy of the connection, so these pull operations are not
+            reflected in the `last_*` attributes and in the operation
+            recorders of the connection. They are included in the statistics
+            of the connection.
+
+            *New in pywbem 1.10.*
+
         Raises:
 
             : Exceptions described in :class:`~pywbem.WBEMConnection`.
@@ -6700,6 +8541,7 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
         # The other parameters are validated in the operations called
         _validate_OperationTimeout(OperationTimeout)
         _validate_MaxObjectCount_Iter(MaxObjectCount)
+        _validate_prefetch(prefetch)
 
         # Common variable for pull result tuple used by pulls and finally:
         pull_result = None
@@ -6726,6 +8568,16 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
                     qrc = pull_result.query_result_class if \
                         ReturnQueryResultClass else None
 
+                    if prefetch and not pull_result.eos:
+                        # The prefetching generator takes over the enumeration
+                        # session, including closing it.
+                        prefetched = self._iter_prefetched(
+                            'PullInstances', pull_result, MaxObjectCount,
+                            prefetch)
+                        pull_result = None
+                        return IterQueryInstancesReturn(
+                            prefetched, query_result_class=qrc)
+
                     # ISSUE #2668: Change to yield each Open/Pull instead of
                     # first calculating the total result and then yielding it.
                     # NOTE that this is only a performance issue. All instances
@@ -6797,7 +8649,8 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
                                IncludeClassOrigin=None, PropertyList=None,
                                FilterQueryLanguage=None, FilterQuery=None,
                                OperationTimeout=None, ContinueOnError=None,
-                               MaxObjectCount=None):
+                               MaxObjectCount=None,
+                               enforce_property_list=False):
         # pylint: disable=invalid-name,line-too-long
         """
         Open an enumeration session to enumerate the instances of a class
@@ -6933,6 +8786,24 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
               :term:`DSP0200` defines that the server-implemented default is
               to return zero instances.
 
+          enforce_property_list (bool):
+            Controls whether the `PropertyList` parameter is enforced on the
+            client side, for WBEM servers that do not honor it.
+
+            * If `True` and `PropertyList` is not `None`, the properties of
+              the returned instances that are not in `PropertyList` are skipped
+              while the response is parsed, so that no CIM objects are created
+              for them.
+            * If `False`, the returned instances have the properties that are
+              returned by the WBEM server.
+
+            The `PropertyList` parameter is also enforced for the
+            instances returned by
+            :meth:`~pywbem.WBEMConnection.PullInstancesWithPath` in this
+            enumeration session.
+
+            *New in pywbem 1.10.*
+
         Returns:
 
             :func:`~py:collections.namedtuple`: A tuple with the following
@@ -7032,6 +8903,8 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
             IncludeClassOrigin = self._iparam_bool(
                 IncludeClassOrigin, 'IncludeClassOrigin')
             PropertyList = _iparam_propertylist(PropertyList)
+            property_filter = _property_filter(
+                PropertyList, enforce_property_list)
             FilterQueryLanguage = self._iparam_string(
                 FilterQueryLanguage, 'FilterQueryLanguage')
             FilterQuery = self._iparam_string(FilterQuery, 'FilterQuery')
@@ -7053,10 +8926,13 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
                 OperationTimeout=OperationTimeout,
                 ContinueOnError=ContinueOnError,
                 MaxObjectCount=MaxObjectCount,
-                has_out_params=True)
+                has_out_params=True,
+                property_filter=property_filter)
 
             result_tuple = pull_inst_result_tuple(
                 *self._get_rslt_params(result, namespace))
+            self._update_pull_property_filter(
+                None, result_tuple, property_filter)
             return result_tuple
 
         except (CIMXMLParseError, XMLParseError) as exce:
@@ -7310,7 +9186,8 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
                                 IncludeClassOrigin=None,
                                 PropertyList=None, FilterQueryLanguage=None,
                                 FilterQuery=None, OperationTimeout=None,
-                                ContinueOnError=None, MaxObjectCount=None):
+                                ContinueOnError=None, MaxObjectCount=None,
+                                enforce_property_list=False):
         # pylint: disable=invalid-name
         # pylint: disable=invalid-name,line-too-long
         """
@@ -7455,6 +9332,24 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
               :term:`DSP0200` defines that the server-implemented default is
               to return zero instances.
 
+          enforce_property_list (bool):
+            Controls whether the `PropertyList` parameter is enforced on the
+            client side, for WBEM servers that do not honor it.
+
+            * If `True` and `PropertyList` is not `None`, the properties of
+              the returned instances that are not in `PropertyList` are skipped
+              while the response is parsed, so that no CIM objects are created
+              for them.
+            * If `False`, the returned instances have the properties that are
+              returned by the WBEM server.
+
+            The `PropertyList` parameter is also enforced for the
+            instances returned by
+            :meth:`~pywbem.WBEMConnection.PullInstancesWithPath` in this
+            enumeration session.
+
+            *New in pywbem 1.10.*
+
         Returns:
 
             :func:`~py:collections.namedtuple`: A tuple with the following
@@ -7543,6 +9438,8 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
             IncludeClassOrigin = self._iparam_bool(
                 IncludeClassOrigin, 'IncludeClassOrigin')
             PropertyList = _iparam_propertylist(PropertyList)
+            property_filter = _property_filter(
+                PropertyList, enforce_property_list)
             FilterQueryLanguage = self._iparam_string(
                 FilterQueryLanguage, 'FilterQueryLanguage')
             FilterQuery = self._iparam_string(FilterQuery, 'FilterQuery')
@@ -7567,10 +9464,13 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
                 OperationTimeout=OperationTimeout,
                 ContinueOnError=ContinueOnError,
                 MaxObjectCount=MaxObjectCount,
-                has_out_params=True)
+                has_out_params=True,
+                property_filter=property_filter)
 
             result_tuple = pull_inst_result_tuple(
                 *self._get_rslt_params(result, namespace))
+            self._update_pull_property_filter(
+                None, result_tuple, property_filter)
             return result_tuple
 
         except (CIMXMLParseError, XMLParseError) as exce:
@@ -7846,7 +9746,8 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
                                IncludeClassOrigin=None, PropertyList=None,
                                FilterQueryLanguage=None, FilterQuery=None,
                                OperationTimeout=None, ContinueOnError=None,
-                               MaxObjectCount=None):
+                               MaxObjectCount=None,
+                               enforce_property_list=False):
         # pylint: disable=invalid-name
         # pylint: disable=invalid-name,line-too-long
         """
@@ -7976,6 +9877,24 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
               to return zero instances.
 
 
+          enforce_property_list (bool):
+            Controls whether the `PropertyList` parameter is enforced on the
+            client side, for WBEM servers that do not honor it.
+
+            * If `True` and `PropertyList` is not `None`, the properties of
+              the returned instances that are not in `PropertyList` are skipped
+              while the response is parsed, so that no CIM objects are created
+              for them.
+            * If `False`, the returned instances have the properties that are
+              returned by the WBEM server.
+
+            The `PropertyList` parameter is also enforced for the
+            instances returned by
+            :meth:`~pywbem.WBEMConnection.PullInstancesWithPath` in this
+            enumeration session.
+
+            *New in pywbem 1.10.*
+
         Returns:
 
             :func:`~py:collections.namedtuple`: A tuple with the following
@@ -8061,6 +9980,8 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
             IncludeClassOrigin = self._iparam_bool(
                 IncludeClassOrigin, 'IncludeClassOrigin')
             PropertyList = _iparam_propertylist(PropertyList)
+            property_filter = _property_filter(
+                PropertyList, enforce_property_list)
             FilterQueryLanguage = self._iparam_string(
                 FilterQueryLanguage, 'FilterQueryLanguage')
             FilterQuery = self._iparam_string(FilterQuery, 'FilterQuery')
@@ -8083,10 +10004,13 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
                 OperationTimeout=OperationTimeout,
                 ContinueOnError=ContinueOnError,
                 MaxObjectCount=MaxObjectCount,
-                has_out_params=True)
+                has_out_params=True,
+                property_filter=property_filter)
 
             result_tuple = pull_inst_result_tuple(
                 *self._get_rslt_params(result, namespace))
+            self._update_pull_property_filter(
+                None, result_tuple, property_filter)
             return result_tuple
 
         except (CIMXMLParseError, XMLParseError) as exce:
@@ -8482,25 +10406,6 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
             : Exceptions described in :class:`~pywbem.WBEMConnection`.
         """
 
-        def _GetQueryRsltClass(result):
-            """ Get the QueryResultClass and return it or generate
-                exception.
-            """
-
-            for p in result:
-                if p[0] == 'QueryResultClass':
-                    class_obj = p[2]
-                    if not isinstance(class_obj, CIMClass):
-                        raise CIMXMLParseError(
-                            _format("Expecting CIMClass object in "
-                                    "QueryResultClass output parameter, got "
-                                    "{0} object", class_obj.__class__.__name__),
-                            conn_id=self.conn_id)
-                    return class_obj
-            raise CIMXMLParseError(
-                "QueryResultClass output parameter is missing",
-                conn_id=self.conn_id)
-
         exc = None
         result_tuple = None
         method_name = 'OpenQueryInstances'
@@ -8545,7 +10450,7 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
 
             insts, eos, enum_ctxt = self._get_rslt_params(result, namespace)
 
-            query_result_class = _GetQueryRsltClass(result) if \
+            query_result_class = self._query_result_class(result) if \
                 ReturnQueryResultClass else None
 
             result_tuple = pull_query_result_tuple(insts, eos, enum_ctxt,
@@ -8690,15 +10595,22 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
             _validate_context(context)
             namespace = context[1]
 
+            # Property filter if the enumeration session was opened with
+            # enforce_property_list
+            property_filter = self._pull_property_filters.get(context[0])
+
             result = self._imethodcall(
                 method_name,
                 namespace=namespace,
                 EnumerationContext=context[0],
                 MaxObjectCount=MaxObjectCount,
-                has_out_params=True)
+                has_out_params=True,
+                property_filter=property_filter)
 
             result_tuple = pull_inst_result_tuple(
                 *self._get_rslt_params(result, namespace))
+            self._update_pull_property_filter(
+                context, result_tuple, property_filter)
             return result_tuple
 
         except (CIMXMLParseError, XMLParseError) as exce:
@@ -9053,6 +10965,8 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
 
             _validate_context(context)
 
+            self._pull_property_filters.pop(context[0], None)
+
             self._imethodcall(
                 method_name,
                 namespace=context[1],
@@ -9496,17 +11410,7 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
                 IncludeClassOrigin=IncludeClassOrigin,
                 PropertyList=PropertyList)
 
-            if result is None:
-                raise CIMXMLParseError(
-                    "Expecting a child element below IMETHODRESPONSE, "
-                    "got no child elements", conn_id=self.conn_id)
-            result = result[0][2]  # List of children of IRETURNVALUE
-
-            if not result:
-                raise CIMXMLParseError(
-                    "Expecting a child element below IRETURNVALUE, "
-                    "got no child elements", conn_id=self.conn_id)
-            klass = result[0]  # CIMClass object
+            klass = self._single_result(result)
 
             if not isinstance(klass, CIMClass):
                 raise CIMXMLParseError(
@@ -9911,17 +11815,7 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
                 namespace,
                 QualifierName=QualifierName)
 
-            if result is None:
-                raise CIMXMLParseError(
-                    "Expecting a child element below IMETHODRESPONSE, "
-                    "got no child elements", conn_id=self.conn_id)
-            result = result[0][2]  # List of children of IRETURNVALUE
-
-            if not result:
-                raise CIMXMLParseError(
-                    "Expecting a child element below IRETURNVALUE, "
-                    "got no child elements", conn_id=self.conn_id)
-            qualifierdecl = result[0]  # CIMQualifierDeclaration object
+            qualifierdecl = self._single_result(result)
 
             if not isinstance(qualifierdecl, CIMQualifierDeclaration):
                 raise CIMXMLParseError(
@@ -10200,3 +12094,449 @@ class WBEMConnection:  # pylint: disable=too-many-instance-attributes
                 IncludeQualifiers=False, IncludeClassOrigin=False)
 
         return False
+
+
+class BatchOperation:
+    """
+    *New in pywbem 1.10 as experimental.*
+
+    A WBEM operation that was added to a :class:`~pywbem.WBEMBatch`, and its
+    result after the batch has been executed.
+
+    Objects of this class are returned by the operation methods of
+    :class:`~pywbem.WBEMBatch` and should not be created by users.
+    """
+
+    def __init__(self, method_name, args, kwargs):
+        """
+        Parameters:
+
+          method_name (str): Name of the WBEMConnection method of the
+            operation.
+
+          args (tuple): Positional arguments for the method.
+
+          kwargs (dict): Keyword arguments for the method.
+        """
+        self._method_name = method_name
+        self._args = args
+        self._kwargs = kwargs
+        self._done = False
+        self._result = None
+        self._exception = None
+
+    def __repr__(self):
+        """
+        Return a representation of the operation with its state, for
+        debugging purposes.
+        """
+        return (
+            f"BatchOperation(method_name={self._method_name!r}, "
+            f"done={self._done!r}, exception={self._exception!r})")
+
+    @property
+    def method_name(self):
+        """
+        :term:`string`: Name of the :class:`~pywbem.WBEMConnection` method
+        of the operation (e.g. 'GetInstance').
+        """
+        return self._method_name
+
+    @property
+    def done(self):
+        """
+        :class:`py:bool`: Indicates whether the operation has been performed,
+        i.e. whether the batch has been executed.
+        """
+        return self._done
+
+    def result(self):
+        """
+        Return the result of the operation, i.e. the return value of the
+        :class:`~pywbem.WBEMConnection` method of the operation.
+
+        Raises:
+
+          Exception: The exception raised by the operation.
+          RuntimeError: The batch has not been executed.
+        """
+        if self.exception() is not None:
+            raise self._exception
+        return self._result
+
+    def exception(self):
+        """
+        Return the exception raised by the operation, or `None` if the
+        operation succeeded.
+
+        Raises:
+
+          RuntimeError: The batch has not been executed.
+        """
+        if not self._done:
+            raise RuntimeError(
+                _format("The {0} operation has not been performed, because "
+                        "its batch has not been executed", self._method_name))
+        return self._exception
+
+    def _run(self, conn):
+        """
+        Perform the operation on a connection and set its result or
+        exception.
+        """
+        try:
+            result = getattr(conn, self._method_name)(
+                *self._args, **self._kwargs)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            self._set_exception(exc)
+        else:
+            self._set_result(result)
+
+    def _set_result(self, result):
+        """Set the result of the operation."""
+        self._result = result
+        self._done = True
+
+    def _set_exception(self, exc):
+        """Set the exception raised by the operation."""
+        self._exception = exc
+        self._done = True
+
+
+class WBEMBatch:
+    """
+    *New in pywbem 1.10 as experimental.*
+
+    A batch of WBEM operations on a :class:`~pywbem.WBEMConnection`, that
+    are performed together with few HTTP round trips.
+
+    Objects of this class are returned by
+    :meth:`~pywbem.WBEMConnection.batch` and should not be created by users.
+
+    A batch has the following methods for adding an operation to it, with the
+    same parameters as the corresponding methods of
+    :class:`~pywbem.WBEMConnection`: EnumerateInstances,
+    EnumerateInstanceNames, GetInstance, ModifyInstance, CreateInstance,
+    DeleteInstance, Associators, AssociatorNames, References, ReferenceNames,
+    InvokeMethod, ExecQuery, EnumerateClasses, EnumerateClassNames, GetClass,
+    ModifyClass, CreateClass, DeleteClass, EnumerateQualifiers, GetQualifier,
+    SetQualifier and DeleteQualifier.
+
+    These methods do not perform the operation, but return a
+    :class:`~pywbem.BatchOperation` object that provides its result or
+    exception once the batch has been executed. The operations are performed
+    in the order they were added to the batch.
+
+    When the batch is sent as a multiple operation request, the operations of
+    the batch are recorded as a single 'MultiRequest' operation in the
+    statistics of the connection, and they are not passed to the operation
+    recorders of the connection. Operations that enforce a property list on
+    the client side (`enforce_property_list` parameter) are always sent as
+    individual requests.
+
+    The object can be used as a context manager, which executes the batch
+    when the `with` statement is left without an exception.
+    """
+
+    def __init__(self, conn, multireq=None,
+                 max_workers=DEFAULT_BATCH_MAX_WORKERS):
+        """
+        Parameters: See :meth:`~pywbem.WBEMConnection.batch`.
+        """
+        if not isinstance(max_workers, int) or max_workers < 1:
+            raise ValueError(
+                _format("The max_workers parameter must be a positive "
+                        "integer, but is {0!A}", max_workers))
+        self._conn = conn
+        self._multireq = multireq
+        self._max_workers = max_workers
+        self._operations = []
+        self._executed = False
+
+    def __enter__(self):
+        """
+        Enter method when the class is used as a context manager.
+        Returns the batch object.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Exit method when the class is used as a context manager.
+
+        It executes the batch by calling :meth:`~pywbem.WBEMBatch.execute`,
+        unless an exception was raised in the `with` statement.
+        """
+        if exc_type is None:
+            self.execute()
+        return False  # re-raise any exceptions
+
+    def __getattr__(self, name):
+        """
+        Return a method for adding the operation with the specified name to
+        the batch.
+        """
+        if name not in BATCH_OPERATIONS:
+            raise AttributeError(
+                _format("{0!A} object has no attribute {1!A}",
+                        self.__class__.__name__, name))
+
+        def add_operation(*args, **kwargs):
+            # pylint: disable=missing-docstring
+            if self._executed:
+                raise RuntimeError(
+                    "Cannot add operations to a batch that has been executed")
+            operation = BatchOperation(name, args, kwargs)
+            self._operations.append(operation)
+            return operation
+
+        add_operation.__name__ = name
+        return add_operation
+
+    def __len__(self):
+        """
+        Return the number of operations in the batch.
+        """
+        return len(self._operations)
+
+    @property
+    def conn(self):
+        """
+        :class:`~pywbem.WBEMConnection`: The connection of the batch.
+        """
+        return self._conn
+
+    @property
+    def operations(self):
+        """
+        list of :class:`~pywbem.BatchOperation`: The operations of the batch,
+        in the order they were added.
+        """
+        return list(self._operations)
+
+    @property
+    def executed(self):
+        """
+        :class:`py:bool`: Indicates whether the batch has been executed.
+        """
+        return self._executed
+
+    def execute(self):
+        """
+        Execute the batch, i.e. perform its operations.
+
+        The results and exceptions of the operations are set in their
+        :class:`~pywbem.BatchOperation` objects. Exceptions raised by the
+        operations are not raised by this method.
+
+        Raises:
+
+          RuntimeError: The batch has already been executed.
+        """
+        if self._executed:
+            raise RuntimeError("The batch has already been executed")
+        self._executed = True
+
+        operations = self._operations
+        if len(operations) > 1 and self._use_multireq():
+            operations = self._execute_multireq(operations)
+        self._execute_individually(operations)
+
+    def _use_multireq(self):
+        """
+        Return a boolean indicating whether the batch is to be sent as a
+        multiple operation request.
+        """
+        if self._multireq is None:
+            # pylint: disable=protected-access
+            return self._conn._supports_multireq()
+        return self._multireq
+
+    def _execute_individually(self, operations):
+        """
+        Perform operations of the batch with individual requests.
+        """
+        # pylint: disable=protected-access
+        if self._conn.thread_safe and len(operations) > 1:
+            max_workers = min(len(operations), self._max_workers)
+            with ThreadPoolExecutor(max_workers) as executor:
+                for _ in executor.map(
+                        lambda op: op._run(self._conn), operations):
+                    pass
+        else:
+            for operation in operations:
+                operation._run(self._conn)
+
+    def _capture(self, operation):
+        """
+        Run the operation method of an operation on a proxy connection that
+        captures its CIM-XML request instead of sending it, and return the
+        captured CIM-XML request string.
+
+        Returns `None` if the operation is to be performed with an individual
+        request. Exceptions raised by the operation method before sending
+        the request (e.g. for invalid parameters) are set in the operation.
+        """
+        # pylint: disable=protected-access
+        requests_data = []
+
+        def imethodcall(methodname, namespace, has_return_value=True,
+                        has_out_params=False, property_filter=None,
+                        **params):
+            # pylint: disable=missing-docstring,unused-argument
+            proxy._verify_open()
+            if property_filter is None:
+                request_data, _ = _imethodcall_request(
+                    methodname, namespace, **params)
+                requests_data.append(request_data)
+            raise _BatchCapture()
+
+        def methodcall(methodname, objectname, Params=None, **params):
+            # pylint: disable=missing-docstring,invalid-name
+            proxy._verify_open()
+            request_data, _ = _methodcall_request(
+                methodname, objectname, proxy.default_namespace, Params,
+                **params)
+            requests_data.append(request_data)
+            raise _BatchCapture()
+
+        proxy = _batch_proxy(self._conn, imethodcall, methodcall)
+        try:
+            getattr(proxy, operation.method_name)(
+                *operation._args, **operation._kwargs)
+        except _BatchCapture:
+            return requests_data[0] if requests_data else None
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            operation._set_exception(exc)
+        return None
+
+    def _execute_multireq(self, operations):
+        """
+        Perform operations of the batch with a multiple operation request.
+
+        Returns the list of operations that remain to be performed with
+        individual requests.
+        """
+        # pylint: disable=protected-access
+        conn = self._conn
+
+        individual_ops = []
+        multi_ops = []
+        multi_requests = []
+        for operation in operations:
+            op_request_data = self._capture(operation)
+            if op_request_data is not None:
+                multi_ops.append(operation)
+                multi_requests.append(op_request_data)
+            elif not operation.done:
+                individual_ops.append(operation)
+
+        if len(multi_ops) < 2:
+            return individual_ops + multi_ops
+
+        # The MULTIREQ element contains the SIMPLEREQ elements of the
+        # requests for the single operations.
+        start_len = len(_REQUEST_START)
+        end_len = len(_REQUEST_END)
+        out = [_REQUEST_START, '<MULTIREQ>']
+        out.extend(op_request_data[start_len:-end_len]
+                   for op_request_data in multi_requests)
+        out.append('</MULTIREQ>')
+        out.append(_REQUEST_END)
+        request_data = ''.join(out)
+        cimxml_headers = [
+            ('CIMOperation', 'MethodCall'),
+            ('CIMBatch', ''),
+        ]
+
+        exc = None
+        stats = conn.statistics.start_timer('MultiRequest')
+        try:
+            tup_tree, request_data = conn._cimxml_call(
+                request_data, cimxml_headers, "CIM-XML response")
+            responses = self._multirsp_responses(
+                tup_tree, len(multi_requests))
+        except HTTPError as exce:
+            exc = exce
+            if self._multireq is None and exce.status == 501 and \
+                    exce.cimerror == _MULTIREQ_UNSUPPORTED:
+                conn._multireq_supported = False
+                return individual_ops + multi_ops
+            for operation in multi_ops:
+                operation._set_exception(exce)
+            return individual_ops
+        except (CIMXMLParseError, XMLParseError) as exce:
+            exce.request_data = conn.last_raw_request
+            exce.response_data = conn.last_raw_reply
+            exc = exce
+            for operation in multi_ops:
+                operation._set_exception(exce)
+            return individual_ops
+        except Exception as exce:  # pylint: disable=broad-exception-caught
+            exc = exce
+            for operation in multi_ops:
+                operation._set_exception(exce)
+            return individual_ops
+        finally:
+            conn._last_operation_time = stats.stop_timer(
+                conn.last_request_len, conn.last_reply_len,
+                conn.last_server_response_time, exc)
+
+        for operation, op_request_data, response in zip(
+                multi_ops, multi_requests, responses):
+            self._replay(operation, op_request_data, response)
+
+        return individual_ops
+
+    def _multirsp_responses(self, tup_tree, num_responses):
+        """
+        Check the parsed CIM-XML response of a multiple operation request and
+        return the responses of the single operations, each as the CIM
+        element of a simple response.
+        """
+        conn_id = self._conn.conn_id
+        cim_attrs = tup_tree[1]
+        message = tup_tree[2]
+        if message[0] != 'MESSAGE':
+            raise CIMXMLParseError(
+                _format("Expecting MESSAGE element, got {0}", message[0]),
+                conn_id=conn_id)
+        multirsp = message[2]
+        if multirsp[0] != 'MULTIRSP':
+            raise CIMXMLParseError(
+                _format("Expecting MULTIRSP element, got {0}", multirsp[0]),
+                conn_id=conn_id)
+        if len(multirsp[2]) != num_responses:
+            raise CIMXMLParseError(
+                _format("Expecting {0} SIMPLERSP elements in MULTIRSP "
+                        "element, got {1}", num_responses, len(multirsp[2])),
+                conn_id=conn_id)
+        return [('CIM', cim_attrs, ('MESSAGE', message[1], simplersp))
+                for simplersp in multirsp[2]]
+
+    def _replay(self, operation, request_data, response):
+        """
+        Run the operation method of an operation on a proxy connection that
+        returns the result from the response of the operation instead of
+        sending a request, and set the result or exception in the operation.
+        """
+        conn = self._conn
+
+        def imethodcall(methodname, namespace, has_return_value=True,
+                        has_out_params=False, property_filter=None,
+                        **params):
+            # pylint: disable=missing-docstring,unused-argument
+            return _imethodcall_result(
+                response, methodname, has_return_value, has_out_params,
+                conn.conn_id, request_data)
+
+        def methodcall(methodname, objectname, Params=None, **params):
+            # pylint: disable=missing-docstring,unused-argument,invalid-name
+            return _methodcall_result(
+                response, methodname, conn.conn_id, request_data)
+
+        # pylint: disable=protected-access
+        proxy = _batch_proxy(conn, imethodcall, methodcall)
+        proxy._last_raw_request = conn.last_raw_request
+        proxy._last_raw_reply = conn.last_raw_reply
+        operation._run(proxy)
@@ -0,0 +1,2655 @@
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this program; if not, write to the Free Software
+# Foundation, Inc., 675 Mass Ave, Cambridge, MA 02139, USA.
+#
+
+"""
+*New in pywbem 1.10 as experimental.*
+
+The :class:`~pywbem.AsyncWBEMConnection` class provides the WBEM operations
+of :class:`~pywbem.WBEMConnection` as :term:`py:coroutine` methods for use
+with :mod:`py:asyncio`.
+
+All operations of a connection run on a single event loop, and any number of
+them may be in flight concurrently. The HTTP requests are sent over a pool of
+persistent HTTP connections to the WBEM server, whose size is bounded by the
+`max_connections` parameter. Many WBEM servers can be polled from a single
+thread by creating one :class:`~pywbem.AsyncWBEMConnection` object per WBEM
+server and running their operations concurrently, for example using
+:func:`py:asyncio.gather`:
+
+.. code-block:: python
+
+    import asyncio
+    import pywbem
+
+    async def count_instances(url, classname):
+        async with pywbem.AsyncWBEMConnection(url, ('user', 'pw')) as conn:
+            paths = await conn.EnumerateInstanceNames(classname)
+            return len(paths)
+
+    async def main(urls):
+        return await asyncio.gather(
+            *[count_instances(url, 'CIM_ComputerSystem') for url in urls])
+
+    counts = asyncio.run(main(['https://srv1', 'https://srv2']))
+
+The `Iter...()` methods are asynchronous generators that are consumed with
+``async for``. If such a generator is not exhausted, it should be closed using
+its ``aclose()`` method, which closes any open enumeration session on the
+WBEM server:
+
+.. code-block:: python
+
+    async for inst in conn.IterEnumerateInstances('CIM_Foo'):
+        print(inst.path)
+
+The request building and response parsing is the same as for
+:class:`~pywbem.WBEMConnection`, so the operation results are identical.
+"""
+
+import asyncio
+import contextlib
+import functools
+
+from .config import DEFAULT_ITER_MAXOBJECTCOUNT
+from ._cim_constants import CIM_ERR_NOT_SUPPORTED, CIM_ERR_FAILED, \
+    DEFAULT_TIMEOUT
+from ._cim_obj import CIMInstance, CIMInstanceName, CIMClass, CIMClassName, \
+    CIMQualifierCache, CIMQualifierDeclaration
+from ._cim_http import parse_url
+from ._cim_http_async import HTTPConnectionPool, wbem_request_async
+from ._cim_operations import IterQueryInstancesReturn, \
+    pull_path_result_tuple, pull_inst_result_tuple, pull_query_result_tuple, \
+    _WBEMConnectionMixin, \
+    _imethodcall_request, _methodcall_request, _iexportcall_request, \
+    _imethodcall_result, _methodcall_result, _iexportcall_result, \
+    _iparam_propertylist, _property_filter, _validate_OperationTimeout, \
+    _validate_MaxObjectCount_Iter, _validate_MaxObjectCount_OpenPull, \
+    _validate_context, _validate_prefetch, _request_xml
+from ._tupletree import xml_to_tupletree_expat
+from ._exceptions import Error, CIMXMLParseError, XMLParseError, CIMError
+from ._exceptions import ConnectionError  # pylint: disable=redefined-builtin
+from ._statistics import Statistics
+from ._utils import _format
+
+__all__ = ['AsyncWBEMConnection']
+
+# Default for the maximum number of HTTP connections to the WBEM server that
+# are in use at the same time.
+DEFAULT_MAX_CONNECTIONS = 10
+
+# Intrinsic operations that do not change any state in the WBEM server, so
+# that their requests can be sent again if a connection broke down before a
+# response was received. The Open...() and Pull...() operations change the
+# state of enumeration sessions and are therefore not included.
+_IDEMPOTENT_METHODS = frozenset([
+    'EnumerateInstances', 'EnumerateInstanceNames', 'GetInstance',
+    'Associators', 'AssociatorNames', 'References', 'ReferenceNames',
+    'ExecQuery', 'EnumerateClasses', 'EnumerateClassNames', 'GetClass',
+    'EnumerateQualifiers', 'GetQualifier',
+])
+
+
+class _OperationData:
+    # pylint: disable=too-few-public-methods
+    """
+    Request and response data of a single operation of an
+    AsyncWBEMConnection.
+
+    Because multiple operations can be in flight concurrently on an
+    AsyncWBEMConnection, this data is maintained per operation instead of
+    per connection.
+    """
+
+    def __init__(self):
+        self.request_data = None
+        self.reply_data = None
+        self.request_len = 0
+        self.reply_len = 0
+        self.server_response_time = None
+
+
+class _AsyncPullPrefetcher:
+    """
+    Background task that issues the pull operations of an open enumeration
+    session ahead of the consumer of the pull results.
+
+    This is the asyncio counterpart of
+    :class:`pywbem._cim_operations._PullPrefetcher`.
+    """
+
+    def __init__(self, pull_method, context, MaxObjectCount, prefetch):
+        # pylint: disable=invalid-name
+        self._results = asyncio.Queue()
+        self._credits = asyncio.Semaphore(prefetch)
+        self._stopped = False
+        self._last_result = None
+        self.failed = False  # A pull operation has raised an exception
+        self._task = asyncio.ensure_future(
+            self._run(pull_method, context, MaxObjectCount))
+
+    async def _run(self, pull_method, context, MaxObjectCount):
+        # pylint: disable=invalid-name
+        """
+        Coroutine of the background task.
+        """
+        while True:
+            await self._credits.acquire()
+            if self._stopped:
+                return
+            try:
+                result = await pull_method(
+                    context, MaxObjectCount=MaxObjectCount)
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                self.failed = True
+                self._results.put_nowait(exc)
+                return
+            self._last_result = result
+            self._results.put_nowait(result)
+            if result.eos:
+                return
+            context = result.context
+
+    async def next_result(self):
+        """
+        Return the next pull result, waiting for it if needed.
+
+        Raises:
+          Exception raised by the pull operation.
+        """
+        result = await self._results.get()
+        self._credits.release()
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    async def stop(self):
+        """
+        Stop the background task, waiting for a pull operation in progress to
+        complete.
+
+        Returns:
+          The last pull result received by the background task, or `None` if
+          no pull operation has succeeded.
+        """
+        self._stopped = True
+        self._credits.release()
+        await self._task
+        return self._last_result
+
+
+class AsyncWBEMConnection(_WBEMConnectionMixin):
+    # pylint: disable=too-many-instance-attributes
+    """
+    *New in pywbem 1.10 as experimental.*
+
+    A client's asynchronous connection to a WBEM server or WBEM listener,
+    for use with :mod:`py:asyncio`.
+
+    This class provides the same WBEM operations as
+    :class:`~pywbem.WBEMConnection`, with the same parameters, return values
+    and exceptions, except that the operation methods are coroutines that need
+    to be awaited and the `Iter...()` methods (except for
+    :meth:`~pywbem.AsyncWBEMConnection.IterQueryInstances`) are asynchronous
+    generators.
+
+    The HTTP requests are sent using :mod:`py:asyncio` streams over a pool of
+    persistent HTTP/1.1 connections to the WBEM server. The operations of a
+    connection object must all be run on the same event loop.
+
+    In contrast to :class:`~pywbem.WBEMConnection`, this class does not
+    support HTTP proxies, operation recorders (and thus logging), and does
+    not maintain the `last_*` attributes about the last request and reply,
+    because these would be ambiguous with concurrent operations. For
+    exceptions raised due to invalid responses, the request and response data
+    of the failing operation is available in the exception.
+    Statistics are supported (see :ref:`WBEM operation statistics`), as are
+    the response parsing modes (e.g. `direct_decode` and `lazy_instances`)
+    and HTTP compression.
+
+    Because HTTP proxies are not supported, the connections to the WBEM
+    server are always direct connections. Proxy settings in environment
+    variables (e.g. `HTTPS_PROXY`), which are used by
+    :class:`~pywbem.WBEMConnection`, are ignored.
+
+    If a pooled connection breaks down before the response to a request has
+    been received, the request is sent again on another connection only for
+    operations that do not change any state in the WBEM server (e.g.
+    :meth:`~pywbem.AsyncWBEMConnection.GetInstance`). For other operations,
+    :exc:`~pywbem.ConnectionError` is raised, because the WBEM server may
+    have performed the operation.
+
+    The class can be used as an asynchronous context manager, which closes
+    the connection at context manager exit:
+
+    .. code-block:: python
+
+        async with AsyncWBEMConnection('https://myserver') as conn:
+            insts = await conn.EnumerateInstances('CIM_Foo')
+    """
+
+    # Class level counter. Incremented at each AsyncWBEMConnection creation
+    # and used as part of the connection ID.
+    _conn_counter = 0
+
+    def __init__(self, url, creds=None, default_namespace=None,
+                 x509=None, ca_certs=None,
+                 no_verification=False, timeout=DEFAULT_TIMEOUT,
+                 use_pull_operations=False,
+                 stats_enabled=False,
+                 max_connections=DEFAULT_MAX_CONNECTIONS,
+                 direct_decode=False, response_validation='strict',
+                 lazy_instances=False, compact_arrays=False,
+                 instance_layouts=False, shared_qualifiers=False,
+                 compression=True, request_compression_threshold=None):
+        """
+        Parameters:
+
+          url (str):
+            URL of the WBEM server or WBEM listener.
+            See :class:`~pywbem.WBEMConnection` for details.
+
+          creds (tuple of userid, password):
+            Credentials for HTTP authentication with the WBEM server.
+            See :class:`~pywbem.WBEMConnection` for details.
+
+          default_namespace (str):
+            Default CIM namespace for this connection.
+            See :class:`~pywbem.WBEMConnection` for details.
+
+          x509 (dict):
+            X.509 client certificate and key file to be presented to the WBEM
+            server during the TLS/SSL handshake.
+            See :class:`~pywbem.WBEMConnection` for details.
+
+          ca_certs (str):
+            Selects the CA certificates (trusted certificates) for verifying
+            the X.509 server certificate returned by the WBEM server.
+            See :class:`~pywbem.WBEMConnection` for details.
+
+          no_verification (bool):
+            Disables verification of the X.509 server certificate returned by
+            the WBEM server during TLS/SSL handshake.
+            See :class:`~pywbem.WBEMConnection` for details.
+
+          timeout (:term:`number`):
+            Timeout in seconds, for requests sent to the server or listener.
+            `None` means no timeout.
+
+          use_pull_operations (bool):
+            Controls the use of pull operations in any `Iter...()` methods.
+            See :class:`~pywbem.WBEMConnection` for details.
+
+          stats_enabled (bool):
+            Initial enablement status for maintaining statistics about the
+            WBEM operations executed via this connection.
+
+          max_connections (:term:`integer`):
+            Maximum number of HTTP connections to the WBEM server or WBEM
+            listener that are in use at the same time. Operations beyond that
+            number wait until a connection becomes available.
+
+          direct_decode (bool):
+            Parse the CIM-XML responses directly into CIM objects.
+            See :class:`~pywbem.WBEMConnection` for details.
+
+          response_validation (:term:`string`):
+            Validation level for the CIM-XML responses ('strict' or 'fast').
+            See :class:`~pywbem.WBEMConnection` for details.
+
+          lazy_instances (bool):
+            Parse the properties of returned CIM instances only when they are
+            accessed.
+            See :class:`~pywbem.WBEMConnection` for details.
+
+          compact_arrays (bool):
+            Return the array values of numeric CIM types as
+            :class:`~pywbem.CIMNumericArray` objects.
+            See :class:`~pywbem.WBEMConnection` for details.
+
+          instance_layouts (bool):
+            Return CIM instances that use a shared
+            :class:`~pywbem.CIMInstanceLayout`.
+            See :class:`~pywbem.WBEMConnection` for details.
+
+          shared_qualifiers (bool):
+            Share one :class:`~pywbem.CIMQualifier` object for equal
+            qualifier values in returned CIM objects.
+            See :class:`~pywbem.WBEMConnection` for details.
+
+          compression (bool):
+            Accept compressed CIM-XML responses.
+            See :class:`~pywbem.WBEMConnection` for details.
+
+          request_compression_threshold (:term:`integer`):
+            Minimum size in Bytes of the HTTP body of a CIM-XML request for
+            the request to be sent compressed, or `None` for not compressing
+            requests.
+            See :class:`~pywbem.WBEMConnection` for details.
+        """
+
+        scheme, hostport, url = parse_url(url)
+        self._scheme = scheme
+        self._host = hostport
+        self._url = url
+        self._creds = creds  # tuple is immutable, so no copy
+        if x509 is not None:
+            if not isinstance(x509, dict):
+                raise TypeError(
+                    "The x509 parameter must be a dictionary but has type: "
+                    f"{type(x509)}")
+            if 'cert_file' not in x509:
+                raise ValueError(
+                    "The x509 parameter does not have the required key "
+                    f"'cert_file': {x509!r}")
+        # x509 dict is mutable, so we copy it
+        self._x509 = None if x509 is None else dict(x509)
+        if ca_certs is not None and not isinstance(ca_certs, str):
+            raise TypeError(
+                _format("The ca_certs parameter has invalid type: {0}",
+                        type(ca_certs)))
+        self._ca_certs = ca_certs
+        self._no_verification = no_verification
+        self._timeout = timeout
+        if not isinstance(max_connections, int) or max_connections < 1:
+            raise ValueError(
+                _format("The max_connections parameter must be a positive "
+                        "integer, but is: {0!A}", max_connections))
+
+        self._set_default_namespace(default_namespace)
+
+        self._direct_decode = direct_decode
+        self._set_response_validation(response_validation)
+        self._lazy_instances = lazy_instances
+        self._compact_arrays = compact_arrays
+        self._instance_layouts = instance_layouts
+        self._shared_qualifiers = shared_qualifiers
+        self._compression = compression
+        self._set_request_compression_threshold(request_compression_threshold)
+
+        # See WBEMConnection.__init__()
+        self._instance_layout_cache = {}
+        self._qualifier_cache = CIMQualifierCache()
+        self._pull_property_filters = {}
+
+        self.__class__._conn_counter += 1
+        self._conn_id = f'a{self.__class__._conn_counter}'
+
+        # Intent to use pull operations, and actual status of using them
+        self._use_pull_operations = use_pull_operations
+        self._use_enum_inst_pull_operations = use_pull_operations
+        self._use_enum_path_pull_operations = use_pull_operations
+        self._use_ref_inst_pull_operations = use_pull_operations
+        self._use_ref_path_pull_operations = use_pull_operations
+        self._use_assoc_inst_pull_operations = use_pull_operations
+        self._use_assoc_path_pull_operations = use_pull_operations
+        self._use_query_pull_operations = use_pull_operations
+
+        self._statistics = Statistics(stats_enabled)
+
+        self._pool = HTTPConnectionPool(self, max_connections)
+
+    async def __aenter__(self):
+        """
+        Enter method when the class is used as an asynchronous context
+        manager. Returns the connection object.
+        """
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """
+        Exit method when the class is used as an asynchronous context
+        manager.
+
+        It closes the connection by calling
+        :meth:`~pywbem.AsyncWBEMConnection.close`.
+        """
+        await self.close()
+        return False  # re-raise any exceptions
+
+    @property
+    def url(self):
+        """
+        str: Normalized URL of the WBEM server or WBEM listener.
+
+        See :attr:`pywbem.WBEMConnection.url` for details.
+        """
+        return self._url
+
+    @property
+    def scheme(self):
+        """
+        str: Normalized scheme of the URL of the WBEM server or WBEM listener,
+        for example 'http' or 'https'.
+        """
+        return self._scheme
+
+    @property
+    def host(self):
+        """
+        str: Normalized host and port number of the WBEM server or WBEM
+        listener, in the format ``host:port``.
+        """
+        return self._host
+
+    @property
+    def creds(self):
+        """
+        :term:`creds`: Credentials for HTTP authentication with the WBEM
+        server.
+        """
+        return self._creds
+
+    @property
+    def default_namespace(self):
+        """
+        str: Name of the CIM namespace to be used by default (if no namespace
+        is specified for an operation).
+
+        This attribute is settable.
+        """
+        return self._default_namespace
+
+    @default_namespace.setter
+    def default_namespace(self, default_namespace):
+        """Setter method; for a description see the getter method."""
+        self._set_default_namespace(default_namespace)
+
+    @property
+    def x509(self):
+        """
+        dict: X.509 client certificate and key file to be presented
+        to the WBEM server during the TLS/SSL handshake.
+        """
+        return self._x509
+
+    @property
+    def ca_certs(self):
+        """
+        str: Selects the CA certificates (trusted certificates) for verifying
+        the X.509 server certificate returned by the WBEM server.
+        """
+        return self._ca_certs
+
+    @property
+    def no_verification(self):
+        """
+        bool: Boolean indicating that verification of the X.509 server
+        certificate returned by the WBEM server during TLS/SSL handshake is
+        disabled.
+        """
+        return self._no_verification
+
+    @property
+    def timeout(self):
+        """
+        :term:`number`: Timeout in seconds, for requests sent to the server or
+        listener.
+
+        `None` means no timeout. This attribute is settable.
+        """
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, timeout_value):
+        """Setter method; for a description see the getter method."""
+        self._timeout = timeout_value
+
+    @property
+    def direct_decode(self):
+        """
+        bool: Boolean indicating that the CIM-XML responses are parsed
+        directly into CIM objects.
+
+        This attribute is settable.
+        See :attr:`pywbem.WBEMConnection.direct_decode` for details.
+        """
+        return self._direct_decode
+
+    @direct_decode.setter
+    def direct_decode(self, direct_decode):
+        """Setter method; for a description see the getter method."""
+        self._direct_decode = direct_decode
+
+    @property
+    def response_validation(self):
+        """
+        :term:`string`: Validation level for the CIM-XML responses
+        ('strict' or 'fast').
+
+        This attribute is settable.
+        See :attr:`pywbem.WBEMConnection.response_validation` for details.
+        """
+        return self._response_validation
+
+    @response_validation.setter
+    def response_validation(self, response_validation):
+        """Setter method; for a description see the getter method."""
+        self._set_response_validation(response_validation)
+
+    @property
+    def lazy_instances(self):
+        """
+        bool: Boolean indicating that the properties of returned CIM instances
+        are parsed only when they are accessed.
+
+        This attribute is settable.
+        See :attr:`pywbem.WBEMConnection.lazy_instances` for details.
+        """
+        return self._lazy_instances
+
+    @lazy_instances.setter
+    def lazy_instances(self, lazy_instances):
+        """Setter method; for a description see the getter method."""
+        self._lazy_instances = lazy_instances
+
+    @property
+    def compact_arrays(self):
+        """
+        bool: Boolean indicating that the array values of numeric CIM types
+        are returned as :class:`~pywbem.CIMNumericArray` objects.
+
+        This attribute is settable.
+        See :attr:`pywbem.WBEMConnection.compact_arrays` for details.
+        """
+        return self._compact_arrays
+
+    @compact_arrays.setter
+    def compact_arrays(self, compact_arrays):
+        """Setter method; for a description see the getter method."""
+        self._compact_arrays = compact_arrays
+
+    @property
+    def instance_layouts(self):
+        """
+        bool: Boolean indicating that returned CIM instances use a shared
+        :class:`~pywbem.CIMInstanceLayout`.
+
+        This attribute is settable.
+        See :attr:`pywbem.WBEMConnection.instance_layouts` for details.
+        """
+        return self._instance_layouts
+
+    @instance_layouts.setter
+    def instance_layouts(self, instance_layouts):
+        """Setter method; for a description see the getter method."""
+        self._instance_layouts = instance_layouts
+
+    @property
+    def shared_qualifiers(self):
+        """
+        bool: Boolean indicating that equal qualifier values in returned CIM
+        objects share one :class:`~pywbem.CIMQualifier` object.
+
+        This attribute is settable.
+        See :attr:`pywbem.WBEMConnection.shared_qualifiers` for details.
+        """
+        return self._shared_qualifiers
+
+    @shared_qualifiers.setter
+    def shared_qualifiers(self, shared_qualifiers):
+        """Setter method; for a description see the getter method."""
+        self._shared_qualifiers = shared_qualifiers
+
+    @property
+    def compression(self):
+        """
+        bool: Boolean indicating that compressed CIM-XML responses are
+        accepted.
+
+        This attribute is settable.
+        See :attr:`pywbem.WBEMConnection.compression` for details.
+        """
+        return self._compression
+
+    @compression.setter
+    def compression(self, compression):
+        """Setter method; for a description see the getter method."""
+        self._compression = compression
+
+    @property
+    def request_compression_threshold(self):
+        """
+        :term:`integer`: Minimum size in Bytes of the HTTP body of a CIM-XML
+        request for the request to be sent compressed, or `None` if requests
+        are not compressed.
+
+        This attribute is settable.
+        See :attr:`pywbem.WBEMConnection.request_compression_threshold` for
+        details.
+        """
+        return self._request_compression_threshold
+
+    @request_compression_threshold.setter
+    def request_compression_threshold(self, threshold):
+        """Setter method; for a description see the getter method."""
+        self._set_request_compression_threshold(threshold)
+
+    @property
+    def max_connections(self):
+        """
+        :term:`integer`: Maximum number of HTTP connections to the WBEM server
+        or WBEM listener that are in use at the same time.
+        """
+        return self._pool.max_connections
+
+    @property
+    def use_pull_operations(self):
+        """
+        bool: Boolean indicating that the client should attempt the use of
+        pull operations in any `Iter...()` methods.
+        """
+        return self._use_pull_operations
+
+    @property
+    def stats_enabled(self):
+        """
+        bool: Statistics enablement status for this connection.
+
+        This attribute is settable.
+        """
+        return self._statistics.enabled
+
+    @stats_enabled.setter
+    def stats_enabled(self, value):
+        """Setter method; for a description see the getter method."""
+        if value:
+            self._statistics.enable()
+        else:
+            self._statistics.disable()
+
+    @property
+    def statistics(self):
+        """
+        :class:`~pywbem.Statistics`: Statistics for this connection.
+        """
+        return self._statistics
+
+    @property
+    def conn_id(self):
+        """
+        :term:`connection id`: Connection ID (a unique ID) of this connection.
+        """
+        return self._conn_id
+
+    def __str__(self):
+        """
+        Return a short representation of the
+        :class:`~pywbem.AsyncWBEMConnection` object for human consumption.
+        """
+        if isinstance(self.creds, tuple):
+            # tuple (userid, password) was specified
+            creds_repr = _format("({0!A}, ...)", self.creds[0])
+        else:
+            creds_repr = _format("{0!A}", self.creds)
+
+        return _format(
+            "AsyncWBEMConnection("
+            "url={s.url!A}, "
+            "creds={creds}, "
+            "default_namespace={s.default_namespace!A}, ...)",
+            s=self, creds=creds_repr)
+
+    def __repr__(self):
+        """
+        Return a representation of the :class:`~pywbem.AsyncWBEMConnection`
+        object with all attributes (except for the password in the
+        credentials) that is suitable for debugging.
+        """
+        if isinstance(self.creds, tuple):
+            # tuple (userid, password) was specified
+            creds_repr = _format("({0!A}, ...)", self.creds[0])
+        else:
+            creds_repr = _format("{0!A}", self.creds)
+
+        return _format(
+            "AsyncWBEMConnection("
+            "url={s.url!A}, "
+            "creds={creds}, "
+            "conn_id={s.conn_id!A}, "
+            "default_namespace={s.default_namespace!A}, "
+            "x509={s.x509!A}, "
+            "ca_certs={s.ca_certs!A}, "
+            "no_verification={s.no_verification!A}, "
+            "timeout={s.timeout!A}, "
+            "use_pull_operations={s.use_pull_operations!A}, "
+            "stats_enabled={s.stats_enabled!A}, "
+            "max_connections={s.max_connections!A}, "
+            "direct_decode={s.direct_decode!A}, "
+            "response_validation={s.response_validation!A}, "
+            "lazy_instances={s.lazy_instances!A}, "
+            "compact_arrays={s.compact_arrays!A}, "
+            "instance_layouts={s.instance_layouts!A}, "
+            "shared_qualifiers={s.shared_qualifiers!A}, "
+            "compression={s.compression!A}, "
+            "request_compression_threshold="
+            "{s.request_compression_threshold!A})",
+            s=self, creds=creds_repr)
+
+    async def close(self):
+        """
+        Close this connection.
+
+        This method closes the pooled HTTP connections and marks the
+        connection closed. Any subsequent WBEM operations will raise
+        :exc:`~pywbem.ConnectionError`.
+
+        Raises:
+          :exc:`~pywbem.ConnectionError`: AsyncWBEMConnection is closed
+        """
+        self._verify_open()
+        await self._pool.close()
+        self._pool = None  # Indicates closed state
+
+    def _verify_open(self):
+        """
+        Verify that this connection is open and raise ConnectionError otherwise.
+        """
+        if self._pool is None:
+            raise ConnectionError(
+                "AsyncWBEMConnection is closed",
+                conn_id=self.conn_id)
+
+    @contextlib.contextmanager
+    def _operation(self, method_name):
+        """
+        Context manager for executing a WBEM operation, that maintains the
+        statistics for the operation and adds request and response data to
+        parsing errors.
+
+        Returns:
+          _OperationData: Request and response data of the operation.
+        """
+        op = _OperationData()
+        stat = self.statistics.get_op_statistic(method_name)
+        start_time = stat.start_timer()
+        exc = None
+        try:
+            yield op
+        except (CIMXMLParseError, XMLParseError) as exce:
+            exce.request_data = _request_xml(op.request_data)
+            exce.response_data = op.reply_data
+            exc = exce
+            raise
+        except Exception as exce:
+            exc = exce
+            raise
+        finally:
+            stat.stop_timer(op.request_len, op.reply_len,
+                            op.server_response_time, exc,
+                            start_time=start_time)
+
+    async def _cimxml_call(self, op, request_data, cimxml_headers, meaning,
+                           target_type='server', idempotent=False,
+                           property_filter=None):
+        """
+        Send a CIM-XML request, receive the response and parse it into a
+        tuple tree, recording request and response in the operation data.
+
+        If `idempotent` is `True`, the request may be sent again if the
+        connection broke down before a response was received.
+
+        The response is parsed with the parser returned by
+        `_tuple_parser()`, as in WBEMConnection._cimxml_call().
+
+        Returns:
+          The CIM element of the response as parsed by TupleParser.
+        """
+        self._verify_open()
+
+        op.request_data = request_data
+        op.request_len = len(op.request_data)
+
+        op.reply_data, op.server_response_time = await wbem_request_async(
+            self, op.request_data, cimxml_headers, target_type, idempotent)
+        op.reply_len = len(op.reply_data)
+
+        # Parse the XML into a tuple tree (may raise CIMXMLParseError or
+        # XMLParseError):
+        tp, decoder = self._tuple_parser()
+        tt_ = xml_to_tupletree_expat(
+            op.reply_data, meaning, decoder=decoder,
+            property_filter=property_filter)
+        return tp.parse_cim(tt_)
+
+    async def _imethodcall(self, op, methodname, namespace,
+                           has_return_value=True, has_out_params=False,
+                           property_filter=None, **params):
+        """
+        Perform an intrinsic CIM-XML operation.
+
+        See WBEMConnection._imethodcall() for details.
+        """
+        request_data, cimxml_headers = _imethodcall_request(
+            methodname, namespace, **params)
+        tup_tree = await self._cimxml_call(
+            op, request_data, cimxml_headers, "CIM-XML response",
+            idempotent=methodname in _IDEMPOTENT_METHODS,
+            property_filter=property_filter)
+        return _imethodcall_result(
+            tup_tree, methodname, has_return_value, has_out_params,
+            self.conn_id, op.request_data)
+
+    async def _methodcall(self, op, methodname, objectname, Params=None,
+                          **params):
+        # pylint: disable=invalid-name
+        """
+        Perform an extrinsic CIM-XML method call.
+
+        See WBEMConnection._methodcall() for details.
+        """
+        request_data, cimxml_headers = _methodcall_request(
+            methodname, objectname, self.default_namespace, Params, **params)
+        tup_tree = await self._cimxml_call(
+            op, request_data, cimxml_headers, "CIM-XML response")
+        return _methodcall_result(
+            tup_tree, methodname, self.conn_id, op.request_data)
+
+    async def _iexportcall(self, op, methodname, **params):
+        """
+        Invoke a CIM-XML export method.
+
+        See WBEMConnection._iexportcall() for details.
+        """
+        request_data, cimxml_headers = _iexportcall_request(
+            methodname, **params)
+        tup_tree = await self._cimxml_call(
+            op, request_data, cimxml_headers, "CIM-XML export response",
+            target_type='listener')
+        _iexportcall_result(tup_tree, methodname, self.conn_id,
+                            op.request_data)
+
+    ###############################################################
+    #
+    # Request Operation methods
+    #
+    ###############################################################
+
+    async def EnumerateInstances(self, ClassName, namespace=None,
+                                 LocalOnly=None, DeepInheritance=None,
+                                 IncludeQualifiers=None,
+                                 IncludeClassOrigin=None, PropertyList=None,
+                                 enforce_property_list=False):
+        # pylint: disable=invalid-name
+        """
+        Enumerate the instances of a class (including instances of its
+        subclasses) in a namespace.
+
+        This is the asynchronous version of
+        :meth:`pywbem.WBEMConnection.EnumerateInstances`, with the same
+        parameters, return value and exceptions.
+        """
+        method_name = 'EnumerateInstances'
+        with self._operation(method_name) as op:
+
+            namespace = self._iparam_namespace_from_classname(
+                namespace, ClassName)
+            ClassName = self._iparam_classname(
+                ClassName, 'ClassName', required=True)
+            LocalOnly = self._iparam_bool(LocalOnly, 'LocalOnly')
+            DeepInheritance = self._iparam_bool(
+                DeepInheritance, 'DeepInheritance')
+            IncludeQualifiers = self._iparam_bool(
+                IncludeQualifiers, 'IncludeQualifiers')
+            IncludeClassOrigin = self._iparam_bool(
+                IncludeClassOrigin, 'IncludeClassOrigin')
+            PropertyList = _iparam_propertylist(PropertyList)
+            property_filter = _property_filter(
+                PropertyList, enforce_property_list)
+
+            result = await self._imethodcall(
+                op, method_name, namespace,
+                ClassName=ClassName,
+                LocalOnly=LocalOnly,
+                DeepInheritance=DeepInheritance,
+                IncludeQualifiers=IncludeQualifiers,
+                IncludeClassOrigin=IncludeClassOrigin,
+                PropertyList=PropertyList,
+                property_filter=property_filter)
+
+            instances = [] if result is None else result[0][2]
+
+            for instance in instances:
+                if not isinstance(instance, CIMInstance):
+                    raise CIMXMLParseError(
+                        _format("Expecting CIMInstance object in result list, "
+                                "got {0} object", instance.__class__.__name__),
+                        conn_id=self.conn_id)
+                # See WBEMConnection.EnumerateInstances()
+                instance.path.namespace = namespace
+
+            return instances
+
+    async def EnumerateInstanceNames(self, ClassName, namespace=None):
+        # pylint: disable=invalid-name
+        """
+        Enumerate the instance paths of instances of a class (including
+        instances of its subclasses) in a namespace.
+
+        This is the asynchronous version of
+        :meth:`pywbem.WBEMConnection.EnumerateInstanceNames`, with the same
+        parameters, return value and exceptions.
+        """
+        method_name = 'EnumerateInstanceNames'
+        with self._operation(method_name) as op:
+
+            namespace = self._iparam_namespace_from_classname(
+                namespace, ClassName)
+            ClassName = self._iparam_classname(
+                ClassName, 'ClassName', required=True)
+
+            result = await self._imethodcall(
+                op, method_name, namespace,
+                ClassName=ClassName)
+
+            instancenames = [] if result is None else result[0][2]
+
+            for instancepath in instancenames:
+                if not isinstance(instancepath, CIMInstanceName):
+                    raise CIMXMLParseError(
+                        _format("Expecting CIMInstanceName object in result "
+                                "list, got {0} object",
+                                instancepath.__class__.__name__),
+                        conn_id=self.conn_id)
+                # See WBEMConnection.EnumerateInstanceNames()
+                instancepath.namespace = namespace
+
+            return instancenames
+
+    async def GetInstance(self, InstanceName, LocalOnly=None,
+                          IncludeQualifiers=None, IncludeClassOrigin=None,
+                          PropertyList=None, enforce_property_list=False):
+        # pylint: disable=invalid-name
+        """
+        Retrieve an instance.
+
+        This is the asynchronous version of
+        :meth:`pywbem.WBEMConnection.GetInstance`, with the same
+        parameters, return value and exceptions.
+        """
+        method_name = 'GetInstance'
+        with self._operation(method_name) as op:
+
+            namespace = self._iparam_namespace_from_objectname(
+                InstanceName, 'InstanceName')
+            InstanceName = self._iparam_instancename(
+                InstanceName, 'InstanceName', required=True)
+            LocalOnly = self._iparam_bool(LocalOnly, 'LocalOnly')
+            IncludeQualifiers = self._iparam_bool(
+                IncludeQualifiers, 'IncludeQualifiers')
+            IncludeClassOrigin = self._iparam_bool(
+                IncludeClassOrigin, 'IncludeClassOrigin')
+            PropertyList = _iparam_propertylist(PropertyList)
+            property_filter = _property_filter(
+                PropertyList, enforce_property_list)
+
+            result = await self._imethodcall(
+                op, method_name, namespace,
+                InstanceName=InstanceName,
+                LocalOnly=LocalOnly,
+                IncludeQualifiers=IncludeQualifiers,
+                IncludeClassOrigin=IncludeClassOrigin,
+                PropertyList=PropertyList,
+                property_filter=property_filter)
+
+            instance = self._single_result(result)
+
+            if not isinstance(instance, CIMInstance):
+                raise CIMXMLParseError(
+                    _format("Expecting CIMInstance object in result, got {0} "
+                            "object", instance.__class__.__name__),
+                    conn_id=self.conn_id)
+
+            # See WBEMConnection.GetInstance()
+            instance.path = InstanceName.copy()
+            instance.path.namespace = namespace
+
+            return instance
+
+    async def ModifyInstance(self, ModifiedInstance, IncludeQualifiers=None,
+                             PropertyList=None):
+        # pylint: disable=invalid-name
+        """
+        Modify the property values of an instance.
+
+        This is the asynchronous version of
+        :meth:`pywbem.WBEMConnection.ModifyInstance`, with the same
+        parameters, return value and exceptions.
+        """
+        method_name = 'ModifyInstance'
+        with self._operation(method_name) as op:
+
+            # Must pass a named CIMInstance here (i.e path attribute set)
+            ModifiedInstance = self._iparam_instance(
+                ModifiedInstance, 'ModifiedInstance', required=True)
+            if ModifiedInstance.path is None:
+                raise ValueError(
+                    'ModifiedInstance parameter must have path attribute set')
+            if ModifiedInstance.path.classname is None:
+                raise ValueError(
+                    'ModifiedInstance parameter must have classname attribute '
+                    'set in its path')
+            if ModifiedInstance.classname is None:
+                raise ValueError(
+                    'ModifiedInstance parameter must have classname attribute '
+                    'set')
+            namespace = self._iparam_namespace_from_objectname(
+                ModifiedInstance.path, 'ModifiedInstance.path')
+            IncludeQualifiers = self._iparam_bool(
+                IncludeQualifiers, 'IncludeQualifiers')
+            PropertyList = _iparam_propertylist(PropertyList)
+
+            # See WBEMConnection.ModifyInstance()
+            ModifiedInstance.path.namespace = None
+            ModifiedInstance.path.host = None
+
+            await self._imethodcall(
+                op, method_name, namespace,
+                ModifiedInstance=ModifiedInstance,
+                IncludeQualifiers=IncludeQualifiers,
+                PropertyList=PropertyList,
+                has_return_value=False)
+
+    async def CreateInstance(self, NewInstance, namespace=None):
+        # pylint: disable=invalid-name
+        """
+        Create an instance in a namespace.
+
+        This is the asynchronous version of
+        :meth:`pywbem.WBEMConnection.CreateInstance`, with the same
+        parameters, return value and exceptions.
+        """
+        method_name = 'CreateInstance'
+        with self._operation(method_name) as op:
+
+            if namespace is None and \
+               getattr(NewInstance.path, 'namespace', None) is not None:
+                namespace = NewInstance.path.namespace
+            namespace = self._iparam_namespace_from_namespace(namespace)
+            NewInstance = self._iparam_instance(
+                NewInstance, 'NewInstance', required=True)
+
+            # See WBEMConnection.CreateInstance()
+            NewInstance.path = None
+
+            result = await self._imethodcall(
+                op, method_name, namespace,
+                NewInstance=NewInstance)
+
+            instancename = self._single_result(result)
+
+            if not isinstance(instancename, CIMInstanceName):
+                raise CIMXMLParseError(
+                    _format("Expecting CIMInstanceName object in result, got "
+                            "{0} object", instancename.__class__.__name__),
+                    conn_id=self.conn_id)
+
+            # See WBEMConnection.CreateInstance()
+            instancename.namespace = namespace
+
+            return instancename
+
+    async def DeleteInstance(self, InstanceName):
+        # pylint: disable=invalid-name
+        """
+        Delete an instance.
+
+        This is the asynchronous version of
+        :meth:`pywbem.WBEMConnection.DeleteInstance`, with the same
+        parameters, return value and exceptions.
+        """
+        method_name = 'DeleteInstance'
+        with self._operation(method_name) as op:
+
+            namespace = self._iparam_namespace_from_objectname(
+                InstanceName, 'InstanceName')
+            InstanceName = self._iparam_instancename(
+                InstanceName, 'InstanceName', required=True)
+
+            await self._imethodcall(
+                op, method_name, namespace,
+                InstanceName=InstanceName,
+                has_return_value=False)
+
+    async def Associators(self, ObjectName, AssocClass=None, ResultClass=None,
+                          Role=None, ResultRole=None, IncludeQualifiers=None,
+                          IncludeClassOrigin=None, PropertyList=None,
+                          enforce_property_list=False):
+        # pylint: disable=invalid-name
+        """
+        Retrieve the instances associated to a source instance, or the classes
+        associated to a source class.
+
+        This is the asynchronous version of
+        :meth:`pywbem.WBEMConnection.Associators`, with the same
+        parameters, return value and exceptions.
+        """
+        method_name = 'Associators'
+        with self._operation(method_name) as op:
+
+            namespace = self._iparam_namespace_from_objectname(
+                ObjectName, 'ObjectName')
+            ObjectName = self._iparam_objectname(
+                ObjectName, 'ObjectName', required=True)
+            AssocClass = self._iparam_classname(AssocClass, 'AssocClass')
+            ResultClass = self._iparam_classname(ResultClass, 'ResultClass')
+            Role = self._iparam_string(Role, 'Role')
+            ResultRole = self._iparam_string(ResultRole, 'ResultRole')
+            IncludeQualifiers = self._iparam_bool(
+                IncludeQualifiers, 'IncludeQualifiers')
+            IncludeClassOrigin = self._iparam_bool(
+                IncludeClassOrigin, 'IncludeClassOrigin')
+            PropertyList = _iparam_propertylist(PropertyList)
+            property_filter = _property_filter(
+                PropertyList, enforce_property_list)
+
+            result = await self._imethodcall(
+                op, method_name, namespace,
+                ObjectName=ObjectName,
+                AssocClass=AssocClass,
+                ResultClass=ResultClass,
+                Role=Role,
+                ResultRole=ResultRole,
+                IncludeQualifiers=IncludeQualifiers,
+                IncludeClassOrigin=IncludeClassOrigin,
+                PropertyList=PropertyList,
+                property_filter=property_filter)
+
+            return self._get_returned_objects(result, ObjectName)
+
+    async def AssociatorNames(self, ObjectName, AssocClass=None,
+                              ResultClass=None, Role=None, ResultRole=None):
+        # pylint: disable=invalid-name
+        """
+        Retrieve the instance paths of the instances associated to a source
+        instance, or the class paths of the classes associated to a source
+        class.
+
+        This is the asynchronous version of
+        :meth:`pywbem.WBEMConnection.AssociatorNames`, with the same
+        parameters, return value and exceptions.
+        """
+        method_name = 'AssociatorNames'
+        with self._operation(method_name) as op:
+
+            namespace = self._iparam_namespace_from_objectname(
+                ObjectName, 'ObjectName')
+            ObjectName = self._iparam_objectname(
+                ObjectName, 'ObjectName', required=True)
+            AssocClass = self._iparam_classname(AssocClass, 'AssocClass')
+            ResultClass = self._iparam_classname(ResultClass, 'ResultClass')
+            Role = self._iparam_string(Role, 'Role')
+            ResultRole = self._iparam_string(ResultRole, 'ResultRole')
+
+            result = await self._imethodcall(
+                op, method_name, namespace,
+                ObjectName=ObjectName,
+                AssocClass=AssocClass,
+                ResultClass=ResultClass,
+                Role=Role,
+                ResultRole=ResultRole)
+
+            return self._get_returned_objectnames(result, ObjectName)
+
+    async def References(self, ObjectName, ResultClass=None, Role=None,
+                         IncludeQualifiers=None, IncludeClassOrigin=None,
+                         PropertyList=None, enforce_property_list=False):
+        # pylint: disable=invalid-name
+        """
+        Retrieve the association instances that reference a source instance,
+        or the association classes that reference a source class.
+
+        This is the asynchronous version of
+        :meth:`pywbem.WBEMConnection.References`, with the same
+        parameters, return value and exceptions.
+        """
+        method_name = 'References'
+        with self._operation(method_name) as op:
+
+            namespace = self._iparam_namespace_from_objectname(
+                ObjectName, 'ObjectName')
+            ObjectName = self._iparam_objectname(
+                ObjectName, 'ObjectName', required=True)
+            ResultClass = self._iparam_classname(ResultClass, 'ResultClass')
+            Role = self._iparam_string(Role, 'Role')
+            IncludeQualifiers = self._iparam_bool(
+                IncludeQualifiers, 'IncludeQualifiers')
+            IncludeClassOrigin = self._iparam_bool(
+                IncludeClassOrigin, 'IncludeClassOrigin')
+            PropertyList = _iparam_propertylist(PropertyList)
+            property_filter = _property_filter(
+                PropertyList, enforce_property_list)
+
+            result = await self._imethodcall(
+                op, method_name, namespace,
+                ObjectName=ObjectName,
+                ResultClass=ResultClass,
+                Role=Role,
+                IncludeQualifiers=IncludeQualifiers,
+                IncludeClassOrigin=IncludeClassOrigin,
+                PropertyList=PropertyList,
+                property_filter=property_filter)
+
+            return self._get_returned_objects(result, ObjectName)
+
+    async def ReferenceNames(self, ObjectName, ResultClass=None, Role=None):
+        # pylint: disable=invalid-name
+        """
+        Retrieve the instance paths of the association instances that reference
+        a source instance, or the class paths of the association classes that
+        reference a source class.
+
+        This is the asynchronous version of
+        :meth:`pywbem.WBEMConnection.ReferenceNames`, with the same
+        parameters, return value and exceptions.
+        """
+        method_name = 'ReferenceNames'
+        with self._operation(method_name) as op:
+
+            namespace = self._iparam_namespace_from_objectname(
+                ObjectName, 'ObjectName')
+            ObjectName = self._iparam_objectname(
+                ObjectName, 'ObjectName', required=True)
+            ResultClass = self._iparam_classname(ResultClass, 'ResultClass')
+            Role = self._iparam_string(Role, 'Role')
+
+            result = await self._imethodcall(
+                op, method_name, namespace,
+                ObjectName=ObjectName,
+                ResultClass=ResultClass,
+                Role=Role)
+
+            return self._get_returned_objectnames(result, ObjectName)
+
+    async def InvokeMethod(self, MethodName, ObjectName, Params=None,
+                           **params):
+        # pylint: disable=invalid-name
+        """
+        Invoke a method on a target instance or on a target class.
+
+        This is the asynchronous version of
+        :meth:`pywbem.WBEMConnection.InvokeMethod`, with the same
+        parameters, return value and exceptions.
+        """
+        with self._operation('InvokeMethod') as op:
+            return await self._methodcall(
+                op, MethodName, ObjectName, Params, **params)
+
+    async def ExecQuery(self, QueryLanguage, Query, namespace=None):
+        # pylint: disable=invalid-name
+        """
+        Execute a query in a namespace.
+
+        This is the asynchronous version of
+        :meth:`pywbem.WBEMConnection.ExecQuery`, with the same
+        parameters, return value and exceptions.
+        """
+        method_name = 'ExecQuery'
+        with self._operation(method_name) as op:
+
+            namespace = self._iparam_namespace_from_namespace(namespace)
+            QueryLanguage = self._iparam_string(
+                QueryLanguage, 'QueryLanguage', required=True)
+            Query = self._iparam_string(Query, 'Query', required=True)
+
+            result = await self._imethodcall(
+                op, method_name, namespace,
+                QueryLanguage=QueryLanguage,
+                Query=Query)
+
+            instances = [] if result is None else [x[2] for x in result[0][2]]
+
+            for instance in instances:
+                # See WBEMConnection.ExecQuery()
+                if instance.path is None:
+                    instance.path = CIMInstanceName(instance.classname,
+                                                    namespace=namespace)
+                else:
+                    instance.path.namespace = namespace
+
+            return instances
+
+    async def _iter_pull(self, use_pull_attr, open_func, pull_method,
+                         items_attr, MaxObjectCount, prefetch=None):
+        # pylint: disable=invalid-name
+        """
+        Common implementation of the pull based `Iter...()` methods.
+
+        This asynchronous generator calls the Open operation function
+        `open_func` (without arguments) and awaits its result, yields its
+        result items, and pulls further items until the enumeration session
+        is exhausted. If `prefetch` is a positive integer, the pull operations
+        are issued by a background task up to that number of pull operations
+        ahead of the consumer. If the generator is closed before the
+        enumeration session is exhausted, the enumeration session is closed.
+        If a prefetched pull operation has failed, exceptions raised when
+        closing the enumeration session are ignored, so that they do not
+        replace the exception of the pull operation.
+
+        If the use of the pull operation is still undetermined and the
+        WBEM server does not support it, sets the attribute `use_pull_attr`
+        to `False` and returns without yielding anything.
+        """
+        pull_result = None
+        prefetcher = None
+        try:
+            try:
+                pull_result = await open_func()
+            except CIMError as ce:
+                # See WBEMConnection.IterEnumerateInstances()
+                if (getattr(self, use_pull_attr) is None and
+                        ce.status_code in
+                        (CIM_ERR_NOT_SUPPORTED, CIM_ERR_FAILED)):
+                    setattr(self, use_pull_attr, False)
+                    return
+                raise
+
+            # Open operation succeeded; set has_pull flag
+            setattr(self, use_pull_attr, True)
+
+            if prefetch and not pull_result.eos:
+                prefetcher = _AsyncPullPrefetcher(
+                    pull_method, pull_result.context, MaxObjectCount,
+                    prefetch)
+
+            for item in getattr(pull_result, items_attr):
+                yield item
+
+            while not pull_result.eos:
+                if prefetcher is not None:
+                    pull_result = await prefetcher.next_result()
+                else:
+                    pull_result = await pull_method(
+                        pull_result.context, MaxObjectCount=MaxObjectCount)
+                for item in getattr(pull_result, items_attr):
+                    yield item
+            pull_result = None
+
+        # Cleanup if caller closes the iterator before exhausting it
+        finally:
+            if prefetcher is not None:
+                # Use the most recent enumeration context, which may belong
+                # to a pull result the consumer has not seen yet.
+                pull_result = await prefetcher.stop() or pull_result
+            if pull_result is not None and not pull_result.eos:
+                if prefetcher is not None and prefetcher.failed:
+                    try:
+                        await self.CloseEnumeration(pull_result.context)
+                    except Error:
+                        pass
+                else:
+                    await self.CloseEnumeration(pull_result.context)
+
+    async def IterEnumerateInstances(
+            self, ClassName, namespace=None, LocalOnly=None,
+            DeepInheritance=None, IncludeQualifiers=None,
+            IncludeClassOrigin=None, PropertyList=None,
+            FilterQueryLanguage=None, FilterQuery=None, OperationTimeout=None,
+            ContinueOnError=None, MaxObjectCount=DEFAULT_ITER_MAXOBJECTCOUNT,
+            prefetch=None, enforce_property_list=False):
+        # pylint: disable=invalid-name
+        """
+        Enumerate the instances of a class (including instances of its
+        subclasses) in a namespace, using the Python :term:`py:generator`
+        idiom to return the result.
+
+        This is the asynchronous version of
+        :meth:`pywbem.WBEMConnection.IterEnumerateInstances`, with the same
+        parameters and exceptions. It is an :term:`py:asynchronous generator`
+        that yields the instances.
+        """
+        _validate_OperationTimeout(OperationTimeout)
+        _validate_MaxObjectCount_Iter(MaxObjectCount)
+        _validate_prefetch(prefetch)
+
+        if self._use_enum_inst_pull_operations is not False:
+            pull_iter = self._iter_pull(
+                '_use_enum_inst_pull_operations',
+                functools.partial(
+                    self.OpenEnumerateInstances,
+                    ClassName, namespace=namespace,
+                    DeepInheritance=DeepInheritance,
+                    IncludeClassOrigin=IncludeClassOrigin,
+                    PropertyList=PropertyList,
+                    FilterQueryLanguage=FilterQueryLanguage,
+                    FilterQuery=FilterQuery,
+                    OperationTimeout=OperationTimeout,
+                    ContinueOnError=ContinueOnError,
+                    MaxObjectCount=MaxObjectCount,
+                    enforce_property_list=enforce_property_list),
+                self.PullInstancesWithPath, 'instances', MaxObjectCount,
+                prefetch)
+            try:
+                async for inst in pull_iter:
+                    yield inst
+            finally:
+                await pull_iter.aclose()
+            if self._use_enum_inst_pull_operations:
+                return
+
+        if FilterQuery is not None or FilterQueryLanguage is not None:
+            raise ValueError('EnumerateInstances does not support'
+                             ' FilterQuery.')
+
+        if ContinueOnError is not None:
+            raise ValueError('EnumerateInstances does not support '
+                             'ContinueOnError.')
+
+        enum_rslt = await self.EnumerateInstances(
+            ClassName,
+            namespace=namespace,
+            LocalOnly=LocalOnly,
+            DeepInheritance=DeepInheritance,
+            IncludeQualifiers=IncludeQualifiers,
+            IncludeClassOrigin=IncludeClassOrigin,
+            PropertyList=PropertyList,
+            enforce_property_list=enforce_property_list)
+
+        # get namespace for the operation
+        namespace = self._iparam_namespace_from_classname(namespace, ClassName)
+
+        # See WBEMConnection.IterEnumerateInstances()
+        for inst in enum_rslt:
+            if inst.path.namespace is None:
+                inst.path.namespace = namespace
+            if inst.path.host is None:
+                inst.path.host = self.host
+            yield inst
+
+    async def IterEnumerateInstancePaths(
+            self, ClassName, namespace=None, FilterQueryLanguage=None,
+            FilterQuery=None, OperationTimeout=None, ContinueOnError=None,
+            MaxObjectCount=DEFAULT_ITER_MAXOBJECTCOUNT):
+        # pylint: disable=invalid-name
+        """
+        Enumerate the instance paths of instances of a class (including
+        instances of its subclasses) in a namespace, using the Python
+        :term:`py:generator` idiom to return the result.
+
+        This is the asynchronous version of
+        :meth:`pywbem.WBEMConnection.IterEnumerateInstancePaths`, with the
+        same parameters and exceptions. It is an
+        :term:`py:asynchronous generator` that yields the instance paths.
+        """
+        _validate_OperationTimeout(OperationTimeout)
+        _validate_MaxObjectCount_Iter(MaxObjectCount)
+
+        if self._use_enum_path_pull_operations is not False:
+            pull_iter = self._iter_pull(
+                '_use_enum_path_pull_operations',
+                functools.partial(
+                    self.OpenEnumerateInstancePaths,
+                    ClassName, namespace=namespace,
+                    FilterQueryLanguage=FilterQueryLanguage,
+                    FilterQuery=FilterQuery,
+                    OperationTimeout=OperationTimeout,
+                    ContinueOnError=ContinueOnError,
+                    MaxObjectCount=MaxObjectCount),
+                self.PullInstancePaths, 'paths', MaxObjectCount)
+            try:
+                async for path in pull_iter:
+                    yield path
+            finally:
+                await pull_iter.aclose()
+            if self._use_enum_path_pull_operations:
+                return
+
+        if FilterQuery is not None or FilterQueryLanguage is not None:
+            raise ValueError('EnumerateInstanceNnames does not support'
+                             ' FilterQuery.')
+
+        if ContinueOnError is not None:
+            raise ValueError('EnumerateInstanceNames does not support '
+                             'ContinueOnError.')
+
+        enum_rslt = await self.EnumerateInstanceNames(
+            ClassName, namespace=namespace)
+
+        # get namespace for the operation
+        namespace = self._iparam_namespace_from_classname(namespace, ClassName)
+
+        # See WBEMConnection.IterEnumerateInstancePaths()
+        for path in enum_rslt:
+            if path.namespace is None:
+                path.namespace = namespace
+            if path.host is None:
+                path.host = self.host
+            yield path
+
+    async def IterAssociatorInstances(
+            self, InstanceName, AssocClass=None, ResultClass=None, Role=None,
+            ResultRole=None, IncludeQualifiers=None, IncludeClassOrigin=None,
+            PropertyList=None, FilterQueryLanguage=None, FilterQuery=None,
+            OperationTimeout=None, ContinueOnError=None,
+            MaxObjectCount=DEFAULT_ITER_MAXOBJECTCOUNT,
+            prefetch=None, enforce_property_list=False):
+        # pylint: disable=invalid-name
+        """
+        Retrieve the instances associated to a source instance, using the
+        Python :term:`py:generator` idiom to return the result.
+
+        This is the asynchronous version of
+        :meth:`pywbem.WBEMConnection.IterAssociatorInstances`, with the same
+        parameters and exceptions. It is an :term:`py:asynchronous generator`
+        that yields the instances.
+        """
+        _validate_OperationTimeout(OperationTimeout)
+        _validate_MaxObjectCount_Iter(MaxObjectCount)
+        _validate_prefetch(prefetch)
+
+        if self._use_assoc_inst_pull_operations is not False:
+            pull_iter = self._iter_pull(
+                '_use_assoc_inst_pull_operations',
+                functools.partial(
+                    self.OpenAssociatorInstances,
+                    InstanceName,
+                    AssocClass=AssocClass,
+                    ResultClass=ResultClass,
+                    Role=Role,
+                    ResultRole=ResultRole,
+                    IncludeClassOrigin=IncludeClassOrigin,
+                    PropertyList=PropertyList,
+                    FilterQueryLanguage=FilterQueryLanguage,
+                    FilterQuery=FilterQuery,
+                    OperationTimeout=OperationTimeout,
+                    ContinueOnError=ContinueOnError,
+                    MaxObjectCount=MaxObjectCount,
+                    enforce_property_list=enforce_property_list),
+                self.PullInstancesWithPath, 'instances', MaxObjectCount,
+                prefetch)
+            try:
+                async for inst in pull_iter:
+                    yield inst
+            finally:
+                await pull_iter.aclose()
+            if self._use_assoc_inst_pull_operations:
+                return
+
+        if FilterQuery is not None or FilterQueryLanguage is not None:
+            raise ValueError('Associators does not support'
+                             ' FilterQuery.')
+
+        if ContinueOnError is not None:
+            raise ValueError('Associators does not support '
+                             'ContinueOnError.')
+
+        enum_rslt = await self.Associators(
+            InstanceName,
+            AssocClass=AssocClass,
+            ResultClass=ResultClass,
+            Role=Role,
+            ResultRole=ResultRole,
+            IncludeQualifiers=IncludeQualifiers,
+            IncludeClassOrigin=IncludeClassOrigin,
+            PropertyList=PropertyList,
+            enforce_property_list=enforce_property_list)
+
+        for inst in enum_rslt:
+            yield inst
+
+    async def IterAssociatorInstancePaths(
+            self, InstanceName, AssocClass=None, ResultClass=None, Role=None,
+            ResultRole=None, FilterQueryLanguage=None, FilterQuery=None,
+            OperationTimeout=None, ContinueOnError=None,
+            MaxObjectCount=DEFAULT_ITER_MAXOBJECTCOUNT):
+        # pylint: disable=invalid-name
+        """
+        Retrieve the instance paths of the instances associated to a source
+        instance, using the Python :term:`py:generator` idiom to return the
+        result.
+
+        This is the asynchronous version of
+        :meth:`pywbem.WBEMConnection.IterAssociatorInstancePaths`, with the
+        same parameters and exceptions. It is an
+        :term:`py:asynchronous generator` that yields the instance paths.
+        """
+        _validate_OperationTimeout(OperationTimeout)
+        _validate_MaxObjectCount_Iter(MaxObjectCount)
+
+        if self._use_assoc_path_pull_operations is not False:
+            pull_iter = self._iter_pull(
+                '_use_assoc_path_pull_operations',
+                functools.partial(
+                    self.OpenAssociatorInstancePaths,
+                    InstanceName,
+                    AssocClass=AssocClass,
+                    ResultClass=ResultClass,
+                    Role=Role,
+                    ResultRole=ResultRole,
+                    FilterQueryLanguage=FilterQueryLanguage,
+                    FilterQuery=FilterQuery,
+                    OperationTimeout=OperationTimeout,
+                    ContinueOnError=ContinueOnError,
+                    MaxObjectCount=MaxObjectCount),
+                self.PullInstancePaths, 'paths', MaxObjectCount)
+            try:
+                async for path in pull_iter:
+                    yield path
+            finally:
+                await pull_iter.aclose()
+            if self._use_assoc_path_pull_operations:
+                return
+
+        if FilterQuery is not None or FilterQueryLanguage is not None:
+            raise ValueError('AssociatorNames does not support'
+                             ' FilterQuery.')
+
+        if ContinueOnError is not None:
+            raise ValueError('AssociatorNames does not support '
+                             'ContinueOnError.')
+
+        enum_rslt = await self.AssociatorNames(
+            InstanceName,
+            AssocClass=AssocClass,
+            ResultClass=ResultClass,
+            Role=Role,
+            ResultRole=ResultRole)
+
+        for path in enum_rslt:
+            yield path
+
+    async def IterReferenceInstances(
+            self, InstanceName, ResultClass=None, Role=None,
+            IncludeQualifiers=None, IncludeClassOrigin=None,
+            PropertyList=None, FilterQueryLanguage=None, FilterQuery=None,
+            OperationTimeout=None, ContinueOnError=None,
+            MaxObjectCount=DEFAULT_ITER_MAXOBJECTCOUNT,
+            prefetch=None, enforce_property_list=False):
+        # pylint: disable=invalid-name
+        """
+        Retrieve the association instances that reference a source instance,
+        using the Python :term:`py:generator` idiom to return the result.
+
+        This is the asynchronous version of
+        :meth:`pywbem.WBEMConnection.IterReferenceInstances`, with the same
+        parameters and exceptions. It is an :term:`py:asynchronous generator`
+        that yields the instances.
+        """
+        _validate_OperationTimeout(OperationTimeout)
+        _validate_MaxObjectCount_Iter(MaxObjectCount)
+        _validate_prefetch(prefetch)
+
+        if self._use_ref_inst_pull_operations is not False:
+            pull_iter = self._iter_pull(
+                '_use_ref_inst_pull_operations',
+                functools.partial(
+                    self.OpenReferenceInstances,
+                    InstanceName,
+                    ResultClass=ResultClass,
+                    Role=Role,
+                    IncludeClassOrigin=IncludeClassOrigin,
+                    PropertyList=PropertyList,
+                    FilterQueryLanguage=FilterQueryLanguage,
+                    FilterQuery=FilterQuery,
+                    OperationTimeout=OperationTimeout,
+                    ContinueOnError=ContinueOnError,
+                    MaxObjectCount=MaxObjectCount,
+                    enforce_property_list=enforce_property_list),
+                self.PullInstancesWithPath, 'instances', MaxObjectCount,
+                prefetch)
+            try:
+                async for inst in pull_iter:
+                    yield inst
+            finally:
+                await pull_iter.aclose()
+            if self._use_ref_inst_pull_operations:
+                return
+
+        if FilterQuery is not None or FilterQueryLanguage is not None:
+            raise ValueError('References does not support'
+                             ' FilterQuery.')
+
+        if ContinueOnError is not None:
+            raise ValueError('References does not support '
+                             'ContinueOnError.')
+
+        enum_rslt = await self.References(
+            InstanceName,
+            ResultClass=ResultClass,
+            Role=Role,
+            IncludeQualifiers=IncludeQualifiers,
+            IncludeClassOrigin=IncludeClassOrigin,
+            PropertyList=PropertyList,
+            enforce_property_list=enforce_property_list)
+
+        for inst in enum_rslt:
+            yield inst
+
+    async def IterReferenceInstancePaths(
+            self, InstanceName, ResultClass=None, Role=None,
+            FilterQueryLanguage=None, FilterQuery=None,
+            OperationTimeout=None, ContinueOnError=None,
+            MaxObjectCount=DEFAULT_ITER_MAXOBJECTCOUNT):
+        # pylint: disable=invalid-name
+        """
+        Retrieve the instance paths of the association instances that reference
+        a source instance, using the Python :term:`py:generator` idiom to
+        return the result.
+
+        This is the asynchronous version of
+        :meth:`pywbem.WBEMConnection.IterReferenceInstancePaths`, with the
+        same parameters and exceptions. It is an
+        :term:`py:asynchronous generator` that yields the instance paths.
+        """
+        _validate_OperationTimeout(OperationTimeout)
+        _validate_MaxObjectCount_Iter(MaxObjectCount)
+
+        if self._use_ref_path_pull_operations is not False:
+            pull_iter = self._iter_pull(
+                '_use_ref_path_pull_operations',
+                functools.partial(
+                    self.OpenReferenceInstancePaths,
+                    InstanceName,
+                    ResultClass=ResultClass,
+                    Role=Role,
+                    FilterQueryLanguage=FilterQueryLanguage,
+                    FilterQuery=FilterQuery,
+                    OperationTimeout=OperationTimeout,
+                    ContinueOnError=ContinueOnError,
+                    MaxObjectCount=MaxObjectCount),
+                self.PullInstancePaths, 'paths', MaxObjectCount)
+            try:
+                async for path in pull_iter:
+                    yield path
+            finally:
+                await pull_iter.aclose()
+            if self._use_ref_path_pull_operations:
+                return
+
+        if FilterQuery is not None or FilterQueryLanguage is not None:
+            raise ValueError('ReferenceInstanceNnames does not support'
+                             ' FilterQuery.')
+
+        if ContinueOnError is not None:
+            raise ValueError('ReferenceInstanceNames does not support '
+                             'ContinueOnError.')
+
+        enum_rslt = await self.ReferenceNames(
+            InstanceName,
+            ResultClass=ResultClass,
+            Role=Role)
+
+        for path in enum_rslt:
+            yield path
+
+    async def IterQueryInstances(
+            self, FilterQueryLanguage, FilterQuery, namespace=None,
+            ReturnQueryResultClass=None, OperationTimeout=None,
+            ContinueOnError=None, MaxObjectCount=DEFAULT_ITER_MAXOBJECTCOUNT):
+        # pylint: disable=invalid-name
+        """
+        Execute a query in a namespace, using the Python :term:`py:generator`
+        idiom to return the result.
+
+        This is the asynchronous version of
+        :meth:`pywbem.WBEMConnection.IterQueryInstances`, with the same
+        parameters (except for `prefetch`, which is not supported), return
+        value and exceptions. It returns an
+        :class:`~pywbem.IterQueryInstancesReturn` object once the complete
+        result has been received.
+        """
+        _validate_OperationTimeout(OperationTimeout)
+        _validate_MaxObjectCount_Iter(MaxObjectCount)
+
+        if self._use_query_pull_operations is not False:
+            pull_result = None
+            try:
+                try:
+                    pull_result = await self.OpenQueryInstances(
+                        FilterQueryLanguage,
+                        FilterQuery,
+                        namespace=namespace,
+                        ReturnQueryResultClass=ReturnQueryResultClass,
+                        OperationTimeout=OperationTimeout,
+                        ContinueOnError=ContinueOnError,
+                        MaxObjectCount=MaxObjectCount)
+
+                    # Open operation succeeded; set has_pull flag
+                    self._use_query_pull_operations = True
+
+                    _instances = pull_result.instances
+                    qrc = pull_result.query_result_class if \
+                        ReturnQueryResultClass else None
+
+                    while not pull_result.eos:
+                        pull_result = await self.PullInstances(
+                            pull_result.context,
+                            MaxObjectCount=MaxObjectCount)
+                        _instances.extend(pull_result.instances)
+
+                    pull_result = None
+                    return IterQueryInstancesReturn(
+                        _instances, query_result_class=qrc)
+
+                except CIMError as ce:
+                    # See WBEMConnection.IterQueryInstances()
+                    if (self._use_query_pull_operations is None and
+                            ce.status_code in
+                            (CIM_ERR_NOT_SUPPORTED, CIM_ERR_FAILED)):
+                        self._use_query_pull_operations = False
+                    else:
+                        raise
+
+            # Cleanup if the operation is cancelled before it completes
+            finally:
+                if pull_result is not None and not pull_result.eos:
+                    await self.CloseEnumeration(pull_result.context)
+
+        if ReturnQueryResultClass is not None:
+            raise ValueError('ExecQuery does not support'
+                             ' ReturnQueryResultClass.')
+
+        if ContinueOnError is not None:
+            raise ValueError('ExecQuery does not support '
+                             'ContinueOnError.')
+
+        _instances = await self.ExecQuery(FilterQueryLanguage,
+                                          FilterQuery,
+                                          namespace=namespace)
+
+        return IterQueryInstancesReturn(_instances)
+
+    async def OpenEnumerateInstances(self, ClassName, namespace=None,
+                                     DeepInheritance=None,
+                                     IncludeClassOrigin=None,
+                                     PropertyList=None,
+                                     FilterQueryLanguage=None,
+                                     FilterQuery=None, OperationTimeout=None,
+                                     ContinueOnError=None,
+                                     MaxObjectCount=None,
+                                     enforce_property_list=False):
+        # pylint: disable=invalid-name
+        """
+        Open an enumeration session to enumerate the instances of a class
+        (including instances of its subclasses) in a namespace.
+
+        This is the asynchronous version of
+        :meth:`pywbem.WBEMConnection.OpenEnumerateInstances`, with the same
+        parameters, return value and exceptions.
+        """
+        method_name = 'OpenEnumerateInstances'
+        with self._operation(method_name) as op:
+
+            namespace = self._iparam_namespace_from_classname(
+                namespace, ClassName)
+            ClassName = self._iparam_classname(
+                ClassName, 'ClassName', required=True)
+            DeepInheritance = self._iparam_bool(
+                DeepInheritance, 'DeepInheritance')
+            IncludeClassOrigin = self._iparam_bool(
+                IncludeClassOrigin, 'IncludeClassOrigin')
+            PropertyList = _iparam_propertylist(PropertyList)
+            property_filter = _property_filter(
+                PropertyList, enforce_property_list)
+            FilterQueryLanguage = self._iparam_string(
+                FilterQueryLanguage, 'FilterQueryLanguage')
+            FilterQuery = self._iparam_string(FilterQuery, 'FilterQuery')
+            OperationTimeout = self._iparam_positive_integer(
+                OperationTimeout, 'OperationTimeout')
+            ContinueOnError = self._iparam_bool(
+                ContinueOnError, 'ContinueOnError')
+            _validate_MaxObjectCount_OpenPull(MaxObjectCount)
+
+            result = await self._imethodcall(
+                op, method_name, namespace,
+                ClassName=ClassName,
+                DeepInheritance=DeepInheritance,
+                IncludeClassOrigin=IncludeClassOrigin,
+                PropertyList=PropertyList,
+                FilterQueryLanguage=FilterQueryLanguage,
+                FilterQuery=FilterQuery,
+                OperationTimeout=OperationTimeout,
+                ContinueOnError=ContinueOnError,
+                MaxObjectCount=MaxObjectCount,
+                has_out_params=True,
+                property_filter=property_filter)
+
+            result_tuple = pull_inst_result_tuple(
+                *self._get_rslt_params(result, namespace))
+            self._update_pull_property_filter(
+                None, result_tuple, property_filter)
+            return result_tuple
+
+    async def OpenEnumerateInstancePaths(self, ClassName, namespace=None,
+                                         FilterQueryLanguage=None,
+                                         FilterQuery=None,
+                                         OperationTimeout=None,
+                                         ContinueOnError=None,
+                                         MaxObjectCount=None):
+        # pylint: disable=invalid-name
+        """
+        Open an enumeration session to enumerate the instance paths of
+        instances of a class (including instances of its subclasses) in
+        a namespace.
+
+        This is the asynchronous version of
+        :meth:`pywbem.WBEMConnection.OpenEnumerateInstancePaths`, with the
+        same parameters, return value and exceptions.
+        """
+        method_name = 'OpenEnumerateInstancePaths'
+        with self._operation(method_name) as op:
+
+            namespace = self._iparam_namespace_from_classname(
+                namespace, ClassName)
+            ClassName = self._iparam_classname(
+                ClassName, 'ClassName', required=True)
+            FilterQueryLanguage = self._iparam_string(
+                FilterQueryLanguage, 'FilterQueryLanguage')
+            FilterQuery = self._iparam_string(FilterQuery, 'FilterQuery')
+            OperationTimeout = self._iparam_positive_integer(
+                OperationTimeout, 'OperationTimeout')
+            ContinueOnError = self._iparam_bool(
+                ContinueOnError, 'ContinueOnError')
+            _validate_MaxObjectCount_OpenPull(MaxObjectCount)
+
+            result = await self._imethodcall(
+                op, method_name, namespace,
+                ClassName=ClassName,
+                FilterQueryLanguage=FilterQueryLanguage,
+                FilterQuery=FilterQuery,
+                OperationTimeout=OperationTimeout,
+                ContinueOnError=ContinueOnError,
+                MaxObjectCount=MaxObjectCount,
+                has_out_params=True)
+
+            return pull_path_result_tuple(
+                *self._get_rslt_params(result, namespace))
+
+    async def OpenAssociatorInstances(self, InstanceName, AssocClass=None,
+                                      ResultClass=None, Role=None,
+                                      ResultRole=None,
+                                      IncludeClassOrigin=None,
+                                      PropertyList=None,
+                                      FilterQueryLanguage=None,
+                                      FilterQuery=None, OperationTimeout=None,
+                                      ContinueOnError=None,
+                                      MaxObjectCount=None,
+                                      enforce_property_list=False):
+        # pylint: disable=invalid-name
+        """
+        Open an enumeration session to retrieve the instances associated
+        to a source instance.
+
+        This is the asynchronous version of
+        :meth:`pywbem.WBEMConnection.OpenAssociatorInstances`, with the same
+        parameters, return value and exceptions.
+        """
+        method_name = 'OpenAssociatorInstances'
+        with self._operation(method_name) as op:
+
+            namespace = self._iparam_namespace_from_objectname(
+                InstanceName, 'InstanceName')
+            InstanceName = self._iparam_instancename(
+                InstanceName, 'InstanceName', required=True)
+            AssocClass = self._iparam_classname(AssocClass, 'AssocClass')
+            ResultClass = self._iparam_classname(ResultClass, 'ResultClass')
+            Role = self._iparam_string(Role, 'Role')
+            ResultRole = self._iparam_string(ResultRole, 'ResultRole')
+            IncludeClassOrigin = self._iparam_bool(
+                IncludeClassOrigin, 'IncludeClassOrigin')
+            PropertyList = _iparam_propertylist(PropertyList)
+            property_filter = _property_filter(
+                PropertyList, enforce_property_list)
+            FilterQueryLanguage = self._iparam_string(
+                FilterQueryLanguage, 'FilterQueryLanguage')
+            FilterQuery = self._iparam_string(FilterQuery, 'FilterQuery')
+            OperationTimeout = self._iparam_positive_integer(
+                OperationTimeout, 'OperationTimeout')
+            ContinueOnError = self._iparam_bool(
+                ContinueOnError, 'ContinueOnError')
+            _validate_MaxObjectCount_OpenPull(MaxObjectCount)
+
+            result = await self._imethodcall(
+                op, method_name, namespace,
+                InstanceName=InstanceName,
+                AssocClass=AssocClass,
+                ResultClass=ResultClass,
+                Role=Role,
+                ResultRole=ResultRole,
+                IncludeClassOrigin=IncludeClassOrigin,
+                PropertyList=PropertyList,
+                FilterQueryLanguage=FilterQueryLanguage,
+                FilterQuery=FilterQuery,
+                OperationTimeout=OperationTimeout,
+                ContinueOnError=ContinueOnError,
+                MaxObjectCount=MaxObjectCount,
+                has_out_params=True,
+                property_filter=property_filter)
+
+            result_tuple = pull_inst_result_tuple(
+                *self._get_rslt_params(result, namespace))
+            self._update_pull_property_filter(
+                None, result_tuple, property_filter)
+            return result_tuple
+
+    async def OpenAssociatorInstancePaths(self, InstanceName,
+                                          AssocClass=None, ResultClass=None,
+                                          Role=None, ResultRole=None,
+                                          FilterQueryLanguage=None,
+                                          FilterQuery=None,
+                                          OperationTimeout=None,
+                                          ContinueOnError=None,
+                                          MaxObjectCount=None):
+        # pylint: disable=invalid-name
+        """
+        Open an enumeration session to retrieve the instance paths of
+        the instances associated to a source instance.
+
+        This is the asynchronous version of
+        :meth:`pywbem.WBEMConnection.OpenAssociatorInstancePaths`, with the
+        same parameters, return value and exceptions.
+        """
+        method_name = 'OpenAssociatorInstancePaths'
+        with self._operation(method_name) as op:
+
+            namespace = self._iparam_namespace_from_objectname(
+                InstanceName, 'InstanceName')
+            InstanceName = self._iparam_instancename(
+                InstanceName, 'InstanceName', required=True)
+            AssocClass = self._iparam_classname(AssocClass, 'AssocClass')
+            ResultClass = self._iparam_classname(ResultClass, 'ResultClass')
+            Role = self._iparam_string(Role, 'Role')
+            ResultRole = self._iparam_string(ResultRole, 'ResultRole')
+            FilterQueryLanguage = self._iparam_string(
+                FilterQueryLanguage, 'FilterQueryLanguage')
+            FilterQuery = self._iparam_string(FilterQuery, 'FilterQuery')
+            OperationTimeout = self._iparam_positive_integer(
+                OperationTimeout, 'OperationTimeout')
+            ContinueOnError = self._iparam_bool(
+                ContinueOnError, 'ContinueOnError')
+            _validate_MaxObjectCount_OpenPull(MaxObjectCount)
+
+            result = await self._imethodcall(
+                op, method_name, namespace,
+                InstanceName=InstanceName,
+                AssocClass=AssocClass,
+                ResultClass=ResultClass,
+                Role=Role,
+                ResultRole=ResultRole,
+                FilterQueryLanguage=FilterQueryLanguage,
+                FilterQuery=FilterQuery,
+                OperationTimeout=OperationTimeout,
+                ContinueOnError=ContinueOnError,
+                MaxObjectCount=MaxObjectCount,
+                has_out_params=True)
+
+            return pull_path_result_tuple(
+                *self._get_rslt_params(result, namespace))
+
+    async def OpenReferenceInstances(self, InstanceName, ResultClass=None,
+                                     Role=None, IncludeClassOrigin=None,
+                                     PropertyList=None,
+                                     FilterQueryLanguage=None,
+                                     FilterQuery=None, OperationTimeout=None,
+                                     ContinueOnError=None,
+                                     MaxObjectCount=None,
+                                     enforce_property_list=False):
+        # pylint: disable=invalid-name
+        """
+        Open an enumeration session to retrieve the association instances
+        that reference a source instance.
+
+        This is the asynchronous version of
+        :meth:`pywbem.WBEMConnection.OpenReferenceInstances`, with the same
+        parameters, return value and exceptions.
+        """
+        method_name = 'OpenReferenceInstances'
+        with self._operation(method_name) as op:
+
+            namespace = self._iparam_namespace_from_objectname(
+                InstanceName, 'InstanceName')
+            InstanceName = self._iparam_instancename(
+                InstanceName, 'InstanceName', required=True)
+            ResultClass = self._iparam_classname(ResultClass, 'ResultClass')
+            Role = self._iparam_string(Role, 'Role')
+            IncludeClassOrigin = self._iparam_bool(
+                IncludeClassOrigin, 'IncludeClassOrigin')
+            PropertyList = _iparam_propertylist(PropertyList)
+            property_filter = _property_filter(
+                PropertyList, enforce_property_list)
+            FilterQueryLanguage = self._iparam_string(
+                FilterQueryLanguage, 'FilterQueryLanguage')
+            FilterQuery = self._iparam_string(FilterQuery, 'FilterQuery')
+            OperationTimeout = self._iparam_positive_integer(
+                OperationTimeout, 'OperationTimeout')
+            ContinueOnError = self._iparam_bool(
+                ContinueOnError, 'ContinueOnError')
+            _validate_MaxObjectCount_OpenPull(MaxObjectCount)
+
+            result = await self._imethodcall(
+                op, method_name, namespace,
+                InstanceName=InstanceName,
+                ResultClass=ResultClass,
+                Role=Role,
+                IncludeClassOrigin=IncludeClassOrigin,
+                PropertyList=PropertyList,
+                FilterQueryLanguage=FilterQueryLanguage,
+                FilterQuery=FilterQuery,
+                OperationTimeout=OperationTimeout,
+                ContinueOnError=ContinueOnError,
+                MaxObjectCount=MaxObjectCount,
+                has_out_params=True,
+                property_filter=property_filter)
+
+            result_tuple = pull_inst_result_tuple(
+                *self._get_rslt_params(result, namespace))
+            self._update_pull_property_filter(
+                None, result_tuple, property_filter)
+            return result_tuple
+
+    async def OpenReferenceInstancePaths(self, InstanceName, ResultClass=None,
+                                         Role=None, FilterQueryLanguage=None,
+                                         FilterQuery=None,
+                                         OperationTimeout=None,
+                                         ContinueOnError=None,
+                                         MaxObjectCount=None):
+        # pylint: disable=invalid-name
+        """
+        Open an enumeration session to retrieve the instance paths of
+        the association instances that reference a source instance.
+
+        This is the asynchronous version of
+        :meth:`pywbem.WBEMConnection.OpenReferenceInstancePaths`, with the
+        same parameters, return value and exceptions.
+        """
+        method_name = 'OpenReferenceInstancePaths'
+        with self._operation(method_name) as op:
+
+            namespace = self._iparam_namespace_from_objectname(
+                InstanceName, 'InstanceName')
+            InstanceName = self._iparam_instancename(
+                InstanceName, 'InstanceName', required=True)
+            ResultClass = self._iparam_classname(ResultClass, 'ResultClass')
+            Role = self._iparam_string(Role, 'Role')
+            FilterQueryLanguage = self._iparam_string(
+                FilterQueryLanguage, 'FilterQueryLanguage')
+            FilterQuery = self._iparam_string(FilterQuery, 'FilterQuery')
+            OperationTimeout = self._iparam_positive_integer(
+                OperationTimeout, 'OperationTimeout')
+            ContinueOnError = self._iparam_bool(
+                ContinueOnError, 'ContinueOnError')
+            _validate_MaxObjectCount_OpenPull(MaxObjectCount)
+
+            result = await self._imethodcall(
+                op, method_name, namespace,
+                InstanceName=InstanceName,
+                ResultClass=ResultClass,
+                Role=Role,
+                FilterQueryLanguage=FilterQueryLanguage,
+                FilterQuery=FilterQuery,
+                OperationTimeout=OperationTimeout,
+                ContinueOnError=ContinueOnError,
+                MaxObjectCount=MaxObjectCount,
+                has_out_params=True)
+
+            return pull_path_result_tuple(
+                *self._get_rslt_params(result, namespace))
+
+    async def OpenQueryInstances(self, FilterQueryLanguage, FilterQuery,
+                                 namespace=None, ReturnQueryResultClass=None,
+                                 OperationTimeout=None, ContinueOnError=None,
+                                 MaxObjectCount=None):
+        # pylint: disable=invalid-name
+        """
+        Open an enumeration session to execute a query in a namespace and to
+        retrieve the instances representing the query result.
+
+        This is the asynchronous version of
+        :meth:`pywbem.WBEMConnection.OpenQueryInstances`, with the same
+        parameters, return value and exceptions.
+        """
+        method_name = 'OpenQueryInstances'
+        with self._operation(method_name) as op:
+
+            namespace = self._iparam_namespace_from_namespace(namespace)
+            FilterQueryLanguage = self._iparam_string(
+                FilterQueryLanguage, 'FilterQueryLanguage')
+            FilterQuery = self._iparam_string(FilterQuery, 'FilterQuery')
+            ReturnQueryResultClass = self._iparam_bool(
+                ReturnQueryResultClass, 'ReturnQueryResultClass')
+            OperationTimeout = self._iparam_positive_integer(
+                OperationTimeout, 'OperationTimeout')
+            ContinueOnError = self._iparam_bool(
+                ContinueOnError, 'ContinueOnError')
+            _validate_MaxObjectCount_OpenPull(MaxObjectCount)
+
+            result = await self._imethodcall(
+                op, method_name, namespace,
+                FilterQueryLanguage=FilterQueryLanguage,
+                FilterQuery=FilterQuery,
+                ReturnQueryResultClass=ReturnQueryResultClass,
+                OperationTimeout=OperationTimeout,
+                ContinueOnError=ContinueOnError,
+                MaxObjectCount=MaxObjectCount,
+                has_out_params=True)
+
+            insts, eos, enum_ctxt = self._get_rslt_params(result, namespace)
+
+            query_result_class = self._query_result_class(result) if \
+                ReturnQueryResultClass else None
+
+            return pull_query_result_tuple(insts, eos, enum_ctxt,
+                                           query_result_class)
+
+    async def _pull_common(self, method_name, result_tuple_type, context,
+                           MaxObjectCount):
+        # pylint: disable=invalid-name
+        """
+        Common implementation of the Pull...() operations.
+        """
+        with self._operation(method_name) as op:
+
+            _validate_MaxObjectCount_OpenPull(MaxObjectCount)
+            _validate_context(context)
+            namespace = context[1]
+
+            # Property filter if the enumeration session was opened with
+            # enforce_property_list
+            property_filter = self._pull_property_filters.get(context[0])
+
+            result = await self._imethodcall(
+                op, method_name,
+                namespace=namespace,
+                EnumerationContext=context[0],
+                MaxObjectCount=MaxObjectCount,
+                has_out_params=True,
+                property_filter=property_filter)
+
+            result_tuple = result_tuple_type(
+                *self._get_rslt_params(result, namespace))
+            self._update_pull_property_filter(
+                context, result_tuple, property_filter)
+            return result_tuple
+
+    async def PullInstancesWithPath(self, context, MaxObjectCount):
+        # pylint: disable=invalid-name
+        """
+        Retrieve the next set of instances (with instance paths) from an open
+        enumeration session.
+
+        This is the asynchronous version of
+        :meth:`pywbem.WBEMConnection.PullInstancesWithPath`, with the same
+        parameters, return value and exceptions.
+        """
+        return await self._pull_common(
+            'PullInstancesWithPath', pull_inst_result_tuple, context,
+            MaxObjectCount)
+
+    async def PullInstancePaths(self, context, MaxObjectCount):
+        # pylint: disable=invalid-name
+        """
+        Retrieve the next set of instance paths from an open enumeration
+        session.
+
+        This is the asynchronous version of
+        :meth:`pywbem.WBEMConnection.PullInstancePaths`, with the same
+        parameters, return value and exceptions.
+        """
+        return await self._pull_common(
+            'PullInstancePaths', pull_path_result_tuple, context,
+            MaxObjectCount)
+
+    async def PullInstances(self, context, MaxObjectCount):
+        # pylint: disable=invalid-name
+        """
+        Retrieve the next set of instances (without instance paths) from an
+        open enumeration session.
+
+        This is the asynchronous version of
+        :meth:`pywbem.WBEMConnection.PullInstances`, with the same
+        parameters, return value and exceptions.
+        """
+        return await self._pull_common(
+            'PullInstances', pull_inst_result_tuple, context, MaxObjectCount)
+
+    async def CloseEnumeration(self, context):
+        # pylint: disable=invalid-name
+        """
+        Close an open enumeration session, causing an early termination of
+        an incomplete enumeration session.
+
+        This is the asynchronous version of
+        :meth:`pywbem.WBEMConnection.CloseEnumeration`, with the same
+        parameters, return value and exceptions.
+        """
+        method_name = 'CloseEnumeration'
+        with self._operation(method_name) as op:
+
+            _validate_context(context)
+
+            self._pull_property_filters.pop(context[0], None)
+
+            await self._imethodcall(
+                op, method_name,
+                namespace=context[1],
+                EnumerationContext=context[0],
+                has_return_value=False)
+
+    async def EnumerateClasses(self, namespace=None, ClassName=None,
+                               DeepInheritance=None, LocalOnly=None,
+                               IncludeQualifiers=None,
+                               IncludeClassOrigin=None):
+        # pylint: disable=invalid-name
+        """
+        Enumerate the subclasses of a class, or the top-level classes in a
+        namespace.
+
+        This is the asynchronous version of
+        :meth:`pywbem.WBEMConnection.EnumerateClasses`, with the same
+        parameters, return value and exceptions.
+        """
+        method_name = 'EnumerateClasses'
+        with self._operation(method_name) as op:
+
+            namespace = self._iparam_namespace_from_classname(
+                namespace, ClassName)
+            ClassName = self._iparam_classname(ClassName, 'ClassName')
+            DeepInheritance = self._iparam_bool(
+                DeepInheritance, 'DeepInheritance')
+            LocalOnly = self._iparam_bool(
+                LocalOnly, 'LocalOnly')
+            IncludeQualifiers = self._iparam_bool(
+                IncludeQualifiers, 'IncludeQualifiers')
+            IncludeClassOrigin = self._iparam_bool(
+                IncludeClassOrigin, 'IncludeClassOrigin')
+
+            result = await self._imethodcall(
+                op, method_name, namespace,
+                ClassName=ClassName,
+                DeepInheritance=DeepInheritance,
+                LocalOnly=LocalOnly,
+                IncludeQualifiers=IncludeQualifiers,
+                IncludeClassOrigin=IncludeClassOrigin)
+
+            classes = [] if result is None else result[0][2]
+
+            for klass in classes:
+                if not isinstance(klass, CIMClass):
+                    raise CIMXMLParseError(
+                        _format("Expecting CIMClass object in result list, "
+                                "got {0} object", klass.__class__.__name__),
+                        conn_id=self.conn_id)
+                # See WBEMConnection.EnumerateClasses()
+                klass.path = CIMClassName(
+                    classname=klass.classname, host=self.host,
+                    namespace=namespace)
+
+            return classes
+
+    async def EnumerateClassNames(self, namespace=None, ClassName=None,
+                                  DeepInheritance=None):
+        # pylint: disable=invalid-name
+        """
+        Enumerate the names of subclasses of a class, or of the top-level
+        classes in a namespace.
+
+        This is the asynchronous version of
+        :meth:`pywbem.WBEMConnection.EnumerateClassNames`, with the same
+        parameters, return value and exceptions.
+        """
+        method_name = 'EnumerateClassNames'
+        with self._operation(method_name) as op:
+
+            namespace = self._iparam_namespace_from_classname(
+                namespace, ClassName)
+            ClassName = self._iparam_classname(ClassName, 'ClassName')
+            DeepInheritance = self._iparam_bool(
+                DeepInheritance, 'DeepInheritance')
+
+            result = await self._imethodcall(
+                op, method_name, namespace,
+                ClassName=ClassName,
+                DeepInheritance=DeepInheritance)
+
+            classpaths = [] if result is None else result[0][2]
+
+            classnames = []
+            for classpath in classpaths:
+                if not isinstance(classpath, CIMClassName):
+                    raise CIMXMLParseError(
+                        _format("Expecting CIMClassName object in result "
+                                "list, got {0} object",
+                                classpath.__class__.__name__),
+                        conn_id=self.conn_id)
+                classnames.append(classpath.classname)
+
+            return classnames
+
+    async def GetClass(self, ClassName, namespace=None, LocalOnly=None,
+                       IncludeQualifiers=None, IncludeClassOrigin=None,
+                       PropertyList=None):
+        # pylint: disable=invalid-name
+        """
+        Retrieve a class.
+
+        This is the asynchronous version of
+        :meth:`pywbem.WBEMConnection.GetClass`, with the same
+        parameters, return value and exceptions.
+        """
+        method_name = 'GetClass'
+        with self._operation(method_name) as op:
+
+            namespace = self._iparam_namespace_from_classname(
+                namespace, ClassName)
+            ClassName = self._iparam_classname(
+                ClassName, 'ClassName', required=True)
+            LocalOnly = self._iparam_bool(
+                LocalOnly, 'LocalOnly')
+            IncludeQualifiers = self._iparam_bool(
+                IncludeQualifiers, 'IncludeQualifiers')
+            IncludeClassOrigin = self._iparam_bool(
+                IncludeClassOrigin, 'IncludeClassOrigin')
+            PropertyList = _iparam_propertylist(PropertyList)
+
+            result = await self._imethodcall(
+                op, method_name, namespace,
+                ClassName=ClassName,
+                LocalOnly=LocalOnly,
+                IncludeQualifiers=IncludeQualifiers,
+                IncludeClassOrigin=IncludeClassOrigin,
+                PropertyList=PropertyList)
+
+            klass = self._single_result(result)
+
+            if not isinstance(klass, CIMClass):
+                raise CIMXMLParseError(
+                    _format("Expecting CIMClass object, got {0} object",
+                            klass.__class__.__name__),
+                    conn_id=self.conn_id)
+
+            # See WBEMConnection.GetClass()
+            klass.path = CIMClassName(
+                classname=klass.classname, host=self.host,
+                namespace=namespace)
+
+            return klass
+
+    async def ModifyClass(self, ModifiedClass, namespace=None):
+        # pylint: disable=invalid-name
+        """
+        Modify a class.
+
+        This is the asynchronous version of
+        :meth:`pywbem.WBEMConnection.ModifyClass`, with the same
+        parameters, return value and exceptions.
+        """
+        method_name = 'ModifyClass'
+        with self._operation(method_name) as op:
+
+            namespace = self._iparam_namespace_from_namespace(namespace)
+            ModifiedClass = self._iparam_class(ModifiedClass, 'ModifiedClass')
+
+            await self._imethodcall(
+                op, method_name, namespace,
+                ModifiedClass=ModifiedClass,
+                has_return_value=False)
+
+    async def CreateClass(self, NewClass, namespace=None):
+        # pylint: disable=invalid-name
+        """
+        Create a class in a namespace.
+
+        This is the asynchronous version of
+        :meth:`pywbem.WBEMConnection.CreateClass`, with the same
+        parameters, return value and exceptions.
+        """
+        method_name = 'CreateClass'
+        with self._operation(method_name) as op:
+
+            namespace = self._iparam_namespace_from_namespace(namespace)
+            NewClass = self._iparam_class(NewClass, 'NewClass')
+
+            await self._imethodcall(
+                op, method_name, namespace,
+                NewClass=NewClass,
+                has_return_value=False)
+
+    async def DeleteClass(self, ClassName, namespace=None):
+        # pylint: disable=invalid-name
+        """
+        Delete a class.
+
+        This is the asynchronous version of
+        :meth:`pywbem.WBEMConnection.DeleteClass`, with the same
+        parameters, return value and exceptions.
+        """
+        method_name = 'DeleteClass'
+        with self._operation(method_name) as op:
+
+            namespace = self._iparam_namespace_from_classname(
+                namespace, ClassName)
+            ClassName = self._iparam_classname(
+                ClassName, 'ClassName', required=True)
+
+            await self._imethodcall(
+                op, method_name, namespace,
+                ClassName=ClassName,
+                has_return_value=False)
+
+    async def EnumerateQualifiers(self, namespace=None):
+        # pylint: disable=invalid-name
+        """
+        Enumerate the qualifier types (= qualifier declarations) in
+        a namespace.
+
+        This is the asynchronous version of
+        :meth:`pywbem.WBEMConnection.EnumerateQualifiers`, with the same
+        parameters, return value and exceptions.
+        """
+        method_name = 'EnumerateQualifiers'
+        with self._operation(method_name) as op:
+
+            namespace = self._iparam_namespace_from_namespace(namespace)
+
+            result = await self._imethodcall(op, method_name, namespace)
+
+            qualifierdecls = [] if result is None else result[0][2]
+
+            for qualifierdecl in qualifierdecls:
+                if not isinstance(qualifierdecl, CIMQualifierDeclaration):
+                    raise CIMXMLParseError(
+                        _format("Expecting CIMQualifierDeclaration object in "
+                                "result list, got {0} object",
+                                qualifierdecl.__class__.__name__),
+                        conn_id=self.conn_id)
+
+            return qualifierdecls
+
+    async def GetQualifier(self, QualifierName, namespace=None):
+        # pylint: disable=invalid-name
+        """
+        Retrieve a qualifier type (= qualifier declaration).
+
+        This is the asynchronous version of
+        :meth:`pywbem.WBEMConnection.GetQualifier`, with the same
+        parameters, return value and exceptions.
+        """
+        method_name = 'GetQualifier'
+        with self._operation(method_name) as op:
+
+            namespace = self._iparam_namespace_from_namespace(namespace)
+            QualifierName = self._iparam_string(
+                QualifierName, 'QualifierName', required=True)
+
+            result = await self._imethodcall(
+                op, method_name, namespace,
+                QualifierName=QualifierName)
+
+            qualifierdecl = self._single_result(result)
+
+            if not isinstance(qualifierdecl, CIMQualifierDeclaration):
+                raise CIMXMLParseError(
+                    _format("Expecting CIMQualifierDeclaration object, got "
+                            "{0} object", qualifierdecl.__class__.__name__),
+                    conn_id=self.conn_id)
+
+            return qualifierdecl
+
+    async def SetQualifier(self, QualifierDeclaration, namespace=None):
+        # pylint: disable=invalid-name
+        """
+        Create or modify a qualifier type (= qualifier declaration) in
+        a namespace.
+
+        This is the asynchronous version of
+        :meth:`pywbem.WBEMConnection.SetQualifier`, with the same
+        parameters, return value and exceptions.
+        """
+        method_name = 'SetQualifier'
+        with self._operation(method_name) as op:
+
+            namespace = self._iparam_namespace_from_namespace(namespace)
+            QualifierDeclaration = self._iparam_qualifierdeclaration(
+                QualifierDeclaration, 'QualifierDeclaration', required=True)
+
+            await self._imethodcall(
+                op, method_name, namespace,
+                QualifierDeclaration=QualifierDeclaration,
+                has_return_value=False)
+
+    async def DeleteQualifier(self, QualifierName, namespace=None):
+        # pylint: disable=invalid-name
+        """
+        Delete a qualifier type (= qualifier declaration).
+
+        This is the asynchronous version of
+        :meth:`pywbem.WBEMConnection.DeleteQualifier`, with the same
+        parameters, return value and exceptions.
+        """
+        method_name = 'DeleteQualifier'
+        with self._operation(method_name) as op:
+
+            namespace = self._iparam_namespace_from_namespace(namespace)
+            QualifierName = self._iparam_string(
+                QualifierName, 'QualifierName', required=True)
+
+            await self._imethodcall(
+                op, method_name, namespace,
+                QualifierName=QualifierName,
+                has_return_value=False)
+
+    async def ExportIndication(self, NewIndication):
+        # pylint: disable=invalid-name
+        """
+        Send an indication to a WBEM listener.
+
+        This is the asynchronous version of
+        :meth:`pywbem.WBEMConnection.ExportIndication`, with the same
+        parameters, return value and exceptions.
+        """
+        with self._operation('ExportIndication') as op:
+            await self._iexportcall(
+                op, 'ExportIndication',
+                NewIndication=NewIndication)
@@ -53,6 +53,8 @@ sint64                                    :class:`~pywbem.Sint64`
 real32                                    :class:`~pywbem.Real32`
 real64                                    :class:`~pywbem.Real64`
 [] (array)                                :class:`py:list`
+                                          or :class:`~pywbem.CIMNumericArray`
+                                          for numeric CIM data types
 ========================================  =====================================
 
 The CIM NULL value is represented with Python `None` which can be used for any
@@ -74,6 +76,8 @@ objects, :class:`py:str`, in addition to
 
 import copy
 import re
+from array import array
+from collections.abc import MutableSequence, Sequence
 from datetime import tzinfo, datetime, timedelta, timezone
 
 from .config import ENFORCE_INTEGER_RANGE
@@ -83,7 +87,7 @@ from ._utils import _ensure_unicode, _hash_item, _format, _to_unicode, \
 __all__ = ['cimtype', 'type_from_name', 'MinutesFromUTC', 'CIMType',
            'CIMDateTime', 'CIMInt', 'Uint8', 'Sint8', 'Uint16', 'Sint16',
            'Uint32', 'Sint32', 'Uint64', 'Sint64', 'CIMFloat', 'Real32',
-           'Real64', 'Char16', '_CIMComparisonMixin']
+           'Real64', 'Char16', 'CIMNumericArray', '_CIMComparisonMixin']
 
 
 class _CIMComparisonMixin:  # pylint: disable=too-few-public-methods
@@ -1247,6 +1251,9 @@ def cimtype(obj):
         # accept both possible types
         return 'string'
 
+    if isinstance(obj, CIMNumericArray):
+        return obj.cimtype
+
     if isinstance(obj, list):
         try:
             obj = obj[0]
@@ -1361,6 +1368,221 @@ def type_from_name(type_name):
     return type_obj
 
 
+def _array_typecode(typecodes, size):
+    """
+    Return the first of the typecodes of the array module whose item size is
+    at least the specified size in bytes.
+    """
+    for typecode in typecodes:
+        if array(typecode).itemsize >= size:
+            return typecode
+    raise AssertionError(  # pragma: no cover
+        _format("No array typecode with item size {0} in {1!A}",
+                size, typecodes))
+
+
+# Typecodes of the array module for the numeric CIM data types.
+# The value range of the integer typecodes is the value range of the CIM
+# data type. real32 values are stored as double precision, because Real32
+# objects are represented as Python float (double precision) values.
+_ARRAY_TYPECODES = {
+    'uint8': 'B',
+    'sint8': 'b',
+    'uint16': 'H',
+    'sint16': 'h',
+    'uint32': _array_typecode('IL', 4),
+    'sint32': _array_typecode('il', 4),
+    'uint64': 'Q',
+    'sint64': 'q',
+    'real32': 'd',
+    'real64': 'd',
+}
+
+
+class CIMNumericArray(SlottedPickleMixin, MutableSequence):
+    # pylint: disable=too-many-ancestors
+    """
+    A compact array of values of a numeric CIM data type (e.g. uint64 or
+    real32), that can be used instead of a :class:`py:list` for the values
+    of array properties, parameters and qualifiers.
+
+    *New in pywbem 1.10.*
+
+    The values are stored in a typed buffer (an :class:`py:array.array`)
+    that uses 1, 2, 4 or 8 bytes per value depending on the CIM data type,
+    instead of a Python object per value. Values of CIM data type real32
+    are stored with double precision, in order to represent the values of
+    :class:`~pywbem.Real32` objects exactly.
+
+    Objects of this class are mutable sequences that behave like a list of
+    CIM data type objects: Accessing an item or iterating over the array
+    returns objects of the CIM data type (e.g. :class:`~pywbem.Uint64`),
+    and objects of this class compare equal to lists, tuples and other
+    sequences with equal values.
+    Items that are set are converted to the CIM data type, and their value
+    range is always enforced, independent of
+    :data:`~pywbem.config.ENFORCE_INTEGER_RANGE`. Array items that are NULL
+    cannot be represented.
+
+    The :attr:`buffer` attribute supports the Python buffer protocol, so the
+    values can be used without copying them, for example by a NumPy array
+    created with ``numpy.frombuffer(arr.buffer, arr.buffer.typecode)``.
+
+    Parameters:
+
+      type (str):
+        The numeric CIM data type name of the array items (e.g. ``"uint64"``).
+
+      values (iterable):
+        The initial values of the array. Each value must be valid for
+        creating an object of the CIM data type.
+
+    Raises:
+
+      ValueError: Invalid CIM data type, or a value cannot be represented
+        in the CIM data type.
+      TypeError: A value has an invalid type.
+    """
+
+    __slots__ = ['_cimtype', '_data']
+
+    def __init__(self, type, values=()):
+        # pylint: disable=redefined-builtin
+        try:
+            typecode = _ARRAY_TYPECODES[type]
+        except KeyError:
+            raise ValueError(
+                _format("Invalid CIM data type for CIMNumericArray: {0!A} "
+                        "(must be a numeric CIM data type)", type))
+        self._cimtype = type
+        self._data = self._array(typecode, values)
+
+    def _array(self, typecode, values):
+        """
+        Return a new array.array object with the values converted to the CIM
+        data type of this array.
+        """
+        if isinstance(values, CIMNumericArray):
+            values = values.buffer
+        try:
+            # Fast path for numbers that are within the value range, and for
+            # arrays of the same typecode (which are copied as a whole).
+            return array(typecode, values)
+        except (TypeError, OverflowError):
+            pass
+        # Convert the values one by one, in order to accept the same values
+        # as the CIM data type and to raise its exceptions.
+        return array(typecode, (self._item(v) for v in values))
+
+    def _item(self, value):
+        """
+        Return the value converted to the CIM data type of this array.
+        """
+        if value is None:
+            raise ValueError(
+                _format("CIMNumericArray of CIM data type {0!A} cannot "
+                        "represent NULL items", self._cimtype))
+        type_obj = _TYPE_FROM_NAME[self._cimtype]
+        value = type_obj(value)
+        # The value range is enforced also if ENFORCE_INTEGER_RANGE is not
+        # set, because the buffer cannot store values outside of it.
+        if issubclass(type_obj, CIMInt) and \
+                not type_obj.minvalue <= value <= type_obj.maxvalue:
+            raise ValueError(
+                _format("Integer value {0} is out of range for CIM "
+                        "datatype {1}", value, self._cimtype))
+        return value
+
+    @property
+    def cimtype(self):
+        """
+        :term:`string`: The CIM data type name of the array items
+        (e.g. ``"uint64"``).
+        """
+        return self._cimtype
+
+    @property
+    def buffer(self):
+        """
+        :class:`py:array.array`: The typed buffer with the values of this
+        array.
+
+        The buffer is shared with this object, so modifying it modifies this
+        object.
+        """
+        return self._data
+
+    def __len__(self):
+        return len(self._data)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return CIMNumericArray(self._cimtype, self._data[index])
+        return _TYPE_FROM_NAME[self._cimtype](self._data[index])
+
+    def __iter__(self):
+        return map(_TYPE_FROM_NAME[self._cimtype], self._data)
+
+    def __reversed__(self):
+        return map(_TYPE_FROM_NAME[self._cimtype], reversed(self._data))
+
+    def __contains__(self, value):
+        return value in self._data
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            self._data[index] = self._array(self._data.typecode, value)
+        else:
+            self._data[index] = self._item(value)
+
+    def __delitem__(self, index):
+        del self._data[index]
+
+    def insert(self, index, value):
+        """
+        Insert a value before the specified index.
+        """
+        self._data.insert(index, self._item(value))
+
+    def append(self, value):
+        """
+        Append a value to the end of the array.
+        """
+        self._data.append(self._item(value))
+
+    def extend(self, values):
+        """
+        Extend the array by appending the values from an iterable.
+        """
+        self._data.extend(self._array(self._data.typecode, values))
+
+    def __eq__(self, other):
+        if isinstance(other, CIMNumericArray):
+            return self._data == other._data
+        if isinstance(other, list):
+            return list(self._data) == other
+        if isinstance(other, Sequence) and \
+                not isinstance(other, (str, bytes)):
+            return list(self._data) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __copy__(self):
+        return CIMNumericArray(self._cimtype, self)
+
+    def __deepcopy__(self, memo):
+        return CIMNumericArray(self._cimtype, self)
+
+    def __repr__(self):
+        """
+        Return a string representation suitable for debugging.
+        """
+        return _format(
+            "{0}(cimtype={1!A}, {2!A})",
+            self.__class__.__name__, self._cimtype, self._data.tolist())
+
+
 def atomic_to_cim_xml(obj):
     # pylint: disable=line-too-long
     """
@@ -41,6 +41,12 @@ attributes and methods, and can be used with the built-in Python XML
 handling routines.  In particular you can call the toxml() and
 toprettyxml() methods to generate XML.
 
+For performance reasons, the CIM-XML requests and the single-line XML strings
+returned by the tocimxmlstr() functions and methods are not produced from
+these classes, but are written directly as strings by the _write_cimxml()
+methods of the CIM object classes, using the string writer functions of this
+module (e.g. write_value()). Both ways produce the same XML strings.
+
 Note that converting using toprettyxml() inserts whitespace which may
 corrupt the data in the XML (!!) so you should only do this when
 displaying to humans who can ignore it, and never for computers.  XML
@@ -164,6 +170,128 @@ def _pcdata_nodes(pcdata):
     return nodelist
 
 
+# The following functions produce CIM-XML strings directly, without creating
+# minidom nodes. They are used by the _write_cimxml() methods of the CIM
+# object classes and by the functions building the CIM-XML requests, and
+# produce exactly the same XML strings as the ``toxml()`` method of the
+# corresponding element classes in this module.
+
+
+def _toxml_escaping():
+    """Return a tuple of two booleans that indicate whether ``toxml()``
+    escapes double quotes in text nodes, and whether it escapes whitespace
+    characters in attribute values.
+
+    The minidom module of Python 3.13 changed its escaping from the former
+    to the latter.
+    """
+    elem = CIMElement('E')
+    elem.setAttribute('A', '\n')
+    elem.appendChild(_text('"'))
+    xml_str = elem.toxml()
+    return '&quot;' in xml_str, '&#10;' in xml_str
+
+
+def escape_text(data):
+    """Return the ``data`` string escaped using XML entity references, in the
+    same way as ``toxml()`` escapes text nodes.
+
+    A value of `None` results in an empty string, consistent with
+    ``toxml()``.
+    """
+    if not data:
+        return ''
+    if '&' in data:
+        data = data.replace('&', '&amp;')
+    if '<' in data:
+        data = data.replace('<', '&lt;')
+    if '>' in data:
+        data = data.replace('>', '&gt;')
+    if _TEXT_ESCAPES_QUOT and '"' in data:
+        data = data.replace('"', '&quot;')
+    return data
+
+
+def escape_attr(data):
+    """Return the ``data`` string escaped using XML entity references, in the
+    same way as ``toxml()`` escapes attribute values.
+
+    A value of `None` results in an empty string, consistent with
+    ``toxml()``.
+    """
+    if not data:
+        return ''
+    if '&' in data:
+        data = data.replace('&', '&amp;')
+    if '<' in data:
+        data = data.replace('<', '&lt;')
+    if '>' in data:
+        data = data.replace('>', '&gt;')
+    if '"' in data:
+        data = data.replace('"', '&quot;')
+    if _ATTR_ESCAPES_WS:
+        if '\r' in data:
+            data = data.replace('\r', '&#13;')
+        if '\n' in data:
+            data = data.replace('\n', '&#10;')
+        if '\t' in data:
+            data = data.replace('\t', '&#9;')
+    return data
+
+
+def pcdata_str(pcdata):
+    """Return the properly escaped ``pcdata`` string, as it appears in the
+    XML string of the nodes returned by ``_pcdata_nodes(pcdata)``.
+
+    This includes the CDATA-based escaping if the
+    ``_cim_xml._CDATA_ESCAPING`` switch is set to True.
+    """
+
+    if _CDATA_ESCAPING and isinstance(pcdata, str) and \
+       (pcdata.find("<") >= 0 or
+        pcdata.find(">") >= 0 or
+        pcdata.find("&") >= 0):  # noqa: E129
+
+        pcdata_part_list = pcdata.split("]]>")
+        last = len(pcdata_part_list)
+        parts = []
+        i = 0
+        for pcdata_part in pcdata_part_list:
+            i += 1
+            left = "" if i == 1 else "]>"
+            right = "" if i == last else "]"
+            parts.append(f"<![CDATA[{left}{pcdata_part}{right}]]>")
+        return ''.join(parts)
+
+    return escape_text(pcdata)
+
+
+def write_value(out, pcdata):
+    """Append the XML string of a VALUE element with the specified pcdata
+    string (may be `None`) to the list of strings ``out``."""
+    if pcdata is None:
+        out.append('<VALUE/>')
+    else:
+        out.append(f'<VALUE>{pcdata_str(pcdata)}</VALUE>')
+
+
+def write_localnamespacepath(out, namespace):
+    """Append the XML string of a LOCALNAMESPACEPATH element for the
+    specified namespace name to the list of strings ``out``."""
+    out.append('<LOCALNAMESPACEPATH>')
+    for ns in namespace.split('/'):
+        out.append(f'<NAMESPACE NAME="{escape_attr(ns)}"/>')
+    out.append('</LOCALNAMESPACEPATH>')
+
+
+def write_namespacepath(out, host, namespace):
+    """Append the XML string of a NAMESPACEPATH element for the specified
+    host and namespace name to the list of strings ``out``."""
+    out.append(f'<NAMESPACEPATH><HOST>{escape_text(host)}</HOST>')
+    write_localnamespacepath(out, namespace)
+    out.append('</NAMESPACEPATH>')
+
+
 class CIMElement(Element):
     """A base class that has a few bonus helper methods."""
 
@@ -192,6 +320,10 @@ class CIMElement(Element):
         for child in children:
             self.appendChild(child)
 
+
+# Escaping done by toxml() in the Python version that is used
+_TEXT_ESCAPES_QUOT, _ATTR_ESCAPES_WS = _toxml_escaping()
+
 # Root element
 
 
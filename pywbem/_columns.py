@@ -0,0 +1,397 @@
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this program; if not, write to the Free Software
+# Foundation, Inc., 675 Mass Ave, Cambridge, MA 02139, USA.
+#
+
+"""
+The :class:`~pywbem.InstanceColumns` class represents a list of CIM instances
+in columnar form, with a column of values for each property and for each
+keybinding of the instance paths.
+
+:meth:`~pywbem.WBEMConnection.EnumerateInstancesColumnar` returns the
+enumerated instances in this form, building the columns directly from the
+CIM-XML response without creating :class:`~pywbem.CIMInstance` and
+:class:`~pywbem.CIMProperty` objects. The columns can also be filled from
+any iterable of :class:`~pywbem.CIMInstance` objects, for example from the
+result of :meth:`~pywbem.WBEMConnection.IterEnumerateInstances`.
+
+The columns of scalar properties of numeric CIM data types store their values
+in a :class:`~pywbem.CIMNumericArray`. If NumPy is installed, each column can
+be converted to a NumPy masked array.
+"""
+
+from array import array
+from collections.abc import Sequence
+
+from ._cim_types import CIMNumericArray, _ARRAY_TYPECODES
+from ._nocasedict import NocaseDict
+from ._utils import _format
+
+__all__ = ['InstanceColumns', 'InstanceColumn']
+
+
+class InstanceColumn(Sequence):
+    """
+    A column of :class:`~pywbem.InstanceColumns`, with one item for each
+    instance.
+
+    *New in pywbem 1.10.*
+
+    The items of a property column are the values of the property in the
+    instances, and the items of a keybinding column are the keybinding
+    values of the instance paths. An item is NULL if the property value is
+    NULL, or if the instance does not have the property or keybinding.
+
+    Objects of this class are read-only sequences of the item values, with
+    `None` for NULL items.
+    """
+
+    __slots__ = ['_name', '_type', '_is_array', '_values', '_mask',
+                 '_append_value', '_null_value']
+
+    def __init__(self, name, type=None, is_array=None, nulls=0):
+        # pylint: disable=redefined-builtin
+        self._name = name
+        self._type = type
+        self._is_array = is_array
+        if not is_array and type in _ARRAY_TYPECODES:
+            self._values = CIMNumericArray(type)
+            buffer = self._values.buffer
+            buffer.extend([0] * nulls)
+            # The values have already been converted to the CIM data type,
+            # so they can be appended to the buffer directly.
+            self._append_value = buffer.append
+            self._null_value = 0
+        else:
+            self._values = [None] * nulls
+            self._append_value = self._values.append
+            self._null_value = None
+        self._mask = array('B', [1] * nulls)
+
+    @property
+    def name(self):
+        """
+        :term:`string`: Name of the property or keybinding of this column.
+        """
+        return self._name
+
+    @property
+    def type(self):
+        """
+        :term:`string`: CIM data type name of the values of this column
+        (e.g. ``"uint64"``).
+
+        `None` for keybinding columns and for property columns whose
+        properties have different CIM data types or array-ness in the
+        instances.
+        """
+        return self._type
+
+    @property
+    def is_array(self):
+        """
+        :class:`py:bool`: Boolean indicating that the values of this column
+        are arrays.
+
+        `None` if :attr:`type` is `None`.
+        """
+        return self._is_array
+
+    @property
+    def values(self):
+        """
+        :class:`~pywbem.CIMNumericArray` or :class:`py:list`: The values of
+        this column, without interpretation of :attr:`mask`.
+
+        The values of a column of a scalar numeric CIM data type are stored in
+        a :class:`~pywbem.CIMNumericArray` with a value of 0 for NULL items.
+        The values of other columns are stored in a list with `None` for NULL
+        items.
+        """
+        return self._values
+
+    @property
+    def mask(self):
+        """
+        :class:`py:array.array`: The NULL mask of this column, with a value of
+        1 for NULL items and 0 for other items (array typecode ``'B'``).
+        """
+        return self._mask
+
+    def __len__(self):
+        return len(self._mask)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if self._mask[index]:
+            return None
+        return self._values[index]
+
+    def __iter__(self):
+        for value, null in zip(self._values, self._mask):
+            yield None if null else value
+
+    def __repr__(self):
+        """
+        Return a string representation suitable for debugging.
+        """
+        return _format(
+            "InstanceColumn(name={s.name!A}, type={s.type!A}, "
+            "is_array={s.is_array!A}, {0!A})", list(self), s=self)
+
+    def to_numpy(self):
+        """
+        Return the values of this column as a NumPy masked array.
+
+        This method requires NumPy to be installed. NumPy is not a dependency
+        of pywbem.
+
+        The values of a column of a scalar numeric CIM data type are returned
+        as a masked array of the corresponding NumPy data type (e.g.
+        `uint64` for CIM data type uint64, or `float64` for real32 and real64)
+        that shares the memory of :attr:`values` and :attr:`mask` without
+        copying them. The values of other columns are returned as a masked
+        array of Python objects.
+
+        Returns:
+
+          `numpy.ma.MaskedArray`: The masked array, whose mask is
+          set for the NULL items.
+
+        Raises:
+
+          ImportError: NumPy is not installed.
+        """
+        # pylint: disable=import-outside-toplevel,import-error
+        import numpy
+
+        mask = numpy.frombuffer(self._mask, dtype=numpy.bool_)
+        if isinstance(self._values, CIMNumericArray):
+            buffer = self._values.buffer
+            data = numpy.frombuffer(buffer, dtype=buffer.typecode)
+        else:
+            # Items are set one by one, so that array values remain list
+            # objects instead of becoming a dimension of the NumPy array.
+            data = numpy.empty(len(self._values), dtype=object)
+            for i, value in enumerate(self._values):
+                data[i] = value
+        return numpy.ma.MaskedArray(data, mask=mask)
+
+    def _add(self, type, is_array, value):
+        # pylint: disable=redefined-builtin
+        """
+        Append an item with a value of the CIM data type and array-ness to
+        this column.
+        """
+        if self._type is not None and \
+                (type != self._type or is_array != self._is_array):
+            self._set_untyped()
+        if value is None:
+            self._add_null()
+            return
+        try:
+            self._append_value(value)
+        except OverflowError:
+            # An integer value outside of the value range of its CIM data
+            # type, which is possible if ENFORCE_INTEGER_RANGE is disabled.
+            self._set_untyped()
+            self._append_value(value)
+        self._mask.append(0)
+
+    def _add_null(self):
+        """
+        Append a NULL item to this column.
+        """
+        self._append_value(self._null_value)
+        self._mask.append(1)
+
+    def _remove_last(self):
+        """
+        Remove the last item from this column.
+        """
+        del self._values[-1]
+        del self._mask[-1]
+
+    def _set_untyped(self):
+        """
+        Change this column to a column of values with different CIM data
+        types, that are stored in a list.
+        """
+        self._values = list(self)
+        self._append_value = self._values.append
+        self._null_value = None
+        self._type = None
+        self._is_array = None
+
+
+class InstanceColumns:
+    """
+    A list of CIM instances in columnar form, with a column of values for
+    each property and for each keybinding of the instance paths.
+
+    *New in pywbem 1.10.*
+
+    Each instance is represented by a row, i.e. by the items with the same
+    index in all columns, and by its creation class name in
+    :attr:`classnames`. Properties and keybindings that exist only in some
+    of the instances are represented by NULL items in the other rows.
+
+    Objects of this class are returned by
+    :meth:`~pywbem.WBEMConnection.EnumerateInstancesColumnar`, and can be
+    created and filled with instances using :meth:`add_instance` and
+    :meth:`add_instances`.
+
+    Example::
+
+        columns = pywbem.InstanceColumns()
+        columns.add_instances(conn.IterEnumerateInstances('CIM_Foo'))
+        for name, column in columns.properties.items():
+            print(name, column.type, list(column))
+    """
+
+    def __init__(self):
+        self._classnames = []
+        self._keybindings = NocaseDict()
+        self._properties = NocaseDict()
+
+    @property
+    def classnames(self):
+        """
+        :class:`py:list` of :term:`string`: The creation class names of the
+        instances, in the order of the rows.
+        """
+        return self._classnames
+
+    @property
+    def keybindings(self):
+        """
+        :class:`~pywbem.NocaseDict`: The keybinding columns, with:
+
+        * key (:term:`string`): Keybinding name (case independent).
+        * value (:class:`~pywbem.InstanceColumn`): Keybinding column.
+
+        Keybinding columns are untyped, i.e. their
+        :attr:`~pywbem.InstanceColumn.type` is `None`.
+        """
+        return self._keybindings
+
+    @property
+    def properties(self):
+        """
+        :class:`~pywbem.NocaseDict`: The property columns, with:
+
+        * key (:term:`string`): Property name (case independent).
+        * value (:class:`~pywbem.InstanceColumn`): Property column.
+        """
+        return self._properties
+
+    def __len__(self):
+        """
+        Return the number of rows (i.e. instances).
+        """
+        return len(self._classnames)
+
+    def __repr__(self):
+        """
+        Return a string representation suitable for debugging.
+        """
+        return _format(
+            "InstanceColumns(rows={0}, keybindings={1!A}, properties={2!A})",
+            len(self), list(self._keybindings), list(self._properties))
+
+    def add_instance(self, instance):
+        """
+        Add a CIM instance as a new row.
+
+        The keybinding columns are filled from the `path` attribute of the
+        instance, if set.
+
+        Parameters:
+
+          instance (:class:`~pywbem.CIMInstance`): The CIM instance.
+        """
+        path = instance.path
+        self.add_row(
+            instance.classname,
+            path.keybindings.items() if path is not None else (),
+            ((prop.name, prop.type, prop.is_array, prop.value)
+             for prop in instance.properties.values()))
+
+    def add_instances(self, instances):
+        """
+        Add CIM instances as new rows.
+
+        Parameters:
+
+          instances (:term:`py:iterable` of :class:`~pywbem.CIMInstance`):
+            The CIM instances. This may be a generator, for example the
+            result of :meth:`~pywbem.WBEMConnection.IterEnumerateInstances`,
+            in which case only one instance exists at a time.
+        """
+        for instance in instances:
+            self.add_instance(instance)
+
+    def add_row(self, classname, keybindings, properties):
+        """
+        Add a new row from the parts of a CIM instance.
+
+        Parameters:
+
+          classname (:term:`string`): Creation class name of the instance.
+
+          keybindings (:term:`py:iterable` of tuple(name, value)):
+            The keybindings of the instance path.
+
+          properties (:term:`py:iterable` of :class:`py:tuple`):
+            The properties of the instance, as tuple(name, type, is_array,
+            value) with name, CIM data type name, array-ness and value (as in
+            the corresponding attributes of :class:`~pywbem.CIMProperty`).
+        """
+        # pylint: disable=protected-access
+        row = len(self._classnames)
+        for kb_name, kb_value in keybindings:
+            self._column(self._keybindings, kb_name, None, None, row)._add(
+                None, None, kb_value)
+        for pname, ptype, is_array, value in properties:
+            self._column(self._properties, pname, ptype, is_array, row)._add(
+                ptype, is_array, value)
+        self._classnames.append(classname)
+
+        # Fill the columns of properties and keybindings that do not exist in
+        # this instance.
+        num_rows = row + 1
+        for columns in (self._keybindings, self._properties):
+            for column in columns.values():
+                if len(column) < num_rows:
+                    column._add_null()
+
+    @staticmethod
+    def _column(columns, name, type, is_array, row):
+        # pylint: disable=redefined-builtin,protected-access
+        """
+        Return the column for a name for adding the item of a row, creating
+        it with NULL items for the previous rows if it does not exist.
+        """
+        try:
+            column = columns[name]
+        except KeyError:
+            column = InstanceColumn(name, type, is_array, nulls=row)
+            columns[name] = column
+            return column
+        if len(column) > row:
+            # The same name occurred more than once in the instance. The last
+            # occurrence wins, like in CIMInstance.
+            column._remove_last()
+        return column
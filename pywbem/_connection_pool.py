@@ -0,0 +1,486 @@
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this program; if not, write to the Free Software
+# Foundation, Inc., 675 Mass Ave, Cambridge, MA 02139, USA.
+#
+
+"""
+*New in pywbem 1.10 as experimental.*
+
+The :class:`~pywbem.WBEMConnectionPool` class runs WBEM operations against
+many WBEM servers concurrently, using a pool of worker threads.
+
+The pool owns one :class:`~pywbem.WBEMConnection` object per WBEM server URL
+and credentials. These connections are in
+:attr:`~pywbem.WBEMConnection.thread_safe` mode, so that the operations
+against the same WBEM server run concurrently on the same connection and reuse
+its HTTP connections. The number of operations in progress is bounded by the
+number of worker threads of the pool (`max_workers`), and the number of
+operations in progress against each WBEM server is bounded by `max_per_server`.
+Further operations are queued until an operation against the same WBEM server
+has completed, without occupying a worker thread.
+
+The :meth:`~pywbem.WBEMConnectionPool.map` method runs an operation against a
+list of WBEM servers and returns the results as they complete:
+
+.. code-block:: python
+
+    import pywbem
+
+    urls = ['https://srv1', 'https://srv2', 'https://srv3']
+    with pywbem.WBEMConnectionPool(default_namespace='root/cimv2') as pool:
+        for res in pool.map(urls, 'EnumerateInstanceNames',
+                            'CIM_ComputerSystem', creds=('user', 'pw')):
+            if res.exception:
+                print(f"{res.server}: Error: {res.exception}")
+            else:
+                print(f"{res.server}: {len(res.result)} instances")
+
+The :meth:`~pywbem.WBEMConnectionPool.submit` method runs a single operation
+against a WBEM server and returns a :class:`py:concurrent.futures.Future`
+object for its result.
+
+The operation can be specified as the name of a :class:`~pywbem.WBEMConnection`
+method, or as a callable that is invoked with the connection as its first
+argument, for running a sequence of operations against a WBEM server. If the
+operation returns a generator (e.g. for the `Iter...()` methods), the
+generator is consumed in the worker thread and its items are returned as a
+list.
+"""
+
+import threading
+import types
+from collections import namedtuple, deque
+from concurrent.futures import ThreadPoolExecutor, Future
+
+from ._cim_http import parse_url
+from ._cim_operations import WBEMConnection
+from ._utils import _format
+
+__all__ = ['WBEMConnectionPool', 'PoolResult']
+
+# Default for the maximum number of operations in progress in a
+# WBEMConnectionPool (i.e. the number of its worker threads).
+DEFAULT_MAX_WORKERS = 32
+
+# Default for the maximum number of operations in progress against a single
+# WBEM server in a WBEMConnectionPool.
+DEFAULT_MAX_PER_SERVER = 4
+
+
+PoolResult = namedtuple('PoolResult', ['server', 'result', 'exception'])
+PoolResult.__doc__ = """
+    *New in pywbem 1.10 as experimental.*
+
+    A :func:`~py:collections.namedtuple` with the result of an operation that
+    was run against one WBEM server by
+    :meth:`~pywbem.WBEMConnectionPool.map`.
+
+    It has these attributes:
+
+    * **server**: The item of the `servers` parameter of
+      :meth:`~pywbem.WBEMConnectionPool.map` that specifies the WBEM server.
+
+    * **result**: The return value of the operation, or `None` if the
+      operation raised an exception.
+
+    * **exception** (:exc:`py:Exception`): The exception raised by the
+      operation, or `None` if the operation succeeded.
+    """
+
+
+class _PoolServer:
+    # pylint: disable=too-few-public-methods
+    """
+    A WBEM server in a WBEMConnectionPool, with its connection and the
+    operations against it that are queued because `max_per_server` operations
+    are already in progress.
+    """
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.running = 0
+        self.pending = deque()  # items: tuple(future, func, args, kwargs)
+
+
+class WBEMConnectionPool:
+    """
+    *New in pywbem 1.10 as experimental.*
+
+    A pool of :class:`~pywbem.WBEMConnection` objects for running WBEM
+    operations against many WBEM servers concurrently, using a pool of worker
+    threads.
+
+    For details, see :ref:`WBEM connection pool`.
+
+    This class can be used as a context manager, which causes the pool to be
+    closed at context manager exit.
+    """
+
+    def __init__(self, max_workers=DEFAULT_MAX_WORKERS,
+                 max_per_server=DEFAULT_MAX_PER_SERVER, **conn_kwargs):
+        """
+        Parameters:
+
+          max_workers (:term:`integer`):
+            Maximum number of operations in progress in the pool, i.e. the
+            number of worker threads of the pool.
+
+          max_per_server (:term:`integer`):
+            Maximum number of operations in progress against a single WBEM
+            server.
+
+          **conn_kwargs:
+            Keyword arguments for creating the :class:`~pywbem.WBEMConnection`
+            objects of the pool, except for `url`, `creds` and `thread_safe`
+            (e.g. `default_namespace`, `timeout`, `ca_certs`).
+
+        Raises:
+
+          ValueError: Invalid max_workers or max_per_server.
+          TypeError: Invalid keyword argument in conn_kwargs.
+        """
+        for name, value in (('max_workers', max_workers),
+                            ('max_per_server', max_per_server)):
+            if not isinstance(value, int) or value < 1:
+                raise ValueError(
+                    _format("The {0} parameter must be a positive integer, "
+                            "but is: {1!A}", name, value))
+        for name in ('url', 'creds', 'thread_safe'):
+            if name in conn_kwargs:
+                raise TypeError(
+                    _format("The {0!A} parameter of WBEMConnection cannot be "
+                            "specified for WBEMConnectionPool", name))
+        self._max_workers = max_workers
+        self._max_per_server = max_per_server
+        self._conn_kwargs = conn_kwargs
+        self._servers = {}  # key: (url, creds), value: _PoolServer
+        self._lock = threading.Lock()
+        self._closed = False
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix='WBEMConnectionPool')
+
+    def __enter__(self):
+        """
+        Enter method when the class is used as a context manager.
+        Returns the pool object.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Exit method when the class is used as a context manager.
+        Closes the pool.
+        """
+        self.close()
+
+    def __repr__(self):
+        """
+        Return a representation of the :class:`~pywbem.WBEMConnectionPool`
+        object that is suitable for debugging.
+        """
+        return _format(
+            "WBEMConnectionPool("
+            "max_workers={s.max_workers!A}, "
+            "max_per_server={s.max_per_server!A}, "
+            "connections={n}, "
+            "closed={s.closed!A})",
+            s=self, n=len(self._servers))
+
+    @property
+    def max_workers(self):
+        """
+        :term:`integer`: Maximum number of operations in progress in the pool.
+        """
+        return self._max_workers
+
+    @property
+    def max_per_server(self):
+        """
+        :term:`integer`: Maximum number of operations in progress against a
+        single WBEM server.
+        """
+        return self._max_per_server
+
+    @property
+    def closed(self):
+        """
+        bool: Boolean indicating that the pool has been closed.
+        """
+        return self._closed
+
+    @property
+    def connections(self):
+        """
+        list of :class:`~pywbem.WBEMConnection`: The connections of the pool,
+        in the order they were created.
+        """
+        with self._lock:
+            return [server.conn for server in self._servers.values()]
+
+    def get_connection(self, url, creds=None):
+        """
+        Return the connection of the pool to a WBEM server, creating it if
+        needed.
+
+        The connections of the pool are identified by the normalized URL and
+        the credentials of the WBEM server.
+
+        Parameters:
+
+          url (str):
+            URL of the WBEM server. For details, see the same-named init
+            parameter of :class:`~pywbem.WBEMConnection`.
+
+          creds (:func:`py:tuple` of userid, password):
+            Credentials for HTTP authentication with the WBEM server.
+            For details, see the same-named init parameter of
+            :class:`~pywbem.WBEMConnection`.
+
+        Returns:
+
+          :class:`~pywbem.WBEMConnection`: The connection to the WBEM server,
+          which is in :attr:`~pywbem.WBEMConnection.thread_safe` mode.
+
+        Raises:
+
+          RuntimeError: The pool has been closed.
+        """
+        with self._lock:
+            return self._get_server(url, creds).conn
+
+    def _get_server(self, url, creds):
+        """
+        Return the _PoolServer object for a WBEM server, creating it and its
+        connection if needed. Must be called with the lock held.
+        """
+        if self._closed:
+            raise RuntimeError("The WBEMConnectionPool is closed")
+        key = (parse_url(url)[2], None if creds is None else tuple(creds))
+        server = self._servers.get(key)
+        if server is None:
+            conn = WBEMConnection(url, creds, thread_safe=True,
+                                  **self._conn_kwargs)
+            server = _PoolServer(conn)
+            self._servers[key] = server
+        return server
+
+    def submit(self, url, operation, *args, creds=None, **kwargs):
+        """
+        Run an operation against a WBEM server in the pool.
+
+        The operation is started when a worker thread of the pool is
+        available and less than `max_per_server` operations are in progress
+        against the WBEM server.
+
+        Parameters:
+
+          url (str):
+            URL of the WBEM server. For details, see the same-named init
+            parameter of :class:`~pywbem.WBEMConnection`.
+
+          operation (str or :term:`callable`):
+            The operation to be run. A string is the name of the
+            :class:`~pywbem.WBEMConnection` method to be invoked on the
+            connection to the WBEM server (e.g. ``'EnumerateInstances'``).
+            A callable is invoked with the connection to the WBEM server as
+            its first argument.
+
+            If the operation returns a generator, the generator is consumed
+            and the result of the operation is the list of its items.
+
+          *args:
+            Positional arguments for the operation.
+
+          creds (:func:`py:tuple` of userid, password):
+            Credentials for HTTP authentication with the WBEM server.
+            For details, see the same-named init parameter of
+            :class:`~pywbem.WBEMConnection`.
+
+          **kwargs:
+            Keyword arguments for the operation.
+
+        Returns:
+
+          :class:`py:concurrent.futures.Future`: The future for the result
+          of the operation. Its :meth:`~py:concurrent.futures.Future.result`
+          method returns the return value of the operation or raises the
+          exception raised by the operation.
+
+        Raises:
+
+          RuntimeError: The pool has been closed.
+        """
+        func = _operation_func(operation)
+        future = Future()
+        with self._lock:
+            server = self._get_server(url, creds)
+            if server.running < self._max_per_server:
+                server.running += 1
+                self._executor.submit(
+                    self._run, server, future, func, args, kwargs)
+            else:
+                server.pending.append((future, func, args, kwargs))
+        return future
+
+    def _run(self, server, future, func, args, kwargs):
+        """
+        Run an operation in a worker thread, and then start the next queued
+        operation against the same WBEM server, if any.
+        """
+        while True:
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = func(server.conn, *args, **kwargs)
+                    if isinstance(result, types.GeneratorType):
+                        result = list(result)
+                # pylint: disable=broad-exception-caught
+                except Exception as exc:
+                    future.set_exception(exc)
+                else:
+                    future.set_result(result)
+            with self._lock:
+                if not server.pending:
+                    server.running -= 1
+                    return
+                future, func, args, kwargs = server.pending.popleft()
+
+    def map(self, servers, operation, *args, creds=None, **kwargs):
+        """
+        Run an operation against multiple WBEM servers in the pool, and
+        return the results as they complete.
+
+        Parameters:
+
+          servers (:term:`py:iterable`):
+            The WBEM servers. Each item is either a URL of a WBEM server, or
+            a tuple of URL and credentials of a WBEM server. For details on
+            URL and credentials, see the `url` and `creds` init parameters of
+            :class:`~pywbem.WBEMConnection`.
+
+          operation (str or :term:`callable`):
+            The operation to be run. For details, see
+            :meth:`~pywbem.WBEMConnectionPool.submit`.
+
+          *args:
+            Positional arguments for the operation.
+
+          creds (:func:`py:tuple` of userid, password):
+            Credentials for HTTP authentication with the WBEM servers that
+            are specified as URLs in the `servers` parameter.
+
+          **kwargs:
+            Keyword arguments for the operation.
+
+        Returns:
+
+          :term:`py:generator` iterating :class:`~pywbem.PoolResult`:
+          A generator object that yields the result of the operation against
+          each WBEM server as soon as it has completed. Exceptions raised by
+          the operation are returned in the
+          :attr:`~pywbem.PoolResult.exception` attribute of the result,
+          rather than being raised. If the generator is closed before it is
+          exhausted, the operations that have not been started are cancelled.
+
+        Raises:
+
+          RuntimeError: The pool has been closed.
+        """
+        futures = {}
+        for server in servers:
+            if isinstance(server, tuple):
+                url, server_creds = server
+            else:
+                url, server_creds = server, creds
+            future = self.submit(url, operation, *args, creds=server_creds,
+                                 **kwargs)
+            futures[future] = server
+        return self._iter_completed(futures)
+
+    @staticmethod
+    def _iter_completed(futures):
+        """
+        Generator function that yields PoolResult objects for the futures in
+        the order the futures complete. See map().
+        """
+        done = threading.Condition()
+        completed = deque()
+
+        def on_done(future):
+            with done:
+                completed.append(future)
+                done.notify()
+
+        try:
+            for future in futures:
+                future.add_done_callback(on_done)
+            for _ in range(len(futures)):
+                with done:
+                    while not completed:
+                        done.wait()
+                    future = completed.popleft()
+                if future.cancelled():
+                    continue
+                exc = future.exception()
+                if exc is None:
+                    yield PoolResult(futures[future], future.result(), None)
+                else:
+                    yield PoolResult(futures[future], None, exc)
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def close(self):
+        """
+        Close the pool.
+
+        The operations that have not been started are cancelled, the
+        operations in progress are waited for to complete, and the
+        connections of the pool are closed.
+
+        Closing a pool that is already closed has no effect.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            for server in self._servers.values():
+                while server.pending:
+                    future = server.pending.popleft()[0]
+                    future.cancel()
+        self._executor.shutdown(wait=True)
+        for server in self._servers.values():
+            server.conn.close()
+
+
+def _operation_func(operation):
+    """
+    Return a function for invoking an operation on a connection, from the
+    operation parameter of WBEMConnectionPool.submit().
+    """
+    if callable(operation):
+        return operation
+    if isinstance(operation, str):
+        if not callable(getattr(WBEMConnection, operation, None)) or \
+                operation.startswith('_'):
+            raise ValueError(
+                _format("The operation parameter specifies an unknown "
+                        "WBEMConnection method: {0!A}", operation))
+
+        def func(conn, *args, **kwargs):
+            return getattr(conn, operation)(*args, **kwargs)
+
+        return func
+    raise TypeError(
+        _format("The operation parameter must be a string or a callable, "
+                "but has type: {0}", type(operation)))
@@ -213,6 +213,7 @@ import threading
 import atexit
 import getpass
 import queue
+import zlib
 try:
     import termios
 except ImportError:
@@ -230,8 +231,10 @@ from ._version import __version__
 from ._cim_obj import CIMInstance
 from ._cim_constants import CIM_ERR_NOT_SUPPORTED, CIM_ERR_INVALID_PARAMETER, \
     CIM_ERR_FAILED, _statuscode2name
+from ._cim_http import decompress_body
 from ._tupleparse import TupleParser
-from ._tupletree import xml_to_tupletree_sax
+from ._tupledecode import TupleDecoder
+from ._tupletree import xml_to_tupletree_expat
 from ._exceptions import CIMXMLParseError, XMLParseError, CIMVersionError, \
     DTDVersionError, ProtocolVersionError, ListenerCertificateError, \
     ListenerPortError, ListenerPromptError, ListenerStartError
@@ -266,6 +269,10 @@ TOKEN_CHARSET_FINDALL_PATTERN = re.compile(
 # Default maximum size of the indication queue.
 DEFAULT_MAX_IND_QUEUE_SIZE = 5000
 
+# Default maximum size in Bytes of the body of a compressed export request,
+# after decompressing it.
+DEFAULT_MAX_REQUEST_SIZE = 16 * 1024 * 1024
+
 __all__ = ['WBEMListener', 'callback_interface']
 
 
@@ -617,13 +624,15 @@ class ListenerRequestHandler(BaseHTTPRequestHandler):
                         content_type))
             return
 
-        # Content-Encoding header check described in DSP0200
+        # Content-Encoding header check described in DSP0200. Compressed
+        # requests are supported with the gzip and deflate content codings.
         content_encoding = self.headers.get('Content-Encoding', 'identity')
-        if content_encoding.lower() != 'identity':
+        content_encoding = content_encoding.strip().lower()
+        if content_encoding not in ('identity', 'gzip', 'x-gzip', 'deflate'):
             self.send_http_error(
                 406, 'header-mismatch',
-                _format("Invalid Content-Encoding header value: {0}"
-                        "(listener supports only identity)",
+                _format("Invalid Content-Encoding header value: {0} "
+                        "(listener supports identity, gzip and deflate)",
                         content_encoding))
             return
 
@@ -635,12 +644,42 @@ class ListenerRequestHandler(BaseHTTPRequestHandler):
         # by servers, but listeners are not required to reject them:
         # Content-Range, Expires, If-Range, Range.
 
-        # Start processing the request
+        # Start processing the request. The maximum request size only limits
+        # compressed requests, in order to protect against decompression
+        # bombs.
+        if content_encoding != 'identity':
+            max_size = self.server.listener.max_request_size or None
+        else:
+            max_size = None
         content_len = int(self.headers.get('Content-Length', 0))
+        if max_size is not None and content_len > max_size:
+            # The request body is not read, so the connection cannot be
+            # used for further requests.
+            self.close_connection = True
+            self.send_http_error(
+                413, cim_error_details=_format(
+                    "The request body of {0} Bytes exceeds the maximum size "
+                    "of {1} Bytes", content_len, max_size))
+            return
         body = self.rfile.read(content_len)
 
+        if content_encoding != 'identity':
+            try:
+                body = decompress_body(body, content_encoding, max_size)
+            except zlib.error as exc:
+                self.send_http_error(
+                    400, "request-not-well-formed",
+                    _format("Cannot decompress the request body with "
+                            "Content-Encoding {0}: {1}",
+                            content_encoding, exc))
+                return
+            except ValueError as exc:
+                self.send_http_error(413, cim_error_details=str(exc))
+                return
+
         try:
-            msgid, methodname, params = self.parse_export_request(body)
+            msgid, methodname, params = self.parse_export_request(
+                body, self.server.listener.direct_decode)
         except (CIMXMLParseError, XMLParseError) as exc:
             self.send_http_error(400, "request-not-well-formed", str(exc))
             return
@@ -787,17 +826,25 @@ class ListenerRequestHandler(BaseHTTPRequestHandler):
         self.wfile.write(resp_body)
 
     @staticmethod
-    def parse_export_request(request_str):
+    def parse_export_request(request_str, direct_decode=False):
         """
         Parse a CIM-XML export request message, and return
         a tuple(msgid, methodname, params).
+
+        If direct_decode is True, the elements of the request are decoded
+        while the request is parsed (see WBEMListener.direct_decode).
         """
 
         # Parse the XML into a tuple tree (may raise CIMXMLParseError or
         # XMLParseError):
 
-        tt_ = xml_to_tupletree_sax(request_str, "CIM-XML export request")
-        tp = TupleParser()
+        if direct_decode:
+            tp = decoder = TupleDecoder()
+        else:
+            tp = TupleParser()
+            decoder = None
+        tt_ = xml_to_tupletree_expat(
+            request_str, "CIM-XML export request", decoder=decoder)
         tup_tree = tp.parse_cim(tt_)
 
         # Check the tuple tree
@@ -978,7 +1025,9 @@ class WBEMListener:
 
     def __init__(self, host, http_port=None, https_port=None,
                  certfile=None, keyfile=None,
-                 max_ind_queue_size=DEFAULT_MAX_IND_QUEUE_SIZE):
+                 max_ind_queue_size=DEFAULT_MAX_IND_QUEUE_SIZE,
+                 direct_decode=False,
+                 max_request_size=DEFAULT_MAX_REQUEST_SIZE):
         """
         Parameters:
 
@@ -1045,12 +1094,44 @@ class WBEMListener:
             For a reliable operation of the listener, it is recommended to
             define a maximum queue size.
 
+          direct_decode (bool):
+            Controls whether the received CIM-XML export requests are decoded
+            into CIM objects while they are parsed.
+
+            *New in pywbem 1.10.*
+
+            `True` means that each element of an export request is decoded
+            into its CIM object as soon as the XML parser has reached the end
+            of the element, without building the complete parse tree of the
+            request first. The validation of the request and the errors that
+            are sent back for invalid requests are the same as with `False`.
+            See also the same-named parameter of
+            :class:`~pywbem.WBEMConnection`.
+
+            `False` (default) means that the complete parse tree of an export
+            request is built first, and is then decoded into CIM objects.
+
+          max_request_size (int):
+            A positive integer which defines the maximum size in Bytes of the
+            body of a received compressed export request, after decompressing
+            it. The decompression is aborted as soon as the size is exceeded,
+            so that small compressed requests that decompress to a very large
+            size (decompression bombs) do not exhaust the memory of the
+            listener. Requests that exceed the size are rejected with HTTP
+            status 413 (Content Too Large). The size of uncompressed requests
+            is not limited.
+
+            *New in pywbem 1.10.*
+
+            A value of 0 indicates that the size of requests is not limited.
+
         Raises:
 
-          TypeError: port, max_ind_queue_size arguments invalid type.
+          TypeError: port, max_ind_queue_size, max_request_size arguments
+            invalid type.
 
-          ValueError: No connection port specified, max_ind_queue_size
-            invalid integer.
+          ValueError: No connection port specified, max_ind_queue_size or
+            max_request_size invalid integer.
         """
 
         self._host = host
@@ -1105,6 +1186,15 @@ class WBEMListener:
             raise ValueError(
                 "max__ind_queue_size argument must be positive integer.")
         self._max_ind_queue_size = max_ind_queue_size
+        self._direct_decode = direct_decode
+
+        if not isinstance(max_request_size, int) or \
+                isinstance(max_request_size, bool):
+            raise TypeError("max_request_size argument must be integer.")
+        if max_request_size < 0:
+            raise ValueError(
+                "max_request_size argument must be positive integer.")
+        self._max_request_size = max_request_size
 
         # Define timeout in seconds for gets on ind_delivery_queue object.
         # Causes wait after indication queue get if queue is empty.
@@ -1146,7 +1236,9 @@ class WBEMListener:
             "_keyfile={s._keyfile!A}, "
             "_logger={s._logger!A}, "
             "_callbacks={s._callbacks!A}, "
-            "_max_ind_queue_size={s._max_ind_queue_size!A})",
+            "_max_ind_queue_size={s._max_ind_queue_size!A}, "
+            "_direct_decode={s._direct_decode!A}, "
+            "_max_request_size={s._max_request_size!A})",
             s=self)
 
     def __enter__(self):
@@ -1271,6 +1363,31 @@ class WBEMListener:
         """
         return self._max_ind_queue_size
 
+    @property
+    def direct_decode(self):
+        """
+        bool: Boolean indicating that the received CIM-XML export requests
+        are decoded into CIM objects while they are parsed.
+
+        *New in pywbem 1.10.*
+
+        For details, see the description of the same-named init parameter of
+        :class:`this class <pywbem.WBEMListener>`.
+        """
+        return self._direct_decode
+
+    @property
+    def max_request_size(self):
+        """
+        int: The maximum size in Bytes of the body of a received compressed
+        export request, after decompressing it.
+
+        *New in pywbem 1.10.*
+
+        A value of 0 means that the size of requests is not limited.
+        """
+        return self._max_request_size
+
     def ind_queue_exists(self):
         """
         Returns whether the indication queue exists.
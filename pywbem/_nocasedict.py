@@ -40,6 +40,8 @@ described in detail in this documentation.
 
 from ._vendor.nocasedict import NocaseDict as _NocaseDict
 from ._vendor.nocasedict import HashableMixin, KeyableByMixin
+from ._vendor.nocasedict._nocasedict import dict_keys, dict_values, \
+    dict_items
 
 __all__ = ['NocaseDict']
 
@@ -47,6 +49,77 @@ __all__ = ['NocaseDict']
 # specified as an argument. Must match the definition in nocasedict package.
 _OMITTED = object()
 
+# Cache of the casefolded keys of NocaseDict objects, by original key. The
+# keys are mostly CIM names from a limited set (e.g. property names), so
+# caching their casefolded form avoids casefolding them again for each
+# NocaseDict operation, and all NocaseDict objects share the casefolded key
+# strings. The cache is cleared when it reaches its maximum size.
+_CASEFOLDED_KEYS = {}
+_CASEFOLDED_KEYS_MAX = 10000
+
+
+def _casefolded(key):
+    """
+    Return the casefolded key, using the cache of casefolded keys.
+
+    This implements the same casefolding as nocasedict.NocaseDict, including
+    the handling of unnamed keys (`None`) and of byte string keys.
+    """
+    try:
+        return _CASEFOLDED_KEYS[key]
+    except (KeyError, TypeError):
+        pass
+    if key is None:
+        return None
+    try:
+        k = key.casefold()
+    except AttributeError:
+        # Probably a byte string, fall back to lower()
+        return key.lower()
+    if isinstance(key, str):
+        if len(_CASEFOLDED_KEYS) >= _CASEFOLDED_KEYS_MAX:
+            _CASEFOLDED_KEYS.clear()
+        _CASEFOLDED_KEYS[key] = k
+    return k
+
+
+class _KeysView(dict_keys):
+    # pylint: disable=too-few-public-methods
+    """
+    Dictionary keys view that iterates the items of the internal dictionary
+    directly.
+    """
+
+    def __iter__(self):
+        # pylint: disable=protected-access
+        for item in self._dict._data.values():
+            yield item[0]
+
+
+class _ValuesView(dict_values):
+    # pylint: disable=too-few-public-methods
+    """
+    Dictionary values view that iterates the items of the internal dictionary
+    directly.
+    """
+
+    def __iter__(self):
+        # pylint: disable=protected-access
+        for item in self._dict._data.values():
+            yield item[1]
+
+
+class _ItemsView(dict_items):
+    # pylint: disable=too-few-public-methods
+    """
+    Dictionary items view that iterates the items of the internal dictionary
+    directly.
+    """
+
+    def __iter__(self):
+        # pylint: disable=protected-access
+        return iter(self._dict._data.values())
+
 
 class NocaseDict(HashableMixin, KeyableByMixin('name'), _NocaseDict):
     """
@@ -59,12 +132,48 @@ class NocaseDict(HashableMixin, KeyableByMixin('name'), _NocaseDict):
 
     * the ability to allow or disallow (by default) unnamed keys via a public
       'allow_unnamed_keys' attribute
+
+    * bulk construction from trusted items via from_items()
+
+    For performance reasons, the methods that are used on the hot paths of
+    pywbem are implemented directly on the internal dictionary. They get the
+    casefolded keys from _casefolded_key(), which uses the cache of casefolded
+    keys.
     """
 
     def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+        if args or kwargs:
+            super().__init__(*args, **kwargs)
+        else:
+            self._data = {}
         self.allow_unnamed_keys = False
 
+    @classmethod
+    def from_items(cls, items, allow_unnamed_keys=False):
+        """
+        Return a new NocaseDict object with the items from an iterable of
+        tuple(key, value), in iteration order.
+
+        As with the init method, if a key occurs more than once
+        (case-insensitively), the last item for that key wins. The items are
+        not checked, so this method must be used only for trusted input (e.g.
+        from the CIM-XML parser or for copies), where the keys are known to be
+        valid for the dictionary and the values have already been checked.
+        """
+        obj = cls.__new__(cls)
+        obj.allow_unnamed_keys = allow_unnamed_keys
+        data = obj._data = {}
+        casefolded_key = obj._casefolded_key
+        for key, value in items:
+            data[casefolded_key(key)] = (key, value)
+        return obj
+
+    def _casefolded_key(self, key):
+        """
+        Return the casefolded key, using the cache of casefolded keys.
+        """
+        return _casefolded(key)
+
     def _check_unnamed_key(self, key):
         """
         Reject unnamed keys if not allowed.
@@ -76,21 +185,62 @@ class NocaseDict(HashableMixin, KeyableByMixin('name'), _NocaseDict):
     # The following methods must be all those that take a key parameter
 
     def __getitem__(self, key):
-        self._check_unnamed_key(key)
-        return super().__getitem__(key)
+        if key is None:
+            self._check_unnamed_key(key)
+        try:
+            return self._data[self._casefolded_key(key)][1]
+        except KeyError:
+            key_error = KeyError(f"Key {key!r} not found")
+            key_error.__cause__ = None  # Suppress 'During handling..'
+            raise key_error  # pylint: disable=raise-missing-from
 
     def __setitem__(self, key, value):
-        self._check_unnamed_key(key)
-        return super().__setitem__(key, value)
+        if key is None:
+            self._check_unnamed_key(key)
+        self._data[self._casefolded_key(key)] = (key, value)
 
     def __delitem__(self, key):
         self._check_unnamed_key(key)
         return super().__delitem__(key)
 
     def __contains__(self, key):
-        self._check_unnamed_key(key)
-        return super().__contains__(key)
+        if key is None:
+            self._check_unnamed_key(key)
+        return self._casefolded_key(key) in self._data
 
     def pop(self, key, default=_OMITTED):
         self._check_unnamed_key(key)
         return super().pop(key, default)
+
+    # The following methods iterate the items of the internal dictionary
+    # directly, instead of looking up each casefolded key.
+
+    def __iter__(self):
+        for item in self._data.values():
+            yield item[0]
+
+    def keys(self):
+        return _KeysView(self)
+
+    def values(self):
+        return _ValuesView(self)
+
+    def items(self):
+        return _ItemsView(self)
+
+    def copy(self):
+        """
+        Return a copy of the dictionary, as an object of the same class with
+        the same 'allow_unnamed_keys' attribute.
+
+        This is a middle-deep copy; the values in the dictionary are shared
+        between original and copy.
+
+        The copy is created by calling the class without arguments. Subclasses
+        whose init method requires arguments or that have state beyond the
+        items of the dictionary must override this method.
+        """
+        result = self.__class__()
+        result.allow_unnamed_keys = self.allow_unnamed_keys
+        result._data.update(self._data)  # pylint: disable=protected-access
+        return result
@@ -23,6 +23,7 @@ Operation recorder interface and implementations.
 from collections import namedtuple, OrderedDict
 from datetime import datetime, timedelta
 import logging
+import threading
 
 import yaml
 import yamlloader
@@ -31,10 +32,11 @@ from ._nocasedict import NocaseDict
 from ._cim_obj import CIMInstance, CIMInstanceName, CIMClass, CIMClassName, \
     CIMProperty, CIMMethod, CIMParameter, CIMQualifier, \
     CIMQualifierDeclaration
-from ._cim_types import CIMInt, CIMFloat, CIMDateTime
+from ._cim_types import CIMInt, CIMFloat, CIMDateTime, CIMNumericArray
+from ._columns import InstanceColumns, InstanceColumn
 from ._exceptions import CIMError
 from ._logging import LOGGER_API_CALLS_NAME, LOGGER_HTTP_NAME
-from ._utils import _ensure_unicode, _format
+from ._utils import _ensure_unicode, _format, _StateAttribute
 
 
 __all__ = ['BaseOperationRecorder', 'TestClientRecorder',
@@ -218,11 +220,39 @@ class BaseOperationRecorder:
     :meth:`~pywbem.BaseOperationRecorder.disable` and
     :meth:`~pywbem.BaseOperationRecorder.enable` methods, respectively.
     This can be used to temporarily pause the recorder.
+
+    The data of the operation that is being staged is maintained separately
+    for each thread, so that an operation recorder can record the operations
+    of a connection in :attr:`~pywbem.WBEMConnection.thread_safe` mode that
+    are executed concurrently in multiple threads.
     """
 
+    # Data of the operation being staged, stored in the _staged
+    # threading.local object of the recorder, so that each thread has its
+    # own staged operation.
+    _pywbem_method = _StateAttribute('_staged')
+    _pywbem_args = _StateAttribute('_staged')
+    _pywbem_result_ret = _StateAttribute('_staged')
+    _pywbem_result_exc = _StateAttribute('_staged')
+    _http_request_version = _StateAttribute('_staged')
+    _http_request_conn_id = _StateAttribute('_staged')
+    _http_request_url = _StateAttribute('_staged')
+    _http_request_target = _StateAttribute('_staged')
+    _http_request_method = _StateAttribute('_staged')
+    _http_request_headers = _StateAttribute('_staged')
+    _http_request_payload = _StateAttribute('_staged')
+    _http_response_version = _StateAttribute('_staged')
+    _http_response_conn_id = _StateAttribute('_staged')
+    _http_response_status = _StateAttribute('_staged')
+    _http_response_reason = _StateAttribute('_staged')
+    _http_response_headers = _StateAttribute('_staged')
+    _http_response_payload = _StateAttribute('_staged')
+    _pull_op = _StateAttribute('_staged')
+
     def __init__(self):
         self._enabled = True
         self._conn_id = None
+        self._staged = threading.local()
         self.reset()
 
     def copy(self):
@@ -969,7 +999,7 @@ class TestClientRecorder(BaseOperationRecorder):
             # converted to a dictionary first.
             ret_dict = obj._asdict()
             return self.toyaml(ret_dict)
-        if isinstance(obj, (list, tuple)):
+        if isinstance(obj, (list, tuple, CIMNumericArray, InstanceColumn)):
             # Note that namedtuple objects are handeled above.
             ret = []
             for item in obj:
@@ -980,6 +1010,12 @@ class TestClientRecorder(BaseOperationRecorder):
             for key in obj.keys():  # get keys in original case
                 ret_dict[key] = self.toyaml(obj[key])
             return ret_dict
+        if isinstance(obj, InstanceColumns):
+            ret_dict = OrderedDict()
+            ret_dict['classnames'] = self.toyaml(obj.classnames)
+            ret_dict['keybindings'] = self.toyaml(obj.keybindings)
+            ret_dict['properties'] = self.toyaml(obj.properties)
+            return ret_dict
         if obj is None:
             return obj
         if isinstance(obj, bytes):
@@ -146,6 +146,7 @@ response times::
 
 import time
 import copy
+import threading
 
 from ._utils import _format
 
@@ -184,7 +185,8 @@ class OperationStatistic:
         """
         self._container = container
         self._stat_start_time = None
-        self._start_time = None
+        # Start times of the measurements in progress, by thread identifier
+        self._start_times = {}
         self._name = name
 
         self._count = 0
@@ -402,14 +404,27 @@ class OperationStatistic:
         A subsequent invocation of :meth:`~pywbem.OperationStatistic.stop_timer`
         will complete the measurement for that operation and will update the
         statistics data.
+
+        Returns:
+
+          float: The start time of the measurement, in seconds since the epoch,
+          or `None` if the statistics container holding this object is not
+          enabled. The start time can be passed to
+          :meth:`~pywbem.OperationStatistic.stop_timer` in order to complete
+          one of multiple concurrent measurements for the same operation.
+          *New in pywbem 1.10.*
         """
         if self.container.enabled:
-            self._start_time = time.time()
+            start_time = time.time()
+            with self._container._lock:  # pylint: disable=protected-access
+                self._start_times[threading.get_ident()] = start_time
             if not self._stat_start_time:
-                self._stat_start_time = self._start_time
+                self._stat_start_time = start_time
+            return start_time
+        return None
 
     def stop_timer(self, request_len=None, reply_len=None, server_time=None,
-                   exception=False):
+                   exception=False, start_time=None):
         """
         This is a low-level method is called by pywbem at the end of an
         operation. It completes the measurement for that operation by capturing
@@ -441,6 +456,19 @@ class OperationStatistic:
             during the remainder of the current statistics measurement interval.
             A reset of the statistics clears that condition again.
 
+          start_time (float):
+            Start time of the measurement, as returned by
+            :meth:`~pywbem.OperationStatistic.start_timer`.
+
+            If `None`, the start time of the preceding invocation of
+            :meth:`~pywbem.OperationStatistic.start_timer` in the current
+            thread is used. Specifying
+            the start time allows completing one of multiple concurrent
+            measurements for the same operation, as needed for the
+            :class:`~pywbem.AsyncWBEMConnection` class.
+
+            *New in pywbem 1.10.*
+
         Returns:
 
           float: The elapsed time for the operation that just ended, or
@@ -451,11 +479,23 @@ class OperationStatistic:
             return None
 
         # stop the timer
-        if self._start_time is None:
-            raise RuntimeError('stop_timer() called without preceding '
-                               'start_timer()')
-        dt = time.time() - self._start_time
-        self._start_time = None
+        with self._container._lock:  # pylint: disable=protected-access
+            thread_start_time = self._start_times.pop(
+                threading.get_ident(), None)
+            if start_time is None:
+                start_time = thread_start_time
+            if start_time is None:
+                raise RuntimeError('stop_timer() called without preceding '
+                                   'start_timer()')
+            dt = time.time() - start_time
+            self._update(dt, request_len, reply_len, server_time, exception)
+        return dt
+
+    def _update(self, dt, request_len, reply_len, server_time, exception):
+        """
+        Update the statistics data with the data of an operation that just
+        ended. For a description of the parameters, see stop_timer().
+        """
         self._count += 1
         if exception:
             self._exception_count += 1
@@ -501,8 +541,6 @@ class OperationStatistic:
             if reply_len < self._reply_len_min:
                 self._reply_len_min = reply_len
 
-        return dt
-
     def __repr__(self):
         """
         Return a human readable string with the statistics values, for debug
@@ -607,10 +645,25 @@ class Statistics:
         self._op_stats = {}
         self._disabled_stats = OperationStatistic(self, "disabled")
 
+        # Lock for updating the statistics data of this container, so that
+        # operations that are performed concurrently in multiple threads
+        # (e.g. on a WBEMConnection in thread_safe mode) do not lose updates.
+        self._lock = threading.Lock()
+
         # Used in context manager (which supports nesting)
         self._cm_stack = []  # items: OperationStatistic object
         self._cm_name = None  # stored only between __call__() and __enter__()
 
+    def __getstate__(self):
+        # The lock cannot be copied or pickled, so copies get a new lock.
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
     def __enter__(self):
         """
         Enter method when the class is used as a context manager.
@@ -717,9 +770,12 @@ class Statistics:
         """
         if not self.enabled:
             return self._disabled_stats
-        if name not in self._op_stats:
-            self._op_stats[name] = OperationStatistic(self, name)
-        return self._op_stats[name]
+        try:
+            return self._op_stats[name]
+        except KeyError:
+            with self._lock:
+                return self._op_stats.setdefault(
+                    name, OperationStatistic(self, name))
 
     def snapshot(self):
         """
@@ -738,7 +794,8 @@ class Statistics:
           - stats (:class:`~pywbem.OperationStatistic`): Time statistics for
             the operation
         """
-        return list(copy.deepcopy(self._op_stats).items())
+        with self._lock:
+            return list(copy.deepcopy(self._op_stats).items())
 
     def __repr__(self):
         """
@@ -813,7 +870,7 @@ class Statistics:
         """
         # Test for any stats being currently timed.
         for stat in self._op_stats.values():
-            if stat._start_time is not None:  # pylint: disable=protected-access
+            if stat._start_times:  # pylint: disable=protected-access
                 return False
 
         # clear all statistics
@@ -0,0 +1,184 @@
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this program; if not, write to the Free Software
+# Foundation, Inc., 675 Mass Ave, Cambridge, MA 02139, USA.
+#
+
+"""
+Event-driven decoder for CIM-XML that decodes each element into its CIM
+object representation as soon as the element has been parsed.
+
+The decoder is a TupleParser that is driven by the end-element events of the
+pyexpat based TupleTreeBuilder, instead of walking a complete tupletree after
+the XML string has been parsed. When an element ends, its child elements have
+all been decoded already, so the TupleParser ``parse_*()`` method for the
+element works on the decoded child elements, and the element is then replaced
+in its parent by a decoded node::
+
+  (NAME, ATTRS, (), RESULT)
+
+where RESULT is the result of the ``parse_*()`` method for the element (the
+reserved fourth element of a tupletree node). The child elements of a decoded
+node are dropped, so that a complete tupletree of the XML string never
+exists.
+
+The ``parse_*()`` methods of TupleDecoder return the result of a decoded node
+without parsing it again, so the parse methods of TupleParser are used
+unchanged, and the usual entry points (e.g. ``parse_cim()`` or
+``parse_any()``) can be called on the decoded root node.
+
+An error detected while decoding an element is not raised when the element
+ends, but is raised when the parent element uses the decoded node. This
+preserves the validation errors and their precedence of TupleParser, because
+the checks of a parent element are still performed before its child elements
+are used.
+"""
+
+from ._tupleparse import TupleParser, PROPERTY_ELEMENTS
+
+__all__ = []
+
+
+class _DecodeFailure:
+    # pylint: disable=too-few-public-methods
+    """
+    Result of a decoded node whose decoding raised an exception.
+    """
+
+    __slots__ = ['exc']
+
+    def __init__(self, exc):
+        self.exc = exc
+
+
+# Caches of the names of the TupleParser methods for parsing an element and of
+# these methods, by element name.
+_PARSE_FUNCNAMES = {}
+_PARSE_METHODS = {}
+
+
+def _parse_funcname(nodename):
+    """
+    Return the name of the TupleParser method for parsing an element, in the
+    same way as TupleParser.parse_any() determines it.
+    """
+    try:
+        return _PARSE_FUNCNAMES[nodename]
+    except KeyError:
+        funcname = 'parse_' + nodename.lower().replace('.', '_')
+        _PARSE_FUNCNAMES[nodename] = funcname
+        return funcname
+
+
+def _parse_method(nodename):
+    """
+    Return the TupleParser method for parsing an element as an unbound
+    function, or `None` if there is no such method.
+    """
+    try:
+        return _PARSE_METHODS[nodename]
+    except KeyError:
+        method = getattr(TupleParser, _parse_funcname(nodename), None)
+        _PARSE_METHODS[nodename] = method
+        return method
+
+
+class TupleDecoder(TupleParser):
+    """
+    Decoder for CIM-XML that decodes each element as soon as it has been
+    parsed.
+
+    The decoder is passed to the `decoder` parameter of the
+    ``xml_to_tupletree_expat()`` functions, and the decoded root node returned
+    by these functions is then passed to a ``parse_*()`` method of the same
+    decoder (e.g. ``parse_cim()``), which returns the decoded result.
+
+    *New in pywbem 1.10.*
+    """
+
+    def decode_node(self, tup_tree):
+        """
+        Decode a tupletree node whose child elements have been decoded
+        already, and return the decoded node.
+
+        Exceptions raised while decoding the node are stored in the decoded
+        node, and are raised when the decoded node is used.
+
+        In the lazy_instances mode, property elements are not decoded, and
+        their nodes are returned unchanged, so that they are parsed when the
+        property is accessed.
+        """
+        if self.lazy_instances and tup_tree[0] in PROPERTY_ELEMENTS:
+            return tup_tree
+        try:
+            # Equivalent to TupleParser.parse_any(), but without the lookup
+            # of the parse method by name for each element.
+            parse_method = _parse_method(tup_tree[0])
+            if parse_method is None:
+                result = TupleParser.parse_any(self, tup_tree)
+            else:
+                result = parse_method(self, tup_tree)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            result = _DecodeFailure(exc)
+        return (tup_tree[0], tup_tree[1], (), result)
+
+    @staticmethod
+    def decoded_result(tup_tree):
+        """
+        Return the result of a decoded node, or raise the exception that was
+        raised while decoding it.
+        """
+        result = tup_tree[3]
+        if isinstance(result, _DecodeFailure):
+            raise result.exc
+        return result
+
+    def parse_any(self, tup_tree):
+        """
+        Parse a fragment of XML, returning the result of a decoded node.
+
+        See TupleParser.parse_any().
+        """
+        if len(tup_tree) == 4:
+            return self.decoded_result(tup_tree)
+        return super().parse_any(tup_tree)
+
+
+def _decoded_parse_method(funcname):
+    """
+    Return a ``parse_*()`` method for TupleDecoder that returns the result of
+    a decoded node for the element that is parsed by the TupleParser method
+    `funcname`, and otherwise parses the node with the TupleParser method.
+
+    Nodes for other elements are passed to the TupleParser method so that it
+    raises the same exception as in TupleParser.
+    """
+    parse_method = getattr(TupleParser, funcname)
+
+    def decoded_parse_method(self, tup_tree):
+        # pylint: disable=missing-docstring
+        if len(tup_tree) == 4 and _parse_funcname(tup_tree[0]) == funcname:
+            return self.decoded_result(tup_tree)
+        return parse_method(self, tup_tree)
+
+    decoded_parse_method.__name__ = funcname
+    decoded_parse_method.__doc__ = parse_method.__doc__
+    return decoded_parse_method
+
+
+# The TupleParser methods for parsing elements are also called directly on
+# child elements (e.g. parse_instancename()), so they are all overridden.
+for _funcname in dir(TupleParser):
+    if _funcname.startswith('parse_') and \
+            _funcname not in ('parse_any', 'parse_embeddedObject'):
+        setattr(TupleDecoder, _funcname, _decoded_parse_method(_funcname))
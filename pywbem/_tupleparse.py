@@ -77,15 +77,16 @@ representation of CIM in XML by having the following properties:
 # This module is meant to be safe for 'import *'.
 
 import re
+import sys
 import warnings
 
 from ._utils import _stacklevel_above_module, _format
-from ._nocasedict import NocaseDict
-from ._cim_obj import CIMInstance, CIMInstanceName, CIMClass, CIMClassName, \
-    CIMProperty, CIMMethod, CIMParameter, CIMQualifier, \
-    CIMQualifierDeclaration
-from ._cim_types import CIMDateTime, type_from_name
-from ._tupletree import xml_to_tupletree_sax
+from ._nocasedict import NocaseDict, _OMITTED
+from ._cim_obj import CIMInstance, CIMInstanceLayout, CIMInstanceName, \
+    CIMClass, CIMClassName, CIMProperty, CIMMethod, CIMParameter, \
+    CIMQualifier, CIMQualifierDeclaration
+from ._cim_types import CIMDateTime, CIMNumericArray, type_from_name
+from ._tupletree import xml_to_tupletree_expat
 from ._exceptions import CIMXMLParseError, CIMVersionError, DTDVersionError, \
     ProtocolVersionError
 from ._warnings import ToleratedServerIssueWarning, MissingKeybindingsWarning
@@ -95,7 +96,16 @@ __all__ = []
 
 
 CIMXML_HEX_PATTERN = re.compile(r'^(\+|\-)?0[xX][0-9a-fA-F]+$')
-NUMERIC_CIMTYPE_PATTERN = re.compile(r'^([su]int(8|16|32|64)|real(32|64))$')
+NUMERIC_CIMTYPES = ('uint8', 'uint16', 'uint32', 'uint64', 'sint8', 'sint16',
+                    'sint32', 'sint64', 'real32', 'real64')
+
+_INF = float('inf')
+
+# Validation levels of TupleParser
+VALIDATION_LEVELS = ('strict', 'fast')
+
+# Names of the child elements of INSTANCE that represent properties
+PROPERTY_ELEMENTS = ('PROPERTY', 'PROPERTY.ARRAY', 'PROPERTY.REFERENCE')
 
 
 def name(tup_tree):
@@ -127,6 +137,20 @@ def kids(tup_tree):
     return [x for x in k if isinstance(x, tuple)]
 
 
+def _decode_string(data):
+    """
+    Unpack a single CIM-XML string value of CIM type 'string'.
+    """
+    return data
+
+
+def _decode_string_array(values):
+    """
+    Unpack a list of CIM-XML string values of CIM type 'string'.
+    """
+    return values
+
+
 def pcdata(tup_tree):
     """
     Return the concatenated character data within the child nodes of a
@@ -145,19 +169,162 @@ def pcdata(tup_tree):
     return ''.join(k)
 
 
+class _LazyPropertyDict(NocaseDict):
+    """
+    NocaseDict with the properties of a CIM instance that has been parsed in
+    the lazy_instances mode of TupleParser.
+
+    The items are initially added with the tupletree nodes of the property
+    elements as their values. A node is parsed into its CIMProperty object
+    when the item is accessed for the first time, and is then replaced by
+    the CIMProperty object. Accessing all values (e.g. via values(), items()
+    or comparison) parses all remaining nodes.
+
+    Errors in the property elements are raised as CIMXMLParseError when the
+    property is accessed.
+    """
+
+    def __init__(self, parser):
+        super().__init__()
+        self._parser = parser  # None when all nodes have been parsed
+
+    def add_node(self, pname, node):
+        """
+        Add an item for a property element that is parsed on first access.
+        """
+        # pylint: disable=protected-access
+        self._data[self._casefolded_key(pname)] = (pname, node)
+
+    def _parsed_value(self, key, value):
+        """
+        Return the value of an item, parsing and replacing the node of the
+        item if it has not been parsed yet.
+        """
+        if isinstance(value, tuple):
+            k = self._casefolded_key(key)
+            pname = self._data[k][0]
+            value = self._parser.parse_any(value)
+            self._data[k] = (pname, value)
+        return value
+
+    def _parse_all(self):
+        """
+        Parse the nodes of all items that have not been parsed yet.
+        """
+        if self._parser is None:
+            return
+        for k, (pname, value) in self._data.items():
+            if isinstance(value, tuple):
+                self._data[k] = (pname, self._parser.parse_any(value))
+        self._parser = None
+
+    def __getitem__(self, key):
+        return self._parsed_value(key, super().__getitem__(key))
+
+    def pop(self, key, default=_OMITTED):
+        value = super().pop(key, default)
+        if isinstance(value, tuple):
+            value = self._parser.parse_any(value)
+        return value
+
+    def popitem(self):
+        pname, value = super().popitem()
+        if isinstance(value, tuple):
+            value = self._parser.parse_any(value)
+        return pname, value
+
+    def values(self):
+        self._parse_all()
+        return super().values()
+
+    def items(self):
+        self._parse_all()
+        return super().items()
+
+    def copy(self):
+        # The copy is a NocaseDict with the parsed values.
+        return NocaseDict.from_items(
+            self.items(), allow_unnamed_keys=self.allow_unnamed_keys)
+
+    def __repr__(self):
+        # Represented as a NocaseDict with the parsed values.
+        return repr(self.copy())
+
+    def __reduce__(self):
+        # Pickled and deep-copied as a NocaseDict with the parsed values.
+        return (NocaseDict, (list(self.items()),))
+
+
 class TupleParser:
     """
     Parser for a CIM XML tupletree.
     """
 
-    def __init__(self, conn_id=None):
+    def __init__(self, conn_id=None, validation='strict',
+                 lazy_instances=False, compact_arrays=False,
+                 instance_layouts=None, qualifier_cache=None):
         """
         Parameters:
 
           conn_id (:term:`connection id`): Connection ID to be used in any
             exceptions that may be raised.
+
+          validation (str): Validation level for the CIM-XML elements:
+
+            - 'strict': Each element is validated against the DTD for its
+              name, attributes, child elements and text content, with the
+              tolerances for known server issues.
+
+            - 'fast': Only the element name and the presence of required
+              attributes are checked, and the number but not the names of
+              child elements. Unexpected attributes, child elements, and text
+              content are not detected. This is meant for trusted WBEM
+              servers that are known to produce valid CIM-XML.
+
+          lazy_instances (bool): Parse the property elements of INSTANCE
+            elements only when the properties are accessed in the resulting
+            CIMInstance objects. Errors in the property elements are then
+            raised when the properties are accessed.
+
+          compact_arrays (bool): Return the values of array properties,
+            parameters and qualifiers of numeric CIM types as
+            CIMNumericArray objects instead of lists.
+
+          instance_layouts (dict): If not `None`, return CIM instances that
+            use a shared CIMInstanceLayout, using the dictionary as a cache
+            for the layouts by class name and property attributes. The
+            dictionary may be shared between parsers. Instances with property
+            qualifiers or with duplicate properties are returned as normal
+            CIM instances. Ignored in the lazy_instances mode.
+
+          qualifier_cache (CIMQualifierCache): If not `None`, return the
+            qualifiers of CIM objects as the equal shared qualifiers of the
+            cache. The cache may be shared between parsers.
+
+        Raises:
+
+          ValueError: Invalid validation level.
         """
+        if validation not in VALIDATION_LEVELS:
+            raise ValueError(
+                _format("Invalid validation level {0!A} (allowed are {1!A})",
+                        validation, VALIDATION_LEVELS))
         self.conn_id = conn_id
+        self.validation = validation
+        self._fast = validation == 'fast'
+        self.lazy_instances = lazy_instances
+        self.compact_arrays = compact_arrays
+        self.instance_layouts = instance_layouts
+        self.qualifier_cache = qualifier_cache
+
+        # Cache for value_decoders(), with the decoder tuples by CIM type
+        self._value_decoders = {}
+
+        # Dispatch table for parse_any(), with the bound parse methods by
+        # element name
+        self._parse_methods = {
+            nodename: getattr(self, funcname)
+            for nodename, funcname in _PARSE_FUNCNAMES.items()}
 
     # pylint: disable=too-many-arguments
     def check_node(self, tup_tree, nodename, required_attrs=None,
@@ -185,6 +352,9 @@ class TupleParser:
 
         If allow_pcdata is True, then non-whitespace text nodes are allowed as
         children. (Whitespace text nodes are always allowed as children.)
+
+        With the 'fast' validation level, only the node name and the presence
+        of the required attributes are checked.
         """
 
         if name(tup_tree) != nodename:
@@ -193,6 +363,19 @@ class TupleParser:
                         name(tup_tree), nodename),
                 conn_id=self.conn_id)
 
+        if self._fast:
+            if required_attrs:
+                tt_attrs = attrs(tup_tree)
+                for attr in required_attrs:
+                    if attr not in tt_attrs:
+                        raise CIMXMLParseError(
+                            _format("Element {0!A} is missing required "
+                                    "attribute {1!A} (only has attributes "
+                                    "{2!A})",
+                                    name(tup_tree), attr, tt_attrs.keys()),
+                            conn_id=self.conn_id)
+            return
+
         # Check we have all the required attributes, and no unexpected ones
         tt_attrs = {}
         if attrs(tup_tree) is not None:
@@ -272,7 +455,7 @@ class TupleParser:
 
         child = k[0]
 
-        if name(child) not in acceptable:
+        if not self._fast and name(child) not in acceptable:
             raise CIMXMLParseError(
                 _format("Element {0!A} has invalid child element {1!A} "
                         "(allowed is one child element {2!A})",
@@ -310,6 +493,10 @@ class TupleParser:
         nodes.
         """
 
+        if self._fast:
+            parse_any = self.parse_any
+            return [parse_any(child) for child in kids(tup_tree)]
+
         result = []
 
         for child in kids(tup_tree):
@@ -353,6 +540,10 @@ class TupleParser:
         if not k:            # empty list, consistent with list_of_various
             return []
 
+        if self._fast:
+            parse_any = self.parse_any
+            return [parse_any(child) for child in k]
+
         a_child = name(k[0])
         if a_child not in acceptable:
             raise CIMXMLParseError(
@@ -591,6 +782,37 @@ class TupleParser:
 
         return instance
 
+    def unpack_value_namedinstance(self, tup_tree):
+        """
+        Unpack a VALUE.NAMEDINSTANCE element into the instance path, the
+        class name and the properties of the instance it represents, without
+        creating CIMInstance and CIMProperty objects.
+
+        See unpack_instance() for details.
+
+        Returns:
+            tuple of (path, classname, properties), with path being a
+            :class:`~pywbem.CIMInstanceName` object (without host or
+            namespace), and classname and properties as returned by
+            unpack_instance().
+        """
+
+        self.check_node(tup_tree, 'VALUE.NAMEDINSTANCE')
+
+        k = kids(tup_tree)
+        if len(k) != 2:
+            raise CIMXMLParseError(
+                _format("Element {0!A} has invalid number of child elements "
+                        "{1!A} (expecting two child elements "
+                        "(INSTANCENAME, INSTANCE))",
+                        name(tup_tree), k),
+                conn_id=self.conn_id)
+
+        inst_path = self.parse_instancename(k[0])
+        classname, props = self.unpack_instance(k[1])
+
+        return inst_path, classname, props
+
     def parse_value_instancewithpath(self, tup_tree):
         """
         The VALUE.INSTANCEWITHPATH is used to define a value that comprises
@@ -805,7 +1027,9 @@ class TupleParser:
         # faster.
         ns_list = self.list_of_various(tup_tree, ('NAMESPACE',))
 
-        return '/'.join(ns_list)
+        # The namespace is the same for many instance paths, so it is
+        # interned like the CIM names in the tupletree (see _tupletree).
+        return sys.intern('/'.join(ns_list))
 
     def parse_host(self, tup_tree):
         """
@@ -1048,6 +1272,17 @@ class TupleParser:
             # faster.
             for key_bind in self.list_of_various(tup_tree, ('KEYBINDING',)):
                 kbs.update(key_bind)
+            if not any(value is None or isinstance(value, CIMClassName)
+                       for value in kbs.values()):
+                # The keybinding values are already CIM data type objects, so
+                # the checks and conversions of the keybindings setter of
+                # CIMInstanceName() are bypassed. Values it rejects (None and
+                # class paths) are left to it for raising the error.
+                inst_name = CIMInstanceName(classname)
+                # pylint: disable=protected-access
+                inst_name._keybindings = NocaseDict.from_items(
+                    kbs.items(), allow_unnamed_keys=True)
+                return inst_name
             try:
                 return CIMInstanceName(classname, kbs)
             except (TypeError, ValueError) as exc:
@@ -1232,20 +1467,98 @@ class TupleParser:
 
         qualifiers = self.list_of_matching(tup_tree, ('QUALIFIER',))
 
+        if self.lazy_instances:
+            # CIMInstance() can raise TypeError and ValueError due to invalid
+            # init arguments, but this cannot possibly be triggered here.
+            inst = CIMInstance(classname, qualifiers=qualifiers)
+            props = _LazyPropertyDict(self)
+            for child in kids(tup_tree):
+                if name(child) in PROPERTY_ELEMENTS:
+                    pname = attrs(child).get('NAME', None)
+                    if pname is None:
+                        # Raises CIMXMLParseError for the missing attribute
+                        self.parse_any(child)
+                    props.add_node(pname, child)
+            inst._properties = props  # pylint: disable=protected-access
+            return inst
+
         # This may raise CIMXMLParseError e.g. when a reference property is set
         # to an invalid reference value (e.g. to a class).
         props = self.list_of_matching(tup_tree,
                                       ('PROPERTY.REFERENCE', 'PROPERTY',
                                        'PROPERTY.ARRAY'))
 
+        if self.instance_layouts is not None:
+            layout = self.instance_layout(classname, props)
+            if layout is not None:
+                # pylint: disable=protected-access
+                return layout._new_instance(
+                    classname, [prop.value for prop in props], qualifiers)
+
         # CIMInstance() can raise TypeError and ValueError due to invalid
         # init arguments, but this cannot possibly be triggered here.
         inst = CIMInstance(classname, qualifiers=qualifiers)
-        for prop in props:
-            inst[prop.name] = prop
+        # The property names of the CIMProperty objects are the dictionary
+        # keys, so the checks of CIMInstance.__setitem__() are not needed.
+        # pylint: disable=protected-access
+        inst._properties = NocaseDict.from_items(
+            (prop.name, prop) for prop in props)
 
         return inst
 
+    def instance_layout(self, classname, props):
+        """
+        Return the shared CIMInstanceLayout for an instance with the
+        CIMProperty objects `props` from the instance_layouts cache, creating
+        it if needed, or `None` if the instance cannot use a layout.
+        """
+        key = [classname]
+        for prop in props:
+            if prop.qualifiers:
+                return None
+            key.append((prop.name, prop.type, prop.is_array, prop.array_size,
+                        prop.class_origin, prop.propagated,
+                        prop.reference_class, prop.embedded_object))
+        key = tuple(key)
+        try:
+            return self.instance_layouts[key]
+        except KeyError:
+            pass
+        try:
+            layout = CIMInstanceLayout(classname, props)
+        except ValueError:
+            # A property occurs more than once in the instance
+            return None
+        self.instance_layouts[key] = layout
+        return layout
+
+    def unpack_instance(self, tup_tree):
+        """
+        Unpack an INSTANCE element into its class name and its properties,
+        without creating CIMInstance and CIMProperty objects.
+
+        The element is checked in the same way as by parse_instance(). The
+        QUALIFIER child elements of the instance and of its properties are
+        ignored.
+
+        Returns:
+            tuple of (classname, properties), with classname being the class
+            name of the instance, and properties being a list of tuples
+            (name, type, is_array, value) as returned by unpack_property()
+            for each property, in the order of the CIM-XML elements.
+        """
+
+        self.check_node(tup_tree, 'INSTANCE', ('CLASSNAME',), ('xml:lang',),
+                        ('QUALIFIER', 'PROPERTY', 'PROPERTY.ARRAY',
+                         'PROPERTY.REFERENCE'))
+
+        classname = attrs(tup_tree)['CLASSNAME']
+
+        props = [self.unpack_property(child) for child in kids(tup_tree)
+                 if name(child) in PROPERTY_ELEMENTS]
+
+        return classname, props
+
     def parse_scope(self, tup_tree):
         """
         Parse a SCOPE element and return a dictionary with an item for each
@@ -1416,6 +1729,9 @@ class TupleParser:
             new_exc.__cause__ = None
             raise new_exc
 
+        if self.qualifier_cache is not None:
+            qual = self.qualifier_cache.share(qual)
+
         return qual
 
     def parse_property(self, tup_tree):
@@ -1588,6 +1904,79 @@ class TupleParser:
             class_origin=class_origin, propagated=propagated,
             embedded_object=False, qualifiers=qualifiers)
 
+    def unpack_property(self, tup_tree):
+        """
+        Unpack a PROPERTY, PROPERTY.ARRAY or PROPERTY.REFERENCE element into
+        the name, CIM type and value of the property, without creating a
+        CIMProperty object.
+
+        The element is checked in the same way as by parse_property(),
+        parse_property_array() and parse_property_reference(), and the value
+        is converted in the same way, including embedded objects. The
+        QUALIFIER child elements are ignored.
+
+        Returns:
+            tuple of (name, type, is_array, value), with value being the
+            property value as in :attr:`pywbem.CIMProperty.value`.
+        """
+
+        nodename = name(tup_tree)
+
+        if nodename == 'PROPERTY.REFERENCE':
+            self.check_node(tup_tree, 'PROPERTY.REFERENCE', ('NAME',),
+                            ('REFERENCECLASS', 'CLASSORIGIN', 'PROPAGATED'),
+                            ('QUALIFIER', 'VALUE.REFERENCE'))
+            pname = attrs(tup_tree)['NAME']
+            value = self.list_of_matching(tup_tree, ('VALUE.REFERENCE',))
+            if not value:
+                value = None
+            elif len(value) == 1:
+                value = value[0]
+            else:
+                raise CIMXMLParseError(
+                    _format("Element {0!A} has more than one child element "
+                            "'VALUE.REFERENCE' (allowed are zero or one)",
+                            name(tup_tree)),
+                    conn_id=self.conn_id)
+            if value is not None and not isinstance(value, CIMInstanceName):
+                raise CIMXMLParseError(
+                    _format("Element {0!A} for property {1!A} has an invalid "
+                            "reference value of type {2} (must be an "
+                            "instance path)",
+                            name(tup_tree), pname, type(value)),
+                    conn_id=self.conn_id)
+            return pname, 'reference', False, value
+
+        is_array = nodename == 'PROPERTY.ARRAY'
+        if is_array:
+            self.check_node(tup_tree, 'PROPERTY.ARRAY', ('NAME', 'TYPE'),
+                            ('CLASSORIGIN', 'PROPAGATED', 'ARRAYSIZE',
+                             'EmbeddedObject', 'EMBEDDEDOBJECT', 'xml:lang'),
+                            ('QUALIFIER', 'VALUE.ARRAY'))
+        else:
+            self.check_node(tup_tree, 'PROPERTY', ('TYPE', 'NAME'),
+                            ('CLASSORIGIN', 'PROPAGATED', 'EmbeddedObject',
+                             'EMBEDDEDOBJECT', 'xml:lang'),
+                            ('QUALIFIER', 'VALUE'))
+
+        attrl = attrs(tup_tree)
+        pname = attrl['NAME']
+        ptype = attrl['TYPE']
+
+        # Raises CIMXMLParseError for an invalid CIM type, also if the value
+        # is NULL.
+        self.value_decoders(ptype)
+
+        # May raise CIMXMLParseError for invalid values
+        value = self.unpack_value(tup_tree)
+
+        embedded_object = attrl.get('EmbeddedObject',
+                                    attrl.get('EMBEDDEDOBJECT', None))
+        if embedded_object:
+            value = self.parse_embeddedObject(value)
+
+        return pname, ptype, is_array, value
+
     def parse_method(self, tup_tree):
         """
           ::
@@ -1924,17 +2313,29 @@ class TupleParser:
         _name = attrs(tup_tree)['NAME']
         return _name, child
 
-    def parse_multirsp(self, tup_tree):  # not implemented
+    def parse_multirsp(self, tup_tree):
         """
-        Parsing support for the MULTIRSP element is not implemented
-        in pywbem, because multi requests are generally not implemented by
-        WBEM servers.
+        Parse for MULTIRSP Element.
+
+        This response element occurs when pywbem sends multiple operation
+        requests (see :meth:`~pywbem.WBEMConnection.batch`).
 
-        This is no limitation of pywbem, because the pywbem client does not
-        send multi requests, so a WBEM server will never respond with a multi
-        response, even if it implements support for it.
+          ::
+
+            <!ELEMENT MULTIRSP (SIMPLERSP, SIMPLERSP+)>
         """
-        self.notimplemented(tup_tree)
+
+        self.check_node(tup_tree, 'MULTIRSP', (), (), ('SIMPLERSP',))
+
+        children = self.list_of_various(tup_tree, ('SIMPLERSP',))
+        if len(children) < 2:
+            raise CIMXMLParseError(
+                _format("Element {0!A} has {1} child elements (must have at "
+                        "least two SIMPLERSP child elements)",
+                        name(tup_tree), len(children)),
+                conn_id=self.conn_id)
+
+        return name(tup_tree), attrs(tup_tree), children
 
     def parse_multiexprsp(self, tup_tree):  # not implemented
         """
@@ -2282,6 +2683,13 @@ class TupleParser:
         Return is determined by function called.
         """
 
+        try:
+            func = self._parse_methods[name(tup_tree)]
+        except KeyError:
+            pass
+        else:
+            return func(tup_tree)  # a bound method, i.e. self is implicit
+
         nodename = name(tup_tree).lower().replace('.', '_')
         funcname = 'parse_' + nodename
         try:
@@ -2349,7 +2757,7 @@ class TupleParser:
             return None
 
         # Perform the un-embedding (may raise XMLParseError)
-        tup_tree = xml_to_tupletree_sax(val, "embedded object", self.conn_id)
+        tup_tree = xml_to_tupletree_expat(val, "embedded object", self.conn_id)
 
         if name(tup_tree) == 'INSTANCE':
             return self.parse_instance(tup_tree)
@@ -2373,7 +2781,8 @@ class TupleParser:
 
         valtype = attrs(tup_tree)['TYPE']
 
-        raw_val = self.list_of_matching(tup_tree, ('VALUE', 'VALUE.ARRAY'))
+        raw_val = [child for child in kids(tup_tree)
+                   if name(child) in ('VALUE', 'VALUE.ARRAY')]
 
         if not raw_val:
             return None
@@ -2385,13 +2794,14 @@ class TupleParser:
                         name(tup_tree), [name(t) for t in kids(tup_tree)]),
                 conn_id=self.conn_id)
 
-        raw_val = raw_val[0]
+        raw_val = self.parse_any(raw_val[0])
+
+        decode, decode_array = self.value_decoders(valtype)
 
         if isinstance(raw_val, list):
-            return [self.unpack_single_value(data, valtype)
-                    for data in raw_val]
+            return decode_array(raw_val)
 
-        return self.unpack_single_value(raw_val, valtype)
+        return decode(raw_val)
 
     def unpack_single_value(self, data, cimtype):
         """
@@ -2407,25 +2817,204 @@ class TupleParser:
           cimtype (str): CIM data type name (e.g. 'datetime') except
             'reference', or None (in which case a numeric value is assumed).
         """
+        return self.value_decoders(cimtype)[0](data)
+
+    def value_decoders(self, cimtype):
+        """
+        Return the functions for unpacking CIM-XML string values of a CIM type,
+        as a tuple (decode, decode_array).
+
+        decode(data) unpacks a single value like unpack_single_value() does,
+        and decode_array(values) unpacks a list of such values and returns
+        them as a list.
+
+        The functions are specialized for the CIM type, so that the CIM type
+        is dispatched on only once for all values of a property or
+        parameter. They are created on first use and are cached in the
+        parser.
+
+        Parameters:
+
+          cimtype (str): CIM data type name (e.g. 'datetime') except
+            'reference', or None (in which case a numeric value is assumed).
+
+        Raises:
+
+          CIMXMLParseError: Invalid CIM type.
+        """
+        try:
+            return self._value_decoders[cimtype]
+        except KeyError:
+            pass
+
         if cimtype == 'string':
-            return data
+            decoders = (_decode_string, _decode_string_array)
+        elif cimtype == 'boolean':
+            decoders = self._simple_decoders(self.unpack_boolean)
+        elif cimtype is None or cimtype in NUMERIC_CIMTYPES:
+            decoders = self._numeric_decoders(cimtype)
+        elif cimtype == 'datetime':
+            decoders = self._simple_decoders(self.unpack_datetime)
+        elif cimtype == 'char16':
+            decoders = self._simple_decoders(self.unpack_char16)
+        else:
+            # Note that 'reference' is not allowed for this function.
+            raise CIMXMLParseError(
+                _format("Invalid CIM type found: {0!A}", cimtype),
+                conn_id=self.conn_id)
 
-        if cimtype == 'boolean':
-            return self.unpack_boolean(data)
+        self._value_decoders[cimtype] = decoders
+        return decoders
 
-        if cimtype is None or NUMERIC_CIMTYPE_PATTERN.match(cimtype):
-            return self.unpack_numeric(data, cimtype)
+    @staticmethod
+    def _simple_decoders(decode):
+        """
+        Return the decoder tuple for a single value decoder function that has
+        no batch path for arrays.
+        """
 
-        if cimtype == 'datetime':
-            return self.unpack_datetime(data)
+        def decode_array(values):
+            "Unpack a list of values one by one"
+            return [decode(data) for data in values]
 
-        if cimtype == 'char16':
-            return self.unpack_char16(data)
+        return decode, decode_array
 
-        # Note that 'reference' is not allowed for this function.
-        raise CIMXMLParseError(
-            _format("Invalid CIM type found: {0!A}", cimtype),
-            conn_id=self.conn_id)
+    def _numeric_decoders(self, cimtype):
+        """
+        Return the decoder tuple for a numeric CIM type, or for None (in which
+        case the values are returned as a Python int or float).
+        """
+
+        conn_id = self.conn_id
+        CIMType = None if cimtype is None else type_from_name(cimtype)
+
+        def decode(data):
+            "Unpack a single numeric value"
+
+            assert data is not None
+
+            # DSP0201 defines numeric values to be whitespace-tolerant
+            data = data.strip()
+
+            # Decode the CIM-XML string representation into a Python number
+            #
+            # Some notes:
+            # * For integer numbers, only decimal and hexadecimal strings are
+            #   allowed - no binary or octal.
+            # * For real values, DSP0201 defines a subset of the syntax
+            #   supported by Python float(), including the special states Inf,
+            #   -Inf, NaN. The only known difference is that DSP0201 requires
+            #   a digit after the decimal dot, while Python does not.
+            if CIMXML_HEX_PATTERN.match(data):
+                value = int(data, 16)
+            else:
+                try:
+                    value = int(data)
+                except ValueError:
+                    try:
+                        value = float(data)
+                    except ValueError:
+                        new_exc = CIMXMLParseError(
+                            _format("Invalid numeric value {0!A}", data),
+                            conn_id=conn_id)
+                        new_exc.__cause__ = None
+                        raise new_exc
+
+            # Convert the Python number into a CIM data type
+            if CIMType is None:
+                return value  # int or float (used for keybindings)
+
+            try:
+                value = CIMType(value)
+            except ValueError as exc:
+                new_exc = CIMXMLParseError(
+                    _format("Cannot convert value {0!A} to numeric CIM type "
+                            "{1}: {2}",
+                            value, cimtype, exc),
+                    conn_id=conn_id)
+                new_exc.__cause__ = None
+                raise new_exc
+            return value
+
+        if CIMType is None:
+            return self._simple_decoders(decode)
+
+        if issubclass(CIMType, int):
+
+            def decode_array(values):
+                "Unpack a list of integer values, with a batch path"
+
+                # Batch path for the common case of decimal values that are
+                # in the value range of the CIM type. int() ignores
+                # surrounding whitespace like decode() does, and rejects
+                # hexadecimal values. Any other case is handled by decoding
+                # the values one by one, which also raises the appropriate
+                # errors.
+                try:
+                    return [CIMType(int(data)) for data in values]
+                except (ValueError, TypeError):
+                    return [decode(data) for data in values]
+
+        else:
+
+            def decode_array(values):
+                "Unpack a list of real values, with a batch path"
+
+                # Batch path for the common case of finite values. The real
+                # CIM types accept strings like float() does, which ignores
+                # surrounding whitespace like decode() does, and rejects
+                # hexadecimal values. Infinite results are decoded again one
+                # by one, because decode() raises OverflowError for integer
+                # strings that are too large for a float.
+                try:
+                    result = [CIMType(data) for data in values]
+                except (ValueError, TypeError):
+                    return [decode(data) for data in values]
+                if _INF in result or -_INF in result:
+                    return [decode(data) for data in values]
+                return result
+
+        if self.compact_arrays:
+            return decode, self._compact_array_decoder(cimtype, decode_array)
+
+        return decode, decode_array
+
+    @staticmethod
+    def _compact_array_decoder(cimtype, decode_array):
+        """
+        Return the array decoder for a numeric CIM type in the compact_arrays
+        mode, that returns CIMNumericArray objects.
+
+        decode_array is the array decoder that returns lists.
+        """
+
+        number = int if issubclass(type_from_name(cimtype), int) else float
+
+        def decode_compact_array(values):
+            "Unpack a list of numeric values into a CIMNumericArray"
+
+            # Batch path like in decode_array(), but without creating objects
+            # of the CIM type. The buffer of CIMNumericArray enforces the
+            # value range of the CIM type.
+            try:
+                numbers = [number(data) for data in values]
+                if number is int or \
+                        not (_INF in numbers or -_INF in numbers):
+                    return CIMNumericArray(cimtype, numbers)
+            except (ValueError, TypeError):
+                pass
+
+            # Decode the values into a list, which raises the appropriate
+            # errors.
+            result = decode_array(values)
+            try:
+                return CIMNumericArray(cimtype, result)
+            except ValueError:
+                # Values that are out of range for the CIM type, if
+                # ENFORCE_INTEGER_RANGE is not set
+                return result
+
+        return decode_compact_array
 
     def unpack_boolean(self, data):
         """
@@ -2473,53 +3062,7 @@ class TupleParser:
           cimtype (str): CIM data type name (e.g. 'uint8'), or None (in which
             case the value is returned as a Python int or float).
         """
-
-        assert data is not None
-
-        # DSP0201 defines numeric values to be whitespace-tolerant
-        data = data.strip()
-
-        # Decode the CIM-XML string representation into a Python number
-        #
-        # Some notes:
-        # * For integer numbers, only decimal and hexadecimal strings are
-        #   allowed - no binary or octal.
-        # * For real values, DSP0201 defines a subset of the syntax supported
-        #   by Python float(), including the special states Inf, -Inf, NaN. The
-        #   only known difference is that DSP0201 requires a digit after the
-        #   decimal dot, while Python does not.
-        if CIMXML_HEX_PATTERN.match(data):
-            value = int(data, 16)
-        else:
-            try:
-                value = int(data)
-            except ValueError:
-                try:
-                    value = float(data)
-                except ValueError:
-                    new_exc = CIMXMLParseError(
-                        _format("Invalid numeric value {0!A}", data),
-                        conn_id=self.conn_id)
-                    new_exc.__cause__ = None
-                    raise new_exc
-
-        # Convert the Python number into a CIM data type
-        if cimtype is None:
-            return value  # int or float (used for keybindings)
-
-        # The caller ensured a numeric type for cimtype
-        CIMType = type_from_name(cimtype)
-        try:
-            value = CIMType(value)
-        except ValueError as exc:
-            new_exc = CIMXMLParseError(
-                _format("Cannot convert value {0!A} to numeric CIM type {1}: "
-                        "{2}",
-                        value, cimtype, exc),
-                conn_id=self.conn_id)
-            new_exc.__cause__ = None
-            raise new_exc
-        return value
+        return self.value_decoders(cimtype)[0](data)
 
     def unpack_datetime(self, data):
         """
@@ -2579,3 +3122,14 @@ class TupleParser:
                 conn_id=self.conn_id)
 
         return data
+
+
+# Names of the parse methods of TupleParser, by the names of the CIM-XML
+# elements they parse. This is the table-driven equivalent of how parse_any()
+# determines the method from the element name.
+_PARSE_FUNCNAMES = {
+    _funcname[len('parse_'):].upper().replace('_', '.'): _funcname
+    for _funcname in dir(TupleParser)
+    if _funcname.startswith('parse_') and
+    _funcname not in ('parse_any', 'parse_embeddedObject')
+}
@@ -46,7 +46,8 @@ order.
 
 The CONTENTS is a list of child elements, preserving order.
 
-The fourth element is reserved.
+The fourth element is reserved. Tupletrees that are built with a decoder
+(see TupleDecoder) have nodes with the decoded element in the fourth element.
 """
 
 # NOTE: The original dom based parsers have been replaced with a sax parser
@@ -55,6 +56,7 @@ The fourth element is reserved.
 
 
 import xml.sax
+import xml.parsers.expat
 import re
 import sys
 
@@ -100,7 +102,7 @@ class CIMContentHandler(xml.sax.ContentHandler):
             self.elements.append(self.element)
         attr_dict = {}  # No order preservation possible, see note above
         for k, v in attrs.items():
-            attr_dict[k] = v
+            attr_dict[k] = sys.intern(v) if k in _NAME_ATTRS else v
         element = (name, attr_dict, [])
         if self.element:
             self.element[2].append(element)
@@ -120,6 +122,299 @@ class CIMContentHandler(xml.sax.ContentHandler):
             children.append(content)
 
 
+# Element and attribute names defined in DSP0201. The pyexpat parsers are
+# created with these names as pre-interned strings, so that the names in the
+# resulting tupletrees are the same string objects for all parsed documents,
+# which speeds up their comparison with the string literals in TupleParser.
+_INTERNED_NAMES = {
+    _name: sys.intern(_name) for _name in (
+        # Elements
+        'CIM', 'CLASS', 'CLASSNAME', 'CLASSPATH', 'DECLARATION', 'DECLGROUP',
+        'DECLGROUP.WITHNAME', 'DECLGROUP.WITHPATH', 'ERROR', 'EXPMETHODCALL',
+        'EXPMETHODRESPONSE', 'EXPPARAMVALUE', 'HOST', 'IMETHODCALL',
+        'IMETHODRESPONSE', 'INSTANCE', 'INSTANCENAME', 'INSTANCEPATH',
+        'IPARAMVALUE', 'IRETURNVALUE', 'KEYBINDING', 'KEYVALUE',
+        'LOCALCLASSPATH', 'LOCALINSTANCEPATH', 'LOCALNAMESPACEPATH',
+        'MESSAGE', 'METHOD', 'METHODCALL', 'METHODRESPONSE', 'MULTIEXPREQ',
+        'MULTIEXPRSP', 'MULTIREQ', 'MULTIRSP', 'NAMESPACE', 'NAMESPACEPATH',
+        'OBJECTPATH', 'PARAMETER', 'PARAMETER.ARRAY', 'PARAMETER.REFARRAY',
+        'PARAMETER.REFERENCE', 'PARAMVALUE', 'PROPERTY', 'PROPERTY.ARRAY',
+        'PROPERTY.REFERENCE', 'QUALIFIER', 'QUALIFIER.DECLARATION',
+        'RETURNVALUE', 'SCOPE', 'SIMPLEEXPREQ', 'SIMPLEEXPRSP', 'SIMPLEREQ',
+        'SIMPLERSP', 'VALUE', 'VALUE.ARRAY', 'VALUE.INSTANCEWITHPATH',
+        'VALUE.NAMEDINSTANCE', 'VALUE.NAMEDOBJECT', 'VALUE.NULL',
+        'VALUE.OBJECT', 'VALUE.OBJECTWITHLOCALPATH', 'VALUE.OBJECTWITHPATH',
+        'VALUE.REFARRAY', 'VALUE.REFERENCE',
+        # Attributes
+        'ARRAYSIZE', 'ASSOCIATION', 'CIMVERSION', 'CLASSORIGIN', 'CODE',
+        'DESCRIPTION', 'DTDVERSION', 'EMBEDDEDOBJECT', 'EmbeddedObject', 'ID',
+        'INDICATION', 'ISARRAY', 'NAME', 'OVERRIDABLE', 'PARAMTYPE',
+        'PROPAGATED', 'PROTOCOLVERSION', 'REFERENCE', 'REFERENCECLASS',
+        'SUPERCLASS', 'TOINSTANCE', 'TOSUBCLASS', 'TRANSLATABLE', 'TYPE',
+        'VALUETYPE', 'xml:lang')
+}
+
+# Attributes defined in DSP0201 whose values are CIM names (e.g. class and
+# property names) or CIM type names. The same values occur many times in a
+# CIM-XML document and in subsequent documents, so they are interned, so that
+# the CIM objects created from them share the string objects, and NocaseDict
+# shares their casefolded forms (see _nocasedict).
+_NAME_ATTRS = frozenset((
+    'CLASSNAME', 'CLASSORIGIN', 'EMBEDDEDOBJECT', 'EmbeddedObject', 'NAME',
+    'PARAMTYPE', 'REFERENCECLASS', 'SUPERCLASS', 'TYPE'))
+
+# Names of the child elements of INSTANCE that represent properties.
+_PROPERTY_NAMES = frozenset(('PROPERTY', 'PROPERTY.ARRAY',
+                             'PROPERTY.REFERENCE'))
+
+
+class TupleTreeBuilder:
+    """
+    Builder for a tupletree from an XML string, that drives the pyexpat
+    parser directly.
+
+    Compared to using xml.sax with CIMContentHandler, this avoids the SAX
+    layer, uses the attribute dictionaries created by pyexpat without copying
+    them, and has pyexpat buffer character data so that text nodes are
+    normally passed in one piece. The element and attribute names are
+    interned.
+
+    The XML string is passed to the builder with :meth:`feed`, either in
+    one piece or in chunks. After the final chunk, the tupletree is available
+    in the `root` attribute.
+
+    If `parent_path` is specified, the child elements of the element at that
+    path are detached from the tupletree as soon as they are complete, and
+    are appended to the `items` attribute, from where they are picked up by
+    the user of the builder. Character data between the detached child
+    elements is dropped. `parent_path` is the list of element names on the
+    path from the root element to the parent element.
+
+    The values of attributes that are CIM names or CIM type names (see
+    `_NAME_ATTRS`) are interned.
+
+    If `decoder` is specified, each element is replaced in the tupletree by
+    the result of ``decoder.decode_node(element)`` as soon as it is
+    complete. This allows a decoder to convert each element to its final
+    form while the XML string is being parsed (see TupleDecoder).
+
+    If `property_filter` is specified, the property elements (PROPERTY,
+    PROPERTY.ARRAY and PROPERTY.REFERENCE) of INSTANCE elements whose NAME
+    attribute is not in `property_filter` are skipped, including their child
+    elements, so that no tupletree nodes are created for them.
+    `property_filter` is a set of lower-cased property names. Property
+    elements without a NAME attribute are not skipped, so that they are
+    reported as invalid when the tupletree is parsed.
+
+    *New in pywbem 1.10.*
+    """
+
+    def __init__(self, parent_path=None, decoder=None, property_filter=None):
+        self.root = None
+        self.items = []
+        self._elements = []  # Stack of currently open elements
+        self._parent_path = None if parent_path is None else list(parent_path)
+        self._decoder = decoder
+        self._property_filter = property_filter
+        self._skip_depth = 0  # Depth within a skipped property element
+
+        parser = xml.parsers.expat.ParserCreate(intern=dict(_INTERNED_NAMES))
+        parser.buffer_text = True
+        parser.buffer_size = 65536
+        if property_filter is None:
+            parser.StartElementHandler = self._start_element
+        else:
+            parser.StartElementHandler = self._start_element_filter
+        if decoder is not None:
+            parser.EndElementHandler = self._end_element_decode
+        elif parent_path is None:
+            parser.EndElementHandler = self._end_element
+        else:
+            parser.EndElementHandler = self._end_element_detach
+        parser.CharacterDataHandler = self._characters
+        self._parser = parser
+        self._handlers = (parser.StartElementHandler,
+                          parser.EndElementHandler,
+                          parser.CharacterDataHandler)
+
+    def feed(self, data, final=False):
+        """
+        Parse a chunk of the XML string.
+
+        Parameters:
+
+          data (:term:`byte string`): The chunk of the UTF-8 encoded XML
+            string.
+
+          final (bool): Indicates that this is the final chunk.
+
+        Raises:
+
+          xml.parsers.expat.ExpatError: XML parsing error.
+        """
+        try:
+            self._parser.Parse(data, final)
+        finally:
+            if final:
+                # The parser and its buffer would otherwise be retained until
+                # the reference cycle through the handlers is collected.
+                self._parser = None
+
+    @staticmethod
+    def error_message(exc):
+        """
+        Return the message for an ExpatError raised by :meth:`feed`, in the
+        same format as the message of a SAXParseException.
+        """
+        return _format("<unknown>:{0}:{1}: {2}",
+                       exc.lineno, exc.offset,
+                       xml.parsers.expat.ErrorString(exc.code))
+
+    def _start_element(self, name, attrs):
+        # attrs is a new dict created by pyexpat for each element.
+        if attrs:
+            for attr in attrs:
+                if attr in _NAME_ATTRS:
+                    attrs[attr] = sys.intern(attrs[attr])
+        element = (name, attrs, [])
+        if self._elements:
+            self._elements[-1][2].append(element)
+        else:
+            self.root = element
+        self._elements.append(element)
+
+    def _start_element_filter(self, name, attrs):
+        if name in _PROPERTY_NAMES and self._elements and \
+                self._elements[-1][0] == 'INSTANCE':
+            prop_name = attrs.get('NAME', None)
+            if prop_name is not None and \
+                    prop_name.lower() not in self._property_filter:
+                # Skip the property element by switching to handlers that
+                # only track the element depth until it ends.
+                parser = self._parser
+                parser.StartElementHandler = self._start_element_skip
+                parser.EndElementHandler = self._end_element_skip
+                parser.CharacterDataHandler = None
+                return
+        self._start_element(name, attrs)
+
+    def _start_element_skip(self, name, attrs):
+        # pylint: disable=unused-argument
+        self._skip_depth += 1
+
+    def _end_element_skip(self, name):
+        # pylint: disable=unused-argument
+        if self._skip_depth:
+            self._skip_depth -= 1
+            return
+        # The skipped property element has ended.
+        parser = self._parser
+        parser.StartElementHandler, parser.EndElementHandler, \
+            parser.CharacterDataHandler = self._handlers
+
+    def _end_element(self, name):
+        # pylint: disable=unused-argument
+        self._elements.pop()
+
+    def _end_element_detach(self, name):
+        # pylint: disable=unused-argument
+        elements = self._elements
+        elements.pop()
+        if len(elements) == len(self._parent_path) and \
+                [e[0] for e in elements] == self._parent_path:
+            children = elements[-1][2]
+            self.items.append(children.pop())
+            while children and isinstance(children[-1], str):
+                children.pop()
+
+    def _end_element_decode(self, name):
+        # pylint: disable=unused-argument
+        elements = self._elements
+        node = self._decoder.decode_node(elements.pop())
+        if not elements:
+            self.root = node
+            return
+        # The ended element is the last child of its parent, because the
+        # character data following it has not been passed yet.
+        children = elements[-1][2]
+        if self._parent_path is not None and \
+                len(elements) == len(self._parent_path) and \
+                [e[0] for e in elements] == self._parent_path:
+            children.pop()
+            self.items.append(node)
+            while children and isinstance(children[-1], str):
+                children.pop()
+        else:
+            children[-1] = node
+
+    def _characters(self, content):
+        children = self._elements[-1][2]  # mutable list
+        # With text buffering, content is passed in one piece unless the text
+        # exceeds the buffer size or spans multiple chunks.
+        if children and isinstance(children[-1], str):
+            children[-1] += content
+        else:
+            children.append(content)
+
+
+def xml_to_tupletree_expat(xml_string, meaning, conn_id=None,
+                           decoder=None, property_filter=None):
+    """
+    Parse an XML string into tupletree, using pyexpat directly.
+
+    This function produces the same tupletree as `xml_to_tupletree_sax()`
+    and raises the same exceptions, but is faster.
+
+    *New in pywbem 1.10.*
+
+    Parameters:
+
+      xml_string (str): A unicode string (when called for embedded
+        objects) or UTF-8 encoded byte string (when called for CIM-XML
+        replies) containing the XML to be parsed. Instead of a byte string,
+        a :class:`py:memoryview` object on the UTF-8 encoded XML string is
+        accepted. It is passed to pyexpat without copying it.
+
+      meaning (str):
+        Short text with meaning of the XML string, for messages in exceptions.
+
+      conn_id (:term:`connection id`): Connection ID to be used in any
+        exceptions that may be raised.
+
+      decoder (TupleDecoder): Decoder that replaces each element of the
+        tupletree with its decoded form as soon as it is complete, or `None`
+        for producing a plain tupletree.
+
+      property_filter (set of str): Lower-cased names of the properties of
+        INSTANCE elements to be included in the tupletree, or `None` for
+        including all properties. See TupleTreeBuilder for details.
+
+    Returns:
+
+      tupletree: tuple with parsed XML tree
+
+    Raises:
+
+      pywbem.XMLParseError: Error detected by pyexpat or UTF-8/XML checkers
+    """
+
+    # The XML string is passed to pyexpat as a UTF-8 encoded byte string, so
+    # that the encoding declared in the XML string applies.
+    xml_string = _ensure_bytes(xml_string)
+
+    builder = TupleTreeBuilder(decoder=decoder,
+                               property_filter=property_filter)
+    try:
+        builder.feed(xml_string, True)
+    except xml.parsers.expat.ExpatError as exc:
+        org_tb = sys.exc_info()[2]
+        pe = _xml_parse_error(
+            bytes(xml_string), builder.error_message(exc), meaning, conn_id)
+        raise pe.with_traceback(org_tb)  # ignore this call in traceback!
+
+    return builder.root
+
+
 def xml_to_tupletree_sax(xml_string, meaning, conn_id=None):
     """
     Parse an XML string into tupletree with SAX parser.
@@ -129,7 +424,8 @@ def xml_to_tupletree_sax(xml_string, meaning, conn_id=None):
     memory.
 
     This is a replacement for the previous parser (xml_to_tuple)
-    which used the dom parser.
+    which used the dom parser. It has been superseded by
+    `xml_to_tupletree_expat()` for parsing in pywbem.
 
     Parameters:
 
@@ -173,35 +469,200 @@ def xml_to_tupletree_sax(xml_string, meaning, conn_id=None):
         # Traceback of the exception that was caught
         org_tb = sys.exc_info()[2]
 
-        # Improve quality of exception info (the check...() functions may
-        # raise XMLParseError):
-        _chk_str = check_invalid_utf8_sequences(xml_string, meaning, conn_id)
-        check_invalid_xml_chars(_chk_str, meaning, conn_id)
-
-        # If the checks above pass, re-raise the SAX exception info, with its
-        # original traceback info:
-        lineno, colno, new_colno, line = get_failing_line(xml_string, str(exc))
-        if lineno is not None:
-            marker_line = ' ' * (new_colno - 1) + '^'
-            xml_msg = _format(
-                "Line {0} column {1} of XML string (as binary UTF-8 string):\n"
-                "{2}\n"
-                "{3}",
-                lineno, colno, line, marker_line)
-        else:
-            xml_msg = _format(
-                "XML string (as binary UTF-8 string):\n"
-                "{0}",
-                line)
+        pe = _xml_parse_error(xml_string, str(exc), meaning, conn_id)
+        raise pe.with_traceback(org_tb)  # ignore this call in traceback!
+
+    return handler.root
+
+
+def _xml_parse_error(xml_string, exc_msg, meaning, conn_id):
+    """
+    Return the XMLParseError for an XML parsing error in an XML string.
+
+    The UTF-8 and XML character checkers are run on the XML string first, in
+    order to improve the quality of the exception info. They raise
+    XMLParseError if they detect an issue.
 
+    Parameters:
+
+      xml_string (bytes): The UTF-8 encoded XML string that failed parsing.
+
+      exc_msg (str): Message of the parsing error, in the format of a
+        SAXParseException.
+
+      meaning (str), conn_id: See xml_to_tupletree_sax().
+    """
+
+    # Improve quality of exception info (the check...() functions may
+    # raise XMLParseError):
+    _chk_str = check_invalid_utf8_sequences(xml_string, meaning, conn_id)
+    check_invalid_xml_chars(_chk_str, meaning, conn_id)
+
+    # If the checks above pass, create the exception for the parsing error:
+    lineno, colno, new_colno, line = get_failing_line(xml_string, exc_msg)
+    if lineno is not None:
+        marker_line = ' ' * (new_colno - 1) + '^'
+        xml_msg = _format(
+            "Line {0} column {1} of XML string (as binary UTF-8 string):\n"
+            "{2}\n"
+            "{3}",
+            lineno, colno, line, marker_line)
+    else:
+        xml_msg = _format(
+            "XML string (as binary UTF-8 string):\n"
+            "{0}",
+            line)
+
+    return XMLParseError(
+        _format("XML parsing error encountered in {0}: {1}\n{2}\n",
+                meaning, exc_msg, xml_msg),
+        conn_id=conn_id)
+
+
+def xml_chunks_to_tupletree_expat(xml_chunks, meaning, conn_id=None,
+                                  decoder=None, property_filter=None):
+    """
+    Parse an XML string that is provided in chunks into tupletree, using
+    pyexpat directly in incremental mode.
+
+    Each chunk is fed into the parser as soon as it is provided by the
+    iterable, so that the production of the chunks (e.g. reading an HTTP
+    response body from the network) overlaps with parsing them. The
+    complete XML string is never held in memory by this function.
+
+    *New in pywbem 1.10.*
+
+    Parameters:
+
+      xml_chunks (:term:`py:iterable` of :term:`byte string`): The chunks of
+        the UTF-8 encoded XML string to be parsed. The chunk boundaries may
+        be anywhere, including within UTF-8 sequences.
+
+      meaning (str):
+        Short text with meaning of the XML string, for messages in exceptions.
+
+      conn_id (:term:`connection id`): Connection ID to be used in any
+        exceptions that may be raised.
+
+      decoder (TupleDecoder): Decoder that replaces each element of the
+        tupletree with its decoded form as soon as it is complete, or `None`
+        for producing a plain tupletree.
+
+      property_filter (set of str): Lower-cased names of the properties of
+        INSTANCE elements to be included in the tupletree, or `None` for
+        including all properties. See TupleTreeBuilder for details.
+
+    Returns:
+
+      tupletree: tuple with parsed XML tree
+
+    Raises:
+
+      pywbem.XMLParseError: Error detected by pyexpat
+    """
+
+    builder = TupleTreeBuilder(decoder=decoder,
+                               property_filter=property_filter)
+    for _ in _feed_chunks(builder, xml_chunks, meaning, conn_id):
+        pass
+    return builder.root
+
+
+def iter_xml_chunks_to_tupletree_expat(xml_chunks, parent_path, meaning,
+                                       conn_id=None, decoder=None,
+                                       property_filter=None):
+    """
+    Generator function that parses an XML string that is provided in chunks
+    using pyexpat directly in incremental mode, and yields the child elements
+    of a particular element as tupletrees as soon as each of them is complete.
+
+    The yielded child elements are detached from the tupletree, so that the
+    memory needed for parsing a long list of child elements (e.g. the
+    instances in the IRETURNVALUE element of a CIM-XML response) does not
+    grow with the number of child elements.
+
+    The return value of the generator (i.e. the result of ``yield from``) is
+    the tupletree of the complete XML string, without the yielded child
+    elements.
+
+    *New in pywbem 1.10.*
+
+    Parameters:
+
+      xml_chunks (:term:`py:iterable` of :term:`byte string`): The chunks of
+        the UTF-8 encoded XML string to be parsed. The chunk boundaries may
+        be anywhere, including within UTF-8 sequences.
+
+      parent_path (:term:`py:iterable` of str): The element names on the path
+        from the root element to the element whose child elements are to be
+        yielded, e.g. ``('CIM', 'MESSAGE', 'SIMPLERSP', 'IMETHODRESPONSE',
+        'IRETURNVALUE')``.
+
+      meaning (str):
+        Short text with meaning of the XML string, for messages in exceptions.
+
+      conn_id (:term:`connection id`): Connection ID to be used in any
+        exceptions that may be raised.
+
+      decoder (TupleDecoder): Decoder that replaces each element of the
+        tupletree with its decoded form as soon as it is complete, or `None`
+        for producing a plain tupletree.
+
+      property_filter (set of str): Lower-cased names of the properties of
+        INSTANCE elements to be included in the tupletree, or `None` for
+        including all properties. See TupleTreeBuilder for details.
+
+    Yields:
+
+      tupletree: tuple with parsed XML tree of the next child element.
+
+    Raises:
+
+      pywbem.XMLParseError: Error detected by pyexpat
+    """
+
+    builder = TupleTreeBuilder(parent_path, decoder, property_filter)
+    for _ in _feed_chunks(builder, xml_chunks, meaning, conn_id):
+        if builder.items:
+            items = builder.items
+            builder.items = []
+            yield from items
+    return builder.root
+
+
+def _feed_chunks(builder, xml_chunks, meaning, conn_id):
+    """
+    Generator function that feeds the chunks of an XML string into a
+    TupleTreeBuilder, and yields after each chunk has been parsed.
+
+    Raises:
+
+      pywbem.XMLParseError: Error detected by pyexpat
+    """
+
+    chunk = b''
+    try:
+        for chunk in xml_chunks:
+            builder.feed(chunk)
+            yield
+        builder.feed(b'', True)
+    except xml.parsers.expat.ExpatError as exc:
+
+        # Traceback of the exception that was caught
+        org_tb = sys.exc_info()[2]
+
+        # The complete XML string is not available, so the UTF-8 and XML
+        # character checks of xml_to_tupletree_expat() cannot be performed
+        # and only the chunk that was being parsed is shown.
+        chunk, _ = truncate_line(chunk, 1, 0, 999)
         pe = XMLParseError(
-            _format("XML parsing error encountered in {0}: {1}\n{2}\n",
-                    meaning, exc, xml_msg),
+            _format("XML parsing error encountered in {0}: {1}\n"
+                    "XML chunk being parsed (as binary UTF-8 string):\n"
+                    "{2}\n",
+                    meaning, builder.error_message(exc), chunk),
             conn_id=conn_id)
         raise pe.with_traceback(org_tb)  # ignore this call in traceback!
 
-    return handler.root
-
 
 def truncate_line(line, colno, max_before, max_after):
     """
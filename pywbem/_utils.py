@@ -150,6 +150,12 @@ def _hash_item(item):
     """
     if isinstance(item, list):
         item = tuple(item)
+    elif isinstance(item, MutableSequence):
+        # Defer import due to circular import dependencies:
+        # pylint: disable=import-outside-toplevel
+        from ._cim_types import CIMNumericArray
+        if isinstance(item, CIMNumericArray):
+            item = tuple(item)
     return hash(item)
 
 
@@ -162,6 +168,35 @@ def _hash_dict(dict_):
     return hash(dict_)
 
 
+class _StateAttribute:
+    """
+    Descriptor for a private attribute of an object whose value is stored in
+    a separate state object, instead of in the object itself.
+
+    The state object is the value of the attribute with the name `state_name`
+    of the object. If the state object is a :class:`py:threading.local`
+    object, the attribute has a separate value in each thread. The attribute
+    has the value `default` until it is set (in the current thread).
+    """
+
+    def __init__(self, state_name, default=None):
+        self._state_name = state_name
+        self._default = default
+        self._name = None
+
+    def __set_name__(self, owner, name):
+        self._name = name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        return getattr(getattr(obj, self._state_name), self._name,
+                       self._default)
+
+    def __set__(self, obj, value):
+        setattr(getattr(obj, self._state_name), self._name, value)
+
+
 def _stacklevel_above_module(mod_name):
     """
     Return the stack level (with 1 = caller of this function) of the first
@@ -239,6 +239,10 @@ class FakedWBEMConnection(WBEMConnection):
         self._imethodcall = self._mock_imethodcall
         self._methodcall = self._mock_methodcall
 
+        # The mock does not support multiple operation requests, so the
+        # operations of batches are performed individually.
+        self._multireq_supported = False
+
     @property
     def namespaces(self):
         """
@@ -1215,10 +1219,15 @@ class FakedWBEMConnection(WBEMConnection):
     ########################################################################
 
     def _mock_imethodcall(self, methodname, namespace, response_params_rqd=None,
-                          **params):  # pylint: disable=unused-argument
+                          property_filter=None, **params):
+        # pylint: disable=unused-argument
         """
         Mocks the WBEMConnection._imethodcall() method.
 
+        The mock WBEM server honors the PropertyList parameter, so the
+        property_filter parameter for enforcing it on the client side is
+        ignored.
+
         This mock calls methods within this class that fake the processing
         in a WBEM server (at the CIM Object level) for the varisous CIM/XML
         methods and return.
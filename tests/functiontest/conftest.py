@@ -94,6 +94,12 @@ Syntax elements:
   - namespace: default_namespace argument
   - timeout: timeout argument
   - stats-enabled: stats_enabled argument
+  - stream-response: stream_response argument
+  - direct-decode: direct_decode argument
+  - lazy-instances: lazy_instances argument
+  - compact-arrays: compact_arrays argument
+  - instance-layouts: instance_layouts argument
+  - shared-qualifiers: shared_qualifiers argument
   - debug: debug attribute
 * {op_exc_type}: String that is the Python class name of the expected exception
   raised by the operation method.
@@ -840,7 +846,19 @@ def runtestcase(testcase):
         default_namespace=tc_getattr(tc_name, pywbem_request, "namespace"),
         timeout=tc_getattr(tc_name, pywbem_request, "timeout"),
         stats_enabled=tc_getattr(tc_name, pywbem_request, "stats-enabled",
-                                 False))
+                                 False),
+        stream_response=tc_getattr(tc_name, pywbem_request, "stream-response",
+                                   False),
+        direct_decode=tc_getattr(tc_name, pywbem_request, "direct-decode",
+                                 False),
+        lazy_instances=tc_getattr(tc_name, pywbem_request, "lazy-instances",
+                                  False),
+        compact_arrays=tc_getattr(tc_name, pywbem_request, "compact-arrays",
+                                  False),
+        instance_layouts=tc_getattr(tc_name, pywbem_request,
+                                    "instance-layouts", False),
+        shared_qualifiers=tc_getattr(tc_name, pywbem_request,
+                                     "shared-qualifiers", False))
 
     conn.session.mount(conn.scheme + '://', mock_adapter)
 
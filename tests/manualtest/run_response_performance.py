@@ -25,12 +25,12 @@ from pywbem._tupleparse import TupleParser  # noqa: E402
 # pylint: disable=use-dict-literal
 
 
-def parse_cim(tt):
+def parse_cim(tt, validation):
     """
     Compatible parse_cim() function, since in pywbem 0.13, parse_cim() changed
     from a function to a method.
     """
-    tp = TupleParser()
+    tp = TupleParser(validation=validation)
     return tp.parse_cim(tt)
 
 
@@ -40,6 +40,7 @@ DEFAULT_RESPONSE_SIZE = [100, 1000]
 DEFAULT_RESPONSE_COUNT = [100, 1000]
 DEFAULT_TOP_N_ROWS = 20
 DEFAULT_RUNID = 'default'
+DEFAULT_VALIDATION = 'strict'
 
 
 PROFILE_OUT_PREFIX = 'perf'
@@ -186,7 +187,7 @@ def create_xml(count=1000, size=100):
     return xml, AVG_RESPONSE_SIZE
 
 
-def execute_test_code(xml_string, profiler):
+def execute_test_code(xml_string, profiler, validation):
     """
     The test code to be executed. If a profiler is defined it is enabled
     just before the test code is executed and disabled just after the
@@ -199,9 +200,9 @@ def execute_test_code(xml_string, profiler):
             profiler.start()
 
     # The code to be tested
-    tt = _tupletree.xml_to_tupletree_sax(xml_string, "TestData")
+    tt = _tupletree.xml_to_tupletree_expat(xml_string, "TestData")
 
-    parse_cim(tt)
+    parse_cim(tt, validation)
 
     if profiler:
         if isinstance(profiler, cProfile.Profile):
@@ -210,7 +211,7 @@ def execute_test_code(xml_string, profiler):
             profiler.stop()
 
 
-def execute_with_time(xml_string, profiler):
+def execute_with_time(xml_string, profiler, validation):
     # desc reserved for future tests.
     """
     Start time measurement and execute the test code.
@@ -219,7 +220,7 @@ def execute_with_time(xml_string, profiler):
     """
     start_time = time.time()
 
-    execute_test_code(xml_string, profiler)
+    execute_test_code(xml_string, profiler, validation)
 
     return time.time() - start_time
 
@@ -235,6 +236,7 @@ class ExecuteTests:
         self.response_size = args.response_size
         self.response_count = args.response_count
         self.profiler = args.profiler
+        self.validation = args.validation
         self.verbose = args.verbose
         self.log = args.log
         self.runid = args.runid or DEFAULT_RUNID
@@ -282,7 +284,8 @@ class ExecuteTests:
             f"ExecuteTests(runid={self.runid}, "
             f"response_size={self.response_size} "
             f"response_count={self.response_count} "
-            f"profiler={self.profiler} verbose={self.verbose}, "
+            f"profiler={self.profiler} validation={self.validation} "
+            f"verbose={self.verbose}, "
             f"log={self.log}, file_datetime={self.file_datetime}, "
             f"logfile={self.logfile}, dumpfilename={self.dumpfilename}, "
             f"top_n_rows={self.top_n_rows}, cprofilesort={self.cprofilesort})")
@@ -297,7 +300,8 @@ class ExecuteTests:
         for response_size in self.response_size:
             for response_count in self.response_count:
                 xml, avg_resp_size = create_xml(response_count, response_size)
-                execution_time = execute_with_time(xml, profiler=profiler)
+                execution_time = execute_with_time(
+                    xml, profiler=profiler, validation=self.validation)
                 row = (response_size,
                        int(avg_resp_size),
                        response_count,
@@ -381,6 +385,7 @@ class ExecuteTests:
                   "Instances\nper sec"]
         title = (
             f'Results: profiler={self.profiler}, '
+            f'validation={self.validation}, '
             f'response_counts={self.response_count},\n   '
             f'response-sizes={self.response_size}, runid={self.runid} '
             f'{self.file_datetime}')
@@ -464,6 +469,12 @@ Examples:
      Execute a minimal test with default input arguments and display time to
      execute. It does not use either of the profilers.
 
+  {prog}  --validation fast --response-count 10000 --response-size 500
+
+     Execute the test with the 'fast' validation level of TupleParser, for
+     comparing the time per instance with the default 'strict' validation
+     level.
+
   {prog}  -p cprofile --response-count 10000 20000 \\
     --response-size 100 1000
 
@@ -517,6 +528,13 @@ Examples:
              '   -s 100 200 300\n'
              f'Default: {DEFAULT_RESPONSE_SIZE}')
 
+    tests_arggroup.add_argument(
+        '-V', '--validation', dest='validation',
+        choices=['strict', 'fast'],
+        action='store', default=DEFAULT_VALIDATION,
+        help='R|The validation level of TupleParser for the test.\n'
+             f'Default: {DEFAULT_VALIDATION}')
+
     tests_arggroup.add_argument(
         '-n', '--top-n-rows', dest='top_n_rows',
         metavar='int', type=int,
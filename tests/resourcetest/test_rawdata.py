@@ -0,0 +1,75 @@
+"""
+Resource consumption tests for receiving large CIM-XML responses, with and
+without retaining the raw request and response in the connection.
+"""
+
+import tracemalloc
+
+import pytest
+import requests_mock
+
+from .resource_measurement import ResourceMeasurement
+
+# pylint: disable=wrong-import-position, wrong-import-order, invalid-name
+from ..utils import import_installed
+pywbem = import_installed('pywbem')
+# pylint: enable=wrong-import-position, wrong-import-order, invalid-name
+
+# Size of the padded CIM-XML responses, in Bytes
+REPLY_SIZE = 100 * 1024 * 1024
+
+
+def padded_getclass_response(size):
+    """
+    Return a CIM-XML response for a GetClass operation that is padded with
+    XML comments to the specified size. The comments are skipped by the XML
+    parser, so that the resource consumption is dominated by the handling of
+    the response data and not by the returned objects.
+    """
+    start = b'<?xml version="1.0" encoding="utf-8" ?>\n'
+    end = (
+        b'<CIM CIMVERSION="2.0" DTDVERSION="2.0">'
+        b'<MESSAGE ID="1001" PROTOCOLVERSION="1.0"><SIMPLERSP>'
+        b'<IMETHODRESPONSE NAME="GetClass"><IRETURNVALUE>'
+        b'<CLASS NAME="CIM_Foo"/>'
+        b'</IRETURNVALUE></IMETHODRESPONSE></SIMPLERSP></MESSAGE></CIM>')
+    comment = b'<!--' + b' ' * 56 + b'-->\n'
+    padding_size = size - len(start) - len(end)
+    padding = comment * (padding_size // len(comment))
+    padding += b' ' * (padding_size - len(padding))
+    return start + padding + end
+
+
+@pytest.mark.parametrize(
+    "retain_raw_data", [True, False]
+)
+def test_getclass_large_reply(retain_raw_data):
+    """
+    Resource consumption test for a GetClass operation with a large
+    response, against a mocked HTTP layer.
+    """
+    content = padded_getclass_response(REPLY_SIZE)
+    conn = pywbem.WBEMConnection(
+        'http://srv1', default_namespace='root/cimv2',
+        retain_raw_data=retain_raw_data)
+    adapter = requests_mock.Adapter()
+    adapter.register_uri(
+        'POST', requests_mock.ANY, content=content,
+        headers={'Content-type': 'application/xml; charset="utf-8"',
+                 'Content-length': str(len(content))})
+    conn.session.mount('http://', adapter)
+
+    print(f"\nResource consumption test: GetClass with a reply of "
+          f"{REPLY_SIZE} B, retain_raw_data={retain_raw_data}:")
+
+    with ResourceMeasurement() as rm:
+        result = conn.GetClass('CIM_Foo')
+        retained_size, _ = tracemalloc.get_traced_memory()
+
+    assert result.classname == 'CIM_Foo'
+    assert conn.last_reply_len == REPLY_SIZE
+
+    print(f"  Elapsed time: {rm.elapsed_time_ms:>12.3f} ms")
+    print(f"  CPU time:     {rm.cpu_time_ms:>12.3f} ms")
+    print(f"  Peak usage:   {rm.peak_size:>12} B")
+    print(f"  Retained:     {retained_size:>12} B")
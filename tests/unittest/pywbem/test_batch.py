@@ -0,0 +1,298 @@
+"""
+Test the batches of WBEM operations (WBEMConnection.batch(), WBEMBatch and
+BatchOperation).
+"""
+
+import re
+
+import pytest
+import requests_mock
+
+from ..utils.pytest_extensions import simplified_test_function
+
+# pylint: disable=wrong-import-position, wrong-import-order, invalid-name
+from ...utils import import_installed
+pywbem = import_installed('pywbem')
+from pywbem import WBEMConnection, WBEMBatch, BatchOperation, CIMError, \
+    HTTPError, CIM_ERR_NOT_FOUND  # noqa: E402
+# pylint: enable=wrong-import-position, wrong-import-order, invalid-name
+
+# Literal form {"blah: 0} faster than dict(blah=0) but same functionality
+# pylint: disable=use-dict-literal
+
+
+def simple_response(simplereq):
+    """
+    Return the SIMPLERSP element for a SIMPLEREQ element of a GetClass or
+    InvokeMethod request. Class CIM_Missing is returned as a CIM_ERR_NOT_FOUND
+    error.
+    """
+    m = re.search(r'<METHODCALL NAME="(\w+)"', simplereq)
+    if m:
+        return (
+            f'<SIMPLERSP><METHODRESPONSE NAME="{m.group(1)}">'
+            '<RETURNVALUE PARAMTYPE="uint32"><VALUE>0</VALUE></RETURNVALUE>'
+            '</METHODRESPONSE></SIMPLERSP>')
+    classname = re.search(r'<CLASSNAME NAME="(\w+)"', simplereq).group(1)
+    if classname == 'CIM_Missing':
+        result = '<ERROR CODE="6" DESCRIPTION="Class not found"/>'
+    else:
+        result = f'<IRETURNVALUE><CLASS NAME="{classname}"/></IRETURNVALUE>'
+    return (
+        '<SIMPLERSP><IMETHODRESPONSE NAME="GetClass">'
+        f'{result}</IMETHODRESPONSE></SIMPLERSP>')
+
+
+def cimxml_response(request, context):
+    # pylint: disable=unused-argument
+    """
+    requests_mock callback that returns the CIM-XML response for a simple or
+    multiple operation request with GetClass and InvokeMethod operations.
+    """
+    rsps = [simple_response(req) for req in
+            re.findall(r'<SIMPLEREQ>(.*?)</SIMPLEREQ>', request.text)]
+    if '<MULTIREQ>' in request.text:
+        rsp = f'<MULTIRSP>{"".join(rsps)}</MULTIRSP>'
+    else:
+        rsp = rsps[0]
+    return (
+        '<?xml version="1.0" encoding="utf-8" ?>\n'
+        '<CIM CIMVERSION="2.0" DTDVERSION="2.0">'
+        f'<MESSAGE ID="1001" PROTOCOLVERSION="1.0">{rsp}</MESSAGE>'
+        '</CIM>').encode('utf-8')
+
+
+def mocked_conn(options_headers, post_kwargs=None, **conn_kwargs):
+    """
+    Return a connection with a mocked HTTP layer, and the requests_mock
+    adapter.
+    """
+    conn = WBEMConnection('http://srv1', ('user', 'pw'),
+                          default_namespace='root/cimv2', **conn_kwargs)
+    adapter = requests_mock.Adapter()
+    adapter.register_uri(
+        'OPTIONS', requests_mock.ANY, status_code=200,
+        headers=options_headers)
+    if post_kwargs is None:
+        post_kwargs = dict(
+            content=cimxml_response, status_code=200,
+            headers={'Content-type': 'application/xml; charset="utf-8"'})
+    adapter.register_uri('POST', requests_mock.ANY, **post_kwargs)
+    conn.session.mount('http://', adapter)
+    return conn, adapter
+
+
+def add_operations(batch):
+    """
+    Add GetClass and InvokeMethod operations to a batch, one of which fails
+    in the WBEM server and one of which has an invalid parameter.
+    """
+    return [
+        batch.GetClass('CIM_Foo'),
+        batch.GetClass('CIM_Missing'),
+        batch.GetClass(42),
+        batch.InvokeMethod('Reset', 'CIM_Foo'),
+    ]
+
+
+def assert_operations(operations):
+    """
+    Check the results of the operations added by add_operations().
+    """
+    assert all(op.done for op in operations)
+    assert operations[0].result().classname == 'CIM_Foo'
+    assert isinstance(operations[1].exception(), CIMError)
+    assert operations[1].exception().status_code == CIM_ERR_NOT_FOUND
+    with pytest.raises(CIMError):
+        operations[1].result()
+    assert isinstance(operations[2].exception(), TypeError)
+    assert operations[3].result() == (0, {})
+
+
+def test_batch_multireq():
+    """
+    Test a batch that is sent as a multiple operation request to a WBEM
+    server that supports them.
+    """
+    conn, adapter = mocked_conn(
+        {'CIMSupportsMultipleOperations': ''}, stats_enabled=True)
+
+    # The code to be tested
+    with conn.batch() as batch:
+        operations = add_operations(batch)
+
+    assert isinstance(batch, WBEMBatch)
+    assert batch.executed
+    assert len(batch) == 4
+    assert batch.operations == operations
+    assert_operations(operations)
+
+    methods = [req.method for req in adapter.request_history]
+    assert methods == ['OPTIONS', 'POST']
+    post = adapter.request_history[1]
+    assert post.headers['CIMBatch'] == ''
+    assert post.headers['CIMOperation'] == 'MethodCall'
+    assert post.text.count('<SIMPLEREQ>') == 3
+    assert '<MULTIREQ>' in conn.last_raw_request
+    assert conn.statistics.get_op_statistic('MultiRequest').count == 1
+
+    # The support of the server is retained in the connection
+    with conn.batch() as batch:
+        add_operations(batch)
+    methods = [req.method for req in adapter.request_history]
+    assert methods == ['OPTIONS', 'POST', 'POST']
+
+
+def test_batch_multireq_prefixed_header():
+    """
+    Test that the support for multiple operation requests is detected from a
+    header field with a prefix.
+    """
+    conn, adapter = mocked_conn({'77-CIMSupportsMultipleOperations': ''})
+
+    with conn.batch() as batch:
+        operations = add_operations(batch)
+
+    assert_operations(operations)
+    assert adapter.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "thread_safe", [False, True])
+def test_batch_individual(thread_safe):
+    """
+    Test a batch that is performed with individual requests, for a WBEM
+    server that does not support multiple operation requests.
+    """
+    conn, adapter = mocked_conn({}, thread_safe=thread_safe)
+
+    # The code to be tested
+    with conn.batch(max_workers=2) as batch:
+        operations = add_operations(batch)
+
+    assert_operations(operations)
+    methods = sorted(req.method for req in adapter.request_history)
+    assert methods == ['OPTIONS', 'POST', 'POST', 'POST']
+    for req in adapter.request_history[1:]:
+        assert 'CIMBatch' not in req.headers
+        assert '<MULTIREQ>' not in req.text
+
+
+def test_batch_multireq_rejected():
+    """
+    Test that a batch is performed with individual requests when the WBEM
+    server rejects the multiple operation request, and that a multiple
+    operation request that is forced fails for all its operations.
+    """
+    conn, adapter = mocked_conn({'CIMSupportsMultipleOperations': ''})
+    rejected = dict(
+        status_code=501, reason='Not Implemented',
+        headers={'CIMError': 'multiple-requests-unsupported'})
+    adapter.register_uri('POST', requests_mock.ANY, [
+        rejected,
+        dict(content=cimxml_response, status_code=200,
+             headers={'Content-type': 'application/xml; charset="utf-8"'}),
+    ])
+
+    # The code to be tested
+    with conn.batch() as batch:
+        operations = add_operations(batch)
+
+    assert_operations(operations)
+    assert adapter.call_count == 5
+
+    # The rejection is retained in the connection, but can be overridden
+    adapter.register_uri('POST', requests_mock.ANY, **rejected)
+    with conn.batch(multireq=True) as batch:
+        operations = add_operations(batch)
+    assert adapter.call_count == 6
+    for i in (0, 1, 3):
+        assert isinstance(operations[i].exception(), HTTPError)
+        assert operations[i].exception().status == 501
+    assert isinstance(operations[2].exception(), TypeError)
+
+
+def test_batch_not_executed():
+    """
+    Test a batch that is not executed because of an exception in the with
+    statement, and the behavior of a batch after it has been executed.
+    """
+    conn, adapter = mocked_conn({'CIMSupportsMultipleOperations': ''})
+
+    with pytest.raises(KeyError):
+        with conn.batch() as batch:
+            operation = batch.GetClass('CIM_Foo')
+            raise KeyError('abc')
+
+    assert isinstance(operation, BatchOperation)
+    assert operation.method_name == 'GetClass'
+    assert not operation.done
+    assert not batch.executed
+    assert adapter.call_count == 0
+    with pytest.raises(RuntimeError):
+        operation.result()
+
+    # The code to be tested
+    batch.execute()
+
+    assert operation.result().classname == 'CIM_Foo'
+    with pytest.raises(RuntimeError):
+        batch.execute()
+    with pytest.raises(RuntimeError):
+        batch.GetClass('CIM_Foo')
+
+
+TESTCASES_BATCH_INVALID = [
+
+    # Testcases for test_batch_invalid()
+    #
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * batch_kwargs: Keyword arguments for WBEMConnection.batch().
+    #   * method_name: Name of the WBEMBatch method to be called.
+    # * exp_exc_types: Expected exception type(s), or None.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "Invalid max_workers",
+        dict(batch_kwargs=dict(max_workers=0), method_name='GetClass'),
+        ValueError, None, True
+    ),
+    (
+        "Pull operation",
+        dict(batch_kwargs={}, method_name='OpenEnumerateInstances'),
+        AttributeError, None, True
+    ),
+    (
+        "Iter operation",
+        dict(batch_kwargs={}, method_name='IterEnumerateInstances'),
+        AttributeError, None, True
+    ),
+    (
+        "Unknown operation",
+        dict(batch_kwargs={}, method_name='GetFoo'),
+        AttributeError, None, True
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_BATCH_INVALID)
+@simplified_test_function
+def test_batch_invalid(testcase, batch_kwargs, method_name):
+    """
+    Test WBEMConnection.batch() and the WBEMBatch methods with invalid
+    parameters.
+    """
+    conn = WBEMConnection('http://srv1')
+
+    # The code to be tested
+    batch = conn.batch(**batch_kwargs)
+    getattr(batch, method_name)('CIM_Foo')
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
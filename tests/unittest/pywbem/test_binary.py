@@ -0,0 +1,438 @@
+"""
+Test the binary format of CIM objects (dumpb(), loadb(), BinaryWriter and
+BinaryReader).
+"""
+
+import io
+import pickle
+from datetime import datetime, timedelta
+
+import pytest
+
+from ..utils.pytest_extensions import simplified_test_function
+
+# pylint: disable=wrong-import-position, wrong-import-order, invalid-name
+from ...utils import import_installed
+pywbem = import_installed('pywbem')
+from pywbem import CIMInstance, CIMInstanceName, CIMClass, CIMClassName, \
+    CIMProperty, CIMMethod, CIMParameter, CIMQualifier, \
+    CIMQualifierDeclaration, CIMQualifierCache, CIMInstanceLayout, \
+    CIMDateTime, MinutesFromUTC, CIMNumericArray, Char16, Uint8, Sint8, \
+    Uint16, Uint32, Sint32, Uint64, Sint64, Real32, Real64, CIMInt, dumpb, \
+    loadb, BinaryWriter, BinaryReader  # noqa: E402
+# pylint: enable=wrong-import-position, wrong-import-order, invalid-name
+
+# Literal form {"blah: 0} faster than dict(blah=0) but same functionality
+# pylint: disable=use-dict-literal
+
+PATH = CIMInstanceName(
+    'CIM_Foo',
+    keybindings={'KeyName': 'foo', 'KeyId': Uint32(42), 'Num': 7, 'Flag': True,
+                 'KeyRef': CIMInstanceName('CIM_Bar', {'Id': Sint64(-1)})},
+    host='woot.com', namespace='root/cimv2')
+
+INSTANCE = CIMInstance(
+    'CIM_Foo',
+    properties=[
+        CIMProperty('Name', 'foo', propagated=False, class_origin='CIM_Foo'),
+        CIMProperty('Id', Uint32(42)),
+        CIMProperty('Null', None, type='sint16'),
+        CIMProperty('Bool', False),
+        CIMProperty('Char', Char16('x')),
+        CIMProperty('Real', Real32(1.1)),
+        CIMProperty('Time', CIMDateTime(datetime(
+            2020, 2, 29, 23, 59, 58, 123456, MinutesFromUTC(-90)))),
+        CIMProperty('Interval', CIMDateTime(timedelta(
+            days=3, seconds=4, microseconds=5))),
+        CIMProperty('Wildcards', CIMDateTime('20200101******.******+060')),
+        CIMProperty('List', [Uint8(1), None, Uint8(255)]),
+        CIMProperty('EmptyList', [], type='string'),
+        CIMProperty('NullList', None, type='real64', is_array=True,
+                    array_size=5),
+        CIMProperty('Compact', CIMNumericArray('sint32', [-1, 0, 1])),
+        CIMProperty('Ref', PATH, reference_class='CIM_Foo'),
+        CIMProperty('Embedded', CIMInstance('CIM_Emb', {'P': 'v'}),
+                    embedded_object='instance'),
+        CIMProperty('EmbeddedList',
+                    [CIMInstance('CIM_Emb', {'P': 'v'}), None,
+                     CIMClass('CIM_Emb')],
+                    embedded_object='object'),
+        CIMProperty('Qualified', 'a', qualifiers=[
+            CIMQualifier('Description', 'd', tosubclass=True,
+                         translatable=True)]),
+        CIMProperty('Unicode', 'ä€\U0001F600'),
+    ],
+    qualifiers=[CIMQualifier('Q1', [Sint8(-1), Sint8(1)], propagated=True)],
+    path=PATH)
+
+CLASS = CIMClass(
+    'CIM_Foo', superclass='CIM_Base',
+    qualifiers=[CIMQualifier('Abstract', True, overridable=False)],
+    properties=[
+        CIMProperty('Name', None, type='string', qualifiers=[
+            CIMQualifier('Key', True)]),
+        CIMProperty('Sizes', [Uint64(1)], class_origin='CIM_Base',
+                    propagated=True),
+        CIMProperty('Ref', None, type='reference', reference_class='CIM_Bar'),
+    ],
+    methods=[
+        CIMMethod('Do', return_type='uint32', propagated=False, parameters=[
+            CIMParameter('In', 'string', qualifiers=[
+                CIMQualifier('In', True)]),
+            CIMParameter('Refs', 'reference', reference_class='CIM_Bar',
+                         is_array=True, array_size=2),
+            CIMParameter('Emb', 'string', embedded_object='instance'),
+        ]),
+        CIMMethod('Nothing', return_type='boolean'),
+    ],
+    path=CIMClassName('CIM_Foo', host='woot.com', namespace='root/cimv2'))
+
+QUALIFIER_DECLARATION = CIMQualifierDeclaration(
+    'ValueMap', 'string', is_array=True, array_size=None,
+    scopes={'PROPERTY': True, 'METHOD': True, 'PARAMETER': False},
+    overridable=True, tosubclass=True, translatable=False)
+
+
+TESTCASES_BINARY_ROUNDTRIP = [
+
+    # Testcases for test_binary_roundtrip()
+    #
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * obj: Object to be converted to the binary format and back.
+    # * exp_exc_types: Expected exception type(s), or None.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "CIMInstance with all kinds of property values",
+        dict(obj=INSTANCE),
+        None, None, True
+    ),
+    (
+        "CIMInstance without path and properties",
+        dict(obj=CIMInstance('CIM_Foo')),
+        None, None, True
+    ),
+    (
+        "CIMInstanceName with keybindings of all kinds",
+        dict(obj=PATH),
+        None, None, True
+    ),
+    (
+        "CIMInstanceName with unnamed keybinding",
+        dict(obj=CIMInstanceName('CIM_Foo', {None: 'a'})),
+        None, None, True
+    ),
+    (
+        "CIMInstanceName without keybindings",
+        dict(obj=CIMInstanceName('CIM_Foo')),
+        None, None, True
+    ),
+    (
+        "CIMClass with properties, methods and parameters",
+        dict(obj=CLASS),
+        None, None, True
+    ),
+    (
+        "CIMClassName",
+        dict(obj=CIMClassName('CIM_Foo', namespace='root/cimv2')),
+        None, None, True
+    ),
+    (
+        "CIMQualifierDeclaration",
+        dict(obj=QUALIFIER_DECLARATION),
+        None, None, True
+    ),
+    (
+        "CIMProperty",
+        dict(obj=CIMProperty('P1', Uint16(3))),
+        None, None, True
+    ),
+    (
+        "CIMMethod",
+        dict(obj=CLASS.methods['Do']),
+        None, None, True
+    ),
+    (
+        "CIMParameter",
+        dict(obj=CIMParameter('P1', 'sint32', value=Sint32(-3))),
+        None, None, True
+    ),
+    (
+        "CIMQualifier",
+        dict(obj=CIMQualifier('Q1', Real64(2.5), toinstance=True)),
+        None, None, True
+    ),
+    (
+        "CIMDateTime point in time",
+        dict(obj=CIMDateTime('20201231235959.999999-720')),
+        None, None, True
+    ),
+    (
+        "CIMDateTime interval",
+        dict(obj=CIMDateTime('12345678235959.999999:000')),
+        None, None, True
+    ),
+    (
+        "CIMDateTime interval with wildcards",
+        dict(obj=CIMDateTime('00000001******.******:000')),
+        None, None, True
+    ),
+    (
+        "Uint64 maximum value",
+        dict(obj=Uint64(2**64 - 1)),
+        None, None, True
+    ),
+    (
+        "Sint64 minimum value",
+        dict(obj=Sint64(-2**63)),
+        None, None, True
+    ),
+    (
+        "String",
+        dict(obj='abc'),
+        None, None, True
+    ),
+    (
+        "Python int and float",
+        dict(obj=[-2**70, 1.5]),
+        None, None, True
+    ),
+    (
+        "None",
+        dict(obj=None),
+        None, None, True
+    ),
+    (
+        "List of CIM objects",
+        dict(obj=[PATH, INSTANCE, CLASS, None]),
+        None, None, True
+    ),
+    (
+        "CIMNumericArray",
+        dict(obj=CIMNumericArray('real32', [0.5, -1.5])),
+        None, None, True
+    ),
+    (
+        "Unsupported type",
+        dict(obj=dict(a=1)),
+        TypeError, None, True
+    ),
+    (
+        "Unsupported type in a list",
+        dict(obj=[Uint8(1), object()]),
+        TypeError, None, True
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_BINARY_ROUNDTRIP)
+@simplified_test_function
+def test_binary_roundtrip(testcase, obj):
+    """
+    Test dumpb() and loadb() for an object.
+    """
+
+    # The code to be tested
+    data = dumpb(obj)
+    result = loadb(data)
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    assert isinstance(data, bytes)
+    assert result == obj
+    assert type(result) is type(obj)  # pylint: disable=unidiomatic-typecheck
+    if isinstance(obj, CIMInstance):
+        for name, prop in obj.properties.items():
+            assert type(result[name]) is type(prop.value)
+
+
+def test_binary_value_types():
+    """
+    Test that loadb() returns values of the CIM data types.
+    """
+    inst = loadb(dumpb(INSTANCE))
+    assert isinstance(inst['Id'], Uint32)
+    assert isinstance(inst['Char'], Char16)
+    assert isinstance(inst['Real'], Real32)
+    assert inst['Real'] == INSTANCE['Real']
+    assert isinstance(inst['Compact'], CIMNumericArray)
+    assert inst['Compact'].cimtype == 'sint32'
+    assert inst['Wildcards'].precision == 8
+    assert inst.properties['NullList'].array_size == 5
+    num = inst.path.keybindings['Num']
+    assert num == 7
+    assert isinstance(num, int) and not isinstance(num, (bool, CIMInt))
+    assert inst.properties['Embedded'].embedded_object == 'instance'
+
+
+def test_binary_size():
+    """
+    Test that the binary format is smaller than the pickle and CIM-XML
+    representations.
+    """
+    data = dumpb(INSTANCE)
+    assert len(data) < len(pickle.dumps(INSTANCE)) / 3
+    assert len(data) < len(INSTANCE.tocimxmlstr()) / 3
+
+
+def test_binary_frozen_path():
+    """
+    Test that frozen instance paths are read as frozen instance paths.
+    """
+    path = PATH.copy().freeze()
+    assert loadb(dumpb(path)).frozen is True
+    assert loadb(dumpb(PATH)).frozen is False
+
+
+def test_binary_layout_instance():
+    """
+    Test the binary format of an instance that uses a CIMInstanceLayout.
+    """
+    layout = CIMInstanceLayout(
+        'CIM_Foo', [CIMProperty('P1', None, type='uint32'),
+                    CIMProperty('P2', None, type='string')])
+    inst = layout.new_instance([Uint32(1), 'a'])
+
+    data = dumpb(inst)
+
+    # pylint: disable=protected-access
+    assert inst._properties.__class__.__name__ == '_LayoutValues'
+    result = loadb(data)
+    assert result == layout.new_instance([Uint32(1), 'a'])
+    assert data == dumpb(CIMInstance('CIM_Foo', [
+        CIMProperty('P1', Uint32(1)), CIMProperty('P2', 'a')]))
+
+
+def test_binary_shared_qualifiers():
+    """
+    Test the binary format of a class with shared qualifiers.
+    """
+    cache = CIMQualifierCache()
+    cls = CLASS.copy(qualifier_cache=cache)
+
+    result = loadb(dumpb(cls))
+
+    assert result == CLASS
+    result.qualifiers['Abstract'].value = False
+
+
+def test_binary_stream():
+    """
+    Test BinaryWriter and BinaryReader with a sequence of objects.
+    """
+    instances = []
+    for i in range(10):
+        inst = INSTANCE.copy()
+        inst['Id'] = Uint32(i)
+        instances.append(inst)
+    fp = io.BytesIO()
+    writer = BinaryWriter(fp)
+
+    # The code to be tested
+    writer.write(CLASS)
+    writer.write_all(iter(instances))
+
+    data = fp.getvalue()
+    reader = BinaryReader(io.BytesIO(data))
+    assert reader.read() == CLASS
+    assert list(reader) == instances
+    with pytest.raises(EOFError):
+        reader.read()
+
+    # The names in the objects are written only once
+    assert len(data) < 0.7 * (len(dumpb(CLASS)) +
+                              sum(len(dumpb(inst)) for inst in instances))
+
+
+TESTCASES_BINARY_INVALID = [
+
+    # Testcases for test_binary_invalid()
+    #
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * data: Invalid binary data.
+    # * exp_exc_types: Expected exception type(s), or None.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "Empty data",
+        dict(data=b''),
+        ValueError, None, True
+    ),
+    (
+        "Invalid header",
+        dict(data=b'PICKLE!\x01\x01\x00'),
+        ValueError, None, True
+    ),
+    (
+        "Unsupported version",
+        dict(data=b'PYWBEMB\x63\x01\x00'),
+        ValueError, None, True
+    ),
+    (
+        "Header without object",
+        dict(data=b'PYWBEMB\x01'),
+        ValueError, None, True
+    ),
+    (
+        "Two objects",
+        dict(data=b'PYWBEMB\x01\x01\x00\x01\x00'),
+        ValueError, None, True
+    ),
+    (
+        "Object size larger than data",
+        dict(data=b'PYWBEMB\x01\x05\x00'),
+        ValueError, None, True
+    ),
+    (
+        "Invalid value tag",
+        dict(data=b'PYWBEMB\x01\x01\x7f'),
+        ValueError, None, True
+    ),
+    (
+        "Data after the end of the object",
+        dict(data=b'PYWBEMB\x01\x02\x00\x00'),
+        ValueError, None, True
+    ),
+    (
+        "Object ends within a value",
+        dict(data=b'PYWBEMB\x01\x02\x02\x05'),
+        ValueError, None, True
+    ),
+    (
+        "Invalid string table index",
+        dict(data=b'PYWBEMB\x01\x04\x14\x05\x00\x00'),
+        ValueError, None, True
+    ),
+    (
+        "Truncated instance",
+        dict(data=dumpb(INSTANCE)[:-3]),
+        ValueError, None, True
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_BINARY_INVALID)
+@simplified_test_function
+def test_binary_invalid(testcase, data):
+    """
+    Test loadb() with invalid binary data.
+    """
+
+    # The code to be tested
+    loadb(data)
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
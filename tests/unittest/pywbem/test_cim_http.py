@@ -3,8 +3,11 @@ Unit test cases for _cim_http.py
 """
 
 import re
+import gzip
+import zlib
 
 import requests
+import requests_mock
 import urllib3
 import pytest
 
@@ -1096,3 +1099,372 @@ def test_get_cimobject_header(testcase, obj, exp_result):
 
     # Verify the result
     assert act_result == exp_result
+
+
+# CIM-XML response for the GetClass operation used in the compression tests
+GETCLASS_RESPONSE = (
+    b'<?xml version="1.0" encoding="utf-8" ?>\n'
+    b'<CIM CIMVERSION="2.0" DTDVERSION="2.0">'
+    b'<MESSAGE ID="1001" PROTOCOLVERSION="1.0"><SIMPLERSP>'
+    b'<IMETHODRESPONSE NAME="GetClass"><IRETURNVALUE>'
+    b'<CLASS NAME="CIM_Foo"/>'
+    b'</IRETURNVALUE></IMETHODRESPONSE>'
+    b'</SIMPLERSP></MESSAGE></CIM>')
+
+
+@pytest.mark.parametrize(
+    "content_encoding, compress_func", [
+        ('gzip', gzip.compress),
+        ('x-gzip', gzip.compress),
+        ('deflate', zlib.compress),
+        ('deflate', lambda data: zlib.compress(data)[2:-4]),  # raw deflate
+        ('gzip', _cim_http.compress_body),
+    ]
+)
+def test_decompress_body(content_encoding, compress_func):
+    """
+    Test function for _cim_http.decompress_body()
+    """
+    body = GETCLASS_RESPONSE * 10
+
+    # The code to be tested
+    act_body = _cim_http.decompress_body(compress_func(body), content_encoding)
+
+    assert act_body == body
+
+
+@pytest.mark.parametrize(
+    "content_encoding, compressed_body, max_size, exp_exc_type", [
+        ('gzip', gzip.compress(b' ' * 1000000), 1000000, None),
+        ('gzip', gzip.compress(b' ' * 1000001), 1000000, ValueError),
+        ('deflate', zlib.compress(b' ' * 1000001), 1000000, ValueError),
+        ('gzip', gzip.compress(b' ' * 1000)[:-10], None, zlib.error),
+        ('deflate', b'invalid', 1000000, zlib.error),
+    ]
+)
+def test_decompress_body_invalid(
+        content_encoding, compressed_body, max_size, exp_exc_type):
+    """
+    Test _cim_http.decompress_body() with a maximum size and with invalid
+    compressed bodies.
+    """
+
+    if exp_exc_type is None:
+
+        # The code to be tested
+        act_body = _cim_http.decompress_body(
+            compressed_body, content_encoding, max_size)
+
+        assert len(act_body) == max_size
+    else:
+        with pytest.raises(exp_exc_type):
+
+            # The code to be tested
+            _cim_http.decompress_body(
+                compressed_body, content_encoding, max_size)
+
+
+@pytest.mark.parametrize(
+    "stream", [False, True]
+)
+def test_wbem_request_decompressed_size(stream, monkeypatch):
+    """
+    Test that _cim_http.wbem_request() aborts reading a compressed response
+    whose decompressed body exceeds the maximum size.
+    """
+    monkeypatch.setattr(_cim_http, 'HTTP_MAX_DECOMPRESSED_SIZE', 100000)
+    conn = pywbem.WBEMConnection('http://srv1')
+    adapter = requests_mock.Adapter()
+    adapter.register_uri(
+        'POST', requests_mock.ANY,
+        content=gzip.compress(GETCLASS_RESPONSE + b' ' * 1000000),
+        headers={'Content-type': 'application/xml; charset="utf-8"',
+                 'Content-Encoding': 'gzip'})
+    conn.session.mount('http://', adapter)
+
+    with pytest.raises(pywbem.ConnectionError) as exc_info:
+
+        # The code to be tested
+        resp_body, _ = _cim_http.wbem_request(
+            conn, '<CIM/>', [('CIMOperation', 'MethodCall')], stream=stream)
+        if stream:
+            for _ in resp_body:
+                pass
+
+    assert re.match(r'The decompressed HTTP response body exceeds the '
+                    r'maximum size of 100000 Bytes', str(exc_info.value))
+
+
+TESTCASES_WBEM_REQUEST_COMPRESSION = [
+
+    # Testcases for test_wbem_request_compression()
+    #
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * init_kwargs: Keyword arguments for WBEMConnection().
+    #   * resp_encoding: Content coding of the response, or None.
+    #   * exp_accept_encoding: Expected Accept-Encoding header of the request.
+    #   * exp_compressed: Boolean indicating the request is expected to be
+    #     compressed.
+    # * exp_exc_types: Expected exception type(s), or None.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "Default connection, uncompressed response",
+        dict(
+            init_kwargs=dict(),
+            resp_encoding=None,
+            exp_accept_encoding='gzip, deflate',
+            exp_compressed=False,
+        ),
+        None, None, True
+    ),
+    (
+        "Default connection, gzip compressed response",
+        dict(
+            init_kwargs=dict(),
+            resp_encoding='gzip',
+            exp_accept_encoding='gzip, deflate',
+            exp_compressed=False,
+        ),
+        None, None, True
+    ),
+    (
+        "Streamed deflate compressed response",
+        dict(
+            init_kwargs=dict(stream_response=True),
+            resp_encoding='deflate',
+            exp_accept_encoding='gzip, deflate',
+            exp_compressed=False,
+        ),
+        None, None, True
+    ),
+    (
+        "Compression disabled",
+        dict(
+            init_kwargs=dict(compression=False),
+            resp_encoding=None,
+            exp_accept_encoding='identity',
+            exp_compressed=False,
+        ),
+        None, None, True
+    ),
+    (
+        "Request larger than compression threshold",
+        dict(
+            init_kwargs=dict(request_compression_threshold=100),
+            resp_encoding='gzip',
+            exp_accept_encoding='gzip, deflate',
+            exp_compressed=True,
+        ),
+        None, None, True
+    ),
+    (
+        "Request smaller than compression threshold",
+        dict(
+            init_kwargs=dict(request_compression_threshold=100000),
+            resp_encoding=None,
+            exp_accept_encoding='gzip, deflate',
+            exp_compressed=False,
+        ),
+        None, None, True
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_WBEM_REQUEST_COMPRESSION)
+@simplified_test_function
+def test_wbem_request_compression(
+        testcase, init_kwargs, resp_encoding, exp_accept_encoding,
+        exp_compressed):
+    """
+    Test compression of requests and responses in _cim_http.wbem_request(),
+    using WBEMConnection.
+    """
+    conn = pywbem.WBEMConnection('http://srv1', **init_kwargs)
+    resp_headers = {'Content-type': 'application/xml; charset="utf-8"'}
+    if resp_encoding is None:
+        content = GETCLASS_RESPONSE
+    else:
+        resp_headers['Content-Encoding'] = resp_encoding
+        content = gzip.compress(GETCLASS_RESPONSE) \
+            if resp_encoding == 'gzip' else zlib.compress(GETCLASS_RESPONSE)
+    adapter = requests_mock.Adapter()
+    adapter.register_uri(
+        'POST', requests_mock.ANY, content=content, headers=resp_headers)
+    conn.session.mount('http://', adapter)
+
+    # The code to be tested
+    klass = conn.GetClass('CIM_Foo', namespace='root/cimv2')
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    assert klass.classname == 'CIM_Foo'
+    assert conn.last_reply_len == len(GETCLASS_RESPONSE)
+
+    request = adapter.last_request
+    assert request.headers['Accept-Encoding'] == exp_accept_encoding
+    if exp_compressed:
+        assert request.headers['Content-Encoding'] == 'gzip'
+        body = gzip.decompress(request.body)
+        assert int(request.headers['Content-length']) == len(request.body)
+    else:
+        assert 'Content-Encoding' not in request.headers
+        body = request.body
+    assert body.decode('utf-8') == \
+        '<?xml version="1.0" encoding="utf-8" ?>\n' + conn.last_raw_request
+    assert conn.last_request_len == len(body)
+
+
+@pytest.mark.parametrize(
+    "req_data", [
+        '<?xml version="1.0" encoding="utf-8" ?>\n<CIM>\u00e4</CIM>',
+        '<CIM>\u00e4</CIM>',
+        '<CIM>\u00e4</CIM>'.encode('utf-8'),
+    ]
+)
+def test_build_request_xml_declaration(req_data):
+    """
+    Test that _cim_http.build_request() adds the XML declaration to the
+    request data only if it does not start with it.
+    """
+    conn = pywbem.WBEMConnection('http://srv1')
+
+    # The code to be tested
+    _, req_body, req_headers = _cim_http.build_request(conn, req_data, None)
+
+    assert req_body == \
+        '<?xml version="1.0" encoding="utf-8" ?>\n<CIM>\u00e4</CIM>'.encode(
+            'utf-8')
+    assert req_headers['Content-length'] == f'{len(req_body)}'
+
+
+@pytest.mark.parametrize(
+    "status_code, resp_headers", [
+        (415, {}),
+        (406, {'CIMError': 'header-mismatch'}),
+    ]
+)
+def test_wbem_request_compression_rejected(status_code, resp_headers):
+    """
+    Test that _cim_http.wbem_request() sends a request again uncompressed if
+    the compressed request is rejected.
+    """
+    conn = pywbem.WBEMConnection(
+        'http://srv1', request_compression_threshold=0)
+    adapter = requests_mock.Adapter()
+    adapter.register_uri('POST', requests_mock.ANY, [
+        dict(status_code=status_code, headers=resp_headers),
+        dict(content=GETCLASS_RESPONSE,
+             headers={'Content-type': 'application/xml; charset="utf-8"'}),
+    ])
+    conn.session.mount('http://', adapter)
+
+    # The code to be tested
+    klass = conn.GetClass('CIM_Foo', namespace='root/cimv2')
+
+    assert klass.classname == 'CIM_Foo'
+    assert conn.request_compression_threshold == 0
+    history = adapter.request_history
+    assert len(history) == 2
+    assert history[0].headers['Content-Encoding'] == 'gzip'
+    assert 'Content-Encoding' not in history[1].headers
+    assert gzip.decompress(history[0].body) == history[1].body
+
+    # Further requests are sent uncompressed, until the threshold is set again
+    adapter.register_uri('POST', requests_mock.ANY, [
+        dict(content=GETCLASS_RESPONSE,
+             headers={'Content-type': 'application/xml; charset="utf-8"'}),
+    ])
+    conn.GetClass('CIM_Foo', namespace='root/cimv2')
+    assert 'Content-Encoding' not in adapter.last_request.headers
+    conn.request_compression_threshold = 0
+    conn.GetClass('CIM_Foo', namespace='root/cimv2')
+    assert adapter.last_request.headers['Content-Encoding'] == 'gzip'
+
+
+TESTCASES_WBEM_REQUEST_BUFFER = [
+
+    # Testcases for test_wbem_request_buffer()
+    #
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * content: HTTP response body that is sent.
+    #   * resp_headers: Additional HTTP response header fields.
+    # * exp_exc_types: Expected exception type(s), or None.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "Response with Content-Length, read into preallocated buffer",
+        dict(
+            content=GETCLASS_RESPONSE,
+            resp_headers={'Content-Length': str(len(GETCLASS_RESPONSE))},
+        ),
+        None, None, True
+    ),
+    (
+        "Response without Content-Length",
+        dict(
+            content=GETCLASS_RESPONSE,
+            resp_headers={},
+        ),
+        None, None, True
+    ),
+    (
+        "Response compressed with gzip",
+        dict(
+            content=gzip.compress(GETCLASS_RESPONSE),
+            resp_headers={'Content-Encoding': 'gzip'},
+        ),
+        None, None, True
+    ),
+    (
+        "Response shorter than its Content-Length",
+        dict(
+            content=GETCLASS_RESPONSE,
+            resp_headers={'Content-Length': str(len(GETCLASS_RESPONSE) + 10)},
+        ),
+        pywbem.ConnectionError, None, True
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_WBEM_REQUEST_BUFFER)
+@simplified_test_function
+def test_wbem_request_buffer(testcase, content, resp_headers):
+    """
+    Test _cim_http.wbem_request() in the buffer mode.
+    """
+    conn = pywbem.WBEMConnection('http://srv1')
+    recorded = []
+    recorder = pywbem.LogOperationRecorder('test')
+    recorder.stage_http_response2 = recorded.append
+    conn.add_operation_recorder(recorder)
+    headers = {'Content-type': 'application/xml; charset="utf-8"'}
+    headers.update(resp_headers)
+    adapter = requests_mock.Adapter()
+    adapter.register_uri(
+        'POST', requests_mock.ANY, content=content, headers=headers)
+    conn.session.mount('http://', adapter)
+
+    # The code to be tested
+    resp_body, _ = _cim_http.wbem_request(
+        conn, '<CIM/>', [('CIMOperation', 'MethodCall')], buffer=True)
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    assert isinstance(resp_body, memoryview)
+    assert resp_body == GETCLASS_RESPONSE
+    assert recorded[-1] == GETCLASS_RESPONSE
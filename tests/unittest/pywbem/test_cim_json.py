@@ -0,0 +1,340 @@
+"""
+Test the JSON representation of CIM objects (tojson(), fromjson(),
+NDJSONWriter and NDJSONReader).
+"""
+
+import io
+import json
+import math
+
+import pytest
+
+from ..utils.pytest_extensions import simplified_test_function
+from .test_binary import PATH, INSTANCE, CLASS, QUALIFIER_DECLARATION
+
+# pylint: disable=wrong-import-position, wrong-import-order, invalid-name
+from ...utils import import_installed
+pywbem = import_installed('pywbem')
+from pywbem import CIMInstance, CIMInstanceName, CIMClassName, CIMProperty, \
+    CIMParameter, CIMQualifier, CIMInstanceLayout, CIMNumericArray, \
+    CIMDateTime, Uint32, Sint32, Uint16, Real32, Real64, tojson, tojsonstr, \
+    fromjson, fromjsonstr, NDJSONWriter, NDJSONReader  # noqa: E402
+# pylint: enable=wrong-import-position, wrong-import-order, invalid-name
+
+# Literal form {"blah: 0} faster than dict(blah=0) but same functionality
+# pylint: disable=use-dict-literal
+
+
+TESTCASES_JSON_ROUNDTRIP = [
+
+    # Testcases for test_json_roundtrip()
+    #
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * obj: Object to be converted to the JSON representation and back.
+    # * exp_exc_types: Expected exception type(s), or None.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "CIMInstance with all kinds of property values",
+        dict(obj=INSTANCE),
+        None, None, True
+    ),
+    (
+        "CIMInstance without path and properties",
+        dict(obj=CIMInstance('CIM_Foo')),
+        None, None, True
+    ),
+    (
+        "CIMInstanceName with keybindings of all kinds",
+        dict(obj=PATH),
+        None, None, True
+    ),
+    (
+        "CIMInstanceName with unnamed keybinding and datetime keybinding",
+        dict(obj=CIMInstanceName('CIM_Foo', {
+            None: CIMDateTime('20201231235959.999999-720')})),
+        None, None, True
+    ),
+    (
+        "CIMClass with properties, methods and parameters",
+        dict(obj=CLASS),
+        None, None, True
+    ),
+    (
+        "CIMClassName",
+        dict(obj=CIMClassName('CIM_Foo', namespace='root/cimv2')),
+        None, None, True
+    ),
+    (
+        "CIMQualifierDeclaration",
+        dict(obj=QUALIFIER_DECLARATION),
+        None, None, True
+    ),
+    (
+        "CIMProperty",
+        dict(obj=CIMProperty('P1', Uint16(3))),
+        None, None, True
+    ),
+    (
+        "CIMMethod",
+        dict(obj=CLASS.methods['Do']),
+        None, None, True
+    ),
+    (
+        "CIMParameter",
+        dict(obj=CIMParameter('P1', 'sint32', value=Sint32(-3))),
+        None, None, True
+    ),
+    (
+        "CIMQualifier",
+        dict(obj=CIMQualifier('Q1', Real64(2.5), toinstance=True)),
+        None, None, True
+    ),
+    (
+        "CIM data type value (not a CIM object)",
+        dict(obj=Uint32(1)),
+        TypeError, None, True
+    ),
+    (
+        "List of CIM objects",
+        dict(obj=[PATH]),
+        TypeError, None, True
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_JSON_ROUNDTRIP)
+@simplified_test_function
+def test_json_roundtrip(testcase, obj):
+    """
+    Test tojsonstr() and fromjsonstr() for a CIM object.
+    """
+
+    # The code to be tested
+    json_str = tojsonstr(obj)
+    result = fromjsonstr(json_str)
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    assert '\n' not in json_str
+    assert result == obj
+    assert type(result) is type(obj)  # pylint: disable=unidiomatic-typecheck
+    assert json.loads(tojsonstr(obj, indent=2)) == json.loads(json_str)
+
+
+def test_json_representation():
+    """
+    Test the JSON representation of a CIM instance.
+    """
+    inst = CIMInstance(
+        'CIM_Foo',
+        properties=[
+            CIMProperty('P1', Uint32(42)),
+            CIMProperty('P2', CIMNumericArray('uint16', [1, 2])),
+            CIMProperty('P3', CIMDateTime('20200101000000.000000+000')),
+        ],
+        path=CIMInstanceName('CIM_Foo', {'K1': 'a', 'K2': 7}))
+
+    # The code to be tested
+    json_obj = tojson(inst)
+
+    assert json_obj == {
+        'pywbem_object': 'CIMInstance',
+        'classname': 'CIM_Foo',
+        'path': {
+            'pywbem_object': 'CIMInstanceName',
+            'classname': 'CIM_Foo',
+            'namespace': None,
+            'host': None,
+            'keybindings': [
+                {'name': 'K1', 'type': 'string', 'value': 'a'},
+                {'name': 'K2', 'type': None, 'value': 7},
+            ],
+        },
+        'properties': [
+            {
+                'name': 'P1', 'type': 'uint32', 'value': 42,
+                'reference_class': None, 'embedded_object': None,
+                'is_array': False, 'array_size': None, 'class_origin': None,
+                'propagated': None, 'qualifiers': [],
+            },
+            {
+                'name': 'P2', 'type': 'uint16', 'value': [1, 2],
+                'reference_class': None, 'embedded_object': None,
+                'is_array': True, 'array_size': None, 'class_origin': None,
+                'propagated': None, 'qualifiers': [],
+            },
+            {
+                'name': 'P3', 'type': 'datetime',
+                'value': '20200101000000.000000+000',
+                'reference_class': None, 'embedded_object': None,
+                'is_array': False, 'array_size': None, 'class_origin': None,
+                'propagated': None, 'qualifiers': [],
+            },
+        ],
+        'qualifiers': [],
+    }
+
+
+def test_json_layout_instance():
+    """
+    Test the JSON representation of an instance that uses a
+    CIMInstanceLayout.
+    """
+    layout = CIMInstanceLayout(
+        'CIM_Foo', [CIMProperty('P1', None, type='uint32'),
+                    CIMProperty('P2', None, type='string')])
+    inst = layout.new_instance([Uint32(1), 'a'])
+
+    json_obj = tojson(inst)
+
+    # pylint: disable=protected-access
+    assert inst._properties.__class__.__name__ == '_LayoutValues'
+    assert json_obj == tojson(CIMInstance('CIM_Foo', [
+        CIMProperty('P1', Uint32(1)), CIMProperty('P2', 'a')]))
+
+
+def test_ndjson_stream():
+    """
+    Test NDJSONWriter and NDJSONReader with a sequence of objects.
+    """
+    instances = []
+    for i in range(5):
+        inst = INSTANCE.copy()
+        inst['Id'] = Uint32(i)
+        instances.append(inst)
+    fp = io.StringIO()
+    writer = NDJSONWriter(fp)
+
+    # The code to be tested
+    writer.write(CLASS)
+    writer.write_all(iter(instances))
+
+    data = fp.getvalue()
+    assert data.count('\n') == 6
+    reader = NDJSONReader(io.StringIO(data + '\n'))
+    assert reader.read() == CLASS
+    assert list(reader) == instances
+    with pytest.raises(EOFError):
+        reader.read()
+
+
+def _reject_constant(name):
+    """
+    parse_constant function for json.loads() that rejects the non-standard
+    JSON constants NaN, Infinity and -Infinity.
+    """
+    raise ValueError(f"Non-standard JSON constant: {name}")
+
+
+def test_json_nonfinite_reals():
+    """
+    Test that the special values NaN, INF and -INF of real values are
+    represented as JSON strings, and are read back as these values.
+    """
+    nan = float('nan')
+    inf = float('inf')
+    inst = CIMInstance(
+        'CIM_Foo',
+        properties=[
+            CIMProperty('P1', Real32(nan)),
+            CIMProperty('P2', Real64(inf)),
+            CIMProperty('P3', [Real64(-inf), Real64(1.5), None],
+                        type='real64'),
+            CIMProperty('P4', CIMNumericArray('real32', [nan, inf, 2.0])),
+        ],
+        path=CIMInstanceName('CIM_Foo', {'K1': Real64(-inf), 'K2': inf}))
+
+    # The code to be tested
+    json_str = tojsonstr(inst)
+    fp = io.StringIO()
+    NDJSONWriter(fp).write(inst)
+
+    json_obj = json.loads(json_str, parse_constant=_reject_constant)
+    assert [jp['value'] for jp in json_obj['properties']] == \
+        ['NaN', 'INF', ['-INF', 1.5, None], ['NaN', 'INF', 2.0]]
+    assert [jk['value'] for jk in json_obj['path']['keybindings']] == \
+        ['-INF', 'INF']
+    assert fp.getvalue() == json_str + '\n'
+
+    result = fromjsonstr(json_str)
+
+    assert isinstance(result['P1'], Real32)
+    assert math.isnan(result['P1'])
+    assert result['P2'] == inf
+    assert isinstance(result['P2'], Real64)
+    assert result['P3'] == [-inf, 1.5, None]
+    assert math.isnan(result['P4'][0])
+    assert result['P4'][1:] == [inf, 2.0]
+    assert isinstance(result['P4'][1], Real32)
+    assert result.path == inst.path
+    assert isinstance(result.path['K1'], Real64)
+
+
+TESTCASES_JSON_INVALID = [
+
+    # Testcases for test_json_invalid()
+    #
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * json_obj: Invalid JSON representation.
+    # * exp_exc_types: Expected exception type(s), or None.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "Not a JSON object",
+        dict(json_obj=['CIMInstance']),
+        ValueError, None, True
+    ),
+    (
+        "Missing pywbem_object member",
+        dict(json_obj={'classname': 'CIM_Foo'}),
+        ValueError, None, True
+    ),
+    (
+        "Invalid pywbem_object member",
+        dict(json_obj={'pywbem_object': 'CIMFoo'}),
+        ValueError, None, True
+    ),
+    (
+        "Missing member",
+        dict(json_obj={'pywbem_object': 'CIMClassName',
+                       'classname': 'CIM_Foo'}),
+        ValueError, None, True
+    ),
+    (
+        "Invalid property value for its type",
+        dict(json_obj={
+            'pywbem_object': 'CIMProperty', 'name': 'P1', 'type': 'uint8',
+            'value': 256, 'reference_class': None, 'embedded_object': None,
+            'is_array': False, 'array_size': None, 'class_origin': None,
+            'propagated': None, 'qualifiers': []}),
+        ValueError, None, True
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_JSON_INVALID)
+@simplified_test_function
+def test_json_invalid(testcase, json_obj):
+    """
+    Test fromjson() with an invalid JSON representation.
+    """
+
+    # The code to be tested
+    fromjson(json_obj)
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
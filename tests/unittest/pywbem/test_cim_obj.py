@@ -6,6 +6,8 @@ Note that class `NocaseDict` is tested in test_nocasedict.py.
 
 import sys
 import re
+import copy
+import pickle
 from datetime import timedelta, datetime
 from unittest.mock import patch
 from collections import OrderedDict
@@ -23,11 +25,13 @@ from pywbem import CIMInstance, CIMInstanceName, CIMClass, CIMClassName, \
     CIMProperty, CIMMethod, CIMParameter, CIMQualifier, \
     CIMQualifierDeclaration, Uint8, Uint16, Uint32, Uint64, Sint8, Sint16, \
     Sint32, Sint64, Real32, Real64, Char16, CIMDateTime, \
-    MinutesFromUTC, __version__, MissingKeybindingsWarning  # noqa: E402
+    MinutesFromUTC, CIMNumericArray, CIMInstanceLayout, CIMQualifierCache, \
+    __version__, \
+    MissingKeybindingsWarning  # noqa: E402
 from pywbem._nocasedict import NocaseDict  # noqa: E402
 from pywbem._cim_obj import mofstr  # noqa: E402
 from pywbem._utils import _format  # noqa: E402
-from pywbem import cimvalue  # noqa: E402
+from pywbem import cimvalue, type_from_name  # noqa: E402
 # pylint: enable=wrong-import-position, wrong-import-order, invalid-name
 
 # Literal form {"blah: 0} faster than dict(blah=0) but same functionality
@@ -2197,6 +2201,182 @@ def test_CIMInstanceName_eq(testcase, obj1, obj2, exp_equal):
     assert equal == exp_equal
 
 
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    # The testcases of test_CIMInstanceName_eq() with two CIMInstanceName
+    # objects
+    [tc for tc in TESTCASES_CIMINSTANCENAME_HASH_EQ +
+     TESTCASES_CIMINSTANCENAME_EQ if tc[2] is None])
+@simplified_test_function
+@log_entry_exit
+def test_CIMInstanceName_frozen_hash_eq(testcase, obj1, obj2, exp_equal):
+    """
+    Test function for CIMInstanceName.__hash__() and __eq__() on frozen
+    objects, compared to the non-frozen objects.
+    """
+    # The testcase objects are shared, so copies are frozen.
+    frozen1 = obj1.copy()
+    frozen2 = obj2.copy()
+
+    # The code to be tested
+    assert frozen1.freeze() is frozen1
+    assert frozen2.freeze() is frozen2
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    assert frozen1.frozen
+    assert not obj1.frozen
+    assert hash(frozen1) == hash(obj1)
+    assert hash(frozen2) == hash(obj2)
+    assert frozen1 == obj1
+    assert obj1 == frozen1
+    assert (frozen1 == frozen2) == exp_equal
+    assert (frozen1 == obj2) == exp_equal
+    assert (obj2 == frozen1) == exp_equal
+    if exp_equal:
+        assert hash(frozen1) == hash(frozen2)
+
+
+TESTCASES_CIMINSTANCENAME_FREEZE = [
+
+    # Testcases for modifying a frozen CIMInstanceName
+
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * modify: Function modifying the frozen CIMInstanceName passed to it.
+    # * exp_exc_types: Expected exception type(s), or None.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "Set classname",
+        dict(modify=lambda obj: setattr(obj, 'classname', 'CIM_Bar')),
+        TypeError, None, True
+    ),
+    (
+        "Set namespace",
+        dict(modify=lambda obj: setattr(obj, 'namespace', 'root/x')),
+        TypeError, None, True
+    ),
+    (
+        "Set host",
+        dict(modify=lambda obj: setattr(obj, 'host', 'woot.com')),
+        TypeError, None, True
+    ),
+    (
+        "Set keybindings",
+        dict(modify=lambda obj: setattr(obj, 'keybindings', {'K1': 'x'})),
+        TypeError, None, True
+    ),
+    (
+        "Set existing keybinding via object",
+        dict(modify=lambda obj: obj.__setitem__('K1', 'x')),
+        TypeError, None, True
+    ),
+    (
+        "Add keybinding via keybindings",
+        dict(modify=lambda obj: obj.keybindings.__setitem__('K3', 'x')),
+        TypeError, None, True
+    ),
+    (
+        "Delete keybinding via object",
+        dict(modify=lambda obj: obj.__delitem__('K1')),
+        TypeError, None, True
+    ),
+    (
+        "Update keybindings via object",
+        dict(modify=lambda obj: obj.update(K1='x')),
+        TypeError, None, True
+    ),
+    (
+        "Pop keybinding",
+        dict(modify=lambda obj: obj.keybindings.pop('K1')),
+        TypeError, None, True
+    ),
+    (
+        "Pop last keybinding",
+        dict(modify=lambda obj: obj.keybindings.popitem()),
+        TypeError, None, True
+    ),
+    (
+        "Clear keybindings",
+        dict(modify=lambda obj: obj.keybindings.clear()),
+        TypeError, None, True
+    ),
+    (
+        "Setdefault for new keybinding",
+        dict(modify=lambda obj: obj.keybindings.setdefault('K3', 'x')),
+        TypeError, None, True
+    ),
+    (
+        "Setdefault for existing keybinding does not modify",
+        dict(modify=lambda obj: obj.keybindings.setdefault('K1', 'x')),
+        None, None, True
+    ),
+    (
+        "Set keybinding of referenced instance path",
+        dict(modify=lambda obj: obj['K2'].__setitem__('K', 'x')),
+        TypeError, None, True
+    ),
+    (
+        "Freeze again",
+        dict(modify=lambda obj: obj.freeze()),
+        None, None, True
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_CIMINSTANCENAME_FREEZE)
+@simplified_test_function
+@log_entry_exit
+def test_CIMInstanceName_freeze(testcase, modify):
+    """
+    Test function for modifying a frozen CIMInstanceName.
+    """
+    ref = CIMInstanceName('CIM_Bar', {'K': Uint32(1)})
+    obj = CIMInstanceName(
+        'CIM_Foo',
+        keybindings=[('K1', 'a'), ('K2', ref)],
+        namespace='root/cimv2', host='woot.com')
+    exp_obj = obj.copy()
+    obj.freeze()
+
+    # The referenced instance path is frozen as a copy
+    assert not ref.frozen
+    assert obj['K2'].frozen
+
+    # The code to be tested
+    modify(obj)
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    assert obj.frozen
+    assert obj == exp_obj
+    assert hash(obj) == hash(exp_obj)
+    assert repr(obj) == repr(exp_obj)
+
+    kbs_copy = obj.keybindings.copy()
+    kbs_copy['K1'] = 'b'
+    assert obj['K1'] == 'a'
+
+    obj_copy = obj.copy()
+    assert not obj_copy.frozen
+    assert not obj_copy['K2'].frozen
+    obj_copy['K1'] = 'b'
+    assert obj_copy['K1'] == 'b'
+    obj_copy['K2']['K'] = Uint32(2)
+    assert obj['K2']['K'] == Uint32(1)
+
+    assert pickle.loads(pickle.dumps(obj)).frozen
+
+
 TESTCASES_CIMINSTANCENAME_REPR = [
 
     # Testcases for CIMInstanceName.__repr__() / repr()
@@ -9299,6 +9479,260 @@ def test_CIMInstance_from_class(testcase, cls_props, inst_prop_vals, kwargs,
     assert exp_inst == act_inst
 
 
+TESTCASES_CIMINSTANCELAYOUT_NEW_INSTANCE = [
+
+    # Testcases for CIMInstanceLayout() and CIMInstanceLayout.new_instance()
+
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * props: List of CIMProperty objects for the layout.
+    #   * values: List of property values for new_instance().
+    #   * exp_props: List of CIMProperty objects of the expected instance.
+    # * exp_exc_types: Expected exception type(s), or None.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "Layout without properties",
+        dict(
+            props=[],
+            values=[],
+            exp_props=[],
+        ),
+        None, None, True
+    ),
+    (
+        "Layout with properties of different types, values are converted",
+        dict(
+            props=[
+                CIMProperty('P1', Uint32(7), class_origin='CIM_Foo',
+                            propagated=False),
+                CIMProperty('P2', None, type='string', is_array=True),
+                CIMProperty('P3', None, type='reference',
+                            reference_class='CIM_Bar'),
+            ],
+            values=[42, ['a', 'b'], CIMInstanceName('CIM_Bar')],
+            exp_props=[
+                CIMProperty('P1', Uint32(42), class_origin='CIM_Foo',
+                            propagated=False),
+                CIMProperty('P2', ['a', 'b'], type='string'),
+                CIMProperty('P3', CIMInstanceName('CIM_Bar'),
+                            reference_class='CIM_Bar'),
+            ],
+        ),
+        None, None, True
+    ),
+    (
+        "Layout with NULL values",
+        dict(
+            props=[
+                CIMProperty('P1', None, type='uint32'),
+                CIMProperty('P2', None, type='string', is_array=True),
+            ],
+            values=[None, None],
+            exp_props=[
+                CIMProperty('P1', None, type='uint32'),
+                CIMProperty('P2', None, type='string', is_array=True),
+            ],
+        ),
+        None, None, True
+    ),
+    (
+        "Layout with property qualifiers",
+        dict(
+            props=[
+                CIMProperty('P1', None, type='uint32',
+                            qualifiers=[CIMQualifier('Key', True)]),
+            ],
+            values=[Uint32(1)],
+            exp_props=[
+                CIMProperty('P1', Uint32(1),
+                            qualifiers=[CIMQualifier('Key', True)]),
+            ],
+        ),
+        None, None, True
+    ),
+    (
+        "Layout with duplicate property names",
+        dict(
+            props=[
+                CIMProperty('P1', None, type='uint32'),
+                CIMProperty('p1', None, type='uint32'),
+            ],
+            values=[None, None],
+            exp_props=None,
+        ),
+        ValueError, None, True
+    ),
+    (
+        "Layout with property that is not a CIMProperty",
+        dict(
+            props=[Uint32(1)],
+            values=[None],
+            exp_props=None,
+        ),
+        TypeError, None, True
+    ),
+    (
+        "Too few values",
+        dict(
+            props=[
+                CIMProperty('P1', None, type='uint32'),
+                CIMProperty('P2', None, type='uint32'),
+            ],
+            values=[Uint32(1)],
+            exp_props=None,
+        ),
+        ValueError, None, True
+    ),
+    (
+        "Value that cannot be converted to the property type",
+        dict(
+            props=[
+                CIMProperty('P1', None, type='datetime'),
+            ],
+            values=[42],
+            exp_props=None,
+        ),
+        TypeError, None, True
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_CIMINSTANCELAYOUT_NEW_INSTANCE)
+@simplified_test_function
+@log_entry_exit
+def test_CIMInstanceLayout_new_instance(testcase, props, values, exp_props):
+    """
+    Test CIMInstanceLayout() and CIMInstanceLayout.new_instance().
+    """
+    path = CIMInstanceName('CIM_Foo', namespace='root/cimv2')
+
+    # The code to be tested
+    layout = CIMInstanceLayout('CIM_Foo', props)
+    act_inst = layout.new_instance(values, path=path)
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    assert layout.classname == 'CIM_Foo'
+    assert len(layout) == len(props)
+    assert layout.names == tuple(p.name for p in props)
+    for prop in layout.properties:
+        assert prop.value is None
+
+    exp_inst = CIMInstance('CIM_Foo', properties=exp_props, path=path)
+    assert act_inst == exp_inst
+    assert exp_inst == act_inst
+    assert act_inst.path is not path
+
+    # The properties of the instance are created when accessed
+    assert act_inst.properties == exp_inst.properties
+    assert act_inst == exp_inst
+
+
+def test_CIMInstanceLayout_instance():
+    """
+    Test that a CIMInstance object that uses a CIMInstanceLayout behaves like
+    a CIMInstance object with properties, and that its CIMProperty objects
+    are created only when needed.
+    """
+    # pylint: disable=protected-access
+    cim_class = CIMClass(
+        'CIM_Foo',
+        properties=[
+            CIMProperty('P1', None, type='uint32', class_origin='CIM_Foo',
+                        propagated=False),
+            CIMProperty('P2', None, type='string', is_array=True,
+                        class_origin='CIM_Foo', propagated=False),
+        ])
+    layout = CIMInstanceLayout.from_class(cim_class)
+    path = CIMInstanceName('CIM_Foo', keybindings={'P1': Uint32(42)})
+    inst = layout.new_instance([Uint32(42), ['a']], path=path)
+    exp_inst = CIMInstance(
+        'CIM_Foo', path=path,
+        properties=[
+            CIMProperty('P1', Uint32(42), class_origin='CIM_Foo',
+                        propagated=False),
+            CIMProperty('P2', ['a'], type='string', class_origin='CIM_Foo',
+                        propagated=False),
+        ])
+    layout_values = inst._properties
+
+    assert inst['p1'] == 42
+    assert inst[b'P1'] == 42
+    assert inst.get('P2') == ['a']
+    assert inst.get(b'p2') == ['a']
+    assert inst.get('P3', 'dflt') == 'dflt'
+    assert 'P1' in inst
+    assert b'P1' in inst
+    assert 'P3' not in inst
+    assert b'P3' not in inst
+    assert len(inst) == 2
+    assert list(inst) == ['P1', 'P2']
+    with pytest.raises(KeyError):
+        _ = inst['P3']
+    with pytest.raises(ValueError):
+        _ = None in inst
+    assert inst.tomof() == exp_inst.tomof()
+    assert inst.tocimxmlstr() == exp_inst.tocimxmlstr()
+    assert inst.tocimxml().toxml() == exp_inst.tocimxml().toxml()
+    assert repr(inst) == repr(exp_inst)
+    assert hash(inst) == hash(exp_inst)
+    assert inst == exp_inst
+
+    inst_copy = inst.copy()
+    assert inst_copy._properties.layout is layout
+    assert inst_copy._properties.values is not layout_values.values
+    assert inst_copy == inst
+    assert inst_copy.path == inst.path
+    assert inst_copy.path is not inst.path
+    assert inst_copy != layout.new_instance([Uint32(43), ['a']], path=path)
+
+    assert pickle.loads(pickle.dumps(inst)) == inst
+    assert inst._properties is layout_values
+
+    # Accessing the properties creates the CIMProperty objects, after which
+    # the instance no longer uses the layout
+    props = inst.properties
+    assert isinstance(props, NocaseDict)
+    assert inst._properties is props
+    assert inst.properties['P1'] is props['P1']
+    assert props == exp_inst.properties
+    assert layout.properties[0].value is None
+
+    # Modifying properties creates the CIMProperty objects
+    inst_copy['P2'] = ['b']
+    assert isinstance(inst_copy._properties, NocaseDict)
+    assert inst_copy['P2'] == ['b']
+    assert inst['P2'] == ['a']
+
+
+def test_CIMInstanceLayout_from_instance():
+    """
+    Test CIMInstanceLayout.from_instance().
+    """
+    inst = CIMInstance(
+        'CIM_Foo',
+        properties=[
+            CIMProperty('P1', Uint32(42)),
+            CIMProperty('P2', 'abc'),
+        ])
+
+    # The code to be tested
+    layout = CIMInstanceLayout.from_instance(inst)
+
+    assert layout.classname == 'CIM_Foo'
+    assert layout.names == ('P1', 'P2')
+    assert [p.type for p in layout.properties] == ['uint32', 'string']
+    assert layout.new_instance(inst.values()) == inst
+    assert repr(layout).startswith("CIMInstanceLayout(classname='CIM_Foo', ")
+
+
 TESTCASES_CIMPROPERTY_INIT = [
 
     # Testcases for CIMProperty.__init__()
@@ -37086,6 +37520,279 @@ def test_CIMParameter_tomof(testcase, obj, kwargs, exp_mof):
     assert mof == exp_mof
 
 
+class CIMQualifierSubclass(CIMQualifier):
+    """Subclass of CIMQualifier, for testing CIMQualifierCache"""
+    __slots__ = []
+
+
+TESTCASES_CIMQUALIFIERCACHE_SHARE = [
+
+    # Testcases for CIMQualifierCache.share()
+
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * qual1: CIMQualifier object that is shared first.
+    #   * qual2: CIMQualifier object that is shared second.
+    #   * exp_shared: Boolean indicating that qual2 is expected to be replaced
+    #     by qual1.
+    # * exp_exc_types: Expected exception type(s), or None.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "Equal string qualifiers",
+        dict(
+            qual1=CIMQualifier('Description', 'abc'),
+            qual2=CIMQualifier('Description', 'abc'),
+            exp_shared=True,
+        ),
+        None, None, True
+    ),
+    (
+        "Equal boolean qualifiers with flavors",
+        dict(
+            qual1=CIMQualifier('Key', True, overridable=False,
+                               tosubclass=True),
+            qual2=CIMQualifier('Key', True, overridable=False,
+                               tosubclass=True),
+            exp_shared=True,
+        ),
+        None, None, True
+    ),
+    (
+        "Equal array qualifiers",
+        dict(
+            qual1=CIMQualifier('ValueMap', ['1', '2']),
+            qual2=CIMQualifier('ValueMap', ['1', '2']),
+            exp_shared=True,
+        ),
+        None, None, True
+    ),
+    (
+        "Equal numeric array qualifiers",
+        dict(
+            qual1=CIMQualifier('Q1', CIMNumericArray('uint8', [1, 2])),
+            qual2=CIMQualifier('Q1', CIMNumericArray('uint8', [1, 2])),
+            exp_shared=True,
+        ),
+        None, None, True
+    ),
+    (
+        "Qualifiers with different values",
+        dict(
+            qual1=CIMQualifier('Description', 'abc'),
+            qual2=CIMQualifier('Description', 'abd'),
+            exp_shared=False,
+        ),
+        None, None, True
+    ),
+    (
+        "Qualifiers with different array values",
+        dict(
+            qual1=CIMQualifier('ValueMap', ['1', '2']),
+            qual2=CIMQualifier('ValueMap', ['1', '3']),
+            exp_shared=False,
+        ),
+        None, None, True
+    ),
+    (
+        "Qualifiers with different types",
+        dict(
+            qual1=CIMQualifier('Q1', Uint8(1)),
+            qual2=CIMQualifier('Q1', Uint16(1)),
+            exp_shared=False,
+        ),
+        None, None, True
+    ),
+    (
+        "Qualifiers with different flavors",
+        dict(
+            qual1=CIMQualifier('Key', True, overridable=False),
+            qual2=CIMQualifier('Key', True, overridable=True),
+            exp_shared=False,
+        ),
+        None, None, True
+    ),
+    (
+        "Qualifiers with different propagated",
+        dict(
+            qual1=CIMQualifier('Key', True, propagated=False),
+            qual2=CIMQualifier('Key', True, propagated=True),
+            exp_shared=False,
+        ),
+        None, None, True
+    ),
+    (
+        "Qualifiers with names in different lexical case",
+        dict(
+            qual1=CIMQualifier('Key', True),
+            qual2=CIMQualifier('KEY', True),
+            exp_shared=False,
+        ),
+        None, None, True
+    ),
+    (
+        "Qualifier of a subclass of CIMQualifier is not shared",
+        dict(
+            qual1=CIMQualifier('Key', True),
+            qual2=CIMQualifierSubclass('Key', True),
+            exp_shared=False,
+        ),
+        None, None, True
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_CIMQUALIFIERCACHE_SHARE)
+@simplified_test_function
+def test_CIMQualifierCache_share(testcase, qual1, qual2, exp_shared):
+    """
+    Test function for CIMQualifierCache.share().
+    """
+    qual1 = qual1.copy()
+    qual2_class = qual2.__class__
+    cache = CIMQualifierCache()
+    shared1 = cache.share(qual1)
+
+    # The code to be tested
+    shared2 = cache.share(qual2)
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    assert shared1 is qual1
+    assert shared2 == qual2
+    if exp_shared:
+        assert shared2 is qual1
+        assert len(cache) == 1
+        assert cache.shared_count == 1
+        assert cache.saved_bytes > 0
+    else:
+        assert shared2 is qual2
+        assert cache.shared_count == 0
+        assert cache.saved_bytes == 0
+
+    # The qualifiers that became shared cannot be modified
+    with pytest.raises(TypeError):
+        shared1.value = None
+    if qual2_class is not CIMQualifier:
+        shared2.value = None
+    assert repr(shared1).startswith("CIMQualifier(")
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.shared_count == 0
+    assert cache.saved_bytes == 0
+
+
+def test_CIMQualifierCache_shared_qualifier():
+    """
+    Test the copies of shared qualifiers.
+    """
+    cache = CIMQualifierCache()
+    qual = cache.share(CIMQualifier('ValueMap', ['1', '2'], tosubclass=True))
+
+    for attr in ('name', 'type', 'value', 'propagated', 'overridable',
+                 'tosubclass', 'toinstance', 'translatable'):
+        with pytest.raises(TypeError):
+            setattr(qual, attr, getattr(qual, attr))
+
+    # The copy() method returns a modifiable copy
+    qual_copy = qual.copy()
+    assert qual_copy == qual
+    assert hash(qual_copy) == hash(qual)
+    qual_copy.value = ['3']
+    assert qual.value == ['1', '2']
+
+    # Copies with the copy module and by pickling remain shared qualifiers
+    for qual2 in (copy.copy(qual), copy.deepcopy(qual),
+                  pickle.loads(pickle.dumps(qual))):
+        assert qual2 == qual
+        with pytest.raises(TypeError):
+            qual2.value = ['3']
+
+
+def test_CIMQualifierCache_share_qualifiers():
+    """
+    Test CIMQualifierCache.share_qualifiers() and CIMClass.copy() with a
+    qualifier cache.
+    """
+    def make_class(classname):
+        "Return a new CIM class with equal qualifiers"
+        return CIMClass(
+            classname,
+            qualifiers=[CIMQualifier('Description', 'abc')],
+            properties=[
+                CIMProperty('P1', None, type='string',
+                            qualifiers=[CIMQualifier('Key', True)]),
+            ],
+            methods=[
+                CIMMethod('M1', return_type='uint32',
+                          qualifiers=[CIMQualifier('Description', 'abc')],
+                          parameters=[
+                              CIMParameter(
+                                  'Parm1', type='string',
+                                  qualifiers=[CIMQualifier('In', True)]),
+                          ]),
+            ])
+
+    cache = CIMQualifierCache()
+    cls1 = make_class('CIM_Foo')
+    cls2 = make_class('CIM_Bar')
+
+    # The code to be tested
+    cache.share_qualifiers(cls1)
+    cache.share_qualifiers(cls2)
+
+    assert cls1 == make_class('CIM_Foo')
+    assert cls2 == make_class('CIM_Bar')
+    desc = cls1.qualifiers['Description']
+    assert cls1.methods['M1'].qualifiers['Description'] is desc
+    assert cls2.qualifiers['Description'] is desc
+    assert cls2.properties['P1'].qualifiers['Key'] is \
+        cls1.properties['P1'].qualifiers['Key']
+    assert cls2.methods['M1'].parameters['Parm1'].qualifiers['In'] is \
+        cls1.methods['M1'].parameters['Parm1'].qualifiers['In']
+    assert len(cache) == 3
+    assert cache.shared_count == 5
+    assert repr(cache) == \
+        f"CIMQualifierCache(qualifiers=3, shared_count=5, " \
+        f"saved_bytes={cache.saved_bytes})"
+
+    # CIMClass.copy() with a qualifier cache does not change the original
+    cls3 = make_class('CIM_Baz')
+    cls3_copy = cls3.copy(qualifier_cache=cache)
+    assert cls3_copy == cls3
+    assert cls3_copy.qualifiers['Description'] is desc
+    assert cls3.qualifiers['Description'] is not desc
+    cls3.qualifiers['Description'].value = 'def'
+    cls3.properties['P1'].qualifiers['Key'].value = False
+    assert cls3_copy.properties['P1'].qualifiers['Key'].value is True
+
+    # Qualifiers of a CIM class that become shared are not changed
+    cache2 = CIMQualifierCache()
+    cls4 = make_class('CIM_Foo')
+    cls4_copy = cls4.copy(qualifier_cache=cache2)
+    assert cls4_copy == cls4
+    cls4.qualifiers['Description'].value = 'def'
+    assert cls4_copy.qualifiers['Description'].value == 'abc'
+
+    inst = CIMInstance(
+        'CIM_Foo',
+        properties=[CIMProperty('P1', 'abc',
+                                qualifiers=[CIMQualifier('Key', True)])])
+    cache.share_qualifiers(inst)
+    assert inst.properties['P1'].qualifiers['Key'] is \
+        cls1.properties['P1'].qualifiers['Key']
+
+    with pytest.raises(TypeError):
+        cache.share_qualifiers(CIMQualifier('Key', True))
+
+
 TESTCASES_CIMQUALIFIERDECLARATION_INIT = [
 
     # Testcases for CIMQualifierDeclaration.__init__()
@@ -43466,6 +44173,154 @@ def test_CIMQualifierDeclaration_tocimxmlstr_indent_str(
         "returns unexpected CIM-XML string")
 
 
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_CIMINSTANCENAME_TOCIMXML +
+    TESTCASES_CIMINSTANCE_TOCIMXML +
+    TESTCASES_CIMPROPERTY_TOCIMXML +
+    TESTCASES_CIMQUALIFIER_TOCIMXML +
+    TESTCASES_CIMCLASSNAME_TOCIMXML +
+    TESTCASES_CIMCLASS_TOCIMXML +
+    TESTCASES_CIMMETHOD_TOCIMXML +
+    TESTCASES_CIMPARAMETER_TOCIMXML +
+    TESTCASES_CIMQUALIFIERDECLARATION_TOCIMXML)
+@simplified_test_function
+@log_entry_exit
+def test_tocimxmlstr_toxml(testcase, obj, kwargs, exp_xml_str):
+    # pylint: disable=unused-argument
+    """
+    Test that the single-line CIM-XML string returned by the tocimxmlstr()
+    methods of the CIM objects, which is written directly, is exactly the
+    string produced from the Element objects returned by tocimxml().
+    """
+
+    # The code to be tested
+    obj_xml_str = obj.tocimxmlstr(**kwargs)
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    exp_xml_str = obj.tocimxml(**kwargs).toxml()
+
+    assert obj_xml_str == exp_xml_str, (
+        f"{obj.__class__.__name__}.tocimxmlstr() returns a CIM-XML string "
+        "that differs from tocimxml().toxml()")
+
+
+TESTCASES_NUMERIC_ARRAY_VALUE = [
+
+    # Testcases for test_numeric_array_value()
+
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * obj_func: Function creating the CIM object from a value.
+    #   * cimtype: CIM type of the array value.
+    #   * values: List of array values.
+    # * exp_exc_types: Expected exception type(s), or None.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "CIMProperty with uint64 array",
+        dict(
+            obj_func=lambda v: CIMProperty('P1', v),
+            cimtype='uint64',
+            values=[0, 42, 2**64 - 1],
+        ),
+        None, None, True
+    ),
+    (
+        "CIMProperty with empty sint8 array and qualifier",
+        dict(
+            obj_func=lambda v: CIMProperty(
+                'P1', v, type='sint8',
+                qualifiers=[CIMQualifier('Q1', 'a')]),
+            cimtype='sint8',
+            values=[],
+        ),
+        None, None, True
+    ),
+    (
+        "CIMProperty with real32 array",
+        dict(
+            obj_func=lambda v: CIMProperty('P1', v, type='real32'),
+            cimtype='real32',
+            values=[0.1, -1.5E-10, float('inf')],
+        ),
+        None, None, True
+    ),
+    (
+        "CIMParameter with uint16 array",
+        dict(
+            obj_func=lambda v: CIMParameter('Parm1', 'uint16', value=v),
+            cimtype='uint16',
+            values=[1, 2],
+        ),
+        None, None, True
+    ),
+    (
+        "CIMQualifier with real64 array",
+        dict(
+            obj_func=lambda v: CIMQualifier('Q1', v),
+            cimtype='real64',
+            values=[1.0, 2.5],
+        ),
+        None, None, True
+    ),
+    (
+        "CIMQualifierDeclaration with sint32 array",
+        dict(
+            obj_func=lambda v: CIMQualifierDeclaration(
+                'Q1', 'sint32', value=v, is_array=True),
+            cimtype='sint32',
+            values=[-1, 1],
+        ),
+        None, None, True
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_NUMERIC_ARRAY_VALUE)
+@simplified_test_function
+@log_entry_exit
+def test_numeric_array_value(testcase, obj_func, cimtype, values):
+    """
+    Test that a CIM object with a CIMNumericArray value behaves like the CIM
+    object with the same values in a list.
+    """
+
+    type_obj = type_from_name(cimtype)
+    list_obj = obj_func([type_obj(v) for v in values])
+
+    # The code to be tested
+    obj = obj_func(CIMNumericArray(cimtype, values))
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    assert isinstance(obj.value, CIMNumericArray)
+    assert obj.type == cimtype
+    if not isinstance(obj, CIMQualifier):
+        assert obj.is_array is True
+    assert obj == list_obj
+    assert hash(obj) == hash(list_obj)
+    assert obj.tocimxml().toxml() == list_obj.tocimxml().toxml()
+    assert obj.tocimxmlstr() == list_obj.tocimxmlstr()
+    if not isinstance(obj, CIMParameter):
+        assert obj.tomof() == list_obj.tomof()
+
+    cpy = obj.copy()
+    assert isinstance(cpy.value, CIMNumericArray)
+    assert cpy == obj
+    cpy.value.append(1)
+    assert obj.value == values
+
+
 TESTCASES_CIMQUALIFIERDECLARATION_TOMOF = [
 
     # Testcases for CIMQualifierDeclaration.tomof()
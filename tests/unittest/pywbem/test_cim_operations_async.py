@@ -0,0 +1,948 @@
+"""
+Unittest functions in _cim_operations_async and _cim_http_async.
+
+The tests run the AsyncWBEMConnection against a minimal WBEM server that is
+implemented using asyncio streams and returns canned CIM-XML responses.
+"""
+
+import asyncio
+import gzip
+import re
+
+import pytest
+
+# pylint: disable=wrong-import-position, wrong-import-order, invalid-name
+from ...utils import import_installed
+pywbem = import_installed('pywbem')
+from pywbem import AsyncWBEMConnection, CIMError, CIMInstanceName, \
+    CIMInstance, CIMProperty, HTTPError, AuthError, CIMXMLParseError, \
+    XMLParseError, IterQueryInstancesReturn, CIM_ERR_NOT_SUPPORTED, \
+    CIM_ERR_NOT_FOUND, CIM_ERR_FAILED, DEFAULT_NAMESPACE, Uint32  # noqa: E402
+# pylint: disable=redefined-builtin
+from pywbem import ConnectionError, TimeoutError  # noqa: E402
+# pylint: enable=redefined-builtin
+from pywbem import _cim_http_async  # noqa: E402
+from pywbem._cim_http_async import split_hostport  # noqa: E402
+# pylint: enable=wrong-import-position, wrong-import-order, invalid-name
+
+# Literal form {"blah: 0} faster than dict(blah=0) but same functionality
+# pylint: disable=use-dict-literal
+
+
+def cim_response(method, content):
+    """Return a CIM-XML intrinsic method response as bytes."""
+    return (
+        '<?xml version="1.0" encoding="utf-8" ?>'
+        '<CIM CIMVERSION="2.0" DTDVERSION="2.0">'
+        '<MESSAGE ID="1000" PROTOCOLVERSION="1.0"><SIMPLERSP>'
+        f'<IMETHODRESPONSE NAME="{method}">{content}</IMETHODRESPONSE>'
+        '</SIMPLERSP></MESSAGE></CIM>').encode('utf-8')
+
+
+def instancename_xml(key):
+    """Return an INSTANCENAME element for CIM_Foo with the key value."""
+    return (
+        '<INSTANCENAME CLASSNAME="CIM_Foo"><KEYBINDING NAME="Id">'
+        f'<KEYVALUE VALUETYPE="string">{key}</KEYVALUE>'
+        '</KEYBINDING></INSTANCENAME>')
+
+
+def instance_xml(key):
+    """Return an INSTANCE element for CIM_Foo with the key value."""
+    return (
+        '<INSTANCE CLASSNAME="CIM_Foo"><PROPERTY NAME="Id" TYPE="string">'
+        f'<VALUE>{key}</VALUE></PROPERTY></INSTANCE>')
+
+
+def instancewithpath_xml(key):
+    """Return a VALUE.INSTANCEWITHPATH element for CIM_Foo."""
+    return (
+        '<VALUE.INSTANCEWITHPATH><INSTANCEPATH><NAMESPACEPATH>'
+        '<HOST>woot.com</HOST><LOCALNAMESPACEPATH>'
+        '<NAMESPACE NAME="root"/><NAMESPACE NAME="cimv2"/>'
+        '</LOCALNAMESPACEPATH></NAMESPACEPATH>'
+        f'{instancename_xml(key)}</INSTANCEPATH>{instance_xml(key)}'
+        '</VALUE.INSTANCEWITHPATH>')
+
+
+def pull_response(method, keys, context):
+    """Return a pull operation response with instances for the keys."""
+    eos = 'TRUE' if context is None else 'FALSE'
+    return cim_response(
+        method,
+        '<IRETURNVALUE>' +
+        ''.join(instancewithpath_xml(k) for k in keys) +
+        '</IRETURNVALUE>'
+        f'<PARAMVALUE NAME="EndOfSequence"><VALUE>{eos}</VALUE></PARAMVALUE>'
+        '<PARAMVALUE NAME="EnumerationContext">'
+        f'<VALUE>{context or ""}</VALUE></PARAMVALUE>')
+
+
+def error_response(method, code):
+    """Return a CIM-XML response with an ERROR element."""
+    return cim_response(
+        method, f'<ERROR CODE="{code}" DESCRIPTION="Failed"/>')
+
+
+class Response:
+    # pylint: disable=too-few-public-methods
+    """HTTP response to be returned by the FakeServer."""
+
+    def __init__(self, body, status=200, headers=None, chunked=False,
+                 close=False, delay=0, drop=False, eof_delimited=False):
+        self.body = body
+        self.status = status
+        self.headers = headers or {}
+        self.chunked = chunked
+        self.close = close or eof_delimited
+        self.delay = delay
+        self.drop = drop  # Close the connection without a response
+        self.eof_delimited = eof_delimited  # No Content-Length header
+
+
+class FakeServer:
+    """
+    A minimal HTTP/1.1 WBEM server running on the event loop, that returns
+    the responses produced by a responder function.
+
+    The responder function is called with the CIMMethod header value and the
+    request body, and returns a Response object.
+    """
+
+    def __init__(self, responder):
+        self.responder = responder
+        self.requests = []  # list of tuple(headers, body)
+        self.connections = 0
+        self.active = 0
+        self.max_active = 0
+        self._server = None
+
+    async def start(self):
+        """Start the server on a free port and return its URL."""
+        self._server = await asyncio.start_server(
+            self._handle, '127.0.0.1', 0)
+        port = self._server.sockets[0].getsockname()[1]
+        return f'http://127.0.0.1:{port}'
+
+    async def stop(self):
+        """Stop the server."""
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(
+                    int(headers.get('content-length', 0)))
+                self.requests.append((headers, body))
+
+                self.active += 1
+                self.max_active = max(self.max_active, self.active)
+                try:
+                    resp = self.responder(headers.get('cimmethod'), body)
+                    if resp.delay:
+                        await asyncio.sleep(resp.delay)
+                finally:
+                    self.active -= 1
+
+                if resp.drop:
+                    break
+                head = [f'HTTP/1.1 {resp.status} Status',
+                        'Content-Type: application/xml; charset="utf-8"',
+                        'CIMOperation: MethodResponse']
+                head.extend(f'{n}: {v}' for n, v in resp.headers.items())
+                if resp.close:
+                    head.append('Connection: close')
+                if resp.chunked:
+                    head.append('Transfer-Encoding: chunked')
+                    half = len(resp.body) // 2
+                    data = b''.join(
+                        b'%x\r\n%s\r\n' % (len(c), c)
+                        for c in (resp.body[:half], resp.body[half:])) + \
+                        b'0\r\n\r\n'
+                elif resp.eof_delimited:
+                    data = resp.body
+                else:
+                    head.append(f'Content-Length: {len(resp.body)}')
+                    data = resp.body
+                writer.write(
+                    ('\r\n'.join(head) + '\r\n\r\n').encode('ascii') + data)
+                await writer.drain()
+                if resp.close:
+                    break
+        except (ConnectionResetError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+def run_with_server(responder, test_coro, **conn_kwargs):
+    """
+    Run the test coroutine function with an AsyncWBEMConnection to a
+    FakeServer using the responder, and return the server object.
+    """
+
+    async def main():
+        server = FakeServer(responder)
+        url = await server.start()
+        try:
+            async with AsyncWBEMConnection(url, ('user', 'pw'),
+                                           **conn_kwargs) as conn:
+                await test_coro(conn)
+        finally:
+            await server.stop()
+        return server
+
+    return asyncio.run(main())
+
+
+def method_of(body):
+    """Return the intrinsic method name of a CIM-XML request body."""
+    m = re.search(rb'<IMETHODCALL NAME="([A-Za-z]+)"', body)
+    return m.group(1).decode('ascii') if m else None
+
+
+def test_init_defaults():
+    """Test AsyncWBEMConnection init with default parameters."""
+    conn = AsyncWBEMConnection('myserver')
+    assert conn.url == 'http://myserver:5988'
+    assert conn.scheme == 'http'
+    assert conn.host == 'myserver:5988'
+    assert conn.creds is None
+    assert conn.default_namespace == DEFAULT_NAMESPACE
+    assert conn.use_pull_operations is False
+    assert conn.stats_enabled is False
+    assert conn.max_connections == 10
+    assert conn.direct_decode is False
+    assert conn.response_validation == 'strict'
+    assert conn.lazy_instances is False
+    assert conn.compact_arrays is False
+    assert conn.instance_layouts is False
+    assert conn.shared_qualifiers is False
+    assert conn.compression is True
+    assert conn.request_compression_threshold is None
+    assert conn.conn_id.startswith('a')
+    assert 'AsyncWBEMConnection(' in repr(conn)
+
+
+@pytest.mark.parametrize(
+    "kwargs, exp_exc",
+    [
+        ({'max_connections': 0}, ValueError),
+        ({'max_connections': 'a'}, ValueError),
+        ({'x509': 'cert.pem'}, TypeError),
+        ({'x509': {'key_file': 'key.pem'}}, ValueError),
+        ({'ca_certs': 42}, TypeError),
+        ({'response_validation': 'none'}, ValueError),
+    ]
+)
+def test_init_invalid(kwargs, exp_exc):
+    """Test AsyncWBEMConnection init with invalid parameters."""
+    with pytest.raises(exp_exc):
+        AsyncWBEMConnection('http://myserver', **kwargs)
+
+
+@pytest.mark.parametrize(
+    "hostport, exp_result",
+    [
+        ('myserver:5988', ('myserver', 5988)),
+        ('10.11.12.13:5989', ('10.11.12.13', 5989)),
+        ('[fe80::1]:5989', ('fe80::1', 5989)),
+        ('[fe80::1-eth0]:5989', ('fe80::1%eth0', 5989)),
+    ]
+)
+def test_split_hostport(hostport, exp_result):
+    """Test split_hostport()."""
+    assert split_hostport(hostport) == exp_result
+
+
+def test_enumerate_instance_names():
+    """Test EnumerateInstanceNames, and reuse of the HTTP connection."""
+
+    def responder(method, body):
+        # pylint: disable=unused-argument
+        return Response(cim_response(
+            method, '<IRETURNVALUE>' + instancename_xml('1') +
+            instancename_xml('2') + '</IRETURNVALUE>'))
+
+    async def test(conn):
+        for _ in range(3):
+            paths = await conn.EnumerateInstanceNames('CIM_Foo')
+            assert [p['Id'] for p in paths] == ['1', '2']
+            for path in paths:
+                assert isinstance(path, CIMInstanceName)
+                assert path.namespace == 'root/cimv2'
+
+    server = run_with_server(responder, test)
+
+    assert server.connections == 1
+    headers, body = server.requests[0]
+    assert headers['cimmethod'] == 'EnumerateInstanceNames'
+    assert headers['cimobject'] == 'root/cimv2'
+    assert headers['authorization'].startswith('Basic ')
+    assert b'<CLASSNAME NAME="CIM_Foo"/>' in body
+
+
+@pytest.mark.parametrize("chunked", [False, True])
+@pytest.mark.parametrize("close", [False, True])
+def test_get_instance(chunked, close):
+    """Test GetInstance, with chunked and non-persistent responses."""
+
+    def responder(method, body):
+        # pylint: disable=unused-argument
+        return Response(
+            cim_response(
+                method, '<IRETURNVALUE>' + instance_xml('1') +
+                '</IRETURNVALUE>'),
+            chunked=chunked, close=close)
+
+    async def test(conn):
+        for _ in range(2):
+            path = CIMInstanceName('CIM_Foo', {'Id': '1'})
+            inst = await conn.GetInstance(path)
+            assert isinstance(inst, CIMInstance)
+            assert inst['Id'] == '1'
+            assert inst.path == CIMInstanceName(
+                'CIM_Foo', {'Id': '1'}, namespace='root/cimv2')
+
+    server = run_with_server(responder, test)
+
+    assert server.connections == (2 if close else 1)
+
+
+def instance2_xml(key):
+    """Return an INSTANCE element for CIM_Foo with two properties."""
+    return (
+        '<INSTANCE CLASSNAME="CIM_Foo"><PROPERTY NAME="Id" TYPE="string">'
+        f'<VALUE>{key}</VALUE></PROPERTY>'
+        '<PROPERTY.ARRAY NAME="Counts" TYPE="uint32"><VALUE.ARRAY>'
+        '<VALUE>1</VALUE><VALUE>2</VALUE></VALUE.ARRAY></PROPERTY.ARRAY>'
+        '</INSTANCE>')
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        dict(),
+        dict(direct_decode=True),
+        dict(lazy_instances=True),
+        dict(direct_decode=True, lazy_instances=True),
+        dict(response_validation='fast'),
+        dict(compact_arrays=True, instance_layouts=True,
+             shared_qualifiers=True),
+    ]
+)
+def test_parse_modes(kwargs):
+    """
+    Test that the parsing modes of the connection are used and return the
+    same instances as the default mode.
+    """
+
+    def responder(method, body):
+        # pylint: disable=unused-argument
+        return Response(cim_response(
+            method, '<IRETURNVALUE><VALUE.NAMEDINSTANCE>' +
+            instancename_xml('1') + instance2_xml('1') +
+            '</VALUE.NAMEDINSTANCE></IRETURNVALUE>'))
+
+    async def test(conn):
+        insts = await conn.EnumerateInstances('CIM_Foo')
+        assert len(insts) == 1
+        inst = insts[0]
+        assert inst.path == CIMInstanceName(
+            'CIM_Foo', {'Id': '1'}, namespace='root/cimv2')
+        assert inst['Id'] == '1'
+        assert list(inst['Counts']) == [1, 2]
+        assert inst == CIMInstance(
+            'CIM_Foo', path=inst.path,
+            properties=[
+                CIMProperty('Id', '1', propagated=False),
+                CIMProperty('Counts', [Uint32(1), Uint32(2)],
+                            propagated=False)])
+
+    run_with_server(responder, test, **kwargs)
+
+
+@pytest.mark.parametrize("direct_decode", [False, True])
+def test_enforce_property_list(direct_decode):
+    """
+    Test enforce_property_list for GetInstance and for the pull operations
+    of IterEnumerateInstances.
+    """
+
+    def responder(method, body):
+        if method == 'GetInstance':
+            return Response(cim_response(
+                method,
+                '<IRETURNVALUE>' + instance2_xml('1') + '</IRETURNVALUE>'))
+        if method == 'CloseEnumeration':
+            return Response(cim_response(method, ''))
+        context = 'ctx1' if method.startswith('Open') else None
+        key = 'p' if context is None else 'o'
+        assert method != 'PullInstancesWithPath' or b'ctx1' in body
+        inst = instancewithpath_xml(key).replace(
+            instance_xml(key), instance2_xml(key))
+        eos = 'FALSE' if context else 'TRUE'
+        return Response(cim_response(
+            method,
+            f'<IRETURNVALUE>{inst}</IRETURNVALUE>'
+            f'<PARAMVALUE NAME="EndOfSequence"><VALUE>{eos}</VALUE>'
+            '</PARAMVALUE><PARAMVALUE NAME="EnumerationContext">'
+            f'<VALUE>{context or ""}</VALUE></PARAMVALUE>'))
+
+    async def test(conn):
+        path = CIMInstanceName('CIM_Foo', {'Id': '1'})
+        inst = await conn.GetInstance(path, PropertyList=['Id'])
+        assert set(inst.keys()) == {'Id', 'Counts'}
+        inst = await conn.GetInstance(
+            path, PropertyList=['Id'], enforce_property_list=True)
+        assert list(inst.keys()) == ['Id']
+
+        insts = [i async for i in conn.IterEnumerateInstances(
+            'CIM_Foo', PropertyList=['Id'], enforce_property_list=True)]
+        assert [i['Id'] for i in insts] == ['o', 'p']
+        assert [list(i.keys()) for i in insts] == [['Id'], ['Id']]
+        # pylint: disable=protected-access
+        assert conn._pull_property_filters == {}
+
+    run_with_server(responder, test, use_pull_operations=True,
+                    direct_decode=direct_decode)
+
+
+@pytest.mark.parametrize("compression", [True, False])
+@pytest.mark.parametrize("chunked", [False, True])
+def test_compressed_response(compression, chunked):
+    """Test that compressed responses are accepted and decompressed."""
+
+    def responder(method, body):
+        # pylint: disable=unused-argument
+        return Response(
+            gzip.compress(cim_response(
+                method, '<IRETURNVALUE>' + instancename_xml('1') +
+                '</IRETURNVALUE>')),
+            headers={'Content-Encoding': 'gzip'}, chunked=chunked)
+
+    async def test(conn):
+        paths = await conn.EnumerateInstanceNames('CIM_Foo')
+        assert [p['Id'] for p in paths] == ['1']
+
+    server = run_with_server(responder, test, compression=compression)
+
+    headers, _ = server.requests[0]
+    assert headers['accept-encoding'] == \
+        ('gzip, deflate' if compression else 'identity')
+    assert 'content-encoding' not in headers
+
+
+def test_compressed_response_invalid():
+    """Test that an invalid compressed response raises ConnectionError."""
+
+    def responder(method, body):
+        # pylint: disable=unused-argument
+        return Response(b'not gzip', headers={'Content-Encoding': 'gzip'})
+
+    async def test(conn):
+        with pytest.raises(ConnectionError) as exc_info:
+            await conn.EnumerateInstanceNames('CIM_Foo')
+        assert 'decompress' in str(exc_info.value)
+
+    run_with_server(responder, test)
+
+
+@pytest.mark.parametrize("reject", [False, True])
+def test_request_compression(reject):
+    """
+    Test that requests are compressed if the threshold is reached, and that
+    they are sent again uncompressed if the server rejects them.
+    """
+
+    def responder(method, body):
+        if body.startswith(b'\x1f\x8b') and reject:
+            return Response(b'', status=415)
+        return Response(cim_response(method, '<IRETURNVALUE/>'))
+
+    async def test(conn):
+        for _ in range(2):
+            assert await conn.EnumerateInstanceNames('CIM_Foo') == []
+        # pylint: disable=protected-access
+        assert conn._request_compression_rejected is reject
+        assert conn.request_compression_threshold == 100
+
+    server = run_with_server(responder, test,
+                             request_compression_threshold=100)
+
+    encodings = [h.get('content-encoding') for h, _ in server.requests]
+    if reject:
+        assert encodings == ['gzip', None, None]
+    else:
+        assert encodings == ['gzip', 'gzip']
+    for headers, body in server.requests:
+        if headers.get('content-encoding') == 'gzip':
+            body = gzip.decompress(body)
+        assert b'<IMETHODCALL NAME="EnumerateInstanceNames">' in body
+
+
+def test_invoke_method():
+    """Test InvokeMethod."""
+
+    def responder(method, body):
+        # pylint: disable=unused-argument
+        return Response((
+            '<?xml version="1.0" encoding="utf-8" ?>'
+            '<CIM CIMVERSION="2.0" DTDVERSION="2.0">'
+            '<MESSAGE ID="1000" PROTOCOLVERSION="1.0"><SIMPLERSP>'
+            '<METHODRESPONSE NAME="Start">'
+            '<RETURNVALUE PARAMTYPE="uint32"><VALUE>0</VALUE></RETURNVALUE>'
+            '<PARAMVALUE NAME="Job" PARAMTYPE="string"><VALUE>j1</VALUE>'
+            '</PARAMVALUE>'
+            '</METHODRESPONSE></SIMPLERSP></MESSAGE></CIM>').encode('utf-8'))
+
+    async def test(conn):
+        path = CIMInstanceName('CIM_Foo', {'Id': '1'})
+        rv, outparams = await conn.InvokeMethod(
+            'Start', path, [('Wait', Uint32(5))])
+        assert rv == 0
+        assert outparams['Job'] == 'j1'
+
+    server = run_with_server(responder, test)
+
+    headers, body = server.requests[0]
+    assert headers['cimmethod'] == 'Start'
+    assert b'<PARAMVALUE NAME="Wait"' in body
+
+
+def test_cim_error():
+    """Test that a CIM error in the response raises CIMError."""
+
+    def responder(method, body):
+        # pylint: disable=unused-argument
+        return Response(error_response(method, CIM_ERR_NOT_FOUND))
+
+    async def test(conn):
+        with pytest.raises(CIMError) as exc_info:
+            await conn.GetInstance(CIMInstanceName('CIM_Foo', {'Id': '1'}))
+        assert exc_info.value.status_code == CIM_ERR_NOT_FOUND
+
+    run_with_server(responder, test)
+
+
+@pytest.mark.parametrize(
+    "status, exp_exc",
+    [
+        (401, AuthError),
+        (500, HTTPError),
+    ]
+)
+def test_http_error(status, exp_exc):
+    """Test that HTTP error statuses raise the expected exception."""
+
+    def responder(method, body):
+        # pylint: disable=unused-argument
+        return Response(b'', status=status)
+
+    async def test(conn):
+        with pytest.raises(exp_exc):
+            await conn.EnumerateInstanceNames('CIM_Foo')
+
+    run_with_server(responder, test)
+
+
+@pytest.mark.parametrize(
+    "body, exp_exc",
+    [
+        (b'<CIM><bad', XMLParseError),
+        (cim_response('EnumerateInstanceNames', '<FOO/>'), CIMXMLParseError),
+    ]
+)
+def test_invalid_response(body, exp_exc):
+    """Test that invalid responses raise parse errors with request data."""
+
+    def responder(method, body_):
+        # pylint: disable=unused-argument
+        return Response(body)
+
+    async def test(conn):
+        with pytest.raises(exp_exc) as exc_info:
+            await conn.EnumerateInstanceNames('CIM_Foo')
+        exc = exc_info.value
+        assert '<IMETHODCALL NAME="EnumerateInstanceNames">' in \
+            exc.request_data
+        assert exc.response_data == body
+
+    run_with_server(responder, test)
+
+
+def test_timeout():
+    """Test that a response exceeding the timeout raises TimeoutError."""
+
+    def responder(method, body):
+        # pylint: disable=unused-argument
+        return Response(cim_response(method, ''), delay=1)
+
+    async def test(conn):
+        with pytest.raises(TimeoutError):
+            await conn.EnumerateInstanceNames('CIM_Foo')
+
+    run_with_server(responder, test, timeout=0.1)
+
+
+def test_connection_refused():
+    """Test that a refused connection raises ConnectionError."""
+
+    async def main():
+        server = FakeServer(None)
+        url = await server.start()
+        await server.stop()
+        async with AsyncWBEMConnection(url) as conn:
+            with pytest.raises(ConnectionError):
+                await conn.EnumerateInstanceNames('CIM_Foo')
+
+    asyncio.run(main())
+
+
+def test_closed():
+    """Test that operations on a closed connection raise ConnectionError."""
+
+    async def main():
+        conn = AsyncWBEMConnection('http://127.0.0.1:1')
+        await conn.close()
+        with pytest.raises(ConnectionError):
+            await conn.EnumerateInstanceNames('CIM_Foo')
+        with pytest.raises(ConnectionError):
+            await conn.close()
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize(
+    "drop, exp_requests",
+    [
+        (False, 2),
+        (True, 3),
+    ]
+)
+def test_retry_idempotent(drop, exp_requests):
+    """
+    Test that the request of an idempotent operation is sent again when a
+    reused connection is closed by the server before it responds.
+    """
+    requests = []
+
+    def responder(method, body):
+        # pylint: disable=unused-argument
+        requests.append(method)
+        if drop and len(requests) == 2:
+            return Response(b'', drop=True)
+        return Response(cim_response(method, '<IRETURNVALUE/>'))
+
+    async def test(conn):
+        for _ in range(2):
+            result = await conn.EnumerateInstanceNames('CIM_Foo')
+            assert result == []
+
+    server = run_with_server(responder, test)
+
+    assert len(requests) == exp_requests
+    assert server.connections == (2 if drop else 1)
+
+
+def test_no_retry_non_idempotent():
+    """
+    Test that the request of an operation that changes the state of the
+    server is not sent again when a reused connection is closed by the
+    server before it responds.
+    """
+    requests = []
+
+    def responder(method, body):
+        # pylint: disable=unused-argument
+        requests.append(method)
+        if method == 'DeleteInstance':
+            return Response(b'', drop=True)
+        return Response(cim_response(method, '<IRETURNVALUE/>'))
+
+    async def test(conn):
+        await conn.EnumerateInstanceNames('CIM_Foo')
+        with pytest.raises(ConnectionError):
+            await conn.DeleteInstance(CIMInstanceName('CIM_Foo', {'Id': '1'}))
+
+    run_with_server(responder, test)
+
+    assert requests == ['EnumerateInstanceNames', 'DeleteInstance']
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        dict(),
+        dict(chunked=True),
+        dict(eof_delimited=True),
+    ]
+)
+def test_max_response_size(monkeypatch, kwargs):
+    """
+    Test that a response body that exceeds the maximum size raises
+    ConnectionError.
+    """
+    monkeypatch.setattr(_cim_http_async, 'HTTP_MAX_RESPONSE_SIZE', 100)
+
+    def responder(method, body):
+        # pylint: disable=unused-argument
+        return Response(cim_response(method, '<IRETURNVALUE/>'), **kwargs)
+
+    async def test(conn):
+        with pytest.raises(ConnectionError) as exc_info:
+            await conn.EnumerateInstanceNames('CIM_Foo')
+        assert 'maximum size' in str(exc_info.value)
+
+    run_with_server(responder, test)
+
+
+def test_concurrent_operations():
+    """
+    Test that concurrent operations are limited by max_connections and all
+    return the correct result.
+    """
+
+    def responder(method, body):
+        key = re.search(rb'<KEYVALUE[^>]*>([0-9]+)<', body).group(1)
+        return Response(
+            cim_response(
+                method, '<IRETURNVALUE>' + instance_xml(key.decode()) +
+                '</IRETURNVALUE>'),
+            delay=0.01)
+
+    async def test(conn):
+        paths = [CIMInstanceName('CIM_Foo', {'Id': str(i)})
+                 for i in range(50)]
+        insts = await asyncio.gather(*[conn.GetInstance(p) for p in paths])
+        assert [inst['Id'] for inst in insts] == \
+            [str(i) for i in range(50)]
+
+    server = run_with_server(responder, test, max_connections=5,
+                             stats_enabled=True)
+
+    assert len(server.requests) == 50
+    assert server.max_active == 5
+    assert server.connections == 5
+
+
+def test_statistics():
+    """Test that statistics are maintained for concurrent operations."""
+
+    def responder(method, body):
+        # pylint: disable=unused-argument
+        return Response(cim_response(method, ''), delay=0.01)
+
+    async def test(conn):
+        await asyncio.gather(
+            *[conn.EnumerateInstanceNames('CIM_Foo') for _ in range(4)])
+        stat = conn.statistics.get_op_statistic('EnumerateInstanceNames')
+        assert stat.count == 4
+        assert stat.exception_count == 0
+        assert stat.avg_time > 0
+
+    run_with_server(responder, test, stats_enabled=True)
+
+
+def pull_responder(pages):
+    """
+    Return a responder for pull operations that returns the pages (lists of
+    keys) in sequence.
+    """
+
+    def responder(method, body):
+        if method == 'CloseEnumeration':
+            return Response(cim_response(method, ''))
+        page_index = 0 if method.startswith('Open') else \
+            int(re.search(rb'<VALUE>ctx([0-9]+)</VALUE>', body).group(1))
+        context = f'ctx{page_index + 1}' if page_index + 1 < len(pages) \
+            else None
+        return Response(pull_response(method, pages[page_index], context))
+
+    return responder
+
+
+@pytest.mark.parametrize("use_pull", [None, True])
+def test_iter_enumerate_instances_pull(use_pull):
+    """Test IterEnumerateInstances using pull operations."""
+
+    async def test(conn):
+        keys = [inst['Id'] async for inst in
+                conn.IterEnumerateInstances('CIM_Foo', MaxObjectCount=2)]
+        assert keys == ['1', '2', '3', '4', '5']
+
+    server = run_with_server(pull_responder([['1', '2'], ['3', '4'], ['5']]),
+                             test, use_pull_operations=use_pull)
+
+    assert [method_of(b) for _, b in server.requests] == \
+        ['OpenEnumerateInstances', 'PullInstancesWithPath',
+         'PullInstancesWithPath']
+
+
+def test_iter_enumerate_instances_aclose():
+    """
+    Test that closing an IterEnumerateInstances generator early closes the
+    enumeration session.
+    """
+
+    async def test(conn):
+        gen = conn.IterEnumerateInstances('CIM_Foo', MaxObjectCount=2)
+        inst = await gen.__anext__()
+        assert inst['Id'] == '1'
+        await gen.aclose()
+
+    server = run_with_server(pull_responder([['1', '2'], ['3', '4'], ['5']]),
+                             test, use_pull_operations=True)
+
+    assert [method_of(b) for _, b in server.requests] == \
+        ['OpenEnumerateInstances', 'CloseEnumeration']
+    assert b'<VALUE>ctx1</VALUE>' in server.requests[1][1]
+
+
+@pytest.mark.parametrize("prefetch", [1, 2])
+def test_iter_enumerate_instances_prefetch(prefetch):
+    """Test IterEnumerateInstances with prefetching of pull results."""
+
+    async def test(conn):
+        keys = [inst['Id'] async for inst in conn.IterEnumerateInstances(
+            'CIM_Foo', MaxObjectCount=2, prefetch=prefetch)]
+        assert keys == ['1', '2', '3', '4', '5']
+
+    server = run_with_server(pull_responder([['1', '2'], ['3', '4'], ['5']]),
+                             test, use_pull_operations=True)
+
+    assert [method_of(b) for _, b in server.requests] == \
+        ['OpenEnumerateInstances', 'PullInstancesWithPath',
+         'PullInstancesWithPath']
+
+
+def test_iter_enumerate_instances_prefetch_aclose():
+    """
+    Test that closing an IterEnumerateInstances generator with prefetching
+    early closes the enumeration session using the most recent context.
+    """
+
+    async def test(conn):
+        gen = conn.IterEnumerateInstances(
+            'CIM_Foo', MaxObjectCount=1, prefetch=1)
+        inst = await gen.__anext__()
+        assert inst['Id'] == '1'
+        await gen.aclose()
+
+    server = run_with_server(pull_responder([['1'], ['2'], ['3'], ['4']]),
+                             test, use_pull_operations=True)
+
+    methods = [method_of(b) for _, b in server.requests]
+    assert methods[0] == 'OpenEnumerateInstances'
+    assert methods[-1] == 'CloseEnumeration'
+    pulls = methods.count('PullInstancesWithPath')
+    assert pulls <= 1
+    assert f'<VALUE>ctx{pulls + 1}</VALUE>'.encode() in \
+        server.requests[-1][1]
+
+
+def test_iter_enumerate_instances_prefetch_error():
+    """
+    Test that the exception of a failed prefetched pull operation is raised,
+    also if closing the enumeration session fails.
+    """
+
+    def responder(method, body):
+        # pylint: disable=unused-argument
+        if method == 'OpenEnumerateInstances':
+            return Response(pull_response(method, ['1'], 'ctx1'))
+        if method == 'PullInstancesWithPath':
+            return Response(error_response(method, CIM_ERR_FAILED))
+        return Response(error_response(method, CIM_ERR_NOT_FOUND))
+
+    async def test(conn):
+        with pytest.raises(CIMError) as exc_info:
+            _ = [inst async for inst in conn.IterEnumerateInstances(
+                'CIM_Foo', MaxObjectCount=1, prefetch=1)]
+        assert exc_info.value.status_code == CIM_ERR_FAILED
+
+    server = run_with_server(responder, test, use_pull_operations=True)
+
+    assert [method_of(b) for _, b in server.requests] == \
+        ['OpenEnumerateInstances', 'PullInstancesWithPath',
+         'CloseEnumeration']
+
+
+def test_iter_enumerate_instances_fallback():
+    """
+    Test that IterEnumerateInstances falls back to EnumerateInstances if pull
+    operations are not supported.
+    """
+
+    def responder(method, body):
+        # pylint: disable=unused-argument
+        if method == 'OpenEnumerateInstances':
+            return Response(error_response(method, CIM_ERR_NOT_SUPPORTED))
+        return Response(cim_response(
+            method, '<IRETURNVALUE><VALUE.NAMEDINSTANCE>' +
+            instancename_xml('1') + instance_xml('1') +
+            '</VALUE.NAMEDINSTANCE></IRETURNVALUE>'))
+
+    async def test(conn):
+        for _ in range(2):
+            insts = [inst async for inst in
+                     conn.IterEnumerateInstances('CIM_Foo')]
+            assert [inst['Id'] for inst in insts] == ['1']
+            assert insts[0].path.namespace == 'root/cimv2'
+        # pylint: disable=protected-access
+        assert conn._use_enum_inst_pull_operations is False
+
+    server = run_with_server(responder, test, use_pull_operations=None)
+
+    assert [method_of(b) for _, b in server.requests] == \
+        ['OpenEnumerateInstances', 'EnumerateInstances', 'EnumerateInstances']
+
+
+def test_iter_enumerate_instance_paths():
+    """Test IterEnumerateInstancePaths using pull operations."""
+
+    def responder(method, body):
+        # pylint: disable=unused-argument
+        return Response(cim_response(
+            method,
+            '<IRETURNVALUE><INSTANCEPATH><NAMESPACEPATH><HOST>woot.com</HOST>'
+            '<LOCALNAMESPACEPATH><NAMESPACE NAME="root"/>'
+            '<NAMESPACE NAME="cimv2"/></LOCALNAMESPACEPATH></NAMESPACEPATH>' +
+            instancename_xml('1') + '</INSTANCEPATH></IRETURNVALUE>'
+            '<PARAMVALUE NAME="EndOfSequence"><VALUE>TRUE</VALUE></PARAMVALUE>'
+            '<PARAMVALUE NAME="EnumerationContext"><VALUE></VALUE>'
+            '</PARAMVALUE>'))
+
+    async def test(conn):
+        paths = [p async for p in conn.IterEnumerateInstancePaths('CIM_Foo')]
+        assert [p['Id'] for p in paths] == ['1']
+
+    run_with_server(responder, test, use_pull_operations=True)
+
+
+def test_iter_query_instances():
+    """Test IterQueryInstances using pull operations."""
+
+    async def test(conn):
+        result = await conn.IterQueryInstances(
+            'DMTF:CQL', 'SELECT * FROM CIM_Foo', MaxObjectCount=2)
+        assert isinstance(result, IterQueryInstancesReturn)
+        assert [inst['Id'] for inst in result.generator] == ['1', '2', '3']
+
+    server = run_with_server(pull_responder([['1', '2'], ['3']]), test,
+                             use_pull_operations=True)
+
+    assert [method_of(b) for _, b in server.requests] == \
+        ['OpenQueryInstances', 'PullInstances']
@@ -5,6 +5,8 @@ Test CIM types.
 """
 
 import re
+import copy
+import pickle
 from datetime import timedelta, datetime
 
 try:
@@ -21,7 +23,7 @@ pywbem = import_installed('pywbem')
 from pywbem import CIMType, CIMInt, CIMFloat, Uint8, Uint16, Uint32, Uint64, \
     Sint8, Sint16, Sint32, Sint64, Real32, Real64, Char16, CIMDateTime, \
     MinutesFromUTC, CIMClass, CIMInstance, CIMInstanceName, CIMClassName, \
-    cimtype, type_from_name  # noqa: E402
+    CIMNumericArray, cimtype, type_from_name  # noqa: E402
 # pylint: enable=wrong-import-position, wrong-import-order, invalid-name
 
 # Literal form {"blah: 0} faster than dict(blah=0) but same functionality
@@ -1506,6 +1508,22 @@ TESTCASES_CIMTYPE = [
         ),
         TypeError, None, True
     ),
+    (
+        "Object is a CIMNumericArray object",
+        dict(
+            obj=CIMNumericArray('sint16', [1, 2]),
+            exp_type_name='sint16',
+        ),
+        None, None, True
+    ),
+    (
+        "Object is an empty CIMNumericArray object",
+        dict(
+            obj=CIMNumericArray('real32'),
+            exp_type_name='real32',
+        ),
+        None, None, True
+    ),
 ]
 
 
@@ -1710,4 +1728,300 @@ def test_type_from_name(testcase, type_name, exp_type_obj):
     assert type_obj is exp_type_obj
 
 
+TESTCASES_NUMERIC_ARRAY_INIT = [
+
+    # Testcases for CIMNumericArray.__init__()
+
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * type_name: type argument for CIMNumericArray().
+    #   * values: values argument for CIMNumericArray().
+    #   * exp_values: Expected list of values, if successful.
+    # * exp_exc_types: Expected exception type(s), or None.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "Empty uint8 array",
+        dict(
+            type_name='uint8',
+            values=[],
+            exp_values=[],
+        ),
+        None, None, True
+    ),
+    (
+        "uint8 array with Python int values at the range limits",
+        dict(
+            type_name='uint8',
+            values=[0, 255],
+            exp_values=[Uint8(0), Uint8(255)],
+        ),
+        None, None, True
+    ),
+    (
+        "sint8 array with Python int values at the range limits",
+        dict(
+            type_name='sint8',
+            values=[-128, 127],
+            exp_values=[Sint8(-128), Sint8(127)],
+        ),
+        None, None, True
+    ),
+    (
+        "uint16 array with CIM typed values",
+        dict(
+            type_name='uint16',
+            values=[Uint16(0), Uint16(65535)],
+            exp_values=[Uint16(0), Uint16(65535)],
+        ),
+        None, None, True
+    ),
+    (
+        "sint16 array with string values",
+        dict(
+            type_name='sint16',
+            values=['-32768', '32767'],
+            exp_values=[Sint16(-32768), Sint16(32767)],
+        ),
+        None, None, True
+    ),
+    (
+        "uint32 array with Python int values at the range limits",
+        dict(
+            type_name='uint32',
+            values=[0, 2**32 - 1],
+            exp_values=[Uint32(0), Uint32(2**32 - 1)],
+        ),
+        None, None, True
+    ),
+    (
+        "sint32 array with Python int values at the range limits",
+        dict(
+            type_name='sint32',
+            values=[-2**31, 2**31 - 1],
+            exp_values=[Sint32(-2**31), Sint32(2**31 - 1)],
+        ),
+        None, None, True
+    ),
+    (
+        "uint64 array with Python int values at the range limits",
+        dict(
+            type_name='uint64',
+            values=[0, 2**64 - 1],
+            exp_values=[Uint64(0), Uint64(2**64 - 1)],
+        ),
+        None, None, True
+    ),
+    (
+        "sint64 array with Python int values at the range limits",
+        dict(
+            type_name='sint64',
+            values=[-2**63, 2**63 - 1],
+            exp_values=[Sint64(-2**63), Sint64(2**63 - 1)],
+        ),
+        None, None, True
+    ),
+    (
+        "real32 array with values that are not exact in single precision",
+        dict(
+            type_name='real32',
+            values=[0.1, Real32(1.1)],
+            exp_values=[Real32(0.1), Real32(1.1)],
+        ),
+        None, None, True
+    ),
+    (
+        "real64 array with string and int values",
+        dict(
+            type_name='real64',
+            values=['1.5', 2],
+            exp_values=[Real64(1.5), Real64(2)],
+        ),
+        None, None, True
+    ),
+    (
+        "Array from a CIMNumericArray with a different type",
+        dict(
+            type_name='uint64',
+            values=CIMNumericArray('uint8', [1, 2]),
+            exp_values=[Uint64(1), Uint64(2)],
+        ),
+        None, None, True
+    ),
+    (
+        "uint8 array with value out of range",
+        dict(
+            type_name='uint8',
+            values=[1, 256],
+            exp_values=None,
+        ),
+        ValueError, None, True
+    ),
+    (
+        "uint64 array with negative value",
+        dict(
+            type_name='uint64',
+            values=[-1],
+            exp_values=None,
+        ),
+        ValueError, None, True
+    ),
+    (
+        "sint32 array with None value",
+        dict(
+            type_name='sint32',
+            values=[1, None],
+            exp_values=None,
+        ),
+        ValueError, None, True
+    ),
+    (
+        "uint8 array with invalid string value",
+        dict(
+            type_name='uint8',
+            values=['abc'],
+            exp_values=None,
+        ),
+        ValueError, None, True
+    ),
+    (
+        "Non-numeric CIM type",
+        dict(
+            type_name='string',
+            values=[],
+            exp_values=None,
+        ),
+        ValueError, None, True
+    ),
+    (
+        "Invalid CIM type",
+        dict(
+            type_name='uint128',
+            values=[],
+            exp_values=None,
+        ),
+        ValueError, None, True
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_NUMERIC_ARRAY_INIT)
+@simplified_test_function
+@log_entry_exit
+def test_numeric_array_init(testcase, type_name, values, exp_values):
+    """
+    Test function for CIMNumericArray.__init__().
+    """
+
+    # The code to be tested
+    arr = CIMNumericArray(type_name, values)
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    assert not hasattr(arr, '__dict__')
+    assert arr.cimtype == type_name
+    assert len(arr) == len(exp_values)
+    assert arr == exp_values
+    assert exp_values == arr
+    act_values = list(arr)
+    assert act_values == exp_values
+    for act_value, exp_value in zip(act_values, exp_values):
+        assert type(act_value) is type(exp_value)  # noqa: E721
+        assert act_value.cimtype == type_name
+
+
+def test_numeric_array_sequence():
+    """
+    Test CIMNumericArray as a mutable sequence.
+    """
+    arr = CIMNumericArray('uint16', [1, 2, 3])
+
+    assert isinstance(arr[0], Uint16)
+    assert arr[-1] == 3
+    assert 2 in arr
+    assert 4 not in arr
+    assert list(reversed(arr)) == [3, 2, 1]
+    assert arr.index(2) == 1
+    assert arr.count(3) == 1
+
+    sliced = arr[1:]
+    assert isinstance(sliced, CIMNumericArray)
+    assert sliced.cimtype == 'uint16'
+    assert sliced == [2, 3]
+
+    arr[0] = '10'
+    arr[1:2] = [20, 21]
+    arr.append(Uint16(4))
+    arr.extend([5, 6])
+    arr.insert(0, 0)
+    del arr[1]
+    arr.remove(6)
+    assert arr == [0, 20, 21, 3, 4, 5]
+    assert arr.pop() == 5
+    assert arr == [0, 20, 21, 3, 4]
+
+    with pytest.raises(ValueError):
+        arr.append(65536)
+    with pytest.raises(ValueError):
+        arr[0] = None
+    with pytest.raises(ValueError):
+        arr.extend([1, -1])
+    assert arr == [0, 20, 21, 3, 4]
+
+    assert arr.buffer.tolist() == [0, 20, 21, 3, 4]
+    assert arr.buffer.itemsize == 2
+
+
+def test_numeric_array_eq():
+    """
+    Test equality comparison of CIMNumericArray.
+    """
+    arr = CIMNumericArray('uint8', [1, 2])
+
+    assert arr == CIMNumericArray('uint8', [1, 2])
+    assert arr == CIMNumericArray('uint32', [1, 2])
+    assert arr != CIMNumericArray('uint8', [1, 3])
+    assert arr == [Uint8(1), Uint8(2)]
+    assert arr != [1, 2, 3]
+    assert arr != [1, None]
+    assert arr == (1, 2)
+    assert arr != (1, 3)
+    assert arr == range(1, 3)
+    assert arr != 'ab'
+    assert arr != b'\x01\x02'
+    assert arr != 1
+    with pytest.raises(TypeError):
+        hash(arr)
+
+
+def test_numeric_array_copy():
+    """
+    Test copying and pickling of CIMNumericArray.
+    """
+    arr = CIMNumericArray('real64', [1.5, 2.5])
+
+    for cpy in (copy.copy(arr), copy.deepcopy(arr),
+                pickle.loads(pickle.dumps(arr))):
+        assert isinstance(cpy, CIMNumericArray)
+        assert cpy.cimtype == 'real64'
+        assert cpy == arr
+        cpy.append(3.5)
+        assert arr == [1.5, 2.5]
+
+
+def test_numeric_array_repr():
+    """
+    Test repr() of CIMNumericArray.
+    """
+    arr = CIMNumericArray('sint8', [-1, 2])
+
+    assert repr(arr) == "CIMNumericArray(cimtype='sint8', [-1, 2])"
+
+
 # TODO: Add tests for atomic_to_cim_xml()
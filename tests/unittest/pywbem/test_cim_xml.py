@@ -4271,3 +4271,137 @@ def test_cim_xml_node(testcase, xml_node, exp_xml_str_list, **kwargs):
     finally:
         if cdata_escaping:
             _cim_xml._CDATA_ESCAPING = False  # pylint: disable=protected-access
+
+
+TESTCASES_WRITE_VALUE = [
+
+    # Testcases for the write_value() function, that writes the XML string of
+    # a VALUE element directly.
+    #
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * pcdata: pcdata string for the VALUE element, or None.
+    #   * cdata_escaping: Boolean to use CDATA escaping.
+    #   * exp_xml_str: Expected XML string.
+    # * exp_exc_types: Expected exception type(s), or None.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "VALUE without pcdata",
+        dict(
+            pcdata=None,
+            cdata_escaping=False,
+            exp_xml_str='<VALUE/>',
+        ),
+        None, None, True
+    ),
+    (
+        "VALUE with empty pcdata",
+        dict(
+            pcdata='',
+            cdata_escaping=False,
+            exp_xml_str='<VALUE></VALUE>',
+        ),
+        None, None, True
+    ),
+    (
+        "VALUE with XML special characters, using XML escaping",
+        dict(
+            pcdata='a&b<c>d\'e',
+            cdata_escaping=False,
+            exp_xml_str='<VALUE>a&amp;b&lt;c&gt;d\'e</VALUE>',
+        ),
+        None, None, True
+    ),
+    (
+        "VALUE with XML special characters, using CDATA escaping",
+        dict(
+            pcdata='a&b<c>d',
+            cdata_escaping=True,
+            exp_xml_str='<VALUE><![CDATA[a&b<c>d]]></VALUE>',
+        ),
+        None, None, True
+    ),
+    (
+        "VALUE with CDATA section, using CDATA escaping",
+        dict(
+            pcdata='<![CDATA[a&b]]>c',
+            cdata_escaping=True,
+            exp_xml_str='<VALUE><![CDATA[<![CDATA[a&b]]]><![CDATA[]>c]]>'
+            '</VALUE>',
+        ),
+        None, None, True
+    ),
+    (
+        "VALUE without XML special characters, using CDATA escaping",
+        dict(
+            pcdata='abc',
+            cdata_escaping=True,
+            exp_xml_str='<VALUE>abc</VALUE>',
+        ),
+        None, None, True
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_WRITE_VALUE)
+@simplified_test_function
+@log_entry_exit
+def test_write_value(testcase, pcdata, cdata_escaping, exp_xml_str):
+    # pylint: disable=unused-argument
+    """
+    Test function for write_value(), verifying that it produces the same XML
+    string as the VALUE element.
+    """
+
+    try:
+        if cdata_escaping:
+            _cim_xml._CDATA_ESCAPING = True  # pylint: disable=protected-access
+
+        # The code to be tested
+        out = []
+        _cim_xml.write_value(out, pcdata)
+        act_xml_str = ''.join(out)
+
+        node_xml_str = _cim_xml.VALUE(pcdata).toxml()
+
+    finally:
+        if cdata_escaping:
+            _cim_xml._CDATA_ESCAPING = False  # pylint: disable=protected-access
+
+    assert act_xml_str == exp_xml_str
+    assert act_xml_str == node_xml_str
+
+
+@pytest.mark.parametrize(
+    "host, namespace",
+    [
+        (None, 'root'),
+        (None, 'root/cimv2'),
+        ('leonardo', 'root/cimv2'),
+        ('a&b', 'x<y/z'),
+    ])
+def test_write_namespacepath(host, namespace):
+    """
+    Test function for write_localnamespacepath() and write_namespacepath(),
+    verifying that they produce the same XML strings as the corresponding
+    elements.
+    """
+
+    localnsp_node = _cim_xml.LOCALNAMESPACEPATH(
+        [_cim_xml.NAMESPACE(ns) for ns in namespace.split('/')])
+
+    out = []
+    if host is None:
+        _cim_xml.write_localnamespacepath(out, namespace)
+        exp_xml_str = localnsp_node.toxml()
+    else:
+        _cim_xml.write_namespacepath(out, host, namespace)
+        exp_xml_str = _cim_xml.NAMESPACEPATH(
+            _cim_xml.HOST(host), localnsp_node).toxml()
+
+    assert ''.join(out) == exp_xml_str
@@ -0,0 +1,386 @@
+"""
+Test the InstanceColumns and InstanceColumn classes and the
+WBEMConnection.EnumerateInstancesColumnar() method.
+"""
+
+import pytest
+import requests_mock
+
+from ..utils.pytest_extensions import simplified_test_function
+
+# pylint: disable=wrong-import-position, wrong-import-order, invalid-name
+from ...utils import import_installed
+pywbem = import_installed('pywbem')
+from pywbem import WBEMConnection, CIMInstance, CIMInstanceName, \
+    CIMProperty, CIMNumericArray, InstanceColumns, Uint8, Uint32, Sint64, \
+    Uint64, Real32, CIMError, CIMXMLParseError  # noqa: E402
+# pylint: enable=wrong-import-position, wrong-import-order, invalid-name
+
+# Literal form {"blah: 0} faster than dict(blah=0) but same functionality
+# pylint: disable=use-dict-literal
+
+
+def make_inst(inst_id, classname='CIM_Foo', **props):
+    """Return a CIM instance with an InstanceID key and the properties."""
+    properties = [CIMProperty('InstanceID', inst_id)]
+    properties.extend(CIMProperty(name, value) if not isinstance(value, tuple)
+                      else CIMProperty(name, value[1], type=value[0])
+                      for name, value in props.items())
+    return CIMInstance(
+        classname, properties=properties,
+        path=CIMInstanceName(classname, {'InstanceID': inst_id}))
+
+
+def column_items(columns):
+    """
+    Return the columns of an InstanceColumns object (properties and
+    keybindings), as dictionaries of name: (type, is_array, items).
+    """
+    return (
+        {name: (col.type, col.is_array, list(col))
+         for name, col in columns.properties.items()},
+        {name: (col.type, col.is_array, list(col))
+         for name, col in columns.keybindings.items()})
+
+
+TESTCASES_INSTANCE_COLUMNS = [
+
+    # Testcases for test_instance_columns()
+    #
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * instances: List of CIMInstance objects to be added.
+    #   * exp_classnames: Expected classnames attribute.
+    #   * exp_properties: Expected property columns, as a dict of
+    #     name: (type, is_array, items).
+    #   * exp_keybindings: Expected keybinding columns, as a dict of
+    #     name: (type, is_array, items).
+    # * exp_exc_types: Expected exception type(s), or None.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "No instances",
+        dict(
+            instances=[],
+            exp_classnames=[],
+            exp_properties={},
+            exp_keybindings={},
+        ),
+        None, None, True
+    ),
+    (
+        "Instances with the same properties",
+        dict(
+            instances=[
+                make_inst('a', P1=Uint32(1), P2=[Uint8(1), Uint8(2)]),
+                make_inst('b', P1=Uint32(2), P2=('uint8', [])),
+            ],
+            exp_classnames=['CIM_Foo', 'CIM_Foo'],
+            exp_properties={
+                'InstanceID': ('string', False, ['a', 'b']),
+                'P1': ('uint32', False, [1, 2]),
+                'P2': ('uint8', True, [[1, 2], []]),
+            },
+            exp_keybindings={
+                'InstanceID': (None, None, ['a', 'b']),
+            },
+        ),
+        None, None, True
+    ),
+    (
+        "Instances with NULL values and properties in only some instances",
+        dict(
+            instances=[
+                make_inst('a', P1=('real32', None)),
+                make_inst('b', 'CIM_Bar', P1=Real32(1.5), P2='x'),
+                make_inst('c'),
+            ],
+            exp_classnames=['CIM_Foo', 'CIM_Bar', 'CIM_Foo'],
+            exp_properties={
+                'InstanceID': ('string', False, ['a', 'b', 'c']),
+                'P1': ('real32', False, [None, 1.5, None]),
+                'P2': ('string', False, [None, 'x', None]),
+            },
+            exp_keybindings={
+                'InstanceID': (None, None, ['a', 'b', 'c']),
+            },
+        ),
+        None, None, True
+    ),
+    (
+        "Property names with different lexical case",
+        dict(
+            instances=[
+                make_inst('a', P1=Sint64(-1)),
+                make_inst('b', p1=Sint64(1)),
+            ],
+            exp_classnames=['CIM_Foo', 'CIM_Foo'],
+            exp_properties={
+                'InstanceID': ('string', False, ['a', 'b']),
+                'P1': ('sint64', False, [-1, 1]),
+            },
+            exp_keybindings={
+                'InstanceID': (None, None, ['a', 'b']),
+            },
+        ),
+        None, None, True
+    ),
+    (
+        "Property with different CIM types in the instances",
+        dict(
+            instances=[
+                make_inst('a', P1=Uint32(1)),
+                make_inst('b', P1='x'),
+                make_inst('c', P1=[Uint32(3)]),
+            ],
+            exp_classnames=['CIM_Foo', 'CIM_Foo', 'CIM_Foo'],
+            exp_properties={
+                'InstanceID': ('string', False, ['a', 'b', 'c']),
+                'P1': (None, None, [1, 'x', [3]]),
+            },
+            exp_keybindings={
+                'InstanceID': (None, None, ['a', 'b', 'c']),
+            },
+        ),
+        None, None, True
+    ),
+    (
+        "Instance without path",
+        dict(
+            instances=[
+                make_inst('a'),
+                CIMInstance('CIM_Foo', properties=[
+                    CIMProperty('InstanceID', 'b')]),
+            ],
+            exp_classnames=['CIM_Foo', 'CIM_Foo'],
+            exp_properties={
+                'InstanceID': ('string', False, ['a', 'b']),
+            },
+            exp_keybindings={
+                'InstanceID': (None, None, ['a', None]),
+            },
+        ),
+        None, None, True
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_INSTANCE_COLUMNS)
+@simplified_test_function
+def test_instance_columns(
+        testcase, instances, exp_classnames, exp_properties, exp_keybindings):
+    """
+    Test InstanceColumns.add_instances().
+    """
+
+    columns = InstanceColumns()
+
+    # The code to be tested
+    columns.add_instances(instances)
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    assert len(columns) == len(instances)
+    assert columns.classnames == exp_classnames
+    assert column_items(columns) == (exp_properties, exp_keybindings)
+    assert list(columns.properties) == list(exp_properties)
+    for col in columns.properties.values():
+        assert len(col) == len(instances)
+        assert list(col.mask) == [int(item is None) for item in col]
+
+
+def test_instance_column_storage():
+    """
+    Test the storage of values and NULL mask in InstanceColumn objects.
+    """
+    columns = InstanceColumns()
+    columns.add_instances([
+        make_inst('a', P1=Uint64(2**64 - 1), P2=[Uint64(1)]),
+        make_inst('b', P1=('uint64', None), P2=('uint64', None)),
+    ])
+    col1 = columns.properties['p1']
+    col2 = columns.properties['P2']
+
+    assert isinstance(col1.values, CIMNumericArray)
+    assert col1.values.cimtype == 'uint64'
+    assert list(col1.values) == [2**64 - 1, 0]
+    assert list(col1.mask) == [0, 1]
+    assert isinstance(col1[0], Uint64)
+    assert col1[1] is None
+    assert col1[-1] is None
+    assert col1[0:1] == [2**64 - 1]
+    assert col1.name == 'P1'
+
+    assert isinstance(col2.values, list)
+    assert col2.values == [[1], None]
+    assert list(col2.mask) == [0, 1]
+
+    assert repr(col1) == \
+        "InstanceColumn(name='P1', type='uint64', is_array=False, " \
+        "[18446744073709551615, None])"
+    assert repr(columns) == \
+        "InstanceColumns(rows=2, keybindings=['InstanceID'], " \
+        "properties=['InstanceID', 'P1', 'P2'])"
+
+
+def test_instance_column_to_numpy():
+    """
+    Test InstanceColumn.to_numpy().
+    """
+    numpy = pytest.importorskip('numpy')
+
+    columns = InstanceColumns()
+    columns.add_instances([
+        make_inst('a', P1=Uint32(7), P2=[Uint8(1), Uint8(2)]),
+        make_inst('b', P1=('uint32', None), P2=[Uint8(3), Uint8(4)]),
+    ])
+
+    # The code to be tested
+    arr1 = columns.properties['P1'].to_numpy()
+    arr2 = columns.properties['P2'].to_numpy()
+
+    assert arr1.dtype.itemsize >= 4
+    assert arr1.dtype.kind == 'u'
+    assert list(arr1.mask) == [False, True]
+    assert arr1[0] == 7
+    assert arr2.dtype == numpy.dtype(object)
+    assert arr2.shape == (2,)
+    assert arr2[1] == [3, 4]
+
+
+def enum_response(items_xml):
+    """Return the CIM-XML response for an EnumerateInstances operation."""
+    return (
+        '<?xml version="1.0" encoding="utf-8" ?>\n'
+        '<CIM CIMVERSION="2.0" DTDVERSION="2.0">'
+        '<MESSAGE ID="1001" PROTOCOLVERSION="1.0"><SIMPLERSP>'
+        '<IMETHODRESPONSE NAME="EnumerateInstances">'
+        f'{items_xml}'
+        '</IMETHODRESPONSE></SIMPLERSP></MESSAGE></CIM>').encode('utf-8')
+
+
+def named_instances_xml(instances):
+    """Return the VALUE.NAMEDINSTANCE elements for the instances."""
+    return ''.join(
+        '<VALUE.NAMEDINSTANCE>'
+        f'{inst.path.tocimxmlstr()}'
+        f'{inst.tocimxmlstr(ignore_path=True)}'
+        '</VALUE.NAMEDINSTANCE>'
+        for inst in instances)
+
+
+def mocked_conn(body, **kwargs):
+    """
+    Return a WBEMConnection with a mocked HTTP layer returning the body.
+    """
+    conn = WBEMConnection('http://dummy', **kwargs)
+    adapter = requests_mock.Adapter()
+    adapter.register_uri(
+        'POST', 'http://dummy:5988/cimom', content=body, status_code=200,
+        headers={'Content-type': 'application/xml; charset="utf-8"'})
+    conn.session.mount('http://', adapter)
+    return conn
+
+
+INSTANCES = [
+    make_inst('a', P1=Uint32(1), P2=[Uint64(1), Uint64(2)], P3='x'),
+    make_inst('b', 'CIM_Bar', P1=('uint32', None), P2=[Uint64(3)]),
+    make_inst('c', P1=Uint32(3), P2=('uint64', None), P3='z'),
+]
+
+
+@pytest.mark.parametrize(
+    "compact_arrays",
+    [False, True]
+)
+@pytest.mark.parametrize(
+    "direct_decode",
+    [False, True]
+)
+@pytest.mark.parametrize(
+    "property_list, enforce_property_list, exp_prop_names",
+    [
+        (None, False, ['InstanceID', 'P1', 'P2', 'P3']),
+        (['p3', 'P1'], True, ['P1', 'P3']),
+        (['P1'], False, ['InstanceID', 'P1', 'P2', 'P3']),
+    ]
+)
+def test_enumerate_instances_columnar(
+        compact_arrays, direct_decode, property_list, enforce_property_list,
+        exp_prop_names):
+    """
+    Test WBEMConnection.EnumerateInstancesColumnar() against the columns of
+    the instances returned by EnumerateInstances(), with a server that
+    ignores the PropertyList parameter.
+    """
+    body = enum_response(
+        f'<IRETURNVALUE>{named_instances_xml(INSTANCES)}</IRETURNVALUE>')
+    conn = mocked_conn(body, compact_arrays=compact_arrays,
+                       direct_decode=direct_decode, stats_enabled=True)
+
+    # The code to be tested
+    columns = conn.EnumerateInstancesColumnar(
+        'CIM_Foo', namespace='root/cimv2', PropertyList=property_list,
+        enforce_property_list=enforce_property_list)
+
+    exp_columns = InstanceColumns()
+    exp_columns.add_instances(conn.EnumerateInstances(
+        'CIM_Foo', namespace='root/cimv2', PropertyList=property_list,
+        enforce_property_list=enforce_property_list))
+
+    assert isinstance(columns, InstanceColumns)
+    assert columns.classnames == ['CIM_Foo', 'CIM_Bar', 'CIM_Foo']
+    assert list(columns.properties) == exp_prop_names
+    assert column_items(columns) == column_items(exp_columns)
+    if 'P2' in exp_prop_names:
+        assert isinstance(columns.properties['P2'][0], CIMNumericArray) == \
+            compact_arrays
+    stats = conn.statistics.get_op_statistic('EnumerateInstancesColumnar')
+    assert stats.count == 1
+
+
+def test_enumerate_instances_columnar_empty():
+    """
+    Test WBEMConnection.EnumerateInstancesColumnar() with an empty result.
+    """
+    conn = mocked_conn(enum_response('<IRETURNVALUE/>'))
+
+    # The code to be tested
+    columns = conn.EnumerateInstancesColumnar('CIM_Foo')
+
+    assert len(columns) == 0
+    assert not columns.properties
+    assert not columns.keybindings
+
+
+def test_enumerate_instances_columnar_error():
+    """
+    Test WBEMConnection.EnumerateInstancesColumnar() with failing operations
+    and invalid responses.
+    """
+    conn = mocked_conn(enum_response(
+        '<ERROR CODE="5" DESCRIPTION="Invalid class"/>'))
+    with pytest.raises(CIMError) as exc_info:
+
+        # The code to be tested
+        conn.EnumerateInstancesColumnar('CIM_Foo')
+
+    assert exc_info.value.status_code == 5
+
+    conn = mocked_conn(enum_response(
+        '<IRETURNVALUE><INSTANCENAME CLASSNAME="CIM_Foo"/></IRETURNVALUE>'))
+    with pytest.raises(CIMXMLParseError, match="Expecting VALUE.NAMEDINSTANCE"):
+
+        # The code to be tested
+        conn.EnumerateInstancesColumnar('CIM_Foo')
+
+    with pytest.raises(TypeError):
+
+        # The code to be tested
+        conn.EnumerateInstancesColumnar(None)
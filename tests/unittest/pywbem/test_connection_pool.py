@@ -0,0 +1,259 @@
+"""
+Test the WBEMConnectionPool class.
+"""
+
+import re
+import threading
+import time
+from concurrent.futures import CancelledError
+
+import pytest
+import requests_mock
+
+from ..utils.pytest_extensions import simplified_test_function
+
+# pylint: disable=wrong-import-position, wrong-import-order, invalid-name
+from ...utils import import_installed
+pywbem = import_installed('pywbem')
+from pywbem import WBEMConnectionPool, PoolResult, CIMError, \
+    CIM_ERR_NOT_FOUND  # noqa: E402
+# pylint: enable=wrong-import-position, wrong-import-order, invalid-name
+
+# Literal form {"blah: 0} faster than dict(blah=0) but same functionality
+# pylint: disable=use-dict-literal
+
+
+def getclass_response(request, context):
+    # pylint: disable=unused-argument
+    """
+    requests_mock callback that returns the CIM-XML response for a GetClass
+    request. Class CIM_Missing is returned as a CIM_ERR_NOT_FOUND error.
+    """
+    classname = re.search(r'<CLASSNAME NAME="(\w+)"', request.text).group(1)
+    if classname == 'CIM_Missing':
+        result = '<ERROR CODE="6" DESCRIPTION="Class not found"/>'
+    else:
+        result = f'<IRETURNVALUE><CLASS NAME="{classname}"/></IRETURNVALUE>'
+    return (
+        '<?xml version="1.0" encoding="utf-8" ?>\n'
+        '<CIM CIMVERSION="2.0" DTDVERSION="2.0">'
+        '<MESSAGE ID="1001" PROTOCOLVERSION="1.0"><SIMPLERSP>'
+        f'<IMETHODRESPONSE NAME="GetClass">{result}</IMETHODRESPONSE>'
+        '</SIMPLERSP></MESSAGE></CIM>').encode('utf-8')
+
+
+def mock_connection(pool, url, creds=None):
+    """
+    Create the connection of the pool for the URL, with a mocked HTTP layer
+    that responds to GetClass requests.
+    """
+    conn = pool.get_connection(url, creds)
+    adapter = requests_mock.Adapter()
+    adapter.register_uri(
+        'POST', requests_mock.ANY, content=getclass_response,
+        status_code=200,
+        headers={'Content-type': 'application/xml; charset="utf-8"'})
+    conn.session.mount('http://', adapter)
+    return conn
+
+
+def test_pool_map():
+    """
+    Test WBEMConnectionPool.map() with a WBEM operation name.
+    """
+    urls = [f'http://srv{i}' for i in range(5)]
+    with WBEMConnectionPool(max_workers=3, max_per_server=2) as pool:
+        for url in urls:
+            mock_connection(pool, url)
+
+        # The code to be tested
+        results = list(pool.map(urls, 'GetClass', 'CIM_Foo',
+                                namespace='root/cimv2'))
+
+        assert len(pool.connections) == 5
+
+    assert pool.closed
+    assert sorted(res.server for res in results) == urls
+    for res in results:
+        assert isinstance(res, PoolResult)
+        assert res.exception is None
+        assert res.result.classname == 'CIM_Foo'
+
+
+def test_pool_map_exception():
+    """
+    Test that WBEMConnectionPool.map() returns the exceptions raised by the
+    operation, and uses the credentials of the servers.
+    """
+    with WBEMConnectionPool(default_namespace='root/cimv2') as pool:
+        conn1 = mock_connection(pool, 'http://srv1', ('user1', 'pw1'))
+        conn2 = mock_connection(pool, 'http://srv1', ('user2', 'pw2'))
+        servers = [('http://srv1', ('user1', 'pw1')),
+                   ('http://srv1', ('user2', 'pw2'))]
+
+        # The code to be tested
+        results = list(pool.map(servers, 'GetClass', 'CIM_Missing'))
+
+    assert conn1 is not conn2
+    assert conn1.creds == ('user1', 'pw1')
+    assert conn2.creds == ('user2', 'pw2')
+    assert sorted(res.server for res in results) == servers
+    for res in results:
+        assert res.result is None
+        assert isinstance(res.exception, CIMError)
+        assert res.exception.status_code == CIM_ERR_NOT_FOUND
+
+
+def test_pool_concurrency():
+    """
+    Test that WBEMConnectionPool bounds the number of operations in progress
+    per WBEM server and in total.
+    """
+    max_workers = 6
+    max_per_server = 2
+    running = {}
+    max_running = {}
+    lock = threading.Lock()
+
+    def operation(conn, duration):
+        with lock:
+            running[conn.url] = running.get(conn.url, 0) + 1
+            running['total'] = running.get('total', 0) + 1
+            for key in (conn.url, 'total'):
+                max_running[key] = max(max_running.get(key, 0), running[key])
+        time.sleep(duration)
+        with lock:
+            running[conn.url] -= 1
+            running['total'] -= 1
+        return conn.url
+
+    urls = [f'http://srv{i}' for i in range(5)] * 3
+    with WBEMConnectionPool(max_workers, max_per_server) as pool:
+
+        # The code to be tested
+        results = list(pool.map(urls, operation, 0.05))
+
+    assert len(results) == 15
+    for res in results:
+        assert res.exception is None
+        assert res.result == f'{res.server}:5988'
+    assert max_running.pop('total') <= max_workers
+    for value in max_running.values():
+        assert value <= max_per_server
+
+
+def test_pool_submit():
+    """
+    Test WBEMConnectionPool.submit() with a callable operation that returns
+    a generator.
+    """
+
+    def operation(conn, classnames):
+        for classname in classnames:
+            yield conn.GetClass(classname).classname
+
+    with WBEMConnectionPool() as pool:
+        conn = mock_connection(pool, 'http://srv1')
+
+        # The code to be tested
+        future = pool.submit('http://srv1:5988', operation, ['C1', 'C2'])
+
+        assert future.result() == ['C1', 'C2']
+        assert conn.thread_safe is True
+        assert pool.get_connection('HTTP://srv1') is conn
+
+
+def test_pool_close():
+    """
+    Test that closing a WBEMConnectionPool cancels the operations that have
+    not been started.
+    """
+    started = threading.Event()
+    release = threading.Event()
+
+    def operation(conn):  # pylint: disable=unused-argument
+        started.set()
+        release.wait()
+        return 42
+
+    pool = WBEMConnectionPool(max_workers=2, max_per_server=1)
+    future1 = pool.submit('http://srv1', operation)
+    future2 = pool.submit('http://srv1', operation)
+    started.wait()
+    threading.Timer(0.1, release.set).start()
+
+    # The code to be tested
+    pool.close()
+
+    assert future1.result() == 42
+    assert future2.cancelled()
+    with pytest.raises(CancelledError):
+        future2.result()
+    with pytest.raises(RuntimeError):
+        pool.submit('http://srv1', operation)
+    pool.close()
+
+
+TESTCASES_POOL_INVALID = [
+
+    # Testcases for test_pool_invalid()
+    #
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * init_kwargs: Keyword arguments for WBEMConnectionPool().
+    #   * operation: Operation for WBEMConnectionPool.submit().
+    # * exp_exc_types: Expected exception type(s), or None.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "Invalid max_workers",
+        dict(init_kwargs=dict(max_workers=0), operation='GetClass'),
+        ValueError, None, True
+    ),
+    (
+        "Invalid max_per_server",
+        dict(init_kwargs=dict(max_per_server='2'), operation='GetClass'),
+        ValueError, None, True
+    ),
+    (
+        "thread_safe connection argument",
+        dict(init_kwargs=dict(thread_safe=False), operation='GetClass'),
+        TypeError, None, True
+    ),
+    (
+        "Unknown WBEMConnection method",
+        dict(init_kwargs={}, operation='GetFoo'),
+        ValueError, None, True
+    ),
+    (
+        "Internal WBEMConnection method",
+        dict(init_kwargs={}, operation='_imethodcall'),
+        ValueError, None, True
+    ),
+    (
+        "Operation with invalid type",
+        dict(init_kwargs={}, operation=42),
+        TypeError, None, True
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_POOL_INVALID)
+@simplified_test_function
+def test_pool_invalid(testcase, init_kwargs, operation):
+    """
+    Test WBEMConnectionPool() and WBEMConnectionPool.submit() with invalid
+    parameters.
+    """
+
+    # The code to be tested
+    with WBEMConnectionPool(**init_kwargs) as pool:
+        pool.submit('http://srv1', operation)
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
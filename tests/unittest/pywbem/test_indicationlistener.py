@@ -6,6 +6,8 @@ Test _listener.py module.
 
 import sys
 import re
+import gzip
+import zlib
 import logging
 import threading
 from time import time, sleep
@@ -29,7 +31,7 @@ pywbem = import_installed('pywbem')
 from pywbem import WBEMListener, ListenerPortError, \
     ListenerQueueFullError  # noqa: E402
 from pywbem._listener import ExceptionHandlingThread, StoppableThread, \
-    ServerThread, CallbackThread  # noqa: E402
+    ServerThread, CallbackThread, ListenerRequestHandler  # noqa: E402
 from pywbem._utils import _format  # noqa: E402
 # pylint: enable=wrong-import-position, wrong-import-order, invalid-name
 
@@ -90,6 +92,7 @@ TESTCASES_WBEMLISTENER_INIT = [
                 certfile='certfile.pem',
                 keyfile='keyfile.pem',
                 max_ind_queue_size=9,
+                direct_decode=True,
             ),
             exp_attrs=dict(
                 host='woot.com',
@@ -97,7 +100,8 @@ TESTCASES_WBEMLISTENER_INIT = [
                 https_port=6998,
                 certfile='certfile.pem',
                 keyfile='keyfile.pem',
-                max_ind_queue_size=9
+                max_ind_queue_size=9,
+                direct_decode=True,
 
             ),
         ),
@@ -269,6 +273,23 @@ TESTCASES_WBEMLISTENER_INIT = [
         ),
         None, None, True
     ),
+    (
+        "Verify valid max_request_size argument",
+        dict(
+            init_args=[],
+            init_kwargs=dict(
+                host='woot.com',
+                http_port=6997,
+                max_request_size=0,
+            ),
+            exp_attrs=dict(
+                host='woot.com',
+                http_port=6997,
+                max_request_size=0,
+            ),
+        ),
+        None, None, True
+    ),
 
     # Failure cases
     (
@@ -366,6 +387,45 @@ TESTCASES_WBEMLISTENER_INIT = [
         ),
         ValueError, None, True
     ),
+    (
+        "Verify failure when providing invalid type max_request_size",
+        dict(
+            init_args=[],
+            init_kwargs=dict(
+                host='woot.com',
+                http_port=6997,
+                max_request_size="fred",
+            ),
+            exp_attrs=None,
+        ),
+        TypeError, None, True
+    ),
+    (
+        "Verify failure when providing bool for max_request_size",
+        dict(
+            init_args=[],
+            init_kwargs=dict(
+                host='woot.com',
+                http_port=6997,
+                max_request_size=True,
+            ),
+            exp_attrs=None,
+        ),
+        TypeError, None, True
+    ),
+    (
+        "Verify failure when providing invalid max_request_size integer",
+        dict(
+            init_args=[],
+            init_kwargs=dict(
+                host='woot.com',
+                http_port=6997,
+                max_request_size=-1,
+            ),
+            exp_attrs=None,
+        ),
+        ValueError, None, True
+    ),
 ]
 
 
@@ -494,6 +554,13 @@ def test_WBEMListener_repr(obj):
     exp_logger_str = _format('_logger={0!A}', obj.logger)
     assert exp_logger_str in result
 
+    exp_direct_decode_str = _format('_direct_decode={0!A}', obj.direct_decode)
+    assert exp_direct_decode_str in result
+
+    exp_max_request_size_str = _format(
+        '_max_request_size={0!A}', obj.max_request_size)
+    assert exp_max_request_size_str in result
+
 
 @log_entry_exit
 def test_WBEMListener_start_stop():
@@ -626,6 +693,24 @@ def create_indication_data(msg_id, sequence_number, delta_time, protocol_ver):
         protocol_ver=protocol_ver, msg_id=msg_id)
 
 
+@log_entry_exit
+def test_parse_export_request_direct_decode():
+    """
+    Test that ListenerRequestHandler.parse_export_request() returns the same
+    result with and without direct_decode.
+    """
+    request_str = create_indication_data(1, 42, 0, '1.4')
+
+    exp_result = ListenerRequestHandler.parse_export_request(request_str)
+
+    # The code to be tested
+    result = ListenerRequestHandler.parse_export_request(
+        request_str, direct_decode=True)
+
+    assert result == exp_result
+    assert result[2]['NewIndication']['SequenceNumber'] == '42'
+
+
 # Verbosity in test_WBEMListener_send_indications(). If True show summary
 # information for each test
 VERBOSE_SUMMARY = False
@@ -1150,6 +1235,112 @@ def test_WBEMListener_incorrect_headers(desc, headers, exp_status, exp_headers):
         listener.stop()
 
 
+@pytest.mark.parametrize(
+    "content_encoding, compress_func, max_request_size, exp_status, "
+    "exp_details", [
+        ('gzip', gzip.compress, 4096, 200, None),
+        ('deflate', zlib.compress, 4096, 200, None),
+        ('gzip', lambda data: b'invalid', 4096, 400,
+         r'Cannot decompress the request body '),
+        ('gzip', lambda data: gzip.compress(data)[:-10], 4096, 400,
+         r'Cannot decompress the request body '),
+        ('gzip', lambda data: gzip.compress(data + b' ' * 1000000), 4096,
+         413, r'The decompressed body exceeds the maximum size of 4096 '),
+        ('gzip', lambda data: gzip.compress(data + b' ' * 1000000), 0,
+         200, None),
+        ('gzip', lambda data: gzip.compress(data) + b' ' * 5000, 4096,
+         413, r'The request body of [0-9]+ Bytes exceeds the maximum size '),
+        ('identity', lambda data: data + b' ' * 5000, 4096, 200, None),
+    ]
+)
+@log_entry_exit
+def test_WBEMListener_compressed_request(
+        content_encoding, compress_func, max_request_size, exp_status,
+        exp_details):
+    """
+    Verify that WBEMListener accepts indications with a compressed request
+    body, and rejects invalid compressed request bodies and request bodies
+    that exceed the maximum size.
+    """
+
+    host = 'localhost'
+    http_port = 50000
+    url = f'http://{host}:{http_port}'
+    headers = {
+        'Content-Type': 'application/xml; charset=utf-8',
+        'Content-Encoding': content_encoding,
+        'CIMExport': 'MethodRequest',
+        'CIMExportMethod': 'ExportIndication',
+        'Accept-Encoding': 'Identity',
+        'CIMProtocolVersion': '1.4',
+    }
+    payload = create_indication_data(42, 0, 0, '1.4').encode('utf-8')
+    received = []
+
+    listener = WBEMListener(host, http_port,
+                            max_request_size=max_request_size)
+    try:
+        listener.add_callback(
+            lambda indication, host: received.append(indication))
+        listener.start()
+
+        # The code to be tested is running in listener thread
+        response = post_bsl(url, headers=headers, data=compress_func(payload))
+
+        assert response.status_code == exp_status
+        if exp_status == 400:
+            assert response.headers['CIMError'] == 'request-not-well-formed'
+        if exp_details is not None:
+            assert re.match(exp_details, response.headers['CIMErrorDetails'])
+        else:
+            for _ in range(50):
+                if received:
+                    break
+                sleep(0.1)
+            assert len(received) == 1
+            assert received[0]['SequenceNumber'] == '0'
+
+    finally:
+        listener.stop()
+
+
+@log_entry_exit
+def test_WBEMListener_compressed_export():
+    """
+    Verify that a WBEMConnection sends a compressed ExportIndication request
+    that is accepted by WBEMListener.
+    """
+
+    host = 'localhost'
+    http_port = 50000
+    received = []
+
+    listener = WBEMListener(host, http_port)
+    try:
+        listener.add_callback(
+            lambda indication, host: received.append(indication))
+        listener.start()
+
+        conn = pywbem.WBEMConnection(
+            f'http://{host}:{http_port}', request_compression_threshold=0)
+        indication = pywbem.CIMInstance(
+            'CIM_AlertIndication', {'Severity': 'high' * 100})
+
+        # The code to be tested
+        conn.ExportIndication(indication)
+
+        assert conn.request_compression_threshold == 0
+        for _ in range(50):
+            if received:
+                break
+            sleep(0.1)
+        assert len(received) == 1
+        assert received[0]['Severity'] == 'high' * 100
+
+    finally:
+        listener.stop()
+
+
 WBEMLISTENER_INCORRECT_PAYLOAD1_TESTCASES = [
     (
         "Ill-formed XML in payload",
@@ -19,9 +19,11 @@ It does not test for valid parameters if the parameters are tested by lower
 level methods because those are the methods that are mocked.
 """
 
-from unittest.mock import Mock
+import io
+from unittest.mock import Mock, patch
 
 import pytest
+import requests_mock
 
 from ..utils.pytest_extensions import log_entry_exit
 
@@ -30,7 +32,7 @@ from ...utils import import_installed
 pywbem = import_installed('pywbem')
 from pywbem import WBEMConnection, CIMInstance, CIMClass, CIMInstanceName, \
     CIMClassName, CIMProperty, CIMError, CIM_ERR_NOT_SUPPORTED, \
-    CIM_ERR_FAILED  # noqa: E402
+    CIM_ERR_FAILED, CIM_ERR_INVALID_ENUMERATION_CONTEXT  # noqa: E402
 from pywbem.config import DEFAULT_ITER_MAXOBJECTCOUNT  # noqa: E402
 from pywbem._cim_operations import pull_inst_result_tuple, \
     pull_path_result_tuple, pull_query_result_tuple  # noqa: E402
@@ -193,7 +195,8 @@ class TestIterEnumerateInstances:
             DeepInheritance=di,
             IncludeQualifiers=iq,
             IncludeClassOrigin=ico,
-            PropertyList=pl)
+            PropertyList=pl,
+            enforce_property_list=False)
 
         assert conn._use_enum_inst_pull_operations is False
         assert conn.use_pull_operations == use_pull_param
@@ -306,7 +309,8 @@ class TestIterEnumerateInstances:
             FilterQuery=fq,
             OperationTimeout=ot,
             ContinueOnError=coe,
-            MaxObjectCount=moc)
+            MaxObjectCount=moc,
+            enforce_property_list=False)
 
         conn.CloseEnumeration.assert_not_called()
 
@@ -922,7 +926,8 @@ class TestIterReferenceInstances:
             Role=ro,
             IncludeQualifiers=iq,
             IncludeClassOrigin=ico,
-            PropertyList=pl)
+            PropertyList=pl,
+            enforce_property_list=False)
 
         assert conn._use_ref_inst_pull_operations is False
         assert conn.use_pull_operations == use_pull_param
@@ -1042,7 +1047,8 @@ class TestIterReferenceInstances:
             FilterQuery=fq,
             OperationTimeout=ot,
             ContinueOnError=coe,
-            MaxObjectCount=moc)
+            MaxObjectCount=moc,
+            enforce_property_list=False)
 
         conn.CloseEnumeration.assert_not_called()
 
@@ -1667,7 +1673,8 @@ class TestIterAssociatorInstances:
             ResultRole=rr,
             IncludeQualifiers=iq,
             IncludeClassOrigin=ico,
-            PropertyList=pl)
+            PropertyList=pl,
+            enforce_property_list=False)
 
         assert conn._use_assoc_inst_pull_operations is False
         assert conn.use_pull_operations == use_pull_param
@@ -1791,7 +1798,8 @@ class TestIterAssociatorInstances:
             FilterQuery=fq,
             OperationTimeout=ot,
             ContinueOnError=coe,
-            MaxObjectCount=moc)
+            MaxObjectCount=moc,
+            enforce_property_list=False)
 
         conn.CloseEnumeration.assert_not_called()
 
@@ -2705,3 +2713,635 @@ class TestIterQueryInstances:
             conn.IterQueryInstances(
                 'CQL', 'Select from *',
                 **kwargs)
+
+
+########################################################################
+#
+#               Prefetch tests for the Iter...Instances methods
+#
+########################################################################
+
+def make_inst(instanceid):
+    """Return an instance of CIM_Foo with the InstanceID value."""
+    return CIMInstance(
+        'CIM_Foo',
+        properties=[CIMProperty('InstanceID', instanceid, type='string')],
+        path=CIMInstanceName('CIM_Foo', keybindings={'InstanceID': instanceid},
+                             namespace='root/cimv2'))
+
+
+class PagedEnumeration:
+    # pylint: disable=too-few-public-methods
+    """
+    Mock for an enumeration session whose open result and pull results each
+    return one page of instances.
+    """
+
+    def __init__(self, page_count, page_size, namespace):
+        self.pages = [[make_inst(f'{p}-{i}') for i in range(page_size)]
+                      for p in range(page_count)]
+        self.namespace = namespace
+        self.returned = []  # pull results returned by pull()
+
+    def result(self, page):
+        """Return the pull result tuple for a page index."""
+        eos = page == len(self.pages) - 1
+        ctx = None if eos else (f'ctx{page}', self.namespace)
+        return pull_query_result_tuple(
+            instances=list(self.pages[page]), eos=eos, context=ctx,
+            query_result_class=None)
+
+    def pull(self, context, MaxObjectCount):
+        # pylint: disable=invalid-name,unused-argument
+        """Side effect for the mocked Pull...() method."""
+        page = int(context[0][3:]) + 1
+        result = self.result(page)
+        self.returned.append(result)
+        return result
+
+    @property
+    def instances(self):
+        """All instances of the enumeration."""
+        return [inst for page in self.pages for inst in page]
+
+
+TESTCASES_ITER_PREFETCH = [
+    # Testcases for the prefetch parameter of Iter...Instances methods
+    # Each list item is a tuple with these items:
+    # * iter_method: Name of the Iter...() method
+    # * iter_args: Positional args for the Iter...() method
+    # * open_method: Name of the Open...() method
+    # * pull_method: Name of the Pull...() method
+
+    ('IterEnumerateInstances', ['CIM_Foo'],
+     'OpenEnumerateInstances', 'PullInstancesWithPath'),
+    ('IterAssociatorInstances', [CIMInstanceName('CIM_Foo')],
+     'OpenAssociatorInstances', 'PullInstancesWithPath'),
+    ('IterReferenceInstances', [CIMInstanceName('CIM_Foo')],
+     'OpenReferenceInstances', 'PullInstancesWithPath'),
+    ('IterQueryInstances', ['DMTF:CQL', 'SELECT * FROM CIM_Foo'],
+     'OpenQueryInstances', 'PullInstances'),
+]
+
+
+def iter_result(conn, iter_method, iter_args, **kwargs):
+    """Call the Iter...() method and return a generator for the result."""
+    result = getattr(conn, iter_method)(*iter_args, **kwargs)
+    if iter_method == 'IterQueryInstances':
+        return result.generator
+    return result
+
+
+@pytest.mark.parametrize(
+    "iter_method, iter_args, open_method, pull_method",
+    TESTCASES_ITER_PREFETCH)
+@pytest.mark.parametrize(
+    "page_count", [1, 2, 5]
+)
+@pytest.mark.parametrize(
+    "prefetch", [None, 1, 3]
+)
+def test_iter_prefetch_success(iter_method, iter_args, open_method,
+                               pull_method, page_count, prefetch):
+    """
+    Test the prefetch parameter of the Iter...Instances methods when the
+    generator is exhausted.
+    """
+    conn = WBEMConnection('dummy', use_pull_operations=True)
+    enum = PagedEnumeration(page_count, 3, conn.default_namespace)
+
+    setattr(conn, open_method, Mock(return_value=enum.result(0)))
+    setattr(conn, pull_method, Mock(side_effect=enum.pull))
+    conn.CloseEnumeration = Mock()
+
+    result = list(iter_result(conn, iter_method, iter_args,
+                              MaxObjectCount=3, prefetch=prefetch))
+
+    assert result == enum.instances
+    assert getattr(conn, pull_method).call_count == page_count - 1
+    conn.CloseEnumeration.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "iter_method, iter_args, open_method, pull_method",
+    TESTCASES_ITER_PREFETCH)
+@pytest.mark.parametrize(
+    "close_after", [1, 4, 7]
+)
+@pytest.mark.parametrize(
+    "prefetch", [1, 3]
+)
+def test_iter_prefetch_closed(iter_method, iter_args, open_method,
+                              pull_method, close_after, prefetch):
+    """
+    Test the prefetch parameter of the Iter...Instances methods when the
+    generator is closed before it is exhausted. The enumeration session must
+    be closed using the enumeration context of the most recent pull result.
+    """
+    conn = WBEMConnection('dummy', use_pull_operations=True)
+    enum = PagedEnumeration(10, 3, conn.default_namespace)
+
+    setattr(conn, open_method, Mock(return_value=enum.result(0)))
+    setattr(conn, pull_method, Mock(side_effect=enum.pull))
+    conn.CloseEnumeration = Mock()
+
+    gen = iter_result(conn, iter_method, iter_args, MaxObjectCount=3,
+                      prefetch=prefetch)
+    result = [next(gen) for _ in range(close_after)]
+    gen.close()
+
+    assert result == enum.instances[0:close_after]
+    # The background thread does not pull more than prefetch pages ahead
+    consumed_pages = (close_after + 2) // 3
+    assert len(enum.returned) <= consumed_pages - 1 + prefetch
+    last_result = enum.returned[-1] if enum.returned else enum.result(0)
+    conn.CloseEnumeration.assert_called_once_with(last_result.context)
+
+
+@pytest.mark.parametrize(
+    "iter_method, iter_args, open_method, pull_method",
+    TESTCASES_ITER_PREFETCH)
+def test_iter_prefetch_pull_error(iter_method, iter_args, open_method,
+                                  pull_method):
+    """
+    Test that an exception raised by a prefetched pull operation is raised
+    to the caller iterating the generator.
+    """
+    conn = WBEMConnection('dummy', use_pull_operations=True)
+    enum = PagedEnumeration(3, 3, conn.default_namespace)
+
+    setattr(conn, open_method, Mock(return_value=enum.result(0)))
+    setattr(conn, pull_method,
+            Mock(side_effect=CIMError(CIM_ERR_FAILED, 'Blah')))
+    conn.CloseEnumeration = Mock()
+
+    gen = iter_result(conn, iter_method, iter_args, MaxObjectCount=3,
+                      prefetch=2)
+    with pytest.raises(CIMError) as exc_info:
+        _ = list(gen)
+
+    assert exc_info.value.status_code == CIM_ERR_FAILED
+    conn.CloseEnumeration.assert_called_once_with(enum.result(0).context)
+
+
+@pytest.mark.parametrize(
+    "iter_method, iter_args, open_method, pull_method",
+    TESTCASES_ITER_PREFETCH)
+def test_iter_prefetch_pull_close_error(iter_method, iter_args, open_method,
+                                        pull_method):
+    """
+    Test that the exception raised by a prefetched pull operation is raised
+    to the caller also if closing the enumeration session fails.
+    """
+    conn = WBEMConnection('dummy', use_pull_operations=True)
+    enum = PagedEnumeration(3, 3, conn.default_namespace)
+
+    setattr(conn, open_method, Mock(return_value=enum.result(0)))
+    setattr(conn, pull_method,
+            Mock(side_effect=CIMError(CIM_ERR_FAILED, 'Blah')))
+    conn.CloseEnumeration = Mock(
+        side_effect=CIMError(CIM_ERR_INVALID_ENUMERATION_CONTEXT, 'Blah'))
+
+    gen = iter_result(conn, iter_method, iter_args, MaxObjectCount=3,
+                      prefetch=2)
+    with pytest.raises(CIMError) as exc_info:
+        _ = list(gen)
+
+    assert exc_info.value.status_code == CIM_ERR_FAILED
+    conn.CloseEnumeration.assert_called_once_with(enum.result(0).context)
+
+
+@pytest.mark.parametrize(
+    "iter_method, iter_args, open_method, pull_method",
+    TESTCASES_ITER_PREFETCH)
+def test_iter_prefetch_connection(iter_method, iter_args, open_method,
+                                  pull_method):
+    """
+    Test that the prefetched pull operations are performed on a private copy
+    of the connection and not on the connection itself.
+    """
+    conn = WBEMConnection('dummy', use_pull_operations=True)
+    enum = PagedEnumeration(4, 3, conn.default_namespace)
+    pull_conns = []
+
+    def pull(self, context, MaxObjectCount):
+        # pylint: disable=invalid-name
+        """Side effect for the mocked Pull...() method."""
+        pull_conns.append(self)
+        return enum.pull(context, MaxObjectCount)
+
+    setattr(conn, open_method, Mock(return_value=enum.result(0)))
+    conn.CloseEnumeration = Mock()
+
+    with patch.object(WBEMConnection, pull_method, autospec=True,
+                      side_effect=pull):
+        result = list(iter_result(conn, iter_method, iter_args,
+                                  MaxObjectCount=3, prefetch=2))
+
+    assert result == enum.instances
+    assert len(pull_conns) == 3
+    for pull_conn in pull_conns:
+        assert pull_conn is not conn
+        # pylint: disable=protected-access
+        assert pull_conn._op_state is not conn._op_state
+        assert pull_conn.session is conn.session
+        assert pull_conn.statistics is conn.statistics
+        assert not pull_conn.operation_recorders
+
+
+@pytest.mark.parametrize(
+    "iter_method, iter_args, open_method, pull_method",
+    TESTCASES_ITER_PREFETCH)
+@pytest.mark.parametrize(
+    "prefetch, exp_exc",
+    [
+        (0, ValueError),
+        (-1, ValueError),
+        ('bla', TypeError),
+        (True, TypeError),
+        (False, TypeError),
+    ]
+)
+def test_iter_prefetch_invalid(iter_method, iter_args, open_method,
+                               pull_method, prefetch, exp_exc):
+    # pylint: disable=unused-argument
+    """
+    Test the Iter...Instances methods with invalid prefetch parameters.
+    """
+    conn = WBEMConnection('dummy', use_pull_operations=True)
+
+    with pytest.raises(exp_exc):
+        _ = list(iter_result(conn, iter_method, iter_args, prefetch=prefetch))
+
+
+########################################################################
+#
+#               Streamed traditional operations in Iter... methods
+#
+########################################################################
+
+class TrackingBody(io.RawIOBase):
+    """
+    Raw HTTP response body that records how many bytes have been read.
+    """
+
+    def __init__(self, data):
+        super().__init__()
+        self.data = data
+        self.pos = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        chunk = self.data[self.pos:self.pos + len(b)]
+        b[:len(chunk)] = chunk
+        self.pos += len(chunk)
+        return len(chunk)
+
+
+def enum_response(method_name, items_xml):
+    """Return the CIM-XML response for an intrinsic operation."""
+    return (
+        '<?xml version="1.0" encoding="utf-8" ?>\n'
+        '<CIM CIMVERSION="2.0" DTDVERSION="2.0">'
+        '<MESSAGE ID="1001" PROTOCOLVERSION="1.0"><SIMPLERSP>'
+        f'<IMETHODRESPONSE NAME="{method_name}">'
+        f'{items_xml}'
+        '</IMETHODRESPONSE></SIMPLERSP></MESSAGE></CIM>').encode('utf-8')
+
+
+def streamed_conn(body):
+    """
+    Return a WBEMConnection that streams responses and does not use pull
+    operations, with a mocked HTTP layer returning the body.
+    """
+    conn = WBEMConnection('http://dummy', use_pull_operations=False,
+                          stream_response=True)
+    adapter = requests_mock.Adapter()
+    adapter.register_uri(
+        'POST', 'http://dummy:5988/cimom', body=body, status_code=200,
+        headers={'Content-type': 'application/xml; charset="utf-8"'})
+    conn.session.mount('http://', adapter)
+    return conn
+
+
+def local_path(inst):
+    """Return a copy of the instance path without namespace and host."""
+    path = inst.path.copy()
+    path.namespace = None
+    path.host = None
+    return path
+
+
+@pytest.mark.parametrize(
+    "iter_method, method_name, count",
+    [
+        ('IterEnumerateInstances', 'EnumerateInstances', 0),
+        ('IterEnumerateInstances', 'EnumerateInstances', 5),
+        ('IterEnumerateInstancePaths', 'EnumerateInstanceNames', 0),
+        ('IterEnumerateInstancePaths', 'EnumerateInstanceNames', 5),
+    ]
+)
+@pytest.mark.parametrize(
+    "direct_decode",
+    [False, True]
+)
+def test_iter_streamed_success(iter_method, method_name, count, direct_decode):
+    """
+    Test the Iter... methods with streamed traditional operations.
+    """
+    insts = [make_inst(str(i)) for i in range(count)]
+    if method_name == 'EnumerateInstances':
+        items = ''.join(
+            '<VALUE.NAMEDINSTANCE>'
+            f'{local_path(inst).tocimxmlstr()}'
+            f'{inst.tocimxmlstr(ignore_path=True)}'
+            '</VALUE.NAMEDINSTANCE>'
+            for inst in insts)
+    else:
+        items = ''.join(local_path(inst).tocimxmlstr() for inst in insts)
+    for inst in insts:
+        inst.path.host = 'dummy:5988'
+        inst.properties['InstanceID'].propagated = False  # as parsed
+    if method_name == 'EnumerateInstances':
+        exp_result = insts
+    else:
+        exp_result = [inst.path for inst in insts]
+    body = enum_response(method_name, f'<IRETURNVALUE>{items}</IRETURNVALUE>')
+    conn = streamed_conn(TrackingBody(body))
+    conn.stats_enabled = True
+    conn.direct_decode = direct_decode
+
+    result = list(getattr(conn, iter_method)('CIM_Foo'))
+
+    assert result == exp_result
+    assert conn.last_reply_len == len(body)
+    assert conn.statistics.get_op_statistic(method_name).count == 1
+
+
+def test_iter_streamed_incremental():
+    """
+    Test that IterEnumerateInstances with a streamed EnumerateInstances
+    operation yields the first instance before the complete response has been
+    read.
+    """
+    insts = [make_inst(str(i) * 100) for i in range(2000)]
+    items = ''.join(
+        '<VALUE.NAMEDINSTANCE>'
+        f'{local_path(inst).tocimxmlstr()}'
+            f'{inst.tocimxmlstr(ignore_path=True)}'
+        '</VALUE.NAMEDINSTANCE>'
+        for inst in insts)
+    body = TrackingBody(enum_response(
+        'EnumerateInstances', f'<IRETURNVALUE>{items}</IRETURNVALUE>'))
+    conn = streamed_conn(body)
+
+    gen = conn.IterEnumerateInstances('CIM_Foo')
+    first = next(gen)
+
+    assert first.path.keybindings['InstanceID'] == '0' * 100
+    assert body.pos < len(body.data) // 2
+    gen.close()
+
+
+@pytest.mark.parametrize(
+    "iter_method, method_name, response, exp_exc",
+    [
+        ('IterEnumerateInstances', 'EnumerateInstances',
+         '<ERROR CODE="5" DESCRIPTION="Invalid class"/>',
+         CIMError),
+        ('IterEnumerateInstancePaths', 'EnumerateInstanceNames',
+         '<ERROR CODE="5" DESCRIPTION="Invalid class"/>',
+         CIMError),
+        ('IterEnumerateInstances', 'EnumerateInstances',
+         '<IRETURNVALUE><INSTANCENAME CLASSNAME="CIM_Foo"/></IRETURNVALUE>',
+         pywbem.CIMXMLParseError),
+        ('IterEnumerateInstancePaths', 'EnumerateInstanceNames',
+         '<IRETURNVALUE><INSTANCENAME CLASSNAME="CIM_Foo"></IRETURNVALUE>',
+         pywbem.XMLParseError),
+    ]
+)
+@pytest.mark.parametrize(
+    "direct_decode",
+    [False, True]
+)
+def test_iter_streamed_error(iter_method, method_name, response, exp_exc,
+                             direct_decode):
+    """
+    Test the Iter... methods with streamed traditional operations that fail.
+    """
+    conn = streamed_conn(TrackingBody(enum_response(method_name, response)))
+    conn.direct_decode = direct_decode
+
+    with pytest.raises(exp_exc):
+        _ = list(getattr(conn, iter_method)('CIM_Foo'))
+
+
+########################################################################
+#
+#               Enforced PropertyList in IterEnumerateInstances
+#
+########################################################################
+
+def make_full_inst(instanceid):
+    """
+    Return a CIM_Foo instance with an instance path with namespace and host,
+    and with properties of all kinds in addition to those of make_inst().
+    """
+    inst = make_inst(instanceid)
+    inst.path.host = 'dummy:5988'
+    inst.properties['P1'] = CIMProperty('P1', 'a')
+    inst.properties['P2'] = CIMProperty('P2', [1, 2], type='uint8')
+    inst.properties['P3'] = CIMProperty(
+        'P3', CIMInstanceName('CIM_Bar', keybindings={'K': 'v'}))
+    return inst
+
+
+def pull_response(method_name, insts, context):
+    """
+    Return the CIM-XML response for an open or pull operation returning
+    instances with path, where context None means end of sequence.
+    """
+    items = ''.join(inst.tocimxmlstr() for inst in insts)
+    eos = 'TRUE' if context is None else 'FALSE'
+    params = (
+        '<PARAMVALUE NAME="EndOfSequence" PARAMTYPE="boolean">'
+        f'<VALUE>{eos}</VALUE></PARAMVALUE>')
+    if context is not None:
+        params += (
+            '<PARAMVALUE NAME="EnumerationContext" PARAMTYPE="string">'
+            f'<VALUE>{context}</VALUE></PARAMVALUE>')
+    return enum_response(
+        method_name, f'<IRETURNVALUE>{items}</IRETURNVALUE>{params}')
+
+
+@pytest.mark.parametrize(
+    "use_pull, stream_response",
+    [
+        (True, False),
+        (True, True),
+        (False, False),
+        (False, True),
+    ]
+)
+@pytest.mark.parametrize(
+    "direct_decode",
+    [False, True]
+)
+@pytest.mark.parametrize(
+    "property_list, enforce_property_list, exp_prop_names",
+    [
+        (['instanceid', 'P2'], True, ['InstanceID', 'P2']),
+        ([], True, []),
+        (None, True, ['InstanceID', 'P1', 'P2', 'P3']),
+        (['P2'], False, ['InstanceID', 'P1', 'P2', 'P3']),
+    ]
+)
+def test_iter_enforce_property_list(
+        use_pull, stream_response, direct_decode, property_list,
+        enforce_property_list, exp_prop_names):
+    """
+    Test IterEnumerateInstances with the enforce_property_list parameter,
+    against a server that ignores the PropertyList parameter.
+    """
+    insts = [make_full_inst(str(i)) for i in range(4)]
+    if use_pull:
+        responses = [
+            pull_response('OpenEnumerateInstances', insts[0:2], 'ctx1'),
+            pull_response('PullInstancesWithPath', insts[2:4], None),
+        ]
+    else:
+        items = ''.join(
+            '<VALUE.NAMEDINSTANCE>'
+            f'{local_path(inst).tocimxmlstr()}'
+            f'{inst.tocimxmlstr(ignore_path=True)}'
+            '</VALUE.NAMEDINSTANCE>'
+            for inst in insts)
+        responses = [enum_response(
+            'EnumerateInstances', f'<IRETURNVALUE>{items}</IRETURNVALUE>')]
+    conn = WBEMConnection('http://dummy', use_pull_operations=use_pull,
+                          stream_response=stream_response,
+                          direct_decode=direct_decode)
+    adapter = requests_mock.Adapter()
+    adapter.register_uri(
+        'POST', 'http://dummy:5988/cimom',
+        [dict(content=response, status_code=200,
+              headers={'Content-type': 'application/xml; charset="utf-8"'})
+         for response in responses])
+    conn.session.mount('http://', adapter)
+
+    result = list(conn.IterEnumerateInstances(
+        'CIM_Foo', PropertyList=property_list,
+        enforce_property_list=enforce_property_list))
+
+    assert [inst.path for inst in result] == [inst.path for inst in insts]
+    for inst, exp_inst in zip(result, insts):
+        assert list(inst.properties) == exp_prop_names
+        for pname in exp_prop_names:
+            assert inst[pname] == exp_inst[pname]
+    # pylint: disable=protected-access
+    assert not conn._pull_property_filters
+
+
+def test_open_enforce_property_list_close():
+    """
+    Test that closing an enumeration session that was opened with
+    enforce_property_list removes its property filter.
+    """
+    insts = [make_full_inst(str(i)) for i in range(2)]
+    responses = [
+        pull_response('OpenEnumerateInstances', insts, 'ctx1'),
+        enum_response('CloseEnumeration', ''),
+    ]
+    conn = WBEMConnection('http://dummy')
+    adapter = requests_mock.Adapter()
+    adapter.register_uri(
+        'POST', 'http://dummy:5988/cimom',
+        [dict(content=response, status_code=200,
+              headers={'Content-type': 'application/xml; charset="utf-8"'})
+         for response in responses])
+    conn.session.mount('http://', adapter)
+
+    result = conn.OpenEnumerateInstances(
+        'CIM_Foo', PropertyList=['P1'], enforce_property_list=True)
+
+    assert [list(inst.properties) for inst in result.instances] == \
+        [['P1'], ['P1']]
+    # pylint: disable=protected-access
+    assert conn._pull_property_filters == {'ctx1': {'p1'}}
+
+    conn.CloseEnumeration(result.context)
+
+    assert not conn._pull_property_filters
+
+
+@pytest.mark.parametrize(
+    "iter_method, open_method, trad_method",
+    [
+        ('IterAssociatorInstances', 'OpenAssociatorInstances', 'Associators'),
+        ('IterReferenceInstances', 'OpenReferenceInstances', 'References'),
+    ]
+)
+@pytest.mark.parametrize(
+    "use_pull",
+    [True, False]
+)
+@pytest.mark.parametrize(
+    "direct_decode",
+    [False, True]
+)
+@pytest.mark.parametrize(
+    "property_list, enforce_property_list, exp_prop_names",
+    [
+        (['instanceid', 'P2'], True, ['InstanceID', 'P2']),
+        ([], True, []),
+        (None, True, ['InstanceID', 'P1', 'P2', 'P3']),
+        (['P2'], False, ['InstanceID', 'P1', 'P2', 'P3']),
+    ]
+)
+def test_iter_assoc_enforce_property_list(
+        iter_method, open_method, trad_method, use_pull, direct_decode,
+        property_list, enforce_property_list, exp_prop_names):
+    """
+    Test IterAssociatorInstances and IterReferenceInstances with the
+    enforce_property_list parameter, against a server that ignores the
+    PropertyList parameter.
+    """
+    insts = [make_full_inst(str(i)) for i in range(4)]
+    if use_pull:
+        responses = [
+            pull_response(open_method, insts[0:2], 'ctx1'),
+            pull_response('PullInstancesWithPath', insts[2:4], None),
+        ]
+    else:
+        items = ''.join(
+            '<VALUE.OBJECTWITHPATH>'
+            f'{inst.path.tocimxmlstr()}'
+            f'{inst.tocimxmlstr(ignore_path=True)}'
+            '</VALUE.OBJECTWITHPATH>'
+            for inst in insts)
+        responses = [enum_response(
+            trad_method, f'<IRETURNVALUE>{items}</IRETURNVALUE>')]
+    conn = WBEMConnection('http://dummy', use_pull_operations=use_pull,
+                          direct_decode=direct_decode)
+    adapter = requests_mock.Adapter()
+    adapter.register_uri(
+        'POST', 'http://dummy:5988/cimom',
+        [dict(content=response, status_code=200,
+              headers={'Content-type': 'application/xml; charset="utf-8"'})
+         for response in responses])
+    conn.session.mount('http://', adapter)
+
+    result = list(getattr(conn, iter_method)(
+        CIMInstanceName('CIM_Foo', keybindings={'InstanceID': 'src'}),
+        PropertyList=property_list,
+        enforce_property_list=enforce_property_list))
+
+    assert [inst.path for inst in result] == [inst.path for inst in insts]
+    for inst, exp_inst in zip(result, insts):
+        assert list(inst.properties) == exp_prop_names
+        for pname in exp_prop_names:
+            assert inst[pname] == exp_inst[pname]
+    # pylint: disable=protected-access
+    assert not conn._pull_property_filters
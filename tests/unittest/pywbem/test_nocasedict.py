@@ -9,6 +9,7 @@ from ..utils.pytest_extensions import simplified_test_function, log_entry_exit
 # pylint: disable=wrong-import-position, wrong-import-order, invalid-name
 from ...utils import import_installed
 pywbem = import_installed('pywbem')
+from pywbem import _nocasedict  # noqa: E402
 from pywbem._nocasedict import NocaseDict  # noqa: E402
 # pylint: enable=wrong-import-position, wrong-import-order, invalid-name
 
@@ -189,3 +190,224 @@ def test_NocaseDict_unnamedkeys_pop(testcase, allow, key):
     assert testcase.exp_exc_types is None
 
     assert key not in obj  # Uses __contains__()
+
+
+TESTCASES_NOCASEDICT_FROM_ITEMS = [
+
+    # Testcases for NocaseDict.from_items()
+
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * items: Iterable of items for from_items().
+    #   * allow: allow_unnamed_keys argument for from_items().
+    #   * exp_items: Expected list of items of the NocaseDict object.
+    # * exp_exc_types: Expected exception type(s), or None.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "Empty list of items",
+        dict(
+            items=[],
+            allow=False,
+            exp_items=[],
+        ),
+        None, None, True
+    ),
+    (
+        "Two items from a list, order is preserved",
+        dict(
+            items=[('Dog', 'Cat'), ('Budgie', 'Fish')],
+            allow=False,
+            exp_items=[('Dog', 'Cat'), ('Budgie', 'Fish')],
+        ),
+        None, None, True
+    ),
+    (
+        "Two items from a generator",
+        dict(
+            items=(item for item in [('Dog', 'Cat'), ('Budgie', 'Fish')]),
+            allow=False,
+            exp_items=[('Dog', 'Cat'), ('Budgie', 'Fish')],
+        ),
+        None, None, True
+    ),
+    (
+        "Key that occurs twice in different lexical case, last one wins",
+        dict(
+            items=[('Dog', 'Cat'), ('Budgie', 'Fish'), ('DOG', 'Mouse')],
+            allow=False,
+            exp_items=[('DOG', 'Mouse'), ('Budgie', 'Fish')],
+        ),
+        None, None, True
+    ),
+    (
+        "Unnamed key with unnamed keys allowed",
+        dict(
+            items=[(None, 'Cat')],
+            allow=True,
+            exp_items=[(None, 'Cat')],
+        ),
+        None, None, True
+    ),
+    (
+        "Item that is not a tuple(key, value) (error)",
+        dict(
+            items=['Dog'],
+            allow=False,
+            exp_items=None,
+        ),
+        ValueError, None, True
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_NOCASEDICT_FROM_ITEMS)
+@simplified_test_function
+@log_entry_exit
+def test_NocaseDict_from_items(testcase, items, allow, exp_items):
+    """
+    Test function for NocaseDict.from_items()
+    """
+
+    # The code to be tested
+    obj = NocaseDict.from_items(items, allow_unnamed_keys=allow)
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    assert isinstance(obj, NocaseDict)
+    assert obj.allow_unnamed_keys == allow
+    assert list(obj.items()) == exp_items
+    for key, value in exp_items:
+        if key is not None:
+            assert obj[key.swapcase()] == value
+
+
+@pytest.mark.parametrize(
+    "allow",
+    [False, True])
+@log_entry_exit
+def test_NocaseDict_copy(allow):
+    """
+    Test function for NocaseDict.copy()
+    """
+    obj = NocaseDict([('Dog', 'Cat'), ('Budgie', 'Fish')])
+    obj.allow_unnamed_keys = allow
+
+    # The code to be tested
+    obj_copy = obj.copy()
+
+    assert isinstance(obj_copy, NocaseDict)
+    assert obj_copy.allow_unnamed_keys == allow
+    assert list(obj_copy.items()) == list(obj.items())
+    assert list(obj_copy.keys()) == ['Dog', 'Budgie']
+    assert list(obj_copy.values()) == ['Cat', 'Fish']
+    assert list(obj_copy) == ['Dog', 'Budgie']
+
+    obj_copy['dog'] = 'Mouse'
+    assert obj['Dog'] == 'Cat'
+
+
+@log_entry_exit
+def test_NocaseDict_casefolded_keys_cache():
+    """
+    Test that the keys of NocaseDict objects are casefolded using the cache
+    of casefolded keys, and that the cache is bounded.
+    """
+    # pylint: disable=protected-access
+    _nocasedict._CASEFOLDED_KEYS.clear()
+
+    obj1 = NocaseDict([('PyWBEM_CachedKey', 1)])
+    obj2 = NocaseDict([('pywbem_cachedkey', 2)])
+
+    assert _nocasedict._CASEFOLDED_KEYS['PyWBEM_CachedKey'] == \
+        'pywbem_cachedkey'
+    assert obj1['PYWBEM_CACHEDKEY'] == 1
+    assert obj2['PyWBEM_CachedKey'] == 2
+    assert obj1 != obj2
+
+    for i in range(_nocasedict._CASEFOLDED_KEYS_MAX + 1):
+        _ = NocaseDict([(f'Key{i}', i)])
+    assert len(_nocasedict._CASEFOLDED_KEYS) <= \
+        _nocasedict._CASEFOLDED_KEYS_MAX
+
+
+class _PrefixNocaseDict(NocaseDict):
+    # pylint: disable=too-few-public-methods
+    """
+    NocaseDict that ignores a 'x_' prefix of its keys, for testing that the
+    key lookups use _casefolded_key().
+    """
+
+    def _casefolded_key(self, key):
+        key = super()._casefolded_key(key)
+        return key[2:] if key.startswith('x_') else key
+
+
+@log_entry_exit
+def test_NocaseDict_casefolded_key_override():
+    """
+    Test that the key lookups of NocaseDict use the _casefolded_key() method,
+    so that subclasses can override it.
+    """
+    obj = _PrefixNocaseDict([('Dog', 'Cat')])
+    obj['X_Budgie'] = 'Fish'
+
+    assert obj['x_dog'] == 'Cat'
+    assert obj['budgie'] == 'Fish'
+    assert 'X_Dog' in obj
+    assert len(obj) == 2
+
+    obj = _PrefixNocaseDict.from_items([('X_Dog', 'Cat'), ('dog', 'Mouse')])
+
+    assert list(obj.items()) == [('dog', 'Mouse')]
+
+
+@log_entry_exit
+def test_NocaseDict_copy_subclass():
+    """
+    Test that NocaseDict.copy() of a subclass object returns an object of the
+    subclass.
+    """
+    obj = _PrefixNocaseDict([('Dog', 'Cat')])
+
+    # The code to be tested
+    obj_copy = obj.copy()
+
+    assert obj_copy.__class__ is _PrefixNocaseDict
+    assert obj_copy['x_dog'] == 'Cat'
+
+
+class _StateNocaseDict(NocaseDict):
+    # pylint: disable=too-few-public-methods
+    """
+    NocaseDict with state that is set in its init method, for testing that
+    NocaseDict.copy() initializes the copy.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.state = 'init'
+
+
+@log_entry_exit
+def test_NocaseDict_copy_subclass_init():
+    """
+    Test that NocaseDict.copy() of a subclass object calls the init method
+    of the subclass.
+    """
+    obj = _StateNocaseDict([('Dog', 'Cat')])
+    obj.allow_unnamed_keys = True
+
+    # The code to be tested
+    obj_copy = obj.copy()
+
+    assert obj_copy.__class__ is _StateNocaseDict
+    assert obj_copy.state == 'init'
+    assert obj_copy.allow_unnamed_keys is True
+    assert list(obj_copy.items()) == [('Dog', 'Cat')]
@@ -4,6 +4,7 @@
 Measure performance of equality tests.
 """
 
+import os
 import statistics
 from time import process_time, get_clock_info
 
@@ -86,7 +87,7 @@ TESTCASES_PERF_EQ = [
     "desc, obj1, obj2",
     TESTCASES_PERF_EQ)
 @log_entry_exit
-def test_perf_eq(desc, obj1, obj2):
+def test_perf_eq(desc, obj1, obj2, tmp_path):
     """
     Measure performance of equality tests.
     """
@@ -94,7 +95,7 @@ def test_perf_eq(desc, obj1, obj2):
     if not process_time:
         pytest.skip("Performance test must be run on Python 3.3 or higher")
 
-    outfile = 'perf_equality.log'
+    outfile = perf_logfile(tmp_path, 'perf_equality.log')
     precision = 0.01  # Desired precision of measured time
     num = 10  # Repetitions for neglecting function overhead
 
@@ -117,6 +118,20 @@ def test_perf_eq(desc, obj1, obj2):
                  f"{num_runs} runs with {num_out} outliers)\n")
 
 
+def perf_logfile(tmp_path, filename):
+    """
+    Return the path name of the log file for the results of a performance
+    test.
+
+    The log file is in the directory specified in the TEST_PERF_LOGDIR
+    environment variable, or in the temporary directory of the test if that
+    is not set, so that running the tests does not leave files in the
+    current directory.
+    """
+    logdir = os.getenv('TEST_PERF_LOGDIR', None) or tmp_path
+    return os.path.join(logdir, filename)
+
+
 def timeit(measure_func, precision):
     """
     Measure the process time for measure_func with the desired precision, and
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+
+"""
+Measure performance of NocaseDict operations.
+"""
+
+from time import process_time
+
+import pytest
+
+from ..utils.pytest_extensions import log_entry_exit
+from .test_perf_equality import timeit, perf_logfile
+
+# pylint: disable=wrong-import-position, wrong-import-order, invalid-name
+from tests.utils import import_installed
+pywbem = import_installed('pywbem')
+from pywbem._nocasedict import NocaseDict  # noqa: E402
+# pylint: enable=wrong-import-position, wrong-import-order, invalid-name
+
+# Items of the dictionaries used for the measurements, similar to the
+# properties of a CIM instance.
+ITEMS = [(f'Property{i}', f'Value{i}') for i in range(20)]
+KEYS = [key for key, _ in ITEMS]
+LOWER_KEYS = [key.lower() for key in KEYS]
+
+
+def get_items(ncd):
+    "Get the value of each item, using keys in a different lexical case"
+    for key in LOWER_KEYS:
+        _ = ncd[key]
+
+
+def set_items(ncd):
+    "Set the value of each item"
+    for key, value in ITEMS:
+        ncd[key] = value
+
+
+def contains_items(ncd):
+    "Test whether each key is in the dictionary"
+    for key in LOWER_KEYS:
+        _ = key in ncd
+
+
+def iterate_keys(ncd):
+    "Iterate through the keys"
+    for _ in ncd:
+        pass
+
+
+def iterate_items(ncd):
+    "Iterate through the items"
+    for _ in ncd.items():
+        pass
+
+
+def copy_dict(ncd):
+    "Copy the dictionary"
+    _ = ncd.copy()
+
+
+def init_dict(ncd):  # pylint: disable=unused-argument
+    "Create a dictionary from items"
+    _ = NocaseDict(ITEMS)
+
+
+def from_items(ncd):  # pylint: disable=unused-argument
+    "Create a dictionary from trusted items"
+    _ = NocaseDict.from_items(ITEMS)
+
+
+TESTCASES_PERF_NOCASEDICT = [
+
+    # Testcases for performance tests for NocaseDict operations
+
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * func: Function with the operation to be measured, that is called with
+    #   a NocaseDict object with the items in ITEMS.
+    ("NocaseDict get of 20 items", get_items),
+    ("NocaseDict set of 20 items", set_items),
+    ("NocaseDict contains of 20 items", contains_items),
+    ("NocaseDict iterate 20 keys", iterate_keys),
+    ("NocaseDict iterate 20 items", iterate_items),
+    ("NocaseDict copy with 20 items", copy_dict),
+    ("NocaseDict init with 20 items", init_dict),
+    ("NocaseDict from_items with 20 items", from_items),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, func",
+    TESTCASES_PERF_NOCASEDICT)
+@log_entry_exit
+def test_perf_nocasedict(desc, func, tmp_path):
+    """
+    Measure performance of NocaseDict operations.
+    """
+
+    if not process_time:
+        pytest.skip("Performance test must be run on Python 3.3 or higher")
+
+    outfile = perf_logfile(tmp_path, 'perf_nocasedict.log')
+    precision = 0.01  # Desired precision of measured time
+    num = 10  # Repetitions for neglecting function overhead
+
+    ncd = NocaseDict(ITEMS)
+
+    def measure():
+        "One measurement"
+        for _ in range(num):
+            # The code to be measured
+            func(ncd)
+
+    t_us, stdev_us, num_runs, num_out = timeit(measure, precision)
+
+    # Scale back to the code to be measured
+    t_us /= num
+    stdev_us /= num
+
+    stdev_pct = 100.0 * stdev_us / t_us if t_us != 0 else 0.0
+
+    with open(outfile, 'a', encoding='utf-8') as fp:
+        fp.write(f"{desc}: {t_us:.3f} us (std.dev. {stdev_pct:.1f}% in "
+                 f"{num_runs} runs with {num_out} outliers)\n")
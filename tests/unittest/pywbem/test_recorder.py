@@ -8,6 +8,7 @@ Unit tests for the recorder functions (_recorder.py module).
 
 import sys
 import os
+import threading
 import logging
 import logging.handlers
 import warnings
@@ -36,7 +37,8 @@ from pywbem import CIMInstanceName, CIMInstance, CIMClassName, CIMClass, \
     Uint8, Uint16, Uint32, Uint64, Sint8, Sint16, \
     Sint32, Sint64, Real32, Real64, CIMDateTime, MinutesFromUTC, CIMError, \
     HTTPError, WBEMConnection, LogOperationRecorder, BaseOperationRecorder, \
-    configure_logger, DEFAULT_TIMEOUT  # noqa: E402
+    CIMNumericArray, InstanceColumns, configure_logger, \
+    DEFAULT_TIMEOUT  # noqa: E402
 # Renamed the following import to not have py.test pick it up as a test class:
 from pywbem import TestClientRecorder as _TestClientRecorder  # noqa: E402
 from pywbem._cim_operations import pull_path_result_tuple, \
@@ -863,6 +865,38 @@ def test_BaseOperationRecorder_enable_disable():
         assert recorder.enabled is True
 
 
+def test_BaseOperationRecorder_staged_threads():
+    """
+    Test that BaseOperationRecorder stages the operation data separately for
+    each thread.
+    """
+    # pylint: disable=protected-access
+
+    with open(os.devnull, 'w', encoding='utf-8') as fp:
+
+        recorder = _TestClientRecorder(fp)
+        recorder.reset()
+        recorder.stage_pywbem_args('GetInstance', InstanceName='a')
+        other = {}
+
+        def thread_func():
+            other['before'] = recorder._pywbem_method
+            recorder.reset(pull_op=True)
+            recorder.stage_pywbem_args('GetClass', ClassName='b')
+            other['after'] = (recorder._pywbem_method, recorder._pywbem_args,
+                              recorder._pull_op)
+
+        thread = threading.Thread(target=thread_func)
+        thread.start()
+        thread.join()
+
+        assert other['before'] is None
+        assert other['after'] == ('GetClass', {'ClassName': 'b'}, True)
+        assert recorder._pywbem_method == 'GetInstance'
+        assert recorder._pywbem_args == {'InstanceName': 'a'}
+        assert recorder._pull_op is None
+
+
 TESTCASES_BASEOPERATIONRECORDER_OPEN_FILE = [
 
     # Testcases for BaseOperationRecorder.open_file()
@@ -943,6 +977,13 @@ def test_BaseOperationRecorder_open_file(testcase, text, exp_bytes):
     os.remove(tmp_filename)
 
 
+def instance_columns(*instances):
+    """Return an InstanceColumns object with the instances."""
+    columns = InstanceColumns()
+    columns.add_instances(instances)
+    return columns
+
+
 TESTCASES_TESTCLIENTRECORDER_TOYAML = [
 
     # Testcases for TestClientRecorder.toyaml()
@@ -1286,6 +1327,35 @@ TESTCASES_TESTCLIENTRECORDER_TOYAML = [
         ),
         None, None, True
     ),
+    (
+        "CIMNumericArray object",
+        dict(
+            obj=CIMNumericArray('uint16', [1, 2]),
+            exp_yaml=[1, 2],
+        ),
+        None, None, True
+    ),
+    (
+        "InstanceColumns object",
+        dict(
+            obj=instance_columns(
+                CIMInstance(
+                    'CIM_Foo',
+                    properties=[CIMProperty('P1', Uint8(42))],
+                    path=CIMInstanceName('CIM_Foo', {'K1': 'a'})),
+                CIMInstance(
+                    'CIM_Foo',
+                    properties=[CIMProperty('P1', None, type='uint8')],
+                    path=CIMInstanceName('CIM_Foo', {'K1': 'b'})),
+            ),
+            exp_yaml=dict(
+                classnames=['CIM_Foo', 'CIM_Foo'],
+                keybindings=dict(K1=['a', 'b']),
+                properties=dict(P1=[42, None]),
+            ),
+        ),
+        None, None, True
+    ),
 ]
 
 
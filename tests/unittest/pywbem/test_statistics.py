@@ -6,6 +6,8 @@ Tests for statistics (`_statistics` in pywbem module).
 
 import re
 import time
+import pickle
+import threading
 
 import pytest
 
@@ -434,6 +436,72 @@ def test_Statistics_measure_avg():
         assert stats.avg_reply_len == 300
 
 
+@log_entry_exit
+def test_Statistics_measure_threads():
+    """
+    Test measuring time of the same operation in multiple threads at the same
+    time.
+    """
+
+    statistics = Statistics()
+    statistics.enable()
+
+    duration = 1.0
+    num_threads = 4
+    started = threading.Barrier(num_threads)
+
+    def thread_func():
+        stats = statistics.start_timer('GetInstance')
+        started.wait()
+        time.sleep(duration)
+        stats.stop_timer(100, 200)
+
+    threads = [threading.Thread(target=thread_func)
+               for _ in range(num_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for _, stats in statistics.snapshot():
+        assert stats.count == num_threads
+        assert_time_range(stats.min_time, duration)
+        assert_time_range(stats.max_time, duration)
+    assert statistics.reset() is True
+
+
+@log_entry_exit
+def test_Statistics_lock():
+    """
+    Test that each statistics container has its own lock, so that updating
+    the statistics of one container does not wait for other containers, and
+    that copies of a container get their own lock.
+    """
+    # pylint: disable=protected-access
+
+    statistics1 = Statistics(enable=True)
+    statistics2 = Statistics(enable=True)
+    assert statistics1._lock is not statistics2._lock
+
+    def thread_func():
+        stats = statistics2.start_timer('GetInstance')
+        stats.stop_timer(100, 200)
+
+    with statistics1._lock:
+        thread = threading.Thread(target=thread_func)
+        thread.start()
+        thread.join(timeout=10)
+        assert not thread.is_alive()
+
+    for _, stats in statistics2.snapshot():
+        assert stats.count == 1
+        assert stats.container._lock is not statistics2._lock
+
+    statistics_copy = pickle.loads(pickle.dumps(statistics2))
+    assert statistics_copy._lock is not statistics2._lock
+    assert statistics_copy.get_op_statistic('GetInstance').count == 1
+
+
 @log_entry_exit
 def test_Statistics_measure_exception():
     """
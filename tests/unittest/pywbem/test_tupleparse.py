@@ -10,15 +10,17 @@ from ..utils.pytest_extensions import simplified_test_function, log_entry_exit
 # pylint: disable=wrong-import-position, wrong-import-order, invalid-name
 from ...utils import import_installed
 pywbem = import_installed('pywbem')
-from pywbem import _tupletree, _tupleparse  # noqa: E402
+from pywbem import _tupletree, _tupleparse, _tupledecode  # noqa: E402
 from pywbem import CIMInstance, CIMInstanceName, CIMClass, CIMClassName, \
     CIMProperty, CIMMethod, CIMParameter, CIMQualifier, \
-    CIMQualifierDeclaration, \
+    CIMQualifierDeclaration, CIMInstanceLayout, CIMQualifierCache, \
+    NocaseDict, \
     CIMDateTime, Uint8, Sint8, Uint16, Sint16, Uint32, Sint32, Uint64, Sint64, \
-    Real32, Real64, XMLParseError, CIMXMLParseError, \
+    Real32, Real64, CIMNumericArray, XMLParseError, CIMXMLParseError, \
     ToleratedServerIssueWarning, MissingKeybindingsWarning, \
     CIMVersionError, DTDVersionError, ProtocolVersionError, \
     __version__  # noqa: E402
+from pywbem._tupleparse import _LazyPropertyDict  # noqa: E402
 # pylint: enable=wrong-import-position, wrong-import-order, invalid-name
 
 # Literal form {"blah: 0} faster than dict(blah=0) but same functionality
@@ -612,6 +614,31 @@ def test_tupleparse_roundtrip(testcase, obj):
     assert parsed_obj == obj, f"CIM-XML of input obj:\n{xml_str}"
 
 
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_TUPLEPARSE_ROUNDTRIP)
+@simplified_test_function
+@log_entry_exit
+def test_tupledecode_roundtrip(testcase, obj):
+    """
+    Test TupleDecoder decoding based upon roundtrip between CIM objects and
+    their CIM-XML, with the same testcases as test_tupleparse_roundtrip().
+    """
+
+    xml_str = obj.tocimxml().toxml()
+    tp = _tupledecode.TupleDecoder()
+    tt = _tupletree.xml_to_tupletree_expat(xml_str, 'Test-XML', decoder=tp)
+
+    # The code to be tested
+    parsed_obj = tp.parse_any(tt)
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    assert parsed_obj == obj, f"CIM-XML of input obj:\n{xml_str}"
+
+
 # Note: These XML testcases cover the full set of possibilities for each
 # CIM-XML element, including invalid input.
 TESTCASES_TUPLEPARSE_XML = [
@@ -12165,7 +12192,7 @@ TESTCASES_TUPLEPARSE_XML = [
         CIMXMLParseError, None, True
     ),
     (
-        "MESSAGE with MULTIRSP child element (not implemented)",
+        "MESSAGE with MULTIRSP child element without children (invalid)",
         dict(
             xml_str=''
             '<MESSAGE ID="42" PROTOCOLVERSION="1.4">'
@@ -12581,9 +12608,11 @@ TESTCASES_TUPLEPARSE_XML = [
         CIMXMLParseError, None, True
     ),
 
-    # MULTIRSP tests: Parsing this element is not implemented
+    # MULTIRSP tests:
+    #
+    #   <!ELEMENT MULTIRSP (SIMPLERSP, SIMPLERSP+)>
     (
-        "MULTIRSP (not implemented)",
+        "MULTIRSP without child elements (invalid)",
         dict(
             xml_str=''
             '<MULTIRSP/>',
@@ -12591,6 +12620,74 @@ TESTCASES_TUPLEPARSE_XML = [
         ),
         CIMXMLParseError, None, True
     ),
+    (
+        "MULTIRSP with one SIMPLERSP child (invalid)",
+        dict(
+            xml_str=''
+            '<MULTIRSP>'
+            '  <SIMPLERSP>'
+            '    <IMETHODRESPONSE NAME="M1"/>'
+            '  </SIMPLERSP>'
+            '</MULTIRSP>',
+            exp_result=None,
+        ),
+        CIMXMLParseError, None, True
+    ),
+    (
+        "MULTIRSP with invalid child element",
+        dict(
+            xml_str=''
+            '<MULTIRSP>'
+            '  <SIMPLERSP>'
+            '    <IMETHODRESPONSE NAME="M1"/>'
+            '  </SIMPLERSP>'
+            '  <XXX/>'
+            '</MULTIRSP>',
+            exp_result=None,
+        ),
+        CIMXMLParseError, None, True
+    ),
+    (
+        "MULTIRSP with two SIMPLERSP children",
+        dict(
+            xml_str=''
+            '<MULTIRSP>'
+            '  <SIMPLERSP>'
+            '    <IMETHODRESPONSE NAME="M1">'
+            '      <IRETURNVALUE/>'
+            '    </IMETHODRESPONSE>'
+            '  </SIMPLERSP>'
+            '  <SIMPLERSP>'
+            '    <METHODRESPONSE NAME="M2"/>'
+            '  </SIMPLERSP>'
+            '</MULTIRSP>',
+            exp_result=(
+                'MULTIRSP',
+                {},
+                [
+                    (
+                        'SIMPLERSP',
+                        {},
+                        (
+                            'IMETHODRESPONSE', {'NAME': 'M1'},
+                            [
+                                ('IRETURNVALUE', {}, []),
+                            ],
+                        ),
+                    ),
+                    (
+                        'SIMPLERSP',
+                        {},
+                        (
+                            'METHODRESPONSE', {'NAME': 'M2'},
+                            [],
+                        ),
+                    ),
+                ],
+            ),
+        ),
+        None, None, True
+    ),
 
     # MULTIEXPRSP tests: Parsing this element is not implemented
     (
@@ -15311,3 +15408,1010 @@ def test_tupleparse_xml(testcase, xml_str, exp_result):
     assert testcase.exp_exc_types is None
 
     assert result == exp_result, f"Input CIM-XML:\n{xml_str}"
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_TUPLEPARSE_XML)
+@simplified_test_function
+@log_entry_exit
+def test_tupledecode_xml(testcase, xml_str, exp_result):
+    """
+    Test TupleDecoder decoding, based upon a CIM-XML string as input, with
+    the same testcases as test_tupleparse_xml().
+
+    The input CIM-XML string is decoded while it is parsed, and the result is
+    compared with an expected result.
+    """
+
+    tp = _tupledecode.TupleDecoder()
+
+    # The code to be tested
+    tt = _tupletree.xml_to_tupletree_expat(xml_str, 'Test-XML', decoder=tp)
+    result = tp.parse_any(tt)
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    assert result == exp_result, f"Input CIM-XML:\n{xml_str}"
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_TUPLEPARSE_ROUNDTRIP)
+@simplified_test_function
+@log_entry_exit
+def test_tupleparse_fast_roundtrip(testcase, obj):
+    """
+    Test tupleparse parsing with the 'fast' validation level based upon
+    roundtrip between CIM objects and their CIM-XML, with the same testcases
+    as test_tupleparse_roundtrip().
+    """
+
+    xml_str = obj.tocimxml().toxml()
+    tt = _tupletree.xml_to_tupletree_expat(xml_str, 'Test-XML')
+
+    tp = _tupleparse.TupleParser(validation='fast')
+
+    # The code to be tested
+    parsed_obj = tp.parse_any(tt)
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    assert parsed_obj == obj, f"CIM-XML of input obj:\n{xml_str}"
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    # The valid testcases of test_tupleparse_xml(). The 'fast' validation
+    # level does not detect all invalid CIM-XML, and does not issue the
+    # warnings for tolerated server issues.
+    [tc for tc in TESTCASES_TUPLEPARSE_XML
+     if tc[2] is None and tc[3] is None])
+@simplified_test_function
+@log_entry_exit
+def test_tupleparse_fast_xml(testcase, xml_str, exp_result):
+    """
+    Test tupleparse parsing with the 'fast' validation level, based upon a
+    CIM-XML string as input, with the valid testcases of
+    test_tupleparse_xml().
+    """
+
+    tt = _tupletree.xml_to_tupletree_expat(xml_str, 'Test-XML')
+
+    tp = _tupleparse.TupleParser(validation='fast')
+
+    # The code to be tested
+    result = tp.parse_any(tt)
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    assert result == exp_result, f"Input CIM-XML:\n{xml_str}"
+
+
+TESTCASES_TUPLEPARSE_FAST_INVALID = [
+
+    # Testcases for test_tupleparse_fast_invalid()
+    #
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * xml_str: Input CIM-XML string.
+    #   * exp_exc_regex: Regexp for the message of the expected exception.
+    # * exp_exc_types: Expected exception type(s), or None. The expected
+    #   CIMXMLParseError is verified in the test function.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "INSTANCE with missing required attribute CLASSNAME",
+        dict(
+            xml_str='<INSTANCE/>',
+            exp_exc_regex="missing required attribute 'CLASSNAME'",
+        ),
+        None, None, True
+    ),
+    (
+        "PROPERTY with missing required attribute TYPE",
+        dict(
+            xml_str='<INSTANCE CLASSNAME="C1">'
+            '<PROPERTY NAME="P1"><VALUE>a</VALUE></PROPERTY>'
+            '</INSTANCE>',
+            exp_exc_regex="missing required attribute 'TYPE'",
+        ),
+        None, None, True
+    ),
+    (
+        "VALUE.NAMEDINSTANCE without child elements",
+        dict(
+            xml_str='<VALUE.NAMEDINSTANCE/>',
+            exp_exc_regex="invalid number of child elements",
+        ),
+        None, None, True
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_TUPLEPARSE_FAST_INVALID)
+@simplified_test_function
+@log_entry_exit
+def test_tupleparse_fast_invalid(testcase, xml_str, exp_exc_regex):
+    """
+    Test that tupleparse parsing with the 'fast' validation level still
+    detects missing required attributes and wrong numbers of child elements.
+    """
+
+    tt = _tupletree.xml_to_tupletree_expat(xml_str, 'Test-XML')
+
+    tp = _tupleparse.TupleParser(validation='fast')
+
+    with pytest.raises(CIMXMLParseError, match=exp_exc_regex):
+
+        # The code to be tested
+        tp.parse_any(tt)
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+
+def test_tupleparse_invalid_validation():
+    """
+    Test that TupleParser raises ValueError for an invalid validation level.
+    """
+    with pytest.raises(ValueError, match="Invalid validation level 'lax'"):
+        _tupleparse.TupleParser(validation='lax')
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_TUPLEPARSE_ROUNDTRIP)
+@simplified_test_function
+@log_entry_exit
+def test_tupleparse_lazy_roundtrip(testcase, obj):
+    """
+    Test tupleparse parsing in the lazy_instances mode based upon roundtrip
+    between CIM objects and their CIM-XML, with the same testcases as
+    test_tupleparse_roundtrip().
+    """
+
+    xml_str = obj.tocimxml().toxml()
+    tt = _tupletree.xml_to_tupletree_expat(xml_str, 'Test-XML')
+
+    tp = _tupleparse.TupleParser(lazy_instances=True)
+
+    # The code to be tested
+    parsed_obj = tp.parse_any(tt)
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    assert parsed_obj == obj, f"CIM-XML of input obj:\n{xml_str}"
+    assert obj == parsed_obj, f"CIM-XML of input obj:\n{xml_str}"
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_TUPLEPARSE_ROUNDTRIP)
+@simplified_test_function
+@log_entry_exit
+def test_tupledecode_lazy_roundtrip(testcase, obj):
+    """
+    Test TupleDecoder decoding in the lazy_instances mode based upon
+    roundtrip between CIM objects and their CIM-XML, with the same testcases
+    as test_tupleparse_roundtrip().
+    """
+
+    xml_str = obj.tocimxml().toxml()
+    tp = _tupledecode.TupleDecoder(lazy_instances=True)
+    tt = _tupletree.xml_to_tupletree_expat(xml_str, 'Test-XML', decoder=tp)
+
+    # The code to be tested
+    parsed_obj = tp.parse_any(tt)
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    assert parsed_obj == obj, f"CIM-XML of input obj:\n{xml_str}"
+    assert obj == parsed_obj, f"CIM-XML of input obj:\n{xml_str}"
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    # The valid testcases of test_tupleparse_xml(). In the lazy_instances
+    # mode, errors and warnings for property elements are raised when the
+    # properties are accessed.
+    [tc for tc in TESTCASES_TUPLEPARSE_XML
+     if tc[2] is None and tc[3] is None])
+@simplified_test_function
+@log_entry_exit
+def test_tupleparse_lazy_xml(testcase, xml_str, exp_result):
+    """
+    Test tupleparse parsing in the lazy_instances mode, based upon a CIM-XML
+    string as input, with the valid testcases of test_tupleparse_xml().
+    """
+
+    tt = _tupletree.xml_to_tupletree_expat(xml_str, 'Test-XML')
+
+    tp = _tupleparse.TupleParser(lazy_instances=True)
+
+    # The code to be tested
+    result = tp.parse_any(tt)
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    assert result == exp_result, f"Input CIM-XML:\n{xml_str}"
+
+
+def test_tupleparse_lazy_access():
+    """
+    Test that the properties of an instance parsed in the lazy_instances mode
+    are parsed when they are accessed, and that errors in property elements
+    are raised when the property is accessed.
+    """
+    xml_str = (
+        '<INSTANCE CLASSNAME="C1">'
+        '<PROPERTY NAME="P1" TYPE="uint32"><VALUE>42</VALUE></PROPERTY>'
+        '<PROPERTY.ARRAY NAME="P2" TYPE="string">'
+        '<VALUE.ARRAY><VALUE>a</VALUE></VALUE.ARRAY></PROPERTY.ARRAY>'
+        '<PROPERTY NAME="P3" TYPE="uint32"><VALUE>bad</VALUE></PROPERTY>'
+        '</INSTANCE>')
+    tt = _tupletree.xml_to_tupletree_expat(xml_str, 'Test-XML')
+    tp = _tupleparse.TupleParser(lazy_instances=True)
+
+    inst = tp.parse_any(tt)
+
+    # pylint: disable=protected-access
+    data = inst.properties._data
+    assert list(inst) == ['P1', 'P2', 'P3']
+    assert all(isinstance(item[1], tuple) for item in data.values())
+
+    assert inst['p1'] == 42
+    assert isinstance(data['p1'][1], CIMProperty)
+    assert isinstance(data['p2'][1], tuple)
+    assert inst.properties['P1'] is inst.properties['P1']
+
+    with pytest.raises(CIMXMLParseError):
+        _ = inst['P3']
+    with pytest.raises(CIMXMLParseError):
+        inst.tomof()
+
+    del inst['P3']
+    assert inst.tomof() == \
+        'instance of C1 {\n   P1 = 42;\n   P2 = { "a" };\n};\n'
+
+
+def test_tupleparse_lazy_copy():
+    """
+    Test that copying, comparing, iterating and representing an instance
+    parsed in the lazy_instances mode parses its properties, and that the
+    copies are NocaseDict objects.
+    """
+    xml_str = (
+        '<INSTANCE CLASSNAME="C1">'
+        '<PROPERTY NAME="P1" TYPE="uint32"><VALUE>42</VALUE></PROPERTY>'
+        '<PROPERTY.ARRAY NAME="P2" TYPE="string">'
+        '<VALUE.ARRAY><VALUE>a</VALUE></VALUE.ARRAY></PROPERTY.ARRAY>'
+        '</INSTANCE>')
+
+    def parse(lazy_instances):
+        """Return the instance parsed from xml_str"""
+        tt = _tupletree.xml_to_tupletree_expat(xml_str, 'Test-XML')
+        tp = _tupleparse.TupleParser(lazy_instances=lazy_instances)
+        return tp.parse_any(tt)
+
+    exp_inst = parse(lazy_instances=False)
+    exp_props = list(exp_inst.properties.items())
+
+    inst_copy = parse(lazy_instances=True).copy()
+    assert isinstance(inst_copy.properties, NocaseDict)
+    assert not isinstance(inst_copy.properties, _LazyPropertyDict)
+    assert inst_copy == exp_inst
+
+    inst_copy = parse(lazy_instances=True).copy()
+    assert list(inst_copy.properties.items()) == exp_props
+
+    props_copy = parse(lazy_instances=True).properties.copy()
+    assert isinstance(props_copy, NocaseDict)
+    assert not isinstance(props_copy, _LazyPropertyDict)
+    assert list(props_copy.values()) == [p[1] for p in exp_props]
+
+    inst = parse(lazy_instances=True)
+    assert inst == exp_inst
+    assert list(parse(lazy_instances=True).properties.items()) == exp_props
+    assert list(parse(lazy_instances=True).properties.values()) == \
+        [p[1] for p in exp_props]
+
+    inst = parse(lazy_instances=True)
+    assert repr(inst.properties) == repr(exp_inst.properties)
+    assert repr(inst.properties).startswith('NocaseDict(')
+
+
+def test_tupleparse_lazy_missing_name():
+    """
+    Test that a property element without NAME attribute is reported when the
+    instance is parsed in the lazy_instances mode.
+    """
+    xml_str = (
+        '<INSTANCE CLASSNAME="C1">'
+        '<PROPERTY TYPE="uint32"><VALUE>42</VALUE></PROPERTY>'
+        '</INSTANCE>')
+    tt = _tupletree.xml_to_tupletree_expat(xml_str, 'Test-XML')
+    tp = _tupleparse.TupleParser(lazy_instances=True)
+
+    with pytest.raises(CIMXMLParseError, match="missing required attribute"):
+        tp.parse_any(tt)
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_TUPLEPARSE_ROUNDTRIP)
+@simplified_test_function
+@log_entry_exit
+def test_tupleparse_layouts_roundtrip(testcase, obj):
+    """
+    Test tupleparse parsing and TupleDecoder decoding with instance layouts
+    based upon roundtrip between CIM objects and their CIM-XML, with the same
+    testcases as test_tupleparse_roundtrip().
+    """
+
+    xml_str = obj.tocimxml().toxml()
+    tt = _tupletree.xml_to_tupletree_expat(xml_str, 'Test-XML')
+    tp = _tupleparse.TupleParser(instance_layouts={})
+    td = _tupledecode.TupleDecoder(instance_layouts={})
+    dt = _tupletree.xml_to_tupletree_expat(xml_str, 'Test-XML', decoder=td)
+
+    # The code to be tested
+    parsed_obj = tp.parse_any(tt)
+    decoded_obj = td.parse_any(dt)
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    assert parsed_obj == obj, f"CIM-XML of input obj:\n{xml_str}"
+    assert obj == parsed_obj, f"CIM-XML of input obj:\n{xml_str}"
+    assert decoded_obj == obj, f"CIM-XML of input obj:\n{xml_str}"
+    assert parsed_obj.tocimxml().toxml() == xml_str
+
+
+def test_tupleparse_layouts_shared():
+    """
+    Test that instances parsed with instance layouts share the layout if
+    they have the same properties, and that instances with property
+    qualifiers or duplicate properties do not use a layout.
+    """
+    inst_xml = (
+        '<INSTANCE CLASSNAME="C1">'
+        '<PROPERTY NAME="P1" TYPE="uint32"><VALUE>{0}</VALUE></PROPERTY>'
+        '<PROPERTY.ARRAY NAME="P2" TYPE="string">'
+        '<VALUE.ARRAY><VALUE>a</VALUE></VALUE.ARRAY></PROPERTY.ARRAY>'
+        '</INSTANCE>')
+    layouts = {}
+    tp = _tupleparse.TupleParser(instance_layouts=layouts)
+
+    insts = [
+        tp.parse_any(_tupletree.xml_to_tupletree_expat(
+            inst_xml.format(value), 'Test-XML'))
+        for value in (1, 2)]
+
+    # pylint: disable=protected-access
+    assert len(layouts) == 1
+    layout = list(layouts.values())[0]
+    assert isinstance(layout, CIMInstanceLayout)
+    assert layout.names == ('P1', 'P2')
+    assert insts[0]._properties.layout is layout
+    assert insts[1]._properties.layout is layout
+    assert insts[0]['P1'] == 1
+    assert insts[1]['P1'] == 2
+    assert insts[0] != insts[1]
+
+    qual_xml = (
+        '<INSTANCE CLASSNAME="C1">'
+        '<PROPERTY NAME="P1" TYPE="uint32">'
+        '<QUALIFIER NAME="Key" TYPE="boolean"><VALUE>TRUE</VALUE></QUALIFIER>'
+        '<VALUE>1</VALUE></PROPERTY>'
+        '</INSTANCE>')
+    dup_xml = (
+        '<INSTANCE CLASSNAME="C1">'
+        '<PROPERTY NAME="P1" TYPE="uint32"><VALUE>1</VALUE></PROPERTY>'
+        '<PROPERTY NAME="p1" TYPE="uint32"><VALUE>2</VALUE></PROPERTY>'
+        '</INSTANCE>')
+    for xml_str in (qual_xml, dup_xml):
+        inst = tp.parse_any(
+            _tupletree.xml_to_tupletree_expat(xml_str, 'Test-XML'))
+        assert isinstance(inst._properties, NocaseDict)
+    assert len(layouts) == 1
+
+
+@pytest.mark.parametrize(
+    "parser_class",
+    [_tupleparse.TupleParser, _tupledecode.TupleDecoder])
+def test_tupleparse_shared_qualifiers(parser_class):
+    """
+    Test that the equal qualifiers of classes parsed with a qualifier cache
+    are shared, and that the parsed classes are equal to the classes parsed
+    without a qualifier cache.
+    """
+    class_xml = (
+        '<CLASS NAME="{0}">'
+        '<QUALIFIER NAME="Description" TYPE="string">'
+        '<VALUE>A class</VALUE></QUALIFIER>'
+        '<PROPERTY NAME="P1" TYPE="uint32">'
+        '<QUALIFIER NAME="Key" TYPE="boolean"><VALUE>TRUE</VALUE></QUALIFIER>'
+        '<QUALIFIER NAME="ValueMap" TYPE="string">'
+        '<VALUE.ARRAY><VALUE>1</VALUE><VALUE>2</VALUE></VALUE.ARRAY>'
+        '</QUALIFIER>'
+        '</PROPERTY>'
+        '<METHOD NAME="M1" TYPE="uint32">'
+        '<QUALIFIER NAME="Description" TYPE="string">'
+        '<VALUE>A class</VALUE></QUALIFIER>'
+        '</METHOD>'
+        '</CLASS>')
+    cache = CIMQualifierCache()
+    tp = parser_class(qualifier_cache=cache)
+    tp_unshared = parser_class()
+
+    classes = []
+    for classname in ('C1', 'C2'):
+        tt = _tupletree.xml_to_tupletree_expat(
+            class_xml.format(classname), 'Test-XML')
+        cls = tp.parse_any(tt)
+        assert cls == tp_unshared.parse_any(tt)
+        classes.append(cls)
+
+    # The Description qualifiers of the classes and methods are shared
+    desc = classes[0].qualifiers['Description']
+    assert classes[1].qualifiers['Description'] is desc
+    assert classes[0].methods['M1'].qualifiers['Description'] is desc
+    assert classes[1].methods['M1'].qualifiers['Description'] is desc
+    for qname in ('Key', 'ValueMap'):
+        assert classes[1].properties['P1'].qualifiers[qname] is \
+            classes[0].properties['P1'].qualifiers[qname]
+    assert len(cache) == 3
+    assert cache.shared_count == 5
+    assert cache.saved_bytes > 0
+
+    with pytest.raises(TypeError):
+        desc.value = 'Another class'
+
+
+TESTCASES_TUPLEPARSE_VALUE_DECODERS = [
+
+    # Testcases for test_tupleparse_value_decoders()
+    #
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * cimtype: CIM type name, or None.
+    #   * values: List of CIM-XML string values to be unpacked.
+    #   * exp_result: Expected list of unpacked values, if successful.
+    #   * exp_exc_regex: Regexp for the message of the expected
+    #     CIMXMLParseError, or None.
+    # * exp_exc_types: Expected exception type(s), or None. The expected
+    #   CIMXMLParseError is verified in the test function.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "string values",
+        dict(
+            cimtype='string',
+            values=['a', ' b ', ''],
+            exp_result=['a', ' b ', ''],
+            exp_exc_regex=None,
+        ),
+        None, None, True
+    ),
+    (
+        "boolean values",
+        dict(
+            cimtype='boolean',
+            values=['true', ' FALSE '],
+            exp_result=[True, False],
+            exp_exc_regex=None,
+        ),
+        None, None, True
+    ),
+    (
+        "uint8 decimal values with whitespace",
+        dict(
+            cimtype='uint8',
+            values=['0', ' 42 ', '255'],
+            exp_result=[Uint8(0), Uint8(42), Uint8(255)],
+            exp_exc_regex=None,
+        ),
+        None, None, True
+    ),
+    (
+        "sint64 decimal and hexadecimal values",
+        dict(
+            cimtype='sint64',
+            values=['-1', '0x1F', '-0X10'],
+            exp_result=[Sint64(-1), Sint64(31), Sint64(-16)],
+            exp_exc_regex=None,
+        ),
+        None, None, True
+    ),
+    (
+        "uint32 value in real notation",
+        dict(
+            cimtype='uint32',
+            values=['1', '2.0'],
+            exp_result=[Uint32(1), Uint32(2)],
+            exp_exc_regex=None,
+        ),
+        None, None, True
+    ),
+    (
+        "real32 values",
+        dict(
+            cimtype='real32',
+            values=['1', '1.5', '-1.5E3'],
+            exp_result=[Real32(1), Real32(1.5), Real32(-1500)],
+            exp_exc_regex=None,
+        ),
+        None, None, True
+    ),
+    (
+        "real64 values with infinity",
+        dict(
+            cimtype='real64',
+            values=['1.5', '-INF', 'inf'],
+            exp_result=[Real64(1.5), Real64('-inf'), Real64('inf')],
+            exp_exc_regex=None,
+        ),
+        None, None, True
+    ),
+    (
+        "uint8 value out of range",
+        dict(
+            cimtype='uint8',
+            values=['1', '256'],
+            exp_result=None,
+            exp_exc_regex="Cannot convert value 256 to numeric CIM type uint8",
+        ),
+        None, None, True
+    ),
+    (
+        "sint16 invalid numeric value",
+        dict(
+            cimtype='sint16',
+            values=['1', 'abc'],
+            exp_result=None,
+            exp_exc_regex="Invalid numeric value 'abc'",
+        ),
+        None, None, True
+    ),
+    (
+        "invalid CIM type",
+        dict(
+            cimtype='foo',
+            values=['1'],
+            exp_result=None,
+            exp_exc_regex="Invalid CIM type found: 'foo'",
+        ),
+        None, None, True
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_TUPLEPARSE_VALUE_DECODERS)
+@simplified_test_function
+@log_entry_exit
+def test_tupleparse_value_decoders(
+        testcase, cimtype, values, exp_result, exp_exc_regex):
+    """
+    Test TupleParser.value_decoders() for single values and arrays.
+    """
+
+    tp = _tupleparse.TupleParser()
+
+    if exp_exc_regex:
+        with pytest.raises(CIMXMLParseError, match=exp_exc_regex):
+
+            # The code to be tested
+            _, decode_array = tp.value_decoders(cimtype)
+            decode_array(values)
+
+    else:
+
+        # The code to be tested
+        decode, decode_array = tp.value_decoders(cimtype)
+        result = decode_array(values)
+        single_results = [decode(data) for data in values]
+
+        assert result == exp_result
+        assert single_results == exp_result
+        for item, exp_item in zip(result, exp_result):
+            assert type(item) is type(exp_item)  # noqa: E721
+
+        # The decoders are cached in the parser
+        assert tp.value_decoders(cimtype) == (decode, decode_array)
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+
+TESTCASES_TUPLEPARSE_COMPACT_ARRAYS = [
+
+    # Testcases for test_tupleparse_compact_arrays()
+    #
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * xml_str: Input CIM-XML string.
+    #   * exp_result: Expected parse result, if successful.
+    #   * exp_exc_regex: Regexp for the message of the expected
+    #     CIMXMLParseError, or None.
+    # * exp_exc_types: Expected exception type(s), or None. The expected
+    #   CIMXMLParseError is verified in the test function.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "PROPERTY.ARRAY of uint64",
+        dict(
+            xml_str='<PROPERTY.ARRAY NAME="P1" TYPE="uint64"><VALUE.ARRAY>'
+            '<VALUE>0</VALUE><VALUE> 42 </VALUE>'
+            '<VALUE>18446744073709551615</VALUE>'
+            '</VALUE.ARRAY></PROPERTY.ARRAY>',
+            exp_result=CIMProperty(
+                'P1', [Uint64(0), Uint64(42), Uint64(18446744073709551615)],
+                propagated=False),
+            exp_exc_regex=None,
+        ),
+        None, None, True
+    ),
+    (
+        "PROPERTY.ARRAY of sint8 with hexadecimal values",
+        dict(
+            xml_str='<PROPERTY.ARRAY NAME="P1" TYPE="sint8"><VALUE.ARRAY>'
+            '<VALUE>-0x80</VALUE><VALUE>0x7F</VALUE><VALUE>1</VALUE>'
+            '</VALUE.ARRAY></PROPERTY.ARRAY>',
+            exp_result=CIMProperty(
+                'P1', [Sint8(-128), Sint8(127), Sint8(1)], propagated=False),
+            exp_exc_regex=None,
+        ),
+        None, None, True
+    ),
+    (
+        "PROPERTY.ARRAY of real32",
+        dict(
+            xml_str='<PROPERTY.ARRAY NAME="P1" TYPE="real32"><VALUE.ARRAY>'
+            '<VALUE>0.1</VALUE><VALUE>-1.5E3</VALUE><VALUE>INF</VALUE>'
+            '</VALUE.ARRAY></PROPERTY.ARRAY>',
+            exp_result=CIMProperty(
+                'P1', [Real32(0.1), Real32(-1500), Real32('inf')],
+                propagated=False),
+            exp_exc_regex=None,
+        ),
+        None, None, True
+    ),
+    (
+        "Empty PROPERTY.ARRAY of uint16",
+        dict(
+            xml_str='<PROPERTY.ARRAY NAME="P1" TYPE="uint16"><VALUE.ARRAY/>'
+            '</PROPERTY.ARRAY>',
+            exp_result=CIMProperty('P1', [], type='uint16', propagated=False),
+            exp_exc_regex=None,
+        ),
+        None, None, True
+    ),
+    (
+        "QUALIFIER with array of sint32",
+        dict(
+            xml_str='<QUALIFIER NAME="Q1" TYPE="sint32"><VALUE.ARRAY>'
+            '<VALUE>-1</VALUE><VALUE>1</VALUE>'
+            '</VALUE.ARRAY></QUALIFIER>',
+            exp_result=CIMQualifier(
+                'Q1', [Sint32(-1), Sint32(1)], propagated=False,
+                overridable=True, tosubclass=True, toinstance=False,
+                translatable=False),
+            exp_exc_regex=None,
+        ),
+        None, None, True
+    ),
+    (
+        "PROPERTY.ARRAY of uint8 with value out of range",
+        dict(
+            xml_str='<PROPERTY.ARRAY NAME="P1" TYPE="uint8"><VALUE.ARRAY>'
+            '<VALUE>1</VALUE><VALUE>256</VALUE>'
+            '</VALUE.ARRAY></PROPERTY.ARRAY>',
+            exp_result=None,
+            exp_exc_regex="Cannot convert value 256 to numeric CIM type uint8",
+        ),
+        None, None, True
+    ),
+    (
+        "PROPERTY.ARRAY of real64 with invalid value",
+        dict(
+            xml_str='<PROPERTY.ARRAY NAME="P1" TYPE="real64"><VALUE.ARRAY>'
+            '<VALUE>1.0</VALUE><VALUE>abc</VALUE>'
+            '</VALUE.ARRAY></PROPERTY.ARRAY>',
+            exp_result=None,
+            exp_exc_regex="Invalid numeric value 'abc'",
+        ),
+        None, None, True
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_TUPLEPARSE_COMPACT_ARRAYS)
+@simplified_test_function
+@log_entry_exit
+def test_tupleparse_compact_arrays(
+        testcase, xml_str, exp_result, exp_exc_regex):
+    """
+    Test that parsing in the compact_arrays mode returns CIMNumericArray
+    values that are equal to the values of the normal mode, with TupleParser
+    and with TupleDecoder.
+    """
+
+    tp = _tupleparse.TupleParser(compact_arrays=True)
+    td = _tupledecode.TupleDecoder(compact_arrays=True)
+
+    if exp_exc_regex:
+        with pytest.raises(CIMXMLParseError, match=exp_exc_regex):
+
+            # The code to be tested
+            tt = _tupletree.xml_to_tupletree_expat(xml_str, 'Test-XML')
+            tp.parse_any(tt)
+
+        with pytest.raises(CIMXMLParseError, match=exp_exc_regex):
+
+            # The code to be tested
+            tt = _tupletree.xml_to_tupletree_expat(
+                xml_str, 'Test-XML', decoder=td)
+            td.parse_any(tt)
+
+    else:
+
+        # The code to be tested
+        tt = _tupletree.xml_to_tupletree_expat(xml_str, 'Test-XML')
+        result = tp.parse_any(tt)
+        tt = _tupletree.xml_to_tupletree_expat(
+            xml_str, 'Test-XML', decoder=td)
+        decoded_result = td.parse_any(tt)
+
+        for res in (result, decoded_result):
+            assert isinstance(res.value, CIMNumericArray)
+            assert res.value.cimtype == res.type
+            assert res == exp_result
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+
+TESTCASES_TUPLEPARSE_UNPACK_PROPERTY = [
+
+    # Testcases for test_tupleparse_unpack_property()
+    #
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * xml_str: Input CIM-XML string of a property element.
+    #   * exp_exc_regex: Regexp for the message of the expected
+    #     CIMXMLParseError, or None.
+    # * exp_exc_types: Expected exception type(s), or None. The expected
+    #   CIMXMLParseError is verified in the test function.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "PROPERTY of string with qualifier",
+        dict(
+            xml_str='<PROPERTY NAME="P1" TYPE="string">'
+            '<QUALIFIER NAME="Key" TYPE="boolean"><VALUE>TRUE</VALUE>'
+            '</QUALIFIER><VALUE>abc</VALUE></PROPERTY>',
+            exp_exc_regex=None,
+        ),
+        None, None, True
+    ),
+    (
+        "PROPERTY of uint32 with NULL value",
+        dict(
+            xml_str='<PROPERTY NAME="P1" TYPE="uint32"/>',
+            exp_exc_regex=None,
+        ),
+        None, None, True
+    ),
+    (
+        "PROPERTY of datetime",
+        dict(
+            xml_str='<PROPERTY NAME="P1" TYPE="datetime">'
+            '<VALUE>20140924193040.654321+120</VALUE></PROPERTY>',
+            exp_exc_regex=None,
+        ),
+        None, None, True
+    ),
+    (
+        "PROPERTY.ARRAY of real64",
+        dict(
+            xml_str='<PROPERTY.ARRAY NAME="P1" TYPE="real64"><VALUE.ARRAY>'
+            '<VALUE>1.5</VALUE><VALUE>-2</VALUE></VALUE.ARRAY>'
+            '</PROPERTY.ARRAY>',
+            exp_exc_regex=None,
+        ),
+        None, None, True
+    ),
+    (
+        "PROPERTY.REFERENCE with value",
+        dict(
+            xml_str='<PROPERTY.REFERENCE NAME="P1" REFERENCECLASS="CIM_Foo">'
+            '<VALUE.REFERENCE><INSTANCENAME CLASSNAME="CIM_Foo">'
+            '<KEYBINDING NAME="K1"><KEYVALUE VALUETYPE="string">a</KEYVALUE>'
+            '</KEYBINDING></INSTANCENAME></VALUE.REFERENCE>'
+            '</PROPERTY.REFERENCE>',
+            exp_exc_regex=None,
+        ),
+        None, None, True
+    ),
+    (
+        "PROPERTY.REFERENCE with NULL value",
+        dict(
+            xml_str='<PROPERTY.REFERENCE NAME="P1"/>',
+            exp_exc_regex=None,
+        ),
+        None, None, True
+    ),
+    (
+        "PROPERTY with embedded instance",
+        dict(
+            xml_str='<PROPERTY NAME="P1" TYPE="string" '
+            'EmbeddedObject="instance"><VALUE>'
+            '&lt;INSTANCE CLASSNAME="CIM_Emb"&gt;'
+            '&lt;PROPERTY NAME="E1" TYPE="uint8"&gt;&lt;VALUE&gt;7'
+            '&lt;/VALUE&gt;&lt;/PROPERTY&gt;&lt;/INSTANCE&gt;'
+            '</VALUE></PROPERTY>',
+            exp_exc_regex=None,
+        ),
+        None, None, True
+    ),
+    (
+        "PROPERTY with invalid CIM type and NULL value",
+        dict(
+            xml_str='<PROPERTY NAME="P1" TYPE="foo"/>',
+            exp_exc_regex="Invalid CIM type found",
+        ),
+        None, None, True
+    ),
+    (
+        "PROPERTY with invalid value",
+        dict(
+            xml_str='<PROPERTY NAME="P1" TYPE="uint8"><VALUE>256</VALUE>'
+            '</PROPERTY>',
+            exp_exc_regex="out of range",
+        ),
+        None, None, True
+    ),
+    (
+        "PROPERTY.ARRAY with invalid child element VALUE",
+        dict(
+            xml_str='<PROPERTY.ARRAY NAME="P1" TYPE="uint8"><VALUE>1</VALUE>'
+            '</PROPERTY.ARRAY>',
+            exp_exc_regex="invalid child element",
+        ),
+        None, None, True
+    ),
+    (
+        "PROPERTY.REFERENCE with two values",
+        dict(
+            xml_str='<PROPERTY.REFERENCE NAME="P1">'
+            '<VALUE.REFERENCE><INSTANCENAME CLASSNAME="CIM_Foo">'
+            '<KEYVALUE VALUETYPE="string">a</KEYVALUE></INSTANCENAME>'
+            '</VALUE.REFERENCE>'
+            '<VALUE.REFERENCE><INSTANCENAME CLASSNAME="CIM_Foo">'
+            '<KEYVALUE VALUETYPE="string">b</KEYVALUE></INSTANCENAME>'
+            '</VALUE.REFERENCE>'
+            '</PROPERTY.REFERENCE>',
+            exp_exc_regex="more than one child element 'VALUE.REFERENCE'",
+        ),
+        None, None, True
+    ),
+    (
+        "PROPERTY.REFERENCE with class path value",
+        dict(
+            xml_str='<PROPERTY.REFERENCE NAME="P1"><VALUE.REFERENCE>'
+            '<CLASSNAME NAME="CIM_Foo"/></VALUE.REFERENCE>'
+            '</PROPERTY.REFERENCE>',
+            exp_exc_regex="invalid reference value",
+        ),
+        None, None, True
+    ),
+    (
+        "Element that is not a property element",
+        dict(
+            xml_str='<VALUE>abc</VALUE>',
+            exp_exc_regex="Unexpected element 'VALUE'",
+        ),
+        None, None, True
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_TUPLEPARSE_UNPACK_PROPERTY)
+@simplified_test_function
+@log_entry_exit
+def test_tupleparse_unpack_property(testcase, xml_str, exp_exc_regex):
+    """
+    Test TupleParser.unpack_property() against the CIMProperty object
+    returned by parsing the same element.
+    """
+
+    tp = _tupleparse.TupleParser()
+    tt = _tupletree.xml_to_tupletree_expat(xml_str, 'Test-XML')
+
+    if exp_exc_regex:
+        with pytest.raises(CIMXMLParseError, match=exp_exc_regex):
+
+            # The code to be tested
+            tp.unpack_property(tt)
+
+    else:
+
+        # The code to be tested
+        result = tp.unpack_property(tt)
+
+        prop = tp.parse_any(tt)
+        assert result == (prop.name, prop.type, prop.is_array, prop.value)
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+
+def test_tupleparse_unpack_value_namedinstance():
+    """
+    Test TupleParser.unpack_value_namedinstance() against the CIMInstance
+    object returned by parsing the same element.
+    """
+    xml_str = (
+        '<VALUE.NAMEDINSTANCE>'
+        '<INSTANCENAME CLASSNAME="CIM_Foo">'
+        '<KEYBINDING NAME="K1"><KEYVALUE VALUETYPE="string">a</KEYVALUE>'
+        '</KEYBINDING></INSTANCENAME>'
+        '<INSTANCE CLASSNAME="CIM_Foo">'
+        '<QUALIFIER NAME="Q1" TYPE="string"><VALUE>q</VALUE></QUALIFIER>'
+        '<PROPERTY NAME="K1" TYPE="string"><VALUE>a</VALUE></PROPERTY>'
+        '<PROPERTY.ARRAY NAME="P1" TYPE="uint16"><VALUE.ARRAY>'
+        '<VALUE>1</VALUE></VALUE.ARRAY></PROPERTY.ARRAY>'
+        '<PROPERTY.REFERENCE NAME="P2"/>'
+        '</INSTANCE>'
+        '</VALUE.NAMEDINSTANCE>')
+    tp = _tupleparse.TupleParser()
+    tt = _tupletree.xml_to_tupletree_expat(xml_str, 'Test-XML')
+
+    # The code to be tested
+    path, classname, props = tp.unpack_value_namedinstance(tt)
+
+    inst = tp.parse_any(tt)
+    assert path == inst.path
+    assert classname == inst.classname
+    assert props == [(p.name, p.type, p.is_array, p.value)
+                     for p in inst.properties.values()]
+
+    with pytest.raises(CIMXMLParseError, match="invalid number of child"):
+        tt = _tupletree.xml_to_tupletree_expat(
+            '<VALUE.NAMEDINSTANCE><INSTANCE CLASSNAME="CIM_Foo"/>'
+            '</VALUE.NAMEDINSTANCE>', 'Test-XML')
+        tp.unpack_value_namedinstance(tt)
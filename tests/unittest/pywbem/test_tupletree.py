@@ -532,6 +532,293 @@ class Test_xml_to_tupletree_sax:
                     "Unexpected exception message:\n" + exc_msg
 
 
+class Test_xml_to_tupletree_expat:
+    # pylint: disable=too-few-public-methods
+    """Tests for _tupletree.xml_to_tupletree_expat()"""
+
+    @pytest.mark.parametrize(
+        "desc, xml_string, exp_tupletree, exp_exc_type, exp_exc_msg_pattern, "
+        "condition",
+        Test_xml_to_tupletree_sax.testcases
+    )
+    @pytest.mark.parametrize(
+        "encoding",
+        ['unicode', 'bytes']
+    )
+    @log_entry_exit
+    def test_xml_to_tupletree_expat(
+            self, encoding, desc, xml_string, exp_tupletree, exp_exc_type,
+            exp_exc_msg_pattern, condition):
+        # pylint: disable=no-self-use,unused-argument
+        """
+        Test xml_to_tupletree_expat() against the expected results of
+        xml_to_tupletree_sax(), including the exception messages.
+        """
+
+        if not condition:
+            pytest.skip("Condition for test case not met")
+
+        if encoding == 'bytes':
+            xml_string = xml_string.encode("utf-8")
+
+        if exp_exc_type is None:
+
+            act_tupletree = _tupletree.xml_to_tupletree_expat(
+                xml_string, 'Test XML')
+
+            assert act_tupletree == exp_tupletree
+
+            sax_tupletree = _tupletree.xml_to_tupletree_sax(
+                xml_string, 'Test XML')
+            assert act_tupletree == sax_tupletree
+
+        else:
+            with pytest.raises(exp_exc_type) as exec_info:
+
+                _tupletree.xml_to_tupletree_expat(xml_string, 'Test XML')
+
+            if exp_exc_msg_pattern:
+                exc_msg = str(exec_info.value)
+                one_line_exc_msg = exc_msg.replace('\n', '\\n')
+                assert re.search(exp_exc_msg_pattern, one_line_exc_msg), \
+                    "Unexpected exception message:\n" + exc_msg
+
+
+class Test_xml_chunks_to_tupletree_expat:
+    # pylint: disable=too-few-public-methods
+    """Tests for _tupletree.xml_chunks_to_tupletree_expat()"""
+
+    @pytest.mark.parametrize(
+        "desc, xml_string, exp_tupletree, exp_exc_type, exp_exc_msg_pattern, "
+        "condition",
+        Test_xml_to_tupletree_sax.testcases
+    )
+    @pytest.mark.parametrize(
+        "chunk_size",
+        [1, 7, None]
+    )
+    @log_entry_exit
+    def test_xml_chunks_to_tupletree_expat(
+            self, chunk_size, desc, xml_string, exp_tupletree, exp_exc_type,
+            exp_exc_msg_pattern, condition):
+        # pylint: disable=no-self-use,unused-argument
+        """
+        Test xml_chunks_to_tupletree_expat() against the expected results of
+        xml_to_tupletree_sax(), with the XML string split into chunks of the
+        specified size (None meaning a single chunk).
+
+        Since the chunks may split UTF-8 sequences and the UTF-8 and XML
+        character checks are not performed, only the exception type and the
+        generic part of the exception message are verified.
+        """
+
+        if not condition:
+            pytest.skip("Condition for test case not met")
+
+        xml_string = xml_string.encode("utf-8")
+        if chunk_size is None:
+            chunks = [xml_string]
+        else:
+            chunks = [xml_string[i:i + chunk_size]
+                      for i in range(0, len(xml_string), chunk_size)]
+
+        if exp_exc_type is None:
+
+            act_tupletree = _tupletree.xml_chunks_to_tupletree_expat(
+                iter(chunks), 'Test XML')
+
+            assert act_tupletree == exp_tupletree
+
+        else:
+            with pytest.raises(exp_exc_type) as exec_info:
+
+                _tupletree.xml_chunks_to_tupletree_expat(
+                    iter(chunks), 'Test XML')
+
+            exc_msg = str(exec_info.value)
+            assert re.search("XML parsing error encountered in Test XML",
+                             exc_msg), \
+                "Unexpected exception message:\n" + exc_msg
+
+
+class Test_iter_xml_chunks_to_tupletree_expat:
+    # pylint: disable=too-few-public-methods
+    """Tests for _tupletree.iter_xml_chunks_to_tupletree_expat()"""
+
+    xml_string = (
+        b'<A>\n'
+        b' <B>\n'
+        b'  <C N="1"><D/></C>\n'
+        b'  <C N="2">text</C>\n'
+        b'  <C N="3"/>\n'
+        b' </B>\n'
+        b' <C N="4"/>\n'
+        b'</A>\n')
+
+    @pytest.mark.parametrize(
+        "parent_path, exp_items, exp_root",
+        [
+            (
+                ['A', 'B'],
+                [('C', {'N': '1'}, [('D', {}, [])]),
+                 ('C', {'N': '2'}, ['text']),
+                 ('C', {'N': '3'}, [])],
+                ('A', {}, ['\n ', ('B', {}, ['\n ']), '\n ',
+                           ('C', {'N': '4'}, []), '\n']),
+            ),
+            (
+                ['A'],
+                [('B', {}, ['\n  ',
+                            ('C', {'N': '1'}, [('D', {}, [])]), '\n  ',
+                            ('C', {'N': '2'}, ['text']), '\n  ',
+                            ('C', {'N': '3'}, []), '\n ']),
+                 ('C', {'N': '4'}, [])],
+                ('A', {}, ['\n']),
+            ),
+            (
+                ['A', 'X'],
+                [],
+                None,  # Same as xml_to_tupletree_sax()
+            ),
+        ]
+    )
+    @pytest.mark.parametrize(
+        "chunk_size",
+        [1, 7, None]
+    )
+    @log_entry_exit
+    def test_iter_xml_chunks_to_tupletree_expat(
+            self, chunk_size, parent_path, exp_items, exp_root):
+        # pylint: disable=no-self-use
+        """
+        Test that iter_xml_chunks_to_tupletree_expat() yields the child
+        elements of the parent element and returns the remaining tupletree.
+        """
+        xml_string = self.xml_string
+        if chunk_size is None:
+            chunks = [xml_string]
+        else:
+            chunks = [xml_string[i:i + chunk_size]
+                      for i in range(0, len(xml_string), chunk_size)]
+        if exp_root is None:
+            exp_root = _tupletree.xml_to_tupletree_sax(xml_string, 'Test XML')
+
+        gen = _tupletree.iter_xml_chunks_to_tupletree_expat(
+            iter(chunks), parent_path, 'Test XML')
+        act_items = []
+        act_root = None
+        while True:
+            try:
+                act_items.append(next(gen))
+            except StopIteration as stop:
+                act_root = stop.value
+                break
+
+        assert act_items == exp_items
+        assert act_root == exp_root
+
+
+class Test_name_interning:
+    # pylint: disable=too-few-public-methods
+    """
+    Tests for the interning of CIM names in the tupletree.
+    """
+
+    @pytest.mark.parametrize(
+        "func_name",
+        ['xml_to_tupletree_expat', 'xml_to_tupletree_sax']
+    )
+    @log_entry_exit
+    def test_name_interning(self, func_name):
+        # pylint: disable=no-self-use
+        """
+        Test that CIM name attributes of two parsed documents are the same
+        string objects, and that other attributes are not interned.
+        """
+        func = getattr(_tupletree, func_name)
+        xml_string = (
+            '<INSTANCE CLASSNAME="PyWBEM_Interned_Class">'
+            '<PROPERTY NAME="PyWBEM_Interned_Prop" TYPE="string">'
+            '<VALUE>PyWBEM_NotInterned_Value</VALUE>'
+            '</PROPERTY></INSTANCE>')
+
+        tt1 = func(xml_string, 'Test XML')
+        tt2 = func(xml_string, 'Test XML')
+
+        assert tt1[1]['CLASSNAME'] is tt2[1]['CLASSNAME']
+        prop1 = tt1[2][0]
+        prop2 = tt2[2][0]
+        assert prop1[1]['NAME'] is prop2[1]['NAME']
+        assert prop1[1]['TYPE'] is prop2[1]['TYPE']
+        assert prop1[2][0][2][0] == prop2[2][0][2][0]
+
+
+class Test_property_filter:
+    # pylint: disable=too-few-public-methods
+    """Tests for the property_filter parameter of the expat functions"""
+
+    xml_string = (
+        b'<X>'
+        b'<INSTANCE CLASSNAME="C1">'
+        b'<QUALIFIER NAME="Q1" TYPE="string"><VALUE>q</VALUE></QUALIFIER>'
+        b'<PROPERTY NAME="P1" TYPE="string">'
+        b'<QUALIFIER NAME="Q1" TYPE="string"><VALUE>q</VALUE></QUALIFIER>'
+        b'<VALUE>a</VALUE></PROPERTY>'
+        b'<PROPERTY.ARRAY NAME="P2" TYPE="uint8">'
+        b'<VALUE.ARRAY><VALUE>1</VALUE></VALUE.ARRAY></PROPERTY.ARRAY>'
+        b'<PROPERTY.REFERENCE NAME="P3"><VALUE.REFERENCE>'
+        b'<INSTANCENAME CLASSNAME="C2"/></VALUE.REFERENCE>'
+        b'</PROPERTY.REFERENCE>'
+        b'<PROPERTY TYPE="string"/>'
+        b'</INSTANCE>'
+        b'<CLASS NAME="C1"><PROPERTY NAME="P1" TYPE="string"/></CLASS>'
+        b'</X>')
+
+    @pytest.mark.parametrize(
+        "property_filter, exp_names",
+        [
+            (None, ['Q1', 'P1', 'P2', 'P3', None]),
+            (set(), ['Q1', None]),
+            ({'p1'}, ['Q1', 'P1', None]),
+            ({'p2', 'p3', 'p4'}, ['Q1', 'P2', 'P3', None]),
+        ]
+    )
+    @pytest.mark.parametrize(
+        "chunk_size",
+        [1, 7, None]
+    )
+    @log_entry_exit
+    def test_property_filter(self, chunk_size, property_filter, exp_names):
+        # pylint: disable=no-self-use
+        """
+        Test that the property elements of INSTANCE elements that are not in
+        the property filter are skipped, and that everything else is the
+        same as without property filter.
+        """
+        xml_string = self.xml_string
+        if chunk_size is None:
+            chunks = [xml_string]
+        else:
+            chunks = [xml_string[i:i + chunk_size]
+                      for i in range(0, len(xml_string), chunk_size)]
+        full_tt = _tupletree.xml_to_tupletree_sax(xml_string, 'Test XML')
+
+        act_tt = _tupletree.xml_chunks_to_tupletree_expat(
+            iter(chunks), 'Test XML', property_filter=property_filter)
+
+        act_instance = act_tt[2][0]
+        act_names = [child[1].get('NAME') for child in act_instance[2]]
+        assert act_names == exp_names
+        for child in act_instance[2]:
+            assert child in full_tt[2][0][2]
+
+        # Elements other than INSTANCE are not filtered
+        assert act_tt[2][1] == full_tt[2][1]
+
+        assert _tupletree.xml_to_tupletree_expat(
+            xml_string, 'Test XML', property_filter=property_filter) == act_tt
+
+
 class Test_get_failing_line:
     # pylint: disable=too-few-public-methods
     """Tests for _tupletree.get_failing_line()"""
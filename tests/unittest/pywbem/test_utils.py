@@ -4,7 +4,7 @@ Tests for _utils module
 """
 
 import platform
-from collections import OrderedDict
+from collections import OrderedDict, UserList
 import unicodedata
 import random
 
@@ -16,7 +16,9 @@ from ..utils.pytest_extensions import simplified_test_function, log_entry_exit
 # pylint: disable=wrong-import-position, wrong-import-order, invalid-name
 from ...utils import import_installed
 pywbem = import_installed('pywbem')
-from pywbem._utils import _ascii2, _format, _integerValue_to_int  # noqa: E402
+from pywbem._utils import _ascii2, _format, _integerValue_to_int, \
+    _hash_item  # noqa: E402
+from pywbem._cim_types import CIMNumericArray, Uint8  # noqa: E402
 from pywbem._cim_obj import NocaseDict  # noqa: E402
 # pylint: enable=wrong-import-position, wrong-import-order, invalid-name
 
@@ -867,3 +869,65 @@ def test_integerValue_to_int(testcase, value, exp_result):
 
     assert type(act_result) is type(exp_result)
     assert act_result == exp_result
+
+
+TESTCASES_HASH_ITEM = [
+
+    # Testcases for _hash_item()
+
+    # Each list item is a testcase tuple with these items:
+    # * desc: Short testcase description.
+    # * kwargs: Keyword arguments for the test function:
+    #   * item: Input item for _hash_item().
+    #   * exp_item: Hashable item with the expected hash value.
+    # * exp_exc_types: Expected exception type(s), or None.
+    # * exp_warn_types: Expected warning type(s), or None.
+    # * condition: Boolean condition for testcase to run, or 'pdb' for debugger
+
+    (
+        "None",
+        dict(item=None, exp_item=None),
+        None, None, True
+    ),
+    (
+        "Scalar value",
+        dict(item=Uint8(42), exp_item=Uint8(42)),
+        None, None, True
+    ),
+    (
+        "List",
+        dict(item=[Uint8(1), Uint8(2)], exp_item=(Uint8(1), Uint8(2))),
+        None, None, True
+    ),
+    (
+        "CIMNumericArray",
+        dict(item=CIMNumericArray('uint8', [1, 2]),
+             exp_item=(Uint8(1), Uint8(2))),
+        None, None, True
+    ),
+    (
+        "Other mutable sequence is not hashable",
+        dict(item=UserList([1, 2]), exp_item=None),
+        TypeError, None, True
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "desc, kwargs, exp_exc_types, exp_warn_types, condition",
+    TESTCASES_HASH_ITEM)
+@simplified_test_function
+@log_entry_exit
+def test_hash_item(testcase, item, exp_item):
+    """
+    Test function for _hash_item().
+    """
+
+    # The code to be tested
+    act_hash = _hash_item(item)
+
+    # Ensure that exceptions raised in the remainder of this function
+    # are not mistaken as expected exceptions
+    assert testcase.exp_exc_types is None
+
+    assert act_hash == hash(exp_item)